@@ -16,7 +16,6 @@ import os
 import json
 import requests
 import re
-from requests.packages.urllib3.exceptions import InsecureRequestWarning
 import xml.etree.ElementTree as Et
 from landscaper.collector import base
 from landscaper.common import LOG
@@ -194,10 +193,6 @@ class CimiPhysicalCollector(base.Collector):
                 "'CIMI_URL' has not been set in the 'general' section of the config file")
             return dict()
 
-        # TODO: certificate authentication issues
-        if cimi_url.lower().find('https') > 0:
-            requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-
         res = requests.get(cimi_url + '/device',
                            headers={'slipstream-authn-info': 'internal ADMIN'},
                            verify=SSL_VERIFY)
@@ -16,8 +16,11 @@ Ephemeral disk collector.
 """
 import threading
 import time
-import xml.etree.ElementTree as ET
 import socket
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.cElementTree as ET
 import paramiko
 from paramiko import ssh_exception
 
@@ -32,7 +35,12 @@ DELETE_EVENTS = ['compute.instance.delete.end',
                  'compute.instance.shutdown.end']
 CREATED_EVENTS = ['compute.instance.create.end']
 SSH_TIMEOUT = 10
+# Number of commands run side by side over one ssh connection. Kept below
+# the sshd MaxSessions default of 10.
+SSH_CHANNELS = 8
 CONFIGURATION_SECTION = 'physical_layer'
+_SSH_ERRORS = (ssh_exception.NoValidConnectionsError, socket.error,
+               ssh_exception.AuthenticationException)
 
 
 class EphemeralDiskCollector(base.Collector):
@@ -46,11 +54,10 @@ class EphemeralDiskCollector(base.Collector):
                                                      event_manager, events)
         self.graph_db = graph_db
         self.conf_mgr = conf_manager
-        self.hosts = []
-        for machine in self.conf_mgr.get_machines():
-            self.hosts.append(machine)
+        self.hosts = list(self.conf_mgr.get_machines())
         self.instance_disks = {}
         self.instance_disk_lookup = {}
+        self._ssh_clients = {}
 
     def init_graph_db(self):
         """
@@ -60,8 +67,14 @@ class EphemeralDiskCollector(base.Collector):
         LOG.info("[EDISK] Adding ephemeral_disk components to the landscape.")
         now_ts = time.time()
         self._retrieve_instance_disks()
+        inst_nodes = self.graph_db.get_nodes_by_uuids(self.instance_disks)
         for instance_id, disk_obj in self.instance_disks.iteritems():
-            self.attach_disk_to_instance(instance_id, disk_obj, now_ts)
+            inst_node = inst_nodes.get(instance_id)
+            if inst_node is None:
+                LOG.warning("[EDISK] Instance %s not in the landscape.",
+                            instance_id)
+                continue
+            self._attach_instance_disks(inst_node, disk_obj, now_ts)
 
     def attach_disk_to_instance(self, uuid, disk_obj, timestamp):
         """
@@ -112,9 +125,9 @@ class EphemeralDiskCollector(base.Collector):
         """
         # Delete ephemeral disks attached to the instance
         instance_disks = self.instance_disk_lookup.get(uuid, [])
-        for disk_uuid in instance_disks:
-            disk_node = self.graph_db.get_node_by_uuid(disk_uuid)
-            if disk_node:
+        if instance_disks:
+            disk_nodes = self.graph_db.get_nodes_by_uuids(instance_disks)
+            for disk_node in disk_nodes.itervalues():
                 self.graph_db.delete_node(disk_node, timestamp)
 
     def _get_machine_node(self, hostname):
@@ -135,13 +148,17 @@ class EphemeralDiskCollector(base.Collector):
 
     def _attach_instance_disks(self, instance_node, disks, timestamp):
         disk_ids = []
+        disk_nodes = []
         for disk_id, disk_attr in disks:
             identity, state = self._create_disk_nodes(disk_attr)
             uuid = "{}_{}".format(instance_node["name"], disk_id)
-
-            node = self.graph_db.add_node(uuid, identity, state, timestamp)
-            self.graph_db.add_edge(instance_node, node, timestamp, "ON")
+            disk_nodes.append((uuid, identity, state))
             disk_ids.append(uuid)
+
+        if disk_nodes:
+            nodes = self.graph_db.add_nodes_bulk(disk_nodes, timestamp)
+            edges = [(instance_node, node) for node in nodes]
+            self.graph_db.add_edges_bulk(edges, timestamp, "ON")
         self.instance_disk_lookup[instance_node["name"]] = disk_ids
 
     @staticmethod
@@ -150,18 +167,28 @@ class EphemeralDiskCollector(base.Collector):
         state_node = disk_attr
         return identity_node, state_node
 
-    @staticmethod
-    def _ssh_client(host):
+    def _ssh_client(self, host):
+        """
+        Returns a connected ssh client for the host. Clients are kept and
+        reused for as long as their connection stays active.
+        :param host: Host to connect to.
+        :return: paramiko SSHClient or None if the connection failed.
+        """
+        ssh_client = self._ssh_clients.get(host)
+        if ssh_client is not None:
+            transport = ssh_client.get_transport()
+            if transport is not None and transport.is_active():
+                return ssh_client
         try:
             ssh_client = paramiko.SSHClient()
             ssh_client.load_system_host_keys()
             ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             ssh_client.connect(host, timeout=SSH_TIMEOUT)
-        except (ssh_exception.NoValidConnectionsError, socket.error,
-                ssh_exception.AuthenticationException) as err:
+        except _SSH_ERRORS as err:
             LOG.error("Could not add ephemeral disks for host: %s", host)
             LOG.error("SSH Error for host %s: %s", host, err)
             return None
+        self._ssh_clients[host] = ssh_client
         return ssh_client
 
     @staticmethod
@@ -199,15 +226,26 @@ class EphemeralDiskCollector(base.Collector):
             thr.join()
 
     def _host_ephemeral_disks(self, host):
+        """
+        Retrieves the disks of every instance on a host. The domain dumps are
+        requested over several channels of the ssh connection at once, rather
+        than waiting on each dump in turn.
+        :param host: Host to query.
+        """
         ssh_client = self._ssh_client(host)
         if ssh_client:
             libvirt_instances = self._libvirt_domains(ssh_client)
-            for libvirt_inst in libvirt_instances:
-                cmd = "virsh dumpxml {}".format(libvirt_inst)
-                _, stdout, _ = ssh_client.exec_command(cmd)
-                xml_dump = stdout.read().strip()
-                instance_id, instance_disks = self._instance_disks(xml_dump)
-                self.instance_disks[instance_id] = instance_disks
+            for start in range(0, len(libvirt_instances), SSH_CHANNELS):
+                outputs = []
+                for libvirt_inst in libvirt_instances[start:
+                                                      start + SSH_CHANNELS]:
+                    cmd = "virsh dumpxml {}".format(libvirt_inst)
+                    _, stdout, _ = ssh_client.exec_command(cmd)
+                    outputs.append(stdout)
+                for stdout in outputs:
+                    xml_dump = stdout.read().strip()
+                    inst_id, inst_disks = self._instance_disks(xml_dump)
+                    self.instance_disks[inst_id] = inst_disks
 
     @staticmethod
     def _libvirt_domains(ssh_client):
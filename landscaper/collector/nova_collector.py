@@ -22,7 +22,6 @@ from landscaper.utilities import openstack
 
 # Node Structure.
 IDENTITY_ATTR = {'layer': 'virtual', 'type': 'vm', 'category': 'compute'}
-STATE_ATTR = {'vcpu': None, 'mem': None}
 
 # Events to listen for.
 ADD_EVENTS = ['compute.instance.create.end',
@@ -198,11 +197,6 @@ class NovaCollectorV2(base.Collector):
         :return: State and instnace nodes.
         """
         identity_node = IDENTITY_ATTR.copy()
-        state_node = STATE_ATTR.copy()
-        state_node["vcpu"] = vcpus
-        state_node["mem"] = mem
-        state_node["vm_name"] = name
-
-        state_node["libvirt_instance"] = libvirt_instance
-
+        state_node = {"vcpu": vcpus, "mem": mem, "vm_name": name,
+                      "libvirt_instance": libvirt_instance}
         return identity_node, state_node
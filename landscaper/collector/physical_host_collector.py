@@ -393,26 +393,27 @@ class HWLocCollector(base.Collector):
             now = time.time()
 
         nodes_added = dict()
-        for node in graph.nodes():
-            state_attr = dict()
-            attributes = graph.node[str(node)]
-            iden_attr = attributes.copy()
-            if 'attributes' in attributes:
-                state_attr = attributes['attributes']
-                del iden_attr['attributes']
-            nodes_added[node] = graph_db.add_node(node, iden_attr, state_attr,
-                                                  now)
-
-        for edge in graph.edges():
-            source = edge[0]
-            target = edge[1]
-            label = 'LINKS_TO'
-            if 'label' in graph.edge[source][target]:
-                label = graph.edge[source][target]['label']
-            src_node = nodes_added.get(source, None)
-            trg_node = nodes_added.get(target, None)
-            if src_node is not None and trg_node is not None:
-                graph_db.add_edge(src_node, trg_node, now, label=label)
+        with graph_db.batch():
+            for node in graph.nodes():
+                state_attr = dict()
+                attributes = graph.node[str(node)]
+                iden_attr = attributes.copy()
+                if 'attributes' in attributes:
+                    state_attr = attributes['attributes']
+                    del iden_attr['attributes']
+                nodes_added[node] = graph_db.add_node(node, iden_attr,
+                                                      state_attr, now)
+
+            for edge in graph.edges():
+                source = edge[0]
+                target = edge[1]
+                label = 'LINKS_TO'
+                if 'label' in graph.edge[source][target]:
+                    label = graph.edge[source][target]['label']
+                src_node = nodes_added.get(source, None)
+                trg_node = nodes_added.get(target, None)
+                if src_node is not None and trg_node is not None:
+                    graph_db.add_edge(src_node, trg_node, now, label=label)
 
     def filter_nodes(self, graph, key, val):
         """
@@ -15,6 +15,7 @@
 Landscape database base class.
 """
 import abc
+import contextlib
 import os
 
 
@@ -56,6 +57,35 @@ class GraphDB(object):
         """
         raise NotImplementedError
 
+    def add_nodes_bulk(self, nodes, timestmp):
+        """
+        Adds several identity nodes, with their states, to the landscape.
+        :param nodes: List of (node_id, identity, state) tuples.
+        :param timestmp: Time of when the nodes were created.
+        :return: List of the identity nodes, in the same order.
+        """
+        return [self.add_node(node_id, identity, state, timestmp)
+                for node_id, identity, state in nodes]
+
+    def add_edges_bulk(self, edges, timestamp, label=None):
+        """
+        Adds several edges with the same description to the landscape.
+        :param edges: List of (src_node, dest_node) tuples.
+        :param timestamp: Epoch timestamp of when the edges were created.
+        :param label: Description of the relationships.
+        :return: List of the newly created edges.
+        """
+        return [self.add_edge(src_node, dest_node, timestamp, label)
+                for src_node, dest_node in edges]
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Groups the writes made within the block so that they can be stored
+        together. Databases without transactions write straight away.
+        """
+        yield
+
     @abc.abstractmethod
     def update_node(self, node_id, timestamp, state=None, extra_attrs=None):
         """
@@ -127,6 +157,19 @@ class GraphDB(object):
         """
         raise NotImplementedError
 
+    def get_nodes_by_uuids(self, node_ids):
+        """
+        Fetches several nodes by their ids.
+        :param node_ids: Ids of the nodes.
+        :return: Dictionary of node id to node instance, for the nodes found.
+        """
+        nodes = {}
+        for node_id in node_ids:
+            node = self.get_node_by_uuid(node_id)
+            if node is not None:
+                nodes[node_id] = node
+        return nodes
+
     @abc.abstractmethod
     def delete_all(self):
         """
@@ -14,7 +14,9 @@
 """
 Neo4j Implementation of the graph database.
 """
+import contextlib
 import json
+import threading
 import time
 import logging
 import copy
@@ -53,6 +55,9 @@ class Neo4jGDB(base.GraphDB):
         self.graph_db_refreshed = None
         self.graph_db = self._get_db_connection()
 
+        # Transaction opened by batch(), per thread.
+        self._batch = threading.local()
+
     def find(self, label, node_id):
         """
         Returns true or false of whether the node with label exists.
@@ -80,13 +85,14 @@ class Neo4jGDB(base.GraphDB):
         identity = _format_node(identity)
         identity['name'] = node_id
         iden_node = Node(identity.get('category', 'UNDEFINED'), **identity)
-        existing_node = self.get_node_by_uuid(node_id)
+        existing_node = (self._batch_nodes().get(node_id) or
+                         self.get_node_by_uuid(node_id))
         if existing_node:
             LOG.warn("Node with UUID: %s already stored in DB", node_id)
             return existing_node
 
         # Store nodes to the database.
-        transaction = self.graph_db.begin()
+        transaction = self._begin()
         state = _format_node(state)
         state_label = identity.get('category', 'UNDEFINED') + '_state'
         state_node = Node(state_label, **state)
@@ -94,10 +100,112 @@ class Neo4jGDB(base.GraphDB):
         transaction.create(iden_node)
         transaction.create(state_node)
         transaction.create(state_rel)
-        transaction.commit()
+        self._commit(transaction)
+        self._batch_nodes()[node_id] = iden_node
 
         return iden_node
 
+    def add_nodes_bulk(self, nodes, timestmp):
+        """
+        Adds several nodes to the Neo4j database. Existing nodes are looked
+        up in one query and the new nodes are stored in one transaction.
+        :param nodes: List of (node_id, identity, state) tuples.
+        :param timestmp: Epoch timestamp of when the nodes were created.
+        :return: List of the py2neo identity nodes, in the same order.
+        """
+        existing = self.get_nodes_by_uuids(node_id for node_id, _, _ in nodes)
+        existing.update(self._batch_nodes())
+        iden_nodes = []
+        transaction = self._begin()
+        for node_id, identity, state in nodes:
+            if node_id in existing:
+                LOG.warn("Node with UUID: %s already stored in DB", node_id)
+                iden_nodes.append(existing[node_id])
+                continue
+            identity = _format_node(identity)
+            identity['name'] = node_id
+            iden_node = Node(identity.get('category', 'UNDEFINED'), **identity)
+            state = _format_node(state)
+            state_label = identity.get('category', 'UNDEFINED') + '_state'
+            state_node = Node(state_label, **state)
+            transaction.create(iden_node)
+            transaction.create(state_node)
+            transaction.create(self._create_edge(iden_node, state_node,
+                                                 timestmp, "STATE"))
+            existing[node_id] = iden_node
+            self._batch_nodes()[node_id] = iden_node
+            iden_nodes.append(iden_node)
+        self._commit(transaction)
+        return iden_nodes
+
+    def add_edges_bulk(self, edges, timestamp, label=None):
+        """
+        Adds several edges in one transaction.
+        :param edges: List of (src_node, dest_node) tuples.
+        :param timestamp: The epoch timestamp of when the edges were created.
+        :param label: Description of the edges.
+        :return: List of the edges.
+        """
+        rels = [self._create_edge(src_node, dest_node, timestamp, label)
+                for src_node, dest_node in edges]
+        transaction = self._begin()
+        for rel in rels:
+            transaction.create(rel)
+        self._commit(transaction)
+        return rels
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Groups the nodes and edges added within the block into a single
+        transaction, committed when the block exits. Nodes added within the
+        block are only found by lookups once it has been committed, although
+        add_node still recognises them as duplicates. Nested blocks join the
+        outer transaction.
+        """
+        if getattr(self._batch, "transaction", None) is not None:
+            yield
+            return
+        self._batch.transaction = self.graph_db.begin()
+        self._batch.nodes = {}
+        try:
+            yield
+            self._batch.transaction.commit()
+        except Exception:
+            self._batch.transaction.rollback()
+            raise
+        finally:
+            self._batch.transaction = None
+            self._batch.nodes = {}
+
+    def _begin(self):
+        """
+        Returns the transaction of the current batch, or a new transaction.
+        :return: py2neo transaction.
+        """
+        transaction = getattr(self._batch, "transaction", None)
+        if transaction is None:
+            transaction = self.graph_db.begin()
+        return transaction
+
+    def _commit(self, transaction):
+        """
+        Commits the transaction, unless it belongs to the current batch.
+        :param transaction: py2neo transaction.
+        """
+        if transaction is not getattr(self._batch, "transaction", None):
+            transaction.commit()
+
+    def _batch_nodes(self):
+        """
+        Nodes added during the current batch, keyed on node id. Empty when
+        there is no batch.
+        :return: Dictionary of node id to node.
+        """
+        if getattr(self._batch, "transaction", None) is None:
+            return {}
+        return self._batch.nodes
+
     def update_node(self, node_id, timestamp, state=None, extra_attrs=None):
         """
         Updating a node in the database involves expiring the old state node
@@ -155,9 +263,9 @@ class Neo4jGDB(base.GraphDB):
 
         # Commit it all
         self.graph_db.push(old_edge)
-        transaction = self.graph_db.begin()
+        transaction = self._begin()
         transaction.create(new_edge)
-        transaction.commit()
+        self._commit(transaction)
 
         umsg = "Node %s updated successfully" % node_id
         return (identity, umsg)
@@ -179,9 +287,9 @@ class Neo4jGDB(base.GraphDB):
         if edge is not None and self.graph_db.exists(edge):
             LOG.warn("Trying to add a relation already stored in the DB")
             return edge
-        transaction = self.graph_db.begin()
+        transaction = self._begin()
         transaction.create(edge)
-        transaction.commit()
+        self._commit(transaction)
         return edge
 
     def update_edge(self, src_node, dest_node, timestamp, label=None):
@@ -200,9 +308,9 @@ class Neo4jGDB(base.GraphDB):
 
         # Create new edge
         edge = self._create_edge(src_node, dest_node, timestamp, label)
-        transaction = self.graph_db.begin()
+        transaction = self._begin()
         transaction.create(edge)
-        transaction.commit()
+        self._commit(transaction)
         return edge
 
     def delete_edge(self, src_node, dest_node, timestamp, label=None):
@@ -358,6 +466,19 @@ class Neo4jGDB(base.GraphDB):
             return selected[0]
         return None
 
+    def get_nodes_by_uuids(self, node_ids):
+        """
+        Retrieve several nodes from the neo4j database in one query.
+        :param node_ids: The names of the nodes to retrieve.
+        :return: Dictionary of node name to node, for the nodes found.
+        """
+        query = "UNWIND {names} AS name MATCH (n) WHERE n.name = name " \
+                "RETURN name, n"
+        nodes = {}
+        for record in self.graph_db.run(query, names=list(node_ids)):
+            nodes.setdefault(record["name"], record["n"])
+        return nodes
+
     def delete_all(self):
         """
         Delete all nodes and edges from the database.
@@ -670,35 +791,52 @@ class Neo4jGDB(base.GraphDB):
     def load_test_landscape(self, graph_file):
         """
         Loads the test graph into the database, for integration tests.
-        :param graph: Networkx Test Graph.
-        """
-        graph_data = json.load(open(graph_file))
-        graph = json_graph.node_link_graph(graph_data, directed=True)
+        :param graph_file: Path to a networkx json test graph, or the
+        networkx graph itself. The graph is not modified, so a parsed graph
+        can be loaded again.
+        """
+        if isinstance(graph_file, basestring):
+            with open(graph_file) as graph_json:
+                graph_data = json.load(graph_json)
+            graph = json_graph.node_link_graph(graph_data, directed=True)
+        else:
+            graph = graph_file
 
-        node_lookup = {}
+        # One UNWIND per node label and per relationship type, rather than a
+        # create statement per element; labels cannot be parameterised.
+        node_rows = {}
         for node_id, node_data in graph.nodes(data=True):
             node_attrs = _format_node(node_data)
             if "_state_" in node_id:
                 category = node_id.split("_")[0] + "_state"
             else:
                 category = node_attrs["category"]
-            node = Node(category, **node_attrs)
-            node_lookup[node_id] = node
+            row = {"key": node_id, "props": node_attrs}
+            node_rows.setdefault(category, []).append(row)
 
-        rels = []
+        edge_rows = {}
         for src, dest, edge_attrs in graph.edges(data=True):
-            label = edge_attrs["label"]
-            del edge_attrs["label"]
-            src_node = node_lookup[src]
-            dest_node = node_lookup[dest]
-            rel = Relationship(src_node, label, dest_node, **edge_attrs)
-            rels.append(rel)
+            edge_attrs = dict(edge_attrs)
+            label = edge_attrs.pop("label")
+            row = {"src": src, "dest": dest, "props": edge_attrs}
+            edge_rows.setdefault(label, []).append(row)
 
         transaction = self.graph_db.begin()
-        for _, node_object in node_lookup.iteritems():
-            transaction.create(node_object)
-        for rel_object in rels:
-            transaction.create(rel_object)
+        node_lookup = {}
+        for category, rows in node_rows.iteritems():
+            query = "UNWIND {rows} AS row CREATE (n:`%s`) SET n = row.props " \
+                    "RETURN row.key AS key, id(n) AS id" % category
+            for record in transaction.run(query, rows=rows):
+                node_lookup[record["key"]] = record["id"]
+
+        for label, rows in edge_rows.iteritems():
+            for row in rows:
+                row["src"] = node_lookup[row["src"]]
+                row["dest"] = node_lookup[row["dest"]]
+            query = "UNWIND {rows} AS row MATCH (src), (dest) " \
+                    "WHERE id(src) = row.src AND id(dest) = row.dest " \
+                    "CREATE (src)-[r:`%s`]->(dest) SET r = row.props" % label
+            transaction.run(query, rows=rows)
         transaction.commit()
 
 
@@ -15,6 +15,7 @@
 Main module for the landscaper. Initialises everything and starts the
 landscaper.
 """
+import ast
 import importlib
 import os
 
@@ -26,6 +27,9 @@ from landscaper.utilities import configuration
 
 CONFIGURATION_SECTION = 'general'
 
+# Plugin class name to module name lookups, cached per plugin directory.
+_PLUGIN_MODULES = {}
+
 
 class LandscapeManager(object):
     """
@@ -137,13 +141,33 @@ class LandscapeManager(object):
         constructor of the plugin.
         """
         plugins = []
+        plugin_modules = _plugin_modules(plugin_dir)
         for plugin_name in plugin_names:
-            for file_name in os.listdir(plugin_dir):
-                if file_name.endswith(".py"):
-                    module_name = '.' + file_name.rstrip(".py")
-                    module = importlib.import_module(module_name, package)
-                    plugin_class = getattr(module, plugin_name, None)
-                    if plugin_class:
-                        plugins.append(plugin_class(*plugin_params))
-                        break  # Only one plugin per module.
+            module_name = plugin_modules.get(plugin_name)
+            if module_name:
+                module = importlib.import_module(module_name, package)
+                plugin_class = getattr(module, plugin_name)
+                plugins.append(plugin_class(*plugin_params))
         return plugins
+
+
+def _plugin_modules(plugin_dir):
+    """
+    Maps the class names defined in the plugin directory to the modules that
+    define them. The module sources are parsed rather than imported, so that
+    only the plugins which are used pull in their dependencies.
+    :param plugin_dir: Plugin directory.
+    :return: Dictionary of class name to relative module name.
+    """
+    if plugin_dir not in _PLUGIN_MODULES:
+        plugin_modules = {}
+        for file_name in sorted(os.listdir(plugin_dir)):
+            if file_name.endswith(".py"):
+                with open(os.path.join(plugin_dir, file_name)) as module_file:
+                    module_ast = ast.parse(module_file.read(), file_name)
+                module_name = '.' + file_name[:-3]
+                for node in module_ast.body:
+                    if isinstance(node, ast.ClassDef):
+                        plugin_modules.setdefault(node.name, module_name)
+        _PLUGIN_MODULES[plugin_dir] = plugin_modules
+    return _PLUGIN_MODULES[plugin_dir]
@@ -11,45 +11,46 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import Queue
+import threading
+import urllib
 import requests
 from landscaper.common import LOG
 from datetime import datetime
-from requests.packages.urllib3.exceptions import InsecureRequestWarning
 requests.packages.urllib3.disable_warnings()
 
 CONFIG_SECTION_GENERAL = 'general'
 CONFIG_CIMI_URL = "cimi_url"
 CIMI_SEC_HEADERS = {"slipstream-authn-info": "internal ADMIN"}
 SSL_VERIFY = False
+# Seconds the metrics worker waits for new metrics before it exits.
+METRICS_IDLE_TIMEOUT = 1
 
 
 class CimiClient():
 
     def __init__(self, conf_manager):
         self.cnf = conf_manager
+        self.session = requests.Session()
+        self._metrics_queue = Queue.Queue()
+        self._metrics_worker = None
+        self._metrics_lock = threading.Lock()
+        self.cimi_url = None
         cimi_url = self.cnf.get_variable(
             CONFIG_SECTION_GENERAL, CONFIG_CIMI_URL)
         if cimi_url is None:
             LOG.error(
                 "'CIMI_URL' has not been set in the 'general' section of the config file")
             return
-        # TODO: certificate authentication issues
-        if cimi_url.lower().find('https') > 0:
-            requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-
         self.cimi_url = cimi_url
 
     # returns events by default, delete events.
     def get_events(self, from_date=None, event_type="DELETED", limit=None):
         # try:
-        date_filter = ""
+        filters = ['content/state="%s"' % event_type]
         if from_date:
-            date_filter = '&$filter=created>"%s"' % from_date
-        limit_filter = ""
-        if limit:
-            limit_filter = "&$last={}".format(limit)
-        url = self.cimi_url + '/event?$orderby=created:desc$filter=content/state="' + \
-            event_type + '"' + date_filter + limit_filter
+            filters.append('created>"%s"' % from_date)
+        url = self._collection_url('event', 'created', filters, limit)
         res = requests.get(url,
                            headers=CIMI_SEC_HEADERS,
                            verify=SSL_VERIFY)
@@ -62,19 +63,18 @@ class CimiClient():
         return dict()
 
     # returns a specific device
-    def get_collection(self, collection, from_date=None, limit=None, updates=False):
+    def get_collection(self, collection, from_date=None, limit=None, updates=False,
+                       filter_expr=None):
         # try:
         fieldName = "created"
         if updates is True:
             fieldName = "updated"
-        date_filter = ""
+        filters = []
         if from_date:
-            date_filter = '&$filter=' + fieldName + '>"%s"' % from_date
-        limit_filter = ""
-        if limit:
-            limit_filter = "&$last={}".format(limit)
-        url = self.cimi_url + '/' + collection + '?$orderby=' + \
-            fieldName + ':desc' + date_filter + limit_filter
+            filters.append(fieldName + '>"%s"' % from_date)
+        if filter_expr:
+            filters.append(filter_expr)
+        url = self._collection_url(collection, fieldName, filters, limit)
         # print url
         res = requests.get(url,
                            headers={'slipstream-authn-info': 'internal ADMIN'},
@@ -87,32 +87,89 @@ class CimiClient():
         LOG.error("Response: " + str(res.json()))
         return dict()
 
+    def _collection_url(self, collection, order_field, filters=None,
+                        limit=None):
+        """
+        Builds a url-encoded CIMI query for a collection, ordered newest
+        first.
+        :param collection: Name of the CIMI collection.
+        :param order_field: Field to order the results by.
+        :param filters: List of CIMI filter expressions, and-ed together.
+        :param limit: Maximum number of results.
+        :return: The collection url.
+        """
+        query = [('$orderby', order_field + ':desc')]
+        if filters:
+            query.append(('$filter', ' and '.join(filters)))
+        if limit:
+            query.append(('$last', limit))
+        return self.cimi_url + '/' + collection + '?' + urllib.urlencode(query)
+
+    # queues the metric, it is posted to CIMI by a background thread.
     def add_service_container_metrics(self, id, device_id, start_time):
-        url = self.cimi_url + '/service-container-metric'
+        if self.cimi_url is None:
+            LOG.error("Service container metric dropped, no CIMI url is set")
+            return
         data = {'container_id': id, 'device_id': {'href': 'device/'+device_id},
                 'start_time': start_time}
-        resp = requests.post(url, headers=CIMI_SEC_HEADERS,
-                             verify=SSL_VERIFY, json=data)
-        if resp.status_code != 201:
-            LOG.error(resp.json())
-        return resp
+        with self._metrics_lock:
+            self._metrics_queue.put(data)
+            self._start_metrics_worker()
+
+    # blocks until all of the queued metrics have been posted.
+    def flush_metrics(self):
+        with self._metrics_lock:
+            if not self._metrics_queue.empty():
+                self._start_metrics_worker()
+        self._metrics_queue.join()
+
+    # starts a worker if none is running, the metrics lock must be held.
+    def _start_metrics_worker(self):
+        worker = self._metrics_worker
+        if worker is None or not worker.is_alive():
+            # Not a daemon, so metrics queued at exit are still posted.
+            self._metrics_worker = threading.Thread(target=self._post_metrics)
+            self._metrics_worker.start()
+
+    # posts queued metrics, exits once the queue has been idle for a while.
+    def _post_metrics(self):
+        while True:
+            try:
+                data = self._metrics_queue.get(timeout=METRICS_IDLE_TIMEOUT)
+            except Queue.Empty:
+                with self._metrics_lock:
+                    if self._metrics_queue.empty():
+                        self._metrics_worker = None
+                        return
+                continue
+            try:
+                url = self.cimi_url + '/service-container-metric'
+                resp = self.session.post(url, headers=CIMI_SEC_HEADERS,
+                                         verify=SSL_VERIFY, json=data)
+                if resp.status_code != 201:
+                    LOG.error(resp.json())
+            except Exception as err:  # pylint: disable=broad-except
+                LOG.error("Failed to post service container metric: %s", err)
+            finally:
+                self._metrics_queue.task_done()
 
     def update_service_container_metrics(self, id, device_id, end_time):
-        coll = self.get_collection('service-container-metric')
-        coll = coll['serviceContainerMetrics']
-        device_id = "device/{0}".format(device_id)
+        # The metric may still be queued for creation.
+        self.flush_metrics()
+        # Let the server find the metric rather than pulling the collection.
+        metric_filter = 'device_id/href="device/{0}" and container_id="{1}"'\
+            .format(device_id, id)
+        coll = self.get_collection('service-container-metric', limit=1,
+                                   filter_expr=metric_filter)
+        coll = coll.get('serviceContainerMetrics', [])
         end_time = float(end_time) // 1000000000
         end_time = datetime.utcfromtimestamp(end_time)
         mlsec = end_time.microsecond
         json_end_time = end_time.strftime(
             '%Y-%m-%dT%H:%M:%S.%f{:02d}Z'.format(mlsec))
         scm_id = None
-        for item in coll:
-            dev_id = item['device_id']['href']
-            cont_id = item['container_id']
-            if dev_id == device_id and cont_id == id:
-                scm_id = item['id']
-                break
+        if coll:
+            scm_id = coll[0]['id']
         if scm_id:
             url = self.cimi_url + '/' + scm_id
             data = {'stop_time': json_end_time}
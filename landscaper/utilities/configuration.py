@@ -28,11 +28,14 @@ class ConfigurationManager(object):
     """
     def __init__(self, config_file=paths.CONF_FILE):
         self.sections = []
+        self._typed_cache = {}
+        self._machines_cache = None
         self.config = ConfigParser.ConfigParser()
         self.config.read(config_file)
         self.config_file = config_file
-        for section in self.sections:
-            self.add_section(section)
+        self._all = {section: self._config_section_map(section, self.config)
+                     for section in self.config.sections()}
+        self._dirty = False
 
     def add_section(self, section):
         """
@@ -41,9 +44,9 @@ class ConfigurationManager(object):
         sections that have been added can be retrieved.
         """
         if section not in self.sections:
-            setattr(
-                self, section, ConfigurationManager.
-                _config_section_map(section, self.config))
+            if section not in self._all:
+                raise ConfigParser.NoSectionError(section)
+            setattr(self, section, self._all[section])
             self.sections.append(section)
 
     @staticmethod
@@ -64,30 +67,38 @@ class ConfigurationManager(object):
         :param variable: name of the variable (string)
         :return: string
         """
-        if variable in self.get_variable_list(section):
-            sect = getattr(self, section)
-            return sect[variable]
-        LOG.info('Config: Cannot find %s in section %s', variable, section)
-        return None
+        if section in self.sections:
+            value = self._all[section].get(variable)
+        else:
+            value = self.get_variable_list(section).get(variable)
+        if value is None:
+            LOG.info('Config: Cannot find %s in section %s', variable, section)
+        return value
 
     def set_variable(self, section, variable, value):
         """
-        Sets the value of a variable for a given section.
+        Sets the value of a variable for a given section. The change is only
+        written to the config file by flush.
         :param section: section to be loaded (string)
         :param variable: name of the variable (string)
         :param: value: the value to set for this variable
         """
         # write setting to config mgr in memory
-        config_values = ConfigurationManager._config_section_map(section,
-                                                                 self.config)
-        config_values[variable] = value
-        setattr(self, section, config_values)
-
-        # write setting back to config file
-        cfgfile = open(self.config_file, 'w')
         self.config.set(section, variable, value)
-        self.config.write(cfgfile)
-        cfgfile.close()
+        self._all[section][variable] = value
+        self._typed_cache.clear()
+        self._dirty = True
+
+    def flush(self):
+        """
+        Writes any settings changed by set_variable back to the config file.
+        Callers that change settings must call this to persist them.
+        """
+        if not self._dirty:
+            return
+        with open(self.config_file, 'w') as cfgfile:
+            self.config.write(cfgfile)
+        self._dirty = False
 
     def get_variable_list(self, section):
         """
@@ -127,22 +138,31 @@ class ConfigurationManager(object):
     def get_machines(self):
         """
         Get the list of physical machines by scanning the folder with hwloc files.
+        The folder is only scanned again when its contents have changed.
         """
         hwloc_folder = self.get_hwloc_folder()
+        key = (hwloc_folder, os.stat(hwloc_folder).st_mtime)
+        if self._machines_cache and self._machines_cache[0] == key:
+            return list(self._machines_cache[1])
         hw_loc_ext = '_hwloc.xml'
         pattern = re.compile(re.escape(hw_loc_ext), re.IGNORECASE)
         machines = [pattern.sub('', f) for f in os.listdir(hwloc_folder) if os.path.isfile(os.path.join(hwloc_folder, f)) and f.lower().endswith(hw_loc_ext)]
-        return machines
+        self._machines_cache = (key, machines)
+        return list(machines)
 
     def get_swarm_info(self):
         """
         Swarm configuration information.
         """
+        if 'swarm_info' in self._typed_cache:
+            return self._typed_cache['swarm_info']
         port = self.get_variable('docker', 'swarm_port')
         ip_address = self.get_variable('docker', 'swarm_ip')
         cert = self.get_variable('docker', 'client_cert')
         key = self.get_variable('docker', 'client_key')
-        return port, ip_address, cert, key
+        swarm_info = (port, ip_address, cert, key)
+        self._typed_cache['swarm_info'] = swarm_info
+        return swarm_info
 
     def get_neo4j_url(self):
         """
@@ -154,6 +174,8 @@ class ConfigurationManager(object):
         """
         Neo4j login security credentials.
         """
+        if 'neo4j_credentials' in self._typed_cache:
+            return self._typed_cache['neo4j_credentials']
         user = self.get_variable('neo4j', 'user')
         password = self.get_variable('neo4j', 'password')
         use_bolt = self.get_variable('neo4j', 'use_bolt')
@@ -161,7 +183,9 @@ class ConfigurationManager(object):
             use_bolt = False
         else:
             use_bolt = True
-        return user, password, use_bolt
+        credentials = (user, password, use_bolt)
+        self._typed_cache['neo4j_credentials'] = credentials
+        return credentials
 
     def get_rabbitmq_info(self):
         """
@@ -211,7 +235,9 @@ class ConfigurationManager(object):
         Get boolean flush value, which indicates whether the database should
         be completely deleted and rebuilt before starting the event listeners.
         """
+        if 'flush' in self._typed_cache:
+            return self._typed_cache['flush']
         flush = self.get_variable("general", "flush")
-        if flush.lower() == "false":
-            return False
-        return True
+        flush = flush.lower() != "false"
+        self._typed_cache['flush'] = flush
+        return flush
@@ -14,9 +14,21 @@
 """
 Retrieval of coordinates.
 """
+import collections
 import json
+import os
 
 from landscaper import paths
+try:
+    import ujson as json_decoder
+except ImportError:
+    json_decoder = json
+
+# Parsed coordinates files, keyed on path and modification time.
+_COORDINATES_CACHE = {}
+
+CoordinatesFile = collections.namedtuple("CoordinatesFile",
+                                         ["coords", "by_name"])
 
 
 class Geo(object):
@@ -30,9 +42,39 @@ class Geo(object):
         :param json_str: networkx json graph
         :return: GeoJSON feature collection
         """
-        json_dict = json.loads(json_str)
+        json_dict = json_decoder.loads(json_str)
+        return json.dumps(Geo.extract_geo_object(json_dict))
+
+    @staticmethod
+    def extract_geo_object(graph):
+        """
+        Build feature collection object from an already parsed networkx json
+        graph, without serialising it.
+        :param graph: networkx json graph dictionary.
+        :return: GeoJSON feature collection dictionary.
+        """
+        return Geo.feature_collection_object(graph['nodes'])
+
+    @staticmethod
+    def feature_collection(nodes):
+        """
+        Build feature collection object from node attribute dictionaries.
+        :param nodes: iterable of node dictionaries, as found in a networkx
+        json graph.
+        :return: GeoJSON feature collection
+        """
+        return json.dumps(Geo.feature_collection_object(nodes))
+
+    @staticmethod
+    def feature_collection_object(nodes):
+        """
+        Build feature collection dictionary from node attribute dictionaries.
+        :param nodes: iterable of node dictionaries, as found in a networkx
+        json graph.
+        :return: GeoJSON feature collection dictionary.
+        """
         features = []
-        for node in json_dict['nodes']:
+        for node in nodes:
             # test for attributes first
             geo = {}
             if 'attributes' in node:
@@ -49,9 +91,7 @@ class Geo(object):
                            "properties": {"name": name}}
                 features.append(feature)
 
-        feat_collection = {"type": "FeatureCollection", "features": features}
-
-        return json.dumps(feat_collection)
+        return {"type": "FeatureCollection", "features": features}
 
 
 def component_coordinates(component_name):
@@ -63,16 +103,34 @@ def component_coordinates(component_name):
     :return: A geoJSON geometry feature.
     """
     if component_name:
-        coordinates = load_coordinates()
-        for component in coordinates.get("features"):
-            if component["properties"]["name"] == component_name:
-                return component["geometry"]
+        return _load_coordinates().by_name.get(component_name)
     return None
 
 
 def load_coordinates():
     """
-    Load the coordinates from the coordinates JSON file.
+    Load the coordinates from the coordinates JSON file. The file is only
+    parsed again when it has been modified.
     :return: JSON containing all of the coordinates.
     """
-    return json.load(open(paths.COORDINATES))
+    return _load_coordinates().coords
+
+
+def _load_coordinates():
+    """
+    Loads the coordinates file along with an index of component names to
+    their geometry. The first feature with a name is the one indexed.
+    :return: CoordinatesFile of the coordinates JSON and the name index.
+    """
+    path = paths.COORDINATES
+    key = (path, os.path.getmtime(path))
+    if key not in _COORDINATES_CACHE:
+        with open(path, 'rb') as coordinates_file:
+            coords = json_decoder.loads(coordinates_file.read())
+        by_name = {}
+        for component in coords.get("features"):
+            by_name.setdefault(component["properties"]["name"],
+                               component["geometry"])
+        _COORDINATES_CACHE.clear()
+        _COORDINATES_CACHE[key] = CoordinatesFile(coords, by_name)
+    return _COORDINATES_CACHE[key]
@@ -14,13 +14,32 @@
 """
 Functions related to networkx graph manipulation.
 """
+import hashlib
+import itertools
 import json
-import operator
+import threading
+import time
+from collections import deque
+from collections import OrderedDict
 import networkx as nx
 from networkx.readwrite import json_graph
 
+from landscaper.utilities.coordinates import Geo
+try:
+    import ujson as json_encoder
+except ImportError:
+    json_encoder = json
 
-def filter_nodes(graph, types, filter_these=True, json_out=True):
+PARSE_CACHE_SIZE = 8
+PARSE_CACHE_TTL = 5  # seconds
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+# Nodes or links serialised together when streaming a graph.
+STREAM_BATCH_SIZE = 500
+
+
+def filter_nodes(graph, types, filter_these=True, json_out=True,
+                 geo_only=False, columnar=False):
     """
     Filters the node types from a graph and connects the nodes as appropriate.
     The types that are filtered are decided by the types and filter_these
@@ -30,41 +49,130 @@ def filter_nodes(graph, types, filter_these=True, json_out=True):
     :param types: The types to keep or filter from the graph.
     :param filter_these: Flag which decides whether types are filtered or kept.
     :param json_out: If true then json is returned rather than a graph.
+    :param geo_only: If true then only the geoJSON feature collection of the
+    kept nodes is returned, without building the filtered graph.
+    :param columnar: If true then json with parallel lists of node ids, types,
+    attributes and edge ends is returned, without building the filtered graph.
     :return: A networkx graph as an object or as json.
     """
     graph = _graph_obj(graph)
-    filter_operator = operator.not_ if filter_these else operator.truth
-    new_graph = nx.DiGraph()
+    types_set = frozenset(types)
     end_nodes = _end_nodes(graph)
+    visited = set()
+    kept_nodes = {}
+    kept_edges = set()
     for end_node in end_nodes:
-        _filter_types(graph, new_graph, end_node, None, types, filter_operator)
+        _filter_types(graph, end_node, types_set, filter_these, visited,
+                      kept_nodes, kept_edges)
+    if geo_only:
+        return Geo.feature_collection(kept_nodes.itervalues())
+    if columnar:
+        return json_encoder.dumps(_columnar(kept_nodes, kept_edges))
+    new_graph = nx.DiGraph()
+    new_graph.add_nodes_from(kept_nodes.iteritems())
+    new_graph.add_edges_from(kept_edges)
     if json_out:
-        return json.dumps(json_graph.node_link_data(new_graph))
+        return json_encoder.dumps(json_graph.node_link_data(new_graph))
     return new_graph
 
 
-def _filter_types(graph, new_graph, nid, source, types, filter_operator):
+def _columnar(nodes, edges):
+    """
+    Lays out nodes and edges as parallel lists.
+    :param nodes: dict of node ids to their attributes.
+    :param edges: iterable of (source, target) edges.
+    :return: dict of ids, types, attrs and edges lists.
+    """
+    ids = nodes.keys()
+    attrs = [nodes[nid] for nid in ids]
+    types = [node_attrs['type'] for node_attrs in attrs]
+    sources, targets = [], []
+    for source, target in edges:
+        sources.append(source)
+        targets.append(target)
+    return {'ids': ids, 'types': types, 'attrs': attrs,
+            'edges': [sources, targets]}
+
+
+def node_link_chunks(graph, batch_size=STREAM_BATCH_SIZE):
+    """
+    Serialises a graph to node-link json in batches of nodes and links, so
+    that large graphs can be streamed without building the whole document.
+    :param graph: networkx graph.
+    :param batch_size: Number of nodes or links serialised per chunk.
+    :return: generator of json strings.
+    """
+    mapping = dict(itertools.izip(graph, itertools.count()))
+    nodes = (dict(graph.node[nid], id=nid) for nid in graph)
+    edges = getattr(graph, 'edges_iter', graph.edges)
+    if graph.is_multigraph():
+        links = (dict(attrs, source=mapping[src], target=mapping[dest],
+                      key=key)
+                 for src, dest, key, attrs in edges(keys=True, data=True))
+    else:
+        links = (dict(attrs, source=mapping[src], target=mapping[dest])
+                 for src, dest, attrs in edges(data=True))
+
+    yield '{{"directed": {}, "multigraph": {}, "graph": {}, "nodes": ['.format(
+        json_encoder.dumps(graph.is_directed()),
+        json_encoder.dumps(graph.is_multigraph()),
+        json_encoder.dumps(graph.graph))
+    for chunk in _json_batches(nodes, batch_size):
+        yield chunk
+    yield '], "links": ['
+    for chunk in _json_batches(links, batch_size):
+        yield chunk
+    yield ']}'
+
+
+def _json_batches(items, batch_size):
+    """
+    Serialises items as comma separated json, batch_size items at a time.
+    :param items: iterable of json serialisable items.
+    :param batch_size: Number of items per string.
+    :return: generator of json strings.
+    """
+    items = iter(items)
+    separator = ''
+    while True:
+        batch = list(itertools.islice(items, batch_size))
+        if not batch:
+            return
+        yield separator + ', '.join(json_encoder.dumps(item) for item in batch)
+        separator = ', '
+
+
+def _filter_types(graph, end_node, types, filter_these, visited, kept_nodes,
+                  kept_edges):
     """
-    Recursive method which walks, depth first, through the graph. Nodes are
-    checked by their type and added if required to the new_graph.
+    Walks, depth first, through the graph from an end node. Nodes are
+    checked by their type and collected, along with their edges, if they are
+    to be kept.
     :param graph: graph that is being traversed through.
-    :param new_graph: graph being built.
-    :param nid: current node being inspected.
-    :param source: last node that was added.
-    :param types: list of types that are being checked against.
-    :param filter_operator: comparison operator.
+    :param end_node: node the walk starts from.
+    :param types: set of types that are being checked against.
+    :param filter_these: Flag which decides whether types are filtered or kept.
+    :param visited: (node, source) pairs already walked. The subtree below a
+    node depends only on the last added node, so a pair is walked once.
+    :param kept_nodes: dict of kept node ids to their attributes.
+    :param kept_edges: set of (source, target) edges between kept nodes.
     :return: None
     """
-    ntype = graph.node[nid]['type']
-    if filter_operator(operator.contains(types, ntype)):
-        new_graph.add_node(nid, **graph.node[nid])
-        if source:
-            new_graph.add_edge(source, nid)
-        source = nid
-    successors = graph.successors(nid)
-    for succ in successors:
-        _filter_types(graph, new_graph, succ, source, types, filter_operator)
-    return
+    stack = deque([(end_node, None)])
+    while stack:
+        nid, source = stack.pop()
+        if (nid, source) in visited:
+            continue
+        visited.add((nid, source))
+        attrs = graph.node[nid]
+        if (attrs['type'] in types) ^ filter_these:
+            kept_nodes[nid] = attrs
+            if source:
+                kept_edges.add((source, nid))
+            source = nid
+        # Reversed so successors are visited in the same order as before.
+        successors = reversed(graph.successors(nid))
+        stack.extend((succ, source) for succ in successors)
 
 
 def _end_nodes(graph):
@@ -72,19 +180,47 @@ def _end_nodes(graph):
     Returns all nodes with no predecessors. We filter the graph form these
     nodes.
     """
-    end_nodes = []
-    for node in graph:
-        predecessor = graph.predecessors(node)
-        if not predecessor:
-            end_nodes.append(node)
-    return end_nodes
+    if hasattr(graph, 'in_degree_iter'):
+        in_degrees = graph.in_degree_iter()
+    else:
+        in_degrees = graph.in_degree()
+    return [node for node, degree in in_degrees if degree == 0]
 
 
 def _graph_obj(graph):
     """
-    converts json strings to graph objects.
+    converts json strings to graph objects. Parsed graphs are shared, see
+    _parse_graph.
     """
     if isinstance(graph, basestring):
-        json_g = json.loads(graph)
-        return json_graph.node_link_graph(json_g, directed=True)
+        return _parse_graph(graph)
+    return graph
+
+
+def _parse_graph(graph_str):
+    """
+    Parses a node-link json string into a graph. The last few parsed graphs
+    are kept for a short time, keyed on a digest of the json, so repeated
+    filters over the same snapshot are only parsed once. The same graph
+    object is returned to every caller, so it must not be modified.
+    :param graph_str: node-link json string.
+    :return: networkx graph.
+    """
+    if isinstance(graph_str, unicode):
+        key = hashlib.sha1(graph_str.encode('utf-8')).digest()
+    else:
+        key = hashlib.sha1(graph_str).digest()
+    now = time.time()
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.pop(key, None)
+        if cached and now - cached[0] < PARSE_CACHE_TTL:
+            _PARSE_CACHE[key] = cached
+            return cached[1]
+
+    json_g = json.loads(graph_str)
+    graph = json_graph.node_link_graph(json_g, directed=True)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = (now, graph)
+        if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
     return graph
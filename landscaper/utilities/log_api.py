@@ -1,7 +1,8 @@
-import subprocess
+import os
 from datetime import datetime
 LOGF = '/collector_log/landscaper.log'
 LOG_BATCH_LINE_COUNT = 50
+TAIL_BLOCK_SIZE = 16384
 
 
 class LogApi:
@@ -10,31 +11,46 @@ class LogApi:
         pass
 
     def get_log(self, from_tm=None):
-        raw_log = subprocess.check_output(['tail', '-n', str(LOG_BATCH_LINE_COUNT), LOGF])
-        lines = raw_log.splitlines()
-        for i in range(0, len(lines)):
-            line = lines[i]
-            tm = line[1:24]
-            tm = datetime.strptime(tm, '%Y-%m-%d %H:%M:%S %Z').isoformat()
+        lines = []
+        for line in tail(LOGF, LOG_BATCH_LINE_COUNT):
+            # The raw timestamp sorts like its isoformat, so old lines are
+            # skipped before being parsed.
+            if from_tm and line[1:11] + 'T' + line[12:20] <= from_tm:
+                continue
+            tm = _parse_ts(line)
             typ = line[27:31]
             desc = line[35:len(line)]
-            line = {'log_time': tm, 'log_type': typ, 'log_text': desc}
-            lines[i] = line
+            lines.append({'log_time': tm, 'log_type': typ, 'log_text': desc})
         lines.sort(key=sort_log, reverse=True)
-        if from_tm:
-            lines = filter_log(lines, from_tm)
         return lines
 
 
-def sort_log(line):
-    return line['log_time']
+def _parse_ts(line):
+    # Lines start with '[%Y-%m-%d %H:%M:%S %Z]', see common.FORMATTER.
+    return datetime(int(line[1:5]), int(line[6:8]), int(line[9:11]),
+                    int(line[12:14]), int(line[15:17]),
+                    int(line[18:20])).isoformat()
+
+
+def tail(path, count):
+    # Read blocks backwards from the end of the file until enough lines have
+    # been seen, rather than reading the whole log.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        data = ''
+        while pos > 0 and data.count('\n') <= count:
+            read_size = min(TAIL_BLOCK_SIZE, pos)
+            pos = os.lseek(fd, pos - read_size, os.SEEK_SET)
+            data = os.read(fd, read_size) + data
+    finally:
+        os.close(fd)
+    lines = data.splitlines()
+    if pos > 0:
+        # The first line is likely partial.
+        lines = lines[1:]
+    return lines[-count:]
 
 
-def filter_log(lines, tm):
-    f_log = []
-    for line in lines:
-        if line['log_time'] > tm:
-            f_log.append(line)
-        else:
-            break
-    return f_log
\ No newline at end of file
+def sort_log(line):
+    return line['log_time']
@@ -21,6 +21,14 @@ Openstack connection class.
 import os
 import time
 
+from cinderclient import client as cinder
+from heatclient import client as heat_client
+from keystoneauth1 import session
+from keystoneauth1.identity import v2
+from keystoneauth1.identity import v3
+from neutronclient.v2_0 import client as neutron
+from novaclient import client as nova
+
 from landscaper.common import LOG
 
 
@@ -41,6 +49,9 @@ OS_USER_DOMAIN_NAME = "OS_USER_DOMAIN_NAME"
 OS_TENANT_ID = "OS_TENANT_ID"
 OS_TENANT_NAME = "OS_TENANT_NAME"
 
+# Keystone sessions shared by all registries, keyed on the connection details.
+_SESSION_CACHE = {}
+
 
 class OpenStackClientRegistry(object):
     """
@@ -61,28 +72,24 @@ class OpenStackClientRegistry(object):
         """
         Return a nova, version 2 client.
         """
-        from novaclient import client as nova
         return nova.Client(NOVA_API_VERSION, session=self._session())
 
     def get_cinder_v2_client(self):
         """
         Returns a cinder, version 2 client.
         """
-        from cinderclient import client as cinder
         return cinder.Client(CINDER_API_VERSION, session=self._session())
 
     def get_neutron_v2_client(self):
         """
         Returns a neutron, version 2 client.
         """
-        from neutronclient.v2_0 import client as neutron
         return neutron.Client(session=self._session())
 
     def get_heat_v1_client(self):
         """
         Returns a heat, version 1 client.
         """
-        from heatclient import client as heat_client
         return heat_client.Client(HEAT_API_VERSION, session=self._session())
 
     def _session(self):
@@ -93,20 +100,39 @@ class OpenStackClientRegistry(object):
         """
         now = time.time()
         if (now - self.session_timestamp) > SESSION_TIMEOUT:
-            if self.keystone_ver == '3':
-                self.session = _get_session_keystone_v3()
-            else:
-                self.session = _get_session_keystone_v2()
-            self.session_timestamp = now
+            self.session, self.session_timestamp = _cached_session(
+                self.keystone_ver, now)
         return self.session
 
 
+def _cached_session(keystone_ver, now):
+    """
+    Returns a keystone session for the current connection details, reusing
+    one created by another registry if it has not yet expired. The session
+    holds the issued token and re-authenticates itself when it expires.
+    :param keystone_ver: Keystone version, '2' or '3'.
+    :param now: Current time.
+    :return: Tuple of the session and the time it was created.
+    """
+    key = (keystone_ver, os.environ.get(OS_USERNAME),
+           os.environ.get(OS_PASSWORD), os.environ.get(OS_USER_DOMAIN_NAME),
+           os.environ.get(OS_PROJECT_NAME), os.environ.get(OS_PROJECT_ID),
+           os.environ.get(OS_AUTH_URL))
+    cached = _SESSION_CACHE.get(key)
+    if cached is None or (now - cached[1]) > SESSION_TIMEOUT:
+        if keystone_ver == '3':
+            sess = _get_session_keystone_v3()
+        else:
+            sess = _get_session_keystone_v2()
+        cached = (sess, now)
+        _SESSION_CACHE[key] = cached
+    return cached
+
+
 def _get_session_keystone_v2():
     """
     Returns a keystone session variable.
     """
-    from keystoneauth1 import session
-    from keystoneauth1.identity import v2
     user, password, auth_uri, project_name, project_id, user_domain_name = _get_connection_info('2')
     auth = v2.Password(username=user, password=password,
                        tenant_name=project_name, auth_url=auth_uri)
@@ -117,10 +143,6 @@ def _get_session_keystone_v3():
     """
     Returns a keystone session variable.
     """
-    from keystoneauth1.identity import v3
-    from keystoneauth1 import session
-    from keystoneclient.v3 import client
-
     user, password, auth_uri, project_name, project_id, user_domain_name = _get_connection_info('3')
 
     auth = v3.Password(auth_url=auth_uri,
@@ -15,6 +15,8 @@
 REST Application for the landscape.
 """
 import ast
+import hashlib
+import threading
 import time
 
 import json
@@ -37,6 +39,14 @@ CORS(APP)
 LANDSCAPE = None
 MIME = "application/json"
 
+# Polling clients within this window share one fetch of the graph.
+GRAPH_CACHE_TTL = 2
+_GRAPH_CACHE = {"ts": 0, "graph_db": None, "graph": None, "etag": None}
+_GRAPH_CACHE_LOCK = threading.Lock()
+
+# Accepted spellings of boolean query parameters, anything else is False.
+_BOOL_MAP = {"true": True, "1": True, "false": False, "0": False}
+
 
 @APP.route("/graph")
 def get_graph():
@@ -49,16 +59,38 @@ def get_graph():
     # Filter arguments
     filter_these = _bool(request.args.get("filter-these", True))
     filter_nodes = request.args.get("filter-nodes", [])
+    columnar = _bool(request.args.get("columnar", False))
 
     # Fetch the graph
-    graph = LANDSCAPE.graph_db.get_graph()
+    graph, graph_etag = _cached_graph()
+
+    # The response only depends on the graph and the query string.
+    etag = _etag(graph_etag + request.query_string)
+    if etag in request.if_none_match:
+        response = Response(status=304, mimetype=MIME)
+        response.set_etag(etag)
+        return response
 
     if filter_nodes:
         filter_nodes = ast.literal_eval(filter_nodes)
-        graph = util_graph.filter_nodes(graph, filter_nodes, filter_these)
-    if geo:
+        if geo:
+            # Collect the features while filtering, in a single pass.
+            graph = util_graph.filter_nodes(graph, filter_nodes, filter_these,
+                                            geo_only=True)
+        elif columnar:
+            graph = util_graph.filter_nodes(graph, filter_nodes, filter_these,
+                                            columnar=True)
+        else:
+            # Stream the filtered graph rather than building the json body.
+            graph = util_graph.filter_nodes(graph, filter_nodes, filter_these,
+                                            json_out=False)
+            graph = util_graph.node_link_chunks(graph)
+    elif geo:
         graph = Geo.extract_geo(graph)
-    return Response(graph, mimetype=MIME)
+
+    response = Response(graph, mimetype=MIME)
+    response.set_etag(etag)
+    return response
 
 
 @APP.route("/subgraph/<node_id>")
@@ -142,7 +174,7 @@ def put_geolocation():
         err_msg = "No coordinate data"
         abort(400, err_msg)
 
-    data = ast.literal_eval(request.data)
+    data = _json_body()
 
     for obj in data:
         LOG.info("Updating coordinates of nodes %s", obj['id'])
@@ -152,6 +184,7 @@ def put_geolocation():
                                                       extra_attrs=attrs)
         if not updated:
             error_log.append((obj["id"], msg))
+    _invalidate_graph_cache()
 
     if error_log:
         err_msg = "Error with the following nodes:" + str(error_log)
@@ -173,7 +206,7 @@ def add_new_device():
         abort(400, err_msg)
 
     LOG.debug(request.data)
-    data = ast.literal_eval(request.data)
+    data = _json_body()
 
     # get config manager
     from landscaper.utilities import configuration
@@ -185,6 +218,7 @@ def add_new_device():
     from landscaper.collector.cimi_physicalhost_collector import CimiPhysicalCollector
     cimi_updater = CimiPhysicalCollector(None, conf_manager, None, None)
     cimi_updater.generate_files(data)
+    _invalidate_graph_cache()
 
     if error_log:
         err_msg = "Error with the following nodes:" + str(error_log)
@@ -205,7 +239,7 @@ def add_new_service():
         abort(400, err_msg)
 
     LOG.debug(request.data)
-    data = ast.literal_eval(request.data)
+    data = _json_body()
 
     if error_log:
         err_msg = "Error with the following nodes:" + str(error_log)
@@ -240,23 +274,70 @@ def get_landscaper_log():
     return Response(log, mimetype=MIME)
 
 
+def _cached_graph():
+    """
+    Returns the full graph, fetching it from the graph database at most once
+    every GRAPH_CACHE_TTL seconds. The lock is held while fetching, so an
+    invalidation waits for the fetch and the graph always matches its ETag.
+    :return: The graph as node-link json and its ETag.
+    """
+    with _GRAPH_CACHE_LOCK:
+        now = time.time()
+        graph_db = LANDSCAPE.graph_db
+        if _GRAPH_CACHE["graph_db"] is not graph_db or \
+                now - _GRAPH_CACHE["ts"] >= GRAPH_CACHE_TTL:
+            graph = graph_db.get_graph()
+            _GRAPH_CACHE["graph"] = graph
+            _GRAPH_CACHE["etag"] = _etag(graph)
+            _GRAPH_CACHE["graph_db"] = graph_db
+            _GRAPH_CACHE["ts"] = now
+        return _GRAPH_CACHE["graph"], _GRAPH_CACHE["etag"]
+
+
+def _invalidate_graph_cache():
+    """
+    Makes the next graph request fetch from the graph database, so that
+    writes are visible straight away.
+    """
+    with _GRAPH_CACHE_LOCK:
+        _GRAPH_CACHE["graph"] = None
+        _GRAPH_CACHE["etag"] = None
+        _GRAPH_CACHE["ts"] = 0
+
+
+def _etag(body):
+    """
+    Entity tag for a response body.
+    :param body: Response body.
+    :return: md5 hex digest of the body.
+    """
+    if isinstance(body, unicode):
+        body = body.encode('utf-8')
+    return hashlib.md5(body).hexdigest()
+
+
+def _json_body():
+    """
+    Parses the json body of the request.
+    :return: The decoded body.
+    """
+    try:
+        return json.loads(request.data)
+    except ValueError:
+        err_msg = "Request body is not valid json."
+        LOG.warn(err_msg)
+        abort(400, err_msg)
+
+
 def _bool(value):
     """
     Determine if the value supplied can be interpreted as bool.
     :param value: boolean value
     :return: True / False
     """
-    if not value:
-        return False
     if isinstance(value, bool):
         return value
-
-    value = str(value).lower().strip()
-    if value in ['true', '1']:
-        return True
-    if value in ['false', '0']:
-        return False
-    return False
+    return _BOOL_MAP.get(str(value).lower().strip(), False)
 
 
 @APP.before_first_request
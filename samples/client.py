@@ -18,6 +18,7 @@ from networkx.readwrite import json_graph
 
 HOST = "localhost"
 PORT = 8000
+SESSION = requests.Session()
 
 def get_graph():
     """
@@ -31,6 +32,34 @@ def get_graph():
     return nx_graph
 
 
+def get_filtered_graph(types, filter_these=True):
+    """
+    Retrieves the landscape graph with node types filtered, transferred in
+    the columnar layout.
+    :param types: The types to keep or filter from the graph.
+    :param filter_these: Whether the types are filtered out or kept.
+    :return: Filtered landscape as a networkx graph.
+    """
+    params = {"filter-nodes": str(list(types)),
+              "filter-these": filter_these, "columnar": True}
+    landscape = _get("/graph", params)
+    landscape.raise_for_status()
+    return from_columnar(landscape.json())
+
+
+def from_columnar(data):
+    """
+    Builds a graph from the columnar layout returned by /graph.
+    :param data: dict of ids, types, attrs and edges lists.
+    :return: networkx graph.
+    """
+    nx_graph = nx.DiGraph()
+    nx_graph.add_nodes_from(zip(data["ids"], data["attrs"]))
+    sources, targets = data["edges"]
+    nx_graph.add_edges_from(zip(sources, targets))
+    return nx_graph
+
+
 def get_subgraph(node_id, timestamp=None, timeframe=0):
     """
     Grab the subgraph starting from the specified node.
@@ -52,11 +81,9 @@ def get_machines(graph):
     :param graph: Networkx graph
     :return: List of physical machines
     """
-    machines = {}
-    for node, node_data in graph.nodes(data=True):
-        if node_data["type"] == "machine":
-            machines[node] = node
-    return machines
+    types = nx.get_node_attributes(graph, "type")
+    return {node: node for node, node_type in types.iteritems()
+            if node_type == "machine"}
 
 
 def get_host_machine_for_vm(graph, node_id):
@@ -66,11 +93,7 @@ def get_host_machine_for_vm(graph, node_id):
     :param node_id: Node name
     :return: The host physical machine name
     """
-    machine_host = []
-    for relation in nx.all_neighbors(graph, node_id):
-        if graph.node[relation].get('type') == "machine":
-            machine_host.append(relation)
-    return machine_host
+    return _neighbours_of_type(graph, node_id, "machine")
 
 
 def get_host_machine_for_stack(graph, node_id):
@@ -80,16 +103,8 @@ def get_host_machine_for_stack(graph, node_id):
     :param node_id: Node name
     :return: The host physical machine name
     """
-    vm_host = []
-    machine_host = []
-    for relation in nx.all_neighbors(graph, node_id):
-        if graph.node[relation].get('type') == "vm":
-            vm_host.append(relation)
-
-    for relation in nx.all_neighbors(graph, vm_host[0]):
-        if graph.node[relation].get('type') == "machine":
-            machine_host.append(relation)
-    return machine_host
+    vm_host = _neighbours_of_type(graph, node_id, "vm")
+    return _neighbours_of_type(graph, vm_host[0], "machine")
 
 def get_vm_running_stack(graph, node_id):
     """
@@ -98,26 +113,31 @@ def get_vm_running_stack(graph, node_id):
     :param node_id: Node name
     :return: The host physical machine name
     """
-    vm_host = []
-    for relation in nx.all_neighbors(graph, node_id):
-        if graph.node[relation].get('type') == "vm":
-            vm_host.append(relation)
-    return vm_host
+    return _neighbours_of_type(graph, node_id, "vm")
+
+
+def _neighbours_of_type(graph, node_id, node_type):
+    """
+    Returns the predecessors and successors of a node which are of a type.
+    :param graph: Networkx graph
+    :param node_id: Node name
+    :param node_type: Type of the neighbouring nodes to return.
+    :return: List of node names.
+    """
+    nodes = graph.node
+    neighbours = [rel for rel in graph.pred[node_id]
+                  if nodes[rel].get('type') == node_type]
+    neighbours.extend(rel for rel in graph.succ[node_id]
+                      if nodes[rel].get('type') == node_type)
+    return neighbours
 
 
 def _get(path, params=None):
     """
     Builds the uri to the service and then retrieves from the host.
     :param path: The path of the service. Host and port are already known.
+    :param params: Query parameters, parameters that are None are skipped.
     :return: A response object of the request.
     """
     uri = "http://{}:{}{}".format(HOST, PORT, path)
-
-    if params:
-        uri += "?"
-        for param_name, param in params.iteritems():
-            if param is None:  # Skip parameters that are none.
-                continue
-            uri += "{}={}&".format(param_name, param)
-        uri = uri[:len(uri)]  # Remove ? or & from the  end of query string
-    return requests.get(uri)
+    return SESSION.get(uri, params=params)
@@ -1,8713 +0,0 @@
-(lp0
-(F0.000164031982421875
-Vorchestration.stack.create.start
-p1
-(dp2
-V_context_request_id
-p3
-Vreq-3a4766e0-22c1-48a8-879a-c888430ad12c
-p4
-sVevent_type
-p5
-g1
-sV_context_region_name
-p6
-NsV_context_auth_token
-p7
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p8
-sV_context_user_id
-p9
-Vef7a4f67379f41aba489a0b6d6a62094
-p10
-sVpayload
-p11
-(dp12
-Vusername
-p13
-NsVstate_reason
-p14
-VStack CREATE started
-p15
-sVuser_id
-p16
-NsVuser_identity
-p17
-Vef7a4f67379f41aba489a0b6d6a62094
-p18
-sVstack_name
-p19
-Vgreen
-p20
-sVtenant_id
-p21
-V187e5e95e7eb499d8a421b3d4ed966d5
-p22
-sVstack_identity
-p23
-V7ab82262-5bd0-4047-89b9-9c9ca4ee979b
-p24
-sVcreate_at
-p25
-V2017-12-06T18:50:15.391551
-p26
-sVstate
-p27
-VCREATE_IN_PROGRESS
-p28
-ssV_context_username
-p29
-NsV_context_show_deleted
-p30
-I00
-sV_context_trust_id
-p31
-NsVpriority
-p32
-VINFO
-p33
-sV_context_is_admin
-p34
-I01
-sV_context_auth_token_info
-p35
-(dp36
-Vtoken
-p37
-(dp38
-Vmethods
-p39
-(lp40
-Vpassword
-p41
-asVroles
-p42
-(lp43
-(dp44
-Vid
-p45
-Vd475171bf8304e06a74b1add560b1f28
-p46
-sVname
-p47
-Vadmin
-p48
-sasVauth_token
-p49
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p50
-sVexpires_at
-p51
-V2017-12-06T19:50:14.000000Z
-p52
-sVproject
-p53
-(dp54
-Vdomain
-p55
-(dp56
-g45
-Vdefault
-p57
-sg47
-VDefault
-p58
-ssg45
-V187e5e95e7eb499d8a421b3d4ed966d5
-p59
-sg47
-Vapexlake
-p60
-ssVcatalog
-p61
-(lp62
-(dp63
-Vendpoints
-p64
-(lp65
-(dp66
-Vurl
-p67
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p68
-sVinterface
-p69
-Vpublic
-p70
-sVregion
-p71
-VRegionOne
-p72
-sVregion_id
-p73
-VRegionOne
-p74
-sg45
-V13359d68397c4732b5d455941ac95989
-p75
-sa(dp76
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p77
-sg69
-Vinternal
-p78
-sg71
-VRegionOne
-p79
-sg73
-VRegionOne
-p80
-sg45
-V50aeae6c5d034dcb80871bdac7391209
-p81
-sa(dp82
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p83
-sg69
-Vadmin
-p84
-sg71
-VRegionOne
-p85
-sg73
-VRegionOne
-p86
-sg45
-V93b06f780b224cbd9b514c2041d3db63
-p87
-sasVtype
-p88
-Vvolumev3
-p89
-sg45
-V00a63293a3154089a4c80b60b4aa9429
-p90
-sg47
-Vcinderv3
-p91
-sa(dp92
-g64
-(lp93
-(dp94
-g67
-Vhttp://172.16.0.5:8000/v1
-p95
-sg69
-Vadmin
-p96
-sg71
-VRegionOne
-p97
-sg73
-VRegionOne
-p98
-sg45
-V24acffb5d9154df4981db7424b7669bd
-p99
-sa(dp100
-g67
-Vhttp://172.18.0.8:8000/v1
-p101
-sg69
-Vpublic
-p102
-sg71
-VRegionOne
-p103
-sg73
-VRegionOne
-p104
-sg45
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p105
-sa(dp106
-g67
-Vhttp://172.16.0.5:8000/v1
-p107
-sg69
-Vinternal
-p108
-sg71
-VRegionOne
-p109
-sg73
-VRegionOne
-p110
-sg45
-V679262173a714d76a078051b95f8c969
-p111
-sasg88
-Vcloudformation
-p112
-sg45
-V245169ccae564a7db06ca002f1553b51
-p113
-sg47
-Vheat-cfn
-p114
-sa(dp115
-g64
-(lp116
-(dp117
-g67
-Vhttp://172.18.0.8:8080
-p118
-sg69
-Vpublic
-p119
-sg71
-VRegionOne
-p120
-sg73
-VRegionOne
-p121
-sg45
-V04a6ef3db6b046b1893ed45a3f906f6c
-p122
-sa(dp123
-g67
-Vhttp://172.16.0.5:8080
-p124
-sg69
-Vinternal
-p125
-sg71
-VRegionOne
-p126
-sg73
-VRegionOne
-p127
-sg45
-V3e30684c9f74492b8ca9a64dd04261e6
-p128
-sa(dp129
-g67
-Vhttp://172.16.0.5:8080
-p130
-sg69
-Vadmin
-p131
-sg71
-VRegionOne
-p132
-sg73
-VRegionOne
-p133
-sg45
-Vc5384b55cd7a441582f151c6b2807745
-p134
-sasg88
-Vs3
-p135
-sg45
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p136
-sg47
-Vswift_s3
-p137
-sa(dp138
-g64
-(lp139
-(dp140
-g67
-Vhttp://172.16.0.5:9696
-p141
-sg69
-Vadmin
-p142
-sg71
-VRegionOne
-p143
-sg73
-VRegionOne
-p144
-sg45
-V38b78b2c00264f59a4ade9392f88132b
-p145
-sa(dp146
-g67
-Vhttp://172.18.0.8:9696
-p147
-sg69
-Vpublic
-p148
-sg71
-VRegionOne
-p149
-sg73
-VRegionOne
-p150
-sg45
-Vb5d0f72fbf674f84adf8929341e45586
-p151
-sa(dp152
-g67
-Vhttp://172.16.0.5:9696
-p153
-sg69
-Vinternal
-p154
-sg71
-VRegionOne
-p155
-sg73
-VRegionOne
-p156
-sg45
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p157
-sasg88
-Vnetwork
-p158
-sg45
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p159
-sg47
-Vneutron
-p160
-sa(dp161
-g64
-(lp162
-(dp163
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p164
-sg69
-Vinternal
-p165
-sg71
-VRegionOne
-p166
-sg73
-VRegionOne
-p167
-sg45
-V7c60744a22724044a92928bc2fa9e422
-p168
-sa(dp169
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p170
-sg69
-Vadmin
-p171
-sg71
-VRegionOne
-p172
-sg73
-VRegionOne
-p173
-sg45
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p174
-sa(dp175
-g67
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p176
-sg69
-Vpublic
-p177
-sg71
-VRegionOne
-p178
-sg73
-VRegionOne
-p179
-sg45
-Vde47d994bdc147bdb824474ea699a77a
-p180
-sasg88
-Vorchestration
-p181
-sg45
-V65a72244f7c54382aeebf5dfdeab8140
-p182
-sg47
-Vheat
-p183
-sa(dp184
-g64
-(lp185
-(dp186
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p187
-sg69
-Vinternal
-p188
-sg71
-VRegionOne
-p189
-sg73
-VRegionOne
-p190
-sg45
-V3a25e85ecaa44b678c3721c2d3d39b38
-p191
-sa(dp192
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p193
-sg69
-Vadmin
-p194
-sg71
-VRegionOne
-p195
-sg73
-VRegionOne
-p196
-sg45
-V68c763474c3d4aa28c4ee0e0249998eb
-p197
-sa(dp198
-g67
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p199
-sg69
-Vpublic
-p200
-sg71
-VRegionOne
-p201
-sg73
-VRegionOne
-p202
-sg45
-Ve0c861373e94468db521d5a8793d33d1
-p203
-sasg88
-Vvolume
-p204
-sg45
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p205
-sg47
-Vcinder
-p206
-sa(dp207
-g64
-(lp208
-(dp209
-g67
-Vhttp://172.18.0.8:5000/v2.0
-p210
-sg69
-Vpublic
-p211
-sg71
-VRegionOne
-p212
-sg73
-VRegionOne
-p213
-sg45
-V6aa35bc15a35447db58ec5b67087f96a
-p214
-sa(dp215
-g67
-Vhttp://172.16.0.5:5000/v2.0
-p216
-sg69
-Vinternal
-p217
-sg71
-VRegionOne
-p218
-sg73
-VRegionOne
-p219
-sg45
-V6b4742f26b694b93bdbcb37304d22f69
-p220
-sa(dp221
-g67
-Vhttp://172.16.0.5:35357/v2.0
-p222
-sg69
-Vadmin
-p223
-sg71
-VRegionOne
-p224
-sg73
-VRegionOne
-p225
-sg45
-Vadc120ea606644a299a3c91a7ceeb8c4
-p226
-sasg88
-Videntity
-p227
-sg45
-V9f95de9f4efc4730b4dd90354894e1dc
-p228
-sg47
-Vkeystone
-p229
-sa(dp230
-g64
-(lp231
-(dp232
-g67
-Vhttp://172.16.0.5:9292
-p233
-sg69
-Vadmin
-p234
-sg71
-VRegionOne
-p235
-sg73
-VRegionOne
-p236
-sg45
-V049519f829be4e7fb5f44ae9f470efdf
-p237
-sa(dp238
-g67
-Vhttp://172.18.0.8:9292
-p239
-sg69
-Vpublic
-p240
-sg71
-VRegionOne
-p241
-sg73
-VRegionOne
-p242
-sg45
-V1baebbbf35744192b335f4f293d1a9d8
-p243
-sa(dp244
-g67
-Vhttp://172.16.0.5:9292
-p245
-sg69
-Vinternal
-p246
-sg71
-VRegionOne
-p247
-sg73
-VRegionOne
-p248
-sg45
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p249
-sasg88
-Vimage
-p250
-sg45
-Va39ec0213acc45ceb59346299e78d6c0
-p251
-sg47
-Vglance
-p252
-sa(dp253
-g64
-(lp254
-(dp255
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p256
-sg69
-Vinternal
-p257
-sg71
-VRegionOne
-p258
-sg73
-VRegionOne
-p259
-sg45
-V2cd9d66e95484830a9006177e301aa57
-p260
-sa(dp261
-g67
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p262
-sg69
-Vpublic
-p263
-sg71
-VRegionOne
-p264
-sg73
-VRegionOne
-p265
-sg45
-Vbe2d979150a2401b9e7d5c365372d093
-p266
-sa(dp267
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p268
-sg69
-Vadmin
-p269
-sg71
-VRegionOne
-p270
-sg73
-VRegionOne
-p271
-sg45
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p272
-sasg88
-Vcompute_legacy
-p273
-sg45
-Va4dd95e3fde340468f8c1d7df9a853d0
-p274
-sg47
-Vcompute_legacy
-p275
-sa(dp276
-g64
-(lp277
-(dp278
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p279
-sg69
-Vadmin
-p280
-sg71
-VRegionOne
-p281
-sg73
-VRegionOne
-p282
-sg45
-V0307d2c32dd54839aa5bc39746eeb186
-p283
-sa(dp284
-g67
-Vhttp://172.18.0.8:8774/v2.1
-p285
-sg69
-Vpublic
-p286
-sg71
-VRegionOne
-p287
-sg73
-VRegionOne
-p288
-sg45
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p289
-sa(dp290
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p291
-sg69
-Vinternal
-p292
-sg71
-VRegionOne
-p293
-sg73
-VRegionOne
-p294
-sg45
-Vdb005ab592334fc599c142cf861e754f
-p295
-sasg88
-Vcompute
-p296
-sg45
-Vc165d40b8c3849bcb6067a3df2540c62
-p297
-sg47
-Vnova
-p298
-sa(dp299
-g64
-(lp300
-(dp301
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p302
-sg69
-Vadmin
-p303
-sg71
-VRegionOne
-p304
-sg73
-VRegionOne
-p305
-sg45
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p306
-sa(dp307
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p308
-sg69
-Vinternal
-p309
-sg71
-VRegionOne
-p310
-sg73
-VRegionOne
-p311
-sg45
-V764118d3a33444ac980632d281acf4a7
-p312
-sa(dp313
-g67
-Vhttp://172.18.0.8:8080/swift/v1
-p314
-sg69
-Vpublic
-p315
-sg71
-VRegionOne
-p316
-sg73
-VRegionOne
-p317
-sg45
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p318
-sasg88
-Vobject-store
-p319
-sg45
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p320
-sg47
-Vswift
-p321
-sa(dp322
-g64
-(lp323
-(dp324
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p325
-sg69
-Vinternal
-p326
-sg71
-VRegionOne
-p327
-sg73
-VRegionOne
-p328
-sg45
-V61ea745c91ab4eb59464679931219024
-p329
-sa(dp330
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p331
-sg69
-Vadmin
-p332
-sg71
-VRegionOne
-p333
-sg73
-VRegionOne
-p334
-sg45
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p335
-sa(dp336
-g67
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p337
-sg69
-Vpublic
-p338
-sg71
-VRegionOne
-p339
-sg73
-VRegionOne
-p340
-sg45
-V7155772851884dc6954c7345d350796f
-p341
-sasg88
-Vvolumev2
-p342
-sg45
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p343
-sg47
-Vcinderv2
-p344
-sa(dp345
-g64
-(lp346
-(dp347
-g67
-Vhttp://172.18.0.8:9494
-p348
-sg69
-Vpublic
-p349
-sg71
-VRegionOne
-p350
-sg73
-VRegionOne
-p351
-sg45
-V43a202e889694d51a3b11899c252a8a9
-p352
-sa(dp353
-g67
-Vhttp://172.16.0.5:9494
-p354
-sg69
-Vadmin
-p355
-sg71
-VRegionOne
-p356
-sg73
-VRegionOne
-p357
-sg45
-Vfa3c9de06e854542b236aa24b53e19a1
-p358
-sa(dp359
-g67
-Vhttp://172.16.0.5:9494
-p360
-sg69
-Vinternal
-p361
-sg71
-VRegionOne
-p362
-sg73
-VRegionOne
-p363
-sg45
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p364
-sasg88
-Vartifact
-p365
-sg45
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p366
-sg47
-Vglare
-p367
-sasVversion
-p368
-Vv3
-p369
-sVuser
-p370
-(dp371
-g55
-(dp372
-g45
-Vdefault
-p373
-sg47
-VDefault
-p374
-ssg45
-Vef7a4f67379f41aba489a0b6d6a62094
-p375
-sg47
-Violie
-p376
-ssVaudit_ids
-p377
-(lp378
-V9X2jQhi7QGau8urW62_TeA
-p379
-asVissued_at
-p380
-V2017-12-06T18:50:14.000000Z
-p381
-sssV_context_user
-p382
-NsVpublisher_id
-p383
-Vorchestration.machine-B
-p384
-sVmessage_id
-p385
-V3bd8b850-a97b-4314-9c50-e44a48e29a27
-p386
-sV_context_roles
-p387
-(lp388
-Vadmin
-p389
-asV_context_auth_url
-p390
-Vhttp://172.16.0.5:35357/v3/
-p391
-sVtimestamp
-p392
-V2017-12-06 18:50:15.606386
-p393
-sV_unique_id
-p394
-V124f41523e9c41938f23e4d66369813b
-p395
-sV_context_tenant_id
-p396
-V187e5e95e7eb499d8a421b3d4ed966d5
-p397
-sV_context_user_domain_id
-p398
-Vdefault
-p399
-sV_context_password
-p400
-NsV_context_trustor_user_id
-p401
-NsV_context_project_domain_id
-p402
-Vdefault
-p403
-sV_context_aws_creds
-p404
-NsV_context_tenant
-p405
-Vapexlake
-p406
-sV_context_user_identity
-p407
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p408
-stp409
-a(F0.3305840492248535
-Vsecurity_group.create.start
-p410
-(dp411
-V_context_domain
-p412
-NsV_context_request_id
-p413
-Vreq-c01b2f6d-b4af-4646-ba09-daf1c1cdcc0c
-p414
-sVevent_type
-p415
-g410
-sV_context_auth_token
-p416
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p417
-sV_context_resource_uuid
-p418
-NsV_context_tenant_name
-p419
-Vapexlake
-p420
-sV_context_user_id
-p421
-Vef7a4f67379f41aba489a0b6d6a62094
-p422
-sVpayload
-p423
-(dp424
-Vsecurity_group
-p425
-(dp426
-Vname
-p427
-VAll SG.
-p428
-sVdescription
-p429
-VSecurity group for Kevin
-p430
-sssV_context_show_deleted
-p431
-I00
-sVpriority
-p432
-VINFO
-p433
-sV_context_is_admin
-p434
-I01
-sV_context_project_domain
-p435
-NsV_context_timestamp
-p436
-V2017-12-06 18:50:15.935416
-p437
-sVpublisher_id
-p438
-Vnetwork.machine-B
-p439
-sVmessage_id
-p440
-V4a4f924d-8be8-47cd-95d3-55a660a889d1
-p441
-sV_context_roles
-p442
-(lp443
-Vadmin
-p444
-asVtimestamp
-p445
-V2017-12-06 18:50:15.937430
-p446
-sV_context_user
-p447
-Vef7a4f67379f41aba489a0b6d6a62094
-p448
-sV_unique_id
-p449
-V7756e94bfeb0466c8afb695e0ec08a5c
-p450
-sV_context_tenant_id
-p451
-V187e5e95e7eb499d8a421b3d4ed966d5
-p452
-sV_context_project_name
-p453
-Vapexlake
-p454
-sV_context_user_identity
-p455
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p456
-sV_context_tenant
-p457
-V187e5e95e7eb499d8a421b3d4ed966d5
-p458
-sV_context_project_id
-p459
-V187e5e95e7eb499d8a421b3d4ed966d5
-p460
-sV_context_read_only
-p461
-I00
-sV_context_user_domain
-p462
-NsV_context_user_name
-p463
-Violie
-p464
-stp465
-a(F0.059309959411621094
-Vsecurity_group.create.end
-p466
-(dp467
-V_context_domain
-p468
-NsV_context_request_id
-p469
-Vreq-c01b2f6d-b4af-4646-ba09-daf1c1cdcc0c
-p470
-sVevent_type
-p471
-g466
-sV_context_auth_token
-p472
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p473
-sV_context_resource_uuid
-p474
-NsV_context_tenant_name
-p475
-Vapexlake
-p476
-sV_context_user_id
-p477
-Vef7a4f67379f41aba489a0b6d6a62094
-p478
-sVpayload
-p479
-(dp480
-Vsecurity_group
-p481
-(dp482
-Vtenant_id
-p483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p484
-sVdescription
-p485
-VSecurity group for Kevin
-p486
-sVid
-p487
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p488
-sVsecurity_group_rules
-p489
-(lp490
-(dp491
-Vremote_group_id
-p492
-NsVdirection
-p493
-Vegress
-p494
-sVprotocol
-p495
-Nsg485
-V
-p496
-sVremote_ip_prefix
-p497
-NsVport_range_max
-p498
-NsVsecurity_group_id
-p499
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p500
-sVport_range_min
-p501
-Nsg483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p502
-sg487
-V7b4b3414-3153-4766-8b93-cb192f827de4
-p503
-sVethertype
-p504
-VIPv4
-p505
-sa(dp506
-g492
-Nsg493
-Vegress
-p507
-sg495
-Nsg485
-g496
-sg497
-Nsg498
-Nsg499
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p508
-sg501
-Nsg483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p509
-sg487
-V291a257a-a101-445e-9511-7d74d36e4f3e
-p510
-sg504
-VIPv6
-p511
-sasVname
-p512
-VAll SG.
-p513
-sssV_context_show_deleted
-p514
-I00
-sVpriority
-p515
-VINFO
-p516
-sV_context_is_admin
-p517
-I01
-sV_context_project_domain
-p518
-NsV_context_timestamp
-p519
-V2017-12-06 18:50:15.935416
-p520
-sVpublisher_id
-p521
-Vnetwork.machine-B
-p522
-sVmessage_id
-p523
-V7cef02eb-d5a6-4592-87c5-68447b955611
-p524
-sV_context_roles
-p525
-(lp526
-Vadmin
-p527
-asVtimestamp
-p528
-V2017-12-06 18:50:15.997289
-p529
-sV_context_user
-p530
-Vef7a4f67379f41aba489a0b6d6a62094
-p531
-sV_unique_id
-p532
-Va2f9bebd603a495b81ac1914705fb471
-p533
-sV_context_tenant_id
-p534
-V187e5e95e7eb499d8a421b3d4ed966d5
-p535
-sV_context_project_name
-p536
-Vapexlake
-p537
-sV_context_user_identity
-p538
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p539
-sV_context_tenant
-p540
-V187e5e95e7eb499d8a421b3d4ed966d5
-p541
-sV_context_project_id
-p542
-V187e5e95e7eb499d8a421b3d4ed966d5
-p543
-sV_context_read_only
-p544
-I00
-sV_context_user_domain
-p545
-NsV_context_user_name
-p546
-Violie
-p547
-stp548
-a(F0.017820119857788086
-Vsecurity_group_rule.create.start
-p549
-(dp550
-V_context_domain
-p551
-NsV_context_request_id
-p552
-Vreq-c4d5afbd-0a5e-4feb-974f-5d105948b258
-p553
-sVevent_type
-p554
-g549
-sV_context_auth_token
-p555
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p556
-sV_context_resource_uuid
-p557
-NsV_context_tenant_name
-p558
-Vapexlake
-p559
-sV_context_user_id
-p560
-Vef7a4f67379f41aba489a0b6d6a62094
-p561
-sVpayload
-p562
-(dp563
-Vsecurity_group_rule
-p564
-(dp565
-Vremote_group_id
-p566
-NsVdirection
-p567
-Vingress
-p568
-sVprotocol
-p569
-Vtcp
-p570
-sVremote_ip_prefix
-p571
-V0.0.0.0/0
-p572
-sVport_range_max
-p573
-V22
-p574
-sVsecurity_group_id
-p575
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p576
-sVport_range_min
-p577
-V22
-p578
-sVethertype
-p579
-VIPv4
-p580
-sssV_context_show_deleted
-p581
-I00
-sVpriority
-p582
-VINFO
-p583
-sV_context_is_admin
-p584
-I01
-sV_context_project_domain
-p585
-NsV_context_timestamp
-p586
-V2017-12-06 18:50:16.014943
-p587
-sVpublisher_id
-p588
-Vnetwork.machine-B
-p589
-sVmessage_id
-p590
-V495a34be-5029-416d-b666-7eb4532f8468
-p591
-sV_context_roles
-p592
-(lp593
-Vadmin
-p594
-asVtimestamp
-p595
-V2017-12-06 18:50:16.016061
-p596
-sV_context_user
-p597
-Vef7a4f67379f41aba489a0b6d6a62094
-p598
-sV_unique_id
-p599
-V03283077c54e45ae97fa8e4be75a1323
-p600
-sV_context_tenant_id
-p601
-V187e5e95e7eb499d8a421b3d4ed966d5
-p602
-sV_context_project_name
-p603
-Vapexlake
-p604
-sV_context_user_identity
-p605
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p606
-sV_context_tenant
-p607
-V187e5e95e7eb499d8a421b3d4ed966d5
-p608
-sV_context_project_id
-p609
-V187e5e95e7eb499d8a421b3d4ed966d5
-p610
-sV_context_read_only
-p611
-I00
-sV_context_user_domain
-p612
-NsV_context_user_name
-p613
-Violie
-p614
-stp615
-a(F0.05750584602355957
-Vsecurity_group_rule.create.end
-p616
-(dp617
-V_context_domain
-p618
-NsV_context_request_id
-p619
-Vreq-c4d5afbd-0a5e-4feb-974f-5d105948b258
-p620
-sVevent_type
-p621
-g616
-sV_context_auth_token
-p622
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p623
-sV_context_resource_uuid
-p624
-NsV_context_tenant_name
-p625
-Vapexlake
-p626
-sV_context_user_id
-p627
-Vef7a4f67379f41aba489a0b6d6a62094
-p628
-sVpayload
-p629
-(dp630
-Vsecurity_group_rule
-p631
-(dp632
-Vremote_group_id
-p633
-NsVdirection
-p634
-Vingress
-p635
-sVprotocol
-p636
-Vtcp
-p637
-sVdescription
-p638
-g496
-sVremote_ip_prefix
-p639
-V0.0.0.0/0
-p640
-sVport_range_max
-p641
-I22
-sVsecurity_group_id
-p642
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p643
-sVport_range_min
-p644
-I22
-sVtenant_id
-p645
-V187e5e95e7eb499d8a421b3d4ed966d5
-p646
-sVid
-p647
-V3a78d254-93c0-4336-8703-6fc4b723c6b1
-p648
-sVethertype
-p649
-VIPv4
-p650
-sssV_context_show_deleted
-p651
-I00
-sVpriority
-p652
-VINFO
-p653
-sV_context_is_admin
-p654
-I01
-sV_context_project_domain
-p655
-NsV_context_timestamp
-p656
-V2017-12-06 18:50:16.014943
-p657
-sVpublisher_id
-p658
-Vnetwork.machine-B
-p659
-sVmessage_id
-p660
-V86b81e72-fcc5-4e65-8f0e-80e9844639fc
-p661
-sV_context_roles
-p662
-(lp663
-Vadmin
-p664
-asVtimestamp
-p665
-V2017-12-06 18:50:16.073565
-p666
-sV_context_user
-p667
-Vef7a4f67379f41aba489a0b6d6a62094
-p668
-sV_unique_id
-p669
-V83032c40113d4c689fb50d0f6889cf04
-p670
-sV_context_tenant_id
-p671
-V187e5e95e7eb499d8a421b3d4ed966d5
-p672
-sV_context_project_name
-p673
-Vapexlake
-p674
-sV_context_user_identity
-p675
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p676
-sV_context_tenant
-p677
-V187e5e95e7eb499d8a421b3d4ed966d5
-p678
-sV_context_project_id
-p679
-V187e5e95e7eb499d8a421b3d4ed966d5
-p680
-sV_context_read_only
-p681
-I00
-sV_context_user_domain
-p682
-NsV_context_user_name
-p683
-Violie
-p684
-stp685
-a(F0.00993800163269043
-Vsecurity_group_rule.create.start
-p686
-(dp687
-V_context_domain
-p688
-NsV_context_request_id
-p689
-Vreq-82b7fa2f-5fca-4ab5-9b51-50fa1a60976c
-p690
-sVevent_type
-p691
-g686
-sV_context_auth_token
-p692
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p693
-sV_context_resource_uuid
-p694
-NsV_context_tenant_name
-p695
-Vapexlake
-p696
-sV_context_user_id
-p697
-Vef7a4f67379f41aba489a0b6d6a62094
-p698
-sVpayload
-p699
-(dp700
-Vsecurity_group_rule
-p701
-(dp702
-Vremote_group_id
-p703
-NsVdirection
-p704
-Vingress
-p705
-sVprotocol
-p706
-Vtcp
-p707
-sVremote_ip_prefix
-p708
-V0.0.0.0/0
-p709
-sVport_range_max
-p710
-V65000
-p711
-sVsecurity_group_id
-p712
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p713
-sVport_range_min
-p714
-V1
-p715
-sVethertype
-p716
-VIPv4
-p717
-sssV_context_show_deleted
-p718
-I00
-sVpriority
-p719
-VINFO
-p720
-sV_context_is_admin
-p721
-I01
-sV_context_project_domain
-p722
-NsV_context_timestamp
-p723
-V2017-12-06 18:50:16.082795
-p724
-sVpublisher_id
-p725
-Vnetwork.machine-B
-p726
-sVmessage_id
-p727
-Ve4c67a62-1a84-4b31-afac-54ae8181f372
-p728
-sV_context_roles
-p729
-(lp730
-Vadmin
-p731
-asVtimestamp
-p732
-V2017-12-06 18:50:16.083923
-p733
-sV_context_user
-p734
-Vef7a4f67379f41aba489a0b6d6a62094
-p735
-sV_unique_id
-p736
-V5c82464dd6454872b2d76699313b0e29
-p737
-sV_context_tenant_id
-p738
-V187e5e95e7eb499d8a421b3d4ed966d5
-p739
-sV_context_project_name
-p740
-Vapexlake
-p741
-sV_context_user_identity
-p742
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p743
-sV_context_tenant
-p744
-V187e5e95e7eb499d8a421b3d4ed966d5
-p745
-sV_context_project_id
-p746
-V187e5e95e7eb499d8a421b3d4ed966d5
-p747
-sV_context_read_only
-p748
-I00
-sV_context_user_domain
-p749
-NsV_context_user_name
-p750
-Violie
-p751
-stp752
-a(F0.04250192642211914
-Vvolume.create.start
-p753
-(dp754
-V_context_domain
-p755
-NsV_context_request_id
-p756
-Vreq-fb247b59-5ad5-4dec-a887-e28c3db71c33
-p757
-sV_context_quota_class
-p758
-NsVevent_type
-p759
-g753
-sV_context_service_catalog
-p760
-(lp761
-(dp762
-Vendpoints
-p763
-(lp764
-(dp765
-VadminURL
-p766
-Vhttp://172.16.0.5:35357/v2.0
-p767
-sVregion
-p768
-VRegionOne
-p769
-sVinternalURL
-p770
-Vhttp://172.16.0.5:5000/v2.0
-p771
-sVpublicURL
-p772
-Vhttp://172.18.0.8:5000/v2.0
-p773
-sasVtype
-p774
-Videntity
-p775
-sVname
-p776
-Vkeystone
-p777
-sa(dp778
-g763
-(lp779
-(dp780
-g766
-Vhttp://172.16.0.5:8774/v2.1
-p781
-sg768
-VRegionOne
-p782
-sg770
-Vhttp://172.16.0.5:8774/v2.1
-p783
-sg772
-Vhttp://172.18.0.8:8774/v2.1
-p784
-sasg774
-Vcompute
-p785
-sg776
-Vnova
-p786
-sa(dp787
-g763
-(lp788
-(dp789
-g766
-Vhttp://172.16.0.5:8080/swift/v1
-p790
-sg768
-VRegionOne
-p791
-sg770
-Vhttp://172.16.0.5:8080/swift/v1
-p792
-sg772
-Vhttp://172.18.0.8:8080/swift/v1
-p793
-sasg774
-Vobject-store
-p794
-sg776
-Vswift
-p795
-sasV_context_auth_token
-p796
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p797
-sV_context_resource_uuid
-p798
-NsV_context_user_id
-p799
-Vef7a4f67379f41aba489a0b6d6a62094
-p800
-sVpayload
-p801
-(dp802
-Vstatus
-p803
-Vcreating
-p804
-sVuser_id
-p805
-Vef7a4f67379f41aba489a0b6d6a62094
-p806
-sVdisplay_name
-p807
-Vgreen-volume_1-napoefd3kj54
-p808
-sVavailability_zone
-p809
-Vnova
-p810
-sVtenant_id
-p811
-V187e5e95e7eb499d8a421b3d4ed966d5
-p812
-sVcreated_at
-p813
-V2017-12-06T18:50:16+00:00
-p814
-sVvolume_attachment
-p815
-(lp816
-sVvolume_type
-p817
-NsVhost
-p818
-Vrbd:volumes@RBD-backend#RBD-backend
-p819
-sVsnapshot_id
-p820
-NsVreplication_status
-p821
-Vdisabled
-p822
-sVvolume_id
-p823
-Vd79a82fa-a195-4086-beee-5c449c981708
-p824
-sVreplication_extended_status
-p825
-NsVreplication_driver_data
-p826
-NsVsize
-p827
-I1
-sVlaunched_at
-p828
-V2017-12-06T18:50:16.056589
-p829
-sVmetadata
-p830
-(lp831
-ssV_context_show_deleted
-p832
-I00
-sVpriority
-p833
-VINFO
-p834
-sV_context_is_admin
-p835
-I01
-sV_context_project_domain
-p836
-NsV_context_timestamp
-p837
-V2017-12-06T18:50:15.646317+00:00
-p838
-sVpublisher_id
-p839
-Vvolume.rbd:volumes@RBD-backend#RBD-backend
-p840
-sVmessage_id
-p841
-Vb314c37c-1638-4245-a34d-5d97521d242a
-p842
-sV_context_remote_address
-p843
-V172.16.0.5
-p844
-sV_context_roles
-p845
-(lp846
-Vadmin
-p847
-asVtimestamp
-p848
-V2017-12-06 18:50:16.125725
-p849
-sV_context_user
-p850
-Vef7a4f67379f41aba489a0b6d6a62094
-p851
-sV_unique_id
-p852
-Vb336e64031cb4c0ba260a97d49a8a8cf
-p853
-sV_context_project_name
-p854
-Vapexlake
-p855
-sV_context_read_deleted
-p856
-Vno
-p857
-sV_context_user_identity
-p858
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p859
-sV_context_tenant
-p860
-V187e5e95e7eb499d8a421b3d4ed966d5
-p861
-sV_context_project_id
-p862
-V187e5e95e7eb499d8a421b3d4ed966d5
-p863
-sV_context_read_only
-p864
-I00
-sV_context_user_domain
-p865
-Nstp866
-a(F0.02494502067565918
-Vsecurity_group_rule.create.end
-p867
-(dp868
-V_context_domain
-p869
-NsV_context_request_id
-p870
-Vreq-82b7fa2f-5fca-4ab5-9b51-50fa1a60976c
-p871
-sVevent_type
-p872
-g867
-sV_context_auth_token
-p873
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p874
-sV_context_resource_uuid
-p875
-NsV_context_tenant_name
-p876
-Vapexlake
-p877
-sV_context_user_id
-p878
-Vef7a4f67379f41aba489a0b6d6a62094
-p879
-sVpayload
-p880
-(dp881
-Vsecurity_group_rule
-p882
-(dp883
-Vremote_group_id
-p884
-NsVdirection
-p885
-Vingress
-p886
-sVprotocol
-p887
-Vtcp
-p888
-sVdescription
-p889
-g496
-sVremote_ip_prefix
-p890
-V0.0.0.0/0
-p891
-sVport_range_max
-p892
-I65000
-sVsecurity_group_id
-p893
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p894
-sVport_range_min
-p895
-I1
-sVtenant_id
-p896
-V187e5e95e7eb499d8a421b3d4ed966d5
-p897
-sVid
-p898
-V08258b04-0ceb-435a-9e8d-821b98b82466
-p899
-sVethertype
-p900
-VIPv4
-p901
-sssV_context_show_deleted
-p902
-I00
-sVpriority
-p903
-VINFO
-p904
-sV_context_is_admin
-p905
-I01
-sV_context_project_domain
-p906
-NsV_context_timestamp
-p907
-V2017-12-06 18:50:16.082795
-p908
-sVpublisher_id
-p909
-Vnetwork.machine-B
-p910
-sVmessage_id
-p911
-V320d25eb-8cd6-4eb8-8a2f-519537680f68
-p912
-sV_context_roles
-p913
-(lp914
-Vadmin
-p915
-asVtimestamp
-p916
-V2017-12-06 18:50:16.151080
-p917
-sV_context_user
-p918
-Vef7a4f67379f41aba489a0b6d6a62094
-p919
-sV_unique_id
-p920
-V9db039fc23a849d0b7f69aaa69d67604
-p921
-sV_context_tenant_id
-p922
-V187e5e95e7eb499d8a421b3d4ed966d5
-p923
-sV_context_project_name
-p924
-Vapexlake
-p925
-sV_context_user_identity
-p926
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p927
-sV_context_tenant
-p928
-V187e5e95e7eb499d8a421b3d4ed966d5
-p929
-sV_context_project_id
-p930
-V187e5e95e7eb499d8a421b3d4ed966d5
-p931
-sV_context_read_only
-p932
-I00
-sV_context_user_domain
-p933
-NsV_context_user_name
-p934
-Violie
-p935
-stp936
-a(F0.00993800163269043
-Vsecurity_group_rule.create.start
-p937
-(dp938
-V_context_domain
-p939
-NsV_context_request_id
-p940
-Vreq-a108f710-5e32-410a-914d-c1d61853fb16
-p941
-sVevent_type
-p942
-g937
-sV_context_auth_token
-p943
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p944
-sV_context_resource_uuid
-p945
-NsV_context_tenant_name
-p946
-Vapexlake
-p947
-sV_context_user_id
-p948
-Vef7a4f67379f41aba489a0b6d6a62094
-p949
-sVpayload
-p950
-(dp951
-Vsecurity_group_rule
-p952
-(dp953
-Vremote_group_id
-p954
-NsVdirection
-p955
-Vingress
-p956
-sVprotocol
-p957
-Vicmp
-p958
-sVremote_ip_prefix
-p959
-V0.0.0.0/0
-p960
-sVport_range_max
-p961
-NsVsecurity_group_id
-p962
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p963
-sVport_range_min
-p964
-NsVethertype
-p965
-VIPv4
-p966
-sssV_context_show_deleted
-p967
-I00
-sVpriority
-p968
-VINFO
-p969
-sV_context_is_admin
-p970
-I01
-sV_context_project_domain
-p971
-NsV_context_timestamp
-p972
-V2017-12-06 18:50:16.160544
-p973
-sVpublisher_id
-p974
-Vnetwork.machine-B
-p975
-sVmessage_id
-p976
-V5eaa4a35-f003-48dd-9b99-721b75e07c27
-p977
-sV_context_roles
-p978
-(lp979
-Vadmin
-p980
-asVtimestamp
-p981
-V2017-12-06 18:50:16.161676
-p982
-sV_context_user
-p983
-Vef7a4f67379f41aba489a0b6d6a62094
-p984
-sV_unique_id
-p985
-Vf7a453788265418b9e603e2a6bdd21a2
-p986
-sV_context_tenant_id
-p987
-V187e5e95e7eb499d8a421b3d4ed966d5
-p988
-sV_context_project_name
-p989
-Vapexlake
-p990
-sV_context_user_identity
-p991
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p992
-sV_context_tenant
-p993
-V187e5e95e7eb499d8a421b3d4ed966d5
-p994
-sV_context_project_id
-p995
-V187e5e95e7eb499d8a421b3d4ed966d5
-p996
-sV_context_read_only
-p997
-I00
-sV_context_user_domain
-p998
-NsV_context_user_name
-p999
-Violie
-p1000
-stp1001
-a(F0.05987215042114258
-Vsecurity_group_rule.create.end
-p1002
-(dp1003
-V_context_domain
-p1004
-NsV_context_request_id
-p1005
-Vreq-a108f710-5e32-410a-914d-c1d61853fb16
-p1006
-sVevent_type
-p1007
-g1002
-sV_context_auth_token
-p1008
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1009
-sV_context_resource_uuid
-p1010
-NsV_context_tenant_name
-p1011
-Vapexlake
-p1012
-sV_context_user_id
-p1013
-Vef7a4f67379f41aba489a0b6d6a62094
-p1014
-sVpayload
-p1015
-(dp1016
-Vsecurity_group_rule
-p1017
-(dp1018
-Vremote_group_id
-p1019
-NsVdirection
-p1020
-Vingress
-p1021
-sVprotocol
-p1022
-Vicmp
-p1023
-sVdescription
-p1024
-g496
-sVremote_ip_prefix
-p1025
-V0.0.0.0/0
-p1026
-sVport_range_max
-p1027
-NsVsecurity_group_id
-p1028
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p1029
-sVport_range_min
-p1030
-NsVtenant_id
-p1031
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1032
-sVid
-p1033
-Va2231a85-a009-413d-bfef-28c12748937a
-p1034
-sVethertype
-p1035
-VIPv4
-p1036
-sssV_context_show_deleted
-p1037
-I00
-sVpriority
-p1038
-VINFO
-p1039
-sV_context_is_admin
-p1040
-I01
-sV_context_project_domain
-p1041
-NsV_context_timestamp
-p1042
-V2017-12-06 18:50:16.160544
-p1043
-sVpublisher_id
-p1044
-Vnetwork.machine-B
-p1045
-sVmessage_id
-p1046
-V58805c7c-f8da-4e08-aa56-674b5260d740
-p1047
-sV_context_roles
-p1048
-(lp1049
-Vadmin
-p1050
-asVtimestamp
-p1051
-V2017-12-06 18:50:16.220449
-p1052
-sV_context_user
-p1053
-Vef7a4f67379f41aba489a0b6d6a62094
-p1054
-sV_unique_id
-p1055
-V3c70c01f60874211b3b62c233903519e
-p1056
-sV_context_tenant_id
-p1057
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1058
-sV_context_project_name
-p1059
-Vapexlake
-p1060
-sV_context_user_identity
-p1061
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1062
-sV_context_tenant
-p1063
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1064
-sV_context_project_id
-p1065
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1066
-sV_context_read_only
-p1067
-I00
-sV_context_user_domain
-p1068
-NsV_context_user_name
-p1069
-Violie
-p1070
-stp1071
-a(F0.09166097640991211
-Vvolume.create.end
-p1072
-(dp1073
-V_context_domain
-p1074
-NsV_context_request_id
-p1075
-Vreq-fb247b59-5ad5-4dec-a887-e28c3db71c33
-p1076
-sV_context_quota_class
-p1077
-NsVevent_type
-p1078
-g1072
-sV_context_service_catalog
-p1079
-(lp1080
-(dp1081
-Vendpoints
-p1082
-(lp1083
-(dp1084
-VadminURL
-p1085
-Vhttp://172.16.0.5:35357/v2.0
-p1086
-sVregion
-p1087
-VRegionOne
-p1088
-sVinternalURL
-p1089
-Vhttp://172.16.0.5:5000/v2.0
-p1090
-sVpublicURL
-p1091
-Vhttp://172.18.0.8:5000/v2.0
-p1092
-sasVtype
-p1093
-Videntity
-p1094
-sVname
-p1095
-Vkeystone
-p1096
-sa(dp1097
-g1082
-(lp1098
-(dp1099
-g1085
-Vhttp://172.16.0.5:8774/v2.1
-p1100
-sg1087
-VRegionOne
-p1101
-sg1089
-Vhttp://172.16.0.5:8774/v2.1
-p1102
-sg1091
-Vhttp://172.18.0.8:8774/v2.1
-p1103
-sasg1093
-Vcompute
-p1104
-sg1095
-Vnova
-p1105
-sa(dp1106
-g1082
-(lp1107
-(dp1108
-g1085
-Vhttp://172.16.0.5:8080/swift/v1
-p1109
-sg1087
-VRegionOne
-p1110
-sg1089
-Vhttp://172.16.0.5:8080/swift/v1
-p1111
-sg1091
-Vhttp://172.18.0.8:8080/swift/v1
-p1112
-sasg1093
-Vobject-store
-p1113
-sg1095
-Vswift
-p1114
-sasV_context_auth_token
-p1115
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1116
-sV_context_resource_uuid
-p1117
-NsV_context_user_id
-p1118
-Vef7a4f67379f41aba489a0b6d6a62094
-p1119
-sVpayload
-p1120
-(dp1121
-Vstatus
-p1122
-Vavailable
-p1123
-sVuser_id
-p1124
-Vef7a4f67379f41aba489a0b6d6a62094
-p1125
-sVdisplay_name
-p1126
-Vgreen-volume_1-napoefd3kj54
-p1127
-sVavailability_zone
-p1128
-Vnova
-p1129
-sVtenant_id
-p1130
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1131
-sVcreated_at
-p1132
-V2017-12-06T18:50:16+00:00
-p1133
-sVvolume_attachment
-p1134
-(lp1135
-sVvolume_type
-p1136
-NsVhost
-p1137
-Vrbd:volumes@RBD-backend#RBD-backend
-p1138
-sVsnapshot_id
-p1139
-NsVreplication_status
-p1140
-Vdisabled
-p1141
-sVvolume_id
-p1142
-Vd79a82fa-a195-4086-beee-5c449c981708
-p1143
-sVreplication_extended_status
-p1144
-NsVreplication_driver_data
-p1145
-NsVsize
-p1146
-I1
-sVlaunched_at
-p1147
-V2017-12-06T18:50:16.182768+00:00
-p1148
-sVmetadata
-p1149
-(lp1150
-ssV_context_show_deleted
-p1151
-I00
-sVpriority
-p1152
-VINFO
-p1153
-sV_context_is_admin
-p1154
-I01
-sV_context_project_domain
-p1155
-NsV_context_timestamp
-p1156
-V2017-12-06T18:50:15.646317+00:00
-p1157
-sVpublisher_id
-p1158
-Vvolume.rbd:volumes@RBD-backend#RBD-backend
-p1159
-sVmessage_id
-p1160
-V1949fd4d-2289-4369-ab86-6fd49937d414
-p1161
-sV_context_remote_address
-p1162
-V172.16.0.5
-p1163
-sV_context_roles
-p1164
-(lp1165
-Vadmin
-p1166
-asVtimestamp
-p1167
-V2017-12-06 18:50:16.312141
-p1168
-sV_context_user
-p1169
-Vef7a4f67379f41aba489a0b6d6a62094
-p1170
-sV_unique_id
-p1171
-V321a78adac7e4e25b6086611c8ff747b
-p1172
-sV_context_project_name
-p1173
-Vapexlake
-p1174
-sV_context_read_deleted
-p1175
-Vno
-p1176
-sV_context_user_identity
-p1177
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1178
-sV_context_tenant
-p1179
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1180
-sV_context_project_id
-p1181
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1182
-sV_context_read_only
-p1183
-I00
-sV_context_user_domain
-p1184
-Nstp1185
-a(F0.27286601066589355
-Vport.create.start
-p1186
-(dp1187
-V_context_domain
-p1188
-NsV_context_request_id
-p1189
-Vreq-e08fd99f-4e2b-4c21-adf6-c2fa8b46f3c4
-p1190
-sVevent_type
-p1191
-g1186
-sV_context_auth_token
-p1192
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1193
-sV_context_resource_uuid
-p1194
-NsV_context_tenant_name
-p1195
-Vapexlake
-p1196
-sV_context_user_id
-p1197
-Vef7a4f67379f41aba489a0b6d6a62094
-p1198
-sVpayload
-p1199
-(dp1200
-Vport
-p1201
-(dp1202
-Vnetwork_id
-p1203
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p1204
-sVfixed_ips
-p1205
-(lp1206
-(dp1207
-Vsubnet_id
-p1208
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p1209
-sasVname
-p1210
-Vgreen-server_port-fm3ogwps6zhw
-p1211
-sVsecurity_groups
-p1212
-(lp1213
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p1214
-asVadmin_state_up
-p1215
-I01
-sssV_context_show_deleted
-p1216
-I00
-sVpriority
-p1217
-VINFO
-p1218
-sV_context_is_admin
-p1219
-I01
-sV_context_project_domain
-p1220
-NsV_context_timestamp
-p1221
-V2017-12-06 18:50:16.583199
-p1222
-sVpublisher_id
-p1223
-Vnetwork.machine-B
-p1224
-sVmessage_id
-p1225
-V89aae8e7-7bd9-4c38-b883-2b189b37d5f8
-p1226
-sV_context_roles
-p1227
-(lp1228
-Vadmin
-p1229
-asVtimestamp
-p1230
-V2017-12-06 18:50:16.584680
-p1231
-sV_context_user
-p1232
-Vef7a4f67379f41aba489a0b6d6a62094
-p1233
-sV_unique_id
-p1234
-V89947bacd4a443c98fc1a347b8f0214b
-p1235
-sV_context_tenant_id
-p1236
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1237
-sV_context_project_name
-p1238
-Vapexlake
-p1239
-sV_context_user_identity
-p1240
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1241
-sV_context_tenant
-p1242
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1243
-sV_context_project_id
-p1244
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1245
-sV_context_read_only
-p1246
-I00
-sV_context_user_domain
-p1247
-NsV_context_user_name
-p1248
-Violie
-p1249
-stp1250
-a(F0.3198509216308594
-Vport.create.end
-p1251
-(dp1252
-V_context_domain
-p1253
-NsV_context_request_id
-p1254
-Vreq-e08fd99f-4e2b-4c21-adf6-c2fa8b46f3c4
-p1255
-sVevent_type
-p1256
-g1251
-sV_context_auth_token
-p1257
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1258
-sV_context_resource_uuid
-p1259
-NsV_context_tenant_name
-p1260
-Vapexlake
-p1261
-sV_context_user_id
-p1262
-Vef7a4f67379f41aba489a0b6d6a62094
-p1263
-sVpayload
-p1264
-(dp1265
-Vport
-p1266
-(dp1267
-Vallowed_address_pairs
-p1268
-(lp1269
-sVextra_dhcp_opts
-p1270
-(lp1271
-sVupdated_at
-p1272
-V2017-12-06T18:50:16
-p1273
-sVdevice_owner
-p1274
-g496
-sVbinding:profile
-p1275
-(dp1276
-sVport_security_enabled
-p1277
-I01
-sVfixed_ips
-p1278
-(lp1279
-(dp1280
-Vsubnet_id
-p1281
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p1282
-sVip_address
-p1283
-V172.16.9.157
-p1284
-sasVid
-p1285
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p1286
-sVsecurity_groups
-p1287
-(lp1288
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p1289
-asVbinding:vif_details
-p1290
-(dp1291
-sVbinding:vif_type
-p1292
-Vunbound
-p1293
-sVmac_address
-p1294
-Vfa:16:3e:a0:d1:cf
-p1295
-sVstatus
-p1296
-VDOWN
-p1297
-sVbinding:host_id
-p1298
-g496
-sVdescription
-p1299
-g496
-sVdns_assignment
-p1300
-(lp1301
-(dp1302
-Vhostname
-p1303
-Vhost-172-16-9-157
-p1304
-sg1283
-V172.16.9.157
-p1305
-sVfqdn
-p1306
-Vhost-172-16-9-157.openstacklocal.
-p1307
-sasVdevice_id
-p1308
-g496
-sVname
-p1309
-Vgreen-server_port-fm3ogwps6zhw
-p1310
-sVadmin_state_up
-p1311
-I01
-sVnetwork_id
-p1312
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p1313
-sVdns_name
-p1314
-g496
-sVcreated_at
-p1315
-V2017-12-06T18:50:16
-p1316
-sVbinding:vnic_type
-p1317
-Vnormal
-p1318
-sVtenant_id
-p1319
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1320
-sssV_context_show_deleted
-p1321
-I00
-sVpriority
-p1322
-VINFO
-p1323
-sV_context_is_admin
-p1324
-I01
-sV_context_project_domain
-p1325
-NsV_context_timestamp
-p1326
-V2017-12-06 18:50:16.583199
-p1327
-sVpublisher_id
-p1328
-Vnetwork.machine-B
-p1329
-sVmessage_id
-p1330
-V32e0a0a2-825a-4d69-ad00-fb640bbb45d7
-p1331
-sV_context_roles
-p1332
-(lp1333
-Vadmin
-p1334
-asVtimestamp
-p1335
-V2017-12-06 18:50:16.904273
-p1336
-sV_context_user
-p1337
-Vef7a4f67379f41aba489a0b6d6a62094
-p1338
-sV_unique_id
-p1339
-Vfbc259ec27d34618816e283184d1c209
-p1340
-sV_context_tenant_id
-p1341
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1342
-sV_context_project_name
-p1343
-Vapexlake
-p1344
-sV_context_user_identity
-p1345
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1346
-sV_context_tenant
-p1347
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1348
-sV_context_project_id
-p1349
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1350
-sV_context_read_only
-p1351
-I00
-sV_context_user_domain
-p1352
-NsV_context_user_name
-p1353
-Violie
-p1354
-stp1355
-a(F1.0428381443023682
-Vfloatingip.create.start
-p1356
-(dp1357
-V_context_domain
-p1358
-NsV_context_request_id
-p1359
-Vreq-9c17e6e9-7f5a-4bfe-90bd-ef5eeac78584
-p1360
-sVevent_type
-p1361
-g1356
-sV_context_auth_token
-p1362
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1363
-sV_context_resource_uuid
-p1364
-NsV_context_tenant_name
-p1365
-Vapexlake
-p1366
-sV_context_user_id
-p1367
-Vef7a4f67379f41aba489a0b6d6a62094
-p1368
-sVpayload
-p1369
-(dp1370
-Vfloatingip
-p1371
-(dp1372
-Vfloating_network_id
-p1373
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p1374
-sVport_id
-p1375
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p1376
-sssV_context_show_deleted
-p1377
-I00
-sVpriority
-p1378
-VINFO
-p1379
-sV_context_is_admin
-p1380
-I01
-sV_context_project_domain
-p1381
-NsV_context_timestamp
-p1382
-V2017-12-06 18:50:18.145953
-p1383
-sVpublisher_id
-p1384
-Vnetwork.machine-B
-p1385
-sVmessage_id
-p1386
-V4ed51db7-4059-4b53-ac55-6872a4d71b79
-p1387
-sV_context_roles
-p1388
-(lp1389
-Vadmin
-p1390
-asVtimestamp
-p1391
-V2017-12-06 18:50:18.147200
-p1392
-sV_context_user
-p1393
-Vef7a4f67379f41aba489a0b6d6a62094
-p1394
-sV_unique_id
-p1395
-V949d46b9f8004d8a94d593356d7441f5
-p1396
-sV_context_tenant_id
-p1397
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1398
-sV_context_project_name
-p1399
-Vapexlake
-p1400
-sV_context_user_identity
-p1401
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1402
-sV_context_tenant
-p1403
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1404
-sV_context_project_id
-p1405
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1406
-sV_context_read_only
-p1407
-I00
-sV_context_user_domain
-p1408
-NsV_context_user_name
-p1409
-Violie
-p1410
-stp1411
-a(F0.6116499900817871
-Vfloatingip.create.end
-p1412
-(dp1413
-V_context_domain
-p1414
-NsV_context_request_id
-p1415
-Vreq-9c17e6e9-7f5a-4bfe-90bd-ef5eeac78584
-p1416
-sVevent_type
-p1417
-g1412
-sV_context_auth_token
-p1418
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1419
-sV_context_resource_uuid
-p1420
-NsV_context_tenant_name
-p1421
-Vapexlake
-p1422
-sV_context_user_id
-p1423
-Vef7a4f67379f41aba489a0b6d6a62094
-p1424
-sVpayload
-p1425
-(dp1426
-Vfloatingip
-p1427
-(dp1428
-Vrouter_id
-p1429
-V4eb1290f-8c3c-45d5-9409-cc446f480079
-p1430
-sVstatus
-p1431
-VDOWN
-p1432
-sVdescription
-p1433
-g496
-sVdns_name
-p1434
-g496
-sVdns_domain
-p1435
-g496
-sVfloating_network_id
-p1436
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p1437
-sVfixed_ip_address
-p1438
-V172.16.9.157
-p1439
-sVfloating_ip_address
-p1440
-V10.2.32.202
-p1441
-sVtenant_id
-p1442
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1443
-sVport_id
-p1444
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p1445
-sVid
-p1446
-V8b9d5b63-29c2-45ae-ba91-1ce731cbcfb3
-p1447
-sssV_context_show_deleted
-p1448
-I00
-sVpriority
-p1449
-VINFO
-p1450
-sV_context_is_admin
-p1451
-I01
-sV_context_project_domain
-p1452
-NsV_context_timestamp
-p1453
-V2017-12-06 18:50:18.145953
-p1454
-sVpublisher_id
-p1455
-Vnetwork.machine-B
-p1456
-sVmessage_id
-p1457
-V3d0a407e-0ab8-43a6-930b-624ce4520faa
-p1458
-sV_context_roles
-p1459
-(lp1460
-Vadmin
-p1461
-asVtimestamp
-p1462
-V2017-12-06 18:50:18.758132
-p1463
-sV_context_user
-p1464
-Vef7a4f67379f41aba489a0b6d6a62094
-p1465
-sV_unique_id
-p1466
-V4d0c727e33cc4a1fbef3c3dfae8269c1
-p1467
-sV_context_tenant_id
-p1468
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1469
-sV_context_project_name
-p1470
-Vapexlake
-p1471
-sV_context_user_identity
-p1472
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1473
-sV_context_tenant
-p1474
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1475
-sV_context_project_id
-p1476
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1477
-sV_context_read_only
-p1478
-I00
-sV_context_user_domain
-p1479
-NsV_context_user_name
-p1480
-Violie
-p1481
-stp1482
-a(F0.6703319549560547
-Vcompute.instance.update
-p1483
-(dp1484
-V_context_domain
-p1485
-NsV_context_request_id
-p1486
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p1487
-sV_context_quota_class
-p1488
-NsVevent_type
-p1489
-g1483
-sV_context_service_catalog
-p1490
-(lp1491
-(dp1492
-Vendpoints
-p1493
-(lp1494
-(dp1495
-VadminURL
-p1496
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1497
-sVregion
-p1498
-VRegionOne
-p1499
-sVinternalURL
-p1500
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1501
-sVpublicURL
-p1502
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1503
-sasVtype
-p1504
-Vvolume
-p1505
-sVname
-p1506
-Vcinder
-p1507
-sa(dp1508
-g1493
-(lp1509
-(dp1510
-g1496
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1511
-sg1498
-VRegionOne
-p1512
-sg1500
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1513
-sg1502
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1514
-sasg1504
-Vvolumev2
-p1515
-sg1506
-Vcinderv2
-p1516
-sasV_context_auth_token
-p1517
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1518
-sV_context_resource_uuid
-p1519
-NsV_context_user_id
-p1520
-Vef7a4f67379f41aba489a0b6d6a62094
-p1521
-sVpayload
-p1522
-(dp1523
-Vstate_description
-p1524
-Vscheduling
-p1525
-sVavailability_zone
-p1526
-Vnova
-p1527
-sVterminated_at
-p1528
-g496
-sVephemeral_gb
-p1529
-I0
-sVinstance_type_id
-p1530
-I1
-sVbandwidth
-p1531
-(dp1532
-sVdeleted_at
-p1533
-g496
-sVreservation_id
-p1534
-Vr-0hp3hep2
-p1535
-sVmemory_mb
-p1536
-I4096
-sVdisplay_name
-p1537
-Vvm_test
-p1538
-sVhostname
-p1539
-Vvm-test
-p1540
-sVstate
-p1541
-Vbuilding
-p1542
-sVold_state
-p1543
-Vbuilding
-p1544
-sVprogress
-p1545
-g496
-sVlaunched_at
-p1546
-g496
-sVmetadata
-p1547
-(dp1548
-sVnode
-p1549
-NsVramdisk_id
-p1550
-g496
-sVaccess_ip_v6
-p1551
-NsVdisk_gb
-p1552
-I40
-sVaccess_ip_v4
-p1553
-NsVkernel_id
-p1554
-g496
-sVhost
-p1555
-NsVuser_id
-p1556
-Vef7a4f67379f41aba489a0b6d6a62094
-p1557
-sVimage_ref_url
-p1558
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1559
-sVcell_name
-p1560
-g496
-sVaudit_period_beginning
-p1561
-V2017-12-01T00:00:00.000000
-p1562
-sVroot_gb
-p1563
-I40
-sVtenant_id
-p1564
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1565
-sVcreated_at
-p1566
-V2017-12-06T18:50:19.394666
-p1567
-sVold_task_state
-p1568
-Vscheduling
-p1569
-sVinstance_id
-p1570
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1571
-sVinstance_type
-p1572
-Vm1.medium
-p1573
-sVvcpus
-p1574
-I2
-sVimage_meta
-p1575
-(dp1576
-Vmin_disk
-p1577
-V40
-p1578
-sVcontainer_format
-p1579
-Vbare
-p1580
-sVmin_ram
-p1581
-V0
-p1582
-sVdisk_format
-p1583
-Vqcow2
-p1584
-sVbase_image_ref
-p1585
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1586
-ssVarchitecture
-p1587
-NsVnew_task_state
-p1588
-Vscheduling
-p1589
-sVaudit_period_ending
-p1590
-V2017-12-06T18:50:19.425116
-p1591
-sVos_type
-p1592
-NsVinstance_flavor_id
-p1593
-V3
-p1594
-ssV_context_show_deleted
-p1595
-I00
-sVpriority
-p1596
-VINFO
-p1597
-sV_context_is_admin
-p1598
-I01
-sV_context_project_domain
-p1599
-NsV_context_timestamp
-p1600
-V2017-12-06T18:50:19.128490
-p1601
-sVpublisher_id
-p1602
-Vapi.machine-B
-p1603
-sVmessage_id
-p1604
-V684d4807-13ef-4b5f-8634-9f615a316425
-p1605
-sV_context_remote_address
-p1606
-V172.16.0.5
-p1607
-sV_context_roles
-p1608
-(lp1609
-Vadmin
-p1610
-asVtimestamp
-p1611
-V2017-12-06 18:50:19.429751
-p1612
-sV_context_user
-p1613
-Vef7a4f67379f41aba489a0b6d6a62094
-p1614
-sV_unique_id
-p1615
-V35d9dff9092d49868be8705040b19e40
-p1616
-sV_context_project_name
-p1617
-Vapexlake
-p1618
-sV_context_read_deleted
-p1619
-Vno
-p1620
-sV_context_user_identity
-p1621
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1622
-sV_context_tenant
-p1623
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1624
-sV_context_instance_lock_checked
-p1625
-I00
-sV_context_project_id
-p1626
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1627
-sV_context_read_only
-p1628
-I00
-sV_context_user_domain
-p1629
-NsV_context_user_name
-p1630
-Violie
-p1631
-stp1632
-a(F0.031568050384521484
-Vscheduler.select_destinations.start
-p1633
-(dp1634
-V_context_domain
-p1635
-NsV_context_request_id
-p1636
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p1637
-sV_context_quota_class
-p1638
-NsVevent_type
-p1639
-g1633
-sV_context_service_catalog
-p1640
-(lp1641
-(dp1642
-Vendpoints
-p1643
-(lp1644
-(dp1645
-VadminURL
-p1646
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1647
-sVregion
-p1648
-VRegionOne
-p1649
-sVinternalURL
-p1650
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1651
-sVpublicURL
-p1652
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1653
-sasVtype
-p1654
-Vvolume
-p1655
-sVname
-p1656
-Vcinder
-p1657
-sa(dp1658
-g1643
-(lp1659
-(dp1660
-g1646
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1661
-sg1648
-VRegionOne
-p1662
-sg1650
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1663
-sg1652
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1664
-sasg1654
-Vvolumev2
-p1665
-sg1656
-Vcinderv2
-p1666
-sasV_context_auth_token
-p1667
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1668
-sV_context_resource_uuid
-p1669
-NsV_context_user_id
-p1670
-Vef7a4f67379f41aba489a0b6d6a62094
-p1671
-sVpayload
-p1672
-(dp1673
-Vrequest_spec
-p1674
-(dp1675
-Vinstance_properties
-p1676
-(dp1677
-Vroot_gb
-p1678
-I40
-sVuuid
-p1679
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1680
-sVavailability_zone
-p1681
-Vnova
-p1682
-sVephemeral_gb
-p1683
-I0
-sVnuma_topology
-p1684
-NsVmemory_mb
-p1685
-I4096
-sVvcpus
-p1686
-I2
-sVproject_id
-p1687
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1688
-sVpci_requests
-p1689
-(dp1690
-Vinstance_uuid
-p1691
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1692
-sVrequests
-p1693
-(lp1694
-sssVinstance_type
-p1695
-(dp1696
-Vdisabled
-p1697
-I00
-sg1678
-I40
-sg1656
-Vm1.medium
-p1698
-sVflavorid
-p1699
-V3
-p1700
-sVdeleted
-p1701
-I00
-sVcreated_at
-p1702
-Nsg1683
-I0
-sVupdated_at
-p1703
-Nsg1685
-I4096
-sg1686
-I2
-sVextra_specs
-p1704
-(dp1705
-sVswap
-p1706
-I0
-sVrxtx_factor
-p1707
-F1.0
-sVis_public
-p1708
-I01
-sVdeleted_at
-p1709
-NsVvcpu_weight
-p1710
-I0
-sVid
-p1711
-I1
-ssVimage
-p1712
-(dp1713
-Vstatus
-p1714
-Vactive
-p1715
-sg1656
-Vubuntu1404
-p1716
-sVcontainer_format
-p1717
-Vbare
-p1718
-sg1702
-V2017-07-01T10:51:05.000000
-p1719
-sVdisk_format
-p1720
-Vqcow2
-p1721
-sg1703
-V2017-07-01T10:51:08.000000
-p1722
-sg1711
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1723
-sVmin_disk
-p1724
-I2
-sVmin_ram
-p1725
-I0
-sVchecksum
-p1726
-V6ad21b1699bcc4cbc02936bf1e915911
-p1727
-sVowner
-p1728
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1729
-sVproperties
-p1730
-(dp1731
-sVsize
-p1732
-I262144512
-ssVnum_instances
-p1733
-I1
-sssV_context_show_deleted
-p1734
-I00
-sVpriority
-p1735
-VINFO
-p1736
-sV_context_is_admin
-p1737
-I01
-sV_context_project_domain
-p1738
-NsV_context_timestamp
-p1739
-V2017-12-06T18:50:19.128490
-p1740
-sVpublisher_id
-p1741
-Vscheduler.machine-B
-p1742
-sVmessage_id
-p1743
-V4a62be2e-a370-403d-b6d2-636a6b1d6784
-p1744
-sV_context_remote_address
-p1745
-V172.16.0.5
-p1746
-sV_context_roles
-p1747
-(lp1748
-Vadmin
-p1749
-asVtimestamp
-p1750
-V2017-12-06 18:50:19.460791
-p1751
-sV_context_user
-p1752
-Vef7a4f67379f41aba489a0b6d6a62094
-p1753
-sV_unique_id
-p1754
-V0dbdf2e0ca9f4111910cd0fa6e2505fa
-p1755
-sV_context_project_name
-p1756
-Vapexlake
-p1757
-sV_context_read_deleted
-p1758
-Vno
-p1759
-sV_context_user_identity
-p1760
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1761
-sV_context_tenant
-p1762
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1763
-sV_context_instance_lock_checked
-p1764
-I00
-sV_context_project_id
-p1765
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1766
-sV_context_read_only
-p1767
-I00
-sV_context_user_domain
-p1768
-NsV_context_user_name
-p1769
-Violie
-p1770
-stp1771
-a(F0.0350949764251709
-Vscheduler.select_destinations.end
-p1772
-(dp1773
-V_context_domain
-p1774
-NsV_context_request_id
-p1775
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p1776
-sV_context_quota_class
-p1777
-NsVevent_type
-p1778
-g1772
-sV_context_service_catalog
-p1779
-(lp1780
-(dp1781
-Vendpoints
-p1782
-(lp1783
-(dp1784
-VadminURL
-p1785
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1786
-sVregion
-p1787
-VRegionOne
-p1788
-sVinternalURL
-p1789
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1790
-sVpublicURL
-p1791
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1792
-sasVtype
-p1793
-Vvolume
-p1794
-sVname
-p1795
-Vcinder
-p1796
-sa(dp1797
-g1782
-(lp1798
-(dp1799
-g1785
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1800
-sg1787
-VRegionOne
-p1801
-sg1789
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1802
-sg1791
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1803
-sasg1793
-Vvolumev2
-p1804
-sg1795
-Vcinderv2
-p1805
-sasV_context_auth_token
-p1806
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1807
-sV_context_resource_uuid
-p1808
-NsV_context_user_id
-p1809
-Vef7a4f67379f41aba489a0b6d6a62094
-p1810
-sVpayload
-p1811
-(dp1812
-Vrequest_spec
-p1813
-(dp1814
-Vinstance_properties
-p1815
-(dp1816
-Vroot_gb
-p1817
-I40
-sVuuid
-p1818
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1819
-sVavailability_zone
-p1820
-Vnova
-p1821
-sVephemeral_gb
-p1822
-I0
-sVnuma_topology
-p1823
-NsVmemory_mb
-p1824
-I4096
-sVvcpus
-p1825
-I2
-sVproject_id
-p1826
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1827
-sVpci_requests
-p1828
-(dp1829
-Vinstance_uuid
-p1830
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1831
-sVrequests
-p1832
-(lp1833
-sssVinstance_type
-p1834
-(dp1835
-Vdisabled
-p1836
-I00
-sg1817
-I40
-sg1795
-Vm1.medium
-p1837
-sVflavorid
-p1838
-V3
-p1839
-sVdeleted
-p1840
-I00
-sVcreated_at
-p1841
-Nsg1822
-I0
-sVupdated_at
-p1842
-Nsg1824
-I4096
-sg1825
-I2
-sVextra_specs
-p1843
-(dp1844
-sVswap
-p1845
-I0
-sVrxtx_factor
-p1846
-F1.0
-sVis_public
-p1847
-I01
-sVdeleted_at
-p1848
-NsVvcpu_weight
-p1849
-I0
-sVid
-p1850
-I1
-ssVimage
-p1851
-(dp1852
-Vstatus
-p1853
-Vactive
-p1854
-sg1795
-Vubuntu1404
-p1855
-sVcontainer_format
-p1856
-Vbare
-p1857
-sg1841
-V2017-07-01T10:51:05.000000
-p1858
-sVdisk_format
-p1859
-Vqcow2
-p1860
-sg1842
-V2017-07-01T10:51:08.000000
-p1861
-sg1850
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1862
-sVmin_disk
-p1863
-I2
-sVmin_ram
-p1864
-I0
-sVchecksum
-p1865
-V6ad21b1699bcc4cbc02936bf1e915911
-p1866
-sVowner
-p1867
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1868
-sVproperties
-p1869
-(dp1870
-sVsize
-p1871
-I262144512
-ssVnum_instances
-p1872
-I1
-sssV_context_show_deleted
-p1873
-I00
-sVpriority
-p1874
-VINFO
-p1875
-sV_context_is_admin
-p1876
-I01
-sV_context_project_domain
-p1877
-NsV_context_timestamp
-p1878
-V2017-12-06T18:50:19.128490
-p1879
-sVpublisher_id
-p1880
-Vscheduler.machine-B
-p1881
-sVmessage_id
-p1882
-V715217ab-99ba-45ee-af77-c0ac3796e51c
-p1883
-sV_context_remote_address
-p1884
-V172.16.0.5
-p1885
-sV_context_roles
-p1886
-(lp1887
-Vadmin
-p1888
-asVtimestamp
-p1889
-V2017-12-06 18:50:19.496521
-p1890
-sV_context_user
-p1891
-Vef7a4f67379f41aba489a0b6d6a62094
-p1892
-sV_unique_id
-p1893
-V8e2f3bae27fe4031a3edff4233d8c74a
-p1894
-sV_context_project_name
-p1895
-Vapexlake
-p1896
-sV_context_read_deleted
-p1897
-Vno
-p1898
-sV_context_user_identity
-p1899
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1900
-sV_context_tenant
-p1901
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1902
-sV_context_instance_lock_checked
-p1903
-I00
-sV_context_project_id
-p1904
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1905
-sV_context_read_only
-p1906
-I00
-sV_context_user_domain
-p1907
-NsV_context_user_name
-p1908
-Violie
-p1909
-stp1910
-a(F0.14736485481262207
-Vcompute.instance.update
-p1911
-(dp1912
-V_context_domain
-p1913
-NsV_context_request_id
-p1914
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p1915
-sV_context_quota_class
-p1916
-NsVevent_type
-p1917
-g1911
-sV_context_service_catalog
-p1918
-(lp1919
-(dp1920
-Vendpoints
-p1921
-(lp1922
-(dp1923
-VadminURL
-p1924
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1925
-sVregion
-p1926
-VRegionOne
-p1927
-sVinternalURL
-p1928
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1929
-sVpublicURL
-p1930
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1931
-sasVtype
-p1932
-Vvolume
-p1933
-sVname
-p1934
-Vcinder
-p1935
-sa(dp1936
-g1921
-(lp1937
-(dp1938
-g1924
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1939
-sg1926
-VRegionOne
-p1940
-sg1928
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1941
-sg1930
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1942
-sasg1932
-Vvolumev2
-p1943
-sg1934
-Vcinderv2
-p1944
-sasV_context_auth_token
-p1945
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p1946
-sV_context_resource_uuid
-p1947
-NsV_context_user_id
-p1948
-Vef7a4f67379f41aba489a0b6d6a62094
-p1949
-sVpayload
-p1950
-(dp1951
-Vstate_description
-p1952
-g496
-sVavailability_zone
-p1953
-Vnova
-p1954
-sVterminated_at
-p1955
-g496
-sVephemeral_gb
-p1956
-I0
-sVinstance_type_id
-p1957
-I1
-sVbandwidth
-p1958
-(dp1959
-sVdeleted_at
-p1960
-g496
-sVreservation_id
-p1961
-Vr-0hp3hep2
-p1962
-sVmemory_mb
-p1963
-I4096
-sVdisplay_name
-p1964
-Vvm_test
-p1965
-sVhostname
-p1966
-Vvm-test
-p1967
-sVstate
-p1968
-Vbuilding
-p1969
-sVold_state
-p1970
-Vbuilding
-p1971
-sVprogress
-p1972
-g496
-sVlaunched_at
-p1973
-g496
-sVmetadata
-p1974
-(dp1975
-sVnode
-p1976
-NsVramdisk_id
-p1977
-g496
-sVaccess_ip_v6
-p1978
-NsVdisk_gb
-p1979
-I40
-sVaccess_ip_v4
-p1980
-NsVkernel_id
-p1981
-g496
-sVhost
-p1982
-NsVuser_id
-p1983
-Vef7a4f67379f41aba489a0b6d6a62094
-p1984
-sVimage_ref_url
-p1985
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1986
-sVcell_name
-p1987
-g496
-sVaudit_period_beginning
-p1988
-V2017-12-01T00:00:00.000000
-p1989
-sVroot_gb
-p1990
-I40
-sVtenant_id
-p1991
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1992
-sVcreated_at
-p1993
-V2017-12-06T18:50:19.000000
-p1994
-sVold_task_state
-p1995
-Vscheduling
-p1996
-sVinstance_id
-p1997
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1998
-sVinstance_type
-p1999
-Vm1.medium
-p2000
-sVvcpus
-p2001
-I2
-sVimage_meta
-p2002
-(dp2003
-Vmin_disk
-p2004
-V40
-p2005
-sVcontainer_format
-p2006
-Vbare
-p2007
-sVmin_ram
-p2008
-V0
-p2009
-sVdisk_format
-p2010
-Vqcow2
-p2011
-sVbase_image_ref
-p2012
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2013
-ssVarchitecture
-p2014
-NsVnew_task_state
-p2015
-NsVaudit_period_ending
-p2016
-V2017-12-06T18:50:19.639654
-p2017
-sVos_type
-p2018
-NsVinstance_flavor_id
-p2019
-V3
-p2020
-ssV_context_show_deleted
-p2021
-I00
-sVpriority
-p2022
-VINFO
-p2023
-sV_context_is_admin
-p2024
-I01
-sV_context_project_domain
-p2025
-NsV_context_timestamp
-p2026
-V2017-12-06T18:50:19.128490
-p2027
-sVpublisher_id
-p2028
-Vcompute.machine-B
-p2029
-sVmessage_id
-p2030
-V5fee2ada-19dc-457c-a025-085484908acc
-p2031
-sV_context_remote_address
-p2032
-V172.16.0.5
-p2033
-sV_context_roles
-p2034
-(lp2035
-Vadmin
-p2036
-asVtimestamp
-p2037
-V2017-12-06 18:50:19.643951
-p2038
-sV_context_user
-p2039
-Vef7a4f67379f41aba489a0b6d6a62094
-p2040
-sV_unique_id
-p2041
-Va87014b5fc0d46a984cf769ff2e32343
-p2042
-sV_context_project_name
-p2043
-Vapexlake
-p2044
-sV_context_read_deleted
-p2045
-Vno
-p2046
-sV_context_user_identity
-p2047
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2048
-sV_context_tenant
-p2049
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2050
-sV_context_instance_lock_checked
-p2051
-I00
-sV_context_project_id
-p2052
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2053
-sV_context_read_only
-p2054
-I00
-sV_context_user_domain
-p2055
-NsV_context_user_name
-p2056
-Violie
-p2057
-stp2058
-a(F0.009819984436035156
-Vcompute.instance.create.start
-p2059
-(dp2060
-V_context_domain
-p2061
-NsV_context_request_id
-p2062
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p2063
-sV_context_quota_class
-p2064
-NsVevent_type
-p2065
-g2059
-sV_context_service_catalog
-p2066
-(lp2067
-(dp2068
-Vendpoints
-p2069
-(lp2070
-(dp2071
-VadminURL
-p2072
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2073
-sVregion
-p2074
-VRegionOne
-p2075
-sVinternalURL
-p2076
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2077
-sVpublicURL
-p2078
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2079
-sasVtype
-p2080
-Vvolume
-p2081
-sVname
-p2082
-Vcinder
-p2083
-sa(dp2084
-g2069
-(lp2085
-(dp2086
-g2072
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2087
-sg2074
-VRegionOne
-p2088
-sg2076
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2089
-sg2078
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2090
-sasg2080
-Vvolumev2
-p2091
-sg2082
-Vcinderv2
-p2092
-sasV_context_auth_token
-p2093
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p2094
-sV_context_resource_uuid
-p2095
-NsV_context_user_id
-p2096
-Vef7a4f67379f41aba489a0b6d6a62094
-p2097
-sVpayload
-p2098
-(dp2099
-Vstate_description
-p2100
-g496
-sVavailability_zone
-p2101
-Vnova
-p2102
-sVterminated_at
-p2103
-g496
-sVephemeral_gb
-p2104
-I0
-sVinstance_type_id
-p2105
-I1
-sVdeleted_at
-p2106
-g496
-sVreservation_id
-p2107
-Vr-0hp3hep2
-p2108
-sVmemory_mb
-p2109
-I4096
-sVdisplay_name
-p2110
-Vvm_test
-p2111
-sVhostname
-p2112
-Vvm-test
-p2113
-sVstate
-p2114
-Vbuilding
-p2115
-sVprogress
-p2116
-g496
-sVlaunched_at
-p2117
-g496
-sVmetadata
-p2118
-(dp2119
-sVnode
-p2120
-NsVramdisk_id
-p2121
-g496
-sVaccess_ip_v6
-p2122
-NsVdisk_gb
-p2123
-I40
-sVaccess_ip_v4
-p2124
-NsVkernel_id
-p2125
-g496
-sVimage_name
-p2126
-Vubuntu1404
-p2127
-sVhost
-p2128
-NsVuser_id
-p2129
-Vef7a4f67379f41aba489a0b6d6a62094
-p2130
-sVimage_ref_url
-p2131
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2132
-sVcell_name
-p2133
-g496
-sVroot_gb
-p2134
-I40
-sVtenant_id
-p2135
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2136
-sVcreated_at
-p2137
-V2017-12-06T18:50:19.000000
-p2138
-sVinstance_id
-p2139
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2140
-sVinstance_type
-p2141
-Vm1.medium
-p2142
-sVvcpus
-p2143
-I2
-sVimage_meta
-p2144
-(dp2145
-Vmin_disk
-p2146
-V40
-p2147
-sVcontainer_format
-p2148
-Vbare
-p2149
-sVmin_ram
-p2150
-V0
-p2151
-sVdisk_format
-p2152
-Vqcow2
-p2153
-sVbase_image_ref
-p2154
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2155
-ssVarchitecture
-p2156
-NsVos_type
-p2157
-NsVinstance_flavor_id
-p2158
-V3
-p2159
-ssV_context_show_deleted
-p2160
-I00
-sVpriority
-p2161
-VINFO
-p2162
-sV_context_is_admin
-p2163
-I01
-sV_context_project_domain
-p2164
-NsV_context_timestamp
-p2165
-V2017-12-06T18:50:19.128490
-p2166
-sVpublisher_id
-p2167
-Vcompute.machine-B
-p2168
-sVmessage_id
-p2169
-V1dd73b64-cd19-4570-9109-f6c6bb4d2375
-p2170
-sV_context_remote_address
-p2171
-V172.16.0.5
-p2172
-sV_context_roles
-p2173
-(lp2174
-Vadmin
-p2175
-asVtimestamp
-p2176
-V2017-12-06 18:50:19.650648
-p2177
-sV_context_user
-p2178
-Vef7a4f67379f41aba489a0b6d6a62094
-p2179
-sV_unique_id
-p2180
-V7a6b825627884f6c96946a8fbb95e00c
-p2181
-sV_context_project_name
-p2182
-Vapexlake
-p2183
-sV_context_read_deleted
-p2184
-Vno
-p2185
-sV_context_user_identity
-p2186
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2187
-sV_context_tenant
-p2188
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2189
-sV_context_instance_lock_checked
-p2190
-I00
-sV_context_project_id
-p2191
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2192
-sV_context_read_only
-p2193
-I00
-sV_context_user_domain
-p2194
-NsV_context_user_name
-p2195
-Violie
-p2196
-stp2197
-a(F0.0885629653930664
-Vcompute.instance.update
-p2198
-(dp2199
-V_context_domain
-p2200
-NsV_context_request_id
-p2201
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p2202
-sV_context_quota_class
-p2203
-NsVevent_type
-p2204
-g2198
-sV_context_service_catalog
-p2205
-(lp2206
-(dp2207
-Vendpoints
-p2208
-(lp2209
-(dp2210
-VadminURL
-p2211
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2212
-sVregion
-p2213
-VRegionOne
-p2214
-sVinternalURL
-p2215
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2216
-sVpublicURL
-p2217
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2218
-sasVtype
-p2219
-Vvolume
-p2220
-sVname
-p2221
-Vcinder
-p2222
-sa(dp2223
-g2208
-(lp2224
-(dp2225
-g2211
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2226
-sg2213
-VRegionOne
-p2227
-sg2215
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2228
-sg2217
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2229
-sasg2219
-Vvolumev2
-p2230
-sg2221
-Vcinderv2
-p2231
-sasV_context_auth_token
-p2232
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p2233
-sV_context_resource_uuid
-p2234
-NsV_context_user_id
-p2235
-Vef7a4f67379f41aba489a0b6d6a62094
-p2236
-sVpayload
-p2237
-(dp2238
-Vstate_description
-p2239
-g496
-sVavailability_zone
-p2240
-Vnova
-p2241
-sVterminated_at
-p2242
-g496
-sVephemeral_gb
-p2243
-I0
-sVinstance_type_id
-p2244
-I1
-sVbandwidth
-p2245
-(dp2246
-sVdeleted_at
-p2247
-g496
-sVreservation_id
-p2248
-Vr-0hp3hep2
-p2249
-sVmemory_mb
-p2250
-I4096
-sVdisplay_name
-p2251
-Vvm_test
-p2252
-sVhostname
-p2253
-Vvm-test
-p2254
-sVstate
-p2255
-Vbuilding
-p2256
-sVold_state
-p2257
-Vbuilding
-p2258
-sVprogress
-p2259
-g496
-sVlaunched_at
-p2260
-g496
-sVmetadata
-p2261
-(dp2262
-sVnode
-p2263
-Vmachine-B
-p2264
-sVramdisk_id
-p2265
-g496
-sVaccess_ip_v6
-p2266
-NsVdisk_gb
-p2267
-I40
-sVaccess_ip_v4
-p2268
-NsVkernel_id
-p2269
-g496
-sVhost
-p2270
-Vmachine-B
-p2271
-sVuser_id
-p2272
-Vef7a4f67379f41aba489a0b6d6a62094
-p2273
-sVimage_ref_url
-p2274
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2275
-sVcell_name
-p2276
-g496
-sVaudit_period_beginning
-p2277
-V2017-12-01T00:00:00.000000
-p2278
-sVroot_gb
-p2279
-I40
-sVtenant_id
-p2280
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2281
-sVcreated_at
-p2282
-V2017-12-06T18:50:19.000000
-p2283
-sVold_task_state
-p2284
-NsVinstance_id
-p2285
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2286
-sVinstance_type
-p2287
-Vm1.medium
-p2288
-sVvcpus
-p2289
-I2
-sVimage_meta
-p2290
-(dp2291
-Vmin_disk
-p2292
-V40
-p2293
-sVcontainer_format
-p2294
-Vbare
-p2295
-sVmin_ram
-p2296
-V0
-p2297
-sVdisk_format
-p2298
-Vqcow2
-p2299
-sVbase_image_ref
-p2300
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2301
-ssVarchitecture
-p2302
-NsVnew_task_state
-p2303
-NsVaudit_period_ending
-p2304
-V2017-12-06T18:50:19.737326
-p2305
-sVos_type
-p2306
-NsVinstance_flavor_id
-p2307
-V3
-p2308
-ssV_context_show_deleted
-p2309
-I00
-sVpriority
-p2310
-VINFO
-p2311
-sV_context_is_admin
-p2312
-I01
-sV_context_project_domain
-p2313
-NsV_context_timestamp
-p2314
-V2017-12-06T18:50:19.128490
-p2315
-sVpublisher_id
-p2316
-Vcompute.machine-B
-p2317
-sVmessage_id
-p2318
-V91b6f494-e2c6-44e9-9c64-956b5cb9fe05
-p2319
-sV_context_remote_address
-p2320
-V172.16.0.5
-p2321
-sV_context_roles
-p2322
-(lp2323
-Vadmin
-p2324
-asVtimestamp
-p2325
-V2017-12-06 18:50:19.741890
-p2326
-sV_context_user
-p2327
-Vef7a4f67379f41aba489a0b6d6a62094
-p2328
-sV_unique_id
-p2329
-V8004cd8881ab470e85f3fafc6151078a
-p2330
-sV_context_project_name
-p2331
-Vapexlake
-p2332
-sV_context_read_deleted
-p2333
-Vno
-p2334
-sV_context_user_identity
-p2335
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2336
-sV_context_tenant
-p2337
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2338
-sV_context_instance_lock_checked
-p2339
-I00
-sV_context_project_id
-p2340
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2341
-sV_context_read_only
-p2342
-I00
-sV_context_user_domain
-p2343
-NsV_context_user_name
-p2344
-Violie
-p2345
-stp2346
-a(F0.09284806251525879
-Vcompute.instance.update
-p2347
-(dp2348
-V_context_domain
-p2349
-NsV_context_request_id
-p2350
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p2351
-sV_context_quota_class
-p2352
-NsVevent_type
-p2353
-g2347
-sV_context_service_catalog
-p2354
-(lp2355
-(dp2356
-Vendpoints
-p2357
-(lp2358
-(dp2359
-VadminURL
-p2360
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2361
-sVregion
-p2362
-VRegionOne
-p2363
-sVinternalURL
-p2364
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2365
-sVpublicURL
-p2366
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2367
-sasVtype
-p2368
-Vvolume
-p2369
-sVname
-p2370
-Vcinder
-p2371
-sa(dp2372
-g2357
-(lp2373
-(dp2374
-g2360
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2375
-sg2362
-VRegionOne
-p2376
-sg2364
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2377
-sg2366
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2378
-sasg2368
-Vvolumev2
-p2379
-sg2370
-Vcinderv2
-p2380
-sasV_context_auth_token
-p2381
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p2382
-sV_context_resource_uuid
-p2383
-NsV_context_user_id
-p2384
-Vef7a4f67379f41aba489a0b6d6a62094
-p2385
-sVpayload
-p2386
-(dp2387
-Vstate_description
-p2388
-Vnetworking
-p2389
-sVavailability_zone
-p2390
-Vnova
-p2391
-sVterminated_at
-p2392
-g496
-sVephemeral_gb
-p2393
-I0
-sVinstance_type_id
-p2394
-I1
-sVbandwidth
-p2395
-(dp2396
-sVdeleted_at
-p2397
-g496
-sVreservation_id
-p2398
-Vr-0hp3hep2
-p2399
-sVmemory_mb
-p2400
-I4096
-sVdisplay_name
-p2401
-Vvm_test
-p2402
-sVhostname
-p2403
-Vvm-test
-p2404
-sVstate
-p2405
-Vbuilding
-p2406
-sVold_state
-p2407
-Vbuilding
-p2408
-sVprogress
-p2409
-g496
-sVlaunched_at
-p2410
-g496
-sVmetadata
-p2411
-(dp2412
-sVnode
-p2413
-Vmachine-B
-p2414
-sVramdisk_id
-p2415
-g496
-sVaccess_ip_v6
-p2416
-NsVdisk_gb
-p2417
-I40
-sVaccess_ip_v4
-p2418
-NsVkernel_id
-p2419
-g496
-sVhost
-p2420
-Vmachine-B
-p2421
-sVuser_id
-p2422
-Vef7a4f67379f41aba489a0b6d6a62094
-p2423
-sVimage_ref_url
-p2424
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2425
-sVcell_name
-p2426
-g496
-sVaudit_period_beginning
-p2427
-V2017-12-01T00:00:00.000000
-p2428
-sVroot_gb
-p2429
-I40
-sVtenant_id
-p2430
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2431
-sVcreated_at
-p2432
-V2017-12-06T18:50:19.000000
-p2433
-sVold_task_state
-p2434
-Vnetworking
-p2435
-sVinstance_id
-p2436
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2437
-sVinstance_type
-p2438
-Vm1.medium
-p2439
-sVvcpus
-p2440
-I2
-sVimage_meta
-p2441
-(dp2442
-Vmin_disk
-p2443
-V40
-p2444
-sVcontainer_format
-p2445
-Vbare
-p2446
-sVmin_ram
-p2447
-V0
-p2448
-sVdisk_format
-p2449
-Vqcow2
-p2450
-sVbase_image_ref
-p2451
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2452
-ssVarchitecture
-p2453
-NsVnew_task_state
-p2454
-Vnetworking
-p2455
-sVaudit_period_ending
-p2456
-V2017-12-06T18:50:19.830751
-p2457
-sVos_type
-p2458
-NsVinstance_flavor_id
-p2459
-V3
-p2460
-ssV_context_show_deleted
-p2461
-I00
-sVpriority
-p2462
-VINFO
-p2463
-sV_context_is_admin
-p2464
-I01
-sV_context_project_domain
-p2465
-NsV_context_timestamp
-p2466
-V2017-12-06T18:50:19.128490
-p2467
-sVpublisher_id
-p2468
-Vcompute.machine-B
-p2469
-sVmessage_id
-p2470
-V89fb89ae-965c-4a32-9acf-27e3f0938cda
-p2471
-sV_context_remote_address
-p2472
-V172.16.0.5
-p2473
-sV_context_roles
-p2474
-(lp2475
-Vadmin
-p2476
-asVtimestamp
-p2477
-V2017-12-06 18:50:19.835032
-p2478
-sV_context_user
-p2479
-Vef7a4f67379f41aba489a0b6d6a62094
-p2480
-sV_unique_id
-p2481
-Ve3df21fa9cce4879b614bf1936bad970
-p2482
-sV_context_project_name
-p2483
-Vapexlake
-p2484
-sV_context_read_deleted
-p2485
-Vno
-p2486
-sV_context_user_identity
-p2487
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2488
-sV_context_tenant
-p2489
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2490
-sV_context_instance_lock_checked
-p2491
-I00
-sV_context_project_id
-p2492
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2493
-sV_context_read_only
-p2494
-I00
-sV_context_user_domain
-p2495
-NsV_context_user_name
-p2496
-Violie
-p2497
-stp2498
-a(F0.10212016105651855
-Vcompute.instance.update
-p2499
-(dp2500
-V_context_domain
-p2501
-NsV_context_request_id
-p2502
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p2503
-sV_context_quota_class
-p2504
-NsVevent_type
-p2505
-g2499
-sV_context_service_catalog
-p2506
-(lp2507
-(dp2508
-Vendpoints
-p2509
-(lp2510
-(dp2511
-VadminURL
-p2512
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2513
-sVregion
-p2514
-VRegionOne
-p2515
-sVinternalURL
-p2516
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2517
-sVpublicURL
-p2518
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2519
-sasVtype
-p2520
-Vvolume
-p2521
-sVname
-p2522
-Vcinder
-p2523
-sa(dp2524
-g2509
-(lp2525
-(dp2526
-g2512
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2527
-sg2514
-VRegionOne
-p2528
-sg2516
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2529
-sg2518
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2530
-sasg2520
-Vvolumev2
-p2531
-sg2522
-Vcinderv2
-p2532
-sasV_context_auth_token
-p2533
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p2534
-sV_context_resource_uuid
-p2535
-NsV_context_user_id
-p2536
-Vef7a4f67379f41aba489a0b6d6a62094
-p2537
-sVpayload
-p2538
-(dp2539
-Vstate_description
-p2540
-Vblock_device_mapping
-p2541
-sVavailability_zone
-p2542
-Vnova
-p2543
-sVterminated_at
-p2544
-g496
-sVephemeral_gb
-p2545
-I0
-sVinstance_type_id
-p2546
-I1
-sVbandwidth
-p2547
-(dp2548
-sVdeleted_at
-p2549
-g496
-sVreservation_id
-p2550
-Vr-0hp3hep2
-p2551
-sVmemory_mb
-p2552
-I4096
-sVdisplay_name
-p2553
-Vvm_test
-p2554
-sVhostname
-p2555
-Vvm-test
-p2556
-sVstate
-p2557
-Vbuilding
-p2558
-sVold_state
-p2559
-Vbuilding
-p2560
-sVprogress
-p2561
-g496
-sVlaunched_at
-p2562
-g496
-sVmetadata
-p2563
-(dp2564
-sVnode
-p2565
-Vmachine-B
-p2566
-sVramdisk_id
-p2567
-g496
-sVaccess_ip_v6
-p2568
-NsVdisk_gb
-p2569
-I40
-sVaccess_ip_v4
-p2570
-NsVkernel_id
-p2571
-g496
-sVhost
-p2572
-Vmachine-B
-p2573
-sVuser_id
-p2574
-Vef7a4f67379f41aba489a0b6d6a62094
-p2575
-sVimage_ref_url
-p2576
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2577
-sVcell_name
-p2578
-g496
-sVaudit_period_beginning
-p2579
-V2017-12-01T00:00:00.000000
-p2580
-sVroot_gb
-p2581
-I40
-sVtenant_id
-p2582
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2583
-sVcreated_at
-p2584
-V2017-12-06T18:50:19.000000
-p2585
-sVold_task_state
-p2586
-Vnetworking
-p2587
-sVinstance_id
-p2588
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2589
-sVinstance_type
-p2590
-Vm1.medium
-p2591
-sVvcpus
-p2592
-I2
-sVimage_meta
-p2593
-(dp2594
-Vmin_disk
-p2595
-V40
-p2596
-sVcontainer_format
-p2597
-Vbare
-p2598
-sVmin_ram
-p2599
-V0
-p2600
-sVdisk_format
-p2601
-Vqcow2
-p2602
-sVbase_image_ref
-p2603
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2604
-ssVarchitecture
-p2605
-NsVnew_task_state
-p2606
-Vblock_device_mapping
-p2607
-sVaudit_period_ending
-p2608
-V2017-12-06T18:50:19.933217
-p2609
-sVos_type
-p2610
-NsVinstance_flavor_id
-p2611
-V3
-p2612
-ssV_context_show_deleted
-p2613
-I00
-sVpriority
-p2614
-VINFO
-p2615
-sV_context_is_admin
-p2616
-I01
-sV_context_project_domain
-p2617
-NsV_context_timestamp
-p2618
-V2017-12-06T18:50:19.128490
-p2619
-sVpublisher_id
-p2620
-Vcompute.machine-B
-p2621
-sVmessage_id
-p2622
-V3a8b2081-1df1-490d-b259-a770ceb2748c
-p2623
-sV_context_remote_address
-p2624
-V172.16.0.5
-p2625
-sV_context_roles
-p2626
-(lp2627
-Vadmin
-p2628
-asVtimestamp
-p2629
-V2017-12-06 18:50:19.936714
-p2630
-sV_context_user
-p2631
-Vef7a4f67379f41aba489a0b6d6a62094
-p2632
-sV_unique_id
-p2633
-V14b5b2361a9d41fd953108001fe7e4e7
-p2634
-sV_context_project_name
-p2635
-Vapexlake
-p2636
-sV_context_read_deleted
-p2637
-Vno
-p2638
-sV_context_user_identity
-p2639
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2640
-sV_context_tenant
-p2641
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2642
-sV_context_instance_lock_checked
-p2643
-I00
-sV_context_project_id
-p2644
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2645
-sV_context_read_only
-p2646
-I00
-sV_context_user_domain
-p2647
-NsV_context_user_name
-p2648
-Violie
-p2649
-stp2650
-a(F0.025059938430786133
-Vport.update.start
-p2651
-(dp2652
-V_context_domain
-p2653
-NsV_context_request_id
-p2654
-Vreq-f7558bed-37cf-4ea3-ae80-eac619135736
-p2655
-sVevent_type
-p2656
-g2651
-sV_context_auth_token
-p2657
-VgAAAAABaKDC0wXHp29QemdyEz0-90tRDSHLLE1ODoSpZB787uDgJ-D8ZEkJnyxWc_DVJqL_cvAwDNpr9GPW7H1E1bD6JxVVb8ClV8CcbiKfaJo8Ce_yaCO1ZXl6trEwdu8W0qI_5tUlPL0rr-9tIaTy5lx6MOlmJ02IRshdTG2Un-vV-GjWldlg
-p2658
-sV_context_resource_uuid
-p2659
-NsV_context_tenant_name
-p2660
-Vservices
-p2661
-sV_context_user_id
-p2662
-V84faafdbb77b40c9a73047fdebb0ab45
-p2663
-sVpayload
-p2664
-(dp2665
-Vport
-p2666
-(dp2667
-Vdns_name
-p2668
-Vvm-test
-p2669
-sVdevice_owner
-p2670
-Vcompute:nova
-p2671
-sVbinding:host_id
-p2672
-Vmachine-B
-p2673
-sVdevice_id
-p2674
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2675
-ssVid
-p2676
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p2677
-ssV_context_show_deleted
-p2678
-I00
-sVpriority
-p2679
-VINFO
-p2680
-sV_context_is_admin
-p2681
-I01
-sV_context_project_domain
-p2682
-NsV_context_timestamp
-p2683
-V2017-12-06 18:50:19.959796
-p2684
-sVpublisher_id
-p2685
-Vnetwork.machine-B
-p2686
-sVmessage_id
-p2687
-V3ac27e58-644e-4250-bcd8-ede4175fbc9c
-p2688
-sV_context_roles
-p2689
-(lp2690
-Vadmin
-p2691
-asVtimestamp
-p2692
-V2017-12-06 18:50:19.961387
-p2693
-sV_context_user
-p2694
-V84faafdbb77b40c9a73047fdebb0ab45
-p2695
-sV_unique_id
-p2696
-V21fd45e0404f44e3ae57261007c2bc91
-p2697
-sV_context_tenant_id
-p2698
-V66fbf30f2dce4cef95d5248254dac9a5
-p2699
-sV_context_project_name
-p2700
-Vservices
-p2701
-sV_context_user_identity
-p2702
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p2703
-sV_context_tenant
-p2704
-V66fbf30f2dce4cef95d5248254dac9a5
-p2705
-sV_context_project_id
-p2706
-V66fbf30f2dce4cef95d5248254dac9a5
-p2707
-sV_context_read_only
-p2708
-I00
-sV_context_user_domain
-p2709
-NsV_context_user_name
-p2710
-Vneutron
-p2711
-stp2712
-a(F0.048410892486572266
-Vcompute.instance.update
-p2713
-(dp2714
-V_context_domain
-p2715
-NsV_context_request_id
-p2716
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p2717
-sV_context_quota_class
-p2718
-NsVevent_type
-p2719
-g2713
-sV_context_service_catalog
-p2720
-(lp2721
-(dp2722
-Vendpoints
-p2723
-(lp2724
-(dp2725
-VadminURL
-p2726
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2727
-sVregion
-p2728
-VRegionOne
-p2729
-sVinternalURL
-p2730
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2731
-sVpublicURL
-p2732
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2733
-sasVtype
-p2734
-Vvolume
-p2735
-sVname
-p2736
-Vcinder
-p2737
-sa(dp2738
-g2723
-(lp2739
-(dp2740
-g2726
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2741
-sg2728
-VRegionOne
-p2742
-sg2730
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2743
-sg2732
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2744
-sasg2734
-Vvolumev2
-p2745
-sg2736
-Vcinderv2
-p2746
-sasV_context_auth_token
-p2747
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p2748
-sV_context_resource_uuid
-p2749
-NsV_context_user_id
-p2750
-Vef7a4f67379f41aba489a0b6d6a62094
-p2751
-sVpayload
-p2752
-(dp2753
-Vstate_description
-p2754
-Vspawning
-p2755
-sVavailability_zone
-p2756
-Vnova
-p2757
-sVterminated_at
-p2758
-g496
-sVephemeral_gb
-p2759
-I0
-sVinstance_type_id
-p2760
-I1
-sVbandwidth
-p2761
-(dp2762
-sVdeleted_at
-p2763
-g496
-sVreservation_id
-p2764
-Vr-0hp3hep2
-p2765
-sVmemory_mb
-p2766
-I4096
-sVdisplay_name
-p2767
-Vvm_test
-p2768
-sVhostname
-p2769
-Vvm-test
-p2770
-sVstate
-p2771
-Vbuilding
-p2772
-sVold_state
-p2773
-Vbuilding
-p2774
-sVprogress
-p2775
-g496
-sVlaunched_at
-p2776
-g496
-sVmetadata
-p2777
-(dp2778
-sVnode
-p2779
-Vmachine-B
-p2780
-sVramdisk_id
-p2781
-g496
-sVaccess_ip_v6
-p2782
-NsVdisk_gb
-p2783
-I40
-sVaccess_ip_v4
-p2784
-NsVkernel_id
-p2785
-g496
-sVhost
-p2786
-Vmachine-B
-p2787
-sVuser_id
-p2788
-Vef7a4f67379f41aba489a0b6d6a62094
-p2789
-sVimage_ref_url
-p2790
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2791
-sVcell_name
-p2792
-g496
-sVaudit_period_beginning
-p2793
-V2017-12-01T00:00:00.000000
-p2794
-sVroot_gb
-p2795
-I40
-sVtenant_id
-p2796
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2797
-sVcreated_at
-p2798
-V2017-12-06T18:50:19.000000
-p2799
-sVold_task_state
-p2800
-Vblock_device_mapping
-p2801
-sVinstance_id
-p2802
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2803
-sVinstance_type
-p2804
-Vm1.medium
-p2805
-sVvcpus
-p2806
-I2
-sVimage_meta
-p2807
-(dp2808
-Vmin_disk
-p2809
-V40
-p2810
-sVcontainer_format
-p2811
-Vbare
-p2812
-sVmin_ram
-p2813
-V0
-p2814
-sVdisk_format
-p2815
-Vqcow2
-p2816
-sVbase_image_ref
-p2817
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2818
-ssVarchitecture
-p2819
-NsVnew_task_state
-p2820
-Vspawning
-p2821
-sVaudit_period_ending
-p2822
-V2017-12-06T18:50:20.006457
-p2823
-sVos_type
-p2824
-NsVinstance_flavor_id
-p2825
-V3
-p2826
-ssV_context_show_deleted
-p2827
-I00
-sVpriority
-p2828
-VINFO
-p2829
-sV_context_is_admin
-p2830
-I01
-sV_context_project_domain
-p2831
-NsV_context_timestamp
-p2832
-V2017-12-06T18:50:19.128490
-p2833
-sVpublisher_id
-p2834
-Vcompute.machine-B
-p2835
-sVmessage_id
-p2836
-V88196f5b-e45c-4980-9775-e0d7b7ecc2d2
-p2837
-sV_context_remote_address
-p2838
-V172.16.0.5
-p2839
-sV_context_roles
-p2840
-(lp2841
-Vadmin
-p2842
-asVtimestamp
-p2843
-V2017-12-06 18:50:20.010909
-p2844
-sV_context_user
-p2845
-Vef7a4f67379f41aba489a0b6d6a62094
-p2846
-sV_unique_id
-p2847
-Ve282f3134cf94caaa057bd416a3d9d89
-p2848
-sV_context_project_name
-p2849
-Vapexlake
-p2850
-sV_context_read_deleted
-p2851
-Vno
-p2852
-sV_context_user_identity
-p2853
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2854
-sV_context_tenant
-p2855
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2856
-sV_context_instance_lock_checked
-p2857
-I00
-sV_context_project_id
-p2858
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2859
-sV_context_read_only
-p2860
-I00
-sV_context_user_domain
-p2861
-NsV_context_user_name
-p2862
-Violie
-p2863
-stp2864
-a(F0.1610579490661621
-Vport.update.end
-p2865
-(dp2866
-V_context_domain
-p2867
-NsV_context_request_id
-p2868
-Vreq-f7558bed-37cf-4ea3-ae80-eac619135736
-p2869
-sVevent_type
-p2870
-g2865
-sV_context_auth_token
-p2871
-VgAAAAABaKDC0wXHp29QemdyEz0-90tRDSHLLE1ODoSpZB787uDgJ-D8ZEkJnyxWc_DVJqL_cvAwDNpr9GPW7H1E1bD6JxVVb8ClV8CcbiKfaJo8Ce_yaCO1ZXl6trEwdu8W0qI_5tUlPL0rr-9tIaTy5lx6MOlmJ02IRshdTG2Un-vV-GjWldlg
-p2872
-sV_context_resource_uuid
-p2873
-NsV_context_tenant_name
-p2874
-Vservices
-p2875
-sV_context_user_id
-p2876
-V84faafdbb77b40c9a73047fdebb0ab45
-p2877
-sVpayload
-p2878
-(dp2879
-Vport
-p2880
-(dp2881
-Vallowed_address_pairs
-p2882
-(lp2883
-sVextra_dhcp_opts
-p2884
-(lp2885
-sVupdated_at
-p2886
-V2017-12-06T18:50:20
-p2887
-sVdevice_owner
-p2888
-Vcompute:nova
-p2889
-sVport_security_enabled
-p2890
-I01
-sVbinding:profile
-p2891
-(dp2892
-sVfixed_ips
-p2893
-(lp2894
-(dp2895
-Vsubnet_id
-p2896
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p2897
-sVip_address
-p2898
-V172.16.9.157
-p2899
-sasVid
-p2900
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p2901
-sVsecurity_groups
-p2902
-(lp2903
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p2904
-asVbinding:vif_details
-p2905
-(dp2906
-Vport_filter
-p2907
-I01
-sVovs_hybrid_plug
-p2908
-I01
-ssVbinding:vif_type
-p2909
-Vovs
-p2910
-sVmac_address
-p2911
-Vfa:16:3e:a0:d1:cf
-p2912
-sVstatus
-p2913
-VDOWN
-p2914
-sVbinding:host_id
-p2915
-Vmachine-B
-p2916
-sVdescription
-p2917
-g496
-sVdevice_id
-p2918
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2919
-sVname
-p2920
-Vgreen-server_port-fm3ogwps6zhw
-p2921
-sVadmin_state_up
-p2922
-I01
-sVnetwork_id
-p2923
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p2924
-sVdns_name
-p2925
-g496
-sVcreated_at
-p2926
-V2017-12-06T18:50:17
-p2927
-sVbinding:vnic_type
-p2928
-Vnormal
-p2929
-sVtenant_id
-p2930
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2931
-sssV_context_show_deleted
-p2932
-I00
-sVpriority
-p2933
-VINFO
-p2934
-sV_context_is_admin
-p2935
-I01
-sV_context_project_domain
-p2936
-NsV_context_timestamp
-p2937
-V2017-12-06 18:50:19.959796
-p2938
-sVpublisher_id
-p2939
-Vnetwork.machine-B
-p2940
-sVmessage_id
-p2941
-V611534b6-8ae2-4760-b3e5-2f2f818ed271
-p2942
-sV_context_roles
-p2943
-(lp2944
-Vadmin
-p2945
-asVtimestamp
-p2946
-V2017-12-06 18:50:20.172291
-p2947
-sV_context_user
-p2948
-V84faafdbb77b40c9a73047fdebb0ab45
-p2949
-sV_unique_id
-p2950
-Vbad8beffeb7841e6bf0a0d3c1b0a46c3
-p2951
-sV_context_tenant_id
-p2952
-V66fbf30f2dce4cef95d5248254dac9a5
-p2953
-sV_context_project_name
-p2954
-Vservices
-p2955
-sV_context_user_identity
-p2956
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p2957
-sV_context_tenant
-p2958
-V66fbf30f2dce4cef95d5248254dac9a5
-p2959
-sV_context_project_id
-p2960
-V66fbf30f2dce4cef95d5248254dac9a5
-p2961
-sV_context_read_only
-p2962
-I00
-sV_context_user_domain
-p2963
-NsV_context_user_name
-p2964
-Vneutron
-p2965
-stp2966
-a(F1.1948709964752198
-Vcompute.instance.update
-p2967
-(dp2968
-V_context_domain
-p2969
-NsV_context_request_id
-p2970
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p2971
-sV_context_quota_class
-p2972
-NsVevent_type
-p2973
-g2967
-sV_context_service_catalog
-p2974
-(lp2975
-(dp2976
-Vendpoints
-p2977
-(lp2978
-(dp2979
-VadminURL
-p2980
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2981
-sVregion
-p2982
-VRegionOne
-p2983
-sVinternalURL
-p2984
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2985
-sVpublicURL
-p2986
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2987
-sasVtype
-p2988
-Vvolume
-p2989
-sVname
-p2990
-Vcinder
-p2991
-sa(dp2992
-g2977
-(lp2993
-(dp2994
-g2980
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2995
-sg2982
-VRegionOne
-p2996
-sg2984
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2997
-sg2986
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2998
-sasg2988
-Vvolumev2
-p2999
-sg2990
-Vcinderv2
-p3000
-sasV_context_auth_token
-p3001
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p3002
-sV_context_resource_uuid
-p3003
-NsV_context_user_id
-p3004
-Vef7a4f67379f41aba489a0b6d6a62094
-p3005
-sVpayload
-p3006
-(dp3007
-Vstate_description
-p3008
-g496
-sVavailability_zone
-p3009
-Vnova
-p3010
-sVterminated_at
-p3011
-g496
-sVephemeral_gb
-p3012
-I0
-sVinstance_type_id
-p3013
-I1
-sVbandwidth
-p3014
-(dp3015
-sVdeleted_at
-p3016
-g496
-sVreservation_id
-p3017
-Vr-0hp3hep2
-p3018
-sVmemory_mb
-p3019
-I4096
-sVdisplay_name
-p3020
-Vvm_test
-p3021
-sVhostname
-p3022
-Vvm-test
-p3023
-sVstate
-p3024
-Vactive
-p3025
-sVold_state
-p3026
-Vbuilding
-p3027
-sVprogress
-p3028
-g496
-sVlaunched_at
-p3029
-V2017-12-06T18:50:30.000000
-p3030
-sVmetadata
-p3031
-(dp3032
-sVnode
-p3033
-Vmachine-B
-p3034
-sVramdisk_id
-p3035
-g496
-sVaccess_ip_v6
-p3036
-NsVdisk_gb
-p3037
-I40
-sVaccess_ip_v4
-p3038
-NsVkernel_id
-p3039
-g496
-sVhost
-p3040
-Vmachine-B
-p3041
-sVuser_id
-p3042
-Vef7a4f67379f41aba489a0b6d6a62094
-p3043
-sVimage_ref_url
-p3044
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3045
-sVcell_name
-p3046
-g496
-sVaudit_period_beginning
-p3047
-V2017-12-01T00:00:00.000000
-p3048
-sVroot_gb
-p3049
-I40
-sVtenant_id
-p3050
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3051
-sVcreated_at
-p3052
-V2017-12-06T18:50:19.000000
-p3053
-sVold_task_state
-p3054
-Vspawning
-p3055
-sVinstance_id
-p3056
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p3057
-sVinstance_type
-p3058
-Vm1.medium
-p3059
-sVvcpus
-p3060
-I2
-sVimage_meta
-p3061
-(dp3062
-Vmin_disk
-p3063
-V40
-p3064
-sVcontainer_format
-p3065
-Vbare
-p3066
-sVmin_ram
-p3067
-V0
-p3068
-sVdisk_format
-p3069
-Vqcow2
-p3070
-sVbase_image_ref
-p3071
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3072
-ssVarchitecture
-p3073
-NsVnew_task_state
-p3074
-NsVaudit_period_ending
-p3075
-V2017-12-06T18:50:31.057826
-p3076
-sVos_type
-p3077
-NsVinstance_flavor_id
-p3078
-V3
-p3079
-ssV_context_show_deleted
-p3080
-I00
-sVpriority
-p3081
-VINFO
-p3082
-sV_context_is_admin
-p3083
-I01
-sV_context_project_domain
-p3084
-NsV_context_timestamp
-p3085
-V2017-12-06T18:50:19.128490
-p3086
-sVpublisher_id
-p3087
-Vcompute.machine-B
-p3088
-sVmessage_id
-p3089
-V86a6c6b8-3110-4261-a72e-96b6cedb1219
-p3090
-sV_context_remote_address
-p3091
-V172.16.0.5
-p3092
-sV_context_roles
-p3093
-(lp3094
-Vadmin
-p3095
-asVtimestamp
-p3096
-V2017-12-06 18:50:31.063328
-p3097
-sV_context_user
-p3098
-Vef7a4f67379f41aba489a0b6d6a62094
-p3099
-sV_unique_id
-p3100
-V2d1a3c48aa3f40058702acc81fc8ed77
-p3101
-sV_context_project_name
-p3102
-Vapexlake
-p3103
-sV_context_read_deleted
-p3104
-Vno
-p3105
-sV_context_user_identity
-p3106
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3107
-sV_context_tenant
-p3108
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3109
-sV_context_instance_lock_checked
-p3110
-I00
-sV_context_project_id
-p3111
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3112
-sV_context_read_only
-p3113
-I00
-sV_context_user_domain
-p3114
-NsV_context_user_name
-p3115
-Violie
-p3116
-stp3117
-a(F0.02033519744873047
-Vcompute.instance.create.end
-p3118
-(dp3119
-V_context_domain
-p3120
-NsV_context_request_id
-p3121
-Vreq-48069276-7d98-4d71-ad68-4c8dcb926e17
-p3122
-sV_context_quota_class
-p3123
-NsVevent_type
-p3124
-g3118
-sV_context_service_catalog
-p3125
-(lp3126
-(dp3127
-Vendpoints
-p3128
-(lp3129
-(dp3130
-VadminURL
-p3131
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3132
-sVregion
-p3133
-VRegionOne
-p3134
-sVinternalURL
-p3135
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3136
-sVpublicURL
-p3137
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3138
-sasVtype
-p3139
-Vvolume
-p3140
-sVname
-p3141
-Vcinder
-p3142
-sa(dp3143
-g3128
-(lp3144
-(dp3145
-g3131
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3146
-sg3133
-VRegionOne
-p3147
-sg3135
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3148
-sg3137
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3149
-sasg3139
-Vvolumev2
-p3150
-sg3141
-Vcinderv2
-p3151
-sasV_context_auth_token
-p3152
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p3153
-sV_context_resource_uuid
-p3154
-NsV_context_user_id
-p3155
-Vef7a4f67379f41aba489a0b6d6a62094
-p3156
-sVpayload
-p3157
-(dp3158
-Vstate_description
-p3159
-g496
-sVavailability_zone
-p3160
-Vnova
-p3161
-sVterminated_at
-p3162
-g496
-sVephemeral_gb
-p3163
-I0
-sVinstance_type_id
-p3164
-I1
-sVmessage
-p3165
-VSuccess
-p3166
-sVdeleted_at
-p3167
-g496
-sVreservation_id
-p3168
-Vr-0hp3hep2
-p3169
-sVmemory_mb
-p3170
-I4096
-sVdisplay_name
-p3171
-Vvm_test
-p3172
-sVfixed_ips
-p3173
-(lp3174
-(dp3175
-Vversion
-p3176
-I4
-sVvif_mac
-p3177
-Vfa:16:3e:a0:d1:cf
-p3178
-sVfloating_ips
-p3179
-(lp3180
-(dp3181
-Vmeta
-p3182
-(dp3183
-sg3139
-Vfloating
-p3184
-sg3176
-I4
-sVaddress
-p3185
-V10.2.32.202
-p3186
-sasVlabel
-p3187
-Vinternal
-p3188
-sg3182
-(dp3189
-sg3185
-V172.16.9.157
-p3190
-sg3139
-Vfixed
-p3191
-sasVhostname
-p3192
-Vvm-test
-p3193
-sVstate
-p3194
-Vactive
-p3195
-sVprogress
-p3196
-g496
-sVlaunched_at
-p3197
-V2017-12-06T18:50:30.870268
-p3198
-sVmetadata
-p3199
-(dp3200
-sVnode
-p3201
-Vmachine-B
-p3202
-sVramdisk_id
-p3203
-g496
-sVaccess_ip_v6
-p3204
-NsVdisk_gb
-p3205
-I40
-sVaccess_ip_v4
-p3206
-NsVkernel_id
-p3207
-g496
-sVhost
-p3208
-Vmachine-B
-p3209
-sVuser_id
-p3210
-Vef7a4f67379f41aba489a0b6d6a62094
-p3211
-sVimage_ref_url
-p3212
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3213
-sVcell_name
-p3214
-g496
-sVroot_gb
-p3215
-I40
-sVtenant_id
-p3216
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3217
-sVcreated_at
-p3218
-V2017-12-06T18:50:19.000000
-p3219
-sVinstance_id
-p3220
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p3221
-sVinstance_type
-p3222
-Vm1.medium
-p3223
-sVvcpus
-p3224
-I2
-sVimage_meta
-p3225
-(dp3226
-Vmin_disk
-p3227
-V40
-p3228
-sVcontainer_format
-p3229
-Vbare
-p3230
-sVmin_ram
-p3231
-V0
-p3232
-sVdisk_format
-p3233
-Vqcow2
-p3234
-sVbase_image_ref
-p3235
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3236
-ssVarchitecture
-p3237
-NsVos_type
-p3238
-NsVinstance_flavor_id
-p3239
-V3
-p3240
-ssV_context_show_deleted
-p3241
-I00
-sVpriority
-p3242
-VINFO
-p3243
-sV_context_is_admin
-p3244
-I01
-sV_context_project_domain
-p3245
-NsV_context_timestamp
-p3246
-V2017-12-06T18:50:19.128490
-p3247
-sVpublisher_id
-p3248
-Vcompute.machine-B
-p3249
-sVmessage_id
-p3250
-V2592f273-3515-4e7f-a868-0ebd1e69a03b
-p3251
-sV_context_remote_address
-p3252
-V172.16.0.5
-p3253
-sV_context_roles
-p3254
-(lp3255
-Vadmin
-p3256
-asVtimestamp
-p3257
-V2017-12-06 18:50:31.084527
-p3258
-sV_context_user
-p3259
-Vef7a4f67379f41aba489a0b6d6a62094
-p3260
-sV_unique_id
-p3261
-V28b26be0cc6a4281a4a7aec3a9921a3b
-p3262
-sV_context_project_name
-p3263
-Vapexlake
-p3264
-sV_context_read_deleted
-p3265
-Vno
-p3266
-sV_context_user_identity
-p3267
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3268
-sV_context_tenant
-p3269
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3270
-sV_context_instance_lock_checked
-p3271
-I00
-sV_context_project_id
-p3272
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3273
-sV_context_read_only
-p3274
-I00
-sV_context_user_domain
-p3275
-NsV_context_user_name
-p3276
-Violie
-p3277
-stp3278
-a(F1.6672308921813965
-Vvolume.attach.start
-p3279
-(dp3280
-V_context_domain
-p3281
-NsV_context_request_id
-p3282
-Vreq-5bb9b9d2-6cec-4adc-a91b-349d6296a5d6
-p3283
-sV_context_quota_class
-p3284
-NsVevent_type
-p3285
-g3279
-sV_context_service_catalog
-p3286
-(lp3287
-(dp3288
-Vendpoints
-p3289
-(lp3290
-(dp3291
-VadminURL
-p3292
-Vhttp://172.16.0.5:35357/v2.0
-p3293
-sVregion
-p3294
-VRegionOne
-p3295
-sVinternalURL
-p3296
-Vhttp://172.16.0.5:5000/v2.0
-p3297
-sVpublicURL
-p3298
-Vhttp://172.18.0.8:5000/v2.0
-p3299
-sasVtype
-p3300
-Videntity
-p3301
-sVname
-p3302
-Vkeystone
-p3303
-sa(dp3304
-g3289
-(lp3305
-(dp3306
-g3292
-Vhttp://172.16.0.5:8774/v2.1
-p3307
-sg3294
-VRegionOne
-p3308
-sg3296
-Vhttp://172.16.0.5:8774/v2.1
-p3309
-sg3298
-Vhttp://172.18.0.8:8774/v2.1
-p3310
-sasg3300
-Vcompute
-p3311
-sg3302
-Vnova
-p3312
-sa(dp3313
-g3289
-(lp3314
-(dp3315
-g3292
-Vhttp://172.16.0.5:8080/swift/v1
-p3316
-sg3294
-VRegionOne
-p3317
-sg3296
-Vhttp://172.16.0.5:8080/swift/v1
-p3318
-sg3298
-Vhttp://172.18.0.8:8080/swift/v1
-p3319
-sasg3300
-Vobject-store
-p3320
-sg3302
-Vswift
-p3321
-sasV_context_auth_token
-p3322
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p3323
-sV_context_resource_uuid
-p3324
-NsV_context_user_id
-p3325
-Vef7a4f67379f41aba489a0b6d6a62094
-p3326
-sVpayload
-p3327
-(dp3328
-Vstatus
-p3329
-Vattaching
-p3330
-sVuser_id
-p3331
-Vef7a4f67379f41aba489a0b6d6a62094
-p3332
-sVdisplay_name
-p3333
-Vgreen-volume_1-napoefd3kj54
-p3334
-sVavailability_zone
-p3335
-Vnova
-p3336
-sVtenant_id
-p3337
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3338
-sVcreated_at
-p3339
-V2017-12-06T18:50:16
-p3340
-sVvolume_attachment
-p3341
-(lp3342
-sVvolume_type
-p3343
-NsVhost
-p3344
-Vrbd:volumes@RBD-backend#RBD-backend
-p3345
-sVsnapshot_id
-p3346
-NsVreplication_status
-p3347
-Vdisabled
-p3348
-sVvolume_id
-p3349
-Vd79a82fa-a195-4086-beee-5c449c981708
-p3350
-sVreplication_extended_status
-p3351
-NsVreplication_driver_data
-p3352
-NsVsize
-p3353
-I1
-sVlaunched_at
-p3354
-V2017-12-06T18:50:16
-p3355
-sVmetadata
-p3356
-(lp3357
-ssV_context_show_deleted
-p3358
-I00
-sVpriority
-p3359
-VINFO
-p3360
-sV_context_is_admin
-p3361
-I01
-sV_context_project_domain
-p3362
-NsV_context_timestamp
-p3363
-V2017-12-06T18:50:33.582737+00:00
-p3364
-sVpublisher_id
-p3365
-Vvolume.rbd:volumes@RBD-backend
-p3366
-sVmessage_id
-p3367
-V83aba907-9366-45c0-ba48-fd0197e98564
-p3368
-sV_context_remote_address
-p3369
-V172.16.0.5
-p3370
-sV_context_roles
-p3371
-(lp3372
-Vadmin
-p3373
-asVtimestamp
-p3374
-V2017-12-06 18:50:33.953204
-p3375
-sV_context_user
-p3376
-Vef7a4f67379f41aba489a0b6d6a62094
-p3377
-sV_unique_id
-p3378
-V4111fca28d6f4653b0ec188365f7a48e
-p3379
-sV_context_project_name
-p3380
-Vapexlake
-p3381
-sV_context_read_deleted
-p3382
-Vno
-p3383
-sV_context_user_identity
-p3384
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3385
-sV_context_tenant
-p3386
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3387
-sV_context_project_id
-p3388
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3389
-sV_context_read_only
-p3390
-I00
-sV_context_user_domain
-p3391
-Nstp3392
-a(F0.2469320297241211
-Vvolume.attach.end
-p3393
-(dp3394
-V_context_domain
-p3395
-NsV_context_request_id
-p3396
-Vreq-5bb9b9d2-6cec-4adc-a91b-349d6296a5d6
-p3397
-sV_context_quota_class
-p3398
-NsVevent_type
-p3399
-g3393
-sV_context_service_catalog
-p3400
-(lp3401
-(dp3402
-Vendpoints
-p3403
-(lp3404
-(dp3405
-VadminURL
-p3406
-Vhttp://172.16.0.5:35357/v2.0
-p3407
-sVregion
-p3408
-VRegionOne
-p3409
-sVinternalURL
-p3410
-Vhttp://172.16.0.5:5000/v2.0
-p3411
-sVpublicURL
-p3412
-Vhttp://172.18.0.8:5000/v2.0
-p3413
-sasVtype
-p3414
-Videntity
-p3415
-sVname
-p3416
-Vkeystone
-p3417
-sa(dp3418
-g3403
-(lp3419
-(dp3420
-g3406
-Vhttp://172.16.0.5:8774/v2.1
-p3421
-sg3408
-VRegionOne
-p3422
-sg3410
-Vhttp://172.16.0.5:8774/v2.1
-p3423
-sg3412
-Vhttp://172.18.0.8:8774/v2.1
-p3424
-sasg3414
-Vcompute
-p3425
-sg3416
-Vnova
-p3426
-sa(dp3427
-g3403
-(lp3428
-(dp3429
-g3406
-Vhttp://172.16.0.5:8080/swift/v1
-p3430
-sg3408
-VRegionOne
-p3431
-sg3410
-Vhttp://172.16.0.5:8080/swift/v1
-p3432
-sg3412
-Vhttp://172.18.0.8:8080/swift/v1
-p3433
-sasg3414
-Vobject-store
-p3434
-sg3416
-Vswift
-p3435
-sasV_context_auth_token
-p3436
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p3437
-sV_context_resource_uuid
-p3438
-NsV_context_user_id
-p3439
-Vef7a4f67379f41aba489a0b6d6a62094
-p3440
-sVpayload
-p3441
-(dp3442
-Vstatus
-p3443
-Vin-use
-p3444
-sVuser_id
-p3445
-Vef7a4f67379f41aba489a0b6d6a62094
-p3446
-sVdisplay_name
-p3447
-Vgreen-volume_1-napoefd3kj54
-p3448
-sVavailability_zone
-p3449
-Vnova
-p3450
-sVtenant_id
-p3451
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3452
-sVcreated_at
-p3453
-V2017-12-06T18:50:16
-p3454
-sVvolume_attachment
-p3455
-(lp3456
-(dp3457
-Vinstance_uuid
-p3458
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p3459
-sVattach_time
-p3460
-V2017-12-06T18:50:34.000000
-p3461
-sVdeleted
-p3462
-I00
-sVattached_host
-p3463
-Nsg3453
-V2017-12-06T18:50:34.000000
-p3464
-sVattach_mode
-p3465
-Vrw
-p3466
-sVupdated_at
-p3467
-V2017-12-06T18:50:34.000000
-p3468
-sVattach_status
-p3469
-Vattached
-p3470
-sVdetach_time
-p3471
-NsVvolume_id
-p3472
-Vd79a82fa-a195-4086-beee-5c449c981708
-p3473
-sVmountpoint
-p3474
-V/dev/vdb
-p3475
-sVdeleted_at
-p3476
-NsVid
-p3477
-Vf80b4121-e9a1-4d19-970c-20362ab37e3d
-p3478
-sasVvolume_type
-p3479
-NsVhost
-p3480
-Vrbd:volumes@RBD-backend#RBD-backend
-p3481
-sVsnapshot_id
-p3482
-NsVreplication_status
-p3483
-Vdisabled
-p3484
-sg3472
-Vd79a82fa-a195-4086-beee-5c449c981708
-p3485
-sVreplication_extended_status
-p3486
-NsVreplication_driver_data
-p3487
-NsVsize
-p3488
-I1
-sVlaunched_at
-p3489
-V2017-12-06T18:50:16
-p3490
-sVmetadata
-p3491
-(lp3492
-ssV_context_show_deleted
-p3493
-I00
-sVpriority
-p3494
-VINFO
-p3495
-sV_context_is_admin
-p3496
-I01
-sV_context_project_domain
-p3497
-NsV_context_timestamp
-p3498
-V2017-12-06T18:50:33.582737+00:00
-p3499
-sVpublisher_id
-p3500
-Vvolume.rbd:volumes@RBD-backend
-p3501
-sVmessage_id
-p3502
-Ve75b1de4-8876-4c4e-aac5-8eb488492f77
-p3503
-sV_context_remote_address
-p3504
-V172.16.0.5
-p3505
-sV_context_roles
-p3506
-(lp3507
-Vadmin
-p3508
-asVtimestamp
-p3509
-V2017-12-06 18:50:34.201105
-p3510
-sV_context_user
-p3511
-Vef7a4f67379f41aba489a0b6d6a62094
-p3512
-sV_unique_id
-p3513
-V5e563cdc1bd54bf49715158531f40f25
-p3514
-sV_context_project_name
-p3515
-Vapexlake
-p3516
-sV_context_read_deleted
-p3517
-Vno
-p3518
-sV_context_user_identity
-p3519
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3520
-sV_context_tenant
-p3521
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3522
-sV_context_project_id
-p3523
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3524
-sV_context_read_only
-p3525
-I00
-sV_context_user_domain
-p3526
-Nstp3527
-a(F0.08257794380187988
-Vcompute.instance.volume.attach
-p3528
-(dp3529
-V_context_domain
-p3530
-NsV_context_request_id
-p3531
-Vreq-26158305-b799-48a6-9d3c-49cd95ca4a1b
-p3532
-sV_context_quota_class
-p3533
-NsVevent_type
-p3534
-g3528
-sV_context_service_catalog
-p3535
-(lp3536
-(dp3537
-Vendpoints
-p3538
-(lp3539
-(dp3540
-VadminURL
-p3541
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3542
-sVregion
-p3543
-VRegionOne
-p3544
-sVinternalURL
-p3545
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3546
-sVpublicURL
-p3547
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3548
-sasVtype
-p3549
-Vvolume
-p3550
-sVname
-p3551
-Vcinder
-p3552
-sa(dp3553
-g3538
-(lp3554
-(dp3555
-g3541
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3556
-sg3543
-VRegionOne
-p3557
-sg3545
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3558
-sg3547
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3559
-sasg3549
-Vvolumev2
-p3560
-sg3551
-Vcinderv2
-p3561
-sasV_context_auth_token
-p3562
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p3563
-sV_context_resource_uuid
-p3564
-NsV_context_user_id
-p3565
-Vef7a4f67379f41aba489a0b6d6a62094
-p3566
-sVpayload
-p3567
-(dp3568
-Vstate_description
-p3569
-g496
-sVavailability_zone
-p3570
-Vnova
-p3571
-sVterminated_at
-p3572
-g496
-sVephemeral_gb
-p3573
-I0
-sVinstance_type_id
-p3574
-I1
-sVdeleted_at
-p3575
-g496
-sVreservation_id
-p3576
-Vr-0hp3hep2
-p3577
-sVmemory_mb
-p3578
-I4096
-sVdisplay_name
-p3579
-Vvm_test
-p3580
-sVhostname
-p3581
-Vvm-test
-p3582
-sVstate
-p3583
-Vactive
-p3584
-sVprogress
-p3585
-g496
-sVlaunched_at
-p3586
-V2017-12-06T18:50:30.000000
-p3587
-sVmetadata
-p3588
-(dp3589
-sVnode
-p3590
-Vmachine-B
-p3591
-sVramdisk_id
-p3592
-g496
-sVaccess_ip_v6
-p3593
-NsVdisk_gb
-p3594
-I40
-sVaccess_ip_v4
-p3595
-NsVkernel_id
-p3596
-g496
-sVhost
-p3597
-Vmachine-B
-p3598
-sVvolume_id
-p3599
-Vd79a82fa-a195-4086-beee-5c449c981708
-p3600
-sVuser_id
-p3601
-Vef7a4f67379f41aba489a0b6d6a62094
-p3602
-sVimage_ref_url
-p3603
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3604
-sVcell_name
-p3605
-g496
-sVroot_gb
-p3606
-I40
-sVtenant_id
-p3607
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3608
-sVcreated_at
-p3609
-V2017-12-06T18:50:19.000000
-p3610
-sVinstance_id
-p3611
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p3612
-sVinstance_type
-p3613
-Vm1.medium
-p3614
-sVvcpus
-p3615
-I2
-sVimage_meta
-p3616
-(dp3617
-Vmin_disk
-p3618
-V40
-p3619
-sVcontainer_format
-p3620
-Vbare
-p3621
-sVmin_ram
-p3622
-V0
-p3623
-sVdisk_format
-p3624
-Vqcow2
-p3625
-sVbase_image_ref
-p3626
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3627
-ssVarchitecture
-p3628
-NsVos_type
-p3629
-NsVinstance_flavor_id
-p3630
-V3
-p3631
-ssV_context_show_deleted
-p3632
-I00
-sVpriority
-p3633
-VINFO
-p3634
-sV_context_is_admin
-p3635
-I01
-sV_context_project_domain
-p3636
-NsV_context_timestamp
-p3637
-V2017-12-06T18:50:32.490760
-p3638
-sVpublisher_id
-p3639
-Vcompute.machine-B
-p3640
-sVmessage_id
-p3641
-V7696d7b9-4ac2-44b6-837a-0c0e2fb3bdb3
-p3642
-sV_context_remote_address
-p3643
-V172.16.0.5
-p3644
-sV_context_roles
-p3645
-(lp3646
-Vadmin
-p3647
-asVtimestamp
-p3648
-V2017-12-06 18:50:34.280805
-p3649
-sV_context_user
-p3650
-Vef7a4f67379f41aba489a0b6d6a62094
-p3651
-sV_unique_id
-p3652
-V9b1dc9463f57428ab33b4705b354f177
-p3653
-sV_context_project_name
-p3654
-Vapexlake
-p3655
-sV_context_read_deleted
-p3656
-Vno
-p3657
-sV_context_user_identity
-p3658
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3659
-sV_context_tenant
-p3660
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3661
-sV_context_instance_lock_checked
-p3662
-I00
-sV_context_project_id
-p3663
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3664
-sV_context_read_only
-p3665
-I00
-sV_context_user_domain
-p3666
-NsV_context_user_name
-p3667
-Violie
-p3668
-stp3669
-a(F0.8166580200195312
-Vorchestration.stack.create.end
-p3670
-(dp3671
-V_context_request_id
-p3672
-Vreq-3a4766e0-22c1-48a8-879a-c888430ad12c
-p3673
-sVevent_type
-p3674
-g3670
-sV_context_region_name
-p3675
-NsV_context_auth_token
-p3676
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p3677
-sV_context_user_id
-p3678
-Vef7a4f67379f41aba489a0b6d6a62094
-p3679
-sVpayload
-p3680
-(dp3681
-Vusername
-p3682
-NsVstate_reason
-p3683
-VStack CREATE completed successfully
-p3684
-sVuser_id
-p3685
-NsVuser_identity
-p3686
-Vef7a4f67379f41aba489a0b6d6a62094
-p3687
-sVstack_name
-p3688
-Vgreen
-p3689
-sVtenant_id
-p3690
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3691
-sVstack_identity
-p3692
-V7ab82262-5bd0-4047-89b9-9c9ca4ee979b
-p3693
-sVcreate_at
-p3694
-V2017-12-06T18:50:15.391551
-p3695
-sVstate
-p3696
-VCREATE_COMPLETE
-p3697
-ssV_context_username
-p3698
-NsV_context_show_deleted
-p3699
-I00
-sV_context_trust_id
-p3700
-NsVpriority
-p3701
-VINFO
-p3702
-sV_context_is_admin
-p3703
-I01
-sV_context_auth_token_info
-p3704
-(dp3705
-Vtoken
-p3706
-(dp3707
-Vmethods
-p3708
-(lp3709
-Vpassword
-p3710
-asVroles
-p3711
-(lp3712
-(dp3713
-Vid
-p3714
-Vd475171bf8304e06a74b1add560b1f28
-p3715
-sVname
-p3716
-Vadmin
-p3717
-sasVauth_token
-p3718
-VgAAAAABaKDvmB2NrDTH59yMg8CgCCXNlxek_ZGohk7zJBs1rVdQwYV4F9uwbTiR8natPmp1J-m3pUEP7ggSSoqhMKMv1w6whtO5GrpNL7jCOEC6lxxz4x0F694J4mQxB4LPSAbbEGJEku56uti1FCqascd4_EBfG3hSINTVfkq8Rlq18Pg44cUs
-p3719
-sVexpires_at
-p3720
-V2017-12-06T19:50:14.000000Z
-p3721
-sVproject
-p3722
-(dp3723
-Vdomain
-p3724
-(dp3725
-g3714
-Vdefault
-p3726
-sg3716
-VDefault
-p3727
-ssg3714
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3728
-sg3716
-Vapexlake
-p3729
-ssVcatalog
-p3730
-(lp3731
-(dp3732
-Vendpoints
-p3733
-(lp3734
-(dp3735
-Vurl
-p3736
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p3737
-sVinterface
-p3738
-Vpublic
-p3739
-sVregion
-p3740
-VRegionOne
-p3741
-sVregion_id
-p3742
-VRegionOne
-p3743
-sg3714
-V13359d68397c4732b5d455941ac95989
-p3744
-sa(dp3745
-g3736
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p3746
-sg3738
-Vinternal
-p3747
-sg3740
-VRegionOne
-p3748
-sg3742
-VRegionOne
-p3749
-sg3714
-V50aeae6c5d034dcb80871bdac7391209
-p3750
-sa(dp3751
-g3736
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p3752
-sg3738
-Vadmin
-p3753
-sg3740
-VRegionOne
-p3754
-sg3742
-VRegionOne
-p3755
-sg3714
-V93b06f780b224cbd9b514c2041d3db63
-p3756
-sasVtype
-p3757
-Vvolumev3
-p3758
-sg3714
-V00a63293a3154089a4c80b60b4aa9429
-p3759
-sg3716
-Vcinderv3
-p3760
-sa(dp3761
-g3733
-(lp3762
-(dp3763
-g3736
-Vhttp://172.16.0.5:8000/v1
-p3764
-sg3738
-Vadmin
-p3765
-sg3740
-VRegionOne
-p3766
-sg3742
-VRegionOne
-p3767
-sg3714
-V24acffb5d9154df4981db7424b7669bd
-p3768
-sa(dp3769
-g3736
-Vhttp://172.18.0.8:8000/v1
-p3770
-sg3738
-Vpublic
-p3771
-sg3740
-VRegionOne
-p3772
-sg3742
-VRegionOne
-p3773
-sg3714
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p3774
-sa(dp3775
-g3736
-Vhttp://172.16.0.5:8000/v1
-p3776
-sg3738
-Vinternal
-p3777
-sg3740
-VRegionOne
-p3778
-sg3742
-VRegionOne
-p3779
-sg3714
-V679262173a714d76a078051b95f8c969
-p3780
-sasg3757
-Vcloudformation
-p3781
-sg3714
-V245169ccae564a7db06ca002f1553b51
-p3782
-sg3716
-Vheat-cfn
-p3783
-sa(dp3784
-g3733
-(lp3785
-(dp3786
-g3736
-Vhttp://172.18.0.8:8080
-p3787
-sg3738
-Vpublic
-p3788
-sg3740
-VRegionOne
-p3789
-sg3742
-VRegionOne
-p3790
-sg3714
-V04a6ef3db6b046b1893ed45a3f906f6c
-p3791
-sa(dp3792
-g3736
-Vhttp://172.16.0.5:8080
-p3793
-sg3738
-Vinternal
-p3794
-sg3740
-VRegionOne
-p3795
-sg3742
-VRegionOne
-p3796
-sg3714
-V3e30684c9f74492b8ca9a64dd04261e6
-p3797
-sa(dp3798
-g3736
-Vhttp://172.16.0.5:8080
-p3799
-sg3738
-Vadmin
-p3800
-sg3740
-VRegionOne
-p3801
-sg3742
-VRegionOne
-p3802
-sg3714
-Vc5384b55cd7a441582f151c6b2807745
-p3803
-sasg3757
-Vs3
-p3804
-sg3714
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p3805
-sg3716
-Vswift_s3
-p3806
-sa(dp3807
-g3733
-(lp3808
-(dp3809
-g3736
-Vhttp://172.16.0.5:9696
-p3810
-sg3738
-Vadmin
-p3811
-sg3740
-VRegionOne
-p3812
-sg3742
-VRegionOne
-p3813
-sg3714
-V38b78b2c00264f59a4ade9392f88132b
-p3814
-sa(dp3815
-g3736
-Vhttp://172.18.0.8:9696
-p3816
-sg3738
-Vpublic
-p3817
-sg3740
-VRegionOne
-p3818
-sg3742
-VRegionOne
-p3819
-sg3714
-Vb5d0f72fbf674f84adf8929341e45586
-p3820
-sa(dp3821
-g3736
-Vhttp://172.16.0.5:9696
-p3822
-sg3738
-Vinternal
-p3823
-sg3740
-VRegionOne
-p3824
-sg3742
-VRegionOne
-p3825
-sg3714
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p3826
-sasg3757
-Vnetwork
-p3827
-sg3714
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p3828
-sg3716
-Vneutron
-p3829
-sa(dp3830
-g3733
-(lp3831
-(dp3832
-g3736
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3833
-sg3738
-Vinternal
-p3834
-sg3740
-VRegionOne
-p3835
-sg3742
-VRegionOne
-p3836
-sg3714
-V7c60744a22724044a92928bc2fa9e422
-p3837
-sa(dp3838
-g3736
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3839
-sg3738
-Vadmin
-p3840
-sg3740
-VRegionOne
-p3841
-sg3742
-VRegionOne
-p3842
-sg3714
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p3843
-sa(dp3844
-g3736
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3845
-sg3738
-Vpublic
-p3846
-sg3740
-VRegionOne
-p3847
-sg3742
-VRegionOne
-p3848
-sg3714
-Vde47d994bdc147bdb824474ea699a77a
-p3849
-sasg3757
-Vorchestration
-p3850
-sg3714
-V65a72244f7c54382aeebf5dfdeab8140
-p3851
-sg3716
-Vheat
-p3852
-sa(dp3853
-g3733
-(lp3854
-(dp3855
-g3736
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3856
-sg3738
-Vinternal
-p3857
-sg3740
-VRegionOne
-p3858
-sg3742
-VRegionOne
-p3859
-sg3714
-V3a25e85ecaa44b678c3721c2d3d39b38
-p3860
-sa(dp3861
-g3736
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3862
-sg3738
-Vadmin
-p3863
-sg3740
-VRegionOne
-p3864
-sg3742
-VRegionOne
-p3865
-sg3714
-V68c763474c3d4aa28c4ee0e0249998eb
-p3866
-sa(dp3867
-g3736
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3868
-sg3738
-Vpublic
-p3869
-sg3740
-VRegionOne
-p3870
-sg3742
-VRegionOne
-p3871
-sg3714
-Ve0c861373e94468db521d5a8793d33d1
-p3872
-sasg3757
-Vvolume
-p3873
-sg3714
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p3874
-sg3716
-Vcinder
-p3875
-sa(dp3876
-g3733
-(lp3877
-(dp3878
-g3736
-Vhttp://172.18.0.8:5000/v2.0
-p3879
-sg3738
-Vpublic
-p3880
-sg3740
-VRegionOne
-p3881
-sg3742
-VRegionOne
-p3882
-sg3714
-V6aa35bc15a35447db58ec5b67087f96a
-p3883
-sa(dp3884
-g3736
-Vhttp://172.16.0.5:5000/v2.0
-p3885
-sg3738
-Vinternal
-p3886
-sg3740
-VRegionOne
-p3887
-sg3742
-VRegionOne
-p3888
-sg3714
-V6b4742f26b694b93bdbcb37304d22f69
-p3889
-sa(dp3890
-g3736
-Vhttp://172.16.0.5:35357/v2.0
-p3891
-sg3738
-Vadmin
-p3892
-sg3740
-VRegionOne
-p3893
-sg3742
-VRegionOne
-p3894
-sg3714
-Vadc120ea606644a299a3c91a7ceeb8c4
-p3895
-sasg3757
-Videntity
-p3896
-sg3714
-V9f95de9f4efc4730b4dd90354894e1dc
-p3897
-sg3716
-Vkeystone
-p3898
-sa(dp3899
-g3733
-(lp3900
-(dp3901
-g3736
-Vhttp://172.16.0.5:9292
-p3902
-sg3738
-Vadmin
-p3903
-sg3740
-VRegionOne
-p3904
-sg3742
-VRegionOne
-p3905
-sg3714
-V049519f829be4e7fb5f44ae9f470efdf
-p3906
-sa(dp3907
-g3736
-Vhttp://172.18.0.8:9292
-p3908
-sg3738
-Vpublic
-p3909
-sg3740
-VRegionOne
-p3910
-sg3742
-VRegionOne
-p3911
-sg3714
-V1baebbbf35744192b335f4f293d1a9d8
-p3912
-sa(dp3913
-g3736
-Vhttp://172.16.0.5:9292
-p3914
-sg3738
-Vinternal
-p3915
-sg3740
-VRegionOne
-p3916
-sg3742
-VRegionOne
-p3917
-sg3714
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p3918
-sasg3757
-Vimage
-p3919
-sg3714
-Va39ec0213acc45ceb59346299e78d6c0
-p3920
-sg3716
-Vglance
-p3921
-sa(dp3922
-g3733
-(lp3923
-(dp3924
-g3736
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3925
-sg3738
-Vinternal
-p3926
-sg3740
-VRegionOne
-p3927
-sg3742
-VRegionOne
-p3928
-sg3714
-V2cd9d66e95484830a9006177e301aa57
-p3929
-sa(dp3930
-g3736
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3931
-sg3738
-Vpublic
-p3932
-sg3740
-VRegionOne
-p3933
-sg3742
-VRegionOne
-p3934
-sg3714
-Vbe2d979150a2401b9e7d5c365372d093
-p3935
-sa(dp3936
-g3736
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3937
-sg3738
-Vadmin
-p3938
-sg3740
-VRegionOne
-p3939
-sg3742
-VRegionOne
-p3940
-sg3714
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p3941
-sasg3757
-Vcompute_legacy
-p3942
-sg3714
-Va4dd95e3fde340468f8c1d7df9a853d0
-p3943
-sg3716
-Vcompute_legacy
-p3944
-sa(dp3945
-g3733
-(lp3946
-(dp3947
-g3736
-Vhttp://172.16.0.5:8774/v2.1
-p3948
-sg3738
-Vadmin
-p3949
-sg3740
-VRegionOne
-p3950
-sg3742
-VRegionOne
-p3951
-sg3714
-V0307d2c32dd54839aa5bc39746eeb186
-p3952
-sa(dp3953
-g3736
-Vhttp://172.18.0.8:8774/v2.1
-p3954
-sg3738
-Vpublic
-p3955
-sg3740
-VRegionOne
-p3956
-sg3742
-VRegionOne
-p3957
-sg3714
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p3958
-sa(dp3959
-g3736
-Vhttp://172.16.0.5:8774/v2.1
-p3960
-sg3738
-Vinternal
-p3961
-sg3740
-VRegionOne
-p3962
-sg3742
-VRegionOne
-p3963
-sg3714
-Vdb005ab592334fc599c142cf861e754f
-p3964
-sasg3757
-Vcompute
-p3965
-sg3714
-Vc165d40b8c3849bcb6067a3df2540c62
-p3966
-sg3716
-Vnova
-p3967
-sa(dp3968
-g3733
-(lp3969
-(dp3970
-g3736
-Vhttp://172.16.0.5:8080/swift/v1
-p3971
-sg3738
-Vadmin
-p3972
-sg3740
-VRegionOne
-p3973
-sg3742
-VRegionOne
-p3974
-sg3714
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p3975
-sa(dp3976
-g3736
-Vhttp://172.16.0.5:8080/swift/v1
-p3977
-sg3738
-Vinternal
-p3978
-sg3740
-VRegionOne
-p3979
-sg3742
-VRegionOne
-p3980
-sg3714
-V764118d3a33444ac980632d281acf4a7
-p3981
-sa(dp3982
-g3736
-Vhttp://172.18.0.8:8080/swift/v1
-p3983
-sg3738
-Vpublic
-p3984
-sg3740
-VRegionOne
-p3985
-sg3742
-VRegionOne
-p3986
-sg3714
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p3987
-sasg3757
-Vobject-store
-p3988
-sg3714
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p3989
-sg3716
-Vswift
-p3990
-sa(dp3991
-g3733
-(lp3992
-(dp3993
-g3736
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3994
-sg3738
-Vinternal
-p3995
-sg3740
-VRegionOne
-p3996
-sg3742
-VRegionOne
-p3997
-sg3714
-V61ea745c91ab4eb59464679931219024
-p3998
-sa(dp3999
-g3736
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4000
-sg3738
-Vadmin
-p4001
-sg3740
-VRegionOne
-p4002
-sg3742
-VRegionOne
-p4003
-sg3714
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p4004
-sa(dp4005
-g3736
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4006
-sg3738
-Vpublic
-p4007
-sg3740
-VRegionOne
-p4008
-sg3742
-VRegionOne
-p4009
-sg3714
-V7155772851884dc6954c7345d350796f
-p4010
-sasg3757
-Vvolumev2
-p4011
-sg3714
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p4012
-sg3716
-Vcinderv2
-p4013
-sa(dp4014
-g3733
-(lp4015
-(dp4016
-g3736
-Vhttp://172.18.0.8:9494
-p4017
-sg3738
-Vpublic
-p4018
-sg3740
-VRegionOne
-p4019
-sg3742
-VRegionOne
-p4020
-sg3714
-V43a202e889694d51a3b11899c252a8a9
-p4021
-sa(dp4022
-g3736
-Vhttp://172.16.0.5:9494
-p4023
-sg3738
-Vadmin
-p4024
-sg3740
-VRegionOne
-p4025
-sg3742
-VRegionOne
-p4026
-sg3714
-Vfa3c9de06e854542b236aa24b53e19a1
-p4027
-sa(dp4028
-g3736
-Vhttp://172.16.0.5:9494
-p4029
-sg3738
-Vinternal
-p4030
-sg3740
-VRegionOne
-p4031
-sg3742
-VRegionOne
-p4032
-sg3714
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p4033
-sasg3757
-Vartifact
-p4034
-sg3714
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p4035
-sg3716
-Vglare
-p4036
-sasVversion
-p4037
-Vv3
-p4038
-sVuser
-p4039
-(dp4040
-g3724
-(dp4041
-g3714
-Vdefault
-p4042
-sg3716
-VDefault
-p4043
-ssg3714
-Vef7a4f67379f41aba489a0b6d6a62094
-p4044
-sg3716
-Violie
-p4045
-ssVaudit_ids
-p4046
-(lp4047
-V9X2jQhi7QGau8urW62_TeA
-p4048
-asVissued_at
-p4049
-V2017-12-06T18:50:14.000000Z
-p4050
-sssV_context_user
-p4051
-NsVpublisher_id
-p4052
-Vorchestration.machine-B
-p4053
-sVmessage_id
-p4054
-Vd272d940-1dff-4640-962f-47155a886ccb
-p4055
-sV_context_roles
-p4056
-(lp4057
-Vadmin
-p4058
-asV_context_auth_url
-p4059
-Vhttp://172.16.0.5:35357/v3/
-p4060
-sVtimestamp
-p4061
-V2017-12-06 18:50:35.098609
-p4062
-sV_unique_id
-p4063
-Ve056e00ef2fc4e64a2fb42dfc6df18cb
-p4064
-sV_context_tenant_id
-p4065
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4066
-sV_context_user_domain_id
-p4067
-Vdefault
-p4068
-sV_context_password
-p4069
-NsV_context_trustor_user_id
-p4070
-NsV_context_project_domain_id
-p4071
-Vdefault
-p4072
-sV_context_aws_creds
-p4073
-NsV_context_tenant
-p4074
-Vapexlake
-p4075
-sV_context_user_identity
-p4076
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p4077
-stp4078
-a.
\ No newline at end of file
@@ -1,23087 +0,0 @@
-(lp1
-(F0.00018310546875
-Vorchestration.stack.create.start
-p2
-(dp3
-V_context_request_id
-p4
-Vreq-1988713e-2198-4488-970f-379f0634b9ac
-p5
-sVevent_type
-p6
-g2
-sV_context_region_name
-p7
-NsV_context_auth_token
-p8
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p9
-sV_context_user_id
-p10
-Vef7a4f67379f41aba489a0b6d6a62094
-p11
-sVpayload
-p12
-(dp13
-Vusername
-p14
-NsVstate_reason
-p15
-VStack CREATE started
-p16
-sVuser_id
-p17
-NsVuser_identity
-p18
-Vef7a4f67379f41aba489a0b6d6a62094
-p19
-sVstack_name
-p20
-VA
-sVtenant_id
-p21
-V187e5e95e7eb499d8a421b3d4ed966d5
-p22
-sVstack_identity
-p23
-V84a34c44-0667-45d8-a9a0-15f98f6af026
-p24
-sVcreate_at
-p25
-V2017-11-30T11:03:51.641706
-p26
-sVstate
-p27
-VCREATE_IN_PROGRESS
-p28
-ssV_context_username
-p29
-NsV_context_show_deleted
-p30
-I00
-sV_context_trust_id
-p31
-NsVpriority
-p32
-VINFO
-p33
-sV_context_is_admin
-p34
-I01
-sV_context_auth_token_info
-p35
-(dp36
-Vtoken
-p37
-(dp38
-Vmethods
-p39
-(lp40
-Vpassword
-p41
-asVroles
-p42
-(lp43
-(dp44
-Vid
-p45
-Vd475171bf8304e06a74b1add560b1f28
-p46
-sVname
-p47
-Vadmin
-p48
-sasVauth_token
-p49
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p50
-sVexpires_at
-p51
-V2017-11-30T12:03:51.000000Z
-p52
-sVproject
-p53
-(dp54
-Vdomain
-p55
-(dp56
-g45
-Vdefault
-p57
-sg47
-VDefault
-p58
-ssg45
-V187e5e95e7eb499d8a421b3d4ed966d5
-p59
-sg47
-Vapexlake
-p60
-ssVcatalog
-p61
-(lp62
-(dp63
-Vendpoints
-p64
-(lp65
-(dp66
-Vurl
-p67
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p68
-sVinterface
-p69
-Vpublic
-p70
-sVregion
-p71
-VRegionOne
-p72
-sVregion_id
-p73
-VRegionOne
-p74
-sg45
-V13359d68397c4732b5d455941ac95989
-p75
-sa(dp76
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p77
-sg69
-Vinternal
-p78
-sg71
-VRegionOne
-p79
-sg73
-VRegionOne
-p80
-sg45
-V50aeae6c5d034dcb80871bdac7391209
-p81
-sa(dp82
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p83
-sg69
-Vadmin
-p84
-sg71
-VRegionOne
-p85
-sg73
-VRegionOne
-p86
-sg45
-V93b06f780b224cbd9b514c2041d3db63
-p87
-sasVtype
-p88
-Vvolumev3
-p89
-sg45
-V00a63293a3154089a4c80b60b4aa9429
-p90
-sg47
-Vcinderv3
-p91
-sa(dp92
-g64
-(lp93
-(dp94
-g67
-Vhttp://172.16.0.5:8000/v1
-p95
-sg69
-Vadmin
-p96
-sg71
-VRegionOne
-p97
-sg73
-VRegionOne
-p98
-sg45
-V24acffb5d9154df4981db7424b7669bd
-p99
-sa(dp100
-g67
-Vhttp://172.18.0.8:8000/v1
-p101
-sg69
-Vpublic
-p102
-sg71
-VRegionOne
-p103
-sg73
-VRegionOne
-p104
-sg45
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p105
-sa(dp106
-g67
-Vhttp://172.16.0.5:8000/v1
-p107
-sg69
-Vinternal
-p108
-sg71
-VRegionOne
-p109
-sg73
-VRegionOne
-p110
-sg45
-V679262173a714d76a078051b95f8c969
-p111
-sasg88
-Vcloudformation
-p112
-sg45
-V245169ccae564a7db06ca002f1553b51
-p113
-sg47
-Vheat-cfn
-p114
-sa(dp115
-g64
-(lp116
-(dp117
-g67
-Vhttp://172.18.0.8:8080
-p118
-sg69
-Vpublic
-p119
-sg71
-VRegionOne
-p120
-sg73
-VRegionOne
-p121
-sg45
-V04a6ef3db6b046b1893ed45a3f906f6c
-p122
-sa(dp123
-g67
-Vhttp://172.16.0.5:8080
-p124
-sg69
-Vinternal
-p125
-sg71
-VRegionOne
-p126
-sg73
-VRegionOne
-p127
-sg45
-V3e30684c9f74492b8ca9a64dd04261e6
-p128
-sa(dp129
-g67
-Vhttp://172.16.0.5:8080
-p130
-sg69
-Vadmin
-p131
-sg71
-VRegionOne
-p132
-sg73
-VRegionOne
-p133
-sg45
-Vc5384b55cd7a441582f151c6b2807745
-p134
-sasg88
-Vs3
-p135
-sg45
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p136
-sg47
-Vswift_s3
-p137
-sa(dp138
-g64
-(lp139
-(dp140
-g67
-Vhttp://172.16.0.5:9696
-p141
-sg69
-Vadmin
-p142
-sg71
-VRegionOne
-p143
-sg73
-VRegionOne
-p144
-sg45
-V38b78b2c00264f59a4ade9392f88132b
-p145
-sa(dp146
-g67
-Vhttp://172.18.0.8:9696
-p147
-sg69
-Vpublic
-p148
-sg71
-VRegionOne
-p149
-sg73
-VRegionOne
-p150
-sg45
-Vb5d0f72fbf674f84adf8929341e45586
-p151
-sa(dp152
-g67
-Vhttp://172.16.0.5:9696
-p153
-sg69
-Vinternal
-p154
-sg71
-VRegionOne
-p155
-sg73
-VRegionOne
-p156
-sg45
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p157
-sasg88
-Vnetwork
-p158
-sg45
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p159
-sg47
-Vneutron
-p160
-sa(dp161
-g64
-(lp162
-(dp163
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p164
-sg69
-Vinternal
-p165
-sg71
-VRegionOne
-p166
-sg73
-VRegionOne
-p167
-sg45
-V7c60744a22724044a92928bc2fa9e422
-p168
-sa(dp169
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p170
-sg69
-Vadmin
-p171
-sg71
-VRegionOne
-p172
-sg73
-VRegionOne
-p173
-sg45
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p174
-sa(dp175
-g67
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p176
-sg69
-Vpublic
-p177
-sg71
-VRegionOne
-p178
-sg73
-VRegionOne
-p179
-sg45
-Vde47d994bdc147bdb824474ea699a77a
-p180
-sasg88
-Vorchestration
-p181
-sg45
-V65a72244f7c54382aeebf5dfdeab8140
-p182
-sg47
-Vheat
-p183
-sa(dp184
-g64
-(lp185
-(dp186
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p187
-sg69
-Vinternal
-p188
-sg71
-VRegionOne
-p189
-sg73
-VRegionOne
-p190
-sg45
-V3a25e85ecaa44b678c3721c2d3d39b38
-p191
-sa(dp192
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p193
-sg69
-Vadmin
-p194
-sg71
-VRegionOne
-p195
-sg73
-VRegionOne
-p196
-sg45
-V68c763474c3d4aa28c4ee0e0249998eb
-p197
-sa(dp198
-g67
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p199
-sg69
-Vpublic
-p200
-sg71
-VRegionOne
-p201
-sg73
-VRegionOne
-p202
-sg45
-Ve0c861373e94468db521d5a8793d33d1
-p203
-sasg88
-Vvolume
-p204
-sg45
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p205
-sg47
-Vcinder
-p206
-sa(dp207
-g64
-(lp208
-(dp209
-g67
-Vhttp://172.18.0.8:5000/v2.0
-p210
-sg69
-Vpublic
-p211
-sg71
-VRegionOne
-p212
-sg73
-VRegionOne
-p213
-sg45
-V6aa35bc15a35447db58ec5b67087f96a
-p214
-sa(dp215
-g67
-Vhttp://172.16.0.5:5000/v2.0
-p216
-sg69
-Vinternal
-p217
-sg71
-VRegionOne
-p218
-sg73
-VRegionOne
-p219
-sg45
-V6b4742f26b694b93bdbcb37304d22f69
-p220
-sa(dp221
-g67
-Vhttp://172.16.0.5:35357/v2.0
-p222
-sg69
-Vadmin
-p223
-sg71
-VRegionOne
-p224
-sg73
-VRegionOne
-p225
-sg45
-Vadc120ea606644a299a3c91a7ceeb8c4
-p226
-sasg88
-Videntity
-p227
-sg45
-V9f95de9f4efc4730b4dd90354894e1dc
-p228
-sg47
-Vkeystone
-p229
-sa(dp230
-g64
-(lp231
-(dp232
-g67
-Vhttp://172.16.0.5:9292
-p233
-sg69
-Vadmin
-p234
-sg71
-VRegionOne
-p235
-sg73
-VRegionOne
-p236
-sg45
-V049519f829be4e7fb5f44ae9f470efdf
-p237
-sa(dp238
-g67
-Vhttp://172.18.0.8:9292
-p239
-sg69
-Vpublic
-p240
-sg71
-VRegionOne
-p241
-sg73
-VRegionOne
-p242
-sg45
-V1baebbbf35744192b335f4f293d1a9d8
-p243
-sa(dp244
-g67
-Vhttp://172.16.0.5:9292
-p245
-sg69
-Vinternal
-p246
-sg71
-VRegionOne
-p247
-sg73
-VRegionOne
-p248
-sg45
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p249
-sasg88
-Vimage
-p250
-sg45
-Va39ec0213acc45ceb59346299e78d6c0
-p251
-sg47
-Vglance
-p252
-sa(dp253
-g64
-(lp254
-(dp255
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p256
-sg69
-Vinternal
-p257
-sg71
-VRegionOne
-p258
-sg73
-VRegionOne
-p259
-sg45
-V2cd9d66e95484830a9006177e301aa57
-p260
-sa(dp261
-g67
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p262
-sg69
-Vpublic
-p263
-sg71
-VRegionOne
-p264
-sg73
-VRegionOne
-p265
-sg45
-Vbe2d979150a2401b9e7d5c365372d093
-p266
-sa(dp267
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p268
-sg69
-Vadmin
-p269
-sg71
-VRegionOne
-p270
-sg73
-VRegionOne
-p271
-sg45
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p272
-sasg88
-Vcompute_legacy
-p273
-sg45
-Va4dd95e3fde340468f8c1d7df9a853d0
-p274
-sg47
-Vcompute_legacy
-p275
-sa(dp276
-g64
-(lp277
-(dp278
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p279
-sg69
-Vadmin
-p280
-sg71
-VRegionOne
-p281
-sg73
-VRegionOne
-p282
-sg45
-V0307d2c32dd54839aa5bc39746eeb186
-p283
-sa(dp284
-g67
-Vhttp://172.18.0.8:8774/v2.1
-p285
-sg69
-Vpublic
-p286
-sg71
-VRegionOne
-p287
-sg73
-VRegionOne
-p288
-sg45
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p289
-sa(dp290
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p291
-sg69
-Vinternal
-p292
-sg71
-VRegionOne
-p293
-sg73
-VRegionOne
-p294
-sg45
-Vdb005ab592334fc599c142cf861e754f
-p295
-sasg88
-Vcompute
-p296
-sg45
-Vc165d40b8c3849bcb6067a3df2540c62
-p297
-sg47
-Vnova
-p298
-sa(dp299
-g64
-(lp300
-(dp301
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p302
-sg69
-Vadmin
-p303
-sg71
-VRegionOne
-p304
-sg73
-VRegionOne
-p305
-sg45
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p306
-sa(dp307
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p308
-sg69
-Vinternal
-p309
-sg71
-VRegionOne
-p310
-sg73
-VRegionOne
-p311
-sg45
-V764118d3a33444ac980632d281acf4a7
-p312
-sa(dp313
-g67
-Vhttp://172.18.0.8:8080/swift/v1
-p314
-sg69
-Vpublic
-p315
-sg71
-VRegionOne
-p316
-sg73
-VRegionOne
-p317
-sg45
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p318
-sasg88
-Vobject-store
-p319
-sg45
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p320
-sg47
-Vswift
-p321
-sa(dp322
-g64
-(lp323
-(dp324
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p325
-sg69
-Vinternal
-p326
-sg71
-VRegionOne
-p327
-sg73
-VRegionOne
-p328
-sg45
-V61ea745c91ab4eb59464679931219024
-p329
-sa(dp330
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p331
-sg69
-Vadmin
-p332
-sg71
-VRegionOne
-p333
-sg73
-VRegionOne
-p334
-sg45
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p335
-sa(dp336
-g67
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p337
-sg69
-Vpublic
-p338
-sg71
-VRegionOne
-p339
-sg73
-VRegionOne
-p340
-sg45
-V7155772851884dc6954c7345d350796f
-p341
-sasg88
-Vvolumev2
-p342
-sg45
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p343
-sg47
-Vcinderv2
-p344
-sa(dp345
-g64
-(lp346
-(dp347
-g67
-Vhttp://172.18.0.8:9494
-p348
-sg69
-Vpublic
-p349
-sg71
-VRegionOne
-p350
-sg73
-VRegionOne
-p351
-sg45
-V43a202e889694d51a3b11899c252a8a9
-p352
-sa(dp353
-g67
-Vhttp://172.16.0.5:9494
-p354
-sg69
-Vadmin
-p355
-sg71
-VRegionOne
-p356
-sg73
-VRegionOne
-p357
-sg45
-Vfa3c9de06e854542b236aa24b53e19a1
-p358
-sa(dp359
-g67
-Vhttp://172.16.0.5:9494
-p360
-sg69
-Vinternal
-p361
-sg71
-VRegionOne
-p362
-sg73
-VRegionOne
-p363
-sg45
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p364
-sasg88
-Vartifact
-p365
-sg45
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p366
-sg47
-Vglare
-p367
-sasVversion
-p368
-Vv3
-p369
-sVuser
-p370
-(dp371
-g55
-(dp372
-g45
-Vdefault
-p373
-sg47
-VDefault
-p374
-ssg45
-Vef7a4f67379f41aba489a0b6d6a62094
-p375
-sg47
-Violie
-p376
-ssVaudit_ids
-p377
-(lp378
-VpVyJXCiQSYqOyodMWo2JnQ
-p379
-asVissued_at
-p380
-V2017-11-30T11:03:51.000000Z
-p381
-sssV_context_user
-p382
-NsVpublisher_id
-p383
-Vorchestration.machine-A
-p384
-sVmessage_id
-p385
-Ve4f054c7-8711-42aa-b2ba-3c1912952aa6
-p386
-sV_context_roles
-p387
-(lp388
-Vadmin
-p389
-asV_context_auth_url
-p390
-Vhttp://172.16.0.5:35357/v3/
-p391
-sVtimestamp
-p392
-V2017-11-30 11:03:51.827736
-p393
-sV_unique_id
-p394
-Va8d3cd2afb4c49b5826463b6225e9642
-p395
-sV_context_tenant_id
-p396
-V187e5e95e7eb499d8a421b3d4ed966d5
-p397
-sV_context_user_domain_id
-p398
-Vdefault
-p399
-sV_context_password
-p400
-NsV_context_trustor_user_id
-p401
-NsV_context_project_domain_id
-p402
-Vdefault
-p403
-sV_context_aws_creds
-p404
-NsV_context_tenant
-p405
-Vapexlake
-p406
-sV_context_user_identity
-p407
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p408
-stp409
-a(F0.039209127426147461
-Vsecurity_group.create.start
-p410
-(dp411
-V_context_domain
-p412
-NsV_context_request_id
-p413
-Vreq-626b91a4-4ff3-47e7-9cc4-592efd3c13e0
-p414
-sVevent_type
-p415
-g410
-sV_context_auth_token
-p416
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p417
-sV_context_resource_uuid
-p418
-NsV_context_tenant_name
-p419
-Vapexlake
-p420
-sV_context_user_id
-p421
-Vef7a4f67379f41aba489a0b6d6a62094
-p422
-sVpayload
-p423
-(dp424
-Vsecurity_group
-p425
-(dp426
-Vname
-p427
-VKevin's SG
-p428
-sVdescription
-p429
-VSecurity group for Kevin
-p430
-sssV_context_show_deleted
-p431
-I00
-sVpriority
-p432
-VINFO
-p433
-sV_context_is_admin
-p434
-I01
-sV_context_project_domain
-p435
-NsV_context_user
-p436
-Vef7a4f67379f41aba489a0b6d6a62094
-p437
-sVpublisher_id
-p438
-Vnetwork.machine-A
-p439
-sVmessage_id
-p440
-Ve7f21578-46cf-46e1-ae8b-a0f23a2d5eb8
-p441
-sV_context_roles
-p442
-(lp443
-Vadmin
-p444
-asVtimestamp
-p445
-V2017-11-30 11:03:51.868515
-p446
-sV_context_timestamp
-p447
-V2017-11-30 11:03:51.867186
-p448
-sV_unique_id
-p449
-V378cab6f7d804d079164a3ba997a813d
-p450
-sV_context_tenant_id
-p451
-V187e5e95e7eb499d8a421b3d4ed966d5
-p452
-sV_context_project_name
-p453
-Vapexlake
-p454
-sV_context_user_identity
-p455
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p456
-sV_context_tenant
-p457
-V187e5e95e7eb499d8a421b3d4ed966d5
-p458
-sV_context_project_id
-p459
-V187e5e95e7eb499d8a421b3d4ed966d5
-p460
-sV_context_read_only
-p461
-I00
-sV_context_user_domain
-p462
-NsV_context_user_name
-p463
-Violie
-p464
-stp465
-a(F0.089342117309570312
-Vsecurity_group.create.end
-p466
-(dp467
-V_context_domain
-p468
-NsV_context_request_id
-p469
-Vreq-626b91a4-4ff3-47e7-9cc4-592efd3c13e0
-p470
-sVevent_type
-p471
-g466
-sV_context_auth_token
-p472
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p473
-sV_context_resource_uuid
-p474
-NsV_context_tenant_name
-p475
-Vapexlake
-p476
-sV_context_user_id
-p477
-Vef7a4f67379f41aba489a0b6d6a62094
-p478
-sVpayload
-p479
-(dp480
-Vsecurity_group
-p481
-(dp482
-Vtenant_id
-p483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p484
-sVname
-p485
-VKevin's SG
-p486
-sVdescription
-p487
-VSecurity group for Kevin
-p488
-sVsecurity_group_rules
-p489
-(lp490
-(dp491
-Vremote_group_id
-p492
-NsVdirection
-p493
-Vegress
-p494
-sVprotocol
-p495
-Nsg487
-V
-sVethertype
-p496
-VIPv4
-p497
-sVremote_ip_prefix
-p498
-NsVport_range_max
-p499
-NsVsecurity_group_id
-p500
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p501
-sVport_range_min
-p502
-Nsg483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p503
-sVid
-p504
-V6c295960-d54d-451d-8f2c-51f1fed503d3
-p505
-sa(dp506
-g492
-Nsg493
-Vegress
-p507
-sg495
-Nsg487
-V
-sg496
-VIPv6
-p508
-sg498
-Nsg499
-Nsg500
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p509
-sg502
-Nsg483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p510
-sg504
-V850528b4-2ce3-45bf-b53b-9806ec4b9d5c
-p511
-sasg504
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p512
-sssV_context_show_deleted
-p513
-I00
-sVpriority
-p514
-VINFO
-p515
-sV_context_is_admin
-p516
-I01
-sV_context_project_domain
-p517
-NsV_context_user
-p518
-Vef7a4f67379f41aba489a0b6d6a62094
-p519
-sVpublisher_id
-p520
-Vnetwork.machine-A
-p521
-sVmessage_id
-p522
-V8984e78a-c435-483a-90a6-bff5a30e3951
-p523
-sV_context_roles
-p524
-(lp525
-Vadmin
-p526
-asVtimestamp
-p527
-V2017-11-30 11:03:51.920036
-p528
-sV_context_timestamp
-p529
-V2017-11-30 11:03:51.867186
-p530
-sV_unique_id
-p531
-Ve774017acb644763ba60226afe920bfc
-p532
-sV_context_tenant_id
-p533
-V187e5e95e7eb499d8a421b3d4ed966d5
-p534
-sV_context_project_name
-p535
-Vapexlake
-p536
-sV_context_user_identity
-p537
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p538
-sV_context_tenant
-p539
-V187e5e95e7eb499d8a421b3d4ed966d5
-p540
-sV_context_project_id
-p541
-V187e5e95e7eb499d8a421b3d4ed966d5
-p542
-sV_context_read_only
-p543
-I00
-sV_context_user_domain
-p544
-NsV_context_user_name
-p545
-Violie
-p546
-stp547
-a(F0.10795807838439941
-Vsecurity_group_rule.create.start
-p548
-(dp549
-V_context_domain
-p550
-NsV_context_request_id
-p551
-Vreq-62ff462a-78e9-4125-8ea7-7e9767e17783
-p552
-sVevent_type
-p553
-g548
-sV_context_auth_token
-p554
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p555
-sV_context_resource_uuid
-p556
-NsV_context_tenant_name
-p557
-Vapexlake
-p558
-sV_context_user_id
-p559
-Vef7a4f67379f41aba489a0b6d6a62094
-p560
-sVpayload
-p561
-(dp562
-Vsecurity_group_rule
-p563
-(dp564
-Vremote_group_id
-p565
-NsVdirection
-p566
-Vingress
-p567
-sVprotocol
-p568
-Vtcp
-p569
-sVremote_ip_prefix
-p570
-V0.0.0.0/0
-p571
-sVport_range_max
-p572
-V22
-p573
-sVsecurity_group_id
-p574
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p575
-sVport_range_min
-p576
-V22
-p577
-sVethertype
-p578
-VIPv4
-p579
-sssV_context_show_deleted
-p580
-I00
-sVpriority
-p581
-VINFO
-p582
-sV_context_is_admin
-p583
-I01
-sV_context_project_domain
-p584
-NsV_context_user
-p585
-Vef7a4f67379f41aba489a0b6d6a62094
-p586
-sVpublisher_id
-p587
-Vnetwork.machine-A
-p588
-sVmessage_id
-p589
-Vd5780ea9-b925-4f41-bc26-ea49ddb468e5
-p590
-sV_context_roles
-p591
-(lp592
-Vadmin
-p593
-asVtimestamp
-p594
-V2017-11-30 11:03:51.937814
-p595
-sV_context_timestamp
-p596
-V2017-11-30 11:03:51.936604
-p597
-sV_unique_id
-p598
-V20c752d3a80d4a2d8472946a20e9bd7d
-p599
-sV_context_tenant_id
-p600
-V187e5e95e7eb499d8a421b3d4ed966d5
-p601
-sV_context_project_name
-p602
-Vapexlake
-p603
-sV_context_user_identity
-p604
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p605
-sV_context_tenant
-p606
-V187e5e95e7eb499d8a421b3d4ed966d5
-p607
-sV_context_project_id
-p608
-V187e5e95e7eb499d8a421b3d4ed966d5
-p609
-sV_context_read_only
-p610
-I00
-sV_context_user_domain
-p611
-NsV_context_user_name
-p612
-Violie
-p613
-stp614
-a(F0.1673731803894043
-Vsecurity_group_rule.create.end
-p615
-(dp616
-V_context_domain
-p617
-NsV_context_request_id
-p618
-Vreq-62ff462a-78e9-4125-8ea7-7e9767e17783
-p619
-sVevent_type
-p620
-g615
-sV_context_auth_token
-p621
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p622
-sV_context_resource_uuid
-p623
-NsV_context_tenant_name
-p624
-Vapexlake
-p625
-sV_context_user_id
-p626
-Vef7a4f67379f41aba489a0b6d6a62094
-p627
-sVpayload
-p628
-(dp629
-Vsecurity_group_rule
-p630
-(dp631
-Vremote_group_id
-p632
-NsVdirection
-p633
-Vingress
-p634
-sVprotocol
-p635
-Vtcp
-p636
-sVdescription
-p637
-V
-sVethertype
-p638
-VIPv4
-p639
-sVremote_ip_prefix
-p640
-V0.0.0.0/0
-p641
-sVport_range_max
-p642
-I22
-sVsecurity_group_id
-p643
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p644
-sVport_range_min
-p645
-I22
-sVtenant_id
-p646
-V187e5e95e7eb499d8a421b3d4ed966d5
-p647
-sVid
-p648
-V9db9c195-a429-4268-8206-312d77472d5f
-p649
-sssV_context_show_deleted
-p650
-I00
-sVpriority
-p651
-VINFO
-p652
-sV_context_is_admin
-p653
-I01
-sV_context_project_domain
-p654
-NsV_context_user
-p655
-Vef7a4f67379f41aba489a0b6d6a62094
-p656
-sVpublisher_id
-p657
-Vnetwork.machine-A
-p658
-sVmessage_id
-p659
-Va8994763-7568-4610-89b0-e6ff1579f334
-p660
-sV_context_roles
-p661
-(lp662
-Vadmin
-p663
-asVtimestamp
-p664
-V2017-11-30 11:03:51.997581
-p665
-sV_context_timestamp
-p666
-V2017-11-30 11:03:51.936604
-p667
-sV_unique_id
-p668
-Vf6a4a8a28e304aba957563a652ae75ad
-p669
-sV_context_tenant_id
-p670
-V187e5e95e7eb499d8a421b3d4ed966d5
-p671
-sV_context_project_name
-p672
-Vapexlake
-p673
-sV_context_user_identity
-p674
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p675
-sV_context_tenant
-p676
-V187e5e95e7eb499d8a421b3d4ed966d5
-p677
-sV_context_project_id
-p678
-V187e5e95e7eb499d8a421b3d4ed966d5
-p679
-sV_context_read_only
-p680
-I00
-sV_context_user_domain
-p681
-NsV_context_user_name
-p682
-Violie
-p683
-stp684
-a(F0.18203902244567871
-Vsecurity_group_rule.create.start
-p685
-(dp686
-V_context_domain
-p687
-NsV_context_request_id
-p688
-Vreq-1fa5185b-f741-45e5-9a43-61be3abfec74
-p689
-sVevent_type
-p690
-g685
-sV_context_auth_token
-p691
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p692
-sV_context_resource_uuid
-p693
-NsV_context_tenant_name
-p694
-Vapexlake
-p695
-sV_context_user_id
-p696
-Vef7a4f67379f41aba489a0b6d6a62094
-p697
-sVpayload
-p698
-(dp699
-Vsecurity_group_rule
-p700
-(dp701
-Vremote_group_id
-p702
-NsVdirection
-p703
-Vingress
-p704
-sVprotocol
-p705
-Vtcp
-p706
-sVremote_ip_prefix
-p707
-V0.0.0.0/0
-p708
-sVport_range_max
-p709
-V65000
-p710
-sVsecurity_group_id
-p711
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p712
-sVport_range_min
-p713
-V1
-sVethertype
-p714
-VIPv4
-p715
-sssV_context_show_deleted
-p716
-I00
-sVpriority
-p717
-VINFO
-p718
-sV_context_is_admin
-p719
-I01
-sV_context_project_domain
-p720
-NsV_context_user
-p721
-Vef7a4f67379f41aba489a0b6d6a62094
-p722
-sVpublisher_id
-p723
-Vnetwork.machine-A
-p724
-sVmessage_id
-p725
-V22edb81e-91e1-4354-b456-42588230cd3a
-p726
-sV_context_roles
-p727
-(lp728
-Vadmin
-p729
-asVtimestamp
-p730
-V2017-11-30 11:03:52.011928
-p731
-sV_context_timestamp
-p732
-V2017-11-30 11:03:52.010257
-p733
-sV_unique_id
-p734
-V232bf0733cdb420d9e3e9d6b25c8f3e0
-p735
-sV_context_tenant_id
-p736
-V187e5e95e7eb499d8a421b3d4ed966d5
-p737
-sV_context_project_name
-p738
-Vapexlake
-p739
-sV_context_user_identity
-p740
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p741
-sV_context_tenant
-p742
-V187e5e95e7eb499d8a421b3d4ed966d5
-p743
-sV_context_project_id
-p744
-V187e5e95e7eb499d8a421b3d4ed966d5
-p745
-sV_context_read_only
-p746
-I00
-sV_context_user_domain
-p747
-NsV_context_user_name
-p748
-Violie
-p749
-stp750
-a(F0.24033498764038086
-Vsecurity_group_rule.create.end
-p751
-(dp752
-V_context_domain
-p753
-NsV_context_request_id
-p754
-Vreq-1fa5185b-f741-45e5-9a43-61be3abfec74
-p755
-sVevent_type
-p756
-g751
-sV_context_auth_token
-p757
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p758
-sV_context_resource_uuid
-p759
-NsV_context_tenant_name
-p760
-Vapexlake
-p761
-sV_context_user_id
-p762
-Vef7a4f67379f41aba489a0b6d6a62094
-p763
-sVpayload
-p764
-(dp765
-Vsecurity_group_rule
-p766
-(dp767
-Vremote_group_id
-p768
-NsVdirection
-p769
-Vingress
-p770
-sVprotocol
-p771
-Vtcp
-p772
-sVdescription
-p773
-V
-sVethertype
-p774
-VIPv4
-p775
-sVremote_ip_prefix
-p776
-V0.0.0.0/0
-p777
-sVport_range_max
-p778
-I65000
-sVsecurity_group_id
-p779
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p780
-sVport_range_min
-p781
-I1
-sVtenant_id
-p782
-V187e5e95e7eb499d8a421b3d4ed966d5
-p783
-sVid
-p784
-Ve8850b1e-da1e-4449-8c41-c75ff791f177
-p785
-sssV_context_show_deleted
-p786
-I00
-sVpriority
-p787
-VINFO
-p788
-sV_context_is_admin
-p789
-I01
-sV_context_project_domain
-p790
-NsV_context_user
-p791
-Vef7a4f67379f41aba489a0b6d6a62094
-p792
-sVpublisher_id
-p793
-Vnetwork.machine-A
-p794
-sVmessage_id
-p795
-V06b36577-3ba0-40ec-a5bb-d5b375ed90fa
-p796
-sV_context_roles
-p797
-(lp798
-Vadmin
-p799
-asVtimestamp
-p800
-V2017-11-30 11:03:52.071288
-p801
-sV_context_timestamp
-p802
-V2017-11-30 11:03:52.010257
-p803
-sV_unique_id
-p804
-V02cf1b811c9d4f0ebade440c706c066b
-p805
-sV_context_tenant_id
-p806
-V187e5e95e7eb499d8a421b3d4ed966d5
-p807
-sV_context_project_name
-p808
-Vapexlake
-p809
-sV_context_user_identity
-p810
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p811
-sV_context_tenant
-p812
-V187e5e95e7eb499d8a421b3d4ed966d5
-p813
-sV_context_project_id
-p814
-V187e5e95e7eb499d8a421b3d4ed966d5
-p815
-sV_context_read_only
-p816
-I00
-sV_context_user_domain
-p817
-NsV_context_user_name
-p818
-Violie
-p819
-stp820
-a(F0.25122499465942383
-Vsecurity_group_rule.create.start
-p821
-(dp822
-V_context_domain
-p823
-NsV_context_request_id
-p824
-Vreq-636d331e-3b4b-4cfa-a82e-a8c905ac9726
-p825
-sVevent_type
-p826
-g821
-sV_context_auth_token
-p827
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p828
-sV_context_resource_uuid
-p829
-NsV_context_tenant_name
-p830
-Vapexlake
-p831
-sV_context_user_id
-p832
-Vef7a4f67379f41aba489a0b6d6a62094
-p833
-sVpayload
-p834
-(dp835
-Vsecurity_group_rule
-p836
-(dp837
-Vremote_group_id
-p838
-NsVdirection
-p839
-Vingress
-p840
-sVprotocol
-p841
-Vtcp
-p842
-sVremote_ip_prefix
-p843
-V0.0.0.0/0
-p844
-sVport_range_max
-p845
-V7474
-p846
-sVsecurity_group_id
-p847
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p848
-sVport_range_min
-p849
-V7474
-p850
-sVethertype
-p851
-VIPv4
-p852
-sssV_context_show_deleted
-p853
-I00
-sVpriority
-p854
-VINFO
-p855
-sV_context_is_admin
-p856
-I01
-sV_context_project_domain
-p857
-NsV_context_user
-p858
-Vef7a4f67379f41aba489a0b6d6a62094
-p859
-sVpublisher_id
-p860
-Vnetwork.machine-A
-p861
-sVmessage_id
-p862
-V682e50de-4006-4a37-9eae-2490fea93d12
-p863
-sV_context_roles
-p864
-(lp865
-Vadmin
-p866
-asVtimestamp
-p867
-V2017-11-30 11:03:52.082308
-p868
-sV_context_timestamp
-p869
-V2017-11-30 11:03:52.081172
-p870
-sV_unique_id
-p871
-V7ce7c548018e43279d688cc06165a4f4
-p872
-sV_context_tenant_id
-p873
-V187e5e95e7eb499d8a421b3d4ed966d5
-p874
-sV_context_project_name
-p875
-Vapexlake
-p876
-sV_context_user_identity
-p877
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p878
-sV_context_tenant
-p879
-V187e5e95e7eb499d8a421b3d4ed966d5
-p880
-sV_context_project_id
-p881
-V187e5e95e7eb499d8a421b3d4ed966d5
-p882
-sV_context_read_only
-p883
-I00
-sV_context_user_domain
-p884
-NsV_context_user_name
-p885
-Violie
-p886
-stp887
-a(F0.30825901031494141
-Vsecurity_group_rule.create.end
-p888
-(dp889
-V_context_domain
-p890
-NsV_context_request_id
-p891
-Vreq-636d331e-3b4b-4cfa-a82e-a8c905ac9726
-p892
-sVevent_type
-p893
-g888
-sV_context_auth_token
-p894
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p895
-sV_context_resource_uuid
-p896
-NsV_context_tenant_name
-p897
-Vapexlake
-p898
-sV_context_user_id
-p899
-Vef7a4f67379f41aba489a0b6d6a62094
-p900
-sVpayload
-p901
-(dp902
-Vsecurity_group_rule
-p903
-(dp904
-Vremote_group_id
-p905
-NsVdirection
-p906
-Vingress
-p907
-sVprotocol
-p908
-Vtcp
-p909
-sVdescription
-p910
-V
-sVethertype
-p911
-VIPv4
-p912
-sVremote_ip_prefix
-p913
-V0.0.0.0/0
-p914
-sVport_range_max
-p915
-I7474
-sVsecurity_group_id
-p916
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p917
-sVport_range_min
-p918
-I7474
-sVtenant_id
-p919
-V187e5e95e7eb499d8a421b3d4ed966d5
-p920
-sVid
-p921
-V8de9bce2-9a99-4f07-acb8-00b7281eafaf
-p922
-sssV_context_show_deleted
-p923
-I00
-sVpriority
-p924
-VINFO
-p925
-sV_context_is_admin
-p926
-I01
-sV_context_project_domain
-p927
-NsV_context_user
-p928
-Vef7a4f67379f41aba489a0b6d6a62094
-p929
-sVpublisher_id
-p930
-Vnetwork.machine-A
-p931
-sVmessage_id
-p932
-V87bd631d-db23-4f56-b01f-ebe6d211b8ab
-p933
-sV_context_roles
-p934
-(lp935
-Vadmin
-p936
-asVtimestamp
-p937
-V2017-11-30 11:03:52.139262
-p938
-sV_context_timestamp
-p939
-V2017-11-30 11:03:52.081172
-p940
-sV_unique_id
-p941
-Vb911a88b08c145f8a348a6b854e19ff0
-p942
-sV_context_tenant_id
-p943
-V187e5e95e7eb499d8a421b3d4ed966d5
-p944
-sV_context_project_name
-p945
-Vapexlake
-p946
-sV_context_user_identity
-p947
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p948
-sV_context_tenant
-p949
-V187e5e95e7eb499d8a421b3d4ed966d5
-p950
-sV_context_project_id
-p951
-V187e5e95e7eb499d8a421b3d4ed966d5
-p952
-sV_context_read_only
-p953
-I00
-sV_context_user_domain
-p954
-NsV_context_user_name
-p955
-Violie
-p956
-stp957
-a(F0.3180701732635498
-Vsecurity_group_rule.create.start
-p958
-(dp959
-V_context_domain
-p960
-NsV_context_request_id
-p961
-Vreq-d4abd283-e1f4-417e-9b3c-4a21addfa9df
-p962
-sVevent_type
-p963
-g958
-sV_context_auth_token
-p964
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p965
-sV_context_resource_uuid
-p966
-NsV_context_tenant_name
-p967
-Vapexlake
-p968
-sV_context_user_id
-p969
-Vef7a4f67379f41aba489a0b6d6a62094
-p970
-sVpayload
-p971
-(dp972
-Vsecurity_group_rule
-p973
-(dp974
-Vremote_group_id
-p975
-NsVdirection
-p976
-Vingress
-p977
-sVprotocol
-p978
-Vicmp
-p979
-sVremote_ip_prefix
-p980
-V0.0.0.0/0
-p981
-sVport_range_max
-p982
-NsVsecurity_group_id
-p983
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p984
-sVport_range_min
-p985
-NsVethertype
-p986
-VIPv4
-p987
-sssV_context_show_deleted
-p988
-I00
-sVpriority
-p989
-VINFO
-p990
-sV_context_is_admin
-p991
-I01
-sV_context_project_domain
-p992
-NsV_context_user
-p993
-Vef7a4f67379f41aba489a0b6d6a62094
-p994
-sVpublisher_id
-p995
-Vnetwork.machine-A
-p996
-sVmessage_id
-p997
-Vf6818fd4-264f-4bcf-aef6-7b7bd1271b23
-p998
-sV_context_roles
-p999
-(lp1000
-Vadmin
-p1001
-asVtimestamp
-p1002
-V2017-11-30 11:03:52.149169
-p1003
-sV_context_timestamp
-p1004
-V2017-11-30 11:03:52.147985
-p1005
-sV_unique_id
-p1006
-V2ab8b92d25444ad1bb8c00f509de627e
-p1007
-sV_context_tenant_id
-p1008
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1009
-sV_context_project_name
-p1010
-Vapexlake
-p1011
-sV_context_user_identity
-p1012
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1013
-sV_context_tenant
-p1014
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1015
-sV_context_project_id
-p1016
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1017
-sV_context_read_only
-p1018
-I00
-sV_context_user_domain
-p1019
-NsV_context_user_name
-p1020
-Violie
-p1021
-stp1022
-a(F0.37347507476806641
-Vsecurity_group_rule.create.end
-p1023
-(dp1024
-V_context_domain
-p1025
-NsV_context_request_id
-p1026
-Vreq-d4abd283-e1f4-417e-9b3c-4a21addfa9df
-p1027
-sVevent_type
-p1028
-g1023
-sV_context_auth_token
-p1029
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p1030
-sV_context_resource_uuid
-p1031
-NsV_context_tenant_name
-p1032
-Vapexlake
-p1033
-sV_context_user_id
-p1034
-Vef7a4f67379f41aba489a0b6d6a62094
-p1035
-sVpayload
-p1036
-(dp1037
-Vsecurity_group_rule
-p1038
-(dp1039
-Vremote_group_id
-p1040
-NsVdirection
-p1041
-Vingress
-p1042
-sVprotocol
-p1043
-Vicmp
-p1044
-sVdescription
-p1045
-V
-sVethertype
-p1046
-VIPv4
-p1047
-sVremote_ip_prefix
-p1048
-V0.0.0.0/0
-p1049
-sVport_range_max
-p1050
-NsVsecurity_group_id
-p1051
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p1052
-sVport_range_min
-p1053
-NsVtenant_id
-p1054
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1055
-sVid
-p1056
-V9c8eaa7a-c266-4b55-9a49-8e179eb43f8a
-p1057
-sssV_context_show_deleted
-p1058
-I00
-sVpriority
-p1059
-VINFO
-p1060
-sV_context_is_admin
-p1061
-I01
-sV_context_project_domain
-p1062
-NsV_context_user
-p1063
-Vef7a4f67379f41aba489a0b6d6a62094
-p1064
-sVpublisher_id
-p1065
-Vnetwork.machine-A
-p1066
-sVmessage_id
-p1067
-V8762514b-9cbc-4ef1-a4d8-bf2028396470
-p1068
-sV_context_roles
-p1069
-(lp1070
-Vadmin
-p1071
-asVtimestamp
-p1072
-V2017-11-30 11:03:52.203428
-p1073
-sV_context_timestamp
-p1074
-V2017-11-30 11:03:52.147985
-p1075
-sV_unique_id
-p1076
-Vd8f301fc9a7a47db833ba5346d911f62
-p1077
-sV_context_tenant_id
-p1078
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1079
-sV_context_project_name
-p1080
-Vapexlake
-p1081
-sV_context_user_identity
-p1082
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1083
-sV_context_tenant
-p1084
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1085
-sV_context_project_id
-p1086
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1087
-sV_context_read_only
-p1088
-I00
-sV_context_user_domain
-p1089
-NsV_context_user_name
-p1090
-Violie
-p1091
-stp1092
-a(F1.4297111034393311
-Vport.create.start
-p1093
-(dp1094
-V_context_domain
-p1095
-NsV_context_request_id
-p1096
-Vreq-9e2346ec-c3bd-47b6-9892-1b8177f86ade
-p1097
-sVevent_type
-p1098
-g1093
-sV_context_auth_token
-p1099
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p1100
-sV_context_resource_uuid
-p1101
-NsV_context_tenant_name
-p1102
-Vapexlake
-p1103
-sV_context_user_id
-p1104
-Vef7a4f67379f41aba489a0b6d6a62094
-p1105
-sVpayload
-p1106
-(dp1107
-Vport
-p1108
-(dp1109
-Vnetwork_id
-p1110
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p1111
-sVfixed_ips
-p1112
-(lp1113
-(dp1114
-Vsubnet_id
-p1115
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p1116
-sasVname
-p1117
-VA-server_port-mq5hsmnf3x5v
-p1118
-sVsecurity_groups
-p1119
-(lp1120
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p1121
-asVadmin_state_up
-p1122
-I01
-sssV_context_show_deleted
-p1123
-I00
-sVpriority
-p1124
-VINFO
-p1125
-sV_context_is_admin
-p1126
-I01
-sV_context_project_domain
-p1127
-NsV_context_user
-p1128
-Vef7a4f67379f41aba489a0b6d6a62094
-p1129
-sVpublisher_id
-p1130
-Vnetwork.machine-A
-p1131
-sVmessage_id
-p1132
-Vb0a8cd4c-1ddb-4cd7-9efd-cce21c4581c4
-p1133
-sV_context_roles
-p1134
-(lp1135
-Vadmin
-p1136
-asVtimestamp
-p1137
-V2017-11-30 11:03:52.242405
-p1138
-sV_context_timestamp
-p1139
-V2017-11-30 11:03:52.241373
-p1140
-sV_unique_id
-p1141
-V2b55e188c9c540b98ee655653c4cbe71
-p1142
-sV_context_tenant_id
-p1143
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1144
-sV_context_project_name
-p1145
-Vapexlake
-p1146
-sV_context_user_identity
-p1147
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1148
-sV_context_tenant
-p1149
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1150
-sV_context_project_id
-p1151
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1152
-sV_context_read_only
-p1153
-I00
-sV_context_user_domain
-p1154
-NsV_context_user_name
-p1155
-Violie
-p1156
-stp1157
-a(F2.7704141139984131
-Vport.create.end
-p1158
-(dp1159
-V_context_domain
-p1160
-NsV_context_request_id
-p1161
-Vreq-9e2346ec-c3bd-47b6-9892-1b8177f86ade
-p1162
-sVevent_type
-p1163
-g1158
-sV_context_auth_token
-p1164
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p1165
-sV_context_resource_uuid
-p1166
-NsV_context_tenant_name
-p1167
-Vapexlake
-p1168
-sV_context_user_id
-p1169
-Vef7a4f67379f41aba489a0b6d6a62094
-p1170
-sVpayload
-p1171
-(dp1172
-Vport
-p1173
-(dp1174
-Vallowed_address_pairs
-p1175
-(lp1176
-sVextra_dhcp_opts
-p1177
-(lp1178
-sVupdated_at
-p1179
-V2017-11-30T11:03:53
-p1180
-sVdevice_owner
-p1181
-V
-sVbinding:profile
-p1182
-(dp1183
-sVport_security_enabled
-p1184
-I01
-sVfixed_ips
-p1185
-(lp1186
-(dp1187
-Vsubnet_id
-p1188
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p1189
-sVip_address
-p1190
-V172.16.9.143
-p1191
-sasVid
-p1192
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p1193
-sVsecurity_groups
-p1194
-(lp1195
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p1196
-asVbinding:vif_details
-p1197
-(dp1198
-sVbinding:vif_type
-p1199
-Vunbound
-p1200
-sVmac_address
-p1201
-Vfa:16:3e:e3:1c:a2
-p1202
-sVstatus
-p1203
-VDOWN
-p1204
-sVbinding:host_id
-p1205
-V
-sVdescription
-p1206
-V
-sVdns_assignment
-p1207
-(lp1208
-(dp1209
-Vhostname
-p1210
-Vhost-172-16-9-143
-p1211
-sg1190
-V172.16.9.143
-p1212
-sVfqdn
-p1213
-Vhost-172-16-9-143.openstacklocal.
-p1214
-sasVdevice_id
-p1215
-V
-sVname
-p1216
-VA-server_port-mq5hsmnf3x5v
-p1217
-sVadmin_state_up
-p1218
-I01
-sVnetwork_id
-p1219
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p1220
-sVdns_name
-p1221
-V
-sVcreated_at
-p1222
-V2017-11-30T11:03:53
-p1223
-sVbinding:vnic_type
-p1224
-Vnormal
-p1225
-sVtenant_id
-p1226
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1227
-sssV_context_show_deleted
-p1228
-I00
-sVpriority
-p1229
-VINFO
-p1230
-sV_context_is_admin
-p1231
-I01
-sV_context_project_domain
-p1232
-NsV_context_user
-p1233
-Vef7a4f67379f41aba489a0b6d6a62094
-p1234
-sVpublisher_id
-p1235
-Vnetwork.machine-A
-p1236
-sVmessage_id
-p1237
-V3600056f-6a1d-4558-8c17-8eda21c64f26
-p1238
-sV_context_roles
-p1239
-(lp1240
-Vadmin
-p1241
-asVtimestamp
-p1242
-V2017-11-30 11:03:54.600278
-p1243
-sV_context_timestamp
-p1244
-V2017-11-30 11:03:52.241373
-p1245
-sV_unique_id
-p1246
-V43edc128fb7445778bd79387b94c4b56
-p1247
-sV_context_tenant_id
-p1248
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1249
-sV_context_project_name
-p1250
-Vapexlake
-p1251
-sV_context_user_identity
-p1252
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1253
-sV_context_tenant
-p1254
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1255
-sV_context_project_id
-p1256
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1257
-sV_context_read_only
-p1258
-I00
-sV_context_user_domain
-p1259
-NsV_context_user_name
-p1260
-Violie
-p1261
-stp1262
-a(F3.930678129196167
-Vfloatingip.create.start
-p1263
-(dp1264
-V_context_domain
-p1265
-NsV_context_request_id
-p1266
-Vreq-53ecce32-f0da-4c60-be46-466be8c0ad65
-p1267
-sVevent_type
-p1268
-g1263
-sV_context_auth_token
-p1269
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p1270
-sV_context_resource_uuid
-p1271
-NsV_context_tenant_name
-p1272
-Vapexlake
-p1273
-sV_context_user_id
-p1274
-Vef7a4f67379f41aba489a0b6d6a62094
-p1275
-sVpayload
-p1276
-(dp1277
-Vfloatingip
-p1278
-(dp1279
-Vfloating_network_id
-p1280
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p1281
-sVport_id
-p1282
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p1283
-sssV_context_show_deleted
-p1284
-I00
-sVpriority
-p1285
-VINFO
-p1286
-sV_context_is_admin
-p1287
-I01
-sV_context_project_domain
-p1288
-NsV_context_user
-p1289
-Vef7a4f67379f41aba489a0b6d6a62094
-p1290
-sVpublisher_id
-p1291
-Vnetwork.machine-A
-p1292
-sVmessage_id
-p1293
-V521b2d77-3719-4a22-91de-46645cc4fbe4
-p1294
-sV_context_roles
-p1295
-(lp1296
-Vadmin
-p1297
-asVtimestamp
-p1298
-V2017-11-30 11:03:55.759010
-p1299
-sV_context_timestamp
-p1300
-V2017-11-30 11:03:55.757693
-p1301
-sV_unique_id
-p1302
-V2ad9d433627b455cafb32ef792480845
-p1303
-sV_context_tenant_id
-p1304
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1305
-sV_context_project_name
-p1306
-Vapexlake
-p1307
-sV_context_user_identity
-p1308
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1309
-sV_context_tenant
-p1310
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1311
-sV_context_project_id
-p1312
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1313
-sV_context_read_only
-p1314
-I00
-sV_context_user_domain
-p1315
-NsV_context_user_name
-p1316
-Violie
-p1317
-stp1318
-a(F4.2961220741271973
-Vorchestration.stack.create.start
-p1319
-(dp1320
-V_context_request_id
-p1321
-Vreq-dc6f2ea5-a97d-4d07-9232-a862062cc609
-p1322
-sVevent_type
-p1323
-g1319
-sV_context_region_name
-p1324
-NsV_context_auth_token
-p1325
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p1326
-sV_context_user_id
-p1327
-Vef7a4f67379f41aba489a0b6d6a62094
-p1328
-sVpayload
-p1329
-(dp1330
-Vusername
-p1331
-NsVstate_reason
-p1332
-VStack CREATE started
-p1333
-sVuser_id
-p1334
-NsVuser_identity
-p1335
-Vef7a4f67379f41aba489a0b6d6a62094
-p1336
-sVstack_name
-p1337
-VB
-sVtenant_id
-p1338
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1339
-sVstack_identity
-p1340
-V4166ecad-7e96-49c6-86e3-f0bab0e0bfec
-p1341
-sVcreate_at
-p1342
-V2017-11-30T11:03:55.987068
-p1343
-sVstate
-p1344
-VCREATE_IN_PROGRESS
-p1345
-ssV_context_username
-p1346
-NsV_context_show_deleted
-p1347
-I00
-sV_context_trust_id
-p1348
-NsVpriority
-p1349
-VINFO
-p1350
-sV_context_is_admin
-p1351
-I01
-sV_context_auth_token_info
-p1352
-(dp1353
-Vtoken
-p1354
-(dp1355
-Vmethods
-p1356
-(lp1357
-Vpassword
-p1358
-asVroles
-p1359
-(lp1360
-(dp1361
-Vid
-p1362
-Vd475171bf8304e06a74b1add560b1f28
-p1363
-sVname
-p1364
-Vadmin
-p1365
-sasVauth_token
-p1366
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p1367
-sVexpires_at
-p1368
-V2017-11-30T12:03:55.000000Z
-p1369
-sVproject
-p1370
-(dp1371
-Vdomain
-p1372
-(dp1373
-g1362
-Vdefault
-p1374
-sg1364
-VDefault
-p1375
-ssg1362
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1376
-sg1364
-Vapexlake
-p1377
-ssVcatalog
-p1378
-(lp1379
-(dp1380
-Vendpoints
-p1381
-(lp1382
-(dp1383
-Vurl
-p1384
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p1385
-sVinterface
-p1386
-Vpublic
-p1387
-sVregion
-p1388
-VRegionOne
-p1389
-sVregion_id
-p1390
-VRegionOne
-p1391
-sg1362
-V13359d68397c4732b5d455941ac95989
-p1392
-sa(dp1393
-g1384
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p1394
-sg1386
-Vinternal
-p1395
-sg1388
-VRegionOne
-p1396
-sg1390
-VRegionOne
-p1397
-sg1362
-V50aeae6c5d034dcb80871bdac7391209
-p1398
-sa(dp1399
-g1384
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p1400
-sg1386
-Vadmin
-p1401
-sg1388
-VRegionOne
-p1402
-sg1390
-VRegionOne
-p1403
-sg1362
-V93b06f780b224cbd9b514c2041d3db63
-p1404
-sasVtype
-p1405
-Vvolumev3
-p1406
-sg1362
-V00a63293a3154089a4c80b60b4aa9429
-p1407
-sg1364
-Vcinderv3
-p1408
-sa(dp1409
-g1381
-(lp1410
-(dp1411
-g1384
-Vhttp://172.16.0.5:8000/v1
-p1412
-sg1386
-Vadmin
-p1413
-sg1388
-VRegionOne
-p1414
-sg1390
-VRegionOne
-p1415
-sg1362
-V24acffb5d9154df4981db7424b7669bd
-p1416
-sa(dp1417
-g1384
-Vhttp://172.18.0.8:8000/v1
-p1418
-sg1386
-Vpublic
-p1419
-sg1388
-VRegionOne
-p1420
-sg1390
-VRegionOne
-p1421
-sg1362
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p1422
-sa(dp1423
-g1384
-Vhttp://172.16.0.5:8000/v1
-p1424
-sg1386
-Vinternal
-p1425
-sg1388
-VRegionOne
-p1426
-sg1390
-VRegionOne
-p1427
-sg1362
-V679262173a714d76a078051b95f8c969
-p1428
-sasg1405
-Vcloudformation
-p1429
-sg1362
-V245169ccae564a7db06ca002f1553b51
-p1430
-sg1364
-Vheat-cfn
-p1431
-sa(dp1432
-g1381
-(lp1433
-(dp1434
-g1384
-Vhttp://172.18.0.8:8080
-p1435
-sg1386
-Vpublic
-p1436
-sg1388
-VRegionOne
-p1437
-sg1390
-VRegionOne
-p1438
-sg1362
-V04a6ef3db6b046b1893ed45a3f906f6c
-p1439
-sa(dp1440
-g1384
-Vhttp://172.16.0.5:8080
-p1441
-sg1386
-Vinternal
-p1442
-sg1388
-VRegionOne
-p1443
-sg1390
-VRegionOne
-p1444
-sg1362
-V3e30684c9f74492b8ca9a64dd04261e6
-p1445
-sa(dp1446
-g1384
-Vhttp://172.16.0.5:8080
-p1447
-sg1386
-Vadmin
-p1448
-sg1388
-VRegionOne
-p1449
-sg1390
-VRegionOne
-p1450
-sg1362
-Vc5384b55cd7a441582f151c6b2807745
-p1451
-sasg1405
-Vs3
-p1452
-sg1362
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p1453
-sg1364
-Vswift_s3
-p1454
-sa(dp1455
-g1381
-(lp1456
-(dp1457
-g1384
-Vhttp://172.16.0.5:9696
-p1458
-sg1386
-Vadmin
-p1459
-sg1388
-VRegionOne
-p1460
-sg1390
-VRegionOne
-p1461
-sg1362
-V38b78b2c00264f59a4ade9392f88132b
-p1462
-sa(dp1463
-g1384
-Vhttp://172.18.0.8:9696
-p1464
-sg1386
-Vpublic
-p1465
-sg1388
-VRegionOne
-p1466
-sg1390
-VRegionOne
-p1467
-sg1362
-Vb5d0f72fbf674f84adf8929341e45586
-p1468
-sa(dp1469
-g1384
-Vhttp://172.16.0.5:9696
-p1470
-sg1386
-Vinternal
-p1471
-sg1388
-VRegionOne
-p1472
-sg1390
-VRegionOne
-p1473
-sg1362
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p1474
-sasg1405
-Vnetwork
-p1475
-sg1362
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p1476
-sg1364
-Vneutron
-p1477
-sa(dp1478
-g1381
-(lp1479
-(dp1480
-g1384
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1481
-sg1386
-Vinternal
-p1482
-sg1388
-VRegionOne
-p1483
-sg1390
-VRegionOne
-p1484
-sg1362
-V7c60744a22724044a92928bc2fa9e422
-p1485
-sa(dp1486
-g1384
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1487
-sg1386
-Vadmin
-p1488
-sg1388
-VRegionOne
-p1489
-sg1390
-VRegionOne
-p1490
-sg1362
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p1491
-sa(dp1492
-g1384
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1493
-sg1386
-Vpublic
-p1494
-sg1388
-VRegionOne
-p1495
-sg1390
-VRegionOne
-p1496
-sg1362
-Vde47d994bdc147bdb824474ea699a77a
-p1497
-sasg1405
-Vorchestration
-p1498
-sg1362
-V65a72244f7c54382aeebf5dfdeab8140
-p1499
-sg1364
-Vheat
-p1500
-sa(dp1501
-g1381
-(lp1502
-(dp1503
-g1384
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1504
-sg1386
-Vinternal
-p1505
-sg1388
-VRegionOne
-p1506
-sg1390
-VRegionOne
-p1507
-sg1362
-V3a25e85ecaa44b678c3721c2d3d39b38
-p1508
-sa(dp1509
-g1384
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1510
-sg1386
-Vadmin
-p1511
-sg1388
-VRegionOne
-p1512
-sg1390
-VRegionOne
-p1513
-sg1362
-V68c763474c3d4aa28c4ee0e0249998eb
-p1514
-sa(dp1515
-g1384
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1516
-sg1386
-Vpublic
-p1517
-sg1388
-VRegionOne
-p1518
-sg1390
-VRegionOne
-p1519
-sg1362
-Ve0c861373e94468db521d5a8793d33d1
-p1520
-sasg1405
-Vvolume
-p1521
-sg1362
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p1522
-sg1364
-Vcinder
-p1523
-sa(dp1524
-g1381
-(lp1525
-(dp1526
-g1384
-Vhttp://172.18.0.8:5000/v2.0
-p1527
-sg1386
-Vpublic
-p1528
-sg1388
-VRegionOne
-p1529
-sg1390
-VRegionOne
-p1530
-sg1362
-V6aa35bc15a35447db58ec5b67087f96a
-p1531
-sa(dp1532
-g1384
-Vhttp://172.16.0.5:5000/v2.0
-p1533
-sg1386
-Vinternal
-p1534
-sg1388
-VRegionOne
-p1535
-sg1390
-VRegionOne
-p1536
-sg1362
-V6b4742f26b694b93bdbcb37304d22f69
-p1537
-sa(dp1538
-g1384
-Vhttp://172.16.0.5:35357/v2.0
-p1539
-sg1386
-Vadmin
-p1540
-sg1388
-VRegionOne
-p1541
-sg1390
-VRegionOne
-p1542
-sg1362
-Vadc120ea606644a299a3c91a7ceeb8c4
-p1543
-sasg1405
-Videntity
-p1544
-sg1362
-V9f95de9f4efc4730b4dd90354894e1dc
-p1545
-sg1364
-Vkeystone
-p1546
-sa(dp1547
-g1381
-(lp1548
-(dp1549
-g1384
-Vhttp://172.16.0.5:9292
-p1550
-sg1386
-Vadmin
-p1551
-sg1388
-VRegionOne
-p1552
-sg1390
-VRegionOne
-p1553
-sg1362
-V049519f829be4e7fb5f44ae9f470efdf
-p1554
-sa(dp1555
-g1384
-Vhttp://172.18.0.8:9292
-p1556
-sg1386
-Vpublic
-p1557
-sg1388
-VRegionOne
-p1558
-sg1390
-VRegionOne
-p1559
-sg1362
-V1baebbbf35744192b335f4f293d1a9d8
-p1560
-sa(dp1561
-g1384
-Vhttp://172.16.0.5:9292
-p1562
-sg1386
-Vinternal
-p1563
-sg1388
-VRegionOne
-p1564
-sg1390
-VRegionOne
-p1565
-sg1362
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p1566
-sasg1405
-Vimage
-p1567
-sg1362
-Va39ec0213acc45ceb59346299e78d6c0
-p1568
-sg1364
-Vglance
-p1569
-sa(dp1570
-g1381
-(lp1571
-(dp1572
-g1384
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1573
-sg1386
-Vinternal
-p1574
-sg1388
-VRegionOne
-p1575
-sg1390
-VRegionOne
-p1576
-sg1362
-V2cd9d66e95484830a9006177e301aa57
-p1577
-sa(dp1578
-g1384
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1579
-sg1386
-Vpublic
-p1580
-sg1388
-VRegionOne
-p1581
-sg1390
-VRegionOne
-p1582
-sg1362
-Vbe2d979150a2401b9e7d5c365372d093
-p1583
-sa(dp1584
-g1384
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1585
-sg1386
-Vadmin
-p1586
-sg1388
-VRegionOne
-p1587
-sg1390
-VRegionOne
-p1588
-sg1362
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p1589
-sasg1405
-Vcompute_legacy
-p1590
-sg1362
-Va4dd95e3fde340468f8c1d7df9a853d0
-p1591
-sg1364
-Vcompute_legacy
-p1592
-sa(dp1593
-g1381
-(lp1594
-(dp1595
-g1384
-Vhttp://172.16.0.5:8774/v2.1
-p1596
-sg1386
-Vadmin
-p1597
-sg1388
-VRegionOne
-p1598
-sg1390
-VRegionOne
-p1599
-sg1362
-V0307d2c32dd54839aa5bc39746eeb186
-p1600
-sa(dp1601
-g1384
-Vhttp://172.18.0.8:8774/v2.1
-p1602
-sg1386
-Vpublic
-p1603
-sg1388
-VRegionOne
-p1604
-sg1390
-VRegionOne
-p1605
-sg1362
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p1606
-sa(dp1607
-g1384
-Vhttp://172.16.0.5:8774/v2.1
-p1608
-sg1386
-Vinternal
-p1609
-sg1388
-VRegionOne
-p1610
-sg1390
-VRegionOne
-p1611
-sg1362
-Vdb005ab592334fc599c142cf861e754f
-p1612
-sasg1405
-Vcompute
-p1613
-sg1362
-Vc165d40b8c3849bcb6067a3df2540c62
-p1614
-sg1364
-Vnova
-p1615
-sa(dp1616
-g1381
-(lp1617
-(dp1618
-g1384
-Vhttp://172.16.0.5:8080/swift/v1
-p1619
-sg1386
-Vadmin
-p1620
-sg1388
-VRegionOne
-p1621
-sg1390
-VRegionOne
-p1622
-sg1362
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p1623
-sa(dp1624
-g1384
-Vhttp://172.16.0.5:8080/swift/v1
-p1625
-sg1386
-Vinternal
-p1626
-sg1388
-VRegionOne
-p1627
-sg1390
-VRegionOne
-p1628
-sg1362
-V764118d3a33444ac980632d281acf4a7
-p1629
-sa(dp1630
-g1384
-Vhttp://172.18.0.8:8080/swift/v1
-p1631
-sg1386
-Vpublic
-p1632
-sg1388
-VRegionOne
-p1633
-sg1390
-VRegionOne
-p1634
-sg1362
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p1635
-sasg1405
-Vobject-store
-p1636
-sg1362
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p1637
-sg1364
-Vswift
-p1638
-sa(dp1639
-g1381
-(lp1640
-(dp1641
-g1384
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1642
-sg1386
-Vinternal
-p1643
-sg1388
-VRegionOne
-p1644
-sg1390
-VRegionOne
-p1645
-sg1362
-V61ea745c91ab4eb59464679931219024
-p1646
-sa(dp1647
-g1384
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1648
-sg1386
-Vadmin
-p1649
-sg1388
-VRegionOne
-p1650
-sg1390
-VRegionOne
-p1651
-sg1362
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p1652
-sa(dp1653
-g1384
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1654
-sg1386
-Vpublic
-p1655
-sg1388
-VRegionOne
-p1656
-sg1390
-VRegionOne
-p1657
-sg1362
-V7155772851884dc6954c7345d350796f
-p1658
-sasg1405
-Vvolumev2
-p1659
-sg1362
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p1660
-sg1364
-Vcinderv2
-p1661
-sa(dp1662
-g1381
-(lp1663
-(dp1664
-g1384
-Vhttp://172.18.0.8:9494
-p1665
-sg1386
-Vpublic
-p1666
-sg1388
-VRegionOne
-p1667
-sg1390
-VRegionOne
-p1668
-sg1362
-V43a202e889694d51a3b11899c252a8a9
-p1669
-sa(dp1670
-g1384
-Vhttp://172.16.0.5:9494
-p1671
-sg1386
-Vadmin
-p1672
-sg1388
-VRegionOne
-p1673
-sg1390
-VRegionOne
-p1674
-sg1362
-Vfa3c9de06e854542b236aa24b53e19a1
-p1675
-sa(dp1676
-g1384
-Vhttp://172.16.0.5:9494
-p1677
-sg1386
-Vinternal
-p1678
-sg1388
-VRegionOne
-p1679
-sg1390
-VRegionOne
-p1680
-sg1362
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p1681
-sasg1405
-Vartifact
-p1682
-sg1362
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p1683
-sg1364
-Vglare
-p1684
-sasVversion
-p1685
-Vv3
-p1686
-sVuser
-p1687
-(dp1688
-g1372
-(dp1689
-g1362
-Vdefault
-p1690
-sg1364
-VDefault
-p1691
-ssg1362
-Vef7a4f67379f41aba489a0b6d6a62094
-p1692
-sg1364
-Violie
-p1693
-ssVaudit_ids
-p1694
-(lp1695
-VBpleDnoXSvqD8HOMTGtMzQ
-p1696
-asVissued_at
-p1697
-V2017-11-30T11:03:55.000000Z
-p1698
-sssV_context_user
-p1699
-NsVpublisher_id
-p1700
-Vorchestration.machine-A
-p1701
-sVmessage_id
-p1702
-V96c17c84-0114-42de-8028-1651ed58e962
-p1703
-sV_context_roles
-p1704
-(lp1705
-Vadmin
-p1706
-asV_context_auth_url
-p1707
-Vhttp://172.16.0.5:35357/v3/
-p1708
-sVtimestamp
-p1709
-V2017-11-30 11:03:56.124427
-p1710
-sV_unique_id
-p1711
-V74967ffbe7b248cfa2881289a56c3af3
-p1712
-sV_context_tenant_id
-p1713
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1714
-sV_context_user_domain_id
-p1715
-Vdefault
-p1716
-sV_context_password
-p1717
-NsV_context_trustor_user_id
-p1718
-NsV_context_project_domain_id
-p1719
-Vdefault
-p1720
-sV_context_aws_creds
-p1721
-NsV_context_tenant
-p1722
-Vapexlake
-p1723
-sV_context_user_identity
-p1724
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p1725
-stp1726
-a(F4.3325800895690918
-Vsecurity_group.create.start
-p1727
-(dp1728
-V_context_domain
-p1729
-NsV_context_request_id
-p1730
-Vreq-ea677d6c-7943-465e-9d17-b17a41102cd2
-p1731
-sVevent_type
-p1732
-g1727
-sV_context_auth_token
-p1733
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p1734
-sV_context_resource_uuid
-p1735
-NsV_context_tenant_name
-p1736
-Vapexlake
-p1737
-sV_context_user_id
-p1738
-Vef7a4f67379f41aba489a0b6d6a62094
-p1739
-sVpayload
-p1740
-(dp1741
-Vsecurity_group
-p1742
-(dp1743
-Vname
-p1744
-VKevin's SG
-p1745
-sVdescription
-p1746
-VSecurity group for Kevin
-p1747
-sssV_context_show_deleted
-p1748
-I00
-sVpriority
-p1749
-VINFO
-p1750
-sV_context_is_admin
-p1751
-I01
-sV_context_project_domain
-p1752
-NsV_context_user
-p1753
-Vef7a4f67379f41aba489a0b6d6a62094
-p1754
-sVpublisher_id
-p1755
-Vnetwork.machine-A
-p1756
-sVmessage_id
-p1757
-V8645b9d3-6353-4a52-8cb6-7c854f965edf
-p1758
-sV_context_roles
-p1759
-(lp1760
-Vadmin
-p1761
-asVtimestamp
-p1762
-V2017-11-30 11:03:56.162947
-p1763
-sV_context_timestamp
-p1764
-V2017-11-30 11:03:56.161535
-p1765
-sV_unique_id
-p1766
-V8efbe305b6c5453a865bffa83b6145bc
-p1767
-sV_context_tenant_id
-p1768
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1769
-sV_context_project_name
-p1770
-Vapexlake
-p1771
-sV_context_user_identity
-p1772
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1773
-sV_context_tenant
-p1774
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1775
-sV_context_project_id
-p1776
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1777
-sV_context_read_only
-p1778
-I00
-sV_context_user_domain
-p1779
-NsV_context_user_name
-p1780
-Violie
-p1781
-stp1782
-a(F4.383430004119873
-Vsecurity_group.create.end
-p1783
-(dp1784
-V_context_domain
-p1785
-NsV_context_request_id
-p1786
-Vreq-ea677d6c-7943-465e-9d17-b17a41102cd2
-p1787
-sVevent_type
-p1788
-g1783
-sV_context_auth_token
-p1789
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p1790
-sV_context_resource_uuid
-p1791
-NsV_context_tenant_name
-p1792
-Vapexlake
-p1793
-sV_context_user_id
-p1794
-Vef7a4f67379f41aba489a0b6d6a62094
-p1795
-sVpayload
-p1796
-(dp1797
-Vsecurity_group
-p1798
-(dp1799
-Vtenant_id
-p1800
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1801
-sVname
-p1802
-VKevin's SG
-p1803
-sVdescription
-p1804
-VSecurity group for Kevin
-p1805
-sVsecurity_group_rules
-p1806
-(lp1807
-(dp1808
-Vremote_group_id
-p1809
-NsVdirection
-p1810
-Vegress
-p1811
-sVprotocol
-p1812
-Nsg1804
-V
-sVethertype
-p1813
-VIPv4
-p1814
-sVremote_ip_prefix
-p1815
-NsVport_range_max
-p1816
-NsVsecurity_group_id
-p1817
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p1818
-sVport_range_min
-p1819
-Nsg1800
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1820
-sVid
-p1821
-V24b9daff-fa99-4319-88f9-0be6b52de0f7
-p1822
-sa(dp1823
-g1809
-Nsg1810
-Vegress
-p1824
-sg1812
-Nsg1804
-V
-sg1813
-VIPv6
-p1825
-sg1815
-Nsg1816
-Nsg1817
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p1826
-sg1819
-Nsg1800
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1827
-sg1821
-Vc58077c4-8041-488f-8095-d1876a284805
-p1828
-sasg1821
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p1829
-sssV_context_show_deleted
-p1830
-I00
-sVpriority
-p1831
-VINFO
-p1832
-sV_context_is_admin
-p1833
-I01
-sV_context_project_domain
-p1834
-NsV_context_user
-p1835
-Vef7a4f67379f41aba489a0b6d6a62094
-p1836
-sVpublisher_id
-p1837
-Vnetwork.machine-A
-p1838
-sVmessage_id
-p1839
-V29277740-3ffa-46db-ab84-d52d722494df
-p1840
-sV_context_roles
-p1841
-(lp1842
-Vadmin
-p1843
-asVtimestamp
-p1844
-V2017-11-30 11:03:56.213436
-p1845
-sV_context_timestamp
-p1846
-V2017-11-30 11:03:56.161535
-p1847
-sV_unique_id
-p1848
-V2cf6c2638a184aecbd37aa34bb132c5a
-p1849
-sV_context_tenant_id
-p1850
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1851
-sV_context_project_name
-p1852
-Vapexlake
-p1853
-sV_context_user_identity
-p1854
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1855
-sV_context_tenant
-p1856
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1857
-sV_context_project_id
-p1858
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1859
-sV_context_read_only
-p1860
-I00
-sV_context_user_domain
-p1861
-NsV_context_user_name
-p1862
-Violie
-p1863
-stp1864
-a(F4.4010879993438721
-Vsecurity_group_rule.create.start
-p1865
-(dp1866
-V_context_domain
-p1867
-NsV_context_request_id
-p1868
-Vreq-16e19a73-3b7f-42f9-a620-d0758b8b756c
-p1869
-sVevent_type
-p1870
-g1865
-sV_context_auth_token
-p1871
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p1872
-sV_context_resource_uuid
-p1873
-NsV_context_tenant_name
-p1874
-Vapexlake
-p1875
-sV_context_user_id
-p1876
-Vef7a4f67379f41aba489a0b6d6a62094
-p1877
-sVpayload
-p1878
-(dp1879
-Vsecurity_group_rule
-p1880
-(dp1881
-Vremote_group_id
-p1882
-NsVdirection
-p1883
-Vingress
-p1884
-sVprotocol
-p1885
-Vtcp
-p1886
-sVremote_ip_prefix
-p1887
-V0.0.0.0/0
-p1888
-sVport_range_max
-p1889
-V22
-p1890
-sVsecurity_group_id
-p1891
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p1892
-sVport_range_min
-p1893
-V22
-p1894
-sVethertype
-p1895
-VIPv4
-p1896
-sssV_context_show_deleted
-p1897
-I00
-sVpriority
-p1898
-VINFO
-p1899
-sV_context_is_admin
-p1900
-I01
-sV_context_project_domain
-p1901
-NsV_context_user
-p1902
-Vef7a4f67379f41aba489a0b6d6a62094
-p1903
-sVpublisher_id
-p1904
-Vnetwork.machine-A
-p1905
-sVmessage_id
-p1906
-V1b87e794-c76f-4cc4-b897-c648b97c6e93
-p1907
-sV_context_roles
-p1908
-(lp1909
-Vadmin
-p1910
-asVtimestamp
-p1911
-V2017-11-30 11:03:56.231252
-p1912
-sV_context_timestamp
-p1913
-V2017-11-30 11:03:56.230059
-p1914
-sV_unique_id
-p1915
-V5ed101f37fe04499b24c1fd285209d85
-p1916
-sV_context_tenant_id
-p1917
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1918
-sV_context_project_name
-p1919
-Vapexlake
-p1920
-sV_context_user_identity
-p1921
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1922
-sV_context_tenant
-p1923
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1924
-sV_context_project_id
-p1925
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1926
-sV_context_read_only
-p1927
-I00
-sV_context_user_domain
-p1928
-NsV_context_user_name
-p1929
-Violie
-p1930
-stp1931
-a(F4.4581840038299561
-Vfloatingip.create.end
-p1932
-(dp1933
-V_context_domain
-p1934
-NsV_context_request_id
-p1935
-Vreq-53ecce32-f0da-4c60-be46-466be8c0ad65
-p1936
-sVevent_type
-p1937
-g1932
-sV_context_auth_token
-p1938
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p1939
-sV_context_resource_uuid
-p1940
-NsV_context_tenant_name
-p1941
-Vapexlake
-p1942
-sV_context_user_id
-p1943
-Vef7a4f67379f41aba489a0b6d6a62094
-p1944
-sVpayload
-p1945
-(dp1946
-Vfloatingip
-p1947
-(dp1948
-Vrouter_id
-p1949
-V4eb1290f-8c3c-45d5-9409-cc446f480079
-p1950
-sVstatus
-p1951
-VDOWN
-p1952
-sVdescription
-p1953
-V
-sVdns_name
-p1954
-V
-sVdns_domain
-p1955
-V
-sVfloating_network_id
-p1956
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p1957
-sVfixed_ip_address
-p1958
-V172.16.9.143
-p1959
-sVfloating_ip_address
-p1960
-V10.2.32.192
-p1961
-sVtenant_id
-p1962
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1963
-sVport_id
-p1964
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p1965
-sVid
-p1966
-V507940da-20a4-4115-9ca3-054d62260b8c
-p1967
-sssV_context_show_deleted
-p1968
-I00
-sVpriority
-p1969
-VINFO
-p1970
-sV_context_is_admin
-p1971
-I01
-sV_context_project_domain
-p1972
-NsV_context_user
-p1973
-Vef7a4f67379f41aba489a0b6d6a62094
-p1974
-sVpublisher_id
-p1975
-Vnetwork.machine-A
-p1976
-sVmessage_id
-p1977
-V8071e79f-9df5-417a-8366-20efed3f16a4
-p1978
-sV_context_roles
-p1979
-(lp1980
-Vadmin
-p1981
-asVtimestamp
-p1982
-V2017-11-30 11:03:56.288686
-p1983
-sV_context_timestamp
-p1984
-V2017-11-30 11:03:55.757693
-p1985
-sV_unique_id
-p1986
-V5000c45b2f8e4f1e801ca1fa5e733834
-p1987
-sV_context_tenant_id
-p1988
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1989
-sV_context_project_name
-p1990
-Vapexlake
-p1991
-sV_context_user_identity
-p1992
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1993
-sV_context_tenant
-p1994
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1995
-sV_context_project_id
-p1996
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1997
-sV_context_read_only
-p1998
-I00
-sV_context_user_domain
-p1999
-NsV_context_user_name
-p2000
-Violie
-p2001
-stp2002
-a(F4.4647459983825684
-Vsecurity_group_rule.create.end
-p2003
-(dp2004
-V_context_domain
-p2005
-NsV_context_request_id
-p2006
-Vreq-16e19a73-3b7f-42f9-a620-d0758b8b756c
-p2007
-sVevent_type
-p2008
-g2003
-sV_context_auth_token
-p2009
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2010
-sV_context_resource_uuid
-p2011
-NsV_context_tenant_name
-p2012
-Vapexlake
-p2013
-sV_context_user_id
-p2014
-Vef7a4f67379f41aba489a0b6d6a62094
-p2015
-sVpayload
-p2016
-(dp2017
-Vsecurity_group_rule
-p2018
-(dp2019
-Vremote_group_id
-p2020
-NsVdirection
-p2021
-Vingress
-p2022
-sVprotocol
-p2023
-Vtcp
-p2024
-sVdescription
-p2025
-V
-sVethertype
-p2026
-VIPv4
-p2027
-sVremote_ip_prefix
-p2028
-V0.0.0.0/0
-p2029
-sVport_range_max
-p2030
-I22
-sVsecurity_group_id
-p2031
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2032
-sVport_range_min
-p2033
-I22
-sVtenant_id
-p2034
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2035
-sVid
-p2036
-V3bcbc8bf-0ff4-4e7e-93e2-d59517d1d377
-p2037
-sssV_context_show_deleted
-p2038
-I00
-sVpriority
-p2039
-VINFO
-p2040
-sV_context_is_admin
-p2041
-I01
-sV_context_project_domain
-p2042
-NsV_context_user
-p2043
-Vef7a4f67379f41aba489a0b6d6a62094
-p2044
-sVpublisher_id
-p2045
-Vnetwork.machine-A
-p2046
-sVmessage_id
-p2047
-Vf80fdd41-cbdd-4e7d-8601-a507b756d1f4
-p2048
-sV_context_roles
-p2049
-(lp2050
-Vadmin
-p2051
-asVtimestamp
-p2052
-V2017-11-30 11:03:56.295814
-p2053
-sV_context_timestamp
-p2054
-V2017-11-30 11:03:56.230059
-p2055
-sV_unique_id
-p2056
-V8ad0f37617344daf84274df9f84e0a1f
-p2057
-sV_context_tenant_id
-p2058
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2059
-sV_context_project_name
-p2060
-Vapexlake
-p2061
-sV_context_user_identity
-p2062
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2063
-sV_context_tenant
-p2064
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2065
-sV_context_project_id
-p2066
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2067
-sV_context_read_only
-p2068
-I00
-sV_context_user_domain
-p2069
-NsV_context_user_name
-p2070
-Violie
-p2071
-stp2072
-a(F4.4789149761199951
-Vsecurity_group_rule.create.start
-p2073
-(dp2074
-V_context_domain
-p2075
-NsV_context_request_id
-p2076
-Vreq-eaaa2bdd-3cd2-4d59-ad8d-42cb77207678
-p2077
-sVevent_type
-p2078
-g2073
-sV_context_auth_token
-p2079
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2080
-sV_context_resource_uuid
-p2081
-NsV_context_tenant_name
-p2082
-Vapexlake
-p2083
-sV_context_user_id
-p2084
-Vef7a4f67379f41aba489a0b6d6a62094
-p2085
-sVpayload
-p2086
-(dp2087
-Vsecurity_group_rule
-p2088
-(dp2089
-Vremote_group_id
-p2090
-NsVdirection
-p2091
-Vingress
-p2092
-sVprotocol
-p2093
-Vtcp
-p2094
-sVremote_ip_prefix
-p2095
-V0.0.0.0/0
-p2096
-sVport_range_max
-p2097
-V65000
-p2098
-sVsecurity_group_id
-p2099
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2100
-sVport_range_min
-p2101
-V1
-sVethertype
-p2102
-VIPv4
-p2103
-sssV_context_show_deleted
-p2104
-I00
-sVpriority
-p2105
-VINFO
-p2106
-sV_context_is_admin
-p2107
-I01
-sV_context_project_domain
-p2108
-NsV_context_user
-p2109
-Vef7a4f67379f41aba489a0b6d6a62094
-p2110
-sVpublisher_id
-p2111
-Vnetwork.machine-A
-p2112
-sVmessage_id
-p2113
-Vc9891855-bdbd-42b7-a926-79afd466b1ed
-p2114
-sV_context_roles
-p2115
-(lp2116
-Vadmin
-p2117
-asVtimestamp
-p2118
-V2017-11-30 11:03:56.309132
-p2119
-sV_context_timestamp
-p2120
-V2017-11-30 11:03:56.307519
-p2121
-sV_unique_id
-p2122
-Vf9b0e317b9594b268e5b2d347509f05d
-p2123
-sV_context_tenant_id
-p2124
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2125
-sV_context_project_name
-p2126
-Vapexlake
-p2127
-sV_context_user_identity
-p2128
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2129
-sV_context_tenant
-p2130
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2131
-sV_context_project_id
-p2132
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2133
-sV_context_read_only
-p2134
-I00
-sV_context_user_domain
-p2135
-NsV_context_user_name
-p2136
-Violie
-p2137
-stp2138
-a(F4.5305831432342529
-Vsecurity_group_rule.create.end
-p2139
-(dp2140
-V_context_domain
-p2141
-NsV_context_request_id
-p2142
-Vreq-eaaa2bdd-3cd2-4d59-ad8d-42cb77207678
-p2143
-sVevent_type
-p2144
-g2139
-sV_context_auth_token
-p2145
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2146
-sV_context_resource_uuid
-p2147
-NsV_context_tenant_name
-p2148
-Vapexlake
-p2149
-sV_context_user_id
-p2150
-Vef7a4f67379f41aba489a0b6d6a62094
-p2151
-sVpayload
-p2152
-(dp2153
-Vsecurity_group_rule
-p2154
-(dp2155
-Vremote_group_id
-p2156
-NsVdirection
-p2157
-Vingress
-p2158
-sVprotocol
-p2159
-Vtcp
-p2160
-sVdescription
-p2161
-V
-sVethertype
-p2162
-VIPv4
-p2163
-sVremote_ip_prefix
-p2164
-V0.0.0.0/0
-p2165
-sVport_range_max
-p2166
-I65000
-sVsecurity_group_id
-p2167
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2168
-sVport_range_min
-p2169
-I1
-sVtenant_id
-p2170
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2171
-sVid
-p2172
-V9e28e6c6-9e72-4af4-adb1-9636ef06cce3
-p2173
-sssV_context_show_deleted
-p2174
-I00
-sVpriority
-p2175
-VINFO
-p2176
-sV_context_is_admin
-p2177
-I01
-sV_context_project_domain
-p2178
-NsV_context_user
-p2179
-Vef7a4f67379f41aba489a0b6d6a62094
-p2180
-sVpublisher_id
-p2181
-Vnetwork.machine-A
-p2182
-sVmessage_id
-p2183
-Vbfd5a81e-c09b-4c09-b83c-ddf514305503
-p2184
-sV_context_roles
-p2185
-(lp2186
-Vadmin
-p2187
-asVtimestamp
-p2188
-V2017-11-30 11:03:56.360749
-p2189
-sV_context_timestamp
-p2190
-V2017-11-30 11:03:56.307519
-p2191
-sV_unique_id
-p2192
-Vb60cc0f8e9674430ae639c7bec6d5f50
-p2193
-sV_context_tenant_id
-p2194
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2195
-sV_context_project_name
-p2196
-Vapexlake
-p2197
-sV_context_user_identity
-p2198
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2199
-sV_context_tenant
-p2200
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2201
-sV_context_project_id
-p2202
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2203
-sV_context_read_only
-p2204
-I00
-sV_context_user_domain
-p2205
-NsV_context_user_name
-p2206
-Violie
-p2207
-stp2208
-a(F4.5412759780883789
-Vsecurity_group_rule.create.start
-p2209
-(dp2210
-V_context_domain
-p2211
-NsV_context_request_id
-p2212
-Vreq-c94cc6f6-4452-402c-b506-97859e666744
-p2213
-sVevent_type
-p2214
-g2209
-sV_context_auth_token
-p2215
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2216
-sV_context_resource_uuid
-p2217
-NsV_context_tenant_name
-p2218
-Vapexlake
-p2219
-sV_context_user_id
-p2220
-Vef7a4f67379f41aba489a0b6d6a62094
-p2221
-sVpayload
-p2222
-(dp2223
-Vsecurity_group_rule
-p2224
-(dp2225
-Vremote_group_id
-p2226
-NsVdirection
-p2227
-Vingress
-p2228
-sVprotocol
-p2229
-Vtcp
-p2230
-sVremote_ip_prefix
-p2231
-V0.0.0.0/0
-p2232
-sVport_range_max
-p2233
-V7474
-p2234
-sVsecurity_group_id
-p2235
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2236
-sVport_range_min
-p2237
-V7474
-p2238
-sVethertype
-p2239
-VIPv4
-p2240
-sssV_context_show_deleted
-p2241
-I00
-sVpriority
-p2242
-VINFO
-p2243
-sV_context_is_admin
-p2244
-I01
-sV_context_project_domain
-p2245
-NsV_context_user
-p2246
-Vef7a4f67379f41aba489a0b6d6a62094
-p2247
-sVpublisher_id
-p2248
-Vnetwork.machine-A
-p2249
-sVmessage_id
-p2250
-V5e9e612e-f0dc-4ed1-99af-b4a04892588e
-p2251
-sV_context_roles
-p2252
-(lp2253
-Vadmin
-p2254
-asVtimestamp
-p2255
-V2017-11-30 11:03:56.371978
-p2256
-sV_context_timestamp
-p2257
-V2017-11-30 11:03:56.370838
-p2258
-sV_unique_id
-p2259
-Vc7181633abf0421890a9551c191b3576
-p2260
-sV_context_tenant_id
-p2261
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2262
-sV_context_project_name
-p2263
-Vapexlake
-p2264
-sV_context_user_identity
-p2265
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2266
-sV_context_tenant
-p2267
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2268
-sV_context_project_id
-p2269
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2270
-sV_context_read_only
-p2271
-I00
-sV_context_user_domain
-p2272
-NsV_context_user_name
-p2273
-Violie
-p2274
-stp2275
-a(F4.6039049625396729
-Vsecurity_group_rule.create.end
-p2276
-(dp2277
-V_context_domain
-p2278
-NsV_context_request_id
-p2279
-Vreq-c94cc6f6-4452-402c-b506-97859e666744
-p2280
-sVevent_type
-p2281
-g2276
-sV_context_auth_token
-p2282
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2283
-sV_context_resource_uuid
-p2284
-NsV_context_tenant_name
-p2285
-Vapexlake
-p2286
-sV_context_user_id
-p2287
-Vef7a4f67379f41aba489a0b6d6a62094
-p2288
-sVpayload
-p2289
-(dp2290
-Vsecurity_group_rule
-p2291
-(dp2292
-Vremote_group_id
-p2293
-NsVdirection
-p2294
-Vingress
-p2295
-sVprotocol
-p2296
-Vtcp
-p2297
-sVdescription
-p2298
-V
-sVethertype
-p2299
-VIPv4
-p2300
-sVremote_ip_prefix
-p2301
-V0.0.0.0/0
-p2302
-sVport_range_max
-p2303
-I7474
-sVsecurity_group_id
-p2304
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2305
-sVport_range_min
-p2306
-I7474
-sVtenant_id
-p2307
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2308
-sVid
-p2309
-Va8594551-41d6-483f-9e84-502d7efdb508
-p2310
-sssV_context_show_deleted
-p2311
-I00
-sVpriority
-p2312
-VINFO
-p2313
-sV_context_is_admin
-p2314
-I01
-sV_context_project_domain
-p2315
-NsV_context_user
-p2316
-Vef7a4f67379f41aba489a0b6d6a62094
-p2317
-sVpublisher_id
-p2318
-Vnetwork.machine-A
-p2319
-sVmessage_id
-p2320
-Vdcb1b5d8-bc82-424b-a84a-dc40fa17179c
-p2321
-sV_context_roles
-p2322
-(lp2323
-Vadmin
-p2324
-asVtimestamp
-p2325
-V2017-11-30 11:03:56.434024
-p2326
-sV_context_timestamp
-p2327
-V2017-11-30 11:03:56.370838
-p2328
-sV_unique_id
-p2329
-Vfc4a445274d9414ca3463e581729e997
-p2330
-sV_context_tenant_id
-p2331
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2332
-sV_context_project_name
-p2333
-Vapexlake
-p2334
-sV_context_user_identity
-p2335
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2336
-sV_context_tenant
-p2337
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2338
-sV_context_project_id
-p2339
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2340
-sV_context_read_only
-p2341
-I00
-sV_context_user_domain
-p2342
-NsV_context_user_name
-p2343
-Violie
-p2344
-stp2345
-a(F4.613631010055542
-Vsecurity_group_rule.create.start
-p2346
-(dp2347
-V_context_domain
-p2348
-NsV_context_request_id
-p2349
-Vreq-73f2d382-1db3-45aa-b553-64a4dda81478
-p2350
-sVevent_type
-p2351
-g2346
-sV_context_auth_token
-p2352
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2353
-sV_context_resource_uuid
-p2354
-NsV_context_tenant_name
-p2355
-Vapexlake
-p2356
-sV_context_user_id
-p2357
-Vef7a4f67379f41aba489a0b6d6a62094
-p2358
-sVpayload
-p2359
-(dp2360
-Vsecurity_group_rule
-p2361
-(dp2362
-Vremote_group_id
-p2363
-NsVdirection
-p2364
-Vingress
-p2365
-sVprotocol
-p2366
-Vicmp
-p2367
-sVremote_ip_prefix
-p2368
-V0.0.0.0/0
-p2369
-sVport_range_max
-p2370
-NsVsecurity_group_id
-p2371
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2372
-sVport_range_min
-p2373
-NsVethertype
-p2374
-VIPv4
-p2375
-sssV_context_show_deleted
-p2376
-I00
-sVpriority
-p2377
-VINFO
-p2378
-sV_context_is_admin
-p2379
-I01
-sV_context_project_domain
-p2380
-NsV_context_user
-p2381
-Vef7a4f67379f41aba489a0b6d6a62094
-p2382
-sVpublisher_id
-p2383
-Vnetwork.machine-A
-p2384
-sVmessage_id
-p2385
-V1d46c6f0-2cd7-4653-b7c0-319d9eb9d7b8
-p2386
-sV_context_roles
-p2387
-(lp2388
-Vadmin
-p2389
-asVtimestamp
-p2390
-V2017-11-30 11:03:56.444496
-p2391
-sV_context_timestamp
-p2392
-V2017-11-30 11:03:56.443423
-p2393
-sV_unique_id
-p2394
-V03f04b3224b044b39e286623a8ff8fae
-p2395
-sV_context_tenant_id
-p2396
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2397
-sV_context_project_name
-p2398
-Vapexlake
-p2399
-sV_context_user_identity
-p2400
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2401
-sV_context_tenant
-p2402
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2403
-sV_context_project_id
-p2404
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2405
-sV_context_read_only
-p2406
-I00
-sV_context_user_domain
-p2407
-NsV_context_user_name
-p2408
-Violie
-p2409
-stp2410
-a(F4.6648530960083008
-Vsecurity_group_rule.create.end
-p2411
-(dp2412
-V_context_domain
-p2413
-NsV_context_request_id
-p2414
-Vreq-73f2d382-1db3-45aa-b553-64a4dda81478
-p2415
-sVevent_type
-p2416
-g2411
-sV_context_auth_token
-p2417
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2418
-sV_context_resource_uuid
-p2419
-NsV_context_tenant_name
-p2420
-Vapexlake
-p2421
-sV_context_user_id
-p2422
-Vef7a4f67379f41aba489a0b6d6a62094
-p2423
-sVpayload
-p2424
-(dp2425
-Vsecurity_group_rule
-p2426
-(dp2427
-Vremote_group_id
-p2428
-NsVdirection
-p2429
-Vingress
-p2430
-sVprotocol
-p2431
-Vicmp
-p2432
-sVdescription
-p2433
-V
-sVethertype
-p2434
-VIPv4
-p2435
-sVremote_ip_prefix
-p2436
-V0.0.0.0/0
-p2437
-sVport_range_max
-p2438
-NsVsecurity_group_id
-p2439
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2440
-sVport_range_min
-p2441
-NsVtenant_id
-p2442
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2443
-sVid
-p2444
-V05ca3f24-9c39-4c2a-98a9-a9729a6aeb09
-p2445
-sssV_context_show_deleted
-p2446
-I00
-sVpriority
-p2447
-VINFO
-p2448
-sV_context_is_admin
-p2449
-I01
-sV_context_project_domain
-p2450
-NsV_context_user
-p2451
-Vef7a4f67379f41aba489a0b6d6a62094
-p2452
-sVpublisher_id
-p2453
-Vnetwork.machine-A
-p2454
-sVmessage_id
-p2455
-Vb5f90258-f74e-4986-b955-4720603a36e1
-p2456
-sV_context_roles
-p2457
-(lp2458
-Vadmin
-p2459
-asVtimestamp
-p2460
-V2017-11-30 11:03:56.495674
-p2461
-sV_context_timestamp
-p2462
-V2017-11-30 11:03:56.443423
-p2463
-sV_unique_id
-p2464
-V8fa53de55d0242e4ba5a959dc44c002f
-p2465
-sV_context_tenant_id
-p2466
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2467
-sV_context_project_name
-p2468
-Vapexlake
-p2469
-sV_context_user_identity
-p2470
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2471
-sV_context_tenant
-p2472
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2473
-sV_context_project_id
-p2474
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2475
-sV_context_read_only
-p2476
-I00
-sV_context_user_domain
-p2477
-NsV_context_user_name
-p2478
-Violie
-p2479
-stp2480
-a(F4.7027549743652344
-Vport.create.start
-p2481
-(dp2482
-V_context_domain
-p2483
-NsV_context_request_id
-p2484
-Vreq-b3dccf43-ceca-4aff-b24b-f58e166fec3a
-p2485
-sVevent_type
-p2486
-g2481
-sV_context_auth_token
-p2487
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2488
-sV_context_resource_uuid
-p2489
-NsV_context_tenant_name
-p2490
-Vapexlake
-p2491
-sV_context_user_id
-p2492
-Vef7a4f67379f41aba489a0b6d6a62094
-p2493
-sVpayload
-p2494
-(dp2495
-Vport
-p2496
-(dp2497
-Vnetwork_id
-p2498
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p2499
-sVfixed_ips
-p2500
-(lp2501
-(dp2502
-Vsubnet_id
-p2503
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p2504
-sasVname
-p2505
-VB-server_port-hw2ilvbsf7dq
-p2506
-sVsecurity_groups
-p2507
-(lp2508
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2509
-asVadmin_state_up
-p2510
-I01
-sssV_context_show_deleted
-p2511
-I00
-sVpriority
-p2512
-VINFO
-p2513
-sV_context_is_admin
-p2514
-I01
-sV_context_project_domain
-p2515
-NsV_context_user
-p2516
-Vef7a4f67379f41aba489a0b6d6a62094
-p2517
-sVpublisher_id
-p2518
-Vnetwork.machine-A
-p2519
-sVmessage_id
-p2520
-Vadc30e09-ea80-494b-8475-935bbaf08035
-p2521
-sV_context_roles
-p2522
-(lp2523
-Vadmin
-p2524
-asVtimestamp
-p2525
-V2017-11-30 11:03:56.533576
-p2526
-sV_context_timestamp
-p2527
-V2017-11-30 11:03:56.532476
-p2528
-sV_unique_id
-p2529
-V7f3f8191163049699c079d1361da5e80
-p2530
-sV_context_tenant_id
-p2531
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2532
-sV_context_project_name
-p2533
-Vapexlake
-p2534
-sV_context_user_identity
-p2535
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2536
-sV_context_tenant
-p2537
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2538
-sV_context_project_id
-p2539
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2540
-sV_context_read_only
-p2541
-I00
-sV_context_user_domain
-p2542
-NsV_context_user_name
-p2543
-Violie
-p2544
-stp2545
-a(F4.9592490196228027
-Vport.create.end
-p2546
-(dp2547
-V_context_domain
-p2548
-NsV_context_request_id
-p2549
-Vreq-b3dccf43-ceca-4aff-b24b-f58e166fec3a
-p2550
-sVevent_type
-p2551
-g2546
-sV_context_auth_token
-p2552
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p2553
-sV_context_resource_uuid
-p2554
-NsV_context_tenant_name
-p2555
-Vapexlake
-p2556
-sV_context_user_id
-p2557
-Vef7a4f67379f41aba489a0b6d6a62094
-p2558
-sVpayload
-p2559
-(dp2560
-Vport
-p2561
-(dp2562
-Vallowed_address_pairs
-p2563
-(lp2564
-sVextra_dhcp_opts
-p2565
-(lp2566
-sVupdated_at
-p2567
-V2017-11-30T11:03:56
-p2568
-sVdevice_owner
-p2569
-V
-sVbinding:profile
-p2570
-(dp2571
-sVport_security_enabled
-p2572
-I01
-sVfixed_ips
-p2573
-(lp2574
-(dp2575
-Vsubnet_id
-p2576
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p2577
-sVip_address
-p2578
-V172.16.9.144
-p2579
-sasVid
-p2580
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p2581
-sVsecurity_groups
-p2582
-(lp2583
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p2584
-asVbinding:vif_details
-p2585
-(dp2586
-sVbinding:vif_type
-p2587
-Vunbound
-p2588
-sVmac_address
-p2589
-Vfa:16:3e:e7:da:1b
-p2590
-sVstatus
-p2591
-VDOWN
-p2592
-sVbinding:host_id
-p2593
-V
-sVdescription
-p2594
-V
-sVdns_assignment
-p2595
-(lp2596
-(dp2597
-Vhostname
-p2598
-Vhost-172-16-9-144
-p2599
-sg2578
-V172.16.9.144
-p2600
-sVfqdn
-p2601
-Vhost-172-16-9-144.openstacklocal.
-p2602
-sasVdevice_id
-p2603
-V
-sVname
-p2604
-VB-server_port-hw2ilvbsf7dq
-p2605
-sVadmin_state_up
-p2606
-I01
-sVnetwork_id
-p2607
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p2608
-sVdns_name
-p2609
-V
-sVcreated_at
-p2610
-V2017-11-30T11:03:56
-p2611
-sVbinding:vnic_type
-p2612
-Vnormal
-p2613
-sVtenant_id
-p2614
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2615
-sssV_context_show_deleted
-p2616
-I00
-sVpriority
-p2617
-VINFO
-p2618
-sV_context_is_admin
-p2619
-I01
-sV_context_project_domain
-p2620
-NsV_context_user
-p2621
-Vef7a4f67379f41aba489a0b6d6a62094
-p2622
-sVpublisher_id
-p2623
-Vnetwork.machine-A
-p2624
-sVmessage_id
-p2625
-V1851a516-122d-4b04-b330-826fb33e0a60
-p2626
-sV_context_roles
-p2627
-(lp2628
-Vadmin
-p2629
-asVtimestamp
-p2630
-V2017-11-30 11:03:56.789402
-p2631
-sV_context_timestamp
-p2632
-V2017-11-30 11:03:56.532476
-p2633
-sV_unique_id
-p2634
-V2fe146385c084aa88e77a3c86d079b56
-p2635
-sV_context_tenant_id
-p2636
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2637
-sV_context_project_name
-p2638
-Vapexlake
-p2639
-sV_context_user_identity
-p2640
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2641
-sV_context_tenant
-p2642
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2643
-sV_context_project_id
-p2644
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2645
-sV_context_read_only
-p2646
-I00
-sV_context_user_domain
-p2647
-NsV_context_user_name
-p2648
-Violie
-p2649
-stp2650
-a(F5.0330371856689453
-Vcompute.instance.update
-p2651
-(dp2652
-V_context_domain
-p2653
-NsV_context_request_id
-p2654
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p2655
-sV_context_quota_class
-p2656
-NsVevent_type
-p2657
-g2651
-sV_context_service_catalog
-p2658
-(lp2659
-(dp2660
-Vendpoints
-p2661
-(lp2662
-(dp2663
-VadminURL
-p2664
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2665
-sVregion
-p2666
-VRegionOne
-p2667
-sVinternalURL
-p2668
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2669
-sVpublicURL
-p2670
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2671
-sasVtype
-p2672
-Vvolume
-p2673
-sVname
-p2674
-Vcinder
-p2675
-sa(dp2676
-g2661
-(lp2677
-(dp2678
-g2664
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2679
-sg2666
-VRegionOne
-p2680
-sg2668
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2681
-sg2670
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2682
-sasg2672
-Vvolumev2
-p2683
-sg2674
-Vcinderv2
-p2684
-sasV_context_auth_token
-p2685
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p2686
-sV_context_resource_uuid
-p2687
-NsV_context_user_id
-p2688
-Vef7a4f67379f41aba489a0b6d6a62094
-p2689
-sVpayload
-p2690
-(dp2691
-Vstate_description
-p2692
-Vscheduling
-p2693
-sVavailability_zone
-p2694
-Vnova
-p2695
-sVterminated_at
-p2696
-V
-sVephemeral_gb
-p2697
-I0
-sVinstance_type_id
-p2698
-I1
-sVbandwidth
-p2699
-(dp2700
-sVdeleted_at
-p2701
-V
-sVreservation_id
-p2702
-Vr-61su4ljd
-p2703
-sVmemory_mb
-p2704
-I4096
-sVdisplay_name
-p2705
-Vvm_test
-p2706
-sVhostname
-p2707
-Vvm-test
-p2708
-sVstate
-p2709
-Vbuilding
-p2710
-sVold_state
-p2711
-Vbuilding
-p2712
-sVprogress
-p2713
-V
-sVlaunched_at
-p2714
-V
-sVmetadata
-p2715
-(dp2716
-sVnode
-p2717
-NsVramdisk_id
-p2718
-V
-sVaccess_ip_v6
-p2719
-NsVdisk_gb
-p2720
-I40
-sVaccess_ip_v4
-p2721
-NsVkernel_id
-p2722
-V
-sVhost
-p2723
-NsVuser_id
-p2724
-Vef7a4f67379f41aba489a0b6d6a62094
-p2725
-sVimage_ref_url
-p2726
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2727
-sVcell_name
-p2728
-V
-sVaudit_period_beginning
-p2729
-V2017-11-01T00:00:00.000000
-p2730
-sVroot_gb
-p2731
-I40
-sVtenant_id
-p2732
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2733
-sVcreated_at
-p2734
-V2017-11-30T11:03:56.818428
-p2735
-sVold_task_state
-p2736
-Vscheduling
-p2737
-sVinstance_id
-p2738
-Va7115aef-929d-454e-9eba-eff685db7a15
-p2739
-sVinstance_type
-p2740
-Vm1.medium
-p2741
-sVvcpus
-p2742
-I2
-sVimage_meta
-p2743
-(dp2744
-Vmin_disk
-p2745
-V40
-p2746
-sVcontainer_format
-p2747
-Vbare
-p2748
-sVmin_ram
-p2749
-V0
-sVdisk_format
-p2750
-Vqcow2
-p2751
-sVbase_image_ref
-p2752
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2753
-ssVarchitecture
-p2754
-NsVnew_task_state
-p2755
-Vscheduling
-p2756
-sVaudit_period_ending
-p2757
-V2017-11-30T11:03:56.853360
-p2758
-sVos_type
-p2759
-NsVinstance_flavor_id
-p2760
-V3
-ssV_context_show_deleted
-p2761
-I00
-sVpriority
-p2762
-VINFO
-p2763
-sV_context_is_admin
-p2764
-I01
-sV_context_project_domain
-p2765
-NsV_context_user
-p2766
-Vef7a4f67379f41aba489a0b6d6a62094
-p2767
-sVpublisher_id
-p2768
-Vapi.machine-A
-p2769
-sVmessage_id
-p2770
-V946ef978-e8e6-4fbc-af6f-d6c92e7a72fb
-p2771
-sV_context_remote_address
-p2772
-V172.16.0.5
-p2773
-sV_context_roles
-p2774
-(lp2775
-Vadmin
-p2776
-asVtimestamp
-p2777
-V2017-11-30 11:03:56.858470
-p2778
-sV_context_timestamp
-p2779
-V2017-11-30T11:03:56.348377
-p2780
-sV_unique_id
-p2781
-V4715c09666384ae39a16279048e1efcc
-p2782
-sV_context_project_name
-p2783
-Vapexlake
-p2784
-sV_context_read_deleted
-p2785
-Vno
-p2786
-sV_context_user_identity
-p2787
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2788
-sV_context_tenant
-p2789
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2790
-sV_context_instance_lock_checked
-p2791
-I00
-sV_context_project_id
-p2792
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2793
-sV_context_read_only
-p2794
-I00
-sV_context_user_domain
-p2795
-NsV_context_user_name
-p2796
-Violie
-p2797
-stp2798
-a(F5.0735311508178711
-Vscheduler.select_destinations.start
-p2799
-(dp2800
-V_context_domain
-p2801
-NsV_context_request_id
-p2802
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p2803
-sV_context_quota_class
-p2804
-NsVevent_type
-p2805
-g2799
-sV_context_service_catalog
-p2806
-(lp2807
-(dp2808
-Vendpoints
-p2809
-(lp2810
-(dp2811
-VadminURL
-p2812
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2813
-sVregion
-p2814
-VRegionOne
-p2815
-sVinternalURL
-p2816
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2817
-sVpublicURL
-p2818
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2819
-sasVtype
-p2820
-Vvolume
-p2821
-sVname
-p2822
-Vcinder
-p2823
-sa(dp2824
-g2809
-(lp2825
-(dp2826
-g2812
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2827
-sg2814
-VRegionOne
-p2828
-sg2816
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2829
-sg2818
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2830
-sasg2820
-Vvolumev2
-p2831
-sg2822
-Vcinderv2
-p2832
-sasV_context_auth_token
-p2833
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p2834
-sV_context_resource_uuid
-p2835
-NsV_context_user_id
-p2836
-Vef7a4f67379f41aba489a0b6d6a62094
-p2837
-sVpayload
-p2838
-(dp2839
-Vrequest_spec
-p2840
-(dp2841
-Vinstance_properties
-p2842
-(dp2843
-Vroot_gb
-p2844
-I40
-sVuuid
-p2845
-Va7115aef-929d-454e-9eba-eff685db7a15
-p2846
-sVavailability_zone
-p2847
-Vnova
-p2848
-sVephemeral_gb
-p2849
-I0
-sVnuma_topology
-p2850
-NsVmemory_mb
-p2851
-I4096
-sVvcpus
-p2852
-I2
-sVproject_id
-p2853
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2854
-sVpci_requests
-p2855
-(dp2856
-Vinstance_uuid
-p2857
-Va7115aef-929d-454e-9eba-eff685db7a15
-p2858
-sVrequests
-p2859
-(lp2860
-sssVinstance_type
-p2861
-(dp2862
-Vdisabled
-p2863
-I00
-sg2844
-I40
-sg2822
-Vm1.medium
-p2864
-sVflavorid
-p2865
-V3
-sVdeleted
-p2866
-I00
-sVcreated_at
-p2867
-Nsg2849
-I0
-sVupdated_at
-p2868
-Nsg2851
-I4096
-sg2852
-I2
-sVextra_specs
-p2869
-(dp2870
-sVswap
-p2871
-I0
-sVrxtx_factor
-p2872
-F1
-sVis_public
-p2873
-I01
-sVdeleted_at
-p2874
-NsVvcpu_weight
-p2875
-I0
-sVid
-p2876
-I1
-ssVimage
-p2877
-(dp2878
-Vstatus
-p2879
-Vactive
-p2880
-sg2822
-Vubuntu1404
-p2881
-sVcontainer_format
-p2882
-Vbare
-p2883
-sg2867
-V2017-07-01T10:51:05.000000
-p2884
-sVdisk_format
-p2885
-Vqcow2
-p2886
-sg2868
-V2017-07-01T10:51:08.000000
-p2887
-sg2876
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2888
-sVmin_disk
-p2889
-I2
-sVmin_ram
-p2890
-I0
-sVchecksum
-p2891
-V6ad21b1699bcc4cbc02936bf1e915911
-p2892
-sVowner
-p2893
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2894
-sVproperties
-p2895
-(dp2896
-sVsize
-p2897
-I262144512
-ssVnum_instances
-p2898
-I1
-sssV_context_show_deleted
-p2899
-I00
-sVpriority
-p2900
-VINFO
-p2901
-sV_context_is_admin
-p2902
-I01
-sV_context_project_domain
-p2903
-NsV_context_user
-p2904
-Vef7a4f67379f41aba489a0b6d6a62094
-p2905
-sVpublisher_id
-p2906
-Vscheduler.machine-A
-p2907
-sVmessage_id
-p2908
-Vf6f1efa1-193c-497c-bf4a-38529d025a41
-p2909
-sV_context_remote_address
-p2910
-V172.16.0.5
-p2911
-sV_context_roles
-p2912
-(lp2913
-Vadmin
-p2914
-asVtimestamp
-p2915
-V2017-11-30 11:03:56.903717
-p2916
-sV_context_timestamp
-p2917
-V2017-11-30T11:03:56.348377
-p2918
-sV_unique_id
-p2919
-V0e4c7faa56a343798cfad9e43ef71760
-p2920
-sV_context_project_name
-p2921
-Vapexlake
-p2922
-sV_context_read_deleted
-p2923
-Vno
-p2924
-sV_context_user_identity
-p2925
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2926
-sV_context_tenant
-p2927
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2928
-sV_context_instance_lock_checked
-p2929
-I00
-sV_context_project_id
-p2930
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2931
-sV_context_read_only
-p2932
-I00
-sV_context_user_domain
-p2933
-NsV_context_user_name
-p2934
-Violie
-p2935
-stp2936
-a(F5.1094131469726562
-Vscheduler.select_destinations.end
-p2937
-(dp2938
-V_context_domain
-p2939
-NsV_context_request_id
-p2940
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p2941
-sV_context_quota_class
-p2942
-NsVevent_type
-p2943
-g2937
-sV_context_service_catalog
-p2944
-(lp2945
-(dp2946
-Vendpoints
-p2947
-(lp2948
-(dp2949
-VadminURL
-p2950
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2951
-sVregion
-p2952
-VRegionOne
-p2953
-sVinternalURL
-p2954
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2955
-sVpublicURL
-p2956
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2957
-sasVtype
-p2958
-Vvolume
-p2959
-sVname
-p2960
-Vcinder
-p2961
-sa(dp2962
-g2947
-(lp2963
-(dp2964
-g2950
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2965
-sg2952
-VRegionOne
-p2966
-sg2954
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2967
-sg2956
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2968
-sasg2958
-Vvolumev2
-p2969
-sg2960
-Vcinderv2
-p2970
-sasV_context_auth_token
-p2971
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p2972
-sV_context_resource_uuid
-p2973
-NsV_context_user_id
-p2974
-Vef7a4f67379f41aba489a0b6d6a62094
-p2975
-sVpayload
-p2976
-(dp2977
-Vrequest_spec
-p2978
-(dp2979
-Vinstance_properties
-p2980
-(dp2981
-Vroot_gb
-p2982
-I40
-sVuuid
-p2983
-Va7115aef-929d-454e-9eba-eff685db7a15
-p2984
-sVavailability_zone
-p2985
-Vnova
-p2986
-sVephemeral_gb
-p2987
-I0
-sVnuma_topology
-p2988
-NsVmemory_mb
-p2989
-I4096
-sVvcpus
-p2990
-I2
-sVproject_id
-p2991
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2992
-sVpci_requests
-p2993
-(dp2994
-Vinstance_uuid
-p2995
-Va7115aef-929d-454e-9eba-eff685db7a15
-p2996
-sVrequests
-p2997
-(lp2998
-sssVinstance_type
-p2999
-(dp3000
-Vdisabled
-p3001
-I00
-sg2982
-I40
-sg2960
-Vm1.medium
-p3002
-sVflavorid
-p3003
-V3
-sVdeleted
-p3004
-I00
-sVcreated_at
-p3005
-Nsg2987
-I0
-sVupdated_at
-p3006
-Nsg2989
-I4096
-sg2990
-I2
-sVextra_specs
-p3007
-(dp3008
-sVswap
-p3009
-I0
-sVrxtx_factor
-p3010
-F1
-sVis_public
-p3011
-I01
-sVdeleted_at
-p3012
-NsVvcpu_weight
-p3013
-I0
-sVid
-p3014
-I1
-ssVimage
-p3015
-(dp3016
-Vstatus
-p3017
-Vactive
-p3018
-sg2960
-Vubuntu1404
-p3019
-sVcontainer_format
-p3020
-Vbare
-p3021
-sg3005
-V2017-07-01T10:51:05.000000
-p3022
-sVdisk_format
-p3023
-Vqcow2
-p3024
-sg3006
-V2017-07-01T10:51:08.000000
-p3025
-sg3014
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3026
-sVmin_disk
-p3027
-I2
-sVmin_ram
-p3028
-I0
-sVchecksum
-p3029
-V6ad21b1699bcc4cbc02936bf1e915911
-p3030
-sVowner
-p3031
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3032
-sVproperties
-p3033
-(dp3034
-sVsize
-p3035
-I262144512
-ssVnum_instances
-p3036
-I1
-sssV_context_show_deleted
-p3037
-I00
-sVpriority
-p3038
-VINFO
-p3039
-sV_context_is_admin
-p3040
-I01
-sV_context_project_domain
-p3041
-NsV_context_user
-p3042
-Vef7a4f67379f41aba489a0b6d6a62094
-p3043
-sVpublisher_id
-p3044
-Vscheduler.machine-A
-p3045
-sVmessage_id
-p3046
-V23f402cb-164d-4508-84c4-e31cc77e3bd4
-p3047
-sV_context_remote_address
-p3048
-V172.16.0.5
-p3049
-sV_context_roles
-p3050
-(lp3051
-Vadmin
-p3052
-asVtimestamp
-p3053
-V2017-11-30 11:03:56.939512
-p3054
-sV_context_timestamp
-p3055
-V2017-11-30T11:03:56.348377
-p3056
-sV_unique_id
-p3057
-Vd716b7efefd74d5f9cdb17fbcb790875
-p3058
-sV_context_project_name
-p3059
-Vapexlake
-p3060
-sV_context_read_deleted
-p3061
-Vno
-p3062
-sV_context_user_identity
-p3063
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3064
-sV_context_tenant
-p3065
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3066
-sV_context_instance_lock_checked
-p3067
-I00
-sV_context_project_id
-p3068
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3069
-sV_context_read_only
-p3070
-I00
-sV_context_user_domain
-p3071
-NsV_context_user_name
-p3072
-Violie
-p3073
-stp3074
-a(F5.2556331157684326
-Vcompute.instance.update
-p3075
-(dp3076
-V_context_domain
-p3077
-NsV_context_request_id
-p3078
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p3079
-sV_context_quota_class
-p3080
-NsVevent_type
-p3081
-g3075
-sV_context_service_catalog
-p3082
-(lp3083
-(dp3084
-Vendpoints
-p3085
-(lp3086
-(dp3087
-VadminURL
-p3088
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3089
-sVregion
-p3090
-VRegionOne
-p3091
-sVinternalURL
-p3092
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3093
-sVpublicURL
-p3094
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3095
-sasVtype
-p3096
-Vvolume
-p3097
-sVname
-p3098
-Vcinder
-p3099
-sa(dp3100
-g3085
-(lp3101
-(dp3102
-g3088
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3103
-sg3090
-VRegionOne
-p3104
-sg3092
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3105
-sg3094
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3106
-sasg3096
-Vvolumev2
-p3107
-sg3098
-Vcinderv2
-p3108
-sasV_context_auth_token
-p3109
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p3110
-sV_context_resource_uuid
-p3111
-NsV_context_user_id
-p3112
-Vef7a4f67379f41aba489a0b6d6a62094
-p3113
-sVpayload
-p3114
-(dp3115
-Vstate_description
-p3116
-V
-sVavailability_zone
-p3117
-Vnova
-p3118
-sVterminated_at
-p3119
-V
-sVephemeral_gb
-p3120
-I0
-sVinstance_type_id
-p3121
-I1
-sVbandwidth
-p3122
-(dp3123
-sVdeleted_at
-p3124
-V
-sVreservation_id
-p3125
-Vr-61su4ljd
-p3126
-sVmemory_mb
-p3127
-I4096
-sVdisplay_name
-p3128
-Vvm_test
-p3129
-sVhostname
-p3130
-Vvm-test
-p3131
-sVstate
-p3132
-Vbuilding
-p3133
-sVold_state
-p3134
-Vbuilding
-p3135
-sVprogress
-p3136
-V
-sVlaunched_at
-p3137
-V
-sVmetadata
-p3138
-(dp3139
-sVnode
-p3140
-NsVramdisk_id
-p3141
-V
-sVaccess_ip_v6
-p3142
-NsVdisk_gb
-p3143
-I40
-sVaccess_ip_v4
-p3144
-NsVkernel_id
-p3145
-V
-sVhost
-p3146
-NsVuser_id
-p3147
-Vef7a4f67379f41aba489a0b6d6a62094
-p3148
-sVimage_ref_url
-p3149
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3150
-sVcell_name
-p3151
-V
-sVaudit_period_beginning
-p3152
-V2017-11-01T00:00:00.000000
-p3153
-sVroot_gb
-p3154
-I40
-sVtenant_id
-p3155
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3156
-sVcreated_at
-p3157
-V2017-11-30T11:03:57.000000
-p3158
-sVold_task_state
-p3159
-Vscheduling
-p3160
-sVinstance_id
-p3161
-Va7115aef-929d-454e-9eba-eff685db7a15
-p3162
-sVinstance_type
-p3163
-Vm1.medium
-p3164
-sVvcpus
-p3165
-I2
-sVimage_meta
-p3166
-(dp3167
-Vmin_disk
-p3168
-V40
-p3169
-sVcontainer_format
-p3170
-Vbare
-p3171
-sVmin_ram
-p3172
-V0
-sVdisk_format
-p3173
-Vqcow2
-p3174
-sVbase_image_ref
-p3175
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3176
-ssVarchitecture
-p3177
-NsVnew_task_state
-p3178
-NsVaudit_period_ending
-p3179
-V2017-11-30T11:03:57.080374
-p3180
-sVos_type
-p3181
-NsVinstance_flavor_id
-p3182
-V3
-ssV_context_show_deleted
-p3183
-I00
-sVpriority
-p3184
-VINFO
-p3185
-sV_context_is_admin
-p3186
-I01
-sV_context_project_domain
-p3187
-NsV_context_user
-p3188
-Vef7a4f67379f41aba489a0b6d6a62094
-p3189
-sVpublisher_id
-p3190
-Vcompute.machine-A
-p3191
-sVmessage_id
-p3192
-V6a79deaa-e477-41e7-b891-48c9a82c50b5
-p3193
-sV_context_remote_address
-p3194
-V172.16.0.5
-p3195
-sV_context_roles
-p3196
-(lp3197
-Vadmin
-p3198
-asVtimestamp
-p3199
-V2017-11-30 11:03:57.083643
-p3200
-sV_context_timestamp
-p3201
-V2017-11-30T11:03:56.348377
-p3202
-sV_unique_id
-p3203
-Vfbf12068eded4237b3770b7d47cfc152
-p3204
-sV_context_project_name
-p3205
-Vapexlake
-p3206
-sV_context_read_deleted
-p3207
-Vno
-p3208
-sV_context_user_identity
-p3209
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3210
-sV_context_tenant
-p3211
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3212
-sV_context_instance_lock_checked
-p3213
-I00
-sV_context_project_id
-p3214
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3215
-sV_context_read_only
-p3216
-I00
-sV_context_user_domain
-p3217
-NsV_context_user_name
-p3218
-Violie
-p3219
-stp3220
-a(F5.2640230655670166
-Vcompute.instance.create.start
-p3221
-(dp3222
-V_context_domain
-p3223
-NsV_context_request_id
-p3224
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p3225
-sV_context_quota_class
-p3226
-NsVevent_type
-p3227
-g3221
-sV_context_service_catalog
-p3228
-(lp3229
-(dp3230
-Vendpoints
-p3231
-(lp3232
-(dp3233
-VadminURL
-p3234
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3235
-sVregion
-p3236
-VRegionOne
-p3237
-sVinternalURL
-p3238
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3239
-sVpublicURL
-p3240
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3241
-sasVtype
-p3242
-Vvolume
-p3243
-sVname
-p3244
-Vcinder
-p3245
-sa(dp3246
-g3231
-(lp3247
-(dp3248
-g3234
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3249
-sg3236
-VRegionOne
-p3250
-sg3238
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3251
-sg3240
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3252
-sasg3242
-Vvolumev2
-p3253
-sg3244
-Vcinderv2
-p3254
-sasV_context_auth_token
-p3255
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p3256
-sV_context_resource_uuid
-p3257
-NsV_context_user_id
-p3258
-Vef7a4f67379f41aba489a0b6d6a62094
-p3259
-sVpayload
-p3260
-(dp3261
-Vstate_description
-p3262
-V
-sVavailability_zone
-p3263
-Vnova
-p3264
-sVterminated_at
-p3265
-V
-sVephemeral_gb
-p3266
-I0
-sVinstance_type_id
-p3267
-I1
-sVdeleted_at
-p3268
-V
-sVreservation_id
-p3269
-Vr-61su4ljd
-p3270
-sVmemory_mb
-p3271
-I4096
-sVdisplay_name
-p3272
-Vvm_test
-p3273
-sVhostname
-p3274
-Vvm-test
-p3275
-sVstate
-p3276
-Vbuilding
-p3277
-sVprogress
-p3278
-V
-sVlaunched_at
-p3279
-V
-sVmetadata
-p3280
-(dp3281
-sVnode
-p3282
-NsVramdisk_id
-p3283
-V
-sVaccess_ip_v6
-p3284
-NsVdisk_gb
-p3285
-I40
-sVaccess_ip_v4
-p3286
-NsVkernel_id
-p3287
-V
-sVimage_name
-p3288
-Vubuntu1404
-p3289
-sVhost
-p3290
-NsVuser_id
-p3291
-Vef7a4f67379f41aba489a0b6d6a62094
-p3292
-sVimage_ref_url
-p3293
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3294
-sVcell_name
-p3295
-V
-sVroot_gb
-p3296
-I40
-sVtenant_id
-p3297
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3298
-sVcreated_at
-p3299
-V2017-11-30T11:03:57.000000
-p3300
-sVinstance_id
-p3301
-Va7115aef-929d-454e-9eba-eff685db7a15
-p3302
-sVinstance_type
-p3303
-Vm1.medium
-p3304
-sVvcpus
-p3305
-I2
-sVimage_meta
-p3306
-(dp3307
-Vmin_disk
-p3308
-V40
-p3309
-sVcontainer_format
-p3310
-Vbare
-p3311
-sVmin_ram
-p3312
-V0
-sVdisk_format
-p3313
-Vqcow2
-p3314
-sVbase_image_ref
-p3315
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3316
-ssVarchitecture
-p3317
-NsVos_type
-p3318
-NsVinstance_flavor_id
-p3319
-V3
-ssV_context_show_deleted
-p3320
-I00
-sVpriority
-p3321
-VINFO
-p3322
-sV_context_is_admin
-p3323
-I01
-sV_context_project_domain
-p3324
-NsV_context_user
-p3325
-Vef7a4f67379f41aba489a0b6d6a62094
-p3326
-sVpublisher_id
-p3327
-Vcompute.machine-B
-p3328
-sVmessage_id
-p3329
-Vb5351372-e721-4ca9-87f0-ed3bcf7443c5
-p3330
-sV_context_remote_address
-p3331
-V172.16.0.5
-p3332
-sV_context_roles
-p3333
-(lp3334
-Vadmin
-p3335
-asVtimestamp
-p3336
-V2017-11-30 11:03:57.095191
-p3337
-sV_context_timestamp
-p3338
-V2017-11-30T11:03:56.348377
-p3339
-sV_unique_id
-p3340
-V88492e349fa94e089e50acb99d5ca24c
-p3341
-sV_context_project_name
-p3342
-Vapexlake
-p3343
-sV_context_read_deleted
-p3344
-Vno
-p3345
-sV_context_user_identity
-p3346
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3347
-sV_context_tenant
-p3348
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3349
-sV_context_instance_lock_checked
-p3350
-I00
-sV_context_project_id
-p3351
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3352
-sV_context_read_only
-p3353
-I00
-sV_context_user_domain
-p3354
-NsV_context_user_name
-p3355
-Violie
-p3356
-stp3357
-a(F5.3550610542297363
-Vcompute.instance.update
-p3358
-(dp3359
-V_context_domain
-p3360
-NsV_context_request_id
-p3361
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p3362
-sV_context_quota_class
-p3363
-NsVevent_type
-p3364
-g3358
-sV_context_service_catalog
-p3365
-(lp3366
-(dp3367
-Vendpoints
-p3368
-(lp3369
-(dp3370
-VadminURL
-p3371
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3372
-sVregion
-p3373
-VRegionOne
-p3374
-sVinternalURL
-p3375
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3376
-sVpublicURL
-p3377
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3378
-sasVtype
-p3379
-Vvolume
-p3380
-sVname
-p3381
-Vcinder
-p3382
-sa(dp3383
-g3368
-(lp3384
-(dp3385
-g3371
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3386
-sg3373
-VRegionOne
-p3387
-sg3375
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3388
-sg3377
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3389
-sasg3379
-Vvolumev2
-p3390
-sg3381
-Vcinderv2
-p3391
-sasV_context_auth_token
-p3392
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p3393
-sV_context_resource_uuid
-p3394
-NsV_context_user_id
-p3395
-Vef7a4f67379f41aba489a0b6d6a62094
-p3396
-sVpayload
-p3397
-(dp3398
-Vstate_description
-p3399
-V
-sVavailability_zone
-p3400
-Vnova
-p3401
-sVterminated_at
-p3402
-V
-sVephemeral_gb
-p3403
-I0
-sVinstance_type_id
-p3404
-I1
-sVbandwidth
-p3405
-(dp3406
-sVdeleted_at
-p3407
-V
-sVreservation_id
-p3408
-Vr-61su4ljd
-p3409
-sVmemory_mb
-p3410
-I4096
-sVdisplay_name
-p3411
-Vvm_test
-p3412
-sVhostname
-p3413
-Vvm-test
-p3414
-sVstate
-p3415
-Vbuilding
-p3416
-sVold_state
-p3417
-Vbuilding
-p3418
-sVprogress
-p3419
-V
-sVlaunched_at
-p3420
-V
-sVmetadata
-p3421
-(dp3422
-sVnode
-p3423
-Vmachine-B
-p3424
-sVramdisk_id
-p3425
-V
-sVaccess_ip_v6
-p3426
-NsVdisk_gb
-p3427
-I40
-sVaccess_ip_v4
-p3428
-NsVkernel_id
-p3429
-V
-sVhost
-p3430
-Vmachine-B
-p3431
-sVuser_id
-p3432
-Vef7a4f67379f41aba489a0b6d6a62094
-p3433
-sVimage_ref_url
-p3434
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3435
-sVcell_name
-p3436
-V
-sVaudit_period_beginning
-p3437
-V2017-11-01T00:00:00.000000
-p3438
-sVroot_gb
-p3439
-I40
-sVtenant_id
-p3440
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3441
-sVcreated_at
-p3442
-V2017-11-30T11:03:57.000000
-p3443
-sVold_task_state
-p3444
-NsVinstance_id
-p3445
-Va7115aef-929d-454e-9eba-eff685db7a15
-p3446
-sVinstance_type
-p3447
-Vm1.medium
-p3448
-sVvcpus
-p3449
-I2
-sVimage_meta
-p3450
-(dp3451
-Vmin_disk
-p3452
-V40
-p3453
-sVcontainer_format
-p3454
-Vbare
-p3455
-sVmin_ram
-p3456
-V0
-sVdisk_format
-p3457
-Vqcow2
-p3458
-sVbase_image_ref
-p3459
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3460
-ssVarchitecture
-p3461
-NsVnew_task_state
-p3462
-NsVaudit_period_ending
-p3463
-V2017-11-30T11:03:57.180945
-p3464
-sVos_type
-p3465
-NsVinstance_flavor_id
-p3466
-V3
-ssV_context_show_deleted
-p3467
-I00
-sVpriority
-p3468
-VINFO
-p3469
-sV_context_is_admin
-p3470
-I01
-sV_context_project_domain
-p3471
-NsV_context_user
-p3472
-Vef7a4f67379f41aba489a0b6d6a62094
-p3473
-sVpublisher_id
-p3474
-Vcompute.machine-A
-p3475
-sVmessage_id
-p3476
-V62355edf-8942-4723-b695-cd505b95a209
-p3477
-sV_context_remote_address
-p3478
-V172.16.0.5
-p3479
-sV_context_roles
-p3480
-(lp3481
-Vadmin
-p3482
-asVtimestamp
-p3483
-V2017-11-30 11:03:57.184993
-p3484
-sV_context_timestamp
-p3485
-V2017-11-30T11:03:56.348377
-p3486
-sV_unique_id
-p3487
-Vfaa680ac169b418491bd0c8f1aeee89e
-p3488
-sV_context_project_name
-p3489
-Vapexlake
-p3490
-sV_context_read_deleted
-p3491
-Vno
-p3492
-sV_context_user_identity
-p3493
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3494
-sV_context_tenant
-p3495
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3496
-sV_context_instance_lock_checked
-p3497
-I00
-sV_context_project_id
-p3498
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3499
-sV_context_read_only
-p3500
-I00
-sV_context_user_domain
-p3501
-NsV_context_user_name
-p3502
-Violie
-p3503
-stp3504
-a(F5.4716651439666748
-Vcompute.instance.update
-p3505
-(dp3506
-V_context_domain
-p3507
-NsV_context_request_id
-p3508
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p3509
-sV_context_quota_class
-p3510
-NsVevent_type
-p3511
-g3505
-sV_context_service_catalog
-p3512
-(lp3513
-(dp3514
-Vendpoints
-p3515
-(lp3516
-(dp3517
-VadminURL
-p3518
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3519
-sVregion
-p3520
-VRegionOne
-p3521
-sVinternalURL
-p3522
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3523
-sVpublicURL
-p3524
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3525
-sasVtype
-p3526
-Vvolume
-p3527
-sVname
-p3528
-Vcinder
-p3529
-sa(dp3530
-g3515
-(lp3531
-(dp3532
-g3518
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3533
-sg3520
-VRegionOne
-p3534
-sg3522
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3535
-sg3524
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3536
-sasg3526
-Vvolumev2
-p3537
-sg3528
-Vcinderv2
-p3538
-sasV_context_auth_token
-p3539
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p3540
-sV_context_resource_uuid
-p3541
-NsV_context_user_id
-p3542
-Vef7a4f67379f41aba489a0b6d6a62094
-p3543
-sVpayload
-p3544
-(dp3545
-Vstate_description
-p3546
-Vnetworking
-p3547
-sVavailability_zone
-p3548
-Vnova
-p3549
-sVterminated_at
-p3550
-V
-sVephemeral_gb
-p3551
-I0
-sVinstance_type_id
-p3552
-I1
-sVbandwidth
-p3553
-(dp3554
-sVdeleted_at
-p3555
-V
-sVreservation_id
-p3556
-Vr-61su4ljd
-p3557
-sVmemory_mb
-p3558
-I4096
-sVdisplay_name
-p3559
-Vvm_test
-p3560
-sVhostname
-p3561
-Vvm-test
-p3562
-sVstate
-p3563
-Vbuilding
-p3564
-sVold_state
-p3565
-Vbuilding
-p3566
-sVprogress
-p3567
-V
-sVlaunched_at
-p3568
-V
-sVmetadata
-p3569
-(dp3570
-sVnode
-p3571
-Vmachine-B
-p3572
-sVramdisk_id
-p3573
-V
-sVaccess_ip_v6
-p3574
-NsVdisk_gb
-p3575
-I40
-sVaccess_ip_v4
-p3576
-NsVkernel_id
-p3577
-V
-sVhost
-p3578
-Vmachine-B
-p3579
-sVuser_id
-p3580
-Vef7a4f67379f41aba489a0b6d6a62094
-p3581
-sVimage_ref_url
-p3582
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3583
-sVcell_name
-p3584
-V
-sVaudit_period_beginning
-p3585
-V2017-11-01T00:00:00.000000
-p3586
-sVroot_gb
-p3587
-I40
-sVtenant_id
-p3588
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3589
-sVcreated_at
-p3590
-V2017-11-30T11:03:57.000000
-p3591
-sVold_task_state
-p3592
-Vnetworking
-p3593
-sVinstance_id
-p3594
-Va7115aef-929d-454e-9eba-eff685db7a15
-p3595
-sVinstance_type
-p3596
-Vm1.medium
-p3597
-sVvcpus
-p3598
-I2
-sVimage_meta
-p3599
-(dp3600
-Vmin_disk
-p3601
-V40
-p3602
-sVcontainer_format
-p3603
-Vbare
-p3604
-sVmin_ram
-p3605
-V0
-sVdisk_format
-p3606
-Vqcow2
-p3607
-sVbase_image_ref
-p3608
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3609
-ssVarchitecture
-p3610
-NsVnew_task_state
-p3611
-Vnetworking
-p3612
-sVaudit_period_ending
-p3613
-V2017-11-30T11:03:57.296886
-p3614
-sVos_type
-p3615
-NsVinstance_flavor_id
-p3616
-V3
-ssV_context_show_deleted
-p3617
-I00
-sVpriority
-p3618
-VINFO
-p3619
-sV_context_is_admin
-p3620
-I01
-sV_context_project_domain
-p3621
-NsV_context_user
-p3622
-Vef7a4f67379f41aba489a0b6d6a62094
-p3623
-sVpublisher_id
-p3624
-Vcompute.machine-A
-p3625
-sVmessage_id
-p3626
-Vebd4316d-2818-4a43-8d86-1ad1cac079f0
-p3627
-sV_context_remote_address
-p3628
-V172.16.0.5
-p3629
-sV_context_roles
-p3630
-(lp3631
-Vadmin
-p3632
-asVtimestamp
-p3633
-V2017-11-30 11:03:57.301612
-p3634
-sV_context_timestamp
-p3635
-V2017-11-30T11:03:56.348377
-p3636
-sV_unique_id
-p3637
-V479a8c3e4aac4e9bab88aab2fb5d6885
-p3638
-sV_context_project_name
-p3639
-Vapexlake
-p3640
-sV_context_read_deleted
-p3641
-Vno
-p3642
-sV_context_user_identity
-p3643
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3644
-sV_context_tenant
-p3645
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3646
-sV_context_instance_lock_checked
-p3647
-I00
-sV_context_project_id
-p3648
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3649
-sV_context_read_only
-p3650
-I00
-sV_context_user_domain
-p3651
-NsV_context_user_name
-p3652
-Violie
-p3653
-stp3654
-a(F5.5754120349884033
-Vport.update.start
-p3655
-(dp3656
-V_context_domain
-p3657
-NsV_context_request_id
-p3658
-Vreq-e24e1127-03cf-4325-ad08-4ef3773df267
-p3659
-sVevent_type
-p3660
-g3655
-sV_context_auth_token
-p3661
-VgAAAAABaH9-CWgcS39ZdW0cxOVLvB4fAIBmlm17jN9SRgqp0r4jwM-zlbzaX9hGvNRl-wtpjKLecYBw6HnF6c1vMrCbTcZ1-hjhyOqt4VRuIiCrMiyyhfQ6Q-3NaU8XzbobGqQaP6eWVhED5sSv6lWMeJ_IZNtU7mchGDTTAGDFyTo8pQB2VLYU
-p3662
-sV_context_resource_uuid
-p3663
-NsV_context_tenant_name
-p3664
-Vservices
-p3665
-sV_context_user_id
-p3666
-V84faafdbb77b40c9a73047fdebb0ab45
-p3667
-sVpayload
-p3668
-(dp3669
-Vport
-p3670
-(dp3671
-Vdns_name
-p3672
-Vvm-test
-p3673
-sVdevice_owner
-p3674
-Vcompute:nova
-p3675
-sVbinding:host_id
-p3676
-Vmachine-B
-p3677
-sVdevice_id
-p3678
-Va7115aef-929d-454e-9eba-eff685db7a15
-p3679
-ssVid
-p3680
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p3681
-ssV_context_show_deleted
-p3682
-I00
-sVpriority
-p3683
-VINFO
-p3684
-sV_context_is_admin
-p3685
-I01
-sV_context_project_domain
-p3686
-NsV_context_user
-p3687
-V84faafdbb77b40c9a73047fdebb0ab45
-p3688
-sVpublisher_id
-p3689
-Vnetwork.machine-A
-p3690
-sVmessage_id
-p3691
-Vead0f179-0ef5-4986-a5d1-8b0e68fb5e89
-p3692
-sV_context_roles
-p3693
-(lp3694
-Vadmin
-p3695
-asVtimestamp
-p3696
-V2017-11-30 11:03:57.406155
-p3697
-sV_context_timestamp
-p3698
-V2017-11-30 11:03:57.405223
-p3699
-sV_unique_id
-p3700
-Vc420e808fffe407aafa754b5cf7f12b5
-p3701
-sV_context_tenant_id
-p3702
-V66fbf30f2dce4cef95d5248254dac9a5
-p3703
-sV_context_project_name
-p3704
-Vservices
-p3705
-sV_context_user_identity
-p3706
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p3707
-sV_context_tenant
-p3708
-V66fbf30f2dce4cef95d5248254dac9a5
-p3709
-sV_context_project_id
-p3710
-V66fbf30f2dce4cef95d5248254dac9a5
-p3711
-sV_context_read_only
-p3712
-I00
-sV_context_user_domain
-p3713
-NsV_context_user_name
-p3714
-Vneutron
-p3715
-stp3716
-a(F5.5922150611877441
-Vcompute.instance.update
-p3717
-(dp3718
-V_context_domain
-p3719
-NsV_context_request_id
-p3720
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p3721
-sV_context_quota_class
-p3722
-NsVevent_type
-p3723
-g3717
-sV_context_service_catalog
-p3724
-(lp3725
-(dp3726
-Vendpoints
-p3727
-(lp3728
-(dp3729
-VadminURL
-p3730
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3731
-sVregion
-p3732
-VRegionOne
-p3733
-sVinternalURL
-p3734
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3735
-sVpublicURL
-p3736
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3737
-sasVtype
-p3738
-Vvolume
-p3739
-sVname
-p3740
-Vcinder
-p3741
-sa(dp3742
-g3727
-(lp3743
-(dp3744
-g3730
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3745
-sg3732
-VRegionOne
-p3746
-sg3734
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3747
-sg3736
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3748
-sasg3738
-Vvolumev2
-p3749
-sg3740
-Vcinderv2
-p3750
-sasV_context_auth_token
-p3751
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p3752
-sV_context_resource_uuid
-p3753
-NsV_context_user_id
-p3754
-Vef7a4f67379f41aba489a0b6d6a62094
-p3755
-sVpayload
-p3756
-(dp3757
-Vstate_description
-p3758
-Vblock_device_mapping
-p3759
-sVavailability_zone
-p3760
-Vnova
-p3761
-sVterminated_at
-p3762
-V
-sVephemeral_gb
-p3763
-I0
-sVinstance_type_id
-p3764
-I1
-sVbandwidth
-p3765
-(dp3766
-sVdeleted_at
-p3767
-V
-sVreservation_id
-p3768
-Vr-61su4ljd
-p3769
-sVmemory_mb
-p3770
-I4096
-sVdisplay_name
-p3771
-Vvm_test
-p3772
-sVhostname
-p3773
-Vvm-test
-p3774
-sVstate
-p3775
-Vbuilding
-p3776
-sVold_state
-p3777
-Vbuilding
-p3778
-sVprogress
-p3779
-V
-sVlaunched_at
-p3780
-V
-sVmetadata
-p3781
-(dp3782
-sVnode
-p3783
-Vmachine-B
-p3784
-sVramdisk_id
-p3785
-V
-sVaccess_ip_v6
-p3786
-NsVdisk_gb
-p3787
-I40
-sVaccess_ip_v4
-p3788
-NsVkernel_id
-p3789
-V
-sVhost
-p3790
-Vmachine-B
-p3791
-sVuser_id
-p3792
-Vef7a4f67379f41aba489a0b6d6a62094
-p3793
-sVimage_ref_url
-p3794
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3795
-sVcell_name
-p3796
-V
-sVaudit_period_beginning
-p3797
-V2017-11-01T00:00:00.000000
-p3798
-sVroot_gb
-p3799
-I40
-sVtenant_id
-p3800
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3801
-sVcreated_at
-p3802
-V2017-11-30T11:03:57.000000
-p3803
-sVold_task_state
-p3804
-Vnetworking
-p3805
-sVinstance_id
-p3806
-Va7115aef-929d-454e-9eba-eff685db7a15
-p3807
-sVinstance_type
-p3808
-Vm1.medium
-p3809
-sVvcpus
-p3810
-I2
-sVimage_meta
-p3811
-(dp3812
-Vmin_disk
-p3813
-V40
-p3814
-sVcontainer_format
-p3815
-Vbare
-p3816
-sVmin_ram
-p3817
-V0
-sVdisk_format
-p3818
-Vqcow2
-p3819
-sVbase_image_ref
-p3820
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3821
-ssVarchitecture
-p3822
-NsVnew_task_state
-p3823
-Vblock_device_mapping
-p3824
-sVaudit_period_ending
-p3825
-V2017-11-30T11:03:57.416829
-p3826
-sVos_type
-p3827
-NsVinstance_flavor_id
-p3828
-V3
-ssV_context_show_deleted
-p3829
-I00
-sVpriority
-p3830
-VINFO
-p3831
-sV_context_is_admin
-p3832
-I01
-sV_context_project_domain
-p3833
-NsV_context_user
-p3834
-Vef7a4f67379f41aba489a0b6d6a62094
-p3835
-sVpublisher_id
-p3836
-Vcompute.machine-A
-p3837
-sVmessage_id
-p3838
-V23deb98f-c492-4908-a816-91d033388684
-p3839
-sV_context_remote_address
-p3840
-V172.16.0.5
-p3841
-sV_context_roles
-p3842
-(lp3843
-Vadmin
-p3844
-asVtimestamp
-p3845
-V2017-11-30 11:03:57.421980
-p3846
-sV_context_timestamp
-p3847
-V2017-11-30T11:03:56.348377
-p3848
-sV_unique_id
-p3849
-Ve1a17e8960ca4108a4edd800b36a8c12
-p3850
-sV_context_project_name
-p3851
-Vapexlake
-p3852
-sV_context_read_deleted
-p3853
-Vno
-p3854
-sV_context_user_identity
-p3855
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3856
-sV_context_tenant
-p3857
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3858
-sV_context_instance_lock_checked
-p3859
-I00
-sV_context_project_id
-p3860
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3861
-sV_context_read_only
-p3862
-I00
-sV_context_user_domain
-p3863
-NsV_context_user_name
-p3864
-Violie
-p3865
-stp3866
-a(F5.6712419986724854
-Vcompute.instance.update
-p3867
-(dp3868
-V_context_domain
-p3869
-NsV_context_request_id
-p3870
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p3871
-sV_context_quota_class
-p3872
-NsVevent_type
-p3873
-g3867
-sV_context_service_catalog
-p3874
-(lp3875
-(dp3876
-Vendpoints
-p3877
-(lp3878
-(dp3879
-VadminURL
-p3880
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3881
-sVregion
-p3882
-VRegionOne
-p3883
-sVinternalURL
-p3884
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3885
-sVpublicURL
-p3886
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3887
-sasVtype
-p3888
-Vvolume
-p3889
-sVname
-p3890
-Vcinder
-p3891
-sa(dp3892
-g3877
-(lp3893
-(dp3894
-g3880
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3895
-sg3882
-VRegionOne
-p3896
-sg3884
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3897
-sg3886
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3898
-sasg3888
-Vvolumev2
-p3899
-sg3890
-Vcinderv2
-p3900
-sasV_context_auth_token
-p3901
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p3902
-sV_context_resource_uuid
-p3903
-NsV_context_user_id
-p3904
-Vef7a4f67379f41aba489a0b6d6a62094
-p3905
-sVpayload
-p3906
-(dp3907
-Vstate_description
-p3908
-Vspawning
-p3909
-sVavailability_zone
-p3910
-Vnova
-p3911
-sVterminated_at
-p3912
-V
-sVephemeral_gb
-p3913
-I0
-sVinstance_type_id
-p3914
-I1
-sVbandwidth
-p3915
-(dp3916
-sVdeleted_at
-p3917
-V
-sVreservation_id
-p3918
-Vr-61su4ljd
-p3919
-sVmemory_mb
-p3920
-I4096
-sVdisplay_name
-p3921
-Vvm_test
-p3922
-sVhostname
-p3923
-Vvm-test
-p3924
-sVstate
-p3925
-Vbuilding
-p3926
-sVold_state
-p3927
-Vbuilding
-p3928
-sVprogress
-p3929
-V
-sVlaunched_at
-p3930
-V
-sVmetadata
-p3931
-(dp3932
-sVnode
-p3933
-Vmachine-B
-p3934
-sVramdisk_id
-p3935
-V
-sVaccess_ip_v6
-p3936
-NsVdisk_gb
-p3937
-I40
-sVaccess_ip_v4
-p3938
-NsVkernel_id
-p3939
-V
-sVhost
-p3940
-Vmachine-B
-p3941
-sVuser_id
-p3942
-Vef7a4f67379f41aba489a0b6d6a62094
-p3943
-sVimage_ref_url
-p3944
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3945
-sVcell_name
-p3946
-V
-sVaudit_period_beginning
-p3947
-V2017-11-01T00:00:00.000000
-p3948
-sVroot_gb
-p3949
-I40
-sVtenant_id
-p3950
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3951
-sVcreated_at
-p3952
-V2017-11-30T11:03:57.000000
-p3953
-sVold_task_state
-p3954
-Vblock_device_mapping
-p3955
-sVinstance_id
-p3956
-Va7115aef-929d-454e-9eba-eff685db7a15
-p3957
-sVinstance_type
-p3958
-Vm1.medium
-p3959
-sVvcpus
-p3960
-I2
-sVimage_meta
-p3961
-(dp3962
-Vmin_disk
-p3963
-V40
-p3964
-sVcontainer_format
-p3965
-Vbare
-p3966
-sVmin_ram
-p3967
-V0
-sVdisk_format
-p3968
-Vqcow2
-p3969
-sVbase_image_ref
-p3970
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3971
-ssVarchitecture
-p3972
-NsVnew_task_state
-p3973
-Vspawning
-p3974
-sVaudit_period_ending
-p3975
-V2017-11-30T11:03:57.495904
-p3976
-sVos_type
-p3977
-NsVinstance_flavor_id
-p3978
-V3
-ssV_context_show_deleted
-p3979
-I00
-sVpriority
-p3980
-VINFO
-p3981
-sV_context_is_admin
-p3982
-I01
-sV_context_project_domain
-p3983
-NsV_context_user
-p3984
-Vef7a4f67379f41aba489a0b6d6a62094
-p3985
-sVpublisher_id
-p3986
-Vcompute.machine-A
-p3987
-sVmessage_id
-p3988
-V0b50b78b-3d06-4cd3-ba9b-7ead0372f6d5
-p3989
-sV_context_remote_address
-p3990
-V172.16.0.5
-p3991
-sV_context_roles
-p3992
-(lp3993
-Vadmin
-p3994
-asVtimestamp
-p3995
-V2017-11-30 11:03:57.501254
-p3996
-sV_context_timestamp
-p3997
-V2017-11-30T11:03:56.348377
-p3998
-sV_unique_id
-p3999
-V98b685e0da894be1950dd11d8e331f59
-p4000
-sV_context_project_name
-p4001
-Vapexlake
-p4002
-sV_context_read_deleted
-p4003
-Vno
-p4004
-sV_context_user_identity
-p4005
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4006
-sV_context_tenant
-p4007
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4008
-sV_context_instance_lock_checked
-p4009
-I00
-sV_context_project_id
-p4010
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4011
-sV_context_read_only
-p4012
-I00
-sV_context_user_domain
-p4013
-NsV_context_user_name
-p4014
-Violie
-p4015
-stp4016
-a(F5.9553141593933105
-Vport.update.end
-p4017
-(dp4018
-V_context_domain
-p4019
-NsV_context_request_id
-p4020
-Vreq-e24e1127-03cf-4325-ad08-4ef3773df267
-p4021
-sVevent_type
-p4022
-g4017
-sV_context_auth_token
-p4023
-VgAAAAABaH9-CWgcS39ZdW0cxOVLvB4fAIBmlm17jN9SRgqp0r4jwM-zlbzaX9hGvNRl-wtpjKLecYBw6HnF6c1vMrCbTcZ1-hjhyOqt4VRuIiCrMiyyhfQ6Q-3NaU8XzbobGqQaP6eWVhED5sSv6lWMeJ_IZNtU7mchGDTTAGDFyTo8pQB2VLYU
-p4024
-sV_context_resource_uuid
-p4025
-NsV_context_tenant_name
-p4026
-Vservices
-p4027
-sV_context_user_id
-p4028
-V84faafdbb77b40c9a73047fdebb0ab45
-p4029
-sVpayload
-p4030
-(dp4031
-Vport
-p4032
-(dp4033
-Vallowed_address_pairs
-p4034
-(lp4035
-sVextra_dhcp_opts
-p4036
-(lp4037
-sVupdated_at
-p4038
-V2017-11-30T11:03:57
-p4039
-sVdevice_owner
-p4040
-Vcompute:nova
-p4041
-sVport_security_enabled
-p4042
-I01
-sVbinding:profile
-p4043
-(dp4044
-sVfixed_ips
-p4045
-(lp4046
-(dp4047
-Vsubnet_id
-p4048
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p4049
-sVip_address
-p4050
-V172.16.9.143
-p4051
-sasVid
-p4052
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p4053
-sVsecurity_groups
-p4054
-(lp4055
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p4056
-asVbinding:vif_details
-p4057
-(dp4058
-Vport_filter
-p4059
-I01
-sVovs_hybrid_plug
-p4060
-I01
-ssVbinding:vif_type
-p4061
-Vovs
-p4062
-sVmac_address
-p4063
-Vfa:16:3e:e3:1c:a2
-p4064
-sVstatus
-p4065
-VDOWN
-p4066
-sVbinding:host_id
-p4067
-Vmachine-B
-p4068
-sVdescription
-p4069
-V
-sVdevice_id
-p4070
-Va7115aef-929d-454e-9eba-eff685db7a15
-p4071
-sVname
-p4072
-VA-server_port-mq5hsmnf3x5v
-p4073
-sVadmin_state_up
-p4074
-I01
-sVnetwork_id
-p4075
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p4076
-sVdns_name
-p4077
-V
-sVcreated_at
-p4078
-V2017-11-30T11:03:53
-p4079
-sVbinding:vnic_type
-p4080
-Vnormal
-p4081
-sVtenant_id
-p4082
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4083
-sssV_context_show_deleted
-p4084
-I00
-sVpriority
-p4085
-VINFO
-p4086
-sV_context_is_admin
-p4087
-I01
-sV_context_project_domain
-p4088
-NsV_context_user
-p4089
-V84faafdbb77b40c9a73047fdebb0ab45
-p4090
-sVpublisher_id
-p4091
-Vnetwork.machine-A
-p4092
-sVmessage_id
-p4093
-V08367c38-81c3-4926-8989-9861779760a5
-p4094
-sV_context_roles
-p4095
-(lp4096
-Vadmin
-p4097
-asVtimestamp
-p4098
-V2017-11-30 11:03:57.786041
-p4099
-sV_context_timestamp
-p4100
-V2017-11-30 11:03:57.405223
-p4101
-sV_unique_id
-p4102
-Ve5f2335108a14f62a8311147faf0d97b
-p4103
-sV_context_tenant_id
-p4104
-V66fbf30f2dce4cef95d5248254dac9a5
-p4105
-sV_context_project_name
-p4106
-Vservices
-p4107
-sV_context_user_identity
-p4108
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p4109
-sV_context_tenant
-p4110
-V66fbf30f2dce4cef95d5248254dac9a5
-p4111
-sV_context_project_id
-p4112
-V66fbf30f2dce4cef95d5248254dac9a5
-p4113
-sV_context_read_only
-p4114
-I00
-sV_context_user_domain
-p4115
-NsV_context_user_name
-p4116
-Vneutron
-p4117
-stp4118
-a(F6.1383659839630127
-Vfloatingip.create.start
-p4119
-(dp4120
-V_context_domain
-p4121
-NsV_context_request_id
-p4122
-Vreq-c345a325-d1fd-4f68-aec9-d559dd3457c9
-p4123
-sVevent_type
-p4124
-g4119
-sV_context_auth_token
-p4125
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4126
-sV_context_resource_uuid
-p4127
-NsV_context_tenant_name
-p4128
-Vapexlake
-p4129
-sV_context_user_id
-p4130
-Vef7a4f67379f41aba489a0b6d6a62094
-p4131
-sVpayload
-p4132
-(dp4133
-Vfloatingip
-p4134
-(dp4135
-Vfloating_network_id
-p4136
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p4137
-sVport_id
-p4138
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p4139
-sssV_context_show_deleted
-p4140
-I00
-sVpriority
-p4141
-VINFO
-p4142
-sV_context_is_admin
-p4143
-I01
-sV_context_project_domain
-p4144
-NsV_context_user
-p4145
-Vef7a4f67379f41aba489a0b6d6a62094
-p4146
-sVpublisher_id
-p4147
-Vnetwork.machine-A
-p4148
-sVmessage_id
-p4149
-V7c08a42e-3773-458a-bc20-235d78d30d22
-p4150
-sV_context_roles
-p4151
-(lp4152
-Vadmin
-p4153
-asVtimestamp
-p4154
-V2017-11-30 11:03:57.968539
-p4155
-sV_context_timestamp
-p4156
-V2017-11-30 11:03:57.967375
-p4157
-sV_unique_id
-p4158
-V3fa1d1d691504e13bfd0ee580d05d6af
-p4159
-sV_context_tenant_id
-p4160
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4161
-sV_context_project_name
-p4162
-Vapexlake
-p4163
-sV_context_user_identity
-p4164
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4165
-sV_context_tenant
-p4166
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4167
-sV_context_project_id
-p4168
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4169
-sV_context_read_only
-p4170
-I00
-sV_context_user_domain
-p4171
-NsV_context_user_name
-p4172
-Violie
-p4173
-stp4174
-a(F6.676177978515625
-Vfloatingip.create.end
-p4175
-(dp4176
-V_context_domain
-p4177
-NsV_context_request_id
-p4178
-Vreq-c345a325-d1fd-4f68-aec9-d559dd3457c9
-p4179
-sVevent_type
-p4180
-g4175
-sV_context_auth_token
-p4181
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4182
-sV_context_resource_uuid
-p4183
-NsV_context_tenant_name
-p4184
-Vapexlake
-p4185
-sV_context_user_id
-p4186
-Vef7a4f67379f41aba489a0b6d6a62094
-p4187
-sVpayload
-p4188
-(dp4189
-Vfloatingip
-p4190
-(dp4191
-Vrouter_id
-p4192
-V4eb1290f-8c3c-45d5-9409-cc446f480079
-p4193
-sVstatus
-p4194
-VDOWN
-p4195
-sVdescription
-p4196
-V
-sVdns_name
-p4197
-V
-sVdns_domain
-p4198
-V
-sVfloating_network_id
-p4199
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p4200
-sVfixed_ip_address
-p4201
-V172.16.9.144
-p4202
-sVfloating_ip_address
-p4203
-V10.2.32.193
-p4204
-sVtenant_id
-p4205
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4206
-sVport_id
-p4207
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p4208
-sVid
-p4209
-V3068dfa3-385a-421b-a3b7-fbfbb47fbc8b
-p4210
-sssV_context_show_deleted
-p4211
-I00
-sVpriority
-p4212
-VINFO
-p4213
-sV_context_is_admin
-p4214
-I01
-sV_context_project_domain
-p4215
-NsV_context_user
-p4216
-Vef7a4f67379f41aba489a0b6d6a62094
-p4217
-sVpublisher_id
-p4218
-Vnetwork.machine-A
-p4219
-sVmessage_id
-p4220
-V3bcfa562-8618-44fd-9e8e-2cb101adc7b7
-p4221
-sV_context_roles
-p4222
-(lp4223
-Vadmin
-p4224
-asVtimestamp
-p4225
-V2017-11-30 11:03:58.505437
-p4226
-sV_context_timestamp
-p4227
-V2017-11-30 11:03:57.967375
-p4228
-sV_unique_id
-p4229
-V489b6dc0aeb94039a937f994e856092a
-p4230
-sV_context_tenant_id
-p4231
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4232
-sV_context_project_name
-p4233
-Vapexlake
-p4234
-sV_context_user_identity
-p4235
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4236
-sV_context_tenant
-p4237
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4238
-sV_context_project_id
-p4239
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4240
-sV_context_read_only
-p4241
-I00
-sV_context_user_domain
-p4242
-NsV_context_user_name
-p4243
-Violie
-p4244
-stp4245
-a(F6.9586021900177002
-Vcompute.instance.update
-p4246
-(dp4247
-V_context_domain
-p4248
-NsV_context_request_id
-p4249
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p4250
-sV_context_quota_class
-p4251
-NsVevent_type
-p4252
-g4246
-sV_context_service_catalog
-p4253
-(lp4254
-(dp4255
-Vendpoints
-p4256
-(lp4257
-(dp4258
-VadminURL
-p4259
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4260
-sVregion
-p4261
-VRegionOne
-p4262
-sVinternalURL
-p4263
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4264
-sVpublicURL
-p4265
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4266
-sasVtype
-p4267
-Vvolume
-p4268
-sVname
-p4269
-Vcinder
-p4270
-sa(dp4271
-g4256
-(lp4272
-(dp4273
-g4259
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4274
-sg4261
-VRegionOne
-p4275
-sg4263
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4276
-sg4265
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4277
-sasg4267
-Vvolumev2
-p4278
-sg4269
-Vcinderv2
-p4279
-sasV_context_auth_token
-p4280
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4281
-sV_context_resource_uuid
-p4282
-NsV_context_user_id
-p4283
-Vef7a4f67379f41aba489a0b6d6a62094
-p4284
-sVpayload
-p4285
-(dp4286
-Vstate_description
-p4287
-Vscheduling
-p4288
-sVavailability_zone
-p4289
-Vnova
-p4290
-sVterminated_at
-p4291
-V
-sVephemeral_gb
-p4292
-I0
-sVinstance_type_id
-p4293
-I1
-sVbandwidth
-p4294
-(dp4295
-sVdeleted_at
-p4296
-V
-sVreservation_id
-p4297
-Vr-4jmm1xbm
-p4298
-sVmemory_mb
-p4299
-I4096
-sVdisplay_name
-p4300
-Vvm_test
-p4301
-sVhostname
-p4302
-Vvm-test
-p4303
-sVstate
-p4304
-Vbuilding
-p4305
-sVold_state
-p4306
-Vbuilding
-p4307
-sVprogress
-p4308
-V
-sVlaunched_at
-p4309
-V
-sVmetadata
-p4310
-(dp4311
-sVnode
-p4312
-NsVramdisk_id
-p4313
-V
-sVaccess_ip_v6
-p4314
-NsVdisk_gb
-p4315
-I40
-sVaccess_ip_v4
-p4316
-NsVkernel_id
-p4317
-V
-sVhost
-p4318
-NsVuser_id
-p4319
-Vef7a4f67379f41aba489a0b6d6a62094
-p4320
-sVimage_ref_url
-p4321
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p4322
-sVcell_name
-p4323
-V
-sVaudit_period_beginning
-p4324
-V2017-11-01T00:00:00.000000
-p4325
-sVroot_gb
-p4326
-I40
-sVtenant_id
-p4327
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4328
-sVcreated_at
-p4329
-V2017-11-30T11:03:58.763340
-p4330
-sVold_task_state
-p4331
-Vscheduling
-p4332
-sVinstance_id
-p4333
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4334
-sVinstance_type
-p4335
-Vm1.medium
-p4336
-sVvcpus
-p4337
-I2
-sVimage_meta
-p4338
-(dp4339
-Vmin_disk
-p4340
-V40
-p4341
-sVcontainer_format
-p4342
-Vbare
-p4343
-sVmin_ram
-p4344
-V0
-sVdisk_format
-p4345
-Vqcow2
-p4346
-sVbase_image_ref
-p4347
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p4348
-ssVarchitecture
-p4349
-NsVnew_task_state
-p4350
-Vscheduling
-p4351
-sVaudit_period_ending
-p4352
-V2017-11-30T11:03:58.785393
-p4353
-sVos_type
-p4354
-NsVinstance_flavor_id
-p4355
-V3
-ssV_context_show_deleted
-p4356
-I00
-sVpriority
-p4357
-VINFO
-p4358
-sV_context_is_admin
-p4359
-I01
-sV_context_project_domain
-p4360
-NsV_context_user
-p4361
-Vef7a4f67379f41aba489a0b6d6a62094
-p4362
-sVpublisher_id
-p4363
-Vapi.machine-A
-p4364
-sVmessage_id
-p4365
-V70d4fe06-c16c-41a6-a69a-5177c25fd26c
-p4366
-sV_context_remote_address
-p4367
-V172.16.0.5
-p4368
-sV_context_roles
-p4369
-(lp4370
-Vadmin
-p4371
-asVtimestamp
-p4372
-V2017-11-30 11:03:58.789083
-p4373
-sV_context_timestamp
-p4374
-V2017-11-30T11:03:58.557388
-p4375
-sV_unique_id
-p4376
-V173bc2222b984646870964656cbf8f16
-p4377
-sV_context_project_name
-p4378
-Vapexlake
-p4379
-sV_context_read_deleted
-p4380
-Vno
-p4381
-sV_context_user_identity
-p4382
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4383
-sV_context_tenant
-p4384
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4385
-sV_context_instance_lock_checked
-p4386
-I00
-sV_context_project_id
-p4387
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4388
-sV_context_read_only
-p4389
-I00
-sV_context_user_domain
-p4390
-NsV_context_user_name
-p4391
-Violie
-p4392
-stp4393
-a(F6.9901950359344482
-Vscheduler.select_destinations.start
-p4394
-(dp4395
-V_context_domain
-p4396
-NsV_context_request_id
-p4397
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p4398
-sV_context_quota_class
-p4399
-NsVevent_type
-p4400
-g4394
-sV_context_service_catalog
-p4401
-(lp4402
-(dp4403
-Vendpoints
-p4404
-(lp4405
-(dp4406
-VadminURL
-p4407
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4408
-sVregion
-p4409
-VRegionOne
-p4410
-sVinternalURL
-p4411
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4412
-sVpublicURL
-p4413
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4414
-sasVtype
-p4415
-Vvolume
-p4416
-sVname
-p4417
-Vcinder
-p4418
-sa(dp4419
-g4404
-(lp4420
-(dp4421
-g4407
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4422
-sg4409
-VRegionOne
-p4423
-sg4411
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4424
-sg4413
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4425
-sasg4415
-Vvolumev2
-p4426
-sg4417
-Vcinderv2
-p4427
-sasV_context_auth_token
-p4428
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4429
-sV_context_resource_uuid
-p4430
-NsV_context_user_id
-p4431
-Vef7a4f67379f41aba489a0b6d6a62094
-p4432
-sVpayload
-p4433
-(dp4434
-Vrequest_spec
-p4435
-(dp4436
-Vinstance_properties
-p4437
-(dp4438
-Vroot_gb
-p4439
-I40
-sVuuid
-p4440
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4441
-sVavailability_zone
-p4442
-Vnova
-p4443
-sVephemeral_gb
-p4444
-I0
-sVnuma_topology
-p4445
-NsVmemory_mb
-p4446
-I4096
-sVvcpus
-p4447
-I2
-sVproject_id
-p4448
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4449
-sVpci_requests
-p4450
-(dp4451
-Vinstance_uuid
-p4452
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4453
-sVrequests
-p4454
-(lp4455
-sssVinstance_type
-p4456
-(dp4457
-Vdisabled
-p4458
-I00
-sg4439
-I40
-sg4417
-Vm1.medium
-p4459
-sVflavorid
-p4460
-V3
-sVdeleted
-p4461
-I00
-sVcreated_at
-p4462
-Nsg4444
-I0
-sVupdated_at
-p4463
-Nsg4446
-I4096
-sg4447
-I2
-sVextra_specs
-p4464
-(dp4465
-sVswap
-p4466
-I0
-sVrxtx_factor
-p4467
-F1
-sVis_public
-p4468
-I01
-sVdeleted_at
-p4469
-NsVvcpu_weight
-p4470
-I0
-sVid
-p4471
-I1
-ssVimage
-p4472
-(dp4473
-Vstatus
-p4474
-Vactive
-p4475
-sg4417
-Vubuntu1404
-p4476
-sVcontainer_format
-p4477
-Vbare
-p4478
-sg4462
-V2017-07-01T10:51:05.000000
-p4479
-sVdisk_format
-p4480
-Vqcow2
-p4481
-sg4463
-V2017-07-01T10:51:08.000000
-p4482
-sg4471
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p4483
-sVmin_disk
-p4484
-I2
-sVmin_ram
-p4485
-I0
-sVchecksum
-p4486
-V6ad21b1699bcc4cbc02936bf1e915911
-p4487
-sVowner
-p4488
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4489
-sVproperties
-p4490
-(dp4491
-sVsize
-p4492
-I262144512
-ssVnum_instances
-p4493
-I1
-sssV_context_show_deleted
-p4494
-I00
-sVpriority
-p4495
-VINFO
-p4496
-sV_context_is_admin
-p4497
-I01
-sV_context_project_domain
-p4498
-NsV_context_user
-p4499
-Vef7a4f67379f41aba489a0b6d6a62094
-p4500
-sVpublisher_id
-p4501
-Vscheduler.machine-A
-p4502
-sVmessage_id
-p4503
-V8db384b1-7eb2-4f68-99eb-f91f643e433f
-p4504
-sV_context_remote_address
-p4505
-V172.16.0.5
-p4506
-sV_context_roles
-p4507
-(lp4508
-Vadmin
-p4509
-asVtimestamp
-p4510
-V2017-11-30 11:03:58.820536
-p4511
-sV_context_timestamp
-p4512
-V2017-11-30T11:03:58.557388
-p4513
-sV_unique_id
-p4514
-Vdb85488bec1a444eac78b2e96307ac10
-p4515
-sV_context_project_name
-p4516
-Vapexlake
-p4517
-sV_context_read_deleted
-p4518
-Vno
-p4519
-sV_context_user_identity
-p4520
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4521
-sV_context_tenant
-p4522
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4523
-sV_context_instance_lock_checked
-p4524
-I00
-sV_context_project_id
-p4525
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4526
-sV_context_read_only
-p4527
-I00
-sV_context_user_domain
-p4528
-NsV_context_user_name
-p4529
-Violie
-p4530
-stp4531
-a(F7.0268721580505371
-Vscheduler.select_destinations.end
-p4532
-(dp4533
-V_context_domain
-p4534
-NsV_context_request_id
-p4535
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p4536
-sV_context_quota_class
-p4537
-NsVevent_type
-p4538
-g4532
-sV_context_service_catalog
-p4539
-(lp4540
-(dp4541
-Vendpoints
-p4542
-(lp4543
-(dp4544
-VadminURL
-p4545
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4546
-sVregion
-p4547
-VRegionOne
-p4548
-sVinternalURL
-p4549
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4550
-sVpublicURL
-p4551
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4552
-sasVtype
-p4553
-Vvolume
-p4554
-sVname
-p4555
-Vcinder
-p4556
-sa(dp4557
-g4542
-(lp4558
-(dp4559
-g4545
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4560
-sg4547
-VRegionOne
-p4561
-sg4549
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4562
-sg4551
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4563
-sasg4553
-Vvolumev2
-p4564
-sg4555
-Vcinderv2
-p4565
-sasV_context_auth_token
-p4566
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4567
-sV_context_resource_uuid
-p4568
-NsV_context_user_id
-p4569
-Vef7a4f67379f41aba489a0b6d6a62094
-p4570
-sVpayload
-p4571
-(dp4572
-Vrequest_spec
-p4573
-(dp4574
-Vinstance_properties
-p4575
-(dp4576
-Vroot_gb
-p4577
-I40
-sVuuid
-p4578
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4579
-sVavailability_zone
-p4580
-Vnova
-p4581
-sVephemeral_gb
-p4582
-I0
-sVnuma_topology
-p4583
-NsVmemory_mb
-p4584
-I4096
-sVvcpus
-p4585
-I2
-sVproject_id
-p4586
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4587
-sVpci_requests
-p4588
-(dp4589
-Vinstance_uuid
-p4590
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4591
-sVrequests
-p4592
-(lp4593
-sssVinstance_type
-p4594
-(dp4595
-Vdisabled
-p4596
-I00
-sg4577
-I40
-sg4555
-Vm1.medium
-p4597
-sVflavorid
-p4598
-V3
-sVdeleted
-p4599
-I00
-sVcreated_at
-p4600
-Nsg4582
-I0
-sVupdated_at
-p4601
-Nsg4584
-I4096
-sg4585
-I2
-sVextra_specs
-p4602
-(dp4603
-sVswap
-p4604
-I0
-sVrxtx_factor
-p4605
-F1
-sVis_public
-p4606
-I01
-sVdeleted_at
-p4607
-NsVvcpu_weight
-p4608
-I0
-sVid
-p4609
-I1
-ssVimage
-p4610
-(dp4611
-Vstatus
-p4612
-Vactive
-p4613
-sg4555
-Vubuntu1404
-p4614
-sVcontainer_format
-p4615
-Vbare
-p4616
-sg4600
-V2017-07-01T10:51:05.000000
-p4617
-sVdisk_format
-p4618
-Vqcow2
-p4619
-sg4601
-V2017-07-01T10:51:08.000000
-p4620
-sg4609
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p4621
-sVmin_disk
-p4622
-I2
-sVmin_ram
-p4623
-I0
-sVchecksum
-p4624
-V6ad21b1699bcc4cbc02936bf1e915911
-p4625
-sVowner
-p4626
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4627
-sVproperties
-p4628
-(dp4629
-sVsize
-p4630
-I262144512
-ssVnum_instances
-p4631
-I1
-sssV_context_show_deleted
-p4632
-I00
-sVpriority
-p4633
-VINFO
-p4634
-sV_context_is_admin
-p4635
-I01
-sV_context_project_domain
-p4636
-NsV_context_user
-p4637
-Vef7a4f67379f41aba489a0b6d6a62094
-p4638
-sVpublisher_id
-p4639
-Vscheduler.machine-A
-p4640
-sVmessage_id
-p4641
-V24974188-8f57-45bd-9cf8-c5ab53490dc5
-p4642
-sV_context_remote_address
-p4643
-V172.16.0.5
-p4644
-sV_context_roles
-p4645
-(lp4646
-Vadmin
-p4647
-asVtimestamp
-p4648
-V2017-11-30 11:03:58.857388
-p4649
-sV_context_timestamp
-p4650
-V2017-11-30T11:03:58.557388
-p4651
-sV_unique_id
-p4652
-V4da11d7187fb4ecf8ddbab4ddc475484
-p4653
-sV_context_project_name
-p4654
-Vapexlake
-p4655
-sV_context_read_deleted
-p4656
-Vno
-p4657
-sV_context_user_identity
-p4658
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4659
-sV_context_tenant
-p4660
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4661
-sV_context_instance_lock_checked
-p4662
-I00
-sV_context_project_id
-p4663
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4664
-sV_context_read_only
-p4665
-I00
-sV_context_user_domain
-p4666
-NsV_context_user_name
-p4667
-Violie
-p4668
-stp4669
-a(F7.1656601428985596
-Vcompute.instance.update
-p4670
-(dp4671
-V_context_domain
-p4672
-NsV_context_request_id
-p4673
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p4674
-sV_context_quota_class
-p4675
-NsVevent_type
-p4676
-g4670
-sV_context_service_catalog
-p4677
-(lp4678
-(dp4679
-Vendpoints
-p4680
-(lp4681
-(dp4682
-VadminURL
-p4683
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4684
-sVregion
-p4685
-VRegionOne
-p4686
-sVinternalURL
-p4687
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4688
-sVpublicURL
-p4689
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4690
-sasVtype
-p4691
-Vvolume
-p4692
-sVname
-p4693
-Vcinder
-p4694
-sa(dp4695
-g4680
-(lp4696
-(dp4697
-g4683
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4698
-sg4685
-VRegionOne
-p4699
-sg4687
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4700
-sg4689
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4701
-sasg4691
-Vvolumev2
-p4702
-sg4693
-Vcinderv2
-p4703
-sasV_context_auth_token
-p4704
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4705
-sV_context_resource_uuid
-p4706
-NsV_context_user_id
-p4707
-Vef7a4f67379f41aba489a0b6d6a62094
-p4708
-sVpayload
-p4709
-(dp4710
-Vstate_description
-p4711
-V
-sVavailability_zone
-p4712
-Vnova
-p4713
-sVterminated_at
-p4714
-V
-sVephemeral_gb
-p4715
-I0
-sVinstance_type_id
-p4716
-I1
-sVbandwidth
-p4717
-(dp4718
-sVdeleted_at
-p4719
-V
-sVreservation_id
-p4720
-Vr-4jmm1xbm
-p4721
-sVmemory_mb
-p4722
-I4096
-sVdisplay_name
-p4723
-Vvm_test
-p4724
-sVhostname
-p4725
-Vvm-test
-p4726
-sVstate
-p4727
-Vbuilding
-p4728
-sVold_state
-p4729
-Vbuilding
-p4730
-sVprogress
-p4731
-V
-sVlaunched_at
-p4732
-V
-sVmetadata
-p4733
-(dp4734
-sVnode
-p4735
-NsVramdisk_id
-p4736
-V
-sVaccess_ip_v6
-p4737
-NsVdisk_gb
-p4738
-I40
-sVaccess_ip_v4
-p4739
-NsVkernel_id
-p4740
-V
-sVhost
-p4741
-NsVuser_id
-p4742
-Vef7a4f67379f41aba489a0b6d6a62094
-p4743
-sVimage_ref_url
-p4744
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p4745
-sVcell_name
-p4746
-V
-sVaudit_period_beginning
-p4747
-V2017-11-01T00:00:00.000000
-p4748
-sVroot_gb
-p4749
-I40
-sVtenant_id
-p4750
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4751
-sVcreated_at
-p4752
-V2017-11-30T11:03:59.000000
-p4753
-sVold_task_state
-p4754
-Vscheduling
-p4755
-sVinstance_id
-p4756
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4757
-sVinstance_type
-p4758
-Vm1.medium
-p4759
-sVvcpus
-p4760
-I2
-sVimage_meta
-p4761
-(dp4762
-Vmin_disk
-p4763
-V40
-p4764
-sVcontainer_format
-p4765
-Vbare
-p4766
-sVmin_ram
-p4767
-V0
-sVdisk_format
-p4768
-Vqcow2
-p4769
-sVbase_image_ref
-p4770
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p4771
-ssVarchitecture
-p4772
-NsVnew_task_state
-p4773
-NsVaudit_period_ending
-p4774
-V2017-11-30T11:03:58.991455
-p4775
-sVos_type
-p4776
-NsVinstance_flavor_id
-p4777
-V3
-ssV_context_show_deleted
-p4778
-I00
-sVpriority
-p4779
-VINFO
-p4780
-sV_context_is_admin
-p4781
-I01
-sV_context_project_domain
-p4782
-NsV_context_user
-p4783
-Vef7a4f67379f41aba489a0b6d6a62094
-p4784
-sVpublisher_id
-p4785
-Vcompute.machine-A
-p4786
-sVmessage_id
-p4787
-V821beadb-f927-48be-bdbb-db568d373f93
-p4788
-sV_context_remote_address
-p4789
-V172.16.0.5
-p4790
-sV_context_roles
-p4791
-(lp4792
-Vadmin
-p4793
-asVtimestamp
-p4794
-V2017-11-30 11:03:58.996284
-p4795
-sV_context_timestamp
-p4796
-V2017-11-30T11:03:58.557388
-p4797
-sV_unique_id
-p4798
-V4e46966fe0ec456c9873bd11b0591a8f
-p4799
-sV_context_project_name
-p4800
-Vapexlake
-p4801
-sV_context_read_deleted
-p4802
-Vno
-p4803
-sV_context_user_identity
-p4804
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4805
-sV_context_tenant
-p4806
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4807
-sV_context_instance_lock_checked
-p4808
-I00
-sV_context_project_id
-p4809
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4810
-sV_context_read_only
-p4811
-I00
-sV_context_user_domain
-p4812
-NsV_context_user_name
-p4813
-Violie
-p4814
-stp4815
-a(F7.1757380962371826
-Vcompute.instance.create.start
-p4816
-(dp4817
-V_context_domain
-p4818
-NsV_context_request_id
-p4819
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p4820
-sV_context_quota_class
-p4821
-NsVevent_type
-p4822
-g4816
-sV_context_service_catalog
-p4823
-(lp4824
-(dp4825
-Vendpoints
-p4826
-(lp4827
-(dp4828
-VadminURL
-p4829
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4830
-sVregion
-p4831
-VRegionOne
-p4832
-sVinternalURL
-p4833
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4834
-sVpublicURL
-p4835
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4836
-sasVtype
-p4837
-Vvolume
-p4838
-sVname
-p4839
-Vcinder
-p4840
-sa(dp4841
-g4826
-(lp4842
-(dp4843
-g4829
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4844
-sg4831
-VRegionOne
-p4845
-sg4833
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4846
-sg4835
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4847
-sasg4837
-Vvolumev2
-p4848
-sg4839
-Vcinderv2
-p4849
-sasV_context_auth_token
-p4850
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4851
-sV_context_resource_uuid
-p4852
-NsV_context_user_id
-p4853
-Vef7a4f67379f41aba489a0b6d6a62094
-p4854
-sVpayload
-p4855
-(dp4856
-Vstate_description
-p4857
-V
-sVavailability_zone
-p4858
-Vnova
-p4859
-sVterminated_at
-p4860
-V
-sVephemeral_gb
-p4861
-I0
-sVinstance_type_id
-p4862
-I1
-sVdeleted_at
-p4863
-V
-sVreservation_id
-p4864
-Vr-4jmm1xbm
-p4865
-sVmemory_mb
-p4866
-I4096
-sVdisplay_name
-p4867
-Vvm_test
-p4868
-sVhostname
-p4869
-Vvm-test
-p4870
-sVstate
-p4871
-Vbuilding
-p4872
-sVprogress
-p4873
-V
-sVlaunched_at
-p4874
-V
-sVmetadata
-p4875
-(dp4876
-sVnode
-p4877
-NsVramdisk_id
-p4878
-V
-sVaccess_ip_v6
-p4879
-NsVdisk_gb
-p4880
-I40
-sVaccess_ip_v4
-p4881
-NsVkernel_id
-p4882
-V
-sVimage_name
-p4883
-Vubuntu1404
-p4884
-sVhost
-p4885
-NsVuser_id
-p4886
-Vef7a4f67379f41aba489a0b6d6a62094
-p4887
-sVimage_ref_url
-p4888
-Vhttp://172.16.0.7:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p4889
-sVcell_name
-p4890
-V
-sVroot_gb
-p4891
-I40
-sVtenant_id
-p4892
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4893
-sVcreated_at
-p4894
-V2017-11-30T11:03:59.000000
-p4895
-sVinstance_id
-p4896
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4897
-sVinstance_type
-p4898
-Vm1.medium
-p4899
-sVvcpus
-p4900
-I2
-sVimage_meta
-p4901
-(dp4902
-Vmin_disk
-p4903
-V40
-p4904
-sVcontainer_format
-p4905
-Vbare
-p4906
-sVmin_ram
-p4907
-V0
-sVdisk_format
-p4908
-Vqcow2
-p4909
-sVbase_image_ref
-p4910
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p4911
-ssVarchitecture
-p4912
-NsVos_type
-p4913
-NsVinstance_flavor_id
-p4914
-V3
-ssV_context_show_deleted
-p4915
-I00
-sVpriority
-p4916
-VINFO
-p4917
-sV_context_is_admin
-p4918
-I01
-sV_context_project_domain
-p4919
-NsV_context_user
-p4920
-Vef7a4f67379f41aba489a0b6d6a62094
-p4921
-sVpublisher_id
-p4922
-Vcompute.machine-C
-p4923
-sVmessage_id
-p4924
-V1cdeeb0b-cdca-456d-8f59-8e095fb78922
-p4925
-sV_context_remote_address
-p4926
-V172.16.0.5
-p4927
-sV_context_roles
-p4928
-(lp4929
-Vadmin
-p4930
-asVtimestamp
-p4931
-V2017-11-30 11:03:59.005473
-p4932
-sV_context_timestamp
-p4933
-V2017-11-30T11:03:58.557388
-p4934
-sV_unique_id
-p4935
-Vd8e75ae2ec394ece89bbcdb84a32388b
-p4936
-sV_context_project_name
-p4937
-Vapexlake
-p4938
-sV_context_read_deleted
-p4939
-Vno
-p4940
-sV_context_user_identity
-p4941
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4942
-sV_context_tenant
-p4943
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4944
-sV_context_instance_lock_checked
-p4945
-I00
-sV_context_project_id
-p4946
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4947
-sV_context_read_only
-p4948
-I00
-sV_context_user_domain
-p4949
-NsV_context_user_name
-p4950
-Violie
-p4951
-stp4952
-a(F7.2708141803741455
-Vcompute.instance.update
-p4953
-(dp4954
-V_context_domain
-p4955
-NsV_context_request_id
-p4956
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p4957
-sV_context_quota_class
-p4958
-NsVevent_type
-p4959
-g4953
-sV_context_service_catalog
-p4960
-(lp4961
-(dp4962
-Vendpoints
-p4963
-(lp4964
-(dp4965
-VadminURL
-p4966
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4967
-sVregion
-p4968
-VRegionOne
-p4969
-sVinternalURL
-p4970
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4971
-sVpublicURL
-p4972
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4973
-sasVtype
-p4974
-Vvolume
-p4975
-sVname
-p4976
-Vcinder
-p4977
-sa(dp4978
-g4963
-(lp4979
-(dp4980
-g4966
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4981
-sg4968
-VRegionOne
-p4982
-sg4970
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4983
-sg4972
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4984
-sasg4974
-Vvolumev2
-p4985
-sg4976
-Vcinderv2
-p4986
-sasV_context_auth_token
-p4987
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p4988
-sV_context_resource_uuid
-p4989
-NsV_context_user_id
-p4990
-Vef7a4f67379f41aba489a0b6d6a62094
-p4991
-sVpayload
-p4992
-(dp4993
-Vstate_description
-p4994
-V
-sVavailability_zone
-p4995
-Vnova
-p4996
-sVterminated_at
-p4997
-V
-sVephemeral_gb
-p4998
-I0
-sVinstance_type_id
-p4999
-I1
-sVbandwidth
-p5000
-(dp5001
-sVdeleted_at
-p5002
-V
-sVreservation_id
-p5003
-Vr-4jmm1xbm
-p5004
-sVmemory_mb
-p5005
-I4096
-sVdisplay_name
-p5006
-Vvm_test
-p5007
-sVhostname
-p5008
-Vvm-test
-p5009
-sVstate
-p5010
-Vbuilding
-p5011
-sVold_state
-p5012
-Vbuilding
-p5013
-sVprogress
-p5014
-V
-sVlaunched_at
-p5015
-V
-sVmetadata
-p5016
-(dp5017
-sVnode
-p5018
-Vmachine-C
-p5019
-sVramdisk_id
-p5020
-V
-sVaccess_ip_v6
-p5021
-NsVdisk_gb
-p5022
-I40
-sVaccess_ip_v4
-p5023
-NsVkernel_id
-p5024
-V
-sVhost
-p5025
-Vmachine-C
-p5026
-sVuser_id
-p5027
-Vef7a4f67379f41aba489a0b6d6a62094
-p5028
-sVimage_ref_url
-p5029
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p5030
-sVcell_name
-p5031
-V
-sVaudit_period_beginning
-p5032
-V2017-11-01T00:00:00.000000
-p5033
-sVroot_gb
-p5034
-I40
-sVtenant_id
-p5035
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5036
-sVcreated_at
-p5037
-V2017-11-30T11:03:59.000000
-p5038
-sVold_task_state
-p5039
-NsVinstance_id
-p5040
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p5041
-sVinstance_type
-p5042
-Vm1.medium
-p5043
-sVvcpus
-p5044
-I2
-sVimage_meta
-p5045
-(dp5046
-Vmin_disk
-p5047
-V40
-p5048
-sVcontainer_format
-p5049
-Vbare
-p5050
-sVmin_ram
-p5051
-V0
-sVdisk_format
-p5052
-Vqcow2
-p5053
-sVbase_image_ref
-p5054
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p5055
-ssVarchitecture
-p5056
-NsVnew_task_state
-p5057
-NsVaudit_period_ending
-p5058
-V2017-11-30T11:03:59.095910
-p5059
-sVos_type
-p5060
-NsVinstance_flavor_id
-p5061
-V3
-ssV_context_show_deleted
-p5062
-I00
-sVpriority
-p5063
-VINFO
-p5064
-sV_context_is_admin
-p5065
-I01
-sV_context_project_domain
-p5066
-NsV_context_user
-p5067
-Vef7a4f67379f41aba489a0b6d6a62094
-p5068
-sVpublisher_id
-p5069
-Vcompute.machine-A
-p5070
-sVmessage_id
-p5071
-V95f974f0-1b9e-42b5-918a-f6327058259c
-p5072
-sV_context_remote_address
-p5073
-V172.16.0.5
-p5074
-sV_context_roles
-p5075
-(lp5076
-Vadmin
-p5077
-asVtimestamp
-p5078
-V2017-11-30 11:03:59.101122
-p5079
-sV_context_timestamp
-p5080
-V2017-11-30T11:03:58.557388
-p5081
-sV_unique_id
-p5082
-Vab05e940d4a34ff8bb319f0f9649bc52
-p5083
-sV_context_project_name
-p5084
-Vapexlake
-p5085
-sV_context_read_deleted
-p5086
-Vno
-p5087
-sV_context_user_identity
-p5088
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5089
-sV_context_tenant
-p5090
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5091
-sV_context_instance_lock_checked
-p5092
-I00
-sV_context_project_id
-p5093
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5094
-sV_context_read_only
-p5095
-I00
-sV_context_user_domain
-p5096
-NsV_context_user_name
-p5097
-Violie
-p5098
-stp5099
-a(F7.3599920272827148
-Vcompute.instance.update
-p5100
-(dp5101
-V_context_domain
-p5102
-NsV_context_request_id
-p5103
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p5104
-sV_context_quota_class
-p5105
-NsVevent_type
-p5106
-g5100
-sV_context_service_catalog
-p5107
-(lp5108
-(dp5109
-Vendpoints
-p5110
-(lp5111
-(dp5112
-VadminURL
-p5113
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5114
-sVregion
-p5115
-VRegionOne
-p5116
-sVinternalURL
-p5117
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5118
-sVpublicURL
-p5119
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5120
-sasVtype
-p5121
-Vvolume
-p5122
-sVname
-p5123
-Vcinder
-p5124
-sa(dp5125
-g5110
-(lp5126
-(dp5127
-g5113
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5128
-sg5115
-VRegionOne
-p5129
-sg5117
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5130
-sg5119
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5131
-sasg5121
-Vvolumev2
-p5132
-sg5123
-Vcinderv2
-p5133
-sasV_context_auth_token
-p5134
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p5135
-sV_context_resource_uuid
-p5136
-NsV_context_user_id
-p5137
-Vef7a4f67379f41aba489a0b6d6a62094
-p5138
-sVpayload
-p5139
-(dp5140
-Vstate_description
-p5141
-Vnetworking
-p5142
-sVavailability_zone
-p5143
-Vnova
-p5144
-sVterminated_at
-p5145
-V
-sVephemeral_gb
-p5146
-I0
-sVinstance_type_id
-p5147
-I1
-sVbandwidth
-p5148
-(dp5149
-sVdeleted_at
-p5150
-V
-sVreservation_id
-p5151
-Vr-4jmm1xbm
-p5152
-sVmemory_mb
-p5153
-I4096
-sVdisplay_name
-p5154
-Vvm_test
-p5155
-sVhostname
-p5156
-Vvm-test
-p5157
-sVstate
-p5158
-Vbuilding
-p5159
-sVold_state
-p5160
-Vbuilding
-p5161
-sVprogress
-p5162
-V
-sVlaunched_at
-p5163
-V
-sVmetadata
-p5164
-(dp5165
-sVnode
-p5166
-Vmachine-C
-p5167
-sVramdisk_id
-p5168
-V
-sVaccess_ip_v6
-p5169
-NsVdisk_gb
-p5170
-I40
-sVaccess_ip_v4
-p5171
-NsVkernel_id
-p5172
-V
-sVhost
-p5173
-Vmachine-C
-p5174
-sVuser_id
-p5175
-Vef7a4f67379f41aba489a0b6d6a62094
-p5176
-sVimage_ref_url
-p5177
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p5178
-sVcell_name
-p5179
-V
-sVaudit_period_beginning
-p5180
-V2017-11-01T00:00:00.000000
-p5181
-sVroot_gb
-p5182
-I40
-sVtenant_id
-p5183
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5184
-sVcreated_at
-p5185
-V2017-11-30T11:03:59.000000
-p5186
-sVold_task_state
-p5187
-Vnetworking
-p5188
-sVinstance_id
-p5189
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p5190
-sVinstance_type
-p5191
-Vm1.medium
-p5192
-sVvcpus
-p5193
-I2
-sVimage_meta
-p5194
-(dp5195
-Vmin_disk
-p5196
-V40
-p5197
-sVcontainer_format
-p5198
-Vbare
-p5199
-sVmin_ram
-p5200
-V0
-sVdisk_format
-p5201
-Vqcow2
-p5202
-sVbase_image_ref
-p5203
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p5204
-ssVarchitecture
-p5205
-NsVnew_task_state
-p5206
-Vnetworking
-p5207
-sVaudit_period_ending
-p5208
-V2017-11-30T11:03:59.187287
-p5209
-sVos_type
-p5210
-NsVinstance_flavor_id
-p5211
-V3
-ssV_context_show_deleted
-p5212
-I00
-sVpriority
-p5213
-VINFO
-p5214
-sV_context_is_admin
-p5215
-I01
-sV_context_project_domain
-p5216
-NsV_context_user
-p5217
-Vef7a4f67379f41aba489a0b6d6a62094
-p5218
-sVpublisher_id
-p5219
-Vcompute.machine-A
-p5220
-sVmessage_id
-p5221
-V8e204ed8-6ff5-4db5-95cb-c441ce6452ce
-p5222
-sV_context_remote_address
-p5223
-V172.16.0.5
-p5224
-sV_context_roles
-p5225
-(lp5226
-Vadmin
-p5227
-asVtimestamp
-p5228
-V2017-11-30 11:03:59.190639
-p5229
-sV_context_timestamp
-p5230
-V2017-11-30T11:03:58.557388
-p5231
-sV_unique_id
-p5232
-V3167a254fe044dc6b12f3e066e03c4f5
-p5233
-sV_context_project_name
-p5234
-Vapexlake
-p5235
-sV_context_read_deleted
-p5236
-Vno
-p5237
-sV_context_user_identity
-p5238
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5239
-sV_context_tenant
-p5240
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5241
-sV_context_instance_lock_checked
-p5242
-I00
-sV_context_project_id
-p5243
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5244
-sV_context_read_only
-p5245
-I00
-sV_context_user_domain
-p5246
-NsV_context_user_name
-p5247
-Violie
-p5248
-stp5249
-a(F7.4670741558074951
-Vcompute.instance.update
-p5250
-(dp5251
-V_context_domain
-p5252
-NsV_context_request_id
-p5253
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p5254
-sV_context_quota_class
-p5255
-NsVevent_type
-p5256
-g5250
-sV_context_service_catalog
-p5257
-(lp5258
-(dp5259
-Vendpoints
-p5260
-(lp5261
-(dp5262
-VadminURL
-p5263
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5264
-sVregion
-p5265
-VRegionOne
-p5266
-sVinternalURL
-p5267
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5268
-sVpublicURL
-p5269
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5270
-sasVtype
-p5271
-Vvolume
-p5272
-sVname
-p5273
-Vcinder
-p5274
-sa(dp5275
-g5260
-(lp5276
-(dp5277
-g5263
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5278
-sg5265
-VRegionOne
-p5279
-sg5267
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5280
-sg5269
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5281
-sasg5271
-Vvolumev2
-p5282
-sg5273
-Vcinderv2
-p5283
-sasV_context_auth_token
-p5284
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p5285
-sV_context_resource_uuid
-p5286
-NsV_context_user_id
-p5287
-Vef7a4f67379f41aba489a0b6d6a62094
-p5288
-sVpayload
-p5289
-(dp5290
-Vstate_description
-p5291
-Vblock_device_mapping
-p5292
-sVavailability_zone
-p5293
-Vnova
-p5294
-sVterminated_at
-p5295
-V
-sVephemeral_gb
-p5296
-I0
-sVinstance_type_id
-p5297
-I1
-sVbandwidth
-p5298
-(dp5299
-sVdeleted_at
-p5300
-V
-sVreservation_id
-p5301
-Vr-4jmm1xbm
-p5302
-sVmemory_mb
-p5303
-I4096
-sVdisplay_name
-p5304
-Vvm_test
-p5305
-sVhostname
-p5306
-Vvm-test
-p5307
-sVstate
-p5308
-Vbuilding
-p5309
-sVold_state
-p5310
-Vbuilding
-p5311
-sVprogress
-p5312
-V
-sVlaunched_at
-p5313
-V
-sVmetadata
-p5314
-(dp5315
-sVnode
-p5316
-Vmachine-C
-p5317
-sVramdisk_id
-p5318
-V
-sVaccess_ip_v6
-p5319
-NsVdisk_gb
-p5320
-I40
-sVaccess_ip_v4
-p5321
-NsVkernel_id
-p5322
-V
-sVhost
-p5323
-Vmachine-C
-p5324
-sVuser_id
-p5325
-Vef7a4f67379f41aba489a0b6d6a62094
-p5326
-sVimage_ref_url
-p5327
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p5328
-sVcell_name
-p5329
-V
-sVaudit_period_beginning
-p5330
-V2017-11-01T00:00:00.000000
-p5331
-sVroot_gb
-p5332
-I40
-sVtenant_id
-p5333
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5334
-sVcreated_at
-p5335
-V2017-11-30T11:03:59.000000
-p5336
-sVold_task_state
-p5337
-Vnetworking
-p5338
-sVinstance_id
-p5339
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p5340
-sVinstance_type
-p5341
-Vm1.medium
-p5342
-sVvcpus
-p5343
-I2
-sVimage_meta
-p5344
-(dp5345
-Vmin_disk
-p5346
-V40
-p5347
-sVcontainer_format
-p5348
-Vbare
-p5349
-sVmin_ram
-p5350
-V0
-sVdisk_format
-p5351
-Vqcow2
-p5352
-sVbase_image_ref
-p5353
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p5354
-ssVarchitecture
-p5355
-NsVnew_task_state
-p5356
-Vblock_device_mapping
-p5357
-sVaudit_period_ending
-p5358
-V2017-11-30T11:03:59.293001
-p5359
-sVos_type
-p5360
-NsVinstance_flavor_id
-p5361
-V3
-ssV_context_show_deleted
-p5362
-I00
-sVpriority
-p5363
-VINFO
-p5364
-sV_context_is_admin
-p5365
-I01
-sV_context_project_domain
-p5366
-NsV_context_user
-p5367
-Vef7a4f67379f41aba489a0b6d6a62094
-p5368
-sVpublisher_id
-p5369
-Vcompute.machine-A
-p5370
-sVmessage_id
-p5371
-V69b1880c-ae98-4c2d-8f95-5407d30c9afa
-p5372
-sV_context_remote_address
-p5373
-V172.16.0.5
-p5374
-sV_context_roles
-p5375
-(lp5376
-Vadmin
-p5377
-asVtimestamp
-p5378
-V2017-11-30 11:03:59.297433
-p5379
-sV_context_timestamp
-p5380
-V2017-11-30T11:03:58.557388
-p5381
-sV_unique_id
-p5382
-V5f67b244eea144298c8fe90aa18f8417
-p5383
-sV_context_project_name
-p5384
-Vapexlake
-p5385
-sV_context_read_deleted
-p5386
-Vno
-p5387
-sV_context_user_identity
-p5388
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5389
-sV_context_tenant
-p5390
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5391
-sV_context_instance_lock_checked
-p5392
-I00
-sV_context_project_id
-p5393
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5394
-sV_context_read_only
-p5395
-I00
-sV_context_user_domain
-p5396
-NsV_context_user_name
-p5397
-Violie
-p5398
-stp5399
-a(F7.5344531536102295
-Vcompute.instance.update
-p5400
-(dp5401
-V_context_domain
-p5402
-NsV_context_request_id
-p5403
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p5404
-sV_context_quota_class
-p5405
-NsVevent_type
-p5406
-g5400
-sV_context_service_catalog
-p5407
-(lp5408
-(dp5409
-Vendpoints
-p5410
-(lp5411
-(dp5412
-VadminURL
-p5413
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5414
-sVregion
-p5415
-VRegionOne
-p5416
-sVinternalURL
-p5417
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5418
-sVpublicURL
-p5419
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5420
-sasVtype
-p5421
-Vvolume
-p5422
-sVname
-p5423
-Vcinder
-p5424
-sa(dp5425
-g5410
-(lp5426
-(dp5427
-g5413
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5428
-sg5415
-VRegionOne
-p5429
-sg5417
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5430
-sg5419
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5431
-sasg5421
-Vvolumev2
-p5432
-sg5423
-Vcinderv2
-p5433
-sasV_context_auth_token
-p5434
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p5435
-sV_context_resource_uuid
-p5436
-NsV_context_user_id
-p5437
-Vef7a4f67379f41aba489a0b6d6a62094
-p5438
-sVpayload
-p5439
-(dp5440
-Vstate_description
-p5441
-Vspawning
-p5442
-sVavailability_zone
-p5443
-Vnova
-p5444
-sVterminated_at
-p5445
-V
-sVephemeral_gb
-p5446
-I0
-sVinstance_type_id
-p5447
-I1
-sVbandwidth
-p5448
-(dp5449
-sVdeleted_at
-p5450
-V
-sVreservation_id
-p5451
-Vr-4jmm1xbm
-p5452
-sVmemory_mb
-p5453
-I4096
-sVdisplay_name
-p5454
-Vvm_test
-p5455
-sVhostname
-p5456
-Vvm-test
-p5457
-sVstate
-p5458
-Vbuilding
-p5459
-sVold_state
-p5460
-Vbuilding
-p5461
-sVprogress
-p5462
-V
-sVlaunched_at
-p5463
-V
-sVmetadata
-p5464
-(dp5465
-sVnode
-p5466
-Vmachine-C
-p5467
-sVramdisk_id
-p5468
-V
-sVaccess_ip_v6
-p5469
-NsVdisk_gb
-p5470
-I40
-sVaccess_ip_v4
-p5471
-NsVkernel_id
-p5472
-V
-sVhost
-p5473
-Vmachine-C
-p5474
-sVuser_id
-p5475
-Vef7a4f67379f41aba489a0b6d6a62094
-p5476
-sVimage_ref_url
-p5477
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p5478
-sVcell_name
-p5479
-V
-sVaudit_period_beginning
-p5480
-V2017-11-01T00:00:00.000000
-p5481
-sVroot_gb
-p5482
-I40
-sVtenant_id
-p5483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5484
-sVcreated_at
-p5485
-V2017-11-30T11:03:59.000000
-p5486
-sVold_task_state
-p5487
-Vblock_device_mapping
-p5488
-sVinstance_id
-p5489
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p5490
-sVinstance_type
-p5491
-Vm1.medium
-p5492
-sVvcpus
-p5493
-I2
-sVimage_meta
-p5494
-(dp5495
-Vmin_disk
-p5496
-V40
-p5497
-sVcontainer_format
-p5498
-Vbare
-p5499
-sVmin_ram
-p5500
-V0
-sVdisk_format
-p5501
-Vqcow2
-p5502
-sVbase_image_ref
-p5503
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p5504
-ssVarchitecture
-p5505
-NsVnew_task_state
-p5506
-Vspawning
-p5507
-sVaudit_period_ending
-p5508
-V2017-11-30T11:03:59.360917
-p5509
-sVos_type
-p5510
-NsVinstance_flavor_id
-p5511
-V3
-ssV_context_show_deleted
-p5512
-I00
-sVpriority
-p5513
-VINFO
-p5514
-sV_context_is_admin
-p5515
-I01
-sV_context_project_domain
-p5516
-NsV_context_user
-p5517
-Vef7a4f67379f41aba489a0b6d6a62094
-p5518
-sVpublisher_id
-p5519
-Vcompute.machine-A
-p5520
-sVmessage_id
-p5521
-V9bdbaf5c-5d64-4164-b767-7ab61ce38bcb
-p5522
-sV_context_remote_address
-p5523
-V172.16.0.5
-p5524
-sV_context_roles
-p5525
-(lp5526
-Vadmin
-p5527
-asVtimestamp
-p5528
-V2017-11-30 11:03:59.364825
-p5529
-sV_context_timestamp
-p5530
-V2017-11-30T11:03:58.557388
-p5531
-sV_unique_id
-p5532
-V447cda1db8464a7a93398008cc869d56
-p5533
-sV_context_project_name
-p5534
-Vapexlake
-p5535
-sV_context_read_deleted
-p5536
-Vno
-p5537
-sV_context_user_identity
-p5538
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5539
-sV_context_tenant
-p5540
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5541
-sV_context_instance_lock_checked
-p5542
-I00
-sV_context_project_id
-p5543
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5544
-sV_context_read_only
-p5545
-I00
-sV_context_user_domain
-p5546
-NsV_context_user_name
-p5547
-Violie
-p5548
-stp5549
-a(F7.5607891082763672
-Vport.update.start
-p5550
-(dp5551
-V_context_domain
-p5552
-NsV_context_request_id
-p5553
-Vreq-2d3a006b-5c50-4522-a72c-af16b7487243
-p5554
-sVevent_type
-p5555
-g5550
-sV_context_auth_token
-p5556
-VgAAAAABaH-Wfd7TZIXXJPMH1HHQqx_qC4NgmENjE_fNChBj5NiFMELs3mInsxfUoG_cVYW4qXmmabXCKFdoJSW0uHGL532NvqPHQiqYBhDuibo1dXODyjZ4xtP39nRzCCS6V0ksS0ABfS2oBUBIqhss0-BVOM-mmH1Q_w4cFCVbQbNUOfBvvB8s
-p5557
-sV_context_resource_uuid
-p5558
-NsV_context_tenant_name
-p5559
-Vservices
-p5560
-sV_context_user_id
-p5561
-V84faafdbb77b40c9a73047fdebb0ab45
-p5562
-sVpayload
-p5563
-(dp5564
-Vport
-p5565
-(dp5566
-Vdns_name
-p5567
-Vvm-test
-p5568
-sVdevice_owner
-p5569
-Vcompute:nova
-p5570
-sVbinding:host_id
-p5571
-Vmachine-C
-p5572
-sVdevice_id
-p5573
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p5574
-ssVid
-p5575
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p5576
-ssV_context_show_deleted
-p5577
-I00
-sVpriority
-p5578
-VINFO
-p5579
-sV_context_is_admin
-p5580
-I01
-sV_context_project_domain
-p5581
-NsV_context_user
-p5582
-V84faafdbb77b40c9a73047fdebb0ab45
-p5583
-sVpublisher_id
-p5584
-Vnetwork.machine-A
-p5585
-sVmessage_id
-p5586
-Vee2b70af-02df-4085-877d-3696d997eeb1
-p5587
-sV_context_roles
-p5588
-(lp5589
-Vadmin
-p5590
-asVtimestamp
-p5591
-V2017-11-30 11:03:59.391530
-p5592
-sV_context_timestamp
-p5593
-V2017-11-30 11:03:59.390543
-p5594
-sV_unique_id
-p5595
-V729503c8bf1041d894d491fe1409196e
-p5596
-sV_context_tenant_id
-p5597
-V66fbf30f2dce4cef95d5248254dac9a5
-p5598
-sV_context_project_name
-p5599
-Vservices
-p5600
-sV_context_user_identity
-p5601
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p5602
-sV_context_tenant
-p5603
-V66fbf30f2dce4cef95d5248254dac9a5
-p5604
-sV_context_project_id
-p5605
-V66fbf30f2dce4cef95d5248254dac9a5
-p5606
-sV_context_read_only
-p5607
-I00
-sV_context_user_domain
-p5608
-NsV_context_user_name
-p5609
-Vneutron
-p5610
-stp5611
-a(F7.6629819869995117
-Vorchestration.stack.create.start
-p5612
-(dp5613
-V_context_request_id
-p5614
-Vreq-d5358eda-3e1a-4e32-b194-90c05c38a45d
-p5615
-sVevent_type
-p5616
-g5612
-sV_context_region_name
-p5617
-NsV_context_auth_token
-p5618
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p5619
-sV_context_user_id
-p5620
-Vef7a4f67379f41aba489a0b6d6a62094
-p5621
-sVpayload
-p5622
-(dp5623
-Vusername
-p5624
-NsVstate_reason
-p5625
-VStack CREATE started
-p5626
-sVuser_id
-p5627
-NsVuser_identity
-p5628
-Vef7a4f67379f41aba489a0b6d6a62094
-p5629
-sVstack_name
-p5630
-VC
-sVtenant_id
-p5631
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5632
-sVstack_identity
-p5633
-V46e5c635-6b08-47d3-8949-effa358b9485
-p5634
-sVcreate_at
-p5635
-V2017-11-30T11:03:59.376944
-p5636
-sVstate
-p5637
-VCREATE_IN_PROGRESS
-p5638
-ssV_context_username
-p5639
-NsV_context_show_deleted
-p5640
-I00
-sV_context_trust_id
-p5641
-NsVpriority
-p5642
-VINFO
-p5643
-sV_context_is_admin
-p5644
-I01
-sV_context_auth_token_info
-p5645
-(dp5646
-Vtoken
-p5647
-(dp5648
-Vmethods
-p5649
-(lp5650
-Vpassword
-p5651
-asVroles
-p5652
-(lp5653
-(dp5654
-Vid
-p5655
-Vd475171bf8304e06a74b1add560b1f28
-p5656
-sVname
-p5657
-Vadmin
-p5658
-sasVauth_token
-p5659
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p5660
-sVexpires_at
-p5661
-V2017-11-30T12:03:58.000000Z
-p5662
-sVproject
-p5663
-(dp5664
-Vdomain
-p5665
-(dp5666
-g5655
-Vdefault
-p5667
-sg5657
-VDefault
-p5668
-ssg5655
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5669
-sg5657
-Vapexlake
-p5670
-ssVcatalog
-p5671
-(lp5672
-(dp5673
-Vendpoints
-p5674
-(lp5675
-(dp5676
-Vurl
-p5677
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p5678
-sVinterface
-p5679
-Vpublic
-p5680
-sVregion
-p5681
-VRegionOne
-p5682
-sVregion_id
-p5683
-VRegionOne
-p5684
-sg5655
-V13359d68397c4732b5d455941ac95989
-p5685
-sa(dp5686
-g5677
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p5687
-sg5679
-Vinternal
-p5688
-sg5681
-VRegionOne
-p5689
-sg5683
-VRegionOne
-p5690
-sg5655
-V50aeae6c5d034dcb80871bdac7391209
-p5691
-sa(dp5692
-g5677
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p5693
-sg5679
-Vadmin
-p5694
-sg5681
-VRegionOne
-p5695
-sg5683
-VRegionOne
-p5696
-sg5655
-V93b06f780b224cbd9b514c2041d3db63
-p5697
-sasVtype
-p5698
-Vvolumev3
-p5699
-sg5655
-V00a63293a3154089a4c80b60b4aa9429
-p5700
-sg5657
-Vcinderv3
-p5701
-sa(dp5702
-g5674
-(lp5703
-(dp5704
-g5677
-Vhttp://172.16.0.5:8000/v1
-p5705
-sg5679
-Vadmin
-p5706
-sg5681
-VRegionOne
-p5707
-sg5683
-VRegionOne
-p5708
-sg5655
-V24acffb5d9154df4981db7424b7669bd
-p5709
-sa(dp5710
-g5677
-Vhttp://172.18.0.8:8000/v1
-p5711
-sg5679
-Vpublic
-p5712
-sg5681
-VRegionOne
-p5713
-sg5683
-VRegionOne
-p5714
-sg5655
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p5715
-sa(dp5716
-g5677
-Vhttp://172.16.0.5:8000/v1
-p5717
-sg5679
-Vinternal
-p5718
-sg5681
-VRegionOne
-p5719
-sg5683
-VRegionOne
-p5720
-sg5655
-V679262173a714d76a078051b95f8c969
-p5721
-sasg5698
-Vcloudformation
-p5722
-sg5655
-V245169ccae564a7db06ca002f1553b51
-p5723
-sg5657
-Vheat-cfn
-p5724
-sa(dp5725
-g5674
-(lp5726
-(dp5727
-g5677
-Vhttp://172.18.0.8:8080
-p5728
-sg5679
-Vpublic
-p5729
-sg5681
-VRegionOne
-p5730
-sg5683
-VRegionOne
-p5731
-sg5655
-V04a6ef3db6b046b1893ed45a3f906f6c
-p5732
-sa(dp5733
-g5677
-Vhttp://172.16.0.5:8080
-p5734
-sg5679
-Vinternal
-p5735
-sg5681
-VRegionOne
-p5736
-sg5683
-VRegionOne
-p5737
-sg5655
-V3e30684c9f74492b8ca9a64dd04261e6
-p5738
-sa(dp5739
-g5677
-Vhttp://172.16.0.5:8080
-p5740
-sg5679
-Vadmin
-p5741
-sg5681
-VRegionOne
-p5742
-sg5683
-VRegionOne
-p5743
-sg5655
-Vc5384b55cd7a441582f151c6b2807745
-p5744
-sasg5698
-Vs3
-p5745
-sg5655
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p5746
-sg5657
-Vswift_s3
-p5747
-sa(dp5748
-g5674
-(lp5749
-(dp5750
-g5677
-Vhttp://172.16.0.5:9696
-p5751
-sg5679
-Vadmin
-p5752
-sg5681
-VRegionOne
-p5753
-sg5683
-VRegionOne
-p5754
-sg5655
-V38b78b2c00264f59a4ade9392f88132b
-p5755
-sa(dp5756
-g5677
-Vhttp://172.18.0.8:9696
-p5757
-sg5679
-Vpublic
-p5758
-sg5681
-VRegionOne
-p5759
-sg5683
-VRegionOne
-p5760
-sg5655
-Vb5d0f72fbf674f84adf8929341e45586
-p5761
-sa(dp5762
-g5677
-Vhttp://172.16.0.5:9696
-p5763
-sg5679
-Vinternal
-p5764
-sg5681
-VRegionOne
-p5765
-sg5683
-VRegionOne
-p5766
-sg5655
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p5767
-sasg5698
-Vnetwork
-p5768
-sg5655
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p5769
-sg5657
-Vneutron
-p5770
-sa(dp5771
-g5674
-(lp5772
-(dp5773
-g5677
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5774
-sg5679
-Vinternal
-p5775
-sg5681
-VRegionOne
-p5776
-sg5683
-VRegionOne
-p5777
-sg5655
-V7c60744a22724044a92928bc2fa9e422
-p5778
-sa(dp5779
-g5677
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5780
-sg5679
-Vadmin
-p5781
-sg5681
-VRegionOne
-p5782
-sg5683
-VRegionOne
-p5783
-sg5655
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p5784
-sa(dp5785
-g5677
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5786
-sg5679
-Vpublic
-p5787
-sg5681
-VRegionOne
-p5788
-sg5683
-VRegionOne
-p5789
-sg5655
-Vde47d994bdc147bdb824474ea699a77a
-p5790
-sasg5698
-Vorchestration
-p5791
-sg5655
-V65a72244f7c54382aeebf5dfdeab8140
-p5792
-sg5657
-Vheat
-p5793
-sa(dp5794
-g5674
-(lp5795
-(dp5796
-g5677
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5797
-sg5679
-Vinternal
-p5798
-sg5681
-VRegionOne
-p5799
-sg5683
-VRegionOne
-p5800
-sg5655
-V3a25e85ecaa44b678c3721c2d3d39b38
-p5801
-sa(dp5802
-g5677
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5803
-sg5679
-Vadmin
-p5804
-sg5681
-VRegionOne
-p5805
-sg5683
-VRegionOne
-p5806
-sg5655
-V68c763474c3d4aa28c4ee0e0249998eb
-p5807
-sa(dp5808
-g5677
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5809
-sg5679
-Vpublic
-p5810
-sg5681
-VRegionOne
-p5811
-sg5683
-VRegionOne
-p5812
-sg5655
-Ve0c861373e94468db521d5a8793d33d1
-p5813
-sasg5698
-Vvolume
-p5814
-sg5655
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p5815
-sg5657
-Vcinder
-p5816
-sa(dp5817
-g5674
-(lp5818
-(dp5819
-g5677
-Vhttp://172.18.0.8:5000/v2.0
-p5820
-sg5679
-Vpublic
-p5821
-sg5681
-VRegionOne
-p5822
-sg5683
-VRegionOne
-p5823
-sg5655
-V6aa35bc15a35447db58ec5b67087f96a
-p5824
-sa(dp5825
-g5677
-Vhttp://172.16.0.5:5000/v2.0
-p5826
-sg5679
-Vinternal
-p5827
-sg5681
-VRegionOne
-p5828
-sg5683
-VRegionOne
-p5829
-sg5655
-V6b4742f26b694b93bdbcb37304d22f69
-p5830
-sa(dp5831
-g5677
-Vhttp://172.16.0.5:35357/v2.0
-p5832
-sg5679
-Vadmin
-p5833
-sg5681
-VRegionOne
-p5834
-sg5683
-VRegionOne
-p5835
-sg5655
-Vadc120ea606644a299a3c91a7ceeb8c4
-p5836
-sasg5698
-Videntity
-p5837
-sg5655
-V9f95de9f4efc4730b4dd90354894e1dc
-p5838
-sg5657
-Vkeystone
-p5839
-sa(dp5840
-g5674
-(lp5841
-(dp5842
-g5677
-Vhttp://172.16.0.5:9292
-p5843
-sg5679
-Vadmin
-p5844
-sg5681
-VRegionOne
-p5845
-sg5683
-VRegionOne
-p5846
-sg5655
-V049519f829be4e7fb5f44ae9f470efdf
-p5847
-sa(dp5848
-g5677
-Vhttp://172.18.0.8:9292
-p5849
-sg5679
-Vpublic
-p5850
-sg5681
-VRegionOne
-p5851
-sg5683
-VRegionOne
-p5852
-sg5655
-V1baebbbf35744192b335f4f293d1a9d8
-p5853
-sa(dp5854
-g5677
-Vhttp://172.16.0.5:9292
-p5855
-sg5679
-Vinternal
-p5856
-sg5681
-VRegionOne
-p5857
-sg5683
-VRegionOne
-p5858
-sg5655
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p5859
-sasg5698
-Vimage
-p5860
-sg5655
-Va39ec0213acc45ceb59346299e78d6c0
-p5861
-sg5657
-Vglance
-p5862
-sa(dp5863
-g5674
-(lp5864
-(dp5865
-g5677
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5866
-sg5679
-Vinternal
-p5867
-sg5681
-VRegionOne
-p5868
-sg5683
-VRegionOne
-p5869
-sg5655
-V2cd9d66e95484830a9006177e301aa57
-p5870
-sa(dp5871
-g5677
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5872
-sg5679
-Vpublic
-p5873
-sg5681
-VRegionOne
-p5874
-sg5683
-VRegionOne
-p5875
-sg5655
-Vbe2d979150a2401b9e7d5c365372d093
-p5876
-sa(dp5877
-g5677
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5878
-sg5679
-Vadmin
-p5879
-sg5681
-VRegionOne
-p5880
-sg5683
-VRegionOne
-p5881
-sg5655
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p5882
-sasg5698
-Vcompute_legacy
-p5883
-sg5655
-Va4dd95e3fde340468f8c1d7df9a853d0
-p5884
-sg5657
-Vcompute_legacy
-p5885
-sa(dp5886
-g5674
-(lp5887
-(dp5888
-g5677
-Vhttp://172.16.0.5:8774/v2.1
-p5889
-sg5679
-Vadmin
-p5890
-sg5681
-VRegionOne
-p5891
-sg5683
-VRegionOne
-p5892
-sg5655
-V0307d2c32dd54839aa5bc39746eeb186
-p5893
-sa(dp5894
-g5677
-Vhttp://172.18.0.8:8774/v2.1
-p5895
-sg5679
-Vpublic
-p5896
-sg5681
-VRegionOne
-p5897
-sg5683
-VRegionOne
-p5898
-sg5655
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p5899
-sa(dp5900
-g5677
-Vhttp://172.16.0.5:8774/v2.1
-p5901
-sg5679
-Vinternal
-p5902
-sg5681
-VRegionOne
-p5903
-sg5683
-VRegionOne
-p5904
-sg5655
-Vdb005ab592334fc599c142cf861e754f
-p5905
-sasg5698
-Vcompute
-p5906
-sg5655
-Vc165d40b8c3849bcb6067a3df2540c62
-p5907
-sg5657
-Vnova
-p5908
-sa(dp5909
-g5674
-(lp5910
-(dp5911
-g5677
-Vhttp://172.16.0.5:8080/swift/v1
-p5912
-sg5679
-Vadmin
-p5913
-sg5681
-VRegionOne
-p5914
-sg5683
-VRegionOne
-p5915
-sg5655
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p5916
-sa(dp5917
-g5677
-Vhttp://172.16.0.5:8080/swift/v1
-p5918
-sg5679
-Vinternal
-p5919
-sg5681
-VRegionOne
-p5920
-sg5683
-VRegionOne
-p5921
-sg5655
-V764118d3a33444ac980632d281acf4a7
-p5922
-sa(dp5923
-g5677
-Vhttp://172.18.0.8:8080/swift/v1
-p5924
-sg5679
-Vpublic
-p5925
-sg5681
-VRegionOne
-p5926
-sg5683
-VRegionOne
-p5927
-sg5655
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p5928
-sasg5698
-Vobject-store
-p5929
-sg5655
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p5930
-sg5657
-Vswift
-p5931
-sa(dp5932
-g5674
-(lp5933
-(dp5934
-g5677
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5935
-sg5679
-Vinternal
-p5936
-sg5681
-VRegionOne
-p5937
-sg5683
-VRegionOne
-p5938
-sg5655
-V61ea745c91ab4eb59464679931219024
-p5939
-sa(dp5940
-g5677
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5941
-sg5679
-Vadmin
-p5942
-sg5681
-VRegionOne
-p5943
-sg5683
-VRegionOne
-p5944
-sg5655
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p5945
-sa(dp5946
-g5677
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5947
-sg5679
-Vpublic
-p5948
-sg5681
-VRegionOne
-p5949
-sg5683
-VRegionOne
-p5950
-sg5655
-V7155772851884dc6954c7345d350796f
-p5951
-sasg5698
-Vvolumev2
-p5952
-sg5655
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p5953
-sg5657
-Vcinderv2
-p5954
-sa(dp5955
-g5674
-(lp5956
-(dp5957
-g5677
-Vhttp://172.18.0.8:9494
-p5958
-sg5679
-Vpublic
-p5959
-sg5681
-VRegionOne
-p5960
-sg5683
-VRegionOne
-p5961
-sg5655
-V43a202e889694d51a3b11899c252a8a9
-p5962
-sa(dp5963
-g5677
-Vhttp://172.16.0.5:9494
-p5964
-sg5679
-Vadmin
-p5965
-sg5681
-VRegionOne
-p5966
-sg5683
-VRegionOne
-p5967
-sg5655
-Vfa3c9de06e854542b236aa24b53e19a1
-p5968
-sa(dp5969
-g5677
-Vhttp://172.16.0.5:9494
-p5970
-sg5679
-Vinternal
-p5971
-sg5681
-VRegionOne
-p5972
-sg5683
-VRegionOne
-p5973
-sg5655
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p5974
-sasg5698
-Vartifact
-p5975
-sg5655
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p5976
-sg5657
-Vglare
-p5977
-sasVversion
-p5978
-Vv3
-p5979
-sVuser
-p5980
-(dp5981
-g5665
-(dp5982
-g5655
-Vdefault
-p5983
-sg5657
-VDefault
-p5984
-ssg5655
-Vef7a4f67379f41aba489a0b6d6a62094
-p5985
-sg5657
-Violie
-p5986
-ssVaudit_ids
-p5987
-(lp5988
-VyUU2bGSwSqygaTsqYoGKNw
-p5989
-asVissued_at
-p5990
-V2017-11-30T11:03:58.000000Z
-p5991
-sssV_context_user
-p5992
-NsVpublisher_id
-p5993
-Vorchestration.machine-A
-p5994
-sVmessage_id
-p5995
-Ve9d7f777-a521-498a-8577-7966fe86a846
-p5996
-sV_context_roles
-p5997
-(lp5998
-Vadmin
-p5999
-asV_context_auth_url
-p6000
-Vhttp://172.16.0.5:35357/v3/
-p6001
-sVtimestamp
-p6002
-V2017-11-30 11:03:59.491454
-p6003
-sV_unique_id
-p6004
-V3ce8a0d45153490e8201e09938ffd4d8
-p6005
-sV_context_tenant_id
-p6006
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6007
-sV_context_user_domain_id
-p6008
-Vdefault
-p6009
-sV_context_password
-p6010
-NsV_context_trustor_user_id
-p6011
-NsV_context_project_domain_id
-p6012
-Vdefault
-p6013
-sV_context_aws_creds
-p6014
-NsV_context_tenant
-p6015
-Vapexlake
-p6016
-sV_context_user_identity
-p6017
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p6018
-stp6019
-a(F7.7802741527557373
-Vport.update.end
-p6020
-(dp6021
-V_context_domain
-p6022
-NsV_context_request_id
-p6023
-Vreq-2d3a006b-5c50-4522-a72c-af16b7487243
-p6024
-sVevent_type
-p6025
-g6020
-sV_context_auth_token
-p6026
-VgAAAAABaH-Wfd7TZIXXJPMH1HHQqx_qC4NgmENjE_fNChBj5NiFMELs3mInsxfUoG_cVYW4qXmmabXCKFdoJSW0uHGL532NvqPHQiqYBhDuibo1dXODyjZ4xtP39nRzCCS6V0ksS0ABfS2oBUBIqhss0-BVOM-mmH1Q_w4cFCVbQbNUOfBvvB8s
-p6027
-sV_context_resource_uuid
-p6028
-NsV_context_tenant_name
-p6029
-Vservices
-p6030
-sV_context_user_id
-p6031
-V84faafdbb77b40c9a73047fdebb0ab45
-p6032
-sVpayload
-p6033
-(dp6034
-Vport
-p6035
-(dp6036
-Vallowed_address_pairs
-p6037
-(lp6038
-sVextra_dhcp_opts
-p6039
-(lp6040
-sVupdated_at
-p6041
-V2017-11-30T11:03:59
-p6042
-sVdevice_owner
-p6043
-Vcompute:nova
-p6044
-sVport_security_enabled
-p6045
-I01
-sVbinding:profile
-p6046
-(dp6047
-sVfixed_ips
-p6048
-(lp6049
-(dp6050
-Vsubnet_id
-p6051
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p6052
-sVip_address
-p6053
-V172.16.9.144
-p6054
-sasVid
-p6055
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p6056
-sVsecurity_groups
-p6057
-(lp6058
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p6059
-asVbinding:vif_details
-p6060
-(dp6061
-Vport_filter
-p6062
-I01
-sVovs_hybrid_plug
-p6063
-I01
-ssVbinding:vif_type
-p6064
-Vovs
-p6065
-sVmac_address
-p6066
-Vfa:16:3e:e7:da:1b
-p6067
-sVstatus
-p6068
-VDOWN
-p6069
-sVbinding:host_id
-p6070
-Vmachine-C
-p6071
-sVdescription
-p6072
-V
-sVdevice_id
-p6073
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p6074
-sVname
-p6075
-VB-server_port-hw2ilvbsf7dq
-p6076
-sVadmin_state_up
-p6077
-I01
-sVnetwork_id
-p6078
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p6079
-sVdns_name
-p6080
-V
-sVcreated_at
-p6081
-V2017-11-30T11:03:57
-p6082
-sVbinding:vnic_type
-p6083
-Vnormal
-p6084
-sVtenant_id
-p6085
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6086
-sssV_context_show_deleted
-p6087
-I00
-sVpriority
-p6088
-VINFO
-p6089
-sV_context_is_admin
-p6090
-I01
-sV_context_project_domain
-p6091
-NsV_context_user
-p6092
-V84faafdbb77b40c9a73047fdebb0ab45
-p6093
-sVpublisher_id
-p6094
-Vnetwork.machine-A
-p6095
-sVmessage_id
-p6096
-Vee4265b0-bb05-401c-9117-443be8c66730
-p6097
-sV_context_roles
-p6098
-(lp6099
-Vadmin
-p6100
-asVtimestamp
-p6101
-V2017-11-30 11:03:59.611137
-p6102
-sV_context_timestamp
-p6103
-V2017-11-30 11:03:59.390543
-p6104
-sV_unique_id
-p6105
-V161a88029da24653b196347cdd8a370d
-p6106
-sV_context_tenant_id
-p6107
-V66fbf30f2dce4cef95d5248254dac9a5
-p6108
-sV_context_project_name
-p6109
-Vservices
-p6110
-sV_context_user_identity
-p6111
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p6112
-sV_context_tenant
-p6113
-V66fbf30f2dce4cef95d5248254dac9a5
-p6114
-sV_context_project_id
-p6115
-V66fbf30f2dce4cef95d5248254dac9a5
-p6116
-sV_context_read_only
-p6117
-I00
-sV_context_user_domain
-p6118
-NsV_context_user_name
-p6119
-Vneutron
-p6120
-stp6121
-a(F8.7070281505584717
-Vsecurity_group.create.start
-p6122
-(dp6123
-V_context_domain
-p6124
-NsV_context_request_id
-p6125
-Vreq-5a466373-5bc5-4983-854b-da3e8942cd5b
-p6126
-sVevent_type
-p6127
-g6122
-sV_context_auth_token
-p6128
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6129
-sV_context_resource_uuid
-p6130
-NsV_context_tenant_name
-p6131
-Vapexlake
-p6132
-sV_context_user_id
-p6133
-Vef7a4f67379f41aba489a0b6d6a62094
-p6134
-sVpayload
-p6135
-(dp6136
-Vsecurity_group
-p6137
-(dp6138
-Vname
-p6139
-VKevin's SG
-p6140
-sVdescription
-p6141
-VSecurity group for Kevin
-p6142
-sssV_context_show_deleted
-p6143
-I00
-sVpriority
-p6144
-VINFO
-p6145
-sV_context_is_admin
-p6146
-I01
-sV_context_project_domain
-p6147
-NsV_context_user
-p6148
-Vef7a4f67379f41aba489a0b6d6a62094
-p6149
-sVpublisher_id
-p6150
-Vnetwork.machine-A
-p6151
-sVmessage_id
-p6152
-Ve14d162c-72ca-41e0-80dc-77fab9399157
-p6153
-sV_context_roles
-p6154
-(lp6155
-Vadmin
-p6156
-asVtimestamp
-p6157
-V2017-11-30 11:03:59.525323
-p6158
-sV_context_timestamp
-p6159
-V2017-11-30 11:03:59.523280
-p6160
-sV_unique_id
-p6161
-Vd94febc7dd3e41f8866f24a39420f2a4
-p6162
-sV_context_tenant_id
-p6163
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6164
-sV_context_project_name
-p6165
-Vapexlake
-p6166
-sV_context_user_identity
-p6167
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6168
-sV_context_tenant
-p6169
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6170
-sV_context_project_id
-p6171
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6172
-sV_context_read_only
-p6173
-I00
-sV_context_user_domain
-p6174
-NsV_context_user_name
-p6175
-Violie
-p6176
-stp6177
-a(F8.7579140663146973
-Vsecurity_group.create.end
-p6178
-(dp6179
-V_context_domain
-p6180
-NsV_context_request_id
-p6181
-Vreq-5a466373-5bc5-4983-854b-da3e8942cd5b
-p6182
-sVevent_type
-p6183
-g6178
-sV_context_auth_token
-p6184
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6185
-sV_context_resource_uuid
-p6186
-NsV_context_tenant_name
-p6187
-Vapexlake
-p6188
-sV_context_user_id
-p6189
-Vef7a4f67379f41aba489a0b6d6a62094
-p6190
-sVpayload
-p6191
-(dp6192
-Vsecurity_group
-p6193
-(dp6194
-Vtenant_id
-p6195
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6196
-sVname
-p6197
-VKevin's SG
-p6198
-sVdescription
-p6199
-VSecurity group for Kevin
-p6200
-sVsecurity_group_rules
-p6201
-(lp6202
-(dp6203
-Vremote_group_id
-p6204
-NsVdirection
-p6205
-Vegress
-p6206
-sVprotocol
-p6207
-Nsg6199
-V
-sVethertype
-p6208
-VIPv4
-p6209
-sVremote_ip_prefix
-p6210
-NsVport_range_max
-p6211
-NsVsecurity_group_id
-p6212
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6213
-sVport_range_min
-p6214
-Nsg6195
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6215
-sVid
-p6216
-Ve0d0a918-7972-4cbf-b867-d6f8827a7c00
-p6217
-sa(dp6218
-g6204
-Nsg6205
-Vegress
-p6219
-sg6207
-Nsg6199
-V
-sg6208
-VIPv6
-p6220
-sg6210
-Nsg6211
-Nsg6212
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6221
-sg6214
-Nsg6195
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6222
-sg6216
-V269bdd0e-2a04-4385-b4e0-b3f38abfb4cd
-p6223
-sasg6216
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6224
-sssV_context_show_deleted
-p6225
-I00
-sVpriority
-p6226
-VINFO
-p6227
-sV_context_is_admin
-p6228
-I01
-sV_context_project_domain
-p6229
-NsV_context_user
-p6230
-Vef7a4f67379f41aba489a0b6d6a62094
-p6231
-sVpublisher_id
-p6232
-Vnetwork.machine-A
-p6233
-sVmessage_id
-p6234
-Vb407f6f8-ad80-4d54-a7fa-9dca657a94ef
-p6235
-sV_context_roles
-p6236
-(lp6237
-Vadmin
-p6238
-asVtimestamp
-p6239
-V2017-11-30 11:04:00.588279
-p6240
-sV_context_timestamp
-p6241
-V2017-11-30 11:03:59.523280
-p6242
-sV_unique_id
-p6243
-Ve42b5d4e223d493687858fe1e63c9c8b
-p6244
-sV_context_tenant_id
-p6245
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6246
-sV_context_project_name
-p6247
-Vapexlake
-p6248
-sV_context_user_identity
-p6249
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6250
-sV_context_tenant
-p6251
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6252
-sV_context_project_id
-p6253
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6254
-sV_context_read_only
-p6255
-I00
-sV_context_user_domain
-p6256
-NsV_context_user_name
-p6257
-Violie
-p6258
-stp6259
-a(F8.7752859592437744
-Vsecurity_group_rule.create.start
-p6260
-(dp6261
-V_context_domain
-p6262
-NsV_context_request_id
-p6263
-Vreq-7d5e201b-d048-4728-a1e2-9f11c60962f5
-p6264
-sVevent_type
-p6265
-g6260
-sV_context_auth_token
-p6266
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6267
-sV_context_resource_uuid
-p6268
-NsV_context_tenant_name
-p6269
-Vapexlake
-p6270
-sV_context_user_id
-p6271
-Vef7a4f67379f41aba489a0b6d6a62094
-p6272
-sVpayload
-p6273
-(dp6274
-Vsecurity_group_rule
-p6275
-(dp6276
-Vremote_group_id
-p6277
-NsVdirection
-p6278
-Vingress
-p6279
-sVprotocol
-p6280
-Vtcp
-p6281
-sVremote_ip_prefix
-p6282
-V0.0.0.0/0
-p6283
-sVport_range_max
-p6284
-V22
-p6285
-sVsecurity_group_id
-p6286
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6287
-sVport_range_min
-p6288
-V22
-p6289
-sVethertype
-p6290
-VIPv4
-p6291
-sssV_context_show_deleted
-p6292
-I00
-sVpriority
-p6293
-VINFO
-p6294
-sV_context_is_admin
-p6295
-I01
-sV_context_project_domain
-p6296
-NsV_context_user
-p6297
-Vef7a4f67379f41aba489a0b6d6a62094
-p6298
-sVpublisher_id
-p6299
-Vnetwork.machine-A
-p6300
-sVmessage_id
-p6301
-V7d86f3b4-62f2-4404-9ba4-8d38351c58ef
-p6302
-sV_context_roles
-p6303
-(lp6304
-Vadmin
-p6305
-asVtimestamp
-p6306
-V2017-11-30 11:04:00.605846
-p6307
-sV_context_timestamp
-p6308
-V2017-11-30 11:04:00.604361
-p6309
-sV_unique_id
-p6310
-Vf1d8746b0b9e4c30986495d12fc93b8d
-p6311
-sV_context_tenant_id
-p6312
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6313
-sV_context_project_name
-p6314
-Vapexlake
-p6315
-sV_context_user_identity
-p6316
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6317
-sV_context_tenant
-p6318
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6319
-sV_context_project_id
-p6320
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6321
-sV_context_read_only
-p6322
-I00
-sV_context_user_domain
-p6323
-NsV_context_user_name
-p6324
-Violie
-p6325
-stp6326
-a(F8.8257091045379639
-Vsecurity_group_rule.create.end
-p6327
-(dp6328
-V_context_domain
-p6329
-NsV_context_request_id
-p6330
-Vreq-7d5e201b-d048-4728-a1e2-9f11c60962f5
-p6331
-sVevent_type
-p6332
-g6327
-sV_context_auth_token
-p6333
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6334
-sV_context_resource_uuid
-p6335
-NsV_context_tenant_name
-p6336
-Vapexlake
-p6337
-sV_context_user_id
-p6338
-Vef7a4f67379f41aba489a0b6d6a62094
-p6339
-sVpayload
-p6340
-(dp6341
-Vsecurity_group_rule
-p6342
-(dp6343
-Vremote_group_id
-p6344
-NsVdirection
-p6345
-Vingress
-p6346
-sVprotocol
-p6347
-Vtcp
-p6348
-sVdescription
-p6349
-V
-sVethertype
-p6350
-VIPv4
-p6351
-sVremote_ip_prefix
-p6352
-V0.0.0.0/0
-p6353
-sVport_range_max
-p6354
-I22
-sVsecurity_group_id
-p6355
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6356
-sVport_range_min
-p6357
-I22
-sVtenant_id
-p6358
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6359
-sVid
-p6360
-V68a44727-524f-4360-a73a-ee8df2143c81
-p6361
-sssV_context_show_deleted
-p6362
-I00
-sVpriority
-p6363
-VINFO
-p6364
-sV_context_is_admin
-p6365
-I01
-sV_context_project_domain
-p6366
-NsV_context_user
-p6367
-Vef7a4f67379f41aba489a0b6d6a62094
-p6368
-sVpublisher_id
-p6369
-Vnetwork.machine-A
-p6370
-sVmessage_id
-p6371
-V580133a6-87c4-4723-8a0b-d108311d63c9
-p6372
-sV_context_roles
-p6373
-(lp6374
-Vadmin
-p6375
-asVtimestamp
-p6376
-V2017-11-30 11:04:00.655905
-p6377
-sV_context_timestamp
-p6378
-V2017-11-30 11:04:00.604361
-p6379
-sV_unique_id
-p6380
-V0264c4bfd7ad47919379638d724cb38d
-p6381
-sV_context_tenant_id
-p6382
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6383
-sV_context_project_name
-p6384
-Vapexlake
-p6385
-sV_context_user_identity
-p6386
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6387
-sV_context_tenant
-p6388
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6389
-sV_context_project_id
-p6390
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6391
-sV_context_read_only
-p6392
-I00
-sV_context_user_domain
-p6393
-NsV_context_user_name
-p6394
-Violie
-p6395
-stp6396
-a(F8.8340671062469482
-Vsecurity_group_rule.create.start
-p6397
-(dp6398
-V_context_domain
-p6399
-NsV_context_request_id
-p6400
-Vreq-7e9c3a12-3e13-4f0b-85fd-6742020bb6f6
-p6401
-sVevent_type
-p6402
-g6397
-sV_context_auth_token
-p6403
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6404
-sV_context_resource_uuid
-p6405
-NsV_context_tenant_name
-p6406
-Vapexlake
-p6407
-sV_context_user_id
-p6408
-Vef7a4f67379f41aba489a0b6d6a62094
-p6409
-sVpayload
-p6410
-(dp6411
-Vsecurity_group_rule
-p6412
-(dp6413
-Vremote_group_id
-p6414
-NsVdirection
-p6415
-Vingress
-p6416
-sVprotocol
-p6417
-Vtcp
-p6418
-sVremote_ip_prefix
-p6419
-V0.0.0.0/0
-p6420
-sVport_range_max
-p6421
-V65000
-p6422
-sVsecurity_group_id
-p6423
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6424
-sVport_range_min
-p6425
-V1
-sVethertype
-p6426
-VIPv4
-p6427
-sssV_context_show_deleted
-p6428
-I00
-sVpriority
-p6429
-VINFO
-p6430
-sV_context_is_admin
-p6431
-I01
-sV_context_project_domain
-p6432
-NsV_context_user
-p6433
-Vef7a4f67379f41aba489a0b6d6a62094
-p6434
-sVpublisher_id
-p6435
-Vnetwork.machine-A
-p6436
-sVmessage_id
-p6437
-Vf684c602-bc36-46a2-a79a-96d961cdbad6
-p6438
-sV_context_roles
-p6439
-(lp6440
-Vadmin
-p6441
-asVtimestamp
-p6442
-V2017-11-30 11:04:00.665497
-p6443
-sV_context_timestamp
-p6444
-V2017-11-30 11:04:00.664429
-p6445
-sV_unique_id
-p6446
-V7fe17bf18e664e2288e896f858a87e8e
-p6447
-sV_context_tenant_id
-p6448
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6449
-sV_context_project_name
-p6450
-Vapexlake
-p6451
-sV_context_user_identity
-p6452
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6453
-sV_context_tenant
-p6454
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6455
-sV_context_project_id
-p6456
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6457
-sV_context_read_only
-p6458
-I00
-sV_context_user_domain
-p6459
-NsV_context_user_name
-p6460
-Violie
-p6461
-stp6462
-a(F8.8832411766052246
-Vsecurity_group_rule.create.end
-p6463
-(dp6464
-V_context_domain
-p6465
-NsV_context_request_id
-p6466
-Vreq-7e9c3a12-3e13-4f0b-85fd-6742020bb6f6
-p6467
-sVevent_type
-p6468
-g6463
-sV_context_auth_token
-p6469
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6470
-sV_context_resource_uuid
-p6471
-NsV_context_tenant_name
-p6472
-Vapexlake
-p6473
-sV_context_user_id
-p6474
-Vef7a4f67379f41aba489a0b6d6a62094
-p6475
-sVpayload
-p6476
-(dp6477
-Vsecurity_group_rule
-p6478
-(dp6479
-Vremote_group_id
-p6480
-NsVdirection
-p6481
-Vingress
-p6482
-sVprotocol
-p6483
-Vtcp
-p6484
-sVdescription
-p6485
-V
-sVethertype
-p6486
-VIPv4
-p6487
-sVremote_ip_prefix
-p6488
-V0.0.0.0/0
-p6489
-sVport_range_max
-p6490
-I65000
-sVsecurity_group_id
-p6491
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6492
-sVport_range_min
-p6493
-I1
-sVtenant_id
-p6494
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6495
-sVid
-p6496
-Vc86683d2-513c-4f7f-80ce-c67ce57efb59
-p6497
-sssV_context_show_deleted
-p6498
-I00
-sVpriority
-p6499
-VINFO
-p6500
-sV_context_is_admin
-p6501
-I01
-sV_context_project_domain
-p6502
-NsV_context_user
-p6503
-Vef7a4f67379f41aba489a0b6d6a62094
-p6504
-sVpublisher_id
-p6505
-Vnetwork.machine-A
-p6506
-sVmessage_id
-p6507
-V1705cd96-8bea-4163-a740-a80d65dce697
-p6508
-sV_context_roles
-p6509
-(lp6510
-Vadmin
-p6511
-asVtimestamp
-p6512
-V2017-11-30 11:04:00.713940
-p6513
-sV_context_timestamp
-p6514
-V2017-11-30 11:04:00.664429
-p6515
-sV_unique_id
-p6516
-Veca584a051fa4358a1db00d9b5ad6dfe
-p6517
-sV_context_tenant_id
-p6518
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6519
-sV_context_project_name
-p6520
-Vapexlake
-p6521
-sV_context_user_identity
-p6522
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6523
-sV_context_tenant
-p6524
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6525
-sV_context_project_id
-p6526
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6527
-sV_context_read_only
-p6528
-I00
-sV_context_user_domain
-p6529
-NsV_context_user_name
-p6530
-Violie
-p6531
-stp6532
-a(F8.8925120830535889
-Vsecurity_group_rule.create.start
-p6533
-(dp6534
-V_context_domain
-p6535
-NsV_context_request_id
-p6536
-Vreq-5beb4617-af57-43d4-8b5d-f4eae27a5335
-p6537
-sVevent_type
-p6538
-g6533
-sV_context_auth_token
-p6539
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6540
-sV_context_resource_uuid
-p6541
-NsV_context_tenant_name
-p6542
-Vapexlake
-p6543
-sV_context_user_id
-p6544
-Vef7a4f67379f41aba489a0b6d6a62094
-p6545
-sVpayload
-p6546
-(dp6547
-Vsecurity_group_rule
-p6548
-(dp6549
-Vremote_group_id
-p6550
-NsVdirection
-p6551
-Vingress
-p6552
-sVprotocol
-p6553
-Vtcp
-p6554
-sVremote_ip_prefix
-p6555
-V0.0.0.0/0
-p6556
-sVport_range_max
-p6557
-V7474
-p6558
-sVsecurity_group_id
-p6559
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6560
-sVport_range_min
-p6561
-V7474
-p6562
-sVethertype
-p6563
-VIPv4
-p6564
-sssV_context_show_deleted
-p6565
-I00
-sVpriority
-p6566
-VINFO
-p6567
-sV_context_is_admin
-p6568
-I01
-sV_context_project_domain
-p6569
-NsV_context_user
-p6570
-Vef7a4f67379f41aba489a0b6d6a62094
-p6571
-sVpublisher_id
-p6572
-Vnetwork.machine-A
-p6573
-sVmessage_id
-p6574
-V01ec72d0-bdb5-4989-b465-8107997e34f5
-p6575
-sV_context_roles
-p6576
-(lp6577
-Vadmin
-p6578
-asVtimestamp
-p6579
-V2017-11-30 11:04:00.723641
-p6580
-sV_context_timestamp
-p6581
-V2017-11-30 11:04:00.722567
-p6582
-sV_unique_id
-p6583
-V4b13b30143bb40ae91bd0198bbaa7d3b
-p6584
-sV_context_tenant_id
-p6585
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6586
-sV_context_project_name
-p6587
-Vapexlake
-p6588
-sV_context_user_identity
-p6589
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6590
-sV_context_tenant
-p6591
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6592
-sV_context_project_id
-p6593
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6594
-sV_context_read_only
-p6595
-I00
-sV_context_user_domain
-p6596
-NsV_context_user_name
-p6597
-Violie
-p6598
-stp6599
-a(F8.939669132232666
-Vsecurity_group_rule.create.end
-p6600
-(dp6601
-V_context_domain
-p6602
-NsV_context_request_id
-p6603
-Vreq-5beb4617-af57-43d4-8b5d-f4eae27a5335
-p6604
-sVevent_type
-p6605
-g6600
-sV_context_auth_token
-p6606
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6607
-sV_context_resource_uuid
-p6608
-NsV_context_tenant_name
-p6609
-Vapexlake
-p6610
-sV_context_user_id
-p6611
-Vef7a4f67379f41aba489a0b6d6a62094
-p6612
-sVpayload
-p6613
-(dp6614
-Vsecurity_group_rule
-p6615
-(dp6616
-Vremote_group_id
-p6617
-NsVdirection
-p6618
-Vingress
-p6619
-sVprotocol
-p6620
-Vtcp
-p6621
-sVdescription
-p6622
-V
-sVethertype
-p6623
-VIPv4
-p6624
-sVremote_ip_prefix
-p6625
-V0.0.0.0/0
-p6626
-sVport_range_max
-p6627
-I7474
-sVsecurity_group_id
-p6628
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6629
-sVport_range_min
-p6630
-I7474
-sVtenant_id
-p6631
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6632
-sVid
-p6633
-V4e6614c3-e0a5-45e7-bcd6-907e617b570d
-p6634
-sssV_context_show_deleted
-p6635
-I00
-sVpriority
-p6636
-VINFO
-p6637
-sV_context_is_admin
-p6638
-I01
-sV_context_project_domain
-p6639
-NsV_context_user
-p6640
-Vef7a4f67379f41aba489a0b6d6a62094
-p6641
-sVpublisher_id
-p6642
-Vnetwork.machine-A
-p6643
-sVmessage_id
-p6644
-V6bfb02cc-3a9e-4294-ab3b-11670503cb2e
-p6645
-sV_context_roles
-p6646
-(lp6647
-Vadmin
-p6648
-asVtimestamp
-p6649
-V2017-11-30 11:04:00.770374
-p6650
-sV_context_timestamp
-p6651
-V2017-11-30 11:04:00.722567
-p6652
-sV_unique_id
-p6653
-V55273fd10d61425290d91add46b7cd92
-p6654
-sV_context_tenant_id
-p6655
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6656
-sV_context_project_name
-p6657
-Vapexlake
-p6658
-sV_context_user_identity
-p6659
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6660
-sV_context_tenant
-p6661
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6662
-sV_context_project_id
-p6663
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6664
-sV_context_read_only
-p6665
-I00
-sV_context_user_domain
-p6666
-NsV_context_user_name
-p6667
-Violie
-p6668
-stp6669
-a(F9.9651691913604736
-Vsecurity_group_rule.create.start
-p6670
-(dp6671
-V_context_domain
-p6672
-NsV_context_request_id
-p6673
-Vreq-fb1ae63d-9297-4f0d-8def-16e024e24c63
-p6674
-sVevent_type
-p6675
-g6670
-sV_context_auth_token
-p6676
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6677
-sV_context_resource_uuid
-p6678
-NsV_context_tenant_name
-p6679
-Vapexlake
-p6680
-sV_context_user_id
-p6681
-Vef7a4f67379f41aba489a0b6d6a62094
-p6682
-sVpayload
-p6683
-(dp6684
-Vsecurity_group_rule
-p6685
-(dp6686
-Vremote_group_id
-p6687
-NsVdirection
-p6688
-Vingress
-p6689
-sVprotocol
-p6690
-Vicmp
-p6691
-sVremote_ip_prefix
-p6692
-V0.0.0.0/0
-p6693
-sVport_range_max
-p6694
-NsVsecurity_group_id
-p6695
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6696
-sVport_range_min
-p6697
-NsVethertype
-p6698
-VIPv4
-p6699
-sssV_context_show_deleted
-p6700
-I00
-sVpriority
-p6701
-VINFO
-p6702
-sV_context_is_admin
-p6703
-I01
-sV_context_project_domain
-p6704
-NsV_context_user
-p6705
-Vef7a4f67379f41aba489a0b6d6a62094
-p6706
-sVpublisher_id
-p6707
-Vnetwork.machine-A
-p6708
-sVmessage_id
-p6709
-Vfd60ad43-fc72-4865-b38c-d18e207a1ea0
-p6710
-sV_context_roles
-p6711
-(lp6712
-Vadmin
-p6713
-asVtimestamp
-p6714
-V2017-11-30 11:04:00.782532
-p6715
-sV_context_timestamp
-p6716
-V2017-11-30 11:04:00.781160
-p6717
-sV_unique_id
-p6718
-V5892b1c76cea49ef9603a4dd820a0190
-p6719
-sV_context_tenant_id
-p6720
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6721
-sV_context_project_name
-p6722
-Vapexlake
-p6723
-sV_context_user_identity
-p6724
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6725
-sV_context_tenant
-p6726
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6727
-sV_context_project_id
-p6728
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6729
-sV_context_read_only
-p6730
-I00
-sV_context_user_domain
-p6731
-NsV_context_user_name
-p6732
-Violie
-p6733
-stp6734
-a(F11.044182062149048
-Vsecurity_group_rule.create.end
-p6735
-(dp6736
-V_context_domain
-p6737
-NsV_context_request_id
-p6738
-Vreq-fb1ae63d-9297-4f0d-8def-16e024e24c63
-p6739
-sVevent_type
-p6740
-g6735
-sV_context_auth_token
-p6741
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6742
-sV_context_resource_uuid
-p6743
-NsV_context_tenant_name
-p6744
-Vapexlake
-p6745
-sV_context_user_id
-p6746
-Vef7a4f67379f41aba489a0b6d6a62094
-p6747
-sVpayload
-p6748
-(dp6749
-Vsecurity_group_rule
-p6750
-(dp6751
-Vremote_group_id
-p6752
-NsVdirection
-p6753
-Vingress
-p6754
-sVprotocol
-p6755
-Vicmp
-p6756
-sVdescription
-p6757
-V
-sVethertype
-p6758
-VIPv4
-p6759
-sVremote_ip_prefix
-p6760
-V0.0.0.0/0
-p6761
-sVport_range_max
-p6762
-NsVsecurity_group_id
-p6763
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6764
-sVport_range_min
-p6765
-NsVtenant_id
-p6766
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6767
-sVid
-p6768
-V85e1fb2f-f1d5-4a12-b050-07a157ab4fb7
-p6769
-sssV_context_show_deleted
-p6770
-I00
-sVpriority
-p6771
-VINFO
-p6772
-sV_context_is_admin
-p6773
-I01
-sV_context_project_domain
-p6774
-NsV_context_user
-p6775
-Vef7a4f67379f41aba489a0b6d6a62094
-p6776
-sVpublisher_id
-p6777
-Vnetwork.machine-A
-p6778
-sVmessage_id
-p6779
-Vd75125c5-c4f8-4c28-92e5-527c0a8b0da3
-p6780
-sV_context_roles
-p6781
-(lp6782
-Vadmin
-p6783
-asVtimestamp
-p6784
-V2017-11-30 11:04:02.874515
-p6785
-sV_context_timestamp
-p6786
-V2017-11-30 11:04:00.781160
-p6787
-sV_unique_id
-p6788
-Vee77753d4c91459887d2fa05b1c1ead3
-p6789
-sV_context_tenant_id
-p6790
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6791
-sV_context_project_name
-p6792
-Vapexlake
-p6793
-sV_context_user_identity
-p6794
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6795
-sV_context_tenant
-p6796
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6797
-sV_context_project_id
-p6798
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6799
-sV_context_read_only
-p6800
-I00
-sV_context_user_domain
-p6801
-NsV_context_user_name
-p6802
-Violie
-p6803
-stp6804
-a(F11.077391147613525
-Vport.create.start
-p6805
-(dp6806
-V_context_domain
-p6807
-NsV_context_request_id
-p6808
-Vreq-c850a087-b99f-4055-bc67-490b48aef365
-p6809
-sVevent_type
-p6810
-g6805
-sV_context_auth_token
-p6811
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6812
-sV_context_resource_uuid
-p6813
-NsV_context_tenant_name
-p6814
-Vapexlake
-p6815
-sV_context_user_id
-p6816
-Vef7a4f67379f41aba489a0b6d6a62094
-p6817
-sVpayload
-p6818
-(dp6819
-Vport
-p6820
-(dp6821
-Vnetwork_id
-p6822
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p6823
-sVfixed_ips
-p6824
-(lp6825
-(dp6826
-Vsubnet_id
-p6827
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p6828
-sasVname
-p6829
-VC-server_port-wh5difunbszp
-p6830
-sVsecurity_groups
-p6831
-(lp6832
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6833
-asVadmin_state_up
-p6834
-I01
-sssV_context_show_deleted
-p6835
-I00
-sVpriority
-p6836
-VINFO
-p6837
-sV_context_is_admin
-p6838
-I01
-sV_context_project_domain
-p6839
-NsV_context_user
-p6840
-Vef7a4f67379f41aba489a0b6d6a62094
-p6841
-sVpublisher_id
-p6842
-Vnetwork.machine-A
-p6843
-sVmessage_id
-p6844
-V7b89e972-2fc0-4e6f-9f23-6637bfc1b099
-p6845
-sV_context_roles
-p6846
-(lp6847
-Vadmin
-p6848
-asVtimestamp
-p6849
-V2017-11-30 11:04:02.908043
-p6850
-sV_context_timestamp
-p6851
-V2017-11-30 11:04:02.907123
-p6852
-sV_unique_id
-p6853
-V7cc950f594b3460ba6faa608e87a7815
-p6854
-sV_context_tenant_id
-p6855
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6856
-sV_context_project_name
-p6857
-Vapexlake
-p6858
-sV_context_user_identity
-p6859
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6860
-sV_context_tenant
-p6861
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6862
-sV_context_project_id
-p6863
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6864
-sV_context_read_only
-p6865
-I00
-sV_context_user_domain
-p6866
-NsV_context_user_name
-p6867
-Violie
-p6868
-stp6869
-a(F11.368050098419189
-Vport.create.end
-p6870
-(dp6871
-V_context_domain
-p6872
-NsV_context_request_id
-p6873
-Vreq-c850a087-b99f-4055-bc67-490b48aef365
-p6874
-sVevent_type
-p6875
-g6870
-sV_context_auth_token
-p6876
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6877
-sV_context_resource_uuid
-p6878
-NsV_context_tenant_name
-p6879
-Vapexlake
-p6880
-sV_context_user_id
-p6881
-Vef7a4f67379f41aba489a0b6d6a62094
-p6882
-sVpayload
-p6883
-(dp6884
-Vport
-p6885
-(dp6886
-Vallowed_address_pairs
-p6887
-(lp6888
-sVextra_dhcp_opts
-p6889
-(lp6890
-sVupdated_at
-p6891
-V2017-11-30T11:04:02
-p6892
-sVdevice_owner
-p6893
-V
-sVbinding:profile
-p6894
-(dp6895
-sVport_security_enabled
-p6896
-I01
-sVfixed_ips
-p6897
-(lp6898
-(dp6899
-Vsubnet_id
-p6900
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p6901
-sVip_address
-p6902
-V172.16.9.145
-p6903
-sasVid
-p6904
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p6905
-sVsecurity_groups
-p6906
-(lp6907
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p6908
-asVbinding:vif_details
-p6909
-(dp6910
-sVbinding:vif_type
-p6911
-Vunbound
-p6912
-sVmac_address
-p6913
-Vfa:16:3e:c1:a1:3f
-p6914
-sVstatus
-p6915
-VDOWN
-p6916
-sVbinding:host_id
-p6917
-V
-sVdescription
-p6918
-V
-sVdns_assignment
-p6919
-(lp6920
-(dp6921
-Vhostname
-p6922
-Vhost-172-16-9-145
-p6923
-sg6902
-V172.16.9.145
-p6924
-sVfqdn
-p6925
-Vhost-172-16-9-145.openstacklocal.
-p6926
-sasVdevice_id
-p6927
-V
-sVname
-p6928
-VC-server_port-wh5difunbszp
-p6929
-sVadmin_state_up
-p6930
-I01
-sVnetwork_id
-p6931
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p6932
-sVdns_name
-p6933
-V
-sVcreated_at
-p6934
-V2017-11-30T11:04:02
-p6935
-sVbinding:vnic_type
-p6936
-Vnormal
-p6937
-sVtenant_id
-p6938
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6939
-sssV_context_show_deleted
-p6940
-I00
-sVpriority
-p6941
-VINFO
-p6942
-sV_context_is_admin
-p6943
-I01
-sV_context_project_domain
-p6944
-NsV_context_user
-p6945
-Vef7a4f67379f41aba489a0b6d6a62094
-p6946
-sVpublisher_id
-p6947
-Vnetwork.machine-A
-p6948
-sVmessage_id
-p6949
-V2fa7eeb2-7c9e-4554-9bb7-c8b098e02581
-p6950
-sV_context_roles
-p6951
-(lp6952
-Vadmin
-p6953
-asVtimestamp
-p6954
-V2017-11-30 11:04:03.197884
-p6955
-sV_context_timestamp
-p6956
-V2017-11-30 11:04:02.907123
-p6957
-sV_unique_id
-p6958
-Ve23dc2debfb04193b83006798048e9f9
-p6959
-sV_context_tenant_id
-p6960
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6961
-sV_context_project_name
-p6962
-Vapexlake
-p6963
-sV_context_user_identity
-p6964
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6965
-sV_context_tenant
-p6966
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6967
-sV_context_project_id
-p6968
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6969
-sV_context_read_only
-p6970
-I00
-sV_context_user_domain
-p6971
-NsV_context_user_name
-p6972
-Violie
-p6973
-stp6974
-a(F12.574000120162964
-Vfloatingip.create.start
-p6975
-(dp6976
-V_context_domain
-p6977
-NsV_context_request_id
-p6978
-Vreq-7a730520-b743-405a-86c8-2fd2e710dc9b
-p6979
-sVevent_type
-p6980
-g6975
-sV_context_auth_token
-p6981
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p6982
-sV_context_resource_uuid
-p6983
-NsV_context_tenant_name
-p6984
-Vapexlake
-p6985
-sV_context_user_id
-p6986
-Vef7a4f67379f41aba489a0b6d6a62094
-p6987
-sVpayload
-p6988
-(dp6989
-Vfloatingip
-p6990
-(dp6991
-Vfloating_network_id
-p6992
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p6993
-sVport_id
-p6994
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p6995
-sssV_context_show_deleted
-p6996
-I00
-sVpriority
-p6997
-VINFO
-p6998
-sV_context_is_admin
-p6999
-I01
-sV_context_project_domain
-p7000
-NsV_context_user
-p7001
-Vef7a4f67379f41aba489a0b6d6a62094
-p7002
-sVpublisher_id
-p7003
-Vnetwork.machine-A
-p7004
-sVmessage_id
-p7005
-Vd86326cb-2b3f-41db-a6db-9e1137239238
-p7006
-sV_context_roles
-p7007
-(lp7008
-Vadmin
-p7009
-asVtimestamp
-p7010
-V2017-11-30 11:04:04.402384
-p7011
-sV_context_timestamp
-p7012
-V2017-11-30 11:04:04.400742
-p7013
-sV_unique_id
-p7014
-V35c1f700632341f5ac32e37d7c9d265f
-p7015
-sV_context_tenant_id
-p7016
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7017
-sV_context_project_name
-p7018
-Vapexlake
-p7019
-sV_context_user_identity
-p7020
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7021
-sV_context_tenant
-p7022
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7023
-sV_context_project_id
-p7024
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7025
-sV_context_read_only
-p7026
-I00
-sV_context_user_domain
-p7027
-NsV_context_user_name
-p7028
-Violie
-p7029
-stp7030
-a(F13.120702028274536
-Vfloatingip.create.end
-p7031
-(dp7032
-V_context_domain
-p7033
-NsV_context_request_id
-p7034
-Vreq-7a730520-b743-405a-86c8-2fd2e710dc9b
-p7035
-sVevent_type
-p7036
-g7031
-sV_context_auth_token
-p7037
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7038
-sV_context_resource_uuid
-p7039
-NsV_context_tenant_name
-p7040
-Vapexlake
-p7041
-sV_context_user_id
-p7042
-Vef7a4f67379f41aba489a0b6d6a62094
-p7043
-sVpayload
-p7044
-(dp7045
-Vfloatingip
-p7046
-(dp7047
-Vrouter_id
-p7048
-V4eb1290f-8c3c-45d5-9409-cc446f480079
-p7049
-sVstatus
-p7050
-VDOWN
-p7051
-sVdescription
-p7052
-V
-sVdns_name
-p7053
-V
-sVdns_domain
-p7054
-V
-sVfloating_network_id
-p7055
-Va8d38bc5-5364-4a80-8b7f-102fafa4cc9f
-p7056
-sVfixed_ip_address
-p7057
-V172.16.9.145
-p7058
-sVfloating_ip_address
-p7059
-V10.2.32.194
-p7060
-sVtenant_id
-p7061
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7062
-sVport_id
-p7063
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p7064
-sVid
-p7065
-V3dce7c86-0999-469a-ad4e-a0dc609695cb
-p7066
-sssV_context_show_deleted
-p7067
-I00
-sVpriority
-p7068
-VINFO
-p7069
-sV_context_is_admin
-p7070
-I01
-sV_context_project_domain
-p7071
-NsV_context_user
-p7072
-Vef7a4f67379f41aba489a0b6d6a62094
-p7073
-sVpublisher_id
-p7074
-Vnetwork.machine-A
-p7075
-sVmessage_id
-p7076
-V35438880-1668-40c3-a948-8c7c351bddc7
-p7077
-sV_context_roles
-p7078
-(lp7079
-Vadmin
-p7080
-asVtimestamp
-p7081
-V2017-11-30 11:04:04.951120
-p7082
-sV_context_timestamp
-p7083
-V2017-11-30 11:04:04.400742
-p7084
-sV_unique_id
-p7085
-V4bf2e8db376840609c3225d57474a26d
-p7086
-sV_context_tenant_id
-p7087
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7088
-sV_context_project_name
-p7089
-Vapexlake
-p7090
-sV_context_user_identity
-p7091
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7092
-sV_context_tenant
-p7093
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7094
-sV_context_project_id
-p7095
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7096
-sV_context_read_only
-p7097
-I00
-sV_context_user_domain
-p7098
-NsV_context_user_name
-p7099
-Violie
-p7100
-stp7101
-a(F13.432867050170898
-Vcompute.instance.update
-p7102
-(dp7103
-V_context_domain
-p7104
-NsV_context_request_id
-p7105
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p7106
-sV_context_quota_class
-p7107
-NsVevent_type
-p7108
-g7102
-sV_context_service_catalog
-p7109
-(lp7110
-(dp7111
-Vendpoints
-p7112
-(lp7113
-(dp7114
-VadminURL
-p7115
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7116
-sVregion
-p7117
-VRegionOne
-p7118
-sVinternalURL
-p7119
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7120
-sVpublicURL
-p7121
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7122
-sasVtype
-p7123
-Vvolume
-p7124
-sVname
-p7125
-Vcinder
-p7126
-sa(dp7127
-g7112
-(lp7128
-(dp7129
-g7115
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7130
-sg7117
-VRegionOne
-p7131
-sg7119
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7132
-sg7121
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7133
-sasg7123
-Vvolumev2
-p7134
-sg7125
-Vcinderv2
-p7135
-sasV_context_auth_token
-p7136
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7137
-sV_context_resource_uuid
-p7138
-NsV_context_user_id
-p7139
-Vef7a4f67379f41aba489a0b6d6a62094
-p7140
-sVpayload
-p7141
-(dp7142
-Vstate_description
-p7143
-Vscheduling
-p7144
-sVavailability_zone
-p7145
-Vnova
-p7146
-sVterminated_at
-p7147
-V
-sVephemeral_gb
-p7148
-I0
-sVinstance_type_id
-p7149
-I1
-sVbandwidth
-p7150
-(dp7151
-sVdeleted_at
-p7152
-V
-sVreservation_id
-p7153
-Vr-lypgovtc
-p7154
-sVmemory_mb
-p7155
-I4096
-sVdisplay_name
-p7156
-Vvm_test
-p7157
-sVhostname
-p7158
-Vvm-test
-p7159
-sVstate
-p7160
-Vbuilding
-p7161
-sVold_state
-p7162
-Vbuilding
-p7163
-sVprogress
-p7164
-V
-sVlaunched_at
-p7165
-V
-sVmetadata
-p7166
-(dp7167
-sVnode
-p7168
-NsVramdisk_id
-p7169
-V
-sVaccess_ip_v6
-p7170
-NsVdisk_gb
-p7171
-I40
-sVaccess_ip_v4
-p7172
-NsVkernel_id
-p7173
-V
-sVhost
-p7174
-NsVuser_id
-p7175
-Vef7a4f67379f41aba489a0b6d6a62094
-p7176
-sVimage_ref_url
-p7177
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p7178
-sVcell_name
-p7179
-V
-sVaudit_period_beginning
-p7180
-V2017-11-01T00:00:00.000000
-p7181
-sVroot_gb
-p7182
-I40
-sVtenant_id
-p7183
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7184
-sVcreated_at
-p7185
-V2017-11-30T11:04:05.228919
-p7186
-sVold_task_state
-p7187
-Vscheduling
-p7188
-sVinstance_id
-p7189
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7190
-sVinstance_type
-p7191
-Vm1.medium
-p7192
-sVvcpus
-p7193
-I2
-sVimage_meta
-p7194
-(dp7195
-Vmin_disk
-p7196
-V40
-p7197
-sVcontainer_format
-p7198
-Vbare
-p7199
-sVmin_ram
-p7200
-V0
-sVdisk_format
-p7201
-Vqcow2
-p7202
-sVbase_image_ref
-p7203
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7204
-ssVarchitecture
-p7205
-NsVnew_task_state
-p7206
-Vscheduling
-p7207
-sVaudit_period_ending
-p7208
-V2017-11-30T11:04:05.257542
-p7209
-sVos_type
-p7210
-NsVinstance_flavor_id
-p7211
-V3
-ssV_context_show_deleted
-p7212
-I00
-sVpriority
-p7213
-VINFO
-p7214
-sV_context_is_admin
-p7215
-I01
-sV_context_project_domain
-p7216
-NsV_context_user
-p7217
-Vef7a4f67379f41aba489a0b6d6a62094
-p7218
-sVpublisher_id
-p7219
-Vapi.machine-A
-p7220
-sVmessage_id
-p7221
-V440f6cc7-dc98-492b-9f8f-594fa43e00e8
-p7222
-sV_context_remote_address
-p7223
-V172.16.0.5
-p7224
-sV_context_roles
-p7225
-(lp7226
-Vadmin
-p7227
-asVtimestamp
-p7228
-V2017-11-30 11:04:05.260908
-p7229
-sV_context_timestamp
-p7230
-V2017-11-30T11:04:05.012319
-p7231
-sV_unique_id
-p7232
-Va7078f56442745cd9cd6b90ac2828dc3
-p7233
-sV_context_project_name
-p7234
-Vapexlake
-p7235
-sV_context_read_deleted
-p7236
-Vno
-p7237
-sV_context_user_identity
-p7238
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7239
-sV_context_tenant
-p7240
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7241
-sV_context_instance_lock_checked
-p7242
-I00
-sV_context_project_id
-p7243
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7244
-sV_context_read_only
-p7245
-I00
-sV_context_user_domain
-p7246
-NsV_context_user_name
-p7247
-Violie
-p7248
-stp7249
-a(F13.467767000198364
-Vscheduler.select_destinations.start
-p7250
-(dp7251
-V_context_domain
-p7252
-NsV_context_request_id
-p7253
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p7254
-sV_context_quota_class
-p7255
-NsVevent_type
-p7256
-g7250
-sV_context_service_catalog
-p7257
-(lp7258
-(dp7259
-Vendpoints
-p7260
-(lp7261
-(dp7262
-VadminURL
-p7263
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7264
-sVregion
-p7265
-VRegionOne
-p7266
-sVinternalURL
-p7267
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7268
-sVpublicURL
-p7269
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7270
-sasVtype
-p7271
-Vvolume
-p7272
-sVname
-p7273
-Vcinder
-p7274
-sa(dp7275
-g7260
-(lp7276
-(dp7277
-g7263
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7278
-sg7265
-VRegionOne
-p7279
-sg7267
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7280
-sg7269
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7281
-sasg7271
-Vvolumev2
-p7282
-sg7273
-Vcinderv2
-p7283
-sasV_context_auth_token
-p7284
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7285
-sV_context_resource_uuid
-p7286
-NsV_context_user_id
-p7287
-Vef7a4f67379f41aba489a0b6d6a62094
-p7288
-sVpayload
-p7289
-(dp7290
-Vrequest_spec
-p7291
-(dp7292
-Vinstance_properties
-p7293
-(dp7294
-Vroot_gb
-p7295
-I40
-sVuuid
-p7296
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7297
-sVavailability_zone
-p7298
-Vnova
-p7299
-sVephemeral_gb
-p7300
-I0
-sVnuma_topology
-p7301
-NsVmemory_mb
-p7302
-I4096
-sVvcpus
-p7303
-I2
-sVproject_id
-p7304
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7305
-sVpci_requests
-p7306
-(dp7307
-Vinstance_uuid
-p7308
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7309
-sVrequests
-p7310
-(lp7311
-sssVinstance_type
-p7312
-(dp7313
-Vdisabled
-p7314
-I00
-sg7295
-I40
-sg7273
-Vm1.medium
-p7315
-sVflavorid
-p7316
-V3
-sVdeleted
-p7317
-I00
-sVcreated_at
-p7318
-Nsg7300
-I0
-sVupdated_at
-p7319
-Nsg7302
-I4096
-sg7303
-I2
-sVextra_specs
-p7320
-(dp7321
-sVswap
-p7322
-I0
-sVrxtx_factor
-p7323
-F1
-sVis_public
-p7324
-I01
-sVdeleted_at
-p7325
-NsVvcpu_weight
-p7326
-I0
-sVid
-p7327
-I1
-ssVimage
-p7328
-(dp7329
-Vstatus
-p7330
-Vactive
-p7331
-sg7273
-Vubuntu1404
-p7332
-sVcontainer_format
-p7333
-Vbare
-p7334
-sg7318
-V2017-07-01T10:51:05.000000
-p7335
-sVdisk_format
-p7336
-Vqcow2
-p7337
-sg7319
-V2017-07-01T10:51:08.000000
-p7338
-sg7327
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7339
-sVmin_disk
-p7340
-I2
-sVmin_ram
-p7341
-I0
-sVchecksum
-p7342
-V6ad21b1699bcc4cbc02936bf1e915911
-p7343
-sVowner
-p7344
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7345
-sVproperties
-p7346
-(dp7347
-sVsize
-p7348
-I262144512
-ssVnum_instances
-p7349
-I1
-sssV_context_show_deleted
-p7350
-I00
-sVpriority
-p7351
-VINFO
-p7352
-sV_context_is_admin
-p7353
-I01
-sV_context_project_domain
-p7354
-NsV_context_user
-p7355
-Vef7a4f67379f41aba489a0b6d6a62094
-p7356
-sVpublisher_id
-p7357
-Vscheduler.machine-A
-p7358
-sVmessage_id
-p7359
-V2eacc314-f747-49e5-ad04-0b781237f75d
-p7360
-sV_context_remote_address
-p7361
-V172.16.0.5
-p7362
-sV_context_roles
-p7363
-(lp7364
-Vadmin
-p7365
-asVtimestamp
-p7366
-V2017-11-30 11:04:05.298848
-p7367
-sV_context_timestamp
-p7368
-V2017-11-30T11:04:05.012319
-p7369
-sV_unique_id
-p7370
-Vbb78042cb4ca4d9691bf53037b65f9f6
-p7371
-sV_context_project_name
-p7372
-Vapexlake
-p7373
-sV_context_read_deleted
-p7374
-Vno
-p7375
-sV_context_user_identity
-p7376
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7377
-sV_context_tenant
-p7378
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7379
-sV_context_instance_lock_checked
-p7380
-I00
-sV_context_project_id
-p7381
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7382
-sV_context_read_only
-p7383
-I00
-sV_context_user_domain
-p7384
-NsV_context_user_name
-p7385
-Violie
-p7386
-stp7387
-a(F13.498921155929565
-Vscheduler.select_destinations.end
-p7388
-(dp7389
-V_context_domain
-p7390
-NsV_context_request_id
-p7391
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p7392
-sV_context_quota_class
-p7393
-NsVevent_type
-p7394
-g7388
-sV_context_service_catalog
-p7395
-(lp7396
-(dp7397
-Vendpoints
-p7398
-(lp7399
-(dp7400
-VadminURL
-p7401
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7402
-sVregion
-p7403
-VRegionOne
-p7404
-sVinternalURL
-p7405
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7406
-sVpublicURL
-p7407
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7408
-sasVtype
-p7409
-Vvolume
-p7410
-sVname
-p7411
-Vcinder
-p7412
-sa(dp7413
-g7398
-(lp7414
-(dp7415
-g7401
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7416
-sg7403
-VRegionOne
-p7417
-sg7405
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7418
-sg7407
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7419
-sasg7409
-Vvolumev2
-p7420
-sg7411
-Vcinderv2
-p7421
-sasV_context_auth_token
-p7422
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7423
-sV_context_resource_uuid
-p7424
-NsV_context_user_id
-p7425
-Vef7a4f67379f41aba489a0b6d6a62094
-p7426
-sVpayload
-p7427
-(dp7428
-Vrequest_spec
-p7429
-(dp7430
-Vinstance_properties
-p7431
-(dp7432
-Vroot_gb
-p7433
-I40
-sVuuid
-p7434
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7435
-sVavailability_zone
-p7436
-Vnova
-p7437
-sVephemeral_gb
-p7438
-I0
-sVnuma_topology
-p7439
-NsVmemory_mb
-p7440
-I4096
-sVvcpus
-p7441
-I2
-sVproject_id
-p7442
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7443
-sVpci_requests
-p7444
-(dp7445
-Vinstance_uuid
-p7446
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7447
-sVrequests
-p7448
-(lp7449
-sssVinstance_type
-p7450
-(dp7451
-Vdisabled
-p7452
-I00
-sg7433
-I40
-sg7411
-Vm1.medium
-p7453
-sVflavorid
-p7454
-V3
-sVdeleted
-p7455
-I00
-sVcreated_at
-p7456
-Nsg7438
-I0
-sVupdated_at
-p7457
-Nsg7440
-I4096
-sg7441
-I2
-sVextra_specs
-p7458
-(dp7459
-sVswap
-p7460
-I0
-sVrxtx_factor
-p7461
-F1
-sVis_public
-p7462
-I01
-sVdeleted_at
-p7463
-NsVvcpu_weight
-p7464
-I0
-sVid
-p7465
-I1
-ssVimage
-p7466
-(dp7467
-Vstatus
-p7468
-Vactive
-p7469
-sg7411
-Vubuntu1404
-p7470
-sVcontainer_format
-p7471
-Vbare
-p7472
-sg7456
-V2017-07-01T10:51:05.000000
-p7473
-sVdisk_format
-p7474
-Vqcow2
-p7475
-sg7457
-V2017-07-01T10:51:08.000000
-p7476
-sg7465
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7477
-sVmin_disk
-p7478
-I2
-sVmin_ram
-p7479
-I0
-sVchecksum
-p7480
-V6ad21b1699bcc4cbc02936bf1e915911
-p7481
-sVowner
-p7482
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7483
-sVproperties
-p7484
-(dp7485
-sVsize
-p7486
-I262144512
-ssVnum_instances
-p7487
-I1
-sssV_context_show_deleted
-p7488
-I00
-sVpriority
-p7489
-VINFO
-p7490
-sV_context_is_admin
-p7491
-I01
-sV_context_project_domain
-p7492
-NsV_context_user
-p7493
-Vef7a4f67379f41aba489a0b6d6a62094
-p7494
-sVpublisher_id
-p7495
-Vscheduler.machine-A
-p7496
-sVmessage_id
-p7497
-Vefbab565-d385-4453-9a48-078cadf75a37
-p7498
-sV_context_remote_address
-p7499
-V172.16.0.5
-p7500
-sV_context_roles
-p7501
-(lp7502
-Vadmin
-p7503
-asVtimestamp
-p7504
-V2017-11-30 11:04:05.329587
-p7505
-sV_context_timestamp
-p7506
-V2017-11-30T11:04:05.012319
-p7507
-sV_unique_id
-p7508
-V7eb64689753c4867b63c0e6a5b04b1cc
-p7509
-sV_context_project_name
-p7510
-Vapexlake
-p7511
-sV_context_read_deleted
-p7512
-Vno
-p7513
-sV_context_user_identity
-p7514
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7515
-sV_context_tenant
-p7516
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7517
-sV_context_instance_lock_checked
-p7518
-I00
-sV_context_project_id
-p7519
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7520
-sV_context_read_only
-p7521
-I00
-sV_context_user_domain
-p7522
-NsV_context_user_name
-p7523
-Violie
-p7524
-stp7525
-a(F13.655038118362427
-Vcompute.instance.update
-p7526
-(dp7527
-V_context_domain
-p7528
-NsV_context_request_id
-p7529
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p7530
-sV_context_quota_class
-p7531
-NsVevent_type
-p7532
-g7526
-sV_context_service_catalog
-p7533
-(lp7534
-(dp7535
-Vendpoints
-p7536
-(lp7537
-(dp7538
-VadminURL
-p7539
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7540
-sVregion
-p7541
-VRegionOne
-p7542
-sVinternalURL
-p7543
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7544
-sVpublicURL
-p7545
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7546
-sasVtype
-p7547
-Vvolume
-p7548
-sVname
-p7549
-Vcinder
-p7550
-sa(dp7551
-g7536
-(lp7552
-(dp7553
-g7539
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7554
-sg7541
-VRegionOne
-p7555
-sg7543
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7556
-sg7545
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7557
-sasg7547
-Vvolumev2
-p7558
-sg7549
-Vcinderv2
-p7559
-sasV_context_auth_token
-p7560
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7561
-sV_context_resource_uuid
-p7562
-NsV_context_user_id
-p7563
-Vef7a4f67379f41aba489a0b6d6a62094
-p7564
-sVpayload
-p7565
-(dp7566
-Vstate_description
-p7567
-V
-sVavailability_zone
-p7568
-Vnova
-p7569
-sVterminated_at
-p7570
-V
-sVephemeral_gb
-p7571
-I0
-sVinstance_type_id
-p7572
-I1
-sVbandwidth
-p7573
-(dp7574
-sVdeleted_at
-p7575
-V
-sVreservation_id
-p7576
-Vr-lypgovtc
-p7577
-sVmemory_mb
-p7578
-I4096
-sVdisplay_name
-p7579
-Vvm_test
-p7580
-sVhostname
-p7581
-Vvm-test
-p7582
-sVstate
-p7583
-Vbuilding
-p7584
-sVold_state
-p7585
-Vbuilding
-p7586
-sVprogress
-p7587
-V
-sVlaunched_at
-p7588
-V
-sVmetadata
-p7589
-(dp7590
-sVnode
-p7591
-NsVramdisk_id
-p7592
-V
-sVaccess_ip_v6
-p7593
-NsVdisk_gb
-p7594
-I40
-sVaccess_ip_v4
-p7595
-NsVkernel_id
-p7596
-V
-sVhost
-p7597
-NsVuser_id
-p7598
-Vef7a4f67379f41aba489a0b6d6a62094
-p7599
-sVimage_ref_url
-p7600
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p7601
-sVcell_name
-p7602
-V
-sVaudit_period_beginning
-p7603
-V2017-11-01T00:00:00.000000
-p7604
-sVroot_gb
-p7605
-I40
-sVtenant_id
-p7606
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7607
-sVcreated_at
-p7608
-V2017-11-30T11:04:05.000000
-p7609
-sVold_task_state
-p7610
-Vscheduling
-p7611
-sVinstance_id
-p7612
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7613
-sVinstance_type
-p7614
-Vm1.medium
-p7615
-sVvcpus
-p7616
-I2
-sVimage_meta
-p7617
-(dp7618
-Vmin_disk
-p7619
-V40
-p7620
-sVcontainer_format
-p7621
-Vbare
-p7622
-sVmin_ram
-p7623
-V0
-sVdisk_format
-p7624
-Vqcow2
-p7625
-sVbase_image_ref
-p7626
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7627
-ssVarchitecture
-p7628
-NsVnew_task_state
-p7629
-NsVaudit_period_ending
-p7630
-V2017-11-30T11:04:05.477673
-p7631
-sVos_type
-p7632
-NsVinstance_flavor_id
-p7633
-V3
-ssV_context_show_deleted
-p7634
-I00
-sVpriority
-p7635
-VINFO
-p7636
-sV_context_is_admin
-p7637
-I01
-sV_context_project_domain
-p7638
-NsV_context_user
-p7639
-Vef7a4f67379f41aba489a0b6d6a62094
-p7640
-sVpublisher_id
-p7641
-Vcompute.machine-A
-p7642
-sVmessage_id
-p7643
-Vde2714d4-ed9a-4ab1-848d-572b4cbd90b5
-p7644
-sV_context_remote_address
-p7645
-V172.16.0.5
-p7646
-sV_context_roles
-p7647
-(lp7648
-Vadmin
-p7649
-asVtimestamp
-p7650
-V2017-11-30 11:04:05.482373
-p7651
-sV_context_timestamp
-p7652
-V2017-11-30T11:04:05.012319
-p7653
-sV_unique_id
-p7654
-V7a569dd4a158416a97676d54d8737ef5
-p7655
-sV_context_project_name
-p7656
-Vapexlake
-p7657
-sV_context_read_deleted
-p7658
-Vno
-p7659
-sV_context_user_identity
-p7660
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7661
-sV_context_tenant
-p7662
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7663
-sV_context_instance_lock_checked
-p7664
-I00
-sV_context_project_id
-p7665
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7666
-sV_context_read_only
-p7667
-I00
-sV_context_user_domain
-p7668
-NsV_context_user_name
-p7669
-Violie
-p7670
-stp7671
-a(F13.66447114944458
-Vcompute.instance.create.start
-p7672
-(dp7673
-V_context_domain
-p7674
-NsV_context_request_id
-p7675
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p7676
-sV_context_quota_class
-p7677
-NsVevent_type
-p7678
-g7672
-sV_context_service_catalog
-p7679
-(lp7680
-(dp7681
-Vendpoints
-p7682
-(lp7683
-(dp7684
-VadminURL
-p7685
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7686
-sVregion
-p7687
-VRegionOne
-p7688
-sVinternalURL
-p7689
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7690
-sVpublicURL
-p7691
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7692
-sasVtype
-p7693
-Vvolume
-p7694
-sVname
-p7695
-Vcinder
-p7696
-sa(dp7697
-g7682
-(lp7698
-(dp7699
-g7685
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7700
-sg7687
-VRegionOne
-p7701
-sg7689
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7702
-sg7691
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7703
-sasg7693
-Vvolumev2
-p7704
-sg7695
-Vcinderv2
-p7705
-sasV_context_auth_token
-p7706
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7707
-sV_context_resource_uuid
-p7708
-NsV_context_user_id
-p7709
-Vef7a4f67379f41aba489a0b6d6a62094
-p7710
-sVpayload
-p7711
-(dp7712
-Vstate_description
-p7713
-V
-sVavailability_zone
-p7714
-Vnova
-p7715
-sVterminated_at
-p7716
-V
-sVephemeral_gb
-p7717
-I0
-sVinstance_type_id
-p7718
-I1
-sVdeleted_at
-p7719
-V
-sVreservation_id
-p7720
-Vr-lypgovtc
-p7721
-sVmemory_mb
-p7722
-I4096
-sVdisplay_name
-p7723
-Vvm_test
-p7724
-sVhostname
-p7725
-Vvm-test
-p7726
-sVstate
-p7727
-Vbuilding
-p7728
-sVprogress
-p7729
-V
-sVlaunched_at
-p7730
-V
-sVmetadata
-p7731
-(dp7732
-sVnode
-p7733
-NsVramdisk_id
-p7734
-V
-sVaccess_ip_v6
-p7735
-NsVdisk_gb
-p7736
-I40
-sVaccess_ip_v4
-p7737
-NsVkernel_id
-p7738
-V
-sVimage_name
-p7739
-Vubuntu1404
-p7740
-sVhost
-p7741
-NsVuser_id
-p7742
-Vef7a4f67379f41aba489a0b6d6a62094
-p7743
-sVimage_ref_url
-p7744
-Vhttp://172.16.0.8:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p7745
-sVcell_name
-p7746
-V
-sVroot_gb
-p7747
-I40
-sVtenant_id
-p7748
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7749
-sVcreated_at
-p7750
-V2017-11-30T11:04:05.000000
-p7751
-sVinstance_id
-p7752
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7753
-sVinstance_type
-p7754
-Vm1.medium
-p7755
-sVvcpus
-p7756
-I2
-sVimage_meta
-p7757
-(dp7758
-Vmin_disk
-p7759
-V40
-p7760
-sVcontainer_format
-p7761
-Vbare
-p7762
-sVmin_ram
-p7763
-V0
-sVdisk_format
-p7764
-Vqcow2
-p7765
-sVbase_image_ref
-p7766
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7767
-ssVarchitecture
-p7768
-NsVos_type
-p7769
-NsVinstance_flavor_id
-p7770
-V3
-ssV_context_show_deleted
-p7771
-I00
-sVpriority
-p7772
-VINFO
-p7773
-sV_context_is_admin
-p7774
-I01
-sV_context_project_domain
-p7775
-NsV_context_user
-p7776
-Vef7a4f67379f41aba489a0b6d6a62094
-p7777
-sVpublisher_id
-p7778
-Vcompute.machine-E
-p7779
-sVmessage_id
-p7780
-V8bad26ed-0f0b-4492-8727-89da756c8a52
-p7781
-sV_context_remote_address
-p7782
-V172.16.0.5
-p7783
-sV_context_roles
-p7784
-(lp7785
-Vadmin
-p7786
-asVtimestamp
-p7787
-V2017-11-30 11:04:05.495047
-p7788
-sV_context_timestamp
-p7789
-V2017-11-30T11:04:05.012319
-p7790
-sV_unique_id
-p7791
-Vbee7b9f7a9f14ad4a3bdd56bec2350d5
-p7792
-sV_context_project_name
-p7793
-Vapexlake
-p7794
-sV_context_read_deleted
-p7795
-Vno
-p7796
-sV_context_user_identity
-p7797
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7798
-sV_context_tenant
-p7799
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7800
-sV_context_instance_lock_checked
-p7801
-I00
-sV_context_project_id
-p7802
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7803
-sV_context_read_only
-p7804
-I00
-sV_context_user_domain
-p7805
-NsV_context_user_name
-p7806
-Violie
-p7807
-stp7808
-a(F13.746118068695068
-Vcompute.instance.update
-p7809
-(dp7810
-V_context_domain
-p7811
-NsV_context_request_id
-p7812
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p7813
-sV_context_quota_class
-p7814
-NsVevent_type
-p7815
-g7809
-sV_context_service_catalog
-p7816
-(lp7817
-(dp7818
-Vendpoints
-p7819
-(lp7820
-(dp7821
-VadminURL
-p7822
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7823
-sVregion
-p7824
-VRegionOne
-p7825
-sVinternalURL
-p7826
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7827
-sVpublicURL
-p7828
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7829
-sasVtype
-p7830
-Vvolume
-p7831
-sVname
-p7832
-Vcinder
-p7833
-sa(dp7834
-g7819
-(lp7835
-(dp7836
-g7822
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7837
-sg7824
-VRegionOne
-p7838
-sg7826
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7839
-sg7828
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7840
-sasg7830
-Vvolumev2
-p7841
-sg7832
-Vcinderv2
-p7842
-sasV_context_auth_token
-p7843
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7844
-sV_context_resource_uuid
-p7845
-NsV_context_user_id
-p7846
-Vef7a4f67379f41aba489a0b6d6a62094
-p7847
-sVpayload
-p7848
-(dp7849
-Vstate_description
-p7850
-V
-sVavailability_zone
-p7851
-Vnova
-p7852
-sVterminated_at
-p7853
-V
-sVephemeral_gb
-p7854
-I0
-sVinstance_type_id
-p7855
-I1
-sVbandwidth
-p7856
-(dp7857
-sVdeleted_at
-p7858
-V
-sVreservation_id
-p7859
-Vr-lypgovtc
-p7860
-sVmemory_mb
-p7861
-I4096
-sVdisplay_name
-p7862
-Vvm_test
-p7863
-sVhostname
-p7864
-Vvm-test
-p7865
-sVstate
-p7866
-Vbuilding
-p7867
-sVold_state
-p7868
-Vbuilding
-p7869
-sVprogress
-p7870
-V
-sVlaunched_at
-p7871
-V
-sVmetadata
-p7872
-(dp7873
-sVnode
-p7874
-Vmachine-E
-p7875
-sVramdisk_id
-p7876
-V
-sVaccess_ip_v6
-p7877
-NsVdisk_gb
-p7878
-I40
-sVaccess_ip_v4
-p7879
-NsVkernel_id
-p7880
-V
-sVhost
-p7881
-Vmachine-E
-p7882
-sVuser_id
-p7883
-Vef7a4f67379f41aba489a0b6d6a62094
-p7884
-sVimage_ref_url
-p7885
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p7886
-sVcell_name
-p7887
-V
-sVaudit_period_beginning
-p7888
-V2017-11-01T00:00:00.000000
-p7889
-sVroot_gb
-p7890
-I40
-sVtenant_id
-p7891
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7892
-sVcreated_at
-p7893
-V2017-11-30T11:04:05.000000
-p7894
-sVold_task_state
-p7895
-NsVinstance_id
-p7896
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7897
-sVinstance_type
-p7898
-Vm1.medium
-p7899
-sVvcpus
-p7900
-I2
-sVimage_meta
-p7901
-(dp7902
-Vmin_disk
-p7903
-V40
-p7904
-sVcontainer_format
-p7905
-Vbare
-p7906
-sVmin_ram
-p7907
-V0
-sVdisk_format
-p7908
-Vqcow2
-p7909
-sVbase_image_ref
-p7910
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7911
-ssVarchitecture
-p7912
-NsVnew_task_state
-p7913
-NsVaudit_period_ending
-p7914
-V2017-11-30T11:04:05.572408
-p7915
-sVos_type
-p7916
-NsVinstance_flavor_id
-p7917
-V3
-ssV_context_show_deleted
-p7918
-I00
-sVpriority
-p7919
-VINFO
-p7920
-sV_context_is_admin
-p7921
-I01
-sV_context_project_domain
-p7922
-NsV_context_user
-p7923
-Vef7a4f67379f41aba489a0b6d6a62094
-p7924
-sVpublisher_id
-p7925
-Vcompute.machine-A
-p7926
-sVmessage_id
-p7927
-V3acabd57-b808-461b-95a8-b11a7a2a5967
-p7928
-sV_context_remote_address
-p7929
-V172.16.0.5
-p7930
-sV_context_roles
-p7931
-(lp7932
-Vadmin
-p7933
-asVtimestamp
-p7934
-V2017-11-30 11:04:05.576043
-p7935
-sV_context_timestamp
-p7936
-V2017-11-30T11:04:05.012319
-p7937
-sV_unique_id
-p7938
-Vedcb2321ed3c4c42840c362ee8595e85
-p7939
-sV_context_project_name
-p7940
-Vapexlake
-p7941
-sV_context_read_deleted
-p7942
-Vno
-p7943
-sV_context_user_identity
-p7944
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7945
-sV_context_tenant
-p7946
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7947
-sV_context_instance_lock_checked
-p7948
-I00
-sV_context_project_id
-p7949
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7950
-sV_context_read_only
-p7951
-I00
-sV_context_user_domain
-p7952
-NsV_context_user_name
-p7953
-Violie
-p7954
-stp7955
-a(F13.847177982330322
-Vcompute.instance.update
-p7956
-(dp7957
-V_context_domain
-p7958
-NsV_context_request_id
-p7959
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p7960
-sV_context_quota_class
-p7961
-NsVevent_type
-p7962
-g7956
-sV_context_service_catalog
-p7963
-(lp7964
-(dp7965
-Vendpoints
-p7966
-(lp7967
-(dp7968
-VadminURL
-p7969
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7970
-sVregion
-p7971
-VRegionOne
-p7972
-sVinternalURL
-p7973
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7974
-sVpublicURL
-p7975
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7976
-sasVtype
-p7977
-Vvolume
-p7978
-sVname
-p7979
-Vcinder
-p7980
-sa(dp7981
-g7966
-(lp7982
-(dp7983
-g7969
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7984
-sg7971
-VRegionOne
-p7985
-sg7973
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7986
-sg7975
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7987
-sasg7977
-Vvolumev2
-p7988
-sg7979
-Vcinderv2
-p7989
-sasV_context_auth_token
-p7990
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p7991
-sV_context_resource_uuid
-p7992
-NsV_context_user_id
-p7993
-Vef7a4f67379f41aba489a0b6d6a62094
-p7994
-sVpayload
-p7995
-(dp7996
-Vstate_description
-p7997
-Vnetworking
-p7998
-sVavailability_zone
-p7999
-Vnova
-p8000
-sVterminated_at
-p8001
-V
-sVephemeral_gb
-p8002
-I0
-sVinstance_type_id
-p8003
-I1
-sVbandwidth
-p8004
-(dp8005
-sVdeleted_at
-p8006
-V
-sVreservation_id
-p8007
-Vr-lypgovtc
-p8008
-sVmemory_mb
-p8009
-I4096
-sVdisplay_name
-p8010
-Vvm_test
-p8011
-sVhostname
-p8012
-Vvm-test
-p8013
-sVstate
-p8014
-Vbuilding
-p8015
-sVold_state
-p8016
-Vbuilding
-p8017
-sVprogress
-p8018
-V
-sVlaunched_at
-p8019
-V
-sVmetadata
-p8020
-(dp8021
-sVnode
-p8022
-Vmachine-E
-p8023
-sVramdisk_id
-p8024
-V
-sVaccess_ip_v6
-p8025
-NsVdisk_gb
-p8026
-I40
-sVaccess_ip_v4
-p8027
-NsVkernel_id
-p8028
-V
-sVhost
-p8029
-Vmachine-E
-p8030
-sVuser_id
-p8031
-Vef7a4f67379f41aba489a0b6d6a62094
-p8032
-sVimage_ref_url
-p8033
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p8034
-sVcell_name
-p8035
-V
-sVaudit_period_beginning
-p8036
-V2017-11-01T00:00:00.000000
-p8037
-sVroot_gb
-p8038
-I40
-sVtenant_id
-p8039
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8040
-sVcreated_at
-p8041
-V2017-11-30T11:04:05.000000
-p8042
-sVold_task_state
-p8043
-Vnetworking
-p8044
-sVinstance_id
-p8045
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p8046
-sVinstance_type
-p8047
-Vm1.medium
-p8048
-sVvcpus
-p8049
-I2
-sVimage_meta
-p8050
-(dp8051
-Vmin_disk
-p8052
-V40
-p8053
-sVcontainer_format
-p8054
-Vbare
-p8055
-sVmin_ram
-p8056
-V0
-sVdisk_format
-p8057
-Vqcow2
-p8058
-sVbase_image_ref
-p8059
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p8060
-ssVarchitecture
-p8061
-NsVnew_task_state
-p8062
-Vnetworking
-p8063
-sVaudit_period_ending
-p8064
-V2017-11-30T11:04:05.669967
-p8065
-sVos_type
-p8066
-NsVinstance_flavor_id
-p8067
-V3
-ssV_context_show_deleted
-p8068
-I00
-sVpriority
-p8069
-VINFO
-p8070
-sV_context_is_admin
-p8071
-I01
-sV_context_project_domain
-p8072
-NsV_context_user
-p8073
-Vef7a4f67379f41aba489a0b6d6a62094
-p8074
-sVpublisher_id
-p8075
-Vcompute.machine-A
-p8076
-sVmessage_id
-p8077
-V077c3340-240a-4825-ad40-01863e8a8abc
-p8078
-sV_context_remote_address
-p8079
-V172.16.0.5
-p8080
-sV_context_roles
-p8081
-(lp8082
-Vadmin
-p8083
-asVtimestamp
-p8084
-V2017-11-30 11:04:05.674593
-p8085
-sV_context_timestamp
-p8086
-V2017-11-30T11:04:05.012319
-p8087
-sV_unique_id
-p8088
-V6b4ec84130524759ba7e4d5259a75846
-p8089
-sV_context_project_name
-p8090
-Vapexlake
-p8091
-sV_context_read_deleted
-p8092
-Vno
-p8093
-sV_context_user_identity
-p8094
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8095
-sV_context_tenant
-p8096
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8097
-sV_context_instance_lock_checked
-p8098
-I00
-sV_context_project_id
-p8099
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8100
-sV_context_read_only
-p8101
-I00
-sV_context_user_domain
-p8102
-NsV_context_user_name
-p8103
-Violie
-p8104
-stp8105
-a(F13.95925498008728
-Vcompute.instance.update
-p8106
-(dp8107
-V_context_domain
-p8108
-NsV_context_request_id
-p8109
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p8110
-sV_context_quota_class
-p8111
-NsVevent_type
-p8112
-g8106
-sV_context_service_catalog
-p8113
-(lp8114
-(dp8115
-Vendpoints
-p8116
-(lp8117
-(dp8118
-VadminURL
-p8119
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8120
-sVregion
-p8121
-VRegionOne
-p8122
-sVinternalURL
-p8123
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8124
-sVpublicURL
-p8125
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8126
-sasVtype
-p8127
-Vvolume
-p8128
-sVname
-p8129
-Vcinder
-p8130
-sa(dp8131
-g8116
-(lp8132
-(dp8133
-g8119
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8134
-sg8121
-VRegionOne
-p8135
-sg8123
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8136
-sg8125
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8137
-sasg8127
-Vvolumev2
-p8138
-sg8129
-Vcinderv2
-p8139
-sasV_context_auth_token
-p8140
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p8141
-sV_context_resource_uuid
-p8142
-NsV_context_user_id
-p8143
-Vef7a4f67379f41aba489a0b6d6a62094
-p8144
-sVpayload
-p8145
-(dp8146
-Vstate_description
-p8147
-Vblock_device_mapping
-p8148
-sVavailability_zone
-p8149
-Vnova
-p8150
-sVterminated_at
-p8151
-V
-sVephemeral_gb
-p8152
-I0
-sVinstance_type_id
-p8153
-I1
-sVbandwidth
-p8154
-(dp8155
-sVdeleted_at
-p8156
-V
-sVreservation_id
-p8157
-Vr-lypgovtc
-p8158
-sVmemory_mb
-p8159
-I4096
-sVdisplay_name
-p8160
-Vvm_test
-p8161
-sVhostname
-p8162
-Vvm-test
-p8163
-sVstate
-p8164
-Vbuilding
-p8165
-sVold_state
-p8166
-Vbuilding
-p8167
-sVprogress
-p8168
-V
-sVlaunched_at
-p8169
-V
-sVmetadata
-p8170
-(dp8171
-sVnode
-p8172
-Vmachine-E
-p8173
-sVramdisk_id
-p8174
-V
-sVaccess_ip_v6
-p8175
-NsVdisk_gb
-p8176
-I40
-sVaccess_ip_v4
-p8177
-NsVkernel_id
-p8178
-V
-sVhost
-p8179
-Vmachine-E
-p8180
-sVuser_id
-p8181
-Vef7a4f67379f41aba489a0b6d6a62094
-p8182
-sVimage_ref_url
-p8183
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p8184
-sVcell_name
-p8185
-V
-sVaudit_period_beginning
-p8186
-V2017-11-01T00:00:00.000000
-p8187
-sVroot_gb
-p8188
-I40
-sVtenant_id
-p8189
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8190
-sVcreated_at
-p8191
-V2017-11-30T11:04:05.000000
-p8192
-sVold_task_state
-p8193
-Vnetworking
-p8194
-sVinstance_id
-p8195
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p8196
-sVinstance_type
-p8197
-Vm1.medium
-p8198
-sVvcpus
-p8199
-I2
-sVimage_meta
-p8200
-(dp8201
-Vmin_disk
-p8202
-V40
-p8203
-sVcontainer_format
-p8204
-Vbare
-p8205
-sVmin_ram
-p8206
-V0
-sVdisk_format
-p8207
-Vqcow2
-p8208
-sVbase_image_ref
-p8209
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p8210
-ssVarchitecture
-p8211
-NsVnew_task_state
-p8212
-Vblock_device_mapping
-p8213
-sVaudit_period_ending
-p8214
-V2017-11-30T11:04:05.784940
-p8215
-sVos_type
-p8216
-NsVinstance_flavor_id
-p8217
-V3
-ssV_context_show_deleted
-p8218
-I00
-sVpriority
-p8219
-VINFO
-p8220
-sV_context_is_admin
-p8221
-I01
-sV_context_project_domain
-p8222
-NsV_context_user
-p8223
-Vef7a4f67379f41aba489a0b6d6a62094
-p8224
-sVpublisher_id
-p8225
-Vcompute.machine-A
-p8226
-sVmessage_id
-p8227
-V6bc24024-3b93-4691-9b31-845a2c6547d8
-p8228
-sV_context_remote_address
-p8229
-V172.16.0.5
-p8230
-sV_context_roles
-p8231
-(lp8232
-Vadmin
-p8233
-asVtimestamp
-p8234
-V2017-11-30 11:04:05.789174
-p8235
-sV_context_timestamp
-p8236
-V2017-11-30T11:04:05.012319
-p8237
-sV_unique_id
-p8238
-V1dc2cb9d30af489686da544bd8592b6e
-p8239
-sV_context_project_name
-p8240
-Vapexlake
-p8241
-sV_context_read_deleted
-p8242
-Vno
-p8243
-sV_context_user_identity
-p8244
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8245
-sV_context_tenant
-p8246
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8247
-sV_context_instance_lock_checked
-p8248
-I00
-sV_context_project_id
-p8249
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8250
-sV_context_read_only
-p8251
-I00
-sV_context_user_domain
-p8252
-NsV_context_user_name
-p8253
-Violie
-p8254
-stp8255
-a(F13.976312160491943
-Vport.update.start
-p8256
-(dp8257
-V_context_domain
-p8258
-NsV_context_request_id
-p8259
-Vreq-e8619cc5-d8bd-4028-923d-4e00c1b3594b
-p8260
-sVevent_type
-p8261
-g8256
-sV_context_auth_token
-p8262
-VgAAAAABaH-BHmi0xZ8F_W1g5ZW6qzDLFsbbMBKtL4OMu5BHvR62oZ2EMKhbFia9wxarzCdtKDak95Qe0fOcEwwPVZLIaXCzG0uKzvM9_1AszHCsDf2g6jiGte2hJPIBQ-FNMri44srNkNqaZWQnZMQadXbwFzNfiig_1PEv4b_8Jf0lo3aKKbA4
-p8263
-sV_context_resource_uuid
-p8264
-NsV_context_tenant_name
-p8265
-Vservices
-p8266
-sV_context_user_id
-p8267
-V84faafdbb77b40c9a73047fdebb0ab45
-p8268
-sVpayload
-p8269
-(dp8270
-Vport
-p8271
-(dp8272
-Vdns_name
-p8273
-Vvm-test
-p8274
-sVdevice_owner
-p8275
-Vcompute:nova
-p8276
-sVbinding:host_id
-p8277
-Vmachine-E
-p8278
-sVdevice_id
-p8279
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p8280
-ssVid
-p8281
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p8282
-ssV_context_show_deleted
-p8283
-I00
-sVpriority
-p8284
-VINFO
-p8285
-sV_context_is_admin
-p8286
-I01
-sV_context_project_domain
-p8287
-NsV_context_user
-p8288
-V84faafdbb77b40c9a73047fdebb0ab45
-p8289
-sVpublisher_id
-p8290
-Vnetwork.machine-A
-p8291
-sVmessage_id
-p8292
-Vc4f8d114-532b-430c-9463-ff02e7ff3a4c
-p8293
-sV_context_roles
-p8294
-(lp8295
-Vadmin
-p8296
-asVtimestamp
-p8297
-V2017-11-30 11:04:05.806991
-p8298
-sV_context_timestamp
-p8299
-V2017-11-30 11:04:05.805696
-p8300
-sV_unique_id
-p8301
-Vd79acb56b805403296b333beb0d388b4
-p8302
-sV_context_tenant_id
-p8303
-V66fbf30f2dce4cef95d5248254dac9a5
-p8304
-sV_context_project_name
-p8305
-Vservices
-p8306
-sV_context_user_identity
-p8307
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p8308
-sV_context_tenant
-p8309
-V66fbf30f2dce4cef95d5248254dac9a5
-p8310
-sV_context_project_id
-p8311
-V66fbf30f2dce4cef95d5248254dac9a5
-p8312
-sV_context_read_only
-p8313
-I00
-sV_context_user_domain
-p8314
-NsV_context_user_name
-p8315
-Vneutron
-p8316
-stp8317
-a(F14.04657506942749
-Vcompute.instance.update
-p8318
-(dp8319
-V_context_domain
-p8320
-NsV_context_request_id
-p8321
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p8322
-sV_context_quota_class
-p8323
-NsVevent_type
-p8324
-g8318
-sV_context_service_catalog
-p8325
-(lp8326
-(dp8327
-Vendpoints
-p8328
-(lp8329
-(dp8330
-VadminURL
-p8331
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8332
-sVregion
-p8333
-VRegionOne
-p8334
-sVinternalURL
-p8335
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8336
-sVpublicURL
-p8337
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8338
-sasVtype
-p8339
-Vvolume
-p8340
-sVname
-p8341
-Vcinder
-p8342
-sa(dp8343
-g8328
-(lp8344
-(dp8345
-g8331
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8346
-sg8333
-VRegionOne
-p8347
-sg8335
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8348
-sg8337
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8349
-sasg8339
-Vvolumev2
-p8350
-sg8341
-Vcinderv2
-p8351
-sasV_context_auth_token
-p8352
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p8353
-sV_context_resource_uuid
-p8354
-NsV_context_user_id
-p8355
-Vef7a4f67379f41aba489a0b6d6a62094
-p8356
-sVpayload
-p8357
-(dp8358
-Vstate_description
-p8359
-Vspawning
-p8360
-sVavailability_zone
-p8361
-Vnova
-p8362
-sVterminated_at
-p8363
-V
-sVephemeral_gb
-p8364
-I0
-sVinstance_type_id
-p8365
-I1
-sVbandwidth
-p8366
-(dp8367
-sVdeleted_at
-p8368
-V
-sVreservation_id
-p8369
-Vr-lypgovtc
-p8370
-sVmemory_mb
-p8371
-I4096
-sVdisplay_name
-p8372
-Vvm_test
-p8373
-sVhostname
-p8374
-Vvm-test
-p8375
-sVstate
-p8376
-Vbuilding
-p8377
-sVold_state
-p8378
-Vbuilding
-p8379
-sVprogress
-p8380
-V
-sVlaunched_at
-p8381
-V
-sVmetadata
-p8382
-(dp8383
-sVnode
-p8384
-Vmachine-E
-p8385
-sVramdisk_id
-p8386
-V
-sVaccess_ip_v6
-p8387
-NsVdisk_gb
-p8388
-I40
-sVaccess_ip_v4
-p8389
-NsVkernel_id
-p8390
-V
-sVhost
-p8391
-Vmachine-E
-p8392
-sVuser_id
-p8393
-Vef7a4f67379f41aba489a0b6d6a62094
-p8394
-sVimage_ref_url
-p8395
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p8396
-sVcell_name
-p8397
-V
-sVaudit_period_beginning
-p8398
-V2017-11-01T00:00:00.000000
-p8399
-sVroot_gb
-p8400
-I40
-sVtenant_id
-p8401
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8402
-sVcreated_at
-p8403
-V2017-11-30T11:04:05.000000
-p8404
-sVold_task_state
-p8405
-Vblock_device_mapping
-p8406
-sVinstance_id
-p8407
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p8408
-sVinstance_type
-p8409
-Vm1.medium
-p8410
-sVvcpus
-p8411
-I2
-sVimage_meta
-p8412
-(dp8413
-Vmin_disk
-p8414
-V40
-p8415
-sVcontainer_format
-p8416
-Vbare
-p8417
-sVmin_ram
-p8418
-V0
-sVdisk_format
-p8419
-Vqcow2
-p8420
-sVbase_image_ref
-p8421
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p8422
-ssVarchitecture
-p8423
-NsVnew_task_state
-p8424
-Vspawning
-p8425
-sVaudit_period_ending
-p8426
-V2017-11-30T11:04:05.872448
-p8427
-sVos_type
-p8428
-NsVinstance_flavor_id
-p8429
-V3
-ssV_context_show_deleted
-p8430
-I00
-sVpriority
-p8431
-VINFO
-p8432
-sV_context_is_admin
-p8433
-I01
-sV_context_project_domain
-p8434
-NsV_context_user
-p8435
-Vef7a4f67379f41aba489a0b6d6a62094
-p8436
-sVpublisher_id
-p8437
-Vcompute.machine-A
-p8438
-sVmessage_id
-p8439
-Vdfe10696-2d4e-4076-8ddd-2532d0adc1a6
-p8440
-sV_context_remote_address
-p8441
-V172.16.0.5
-p8442
-sV_context_roles
-p8443
-(lp8444
-Vadmin
-p8445
-asVtimestamp
-p8446
-V2017-11-30 11:04:05.877153
-p8447
-sV_context_timestamp
-p8448
-V2017-11-30T11:04:05.012319
-p8449
-sV_unique_id
-p8450
-Vcb22202bade449f2b915743581fc0cbe
-p8451
-sV_context_project_name
-p8452
-Vapexlake
-p8453
-sV_context_read_deleted
-p8454
-Vno
-p8455
-sV_context_user_identity
-p8456
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8457
-sV_context_tenant
-p8458
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8459
-sV_context_instance_lock_checked
-p8460
-I00
-sV_context_project_id
-p8461
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8462
-sV_context_read_only
-p8463
-I00
-sV_context_user_domain
-p8464
-NsV_context_user_name
-p8465
-Violie
-p8466
-stp8467
-a(F14.218984127044678
-Vport.update.end
-p8468
-(dp8469
-V_context_domain
-p8470
-NsV_context_request_id
-p8471
-Vreq-e8619cc5-d8bd-4028-923d-4e00c1b3594b
-p8472
-sVevent_type
-p8473
-g8468
-sV_context_auth_token
-p8474
-VgAAAAABaH-BHmi0xZ8F_W1g5ZW6qzDLFsbbMBKtL4OMu5BHvR62oZ2EMKhbFia9wxarzCdtKDak95Qe0fOcEwwPVZLIaXCzG0uKzvM9_1AszHCsDf2g6jiGte2hJPIBQ-FNMri44srNkNqaZWQnZMQadXbwFzNfiig_1PEv4b_8Jf0lo3aKKbA4
-p8475
-sV_context_resource_uuid
-p8476
-NsV_context_tenant_name
-p8477
-Vservices
-p8478
-sV_context_user_id
-p8479
-V84faafdbb77b40c9a73047fdebb0ab45
-p8480
-sVpayload
-p8481
-(dp8482
-Vport
-p8483
-(dp8484
-Vallowed_address_pairs
-p8485
-(lp8486
-sVextra_dhcp_opts
-p8487
-(lp8488
-sVupdated_at
-p8489
-V2017-11-30T11:04:05
-p8490
-sVdevice_owner
-p8491
-Vcompute:nova
-p8492
-sVport_security_enabled
-p8493
-I01
-sVbinding:profile
-p8494
-(dp8495
-sVfixed_ips
-p8496
-(lp8497
-(dp8498
-Vsubnet_id
-p8499
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p8500
-sVip_address
-p8501
-V172.16.9.145
-p8502
-sasVid
-p8503
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p8504
-sVsecurity_groups
-p8505
-(lp8506
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p8507
-asVbinding:vif_details
-p8508
-(dp8509
-Vport_filter
-p8510
-I01
-sVovs_hybrid_plug
-p8511
-I01
-ssVbinding:vif_type
-p8512
-Vovs
-p8513
-sVmac_address
-p8514
-Vfa:16:3e:c1:a1:3f
-p8515
-sVstatus
-p8516
-VDOWN
-p8517
-sVbinding:host_id
-p8518
-Vmachine-E
-p8519
-sVdescription
-p8520
-V
-sVdevice_id
-p8521
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p8522
-sVname
-p8523
-VC-server_port-wh5difunbszp
-p8524
-sVadmin_state_up
-p8525
-I01
-sVnetwork_id
-p8526
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p8527
-sVdns_name
-p8528
-V
-sVcreated_at
-p8529
-V2017-11-30T11:04:03
-p8530
-sVbinding:vnic_type
-p8531
-Vnormal
-p8532
-sVtenant_id
-p8533
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8534
-sssV_context_show_deleted
-p8535
-I00
-sVpriority
-p8536
-VINFO
-p8537
-sV_context_is_admin
-p8538
-I01
-sV_context_project_domain
-p8539
-NsV_context_user
-p8540
-V84faafdbb77b40c9a73047fdebb0ab45
-p8541
-sVpublisher_id
-p8542
-Vnetwork.machine-A
-p8543
-sVmessage_id
-p8544
-V060975bc-9707-4142-ad01-05eb8f05b82e
-p8545
-sV_context_roles
-p8546
-(lp8547
-Vadmin
-p8548
-asVtimestamp
-p8549
-V2017-11-30 11:04:06.049566
-p8550
-sV_context_timestamp
-p8551
-V2017-11-30 11:04:05.805696
-p8552
-sV_unique_id
-p8553
-V38057bc25ad7460fbfdf76d535de0610
-p8554
-sV_context_tenant_id
-p8555
-V66fbf30f2dce4cef95d5248254dac9a5
-p8556
-sV_context_project_name
-p8557
-Vservices
-p8558
-sV_context_user_identity
-p8559
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p8560
-sV_context_tenant
-p8561
-V66fbf30f2dce4cef95d5248254dac9a5
-p8562
-sV_context_project_id
-p8563
-V66fbf30f2dce4cef95d5248254dac9a5
-p8564
-sV_context_read_only
-p8565
-I00
-sV_context_user_domain
-p8566
-NsV_context_user_name
-p8567
-Vneutron
-p8568
-stp8569
-a(F16.361668109893799
-Vcompute.instance.update
-p8570
-(dp8571
-V_context_domain
-p8572
-NsV_context_request_id
-p8573
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p8574
-sV_context_quota_class
-p8575
-NsVevent_type
-p8576
-g8570
-sV_context_service_catalog
-p8577
-(lp8578
-(dp8579
-Vendpoints
-p8580
-(lp8581
-(dp8582
-VadminURL
-p8583
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8584
-sVregion
-p8585
-VRegionOne
-p8586
-sVinternalURL
-p8587
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8588
-sVpublicURL
-p8589
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8590
-sasVtype
-p8591
-Vvolume
-p8592
-sVname
-p8593
-Vcinder
-p8594
-sa(dp8595
-g8580
-(lp8596
-(dp8597
-g8583
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8598
-sg8585
-VRegionOne
-p8599
-sg8587
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8600
-sg8589
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8601
-sasg8591
-Vvolumev2
-p8602
-sg8593
-Vcinderv2
-p8603
-sasV_context_auth_token
-p8604
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p8605
-sV_context_resource_uuid
-p8606
-NsV_context_user_id
-p8607
-Vef7a4f67379f41aba489a0b6d6a62094
-p8608
-sVpayload
-p8609
-(dp8610
-Vstate_description
-p8611
-V
-sVavailability_zone
-p8612
-Vnova
-p8613
-sVterminated_at
-p8614
-V
-sVephemeral_gb
-p8615
-I0
-sVinstance_type_id
-p8616
-I1
-sVbandwidth
-p8617
-(dp8618
-sVdeleted_at
-p8619
-V
-sVreservation_id
-p8620
-Vr-61su4ljd
-p8621
-sVmemory_mb
-p8622
-I4096
-sVdisplay_name
-p8623
-Vvm_test
-p8624
-sVhostname
-p8625
-Vvm-test
-p8626
-sVstate
-p8627
-Vactive
-p8628
-sVold_state
-p8629
-Vbuilding
-p8630
-sVprogress
-p8631
-V
-sVlaunched_at
-p8632
-V2017-11-30T11:04:08.000000
-p8633
-sVmetadata
-p8634
-(dp8635
-sVnode
-p8636
-Vmachine-B
-p8637
-sVramdisk_id
-p8638
-V
-sVaccess_ip_v6
-p8639
-NsVdisk_gb
-p8640
-I40
-sVaccess_ip_v4
-p8641
-NsVkernel_id
-p8642
-V
-sVhost
-p8643
-Vmachine-B
-p8644
-sVuser_id
-p8645
-Vef7a4f67379f41aba489a0b6d6a62094
-p8646
-sVimage_ref_url
-p8647
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p8648
-sVcell_name
-p8649
-V
-sVaudit_period_beginning
-p8650
-V2017-11-01T00:00:00.000000
-p8651
-sVroot_gb
-p8652
-I40
-sVtenant_id
-p8653
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8654
-sVcreated_at
-p8655
-V2017-11-30T11:03:57.000000
-p8656
-sVold_task_state
-p8657
-Vspawning
-p8658
-sVinstance_id
-p8659
-Va7115aef-929d-454e-9eba-eff685db7a15
-p8660
-sVinstance_type
-p8661
-Vm1.medium
-p8662
-sVvcpus
-p8663
-I2
-sVimage_meta
-p8664
-(dp8665
-Vmin_disk
-p8666
-V40
-p8667
-sVcontainer_format
-p8668
-Vbare
-p8669
-sVmin_ram
-p8670
-V0
-sVdisk_format
-p8671
-Vqcow2
-p8672
-sVbase_image_ref
-p8673
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p8674
-ssVarchitecture
-p8675
-NsVnew_task_state
-p8676
-NsVaudit_period_ending
-p8677
-V2017-11-30T11:04:08.184887
-p8678
-sVos_type
-p8679
-NsVinstance_flavor_id
-p8680
-V3
-ssV_context_show_deleted
-p8681
-I00
-sVpriority
-p8682
-VINFO
-p8683
-sV_context_is_admin
-p8684
-I01
-sV_context_project_domain
-p8685
-NsV_context_user
-p8686
-Vef7a4f67379f41aba489a0b6d6a62094
-p8687
-sVpublisher_id
-p8688
-Vcompute.machine-A
-p8689
-sVmessage_id
-p8690
-Vb9e2ea4e-4e3d-49f0-8258-f4e380f5e731
-p8691
-sV_context_remote_address
-p8692
-V172.16.0.5
-p8693
-sV_context_roles
-p8694
-(lp8695
-Vadmin
-p8696
-asVtimestamp
-p8697
-V2017-11-30 11:04:08.190438
-p8698
-sV_context_timestamp
-p8699
-V2017-11-30T11:03:56.348377
-p8700
-sV_unique_id
-p8701
-Vbd34684735774fe7ae494b4070587021
-p8702
-sV_context_project_name
-p8703
-Vapexlake
-p8704
-sV_context_read_deleted
-p8705
-Vno
-p8706
-sV_context_user_identity
-p8707
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8708
-sV_context_tenant
-p8709
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8710
-sV_context_instance_lock_checked
-p8711
-I00
-sV_context_project_id
-p8712
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8713
-sV_context_read_only
-p8714
-I00
-sV_context_user_domain
-p8715
-NsV_context_user_name
-p8716
-Violie
-p8717
-stp8718
-a(F16.37703800201416
-Vcompute.instance.create.end
-p8719
-(dp8720
-V_context_domain
-p8721
-NsV_context_request_id
-p8722
-Vreq-dbd6fa1f-3d62-424a-8d6a-7745756e8fa8
-p8723
-sV_context_quota_class
-p8724
-NsVevent_type
-p8725
-g8719
-sV_context_service_catalog
-p8726
-(lp8727
-(dp8728
-Vendpoints
-p8729
-(lp8730
-(dp8731
-VadminURL
-p8732
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8733
-sVregion
-p8734
-VRegionOne
-p8735
-sVinternalURL
-p8736
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8737
-sVpublicURL
-p8738
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8739
-sasVtype
-p8740
-Vvolume
-p8741
-sVname
-p8742
-Vcinder
-p8743
-sa(dp8744
-g8729
-(lp8745
-(dp8746
-g8732
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8747
-sg8734
-VRegionOne
-p8748
-sg8736
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8749
-sg8738
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8750
-sasg8740
-Vvolumev2
-p8751
-sg8742
-Vcinderv2
-p8752
-sasV_context_auth_token
-p8753
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p8754
-sV_context_resource_uuid
-p8755
-NsV_context_user_id
-p8756
-Vef7a4f67379f41aba489a0b6d6a62094
-p8757
-sVpayload
-p8758
-(dp8759
-Vstate_description
-p8760
-V
-sVavailability_zone
-p8761
-Vnova
-p8762
-sVterminated_at
-p8763
-V
-sVephemeral_gb
-p8764
-I0
-sVinstance_type_id
-p8765
-I1
-sVmessage
-p8766
-VSuccess
-p8767
-sVdeleted_at
-p8768
-V
-sVreservation_id
-p8769
-Vr-61su4ljd
-p8770
-sVmemory_mb
-p8771
-I4096
-sVdisplay_name
-p8772
-Vvm_test
-p8773
-sVfixed_ips
-p8774
-(lp8775
-(dp8776
-Vversion
-p8777
-I4
-sVvif_mac
-p8778
-Vfa:16:3e:e3:1c:a2
-p8779
-sVfloating_ips
-p8780
-(lp8781
-(dp8782
-Vmeta
-p8783
-(dp8784
-sg8740
-Vfloating
-p8785
-sg8777
-I4
-sVaddress
-p8786
-V10.2.32.192
-p8787
-sasVlabel
-p8788
-Vinternal
-p8789
-sg8783
-(dp8790
-sg8786
-V172.16.9.143
-p8791
-sg8740
-Vfixed
-p8792
-sasVhostname
-p8793
-Vvm-test
-p8794
-sVstate
-p8795
-Vactive
-p8796
-sVprogress
-p8797
-V
-sVlaunched_at
-p8798
-V2017-11-30T11:04:08.094610
-p8799
-sVmetadata
-p8800
-(dp8801
-sVnode
-p8802
-Vmachine-B
-p8803
-sVramdisk_id
-p8804
-V
-sVaccess_ip_v6
-p8805
-NsVdisk_gb
-p8806
-I40
-sVaccess_ip_v4
-p8807
-NsVkernel_id
-p8808
-V
-sVhost
-p8809
-Vmachine-B
-p8810
-sVuser_id
-p8811
-Vef7a4f67379f41aba489a0b6d6a62094
-p8812
-sVimage_ref_url
-p8813
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p8814
-sVcell_name
-p8815
-V
-sVroot_gb
-p8816
-I40
-sVtenant_id
-p8817
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8818
-sVcreated_at
-p8819
-V2017-11-30T11:03:57.000000
-p8820
-sVinstance_id
-p8821
-Va7115aef-929d-454e-9eba-eff685db7a15
-p8822
-sVinstance_type
-p8823
-Vm1.medium
-p8824
-sVvcpus
-p8825
-I2
-sVimage_meta
-p8826
-(dp8827
-Vmin_disk
-p8828
-V40
-p8829
-sVcontainer_format
-p8830
-Vbare
-p8831
-sVmin_ram
-p8832
-V0
-sVdisk_format
-p8833
-Vqcow2
-p8834
-sVbase_image_ref
-p8835
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p8836
-ssVarchitecture
-p8837
-NsVos_type
-p8838
-NsVinstance_flavor_id
-p8839
-V3
-ssV_context_show_deleted
-p8840
-I00
-sVpriority
-p8841
-VINFO
-p8842
-sV_context_is_admin
-p8843
-I01
-sV_context_project_domain
-p8844
-NsV_context_user
-p8845
-Vef7a4f67379f41aba489a0b6d6a62094
-p8846
-sVpublisher_id
-p8847
-Vcompute.machine-B
-p8848
-sVmessage_id
-p8849
-Vb9840cd3-c629-40d3-923e-1009d0f7e105
-p8850
-sV_context_remote_address
-p8851
-V172.16.0.5
-p8852
-sV_context_roles
-p8853
-(lp8854
-Vadmin
-p8855
-asVtimestamp
-p8856
-V2017-11-30 11:04:08.206735
-p8857
-sV_context_timestamp
-p8858
-V2017-11-30T11:03:56.348377
-p8859
-sV_unique_id
-p8860
-Veca49907ea3c41d3ba60bdda8903457a
-p8861
-sV_context_project_name
-p8862
-Vapexlake
-p8863
-sV_context_read_deleted
-p8864
-Vno
-p8865
-sV_context_user_identity
-p8866
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8867
-sV_context_tenant
-p8868
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8869
-sV_context_instance_lock_checked
-p8870
-I00
-sV_context_project_id
-p8871
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8872
-sV_context_read_only
-p8873
-I00
-sV_context_user_domain
-p8874
-NsV_context_user_name
-p8875
-Violie
-p8876
-stp8877
-a(F17.794902086257935
-Vorchestration.stack.create.end
-p8878
-(dp8879
-V_context_request_id
-p8880
-Vreq-1988713e-2198-4488-970f-379f0634b9ac
-p8881
-sVevent_type
-p8882
-g8878
-sV_context_region_name
-p8883
-NsV_context_auth_token
-p8884
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p8885
-sV_context_user_id
-p8886
-Vef7a4f67379f41aba489a0b6d6a62094
-p8887
-sVpayload
-p8888
-(dp8889
-Vusername
-p8890
-NsVstate_reason
-p8891
-VStack CREATE completed successfully
-p8892
-sVuser_id
-p8893
-NsVuser_identity
-p8894
-Vef7a4f67379f41aba489a0b6d6a62094
-p8895
-sVstack_name
-p8896
-VA
-sVtenant_id
-p8897
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8898
-sVstack_identity
-p8899
-V84a34c44-0667-45d8-a9a0-15f98f6af026
-p8900
-sVcreate_at
-p8901
-V2017-11-30T11:03:51.641706
-p8902
-sVstate
-p8903
-VCREATE_COMPLETE
-p8904
-ssV_context_username
-p8905
-NsV_context_show_deleted
-p8906
-I00
-sV_context_trust_id
-p8907
-NsVpriority
-p8908
-VINFO
-p8909
-sV_context_is_admin
-p8910
-I01
-sV_context_auth_token_info
-p8911
-(dp8912
-Vtoken
-p8913
-(dp8914
-Vmethods
-p8915
-(lp8916
-Vpassword
-p8917
-asVroles
-p8918
-(lp8919
-(dp8920
-Vid
-p8921
-Vd475171bf8304e06a74b1add560b1f28
-p8922
-sVname
-p8923
-Vadmin
-p8924
-sasVauth_token
-p8925
-VgAAAAABaH-WXlADvC-vqzCfjYdALjn4p2iyd7tdQoqUjg6w451tvj72hgMWTZYkjRwXZF7WW9CT7zAp45CgA6UmssKYozh4-ArsDWYFizSywCggURFPt7NXoUb4ek_to2-4VcfU_AXwIxZsXpYoGrH5XmIi3lxs3weMmiiVySKfZMKkWd5zNr3g
-p8926
-sVexpires_at
-p8927
-V2017-11-30T12:03:51.000000Z
-p8928
-sVproject
-p8929
-(dp8930
-Vdomain
-p8931
-(dp8932
-g8921
-Vdefault
-p8933
-sg8923
-VDefault
-p8934
-ssg8921
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8935
-sg8923
-Vapexlake
-p8936
-ssVcatalog
-p8937
-(lp8938
-(dp8939
-Vendpoints
-p8940
-(lp8941
-(dp8942
-Vurl
-p8943
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p8944
-sVinterface
-p8945
-Vpublic
-p8946
-sVregion
-p8947
-VRegionOne
-p8948
-sVregion_id
-p8949
-VRegionOne
-p8950
-sg8921
-V13359d68397c4732b5d455941ac95989
-p8951
-sa(dp8952
-g8943
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p8953
-sg8945
-Vinternal
-p8954
-sg8947
-VRegionOne
-p8955
-sg8949
-VRegionOne
-p8956
-sg8921
-V50aeae6c5d034dcb80871bdac7391209
-p8957
-sa(dp8958
-g8943
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p8959
-sg8945
-Vadmin
-p8960
-sg8947
-VRegionOne
-p8961
-sg8949
-VRegionOne
-p8962
-sg8921
-V93b06f780b224cbd9b514c2041d3db63
-p8963
-sasVtype
-p8964
-Vvolumev3
-p8965
-sg8921
-V00a63293a3154089a4c80b60b4aa9429
-p8966
-sg8923
-Vcinderv3
-p8967
-sa(dp8968
-g8940
-(lp8969
-(dp8970
-g8943
-Vhttp://172.16.0.5:8000/v1
-p8971
-sg8945
-Vadmin
-p8972
-sg8947
-VRegionOne
-p8973
-sg8949
-VRegionOne
-p8974
-sg8921
-V24acffb5d9154df4981db7424b7669bd
-p8975
-sa(dp8976
-g8943
-Vhttp://172.18.0.8:8000/v1
-p8977
-sg8945
-Vpublic
-p8978
-sg8947
-VRegionOne
-p8979
-sg8949
-VRegionOne
-p8980
-sg8921
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p8981
-sa(dp8982
-g8943
-Vhttp://172.16.0.5:8000/v1
-p8983
-sg8945
-Vinternal
-p8984
-sg8947
-VRegionOne
-p8985
-sg8949
-VRegionOne
-p8986
-sg8921
-V679262173a714d76a078051b95f8c969
-p8987
-sasg8964
-Vcloudformation
-p8988
-sg8921
-V245169ccae564a7db06ca002f1553b51
-p8989
-sg8923
-Vheat-cfn
-p8990
-sa(dp8991
-g8940
-(lp8992
-(dp8993
-g8943
-Vhttp://172.18.0.8:8080
-p8994
-sg8945
-Vpublic
-p8995
-sg8947
-VRegionOne
-p8996
-sg8949
-VRegionOne
-p8997
-sg8921
-V04a6ef3db6b046b1893ed45a3f906f6c
-p8998
-sa(dp8999
-g8943
-Vhttp://172.16.0.5:8080
-p9000
-sg8945
-Vinternal
-p9001
-sg8947
-VRegionOne
-p9002
-sg8949
-VRegionOne
-p9003
-sg8921
-V3e30684c9f74492b8ca9a64dd04261e6
-p9004
-sa(dp9005
-g8943
-Vhttp://172.16.0.5:8080
-p9006
-sg8945
-Vadmin
-p9007
-sg8947
-VRegionOne
-p9008
-sg8949
-VRegionOne
-p9009
-sg8921
-Vc5384b55cd7a441582f151c6b2807745
-p9010
-sasg8964
-Vs3
-p9011
-sg8921
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p9012
-sg8923
-Vswift_s3
-p9013
-sa(dp9014
-g8940
-(lp9015
-(dp9016
-g8943
-Vhttp://172.16.0.5:9696
-p9017
-sg8945
-Vadmin
-p9018
-sg8947
-VRegionOne
-p9019
-sg8949
-VRegionOne
-p9020
-sg8921
-V38b78b2c00264f59a4ade9392f88132b
-p9021
-sa(dp9022
-g8943
-Vhttp://172.18.0.8:9696
-p9023
-sg8945
-Vpublic
-p9024
-sg8947
-VRegionOne
-p9025
-sg8949
-VRegionOne
-p9026
-sg8921
-Vb5d0f72fbf674f84adf8929341e45586
-p9027
-sa(dp9028
-g8943
-Vhttp://172.16.0.5:9696
-p9029
-sg8945
-Vinternal
-p9030
-sg8947
-VRegionOne
-p9031
-sg8949
-VRegionOne
-p9032
-sg8921
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p9033
-sasg8964
-Vnetwork
-p9034
-sg8921
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p9035
-sg8923
-Vneutron
-p9036
-sa(dp9037
-g8940
-(lp9038
-(dp9039
-g8943
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9040
-sg8945
-Vinternal
-p9041
-sg8947
-VRegionOne
-p9042
-sg8949
-VRegionOne
-p9043
-sg8921
-V7c60744a22724044a92928bc2fa9e422
-p9044
-sa(dp9045
-g8943
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9046
-sg8945
-Vadmin
-p9047
-sg8947
-VRegionOne
-p9048
-sg8949
-VRegionOne
-p9049
-sg8921
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p9050
-sa(dp9051
-g8943
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9052
-sg8945
-Vpublic
-p9053
-sg8947
-VRegionOne
-p9054
-sg8949
-VRegionOne
-p9055
-sg8921
-Vde47d994bdc147bdb824474ea699a77a
-p9056
-sasg8964
-Vorchestration
-p9057
-sg8921
-V65a72244f7c54382aeebf5dfdeab8140
-p9058
-sg8923
-Vheat
-p9059
-sa(dp9060
-g8940
-(lp9061
-(dp9062
-g8943
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9063
-sg8945
-Vinternal
-p9064
-sg8947
-VRegionOne
-p9065
-sg8949
-VRegionOne
-p9066
-sg8921
-V3a25e85ecaa44b678c3721c2d3d39b38
-p9067
-sa(dp9068
-g8943
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9069
-sg8945
-Vadmin
-p9070
-sg8947
-VRegionOne
-p9071
-sg8949
-VRegionOne
-p9072
-sg8921
-V68c763474c3d4aa28c4ee0e0249998eb
-p9073
-sa(dp9074
-g8943
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9075
-sg8945
-Vpublic
-p9076
-sg8947
-VRegionOne
-p9077
-sg8949
-VRegionOne
-p9078
-sg8921
-Ve0c861373e94468db521d5a8793d33d1
-p9079
-sasg8964
-Vvolume
-p9080
-sg8921
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p9081
-sg8923
-Vcinder
-p9082
-sa(dp9083
-g8940
-(lp9084
-(dp9085
-g8943
-Vhttp://172.18.0.8:5000/v2.0
-p9086
-sg8945
-Vpublic
-p9087
-sg8947
-VRegionOne
-p9088
-sg8949
-VRegionOne
-p9089
-sg8921
-V6aa35bc15a35447db58ec5b67087f96a
-p9090
-sa(dp9091
-g8943
-Vhttp://172.16.0.5:5000/v2.0
-p9092
-sg8945
-Vinternal
-p9093
-sg8947
-VRegionOne
-p9094
-sg8949
-VRegionOne
-p9095
-sg8921
-V6b4742f26b694b93bdbcb37304d22f69
-p9096
-sa(dp9097
-g8943
-Vhttp://172.16.0.5:35357/v2.0
-p9098
-sg8945
-Vadmin
-p9099
-sg8947
-VRegionOne
-p9100
-sg8949
-VRegionOne
-p9101
-sg8921
-Vadc120ea606644a299a3c91a7ceeb8c4
-p9102
-sasg8964
-Videntity
-p9103
-sg8921
-V9f95de9f4efc4730b4dd90354894e1dc
-p9104
-sg8923
-Vkeystone
-p9105
-sa(dp9106
-g8940
-(lp9107
-(dp9108
-g8943
-Vhttp://172.16.0.5:9292
-p9109
-sg8945
-Vadmin
-p9110
-sg8947
-VRegionOne
-p9111
-sg8949
-VRegionOne
-p9112
-sg8921
-V049519f829be4e7fb5f44ae9f470efdf
-p9113
-sa(dp9114
-g8943
-Vhttp://172.18.0.8:9292
-p9115
-sg8945
-Vpublic
-p9116
-sg8947
-VRegionOne
-p9117
-sg8949
-VRegionOne
-p9118
-sg8921
-V1baebbbf35744192b335f4f293d1a9d8
-p9119
-sa(dp9120
-g8943
-Vhttp://172.16.0.5:9292
-p9121
-sg8945
-Vinternal
-p9122
-sg8947
-VRegionOne
-p9123
-sg8949
-VRegionOne
-p9124
-sg8921
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p9125
-sasg8964
-Vimage
-p9126
-sg8921
-Va39ec0213acc45ceb59346299e78d6c0
-p9127
-sg8923
-Vglance
-p9128
-sa(dp9129
-g8940
-(lp9130
-(dp9131
-g8943
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9132
-sg8945
-Vinternal
-p9133
-sg8947
-VRegionOne
-p9134
-sg8949
-VRegionOne
-p9135
-sg8921
-V2cd9d66e95484830a9006177e301aa57
-p9136
-sa(dp9137
-g8943
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9138
-sg8945
-Vpublic
-p9139
-sg8947
-VRegionOne
-p9140
-sg8949
-VRegionOne
-p9141
-sg8921
-Vbe2d979150a2401b9e7d5c365372d093
-p9142
-sa(dp9143
-g8943
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9144
-sg8945
-Vadmin
-p9145
-sg8947
-VRegionOne
-p9146
-sg8949
-VRegionOne
-p9147
-sg8921
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p9148
-sasg8964
-Vcompute_legacy
-p9149
-sg8921
-Va4dd95e3fde340468f8c1d7df9a853d0
-p9150
-sg8923
-Vcompute_legacy
-p9151
-sa(dp9152
-g8940
-(lp9153
-(dp9154
-g8943
-Vhttp://172.16.0.5:8774/v2.1
-p9155
-sg8945
-Vadmin
-p9156
-sg8947
-VRegionOne
-p9157
-sg8949
-VRegionOne
-p9158
-sg8921
-V0307d2c32dd54839aa5bc39746eeb186
-p9159
-sa(dp9160
-g8943
-Vhttp://172.18.0.8:8774/v2.1
-p9161
-sg8945
-Vpublic
-p9162
-sg8947
-VRegionOne
-p9163
-sg8949
-VRegionOne
-p9164
-sg8921
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p9165
-sa(dp9166
-g8943
-Vhttp://172.16.0.5:8774/v2.1
-p9167
-sg8945
-Vinternal
-p9168
-sg8947
-VRegionOne
-p9169
-sg8949
-VRegionOne
-p9170
-sg8921
-Vdb005ab592334fc599c142cf861e754f
-p9171
-sasg8964
-Vcompute
-p9172
-sg8921
-Vc165d40b8c3849bcb6067a3df2540c62
-p9173
-sg8923
-Vnova
-p9174
-sa(dp9175
-g8940
-(lp9176
-(dp9177
-g8943
-Vhttp://172.16.0.5:8080/swift/v1
-p9178
-sg8945
-Vadmin
-p9179
-sg8947
-VRegionOne
-p9180
-sg8949
-VRegionOne
-p9181
-sg8921
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p9182
-sa(dp9183
-g8943
-Vhttp://172.16.0.5:8080/swift/v1
-p9184
-sg8945
-Vinternal
-p9185
-sg8947
-VRegionOne
-p9186
-sg8949
-VRegionOne
-p9187
-sg8921
-V764118d3a33444ac980632d281acf4a7
-p9188
-sa(dp9189
-g8943
-Vhttp://172.18.0.8:8080/swift/v1
-p9190
-sg8945
-Vpublic
-p9191
-sg8947
-VRegionOne
-p9192
-sg8949
-VRegionOne
-p9193
-sg8921
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p9194
-sasg8964
-Vobject-store
-p9195
-sg8921
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p9196
-sg8923
-Vswift
-p9197
-sa(dp9198
-g8940
-(lp9199
-(dp9200
-g8943
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9201
-sg8945
-Vinternal
-p9202
-sg8947
-VRegionOne
-p9203
-sg8949
-VRegionOne
-p9204
-sg8921
-V61ea745c91ab4eb59464679931219024
-p9205
-sa(dp9206
-g8943
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9207
-sg8945
-Vadmin
-p9208
-sg8947
-VRegionOne
-p9209
-sg8949
-VRegionOne
-p9210
-sg8921
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p9211
-sa(dp9212
-g8943
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9213
-sg8945
-Vpublic
-p9214
-sg8947
-VRegionOne
-p9215
-sg8949
-VRegionOne
-p9216
-sg8921
-V7155772851884dc6954c7345d350796f
-p9217
-sasg8964
-Vvolumev2
-p9218
-sg8921
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p9219
-sg8923
-Vcinderv2
-p9220
-sa(dp9221
-g8940
-(lp9222
-(dp9223
-g8943
-Vhttp://172.18.0.8:9494
-p9224
-sg8945
-Vpublic
-p9225
-sg8947
-VRegionOne
-p9226
-sg8949
-VRegionOne
-p9227
-sg8921
-V43a202e889694d51a3b11899c252a8a9
-p9228
-sa(dp9229
-g8943
-Vhttp://172.16.0.5:9494
-p9230
-sg8945
-Vadmin
-p9231
-sg8947
-VRegionOne
-p9232
-sg8949
-VRegionOne
-p9233
-sg8921
-Vfa3c9de06e854542b236aa24b53e19a1
-p9234
-sa(dp9235
-g8943
-Vhttp://172.16.0.5:9494
-p9236
-sg8945
-Vinternal
-p9237
-sg8947
-VRegionOne
-p9238
-sg8949
-VRegionOne
-p9239
-sg8921
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p9240
-sasg8964
-Vartifact
-p9241
-sg8921
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p9242
-sg8923
-Vglare
-p9243
-sasVversion
-p9244
-Vv3
-p9245
-sVuser
-p9246
-(dp9247
-g8931
-(dp9248
-g8921
-Vdefault
-p9249
-sg8923
-VDefault
-p9250
-ssg8921
-Vef7a4f67379f41aba489a0b6d6a62094
-p9251
-sg8923
-Violie
-p9252
-ssVaudit_ids
-p9253
-(lp9254
-VpVyJXCiQSYqOyodMWo2JnQ
-p9255
-asVissued_at
-p9256
-V2017-11-30T11:03:51.000000Z
-p9257
-sssV_context_user
-p9258
-NsVpublisher_id
-p9259
-Vorchestration.machine-A
-p9260
-sVmessage_id
-p9261
-V938b15c2-66de-4f64-a4a1-0e4b7e175f41
-p9262
-sV_context_roles
-p9263
-(lp9264
-Vadmin
-p9265
-asV_context_auth_url
-p9266
-Vhttp://172.16.0.5:35357/v3/
-p9267
-sVtimestamp
-p9268
-V2017-11-30 11:04:09.624219
-p9269
-sV_unique_id
-p9270
-V7443e0ee570b41f09cab8d0fe6301a6e
-p9271
-sV_context_tenant_id
-p9272
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9273
-sV_context_user_domain_id
-p9274
-Vdefault
-p9275
-sV_context_password
-p9276
-NsV_context_trustor_user_id
-p9277
-NsV_context_project_domain_id
-p9278
-Vdefault
-p9279
-sV_context_aws_creds
-p9280
-NsV_context_tenant
-p9281
-Vapexlake
-p9282
-sV_context_user_identity
-p9283
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p9284
-stp9285
-a(F21.48681116104126
-Vcompute.instance.update
-p9286
-(dp9287
-V_context_domain
-p9288
-NsV_context_request_id
-p9289
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p9290
-sV_context_quota_class
-p9291
-NsVevent_type
-p9292
-g9286
-sV_context_service_catalog
-p9293
-(lp9294
-(dp9295
-Vendpoints
-p9296
-(lp9297
-(dp9298
-VadminURL
-p9299
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9300
-sVregion
-p9301
-VRegionOne
-p9302
-sVinternalURL
-p9303
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9304
-sVpublicURL
-p9305
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9306
-sasVtype
-p9307
-Vvolume
-p9308
-sVname
-p9309
-Vcinder
-p9310
-sa(dp9311
-g9296
-(lp9312
-(dp9313
-g9299
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9314
-sg9301
-VRegionOne
-p9315
-sg9303
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9316
-sg9305
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9317
-sasg9307
-Vvolumev2
-p9318
-sg9309
-Vcinderv2
-p9319
-sasV_context_auth_token
-p9320
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p9321
-sV_context_resource_uuid
-p9322
-NsV_context_user_id
-p9323
-Vef7a4f67379f41aba489a0b6d6a62094
-p9324
-sVpayload
-p9325
-(dp9326
-Vstate_description
-p9327
-V
-sVavailability_zone
-p9328
-Vnova
-p9329
-sVterminated_at
-p9330
-V
-sVephemeral_gb
-p9331
-I0
-sVinstance_type_id
-p9332
-I1
-sVbandwidth
-p9333
-(dp9334
-sVdeleted_at
-p9335
-V
-sVreservation_id
-p9336
-Vr-4jmm1xbm
-p9337
-sVmemory_mb
-p9338
-I4096
-sVdisplay_name
-p9339
-Vvm_test
-p9340
-sVhostname
-p9341
-Vvm-test
-p9342
-sVstate
-p9343
-Vactive
-p9344
-sVold_state
-p9345
-Vbuilding
-p9346
-sVprogress
-p9347
-V
-sVlaunched_at
-p9348
-V2017-11-30T11:04:13.000000
-p9349
-sVmetadata
-p9350
-(dp9351
-sVnode
-p9352
-Vmachine-C
-p9353
-sVramdisk_id
-p9354
-V
-sVaccess_ip_v6
-p9355
-NsVdisk_gb
-p9356
-I40
-sVaccess_ip_v4
-p9357
-NsVkernel_id
-p9358
-V
-sVhost
-p9359
-Vmachine-C
-p9360
-sVuser_id
-p9361
-Vef7a4f67379f41aba489a0b6d6a62094
-p9362
-sVimage_ref_url
-p9363
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p9364
-sVcell_name
-p9365
-V
-sVaudit_period_beginning
-p9366
-V2017-11-01T00:00:00.000000
-p9367
-sVroot_gb
-p9368
-I40
-sVtenant_id
-p9369
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9370
-sVcreated_at
-p9371
-V2017-11-30T11:03:59.000000
-p9372
-sVold_task_state
-p9373
-Vspawning
-p9374
-sVinstance_id
-p9375
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p9376
-sVinstance_type
-p9377
-Vm1.medium
-p9378
-sVvcpus
-p9379
-I2
-sVimage_meta
-p9380
-(dp9381
-Vmin_disk
-p9382
-V40
-p9383
-sVcontainer_format
-p9384
-Vbare
-p9385
-sVmin_ram
-p9386
-V0
-sVdisk_format
-p9387
-Vqcow2
-p9388
-sVbase_image_ref
-p9389
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p9390
-ssVarchitecture
-p9391
-NsVnew_task_state
-p9392
-NsVaudit_period_ending
-p9393
-V2017-11-30T11:04:13.312245
-p9394
-sVos_type
-p9395
-NsVinstance_flavor_id
-p9396
-V3
-ssV_context_show_deleted
-p9397
-I00
-sVpriority
-p9398
-VINFO
-p9399
-sV_context_is_admin
-p9400
-I01
-sV_context_project_domain
-p9401
-NsV_context_user
-p9402
-Vef7a4f67379f41aba489a0b6d6a62094
-p9403
-sVpublisher_id
-p9404
-Vcompute.machine-A
-p9405
-sVmessage_id
-p9406
-V3a690065-ae41-495e-a9ca-a5ce8b96012c
-p9407
-sV_context_remote_address
-p9408
-V172.16.0.5
-p9409
-sV_context_roles
-p9410
-(lp9411
-Vadmin
-p9412
-asVtimestamp
-p9413
-V2017-11-30 11:04:13.316470
-p9414
-sV_context_timestamp
-p9415
-V2017-11-30T11:03:58.557388
-p9416
-sV_unique_id
-p9417
-V64c3cdc89ed84f98b13f15480e53bfbc
-p9418
-sV_context_project_name
-p9419
-Vapexlake
-p9420
-sV_context_read_deleted
-p9421
-Vno
-p9422
-sV_context_user_identity
-p9423
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p9424
-sV_context_tenant
-p9425
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9426
-sV_context_instance_lock_checked
-p9427
-I00
-sV_context_project_id
-p9428
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9429
-sV_context_read_only
-p9430
-I00
-sV_context_user_domain
-p9431
-NsV_context_user_name
-p9432
-Violie
-p9433
-stp9434
-a(F21.511273145675659
-Vcompute.instance.create.end
-p9435
-(dp9436
-V_context_domain
-p9437
-NsV_context_request_id
-p9438
-Vreq-ee634947-3cd5-4cae-a4c0-a5bf15f9c9b8
-p9439
-sV_context_quota_class
-p9440
-NsVevent_type
-p9441
-g9435
-sV_context_service_catalog
-p9442
-(lp9443
-(dp9444
-Vendpoints
-p9445
-(lp9446
-(dp9447
-VadminURL
-p9448
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9449
-sVregion
-p9450
-VRegionOne
-p9451
-sVinternalURL
-p9452
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9453
-sVpublicURL
-p9454
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9455
-sasVtype
-p9456
-Vvolume
-p9457
-sVname
-p9458
-Vcinder
-p9459
-sa(dp9460
-g9445
-(lp9461
-(dp9462
-g9448
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9463
-sg9450
-VRegionOne
-p9464
-sg9452
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9465
-sg9454
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9466
-sasg9456
-Vvolumev2
-p9467
-sg9458
-Vcinderv2
-p9468
-sasV_context_auth_token
-p9469
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p9470
-sV_context_resource_uuid
-p9471
-NsV_context_user_id
-p9472
-Vef7a4f67379f41aba489a0b6d6a62094
-p9473
-sVpayload
-p9474
-(dp9475
-Vstate_description
-p9476
-V
-sVavailability_zone
-p9477
-Vnova
-p9478
-sVterminated_at
-p9479
-V
-sVephemeral_gb
-p9480
-I0
-sVinstance_type_id
-p9481
-I1
-sVmessage
-p9482
-VSuccess
-p9483
-sVdeleted_at
-p9484
-V
-sVreservation_id
-p9485
-Vr-4jmm1xbm
-p9486
-sVmemory_mb
-p9487
-I4096
-sVdisplay_name
-p9488
-Vvm_test
-p9489
-sVfixed_ips
-p9490
-(lp9491
-(dp9492
-Vversion
-p9493
-I4
-sVvif_mac
-p9494
-Vfa:16:3e:e7:da:1b
-p9495
-sVfloating_ips
-p9496
-(lp9497
-(dp9498
-Vmeta
-p9499
-(dp9500
-sg9456
-Vfloating
-p9501
-sg9493
-I4
-sVaddress
-p9502
-V10.2.32.193
-p9503
-sasVlabel
-p9504
-Vinternal
-p9505
-sg9499
-(dp9506
-sg9502
-V172.16.9.144
-p9507
-sg9456
-Vfixed
-p9508
-sasVhostname
-p9509
-Vvm-test
-p9510
-sVstate
-p9511
-Vactive
-p9512
-sVprogress
-p9513
-V
-sVlaunched_at
-p9514
-V2017-11-30T11:04:13.235347
-p9515
-sVmetadata
-p9516
-(dp9517
-sVnode
-p9518
-Vmachine-C
-p9519
-sVramdisk_id
-p9520
-V
-sVaccess_ip_v6
-p9521
-NsVdisk_gb
-p9522
-I40
-sVaccess_ip_v4
-p9523
-NsVkernel_id
-p9524
-V
-sVhost
-p9525
-Vmachine-C
-p9526
-sVuser_id
-p9527
-Vef7a4f67379f41aba489a0b6d6a62094
-p9528
-sVimage_ref_url
-p9529
-Vhttp://172.16.0.7:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p9530
-sVcell_name
-p9531
-V
-sVroot_gb
-p9532
-I40
-sVtenant_id
-p9533
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9534
-sVcreated_at
-p9535
-V2017-11-30T11:03:59.000000
-p9536
-sVinstance_id
-p9537
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p9538
-sVinstance_type
-p9539
-Vm1.medium
-p9540
-sVvcpus
-p9541
-I2
-sVimage_meta
-p9542
-(dp9543
-Vmin_disk
-p9544
-V40
-p9545
-sVcontainer_format
-p9546
-Vbare
-p9547
-sVmin_ram
-p9548
-V0
-sVdisk_format
-p9549
-Vqcow2
-p9550
-sVbase_image_ref
-p9551
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p9552
-ssVarchitecture
-p9553
-NsVos_type
-p9554
-NsVinstance_flavor_id
-p9555
-V3
-ssV_context_show_deleted
-p9556
-I00
-sVpriority
-p9557
-VINFO
-p9558
-sV_context_is_admin
-p9559
-I01
-sV_context_project_domain
-p9560
-NsV_context_user
-p9561
-Vef7a4f67379f41aba489a0b6d6a62094
-p9562
-sVpublisher_id
-p9563
-Vcompute.machine-C
-p9564
-sVmessage_id
-p9565
-V6a87fb7b-82fa-4c22-8cfc-19d11a6c4204
-p9566
-sV_context_remote_address
-p9567
-V172.16.0.5
-p9568
-sV_context_roles
-p9569
-(lp9570
-Vadmin
-p9571
-asVtimestamp
-p9572
-V2017-11-30 11:04:13.340615
-p9573
-sV_context_timestamp
-p9574
-V2017-11-30T11:03:58.557388
-p9575
-sV_unique_id
-p9576
-V73fcf3ab7b5c49269fe6d6f5a1426bef
-p9577
-sV_context_project_name
-p9578
-Vapexlake
-p9579
-sV_context_read_deleted
-p9580
-Vno
-p9581
-sV_context_user_identity
-p9582
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p9583
-sV_context_tenant
-p9584
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9585
-sV_context_instance_lock_checked
-p9586
-I00
-sV_context_project_id
-p9587
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9588
-sV_context_read_only
-p9589
-I00
-sV_context_user_domain
-p9590
-NsV_context_user_name
-p9591
-Violie
-p9592
-stp9593
-a(F22.610975027084351
-Vorchestration.stack.create.end
-p9594
-(dp9595
-V_context_request_id
-p9596
-Vreq-dc6f2ea5-a97d-4d07-9232-a862062cc609
-p9597
-sVevent_type
-p9598
-g9594
-sV_context_region_name
-p9599
-NsV_context_auth_token
-p9600
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p9601
-sV_context_user_id
-p9602
-Vef7a4f67379f41aba489a0b6d6a62094
-p9603
-sVpayload
-p9604
-(dp9605
-Vusername
-p9606
-NsVstate_reason
-p9607
-VStack CREATE completed successfully
-p9608
-sVuser_id
-p9609
-NsVuser_identity
-p9610
-Vef7a4f67379f41aba489a0b6d6a62094
-p9611
-sVstack_name
-p9612
-VB
-sVtenant_id
-p9613
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9614
-sVstack_identity
-p9615
-V4166ecad-7e96-49c6-86e3-f0bab0e0bfec
-p9616
-sVcreate_at
-p9617
-V2017-11-30T11:03:55.987068
-p9618
-sVstate
-p9619
-VCREATE_COMPLETE
-p9620
-ssV_context_username
-p9621
-NsV_context_show_deleted
-p9622
-I00
-sV_context_trust_id
-p9623
-NsVpriority
-p9624
-VINFO
-p9625
-sV_context_is_admin
-p9626
-I01
-sV_context_auth_token_info
-p9627
-(dp9628
-Vtoken
-p9629
-(dp9630
-Vmethods
-p9631
-(lp9632
-Vpassword
-p9633
-asVroles
-p9634
-(lp9635
-(dp9636
-Vid
-p9637
-Vd475171bf8304e06a74b1add560b1f28
-p9638
-sVname
-p9639
-Vadmin
-p9640
-sasVauth_token
-p9641
-VgAAAAABaH-WbLlQeNvukJ-n0qxUPgy06iOLGvp-VqHkbviRQJbfbZxWyKdew1lYJTBw8-aBOYH7jyxhVAPck3Vu7l7NYBw26MwoFEwlTXi9Dw2StvTMbyKimD6xi38sMWp_dTbrD4ewK2zMgUv7qhayIWADcU1ouhMwuI_39u4cXPvtTFql8YW0
-p9642
-sVexpires_at
-p9643
-V2017-11-30T12:03:55.000000Z
-p9644
-sVproject
-p9645
-(dp9646
-Vdomain
-p9647
-(dp9648
-g9637
-Vdefault
-p9649
-sg9639
-VDefault
-p9650
-ssg9637
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9651
-sg9639
-Vapexlake
-p9652
-ssVcatalog
-p9653
-(lp9654
-(dp9655
-Vendpoints
-p9656
-(lp9657
-(dp9658
-Vurl
-p9659
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p9660
-sVinterface
-p9661
-Vpublic
-p9662
-sVregion
-p9663
-VRegionOne
-p9664
-sVregion_id
-p9665
-VRegionOne
-p9666
-sg9637
-V13359d68397c4732b5d455941ac95989
-p9667
-sa(dp9668
-g9659
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p9669
-sg9661
-Vinternal
-p9670
-sg9663
-VRegionOne
-p9671
-sg9665
-VRegionOne
-p9672
-sg9637
-V50aeae6c5d034dcb80871bdac7391209
-p9673
-sa(dp9674
-g9659
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p9675
-sg9661
-Vadmin
-p9676
-sg9663
-VRegionOne
-p9677
-sg9665
-VRegionOne
-p9678
-sg9637
-V93b06f780b224cbd9b514c2041d3db63
-p9679
-sasVtype
-p9680
-Vvolumev3
-p9681
-sg9637
-V00a63293a3154089a4c80b60b4aa9429
-p9682
-sg9639
-Vcinderv3
-p9683
-sa(dp9684
-g9656
-(lp9685
-(dp9686
-g9659
-Vhttp://172.16.0.5:8000/v1
-p9687
-sg9661
-Vadmin
-p9688
-sg9663
-VRegionOne
-p9689
-sg9665
-VRegionOne
-p9690
-sg9637
-V24acffb5d9154df4981db7424b7669bd
-p9691
-sa(dp9692
-g9659
-Vhttp://172.18.0.8:8000/v1
-p9693
-sg9661
-Vpublic
-p9694
-sg9663
-VRegionOne
-p9695
-sg9665
-VRegionOne
-p9696
-sg9637
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p9697
-sa(dp9698
-g9659
-Vhttp://172.16.0.5:8000/v1
-p9699
-sg9661
-Vinternal
-p9700
-sg9663
-VRegionOne
-p9701
-sg9665
-VRegionOne
-p9702
-sg9637
-V679262173a714d76a078051b95f8c969
-p9703
-sasg9680
-Vcloudformation
-p9704
-sg9637
-V245169ccae564a7db06ca002f1553b51
-p9705
-sg9639
-Vheat-cfn
-p9706
-sa(dp9707
-g9656
-(lp9708
-(dp9709
-g9659
-Vhttp://172.18.0.8:8080
-p9710
-sg9661
-Vpublic
-p9711
-sg9663
-VRegionOne
-p9712
-sg9665
-VRegionOne
-p9713
-sg9637
-V04a6ef3db6b046b1893ed45a3f906f6c
-p9714
-sa(dp9715
-g9659
-Vhttp://172.16.0.5:8080
-p9716
-sg9661
-Vinternal
-p9717
-sg9663
-VRegionOne
-p9718
-sg9665
-VRegionOne
-p9719
-sg9637
-V3e30684c9f74492b8ca9a64dd04261e6
-p9720
-sa(dp9721
-g9659
-Vhttp://172.16.0.5:8080
-p9722
-sg9661
-Vadmin
-p9723
-sg9663
-VRegionOne
-p9724
-sg9665
-VRegionOne
-p9725
-sg9637
-Vc5384b55cd7a441582f151c6b2807745
-p9726
-sasg9680
-Vs3
-p9727
-sg9637
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p9728
-sg9639
-Vswift_s3
-p9729
-sa(dp9730
-g9656
-(lp9731
-(dp9732
-g9659
-Vhttp://172.16.0.5:9696
-p9733
-sg9661
-Vadmin
-p9734
-sg9663
-VRegionOne
-p9735
-sg9665
-VRegionOne
-p9736
-sg9637
-V38b78b2c00264f59a4ade9392f88132b
-p9737
-sa(dp9738
-g9659
-Vhttp://172.18.0.8:9696
-p9739
-sg9661
-Vpublic
-p9740
-sg9663
-VRegionOne
-p9741
-sg9665
-VRegionOne
-p9742
-sg9637
-Vb5d0f72fbf674f84adf8929341e45586
-p9743
-sa(dp9744
-g9659
-Vhttp://172.16.0.5:9696
-p9745
-sg9661
-Vinternal
-p9746
-sg9663
-VRegionOne
-p9747
-sg9665
-VRegionOne
-p9748
-sg9637
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p9749
-sasg9680
-Vnetwork
-p9750
-sg9637
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p9751
-sg9639
-Vneutron
-p9752
-sa(dp9753
-g9656
-(lp9754
-(dp9755
-g9659
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9756
-sg9661
-Vinternal
-p9757
-sg9663
-VRegionOne
-p9758
-sg9665
-VRegionOne
-p9759
-sg9637
-V7c60744a22724044a92928bc2fa9e422
-p9760
-sa(dp9761
-g9659
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9762
-sg9661
-Vadmin
-p9763
-sg9663
-VRegionOne
-p9764
-sg9665
-VRegionOne
-p9765
-sg9637
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p9766
-sa(dp9767
-g9659
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9768
-sg9661
-Vpublic
-p9769
-sg9663
-VRegionOne
-p9770
-sg9665
-VRegionOne
-p9771
-sg9637
-Vde47d994bdc147bdb824474ea699a77a
-p9772
-sasg9680
-Vorchestration
-p9773
-sg9637
-V65a72244f7c54382aeebf5dfdeab8140
-p9774
-sg9639
-Vheat
-p9775
-sa(dp9776
-g9656
-(lp9777
-(dp9778
-g9659
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9779
-sg9661
-Vinternal
-p9780
-sg9663
-VRegionOne
-p9781
-sg9665
-VRegionOne
-p9782
-sg9637
-V3a25e85ecaa44b678c3721c2d3d39b38
-p9783
-sa(dp9784
-g9659
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9785
-sg9661
-Vadmin
-p9786
-sg9663
-VRegionOne
-p9787
-sg9665
-VRegionOne
-p9788
-sg9637
-V68c763474c3d4aa28c4ee0e0249998eb
-p9789
-sa(dp9790
-g9659
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p9791
-sg9661
-Vpublic
-p9792
-sg9663
-VRegionOne
-p9793
-sg9665
-VRegionOne
-p9794
-sg9637
-Ve0c861373e94468db521d5a8793d33d1
-p9795
-sasg9680
-Vvolume
-p9796
-sg9637
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p9797
-sg9639
-Vcinder
-p9798
-sa(dp9799
-g9656
-(lp9800
-(dp9801
-g9659
-Vhttp://172.18.0.8:5000/v2.0
-p9802
-sg9661
-Vpublic
-p9803
-sg9663
-VRegionOne
-p9804
-sg9665
-VRegionOne
-p9805
-sg9637
-V6aa35bc15a35447db58ec5b67087f96a
-p9806
-sa(dp9807
-g9659
-Vhttp://172.16.0.5:5000/v2.0
-p9808
-sg9661
-Vinternal
-p9809
-sg9663
-VRegionOne
-p9810
-sg9665
-VRegionOne
-p9811
-sg9637
-V6b4742f26b694b93bdbcb37304d22f69
-p9812
-sa(dp9813
-g9659
-Vhttp://172.16.0.5:35357/v2.0
-p9814
-sg9661
-Vadmin
-p9815
-sg9663
-VRegionOne
-p9816
-sg9665
-VRegionOne
-p9817
-sg9637
-Vadc120ea606644a299a3c91a7ceeb8c4
-p9818
-sasg9680
-Videntity
-p9819
-sg9637
-V9f95de9f4efc4730b4dd90354894e1dc
-p9820
-sg9639
-Vkeystone
-p9821
-sa(dp9822
-g9656
-(lp9823
-(dp9824
-g9659
-Vhttp://172.16.0.5:9292
-p9825
-sg9661
-Vadmin
-p9826
-sg9663
-VRegionOne
-p9827
-sg9665
-VRegionOne
-p9828
-sg9637
-V049519f829be4e7fb5f44ae9f470efdf
-p9829
-sa(dp9830
-g9659
-Vhttp://172.18.0.8:9292
-p9831
-sg9661
-Vpublic
-p9832
-sg9663
-VRegionOne
-p9833
-sg9665
-VRegionOne
-p9834
-sg9637
-V1baebbbf35744192b335f4f293d1a9d8
-p9835
-sa(dp9836
-g9659
-Vhttp://172.16.0.5:9292
-p9837
-sg9661
-Vinternal
-p9838
-sg9663
-VRegionOne
-p9839
-sg9665
-VRegionOne
-p9840
-sg9637
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p9841
-sasg9680
-Vimage
-p9842
-sg9637
-Va39ec0213acc45ceb59346299e78d6c0
-p9843
-sg9639
-Vglance
-p9844
-sa(dp9845
-g9656
-(lp9846
-(dp9847
-g9659
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9848
-sg9661
-Vinternal
-p9849
-sg9663
-VRegionOne
-p9850
-sg9665
-VRegionOne
-p9851
-sg9637
-V2cd9d66e95484830a9006177e301aa57
-p9852
-sa(dp9853
-g9659
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9854
-sg9661
-Vpublic
-p9855
-sg9663
-VRegionOne
-p9856
-sg9665
-VRegionOne
-p9857
-sg9637
-Vbe2d979150a2401b9e7d5c365372d093
-p9858
-sa(dp9859
-g9659
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9860
-sg9661
-Vadmin
-p9861
-sg9663
-VRegionOne
-p9862
-sg9665
-VRegionOne
-p9863
-sg9637
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p9864
-sasg9680
-Vcompute_legacy
-p9865
-sg9637
-Va4dd95e3fde340468f8c1d7df9a853d0
-p9866
-sg9639
-Vcompute_legacy
-p9867
-sa(dp9868
-g9656
-(lp9869
-(dp9870
-g9659
-Vhttp://172.16.0.5:8774/v2.1
-p9871
-sg9661
-Vadmin
-p9872
-sg9663
-VRegionOne
-p9873
-sg9665
-VRegionOne
-p9874
-sg9637
-V0307d2c32dd54839aa5bc39746eeb186
-p9875
-sa(dp9876
-g9659
-Vhttp://172.18.0.8:8774/v2.1
-p9877
-sg9661
-Vpublic
-p9878
-sg9663
-VRegionOne
-p9879
-sg9665
-VRegionOne
-p9880
-sg9637
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p9881
-sa(dp9882
-g9659
-Vhttp://172.16.0.5:8774/v2.1
-p9883
-sg9661
-Vinternal
-p9884
-sg9663
-VRegionOne
-p9885
-sg9665
-VRegionOne
-p9886
-sg9637
-Vdb005ab592334fc599c142cf861e754f
-p9887
-sasg9680
-Vcompute
-p9888
-sg9637
-Vc165d40b8c3849bcb6067a3df2540c62
-p9889
-sg9639
-Vnova
-p9890
-sa(dp9891
-g9656
-(lp9892
-(dp9893
-g9659
-Vhttp://172.16.0.5:8080/swift/v1
-p9894
-sg9661
-Vadmin
-p9895
-sg9663
-VRegionOne
-p9896
-sg9665
-VRegionOne
-p9897
-sg9637
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p9898
-sa(dp9899
-g9659
-Vhttp://172.16.0.5:8080/swift/v1
-p9900
-sg9661
-Vinternal
-p9901
-sg9663
-VRegionOne
-p9902
-sg9665
-VRegionOne
-p9903
-sg9637
-V764118d3a33444ac980632d281acf4a7
-p9904
-sa(dp9905
-g9659
-Vhttp://172.18.0.8:8080/swift/v1
-p9906
-sg9661
-Vpublic
-p9907
-sg9663
-VRegionOne
-p9908
-sg9665
-VRegionOne
-p9909
-sg9637
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p9910
-sasg9680
-Vobject-store
-p9911
-sg9637
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p9912
-sg9639
-Vswift
-p9913
-sa(dp9914
-g9656
-(lp9915
-(dp9916
-g9659
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9917
-sg9661
-Vinternal
-p9918
-sg9663
-VRegionOne
-p9919
-sg9665
-VRegionOne
-p9920
-sg9637
-V61ea745c91ab4eb59464679931219024
-p9921
-sa(dp9922
-g9659
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9923
-sg9661
-Vadmin
-p9924
-sg9663
-VRegionOne
-p9925
-sg9665
-VRegionOne
-p9926
-sg9637
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p9927
-sa(dp9928
-g9659
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p9929
-sg9661
-Vpublic
-p9930
-sg9663
-VRegionOne
-p9931
-sg9665
-VRegionOne
-p9932
-sg9637
-V7155772851884dc6954c7345d350796f
-p9933
-sasg9680
-Vvolumev2
-p9934
-sg9637
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p9935
-sg9639
-Vcinderv2
-p9936
-sa(dp9937
-g9656
-(lp9938
-(dp9939
-g9659
-Vhttp://172.18.0.8:9494
-p9940
-sg9661
-Vpublic
-p9941
-sg9663
-VRegionOne
-p9942
-sg9665
-VRegionOne
-p9943
-sg9637
-V43a202e889694d51a3b11899c252a8a9
-p9944
-sa(dp9945
-g9659
-Vhttp://172.16.0.5:9494
-p9946
-sg9661
-Vadmin
-p9947
-sg9663
-VRegionOne
-p9948
-sg9665
-VRegionOne
-p9949
-sg9637
-Vfa3c9de06e854542b236aa24b53e19a1
-p9950
-sa(dp9951
-g9659
-Vhttp://172.16.0.5:9494
-p9952
-sg9661
-Vinternal
-p9953
-sg9663
-VRegionOne
-p9954
-sg9665
-VRegionOne
-p9955
-sg9637
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p9956
-sasg9680
-Vartifact
-p9957
-sg9637
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p9958
-sg9639
-Vglare
-p9959
-sasVversion
-p9960
-Vv3
-p9961
-sVuser
-p9962
-(dp9963
-g9647
-(dp9964
-g9637
-Vdefault
-p9965
-sg9639
-VDefault
-p9966
-ssg9637
-Vef7a4f67379f41aba489a0b6d6a62094
-p9967
-sg9639
-Violie
-p9968
-ssVaudit_ids
-p9969
-(lp9970
-VBpleDnoXSvqD8HOMTGtMzQ
-p9971
-asVissued_at
-p9972
-V2017-11-30T11:03:55.000000Z
-p9973
-sssV_context_user
-p9974
-NsVpublisher_id
-p9975
-Vorchestration.machine-A
-p9976
-sVmessage_id
-p9977
-Vf5c741a0-249f-4c84-ae2b-713bbee2fc78
-p9978
-sV_context_roles
-p9979
-(lp9980
-Vadmin
-p9981
-asV_context_auth_url
-p9982
-Vhttp://172.16.0.5:35357/v3/
-p9983
-sVtimestamp
-p9984
-V2017-11-30 11:04:14.440947
-p9985
-sV_unique_id
-p9986
-Vce744aaba62a47669990095dc58312f3
-p9987
-sV_context_tenant_id
-p9988
-V187e5e95e7eb499d8a421b3d4ed966d5
-p9989
-sV_context_user_domain_id
-p9990
-Vdefault
-p9991
-sV_context_password
-p9992
-NsV_context_trustor_user_id
-p9993
-NsV_context_project_domain_id
-p9994
-Vdefault
-p9995
-sV_context_aws_creds
-p9996
-NsV_context_tenant
-p9997
-Vapexlake
-p9998
-sV_context_user_identity
-p9999
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p10000
-stp10001
-a(F23.840273141860962
-Vcompute.instance.update
-p10002
-(dp10003
-V_context_domain
-p10004
-NsV_context_request_id
-p10005
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p10006
-sV_context_quota_class
-p10007
-NsVevent_type
-p10008
-g10002
-sV_context_service_catalog
-p10009
-(lp10010
-(dp10011
-Vendpoints
-p10012
-(lp10013
-(dp10014
-VadminURL
-p10015
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10016
-sVregion
-p10017
-VRegionOne
-p10018
-sVinternalURL
-p10019
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10020
-sVpublicURL
-p10021
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10022
-sasVtype
-p10023
-Vvolume
-p10024
-sVname
-p10025
-Vcinder
-p10026
-sa(dp10027
-g10012
-(lp10028
-(dp10029
-g10015
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10030
-sg10017
-VRegionOne
-p10031
-sg10019
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10032
-sg10021
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10033
-sasg10023
-Vvolumev2
-p10034
-sg10025
-Vcinderv2
-p10035
-sasV_context_auth_token
-p10036
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p10037
-sV_context_resource_uuid
-p10038
-NsV_context_user_id
-p10039
-Vef7a4f67379f41aba489a0b6d6a62094
-p10040
-sVpayload
-p10041
-(dp10042
-Vstate_description
-p10043
-V
-sVavailability_zone
-p10044
-Vnova
-p10045
-sVterminated_at
-p10046
-V
-sVephemeral_gb
-p10047
-I0
-sVinstance_type_id
-p10048
-I1
-sVbandwidth
-p10049
-(dp10050
-sVdeleted_at
-p10051
-V
-sVreservation_id
-p10052
-Vr-lypgovtc
-p10053
-sVmemory_mb
-p10054
-I4096
-sVdisplay_name
-p10055
-Vvm_test
-p10056
-sVhostname
-p10057
-Vvm-test
-p10058
-sVstate
-p10059
-Vactive
-p10060
-sVold_state
-p10061
-Vbuilding
-p10062
-sVprogress
-p10063
-V
-sVlaunched_at
-p10064
-V2017-11-30T11:04:15.000000
-p10065
-sVmetadata
-p10066
-(dp10067
-sVnode
-p10068
-Vmachine-E
-p10069
-sVramdisk_id
-p10070
-V
-sVaccess_ip_v6
-p10071
-NsVdisk_gb
-p10072
-I40
-sVaccess_ip_v4
-p10073
-NsVkernel_id
-p10074
-V
-sVhost
-p10075
-Vmachine-E
-p10076
-sVuser_id
-p10077
-Vef7a4f67379f41aba489a0b6d6a62094
-p10078
-sVimage_ref_url
-p10079
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p10080
-sVcell_name
-p10081
-V
-sVaudit_period_beginning
-p10082
-V2017-11-01T00:00:00.000000
-p10083
-sVroot_gb
-p10084
-I40
-sVtenant_id
-p10085
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10086
-sVcreated_at
-p10087
-V2017-11-30T11:04:05.000000
-p10088
-sVold_task_state
-p10089
-Vspawning
-p10090
-sVinstance_id
-p10091
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p10092
-sVinstance_type
-p10093
-Vm1.medium
-p10094
-sVvcpus
-p10095
-I2
-sVimage_meta
-p10096
-(dp10097
-Vmin_disk
-p10098
-V40
-p10099
-sVcontainer_format
-p10100
-Vbare
-p10101
-sVmin_ram
-p10102
-V0
-sVdisk_format
-p10103
-Vqcow2
-p10104
-sVbase_image_ref
-p10105
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p10106
-ssVarchitecture
-p10107
-NsVnew_task_state
-p10108
-NsVaudit_period_ending
-p10109
-V2017-11-30T11:04:15.665005
-p10110
-sVos_type
-p10111
-NsVinstance_flavor_id
-p10112
-V3
-ssV_context_show_deleted
-p10113
-I00
-sVpriority
-p10114
-VINFO
-p10115
-sV_context_is_admin
-p10116
-I01
-sV_context_project_domain
-p10117
-NsV_context_user
-p10118
-Vef7a4f67379f41aba489a0b6d6a62094
-p10119
-sVpublisher_id
-p10120
-Vcompute.machine-A
-p10121
-sVmessage_id
-p10122
-V023d0d2b-268e-4e56-b31e-a7c19ffd565c
-p10123
-sV_context_remote_address
-p10124
-V172.16.0.5
-p10125
-sV_context_roles
-p10126
-(lp10127
-Vadmin
-p10128
-asVtimestamp
-p10129
-V2017-11-30 11:04:15.669783
-p10130
-sV_context_timestamp
-p10131
-V2017-11-30T11:04:05.012319
-p10132
-sV_unique_id
-p10133
-V380fe72e15064201980fa51bae881c90
-p10134
-sV_context_project_name
-p10135
-Vapexlake
-p10136
-sV_context_read_deleted
-p10137
-Vno
-p10138
-sV_context_user_identity
-p10139
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p10140
-sV_context_tenant
-p10141
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10142
-sV_context_instance_lock_checked
-p10143
-I00
-sV_context_project_id
-p10144
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10145
-sV_context_read_only
-p10146
-I00
-sV_context_user_domain
-p10147
-NsV_context_user_name
-p10148
-Violie
-p10149
-stp10150
-a(F23.854341983795166
-Vcompute.instance.create.end
-p10151
-(dp10152
-V_context_domain
-p10153
-NsV_context_request_id
-p10154
-Vreq-13a2fec4-ed43-4c4a-928a-71b0ff5f34b1
-p10155
-sV_context_quota_class
-p10156
-NsVevent_type
-p10157
-g10151
-sV_context_service_catalog
-p10158
-(lp10159
-(dp10160
-Vendpoints
-p10161
-(lp10162
-(dp10163
-VadminURL
-p10164
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10165
-sVregion
-p10166
-VRegionOne
-p10167
-sVinternalURL
-p10168
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10169
-sVpublicURL
-p10170
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10171
-sasVtype
-p10172
-Vvolume
-p10173
-sVname
-p10174
-Vcinder
-p10175
-sa(dp10176
-g10161
-(lp10177
-(dp10178
-g10164
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10179
-sg10166
-VRegionOne
-p10180
-sg10168
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10181
-sg10170
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10182
-sasg10172
-Vvolumev2
-p10183
-sg10174
-Vcinderv2
-p10184
-sasV_context_auth_token
-p10185
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p10186
-sV_context_resource_uuid
-p10187
-NsV_context_user_id
-p10188
-Vef7a4f67379f41aba489a0b6d6a62094
-p10189
-sVpayload
-p10190
-(dp10191
-Vstate_description
-p10192
-V
-sVavailability_zone
-p10193
-Vnova
-p10194
-sVterminated_at
-p10195
-V
-sVephemeral_gb
-p10196
-I0
-sVinstance_type_id
-p10197
-I1
-sVmessage
-p10198
-VSuccess
-p10199
-sVdeleted_at
-p10200
-V
-sVreservation_id
-p10201
-Vr-lypgovtc
-p10202
-sVmemory_mb
-p10203
-I4096
-sVdisplay_name
-p10204
-Vvm_test
-p10205
-sVfixed_ips
-p10206
-(lp10207
-(dp10208
-Vversion
-p10209
-I4
-sVvif_mac
-p10210
-Vfa:16:3e:c1:a1:3f
-p10211
-sVfloating_ips
-p10212
-(lp10213
-(dp10214
-Vmeta
-p10215
-(dp10216
-sg10172
-Vfloating
-p10217
-sg10209
-I4
-sVaddress
-p10218
-V10.2.32.194
-p10219
-sasVlabel
-p10220
-Vinternal
-p10221
-sg10215
-(dp10222
-sg10218
-V172.16.9.145
-p10223
-sg10172
-Vfixed
-p10224
-sasVhostname
-p10225
-Vvm-test
-p10226
-sVstate
-p10227
-Vactive
-p10228
-sVprogress
-p10229
-V
-sVlaunched_at
-p10230
-V2017-11-30T11:04:15.599051
-p10231
-sVmetadata
-p10232
-(dp10233
-sVnode
-p10234
-Vmachine-E
-p10235
-sVramdisk_id
-p10236
-V
-sVaccess_ip_v6
-p10237
-NsVdisk_gb
-p10238
-I40
-sVaccess_ip_v4
-p10239
-NsVkernel_id
-p10240
-V
-sVhost
-p10241
-Vmachine-E
-p10242
-sVuser_id
-p10243
-Vef7a4f67379f41aba489a0b6d6a62094
-p10244
-sVimage_ref_url
-p10245
-Vhttp://172.16.0.8:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p10246
-sVcell_name
-p10247
-V
-sVroot_gb
-p10248
-I40
-sVtenant_id
-p10249
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10250
-sVcreated_at
-p10251
-V2017-11-30T11:04:05.000000
-p10252
-sVinstance_id
-p10253
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p10254
-sVinstance_type
-p10255
-Vm1.medium
-p10256
-sVvcpus
-p10257
-I2
-sVimage_meta
-p10258
-(dp10259
-Vmin_disk
-p10260
-V40
-p10261
-sVcontainer_format
-p10262
-Vbare
-p10263
-sVmin_ram
-p10264
-V0
-sVdisk_format
-p10265
-Vqcow2
-p10266
-sVbase_image_ref
-p10267
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p10268
-ssVarchitecture
-p10269
-NsVos_type
-p10270
-NsVinstance_flavor_id
-p10271
-V3
-ssV_context_show_deleted
-p10272
-I00
-sVpriority
-p10273
-VINFO
-p10274
-sV_context_is_admin
-p10275
-I01
-sV_context_project_domain
-p10276
-NsV_context_user
-p10277
-Vef7a4f67379f41aba489a0b6d6a62094
-p10278
-sVpublisher_id
-p10279
-Vcompute.machine-E
-p10280
-sVmessage_id
-p10281
-Vf8017d60-f2dc-41e0-8382-a0305dfd7103
-p10282
-sV_context_remote_address
-p10283
-V172.16.0.5
-p10284
-sV_context_roles
-p10285
-(lp10286
-Vadmin
-p10287
-asVtimestamp
-p10288
-V2017-11-30 11:04:15.685256
-p10289
-sV_context_timestamp
-p10290
-V2017-11-30T11:04:05.012319
-p10291
-sV_unique_id
-p10292
-V06b7d3b146ae40dd86df0ee2ee8f3ed6
-p10293
-sV_context_project_name
-p10294
-Vapexlake
-p10295
-sV_context_read_deleted
-p10296
-Vno
-p10297
-sV_context_user_identity
-p10298
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p10299
-sV_context_tenant
-p10300
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10301
-sV_context_instance_lock_checked
-p10302
-I00
-sV_context_project_id
-p10303
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10304
-sV_context_read_only
-p10305
-I00
-sV_context_user_domain
-p10306
-NsV_context_user_name
-p10307
-Violie
-p10308
-stp10309
-a(F25.034615993499756
-Vorchestration.stack.create.end
-p10310
-(dp10311
-V_context_request_id
-p10312
-Vreq-d5358eda-3e1a-4e32-b194-90c05c38a45d
-p10313
-sVevent_type
-p10314
-g10310
-sV_context_region_name
-p10315
-NsV_context_auth_token
-p10316
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p10317
-sV_context_user_id
-p10318
-Vef7a4f67379f41aba489a0b6d6a62094
-p10319
-sVpayload
-p10320
-(dp10321
-Vusername
-p10322
-NsVstate_reason
-p10323
-VStack CREATE completed successfully
-p10324
-sVuser_id
-p10325
-NsVuser_identity
-p10326
-Vef7a4f67379f41aba489a0b6d6a62094
-p10327
-sVstack_name
-p10328
-VC
-sVtenant_id
-p10329
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10330
-sVstack_identity
-p10331
-V46e5c635-6b08-47d3-8949-effa358b9485
-p10332
-sVcreate_at
-p10333
-V2017-11-30T11:03:59.376944
-p10334
-sVstate
-p10335
-VCREATE_COMPLETE
-p10336
-ssV_context_username
-p10337
-NsV_context_show_deleted
-p10338
-I00
-sV_context_trust_id
-p10339
-NsVpriority
-p10340
-VINFO
-p10341
-sV_context_is_admin
-p10342
-I01
-sV_context_auth_token_info
-p10343
-(dp10344
-Vtoken
-p10345
-(dp10346
-Vmethods
-p10347
-(lp10348
-Vpassword
-p10349
-asVroles
-p10350
-(lp10351
-(dp10352
-Vid
-p10353
-Vd475171bf8304e06a74b1add560b1f28
-p10354
-sVname
-p10355
-Vadmin
-p10356
-sasVauth_token
-p10357
-VgAAAAABaH-We0Q52Ozb-6rzEH_RfUVOonsiFapXkfEFRWd9Xb6U7giHXfUNun_RkN6zoDQxP-L_n2026MxfL8Bkks7ibxMyb5EOwRvAfo-snzMmcEwz8CIaiSsaMw4J6SRVthCC5igYQBQxrt30lMCsNA0Qn8KcrBrF7e7UAMyHDnUK7_HU3UcU
-p10358
-sVexpires_at
-p10359
-V2017-11-30T12:03:58.000000Z
-p10360
-sVproject
-p10361
-(dp10362
-Vdomain
-p10363
-(dp10364
-g10353
-Vdefault
-p10365
-sg10355
-VDefault
-p10366
-ssg10353
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10367
-sg10355
-Vapexlake
-p10368
-ssVcatalog
-p10369
-(lp10370
-(dp10371
-Vendpoints
-p10372
-(lp10373
-(dp10374
-Vurl
-p10375
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p10376
-sVinterface
-p10377
-Vpublic
-p10378
-sVregion
-p10379
-VRegionOne
-p10380
-sVregion_id
-p10381
-VRegionOne
-p10382
-sg10353
-V13359d68397c4732b5d455941ac95989
-p10383
-sa(dp10384
-g10375
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p10385
-sg10377
-Vinternal
-p10386
-sg10379
-VRegionOne
-p10387
-sg10381
-VRegionOne
-p10388
-sg10353
-V50aeae6c5d034dcb80871bdac7391209
-p10389
-sa(dp10390
-g10375
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p10391
-sg10377
-Vadmin
-p10392
-sg10379
-VRegionOne
-p10393
-sg10381
-VRegionOne
-p10394
-sg10353
-V93b06f780b224cbd9b514c2041d3db63
-p10395
-sasVtype
-p10396
-Vvolumev3
-p10397
-sg10353
-V00a63293a3154089a4c80b60b4aa9429
-p10398
-sg10355
-Vcinderv3
-p10399
-sa(dp10400
-g10372
-(lp10401
-(dp10402
-g10375
-Vhttp://172.16.0.5:8000/v1
-p10403
-sg10377
-Vadmin
-p10404
-sg10379
-VRegionOne
-p10405
-sg10381
-VRegionOne
-p10406
-sg10353
-V24acffb5d9154df4981db7424b7669bd
-p10407
-sa(dp10408
-g10375
-Vhttp://172.18.0.8:8000/v1
-p10409
-sg10377
-Vpublic
-p10410
-sg10379
-VRegionOne
-p10411
-sg10381
-VRegionOne
-p10412
-sg10353
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p10413
-sa(dp10414
-g10375
-Vhttp://172.16.0.5:8000/v1
-p10415
-sg10377
-Vinternal
-p10416
-sg10379
-VRegionOne
-p10417
-sg10381
-VRegionOne
-p10418
-sg10353
-V679262173a714d76a078051b95f8c969
-p10419
-sasg10396
-Vcloudformation
-p10420
-sg10353
-V245169ccae564a7db06ca002f1553b51
-p10421
-sg10355
-Vheat-cfn
-p10422
-sa(dp10423
-g10372
-(lp10424
-(dp10425
-g10375
-Vhttp://172.18.0.8:8080
-p10426
-sg10377
-Vpublic
-p10427
-sg10379
-VRegionOne
-p10428
-sg10381
-VRegionOne
-p10429
-sg10353
-V04a6ef3db6b046b1893ed45a3f906f6c
-p10430
-sa(dp10431
-g10375
-Vhttp://172.16.0.5:8080
-p10432
-sg10377
-Vinternal
-p10433
-sg10379
-VRegionOne
-p10434
-sg10381
-VRegionOne
-p10435
-sg10353
-V3e30684c9f74492b8ca9a64dd04261e6
-p10436
-sa(dp10437
-g10375
-Vhttp://172.16.0.5:8080
-p10438
-sg10377
-Vadmin
-p10439
-sg10379
-VRegionOne
-p10440
-sg10381
-VRegionOne
-p10441
-sg10353
-Vc5384b55cd7a441582f151c6b2807745
-p10442
-sasg10396
-Vs3
-p10443
-sg10353
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p10444
-sg10355
-Vswift_s3
-p10445
-sa(dp10446
-g10372
-(lp10447
-(dp10448
-g10375
-Vhttp://172.16.0.5:9696
-p10449
-sg10377
-Vadmin
-p10450
-sg10379
-VRegionOne
-p10451
-sg10381
-VRegionOne
-p10452
-sg10353
-V38b78b2c00264f59a4ade9392f88132b
-p10453
-sa(dp10454
-g10375
-Vhttp://172.18.0.8:9696
-p10455
-sg10377
-Vpublic
-p10456
-sg10379
-VRegionOne
-p10457
-sg10381
-VRegionOne
-p10458
-sg10353
-Vb5d0f72fbf674f84adf8929341e45586
-p10459
-sa(dp10460
-g10375
-Vhttp://172.16.0.5:9696
-p10461
-sg10377
-Vinternal
-p10462
-sg10379
-VRegionOne
-p10463
-sg10381
-VRegionOne
-p10464
-sg10353
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p10465
-sasg10396
-Vnetwork
-p10466
-sg10353
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p10467
-sg10355
-Vneutron
-p10468
-sa(dp10469
-g10372
-(lp10470
-(dp10471
-g10375
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10472
-sg10377
-Vinternal
-p10473
-sg10379
-VRegionOne
-p10474
-sg10381
-VRegionOne
-p10475
-sg10353
-V7c60744a22724044a92928bc2fa9e422
-p10476
-sa(dp10477
-g10375
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10478
-sg10377
-Vadmin
-p10479
-sg10379
-VRegionOne
-p10480
-sg10381
-VRegionOne
-p10481
-sg10353
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p10482
-sa(dp10483
-g10375
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10484
-sg10377
-Vpublic
-p10485
-sg10379
-VRegionOne
-p10486
-sg10381
-VRegionOne
-p10487
-sg10353
-Vde47d994bdc147bdb824474ea699a77a
-p10488
-sasg10396
-Vorchestration
-p10489
-sg10353
-V65a72244f7c54382aeebf5dfdeab8140
-p10490
-sg10355
-Vheat
-p10491
-sa(dp10492
-g10372
-(lp10493
-(dp10494
-g10375
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10495
-sg10377
-Vinternal
-p10496
-sg10379
-VRegionOne
-p10497
-sg10381
-VRegionOne
-p10498
-sg10353
-V3a25e85ecaa44b678c3721c2d3d39b38
-p10499
-sa(dp10500
-g10375
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10501
-sg10377
-Vadmin
-p10502
-sg10379
-VRegionOne
-p10503
-sg10381
-VRegionOne
-p10504
-sg10353
-V68c763474c3d4aa28c4ee0e0249998eb
-p10505
-sa(dp10506
-g10375
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p10507
-sg10377
-Vpublic
-p10508
-sg10379
-VRegionOne
-p10509
-sg10381
-VRegionOne
-p10510
-sg10353
-Ve0c861373e94468db521d5a8793d33d1
-p10511
-sasg10396
-Vvolume
-p10512
-sg10353
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p10513
-sg10355
-Vcinder
-p10514
-sa(dp10515
-g10372
-(lp10516
-(dp10517
-g10375
-Vhttp://172.18.0.8:5000/v2.0
-p10518
-sg10377
-Vpublic
-p10519
-sg10379
-VRegionOne
-p10520
-sg10381
-VRegionOne
-p10521
-sg10353
-V6aa35bc15a35447db58ec5b67087f96a
-p10522
-sa(dp10523
-g10375
-Vhttp://172.16.0.5:5000/v2.0
-p10524
-sg10377
-Vinternal
-p10525
-sg10379
-VRegionOne
-p10526
-sg10381
-VRegionOne
-p10527
-sg10353
-V6b4742f26b694b93bdbcb37304d22f69
-p10528
-sa(dp10529
-g10375
-Vhttp://172.16.0.5:35357/v2.0
-p10530
-sg10377
-Vadmin
-p10531
-sg10379
-VRegionOne
-p10532
-sg10381
-VRegionOne
-p10533
-sg10353
-Vadc120ea606644a299a3c91a7ceeb8c4
-p10534
-sasg10396
-Videntity
-p10535
-sg10353
-V9f95de9f4efc4730b4dd90354894e1dc
-p10536
-sg10355
-Vkeystone
-p10537
-sa(dp10538
-g10372
-(lp10539
-(dp10540
-g10375
-Vhttp://172.16.0.5:9292
-p10541
-sg10377
-Vadmin
-p10542
-sg10379
-VRegionOne
-p10543
-sg10381
-VRegionOne
-p10544
-sg10353
-V049519f829be4e7fb5f44ae9f470efdf
-p10545
-sa(dp10546
-g10375
-Vhttp://172.18.0.8:9292
-p10547
-sg10377
-Vpublic
-p10548
-sg10379
-VRegionOne
-p10549
-sg10381
-VRegionOne
-p10550
-sg10353
-V1baebbbf35744192b335f4f293d1a9d8
-p10551
-sa(dp10552
-g10375
-Vhttp://172.16.0.5:9292
-p10553
-sg10377
-Vinternal
-p10554
-sg10379
-VRegionOne
-p10555
-sg10381
-VRegionOne
-p10556
-sg10353
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p10557
-sasg10396
-Vimage
-p10558
-sg10353
-Va39ec0213acc45ceb59346299e78d6c0
-p10559
-sg10355
-Vglance
-p10560
-sa(dp10561
-g10372
-(lp10562
-(dp10563
-g10375
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10564
-sg10377
-Vinternal
-p10565
-sg10379
-VRegionOne
-p10566
-sg10381
-VRegionOne
-p10567
-sg10353
-V2cd9d66e95484830a9006177e301aa57
-p10568
-sa(dp10569
-g10375
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10570
-sg10377
-Vpublic
-p10571
-sg10379
-VRegionOne
-p10572
-sg10381
-VRegionOne
-p10573
-sg10353
-Vbe2d979150a2401b9e7d5c365372d093
-p10574
-sa(dp10575
-g10375
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10576
-sg10377
-Vadmin
-p10577
-sg10379
-VRegionOne
-p10578
-sg10381
-VRegionOne
-p10579
-sg10353
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p10580
-sasg10396
-Vcompute_legacy
-p10581
-sg10353
-Va4dd95e3fde340468f8c1d7df9a853d0
-p10582
-sg10355
-Vcompute_legacy
-p10583
-sa(dp10584
-g10372
-(lp10585
-(dp10586
-g10375
-Vhttp://172.16.0.5:8774/v2.1
-p10587
-sg10377
-Vadmin
-p10588
-sg10379
-VRegionOne
-p10589
-sg10381
-VRegionOne
-p10590
-sg10353
-V0307d2c32dd54839aa5bc39746eeb186
-p10591
-sa(dp10592
-g10375
-Vhttp://172.18.0.8:8774/v2.1
-p10593
-sg10377
-Vpublic
-p10594
-sg10379
-VRegionOne
-p10595
-sg10381
-VRegionOne
-p10596
-sg10353
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p10597
-sa(dp10598
-g10375
-Vhttp://172.16.0.5:8774/v2.1
-p10599
-sg10377
-Vinternal
-p10600
-sg10379
-VRegionOne
-p10601
-sg10381
-VRegionOne
-p10602
-sg10353
-Vdb005ab592334fc599c142cf861e754f
-p10603
-sasg10396
-Vcompute
-p10604
-sg10353
-Vc165d40b8c3849bcb6067a3df2540c62
-p10605
-sg10355
-Vnova
-p10606
-sa(dp10607
-g10372
-(lp10608
-(dp10609
-g10375
-Vhttp://172.16.0.5:8080/swift/v1
-p10610
-sg10377
-Vadmin
-p10611
-sg10379
-VRegionOne
-p10612
-sg10381
-VRegionOne
-p10613
-sg10353
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p10614
-sa(dp10615
-g10375
-Vhttp://172.16.0.5:8080/swift/v1
-p10616
-sg10377
-Vinternal
-p10617
-sg10379
-VRegionOne
-p10618
-sg10381
-VRegionOne
-p10619
-sg10353
-V764118d3a33444ac980632d281acf4a7
-p10620
-sa(dp10621
-g10375
-Vhttp://172.18.0.8:8080/swift/v1
-p10622
-sg10377
-Vpublic
-p10623
-sg10379
-VRegionOne
-p10624
-sg10381
-VRegionOne
-p10625
-sg10353
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p10626
-sasg10396
-Vobject-store
-p10627
-sg10353
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p10628
-sg10355
-Vswift
-p10629
-sa(dp10630
-g10372
-(lp10631
-(dp10632
-g10375
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10633
-sg10377
-Vinternal
-p10634
-sg10379
-VRegionOne
-p10635
-sg10381
-VRegionOne
-p10636
-sg10353
-V61ea745c91ab4eb59464679931219024
-p10637
-sa(dp10638
-g10375
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10639
-sg10377
-Vadmin
-p10640
-sg10379
-VRegionOne
-p10641
-sg10381
-VRegionOne
-p10642
-sg10353
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p10643
-sa(dp10644
-g10375
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p10645
-sg10377
-Vpublic
-p10646
-sg10379
-VRegionOne
-p10647
-sg10381
-VRegionOne
-p10648
-sg10353
-V7155772851884dc6954c7345d350796f
-p10649
-sasg10396
-Vvolumev2
-p10650
-sg10353
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p10651
-sg10355
-Vcinderv2
-p10652
-sa(dp10653
-g10372
-(lp10654
-(dp10655
-g10375
-Vhttp://172.18.0.8:9494
-p10656
-sg10377
-Vpublic
-p10657
-sg10379
-VRegionOne
-p10658
-sg10381
-VRegionOne
-p10659
-sg10353
-V43a202e889694d51a3b11899c252a8a9
-p10660
-sa(dp10661
-g10375
-Vhttp://172.16.0.5:9494
-p10662
-sg10377
-Vadmin
-p10663
-sg10379
-VRegionOne
-p10664
-sg10381
-VRegionOne
-p10665
-sg10353
-Vfa3c9de06e854542b236aa24b53e19a1
-p10666
-sa(dp10667
-g10375
-Vhttp://172.16.0.5:9494
-p10668
-sg10377
-Vinternal
-p10669
-sg10379
-VRegionOne
-p10670
-sg10381
-VRegionOne
-p10671
-sg10353
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p10672
-sasg10396
-Vartifact
-p10673
-sg10353
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p10674
-sg10355
-Vglare
-p10675
-sasVversion
-p10676
-Vv3
-p10677
-sVuser
-p10678
-(dp10679
-g10363
-(dp10680
-g10353
-Vdefault
-p10681
-sg10355
-VDefault
-p10682
-ssg10353
-Vef7a4f67379f41aba489a0b6d6a62094
-p10683
-sg10355
-Violie
-p10684
-ssVaudit_ids
-p10685
-(lp10686
-VyUU2bGSwSqygaTsqYoGKNw
-p10687
-asVissued_at
-p10688
-V2017-11-30T11:03:58.000000Z
-p10689
-sssV_context_user
-p10690
-NsVpublisher_id
-p10691
-Vorchestration.machine-A
-p10692
-sVmessage_id
-p10693
-V63b583c2-9d16-48d0-a634-c2e9565dc4b7
-p10694
-sV_context_roles
-p10695
-(lp10696
-Vadmin
-p10697
-asV_context_auth_url
-p10698
-Vhttp://172.16.0.5:35357/v3/
-p10699
-sVtimestamp
-p10700
-V2017-11-30 11:04:16.864974
-p10701
-sV_unique_id
-p10702
-V69ab525915a4465b848ef04bd0c3f8dc
-p10703
-sV_context_tenant_id
-p10704
-V187e5e95e7eb499d8a421b3d4ed966d5
-p10705
-sV_context_user_domain_id
-p10706
-Vdefault
-p10707
-sV_context_password
-p10708
-NsV_context_trustor_user_id
-p10709
-NsV_context_project_domain_id
-p10710
-Vdefault
-p10711
-sV_context_aws_creds
-p10712
-NsV_context_tenant
-p10713
-Vapexlake
-p10714
-sV_context_user_identity
-p10715
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p10716
-stp10717
-a.
\ No newline at end of file
@@ -1,7393 +0,0 @@
-(lp0
-(F0.00014781951904296875
-Vorchestration.stack.delete.start
-p1
-(dp2
-V_context_request_id
-p3
-Vreq-827c6fe9-8a9c-4f38-bc6d-a80e705389f8
-p4
-sVevent_type
-p5
-g1
-sV_context_region_name
-p6
-NsV_context_auth_token
-p7
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p8
-sV_context_user_id
-p9
-Vef7a4f67379f41aba489a0b6d6a62094
-p10
-sVpayload
-p11
-(dp12
-Vusername
-p13
-NsVstate_reason
-p14
-VStack DELETE started
-p15
-sVuser_id
-p16
-NsVuser_identity
-p17
-Vef7a4f67379f41aba489a0b6d6a62094
-p18
-sVstack_name
-p19
-Vgreen
-p20
-sVtenant_id
-p21
-V187e5e95e7eb499d8a421b3d4ed966d5
-p22
-sVstack_identity
-p23
-V7ab82262-5bd0-4047-89b9-9c9ca4ee979b
-p24
-sVcreate_at
-p25
-V2017-12-06T18:50:15
-p26
-sVstate
-p27
-VDELETE_IN_PROGRESS
-p28
-ssV_context_username
-p29
-NsV_context_show_deleted
-p30
-I00
-sV_context_trust_id
-p31
-NsVpriority
-p32
-VINFO
-p33
-sV_context_is_admin
-p34
-I01
-sV_context_auth_token_info
-p35
-(dp36
-Vtoken
-p37
-(dp38
-Vmethods
-p39
-(lp40
-Vpassword
-p41
-asVroles
-p42
-(lp43
-(dp44
-Vid
-p45
-Vd475171bf8304e06a74b1add560b1f28
-p46
-sVname
-p47
-Vadmin
-p48
-sasVauth_token
-p49
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p50
-sVexpires_at
-p51
-V2017-12-06T19:51:16.000000Z
-p52
-sVproject
-p53
-(dp54
-Vdomain
-p55
-(dp56
-g45
-Vdefault
-p57
-sg47
-VDefault
-p58
-ssg45
-V187e5e95e7eb499d8a421b3d4ed966d5
-p59
-sg47
-Vapexlake
-p60
-ssVcatalog
-p61
-(lp62
-(dp63
-Vendpoints
-p64
-(lp65
-(dp66
-Vurl
-p67
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p68
-sVinterface
-p69
-Vpublic
-p70
-sVregion
-p71
-VRegionOne
-p72
-sVregion_id
-p73
-VRegionOne
-p74
-sg45
-V13359d68397c4732b5d455941ac95989
-p75
-sa(dp76
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p77
-sg69
-Vinternal
-p78
-sg71
-VRegionOne
-p79
-sg73
-VRegionOne
-p80
-sg45
-V50aeae6c5d034dcb80871bdac7391209
-p81
-sa(dp82
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p83
-sg69
-Vadmin
-p84
-sg71
-VRegionOne
-p85
-sg73
-VRegionOne
-p86
-sg45
-V93b06f780b224cbd9b514c2041d3db63
-p87
-sasVtype
-p88
-Vvolumev3
-p89
-sg45
-V00a63293a3154089a4c80b60b4aa9429
-p90
-sg47
-Vcinderv3
-p91
-sa(dp92
-g64
-(lp93
-(dp94
-g67
-Vhttp://172.16.0.5:8000/v1
-p95
-sg69
-Vadmin
-p96
-sg71
-VRegionOne
-p97
-sg73
-VRegionOne
-p98
-sg45
-V24acffb5d9154df4981db7424b7669bd
-p99
-sa(dp100
-g67
-Vhttp://172.18.0.8:8000/v1
-p101
-sg69
-Vpublic
-p102
-sg71
-VRegionOne
-p103
-sg73
-VRegionOne
-p104
-sg45
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p105
-sa(dp106
-g67
-Vhttp://172.16.0.5:8000/v1
-p107
-sg69
-Vinternal
-p108
-sg71
-VRegionOne
-p109
-sg73
-VRegionOne
-p110
-sg45
-V679262173a714d76a078051b95f8c969
-p111
-sasg88
-Vcloudformation
-p112
-sg45
-V245169ccae564a7db06ca002f1553b51
-p113
-sg47
-Vheat-cfn
-p114
-sa(dp115
-g64
-(lp116
-(dp117
-g67
-Vhttp://172.18.0.8:8080
-p118
-sg69
-Vpublic
-p119
-sg71
-VRegionOne
-p120
-sg73
-VRegionOne
-p121
-sg45
-V04a6ef3db6b046b1893ed45a3f906f6c
-p122
-sa(dp123
-g67
-Vhttp://172.16.0.5:8080
-p124
-sg69
-Vinternal
-p125
-sg71
-VRegionOne
-p126
-sg73
-VRegionOne
-p127
-sg45
-V3e30684c9f74492b8ca9a64dd04261e6
-p128
-sa(dp129
-g67
-Vhttp://172.16.0.5:8080
-p130
-sg69
-Vadmin
-p131
-sg71
-VRegionOne
-p132
-sg73
-VRegionOne
-p133
-sg45
-Vc5384b55cd7a441582f151c6b2807745
-p134
-sasg88
-Vs3
-p135
-sg45
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p136
-sg47
-Vswift_s3
-p137
-sa(dp138
-g64
-(lp139
-(dp140
-g67
-Vhttp://172.16.0.5:9696
-p141
-sg69
-Vadmin
-p142
-sg71
-VRegionOne
-p143
-sg73
-VRegionOne
-p144
-sg45
-V38b78b2c00264f59a4ade9392f88132b
-p145
-sa(dp146
-g67
-Vhttp://172.18.0.8:9696
-p147
-sg69
-Vpublic
-p148
-sg71
-VRegionOne
-p149
-sg73
-VRegionOne
-p150
-sg45
-Vb5d0f72fbf674f84adf8929341e45586
-p151
-sa(dp152
-g67
-Vhttp://172.16.0.5:9696
-p153
-sg69
-Vinternal
-p154
-sg71
-VRegionOne
-p155
-sg73
-VRegionOne
-p156
-sg45
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p157
-sasg88
-Vnetwork
-p158
-sg45
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p159
-sg47
-Vneutron
-p160
-sa(dp161
-g64
-(lp162
-(dp163
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p164
-sg69
-Vinternal
-p165
-sg71
-VRegionOne
-p166
-sg73
-VRegionOne
-p167
-sg45
-V7c60744a22724044a92928bc2fa9e422
-p168
-sa(dp169
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p170
-sg69
-Vadmin
-p171
-sg71
-VRegionOne
-p172
-sg73
-VRegionOne
-p173
-sg45
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p174
-sa(dp175
-g67
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p176
-sg69
-Vpublic
-p177
-sg71
-VRegionOne
-p178
-sg73
-VRegionOne
-p179
-sg45
-Vde47d994bdc147bdb824474ea699a77a
-p180
-sasg88
-Vorchestration
-p181
-sg45
-V65a72244f7c54382aeebf5dfdeab8140
-p182
-sg47
-Vheat
-p183
-sa(dp184
-g64
-(lp185
-(dp186
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p187
-sg69
-Vinternal
-p188
-sg71
-VRegionOne
-p189
-sg73
-VRegionOne
-p190
-sg45
-V3a25e85ecaa44b678c3721c2d3d39b38
-p191
-sa(dp192
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p193
-sg69
-Vadmin
-p194
-sg71
-VRegionOne
-p195
-sg73
-VRegionOne
-p196
-sg45
-V68c763474c3d4aa28c4ee0e0249998eb
-p197
-sa(dp198
-g67
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p199
-sg69
-Vpublic
-p200
-sg71
-VRegionOne
-p201
-sg73
-VRegionOne
-p202
-sg45
-Ve0c861373e94468db521d5a8793d33d1
-p203
-sasg88
-Vvolume
-p204
-sg45
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p205
-sg47
-Vcinder
-p206
-sa(dp207
-g64
-(lp208
-(dp209
-g67
-Vhttp://172.18.0.8:5000/v2.0
-p210
-sg69
-Vpublic
-p211
-sg71
-VRegionOne
-p212
-sg73
-VRegionOne
-p213
-sg45
-V6aa35bc15a35447db58ec5b67087f96a
-p214
-sa(dp215
-g67
-Vhttp://172.16.0.5:5000/v2.0
-p216
-sg69
-Vinternal
-p217
-sg71
-VRegionOne
-p218
-sg73
-VRegionOne
-p219
-sg45
-V6b4742f26b694b93bdbcb37304d22f69
-p220
-sa(dp221
-g67
-Vhttp://172.16.0.5:35357/v2.0
-p222
-sg69
-Vadmin
-p223
-sg71
-VRegionOne
-p224
-sg73
-VRegionOne
-p225
-sg45
-Vadc120ea606644a299a3c91a7ceeb8c4
-p226
-sasg88
-Videntity
-p227
-sg45
-V9f95de9f4efc4730b4dd90354894e1dc
-p228
-sg47
-Vkeystone
-p229
-sa(dp230
-g64
-(lp231
-(dp232
-g67
-Vhttp://172.16.0.5:9292
-p233
-sg69
-Vadmin
-p234
-sg71
-VRegionOne
-p235
-sg73
-VRegionOne
-p236
-sg45
-V049519f829be4e7fb5f44ae9f470efdf
-p237
-sa(dp238
-g67
-Vhttp://172.18.0.8:9292
-p239
-sg69
-Vpublic
-p240
-sg71
-VRegionOne
-p241
-sg73
-VRegionOne
-p242
-sg45
-V1baebbbf35744192b335f4f293d1a9d8
-p243
-sa(dp244
-g67
-Vhttp://172.16.0.5:9292
-p245
-sg69
-Vinternal
-p246
-sg71
-VRegionOne
-p247
-sg73
-VRegionOne
-p248
-sg45
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p249
-sasg88
-Vimage
-p250
-sg45
-Va39ec0213acc45ceb59346299e78d6c0
-p251
-sg47
-Vglance
-p252
-sa(dp253
-g64
-(lp254
-(dp255
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p256
-sg69
-Vinternal
-p257
-sg71
-VRegionOne
-p258
-sg73
-VRegionOne
-p259
-sg45
-V2cd9d66e95484830a9006177e301aa57
-p260
-sa(dp261
-g67
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p262
-sg69
-Vpublic
-p263
-sg71
-VRegionOne
-p264
-sg73
-VRegionOne
-p265
-sg45
-Vbe2d979150a2401b9e7d5c365372d093
-p266
-sa(dp267
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p268
-sg69
-Vadmin
-p269
-sg71
-VRegionOne
-p270
-sg73
-VRegionOne
-p271
-sg45
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p272
-sasg88
-Vcompute_legacy
-p273
-sg45
-Va4dd95e3fde340468f8c1d7df9a853d0
-p274
-sg47
-Vcompute_legacy
-p275
-sa(dp276
-g64
-(lp277
-(dp278
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p279
-sg69
-Vadmin
-p280
-sg71
-VRegionOne
-p281
-sg73
-VRegionOne
-p282
-sg45
-V0307d2c32dd54839aa5bc39746eeb186
-p283
-sa(dp284
-g67
-Vhttp://172.18.0.8:8774/v2.1
-p285
-sg69
-Vpublic
-p286
-sg71
-VRegionOne
-p287
-sg73
-VRegionOne
-p288
-sg45
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p289
-sa(dp290
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p291
-sg69
-Vinternal
-p292
-sg71
-VRegionOne
-p293
-sg73
-VRegionOne
-p294
-sg45
-Vdb005ab592334fc599c142cf861e754f
-p295
-sasg88
-Vcompute
-p296
-sg45
-Vc165d40b8c3849bcb6067a3df2540c62
-p297
-sg47
-Vnova
-p298
-sa(dp299
-g64
-(lp300
-(dp301
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p302
-sg69
-Vadmin
-p303
-sg71
-VRegionOne
-p304
-sg73
-VRegionOne
-p305
-sg45
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p306
-sa(dp307
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p308
-sg69
-Vinternal
-p309
-sg71
-VRegionOne
-p310
-sg73
-VRegionOne
-p311
-sg45
-V764118d3a33444ac980632d281acf4a7
-p312
-sa(dp313
-g67
-Vhttp://172.18.0.8:8080/swift/v1
-p314
-sg69
-Vpublic
-p315
-sg71
-VRegionOne
-p316
-sg73
-VRegionOne
-p317
-sg45
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p318
-sasg88
-Vobject-store
-p319
-sg45
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p320
-sg47
-Vswift
-p321
-sa(dp322
-g64
-(lp323
-(dp324
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p325
-sg69
-Vinternal
-p326
-sg71
-VRegionOne
-p327
-sg73
-VRegionOne
-p328
-sg45
-V61ea745c91ab4eb59464679931219024
-p329
-sa(dp330
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p331
-sg69
-Vadmin
-p332
-sg71
-VRegionOne
-p333
-sg73
-VRegionOne
-p334
-sg45
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p335
-sa(dp336
-g67
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p337
-sg69
-Vpublic
-p338
-sg71
-VRegionOne
-p339
-sg73
-VRegionOne
-p340
-sg45
-V7155772851884dc6954c7345d350796f
-p341
-sasg88
-Vvolumev2
-p342
-sg45
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p343
-sg47
-Vcinderv2
-p344
-sa(dp345
-g64
-(lp346
-(dp347
-g67
-Vhttp://172.18.0.8:9494
-p348
-sg69
-Vpublic
-p349
-sg71
-VRegionOne
-p350
-sg73
-VRegionOne
-p351
-sg45
-V43a202e889694d51a3b11899c252a8a9
-p352
-sa(dp353
-g67
-Vhttp://172.16.0.5:9494
-p354
-sg69
-Vadmin
-p355
-sg71
-VRegionOne
-p356
-sg73
-VRegionOne
-p357
-sg45
-Vfa3c9de06e854542b236aa24b53e19a1
-p358
-sa(dp359
-g67
-Vhttp://172.16.0.5:9494
-p360
-sg69
-Vinternal
-p361
-sg71
-VRegionOne
-p362
-sg73
-VRegionOne
-p363
-sg45
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p364
-sasg88
-Vartifact
-p365
-sg45
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p366
-sg47
-Vglare
-p367
-sasVversion
-p368
-Vv3
-p369
-sVuser
-p370
-(dp371
-g55
-(dp372
-g45
-Vdefault
-p373
-sg47
-VDefault
-p374
-ssg45
-Vef7a4f67379f41aba489a0b6d6a62094
-p375
-sg47
-Violie
-p376
-ssVaudit_ids
-p377
-(lp378
-Vir5buaPSTDG4VbCO0gmewQ
-p379
-asVissued_at
-p380
-V2017-12-06T18:51:16.000000Z
-p381
-sssV_context_user
-p382
-NsVpublisher_id
-p383
-Vorchestration.machine-D
-p384
-sVmessage_id
-p385
-Vaa05e5cc-c851-4e72-8715-425f6f151de6
-p386
-sV_context_roles
-p387
-(lp388
-Vadmin
-p389
-asV_context_auth_url
-p390
-Vhttp://172.16.0.5:35357/v3/
-p391
-sVtimestamp
-p392
-V2017-12-06 18:51:17.113069
-p393
-sV_unique_id
-p394
-V70e2a4782bf048e2acfb0f2de44eb4b6
-p395
-sV_context_tenant_id
-p396
-V187e5e95e7eb499d8a421b3d4ed966d5
-p397
-sV_context_user_domain_id
-p398
-Vdefault
-p399
-sV_context_password
-p400
-NsV_context_trustor_user_id
-p401
-NsV_context_project_domain_id
-p402
-Vdefault
-p403
-sV_context_aws_creds
-p404
-NsV_context_tenant
-p405
-Vapexlake
-p406
-sV_context_user_identity
-p407
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p408
-stp409
-a(F0.048120975494384766
-Vfloatingip.delete.start
-p410
-(dp411
-V_context_domain
-p412
-NsV_context_request_id
-p413
-Vreq-e00daa5a-9c6d-4871-a8fb-a983494fbd03
-p414
-sVevent_type
-p415
-g410
-sV_context_auth_token
-p416
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p417
-sV_context_resource_uuid
-p418
-NsV_context_tenant_name
-p419
-Vapexlake
-p420
-sV_context_user_id
-p421
-Vef7a4f67379f41aba489a0b6d6a62094
-p422
-sVpayload
-p423
-(dp424
-Vfloatingip_id
-p425
-V8b9d5b63-29c2-45ae-ba91-1ce731cbcfb3
-p426
-ssV_context_show_deleted
-p427
-I00
-sVpriority
-p428
-VINFO
-p429
-sV_context_is_admin
-p430
-I01
-sV_context_project_domain
-p431
-NsV_context_timestamp
-p432
-V2017-12-06 18:51:17.165237
-p433
-sVpublisher_id
-p434
-Vnetwork.machine-D
-p435
-sVmessage_id
-p436
-V0442ebd7-1aea-4331-af41-de0da163a0a8
-p437
-sV_context_roles
-p438
-(lp439
-Vadmin
-p440
-asVtimestamp
-p441
-V2017-12-06 18:51:17.166745
-p442
-sV_context_user
-p443
-Vef7a4f67379f41aba489a0b6d6a62094
-p444
-sV_unique_id
-p445
-V5d527f5b42f04d1fbad0d48dcb046177
-p446
-sV_context_tenant_id
-p447
-V187e5e95e7eb499d8a421b3d4ed966d5
-p448
-sV_context_project_name
-p449
-Vapexlake
-p450
-sV_context_user_identity
-p451
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p452
-sV_context_tenant
-p453
-V187e5e95e7eb499d8a421b3d4ed966d5
-p454
-sV_context_project_id
-p455
-V187e5e95e7eb499d8a421b3d4ed966d5
-p456
-sV_context_read_only
-p457
-I00
-sV_context_user_domain
-p458
-NsV_context_user_name
-p459
-Violie
-p460
-stp461
-a(F0.20527315139770508
-Vfloatingip.delete.end
-p462
-(dp463
-V_context_domain
-p464
-NsV_context_request_id
-p465
-Vreq-e00daa5a-9c6d-4871-a8fb-a983494fbd03
-p466
-sVevent_type
-p467
-g462
-sV_context_auth_token
-p468
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p469
-sV_context_resource_uuid
-p470
-NsV_context_tenant_name
-p471
-Vapexlake
-p472
-sV_context_user_id
-p473
-Vef7a4f67379f41aba489a0b6d6a62094
-p474
-sVpayload
-p475
-(dp476
-Vfloatingip_id
-p477
-V8b9d5b63-29c2-45ae-ba91-1ce731cbcfb3
-p478
-ssV_context_show_deleted
-p479
-I00
-sVpriority
-p480
-VINFO
-p481
-sV_context_is_admin
-p482
-I01
-sV_context_project_domain
-p483
-NsV_context_timestamp
-p484
-V2017-12-06 18:51:17.165237
-p485
-sVpublisher_id
-p486
-Vnetwork.machine-D
-p487
-sVmessage_id
-p488
-V05d48ee5-54c1-48e3-9e0f-4c21751bc176
-p489
-sV_context_roles
-p490
-(lp491
-Vadmin
-p492
-asVtimestamp
-p493
-V2017-12-06 18:51:17.373207
-p494
-sV_context_user
-p495
-Vef7a4f67379f41aba489a0b6d6a62094
-p496
-sV_unique_id
-p497
-V414423bd6ff243fba53bc22f96574995
-p498
-sV_context_tenant_id
-p499
-V187e5e95e7eb499d8a421b3d4ed966d5
-p500
-sV_context_project_name
-p501
-Vapexlake
-p502
-sV_context_user_identity
-p503
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p504
-sV_context_tenant
-p505
-V187e5e95e7eb499d8a421b3d4ed966d5
-p506
-sV_context_project_id
-p507
-V187e5e95e7eb499d8a421b3d4ed966d5
-p508
-sV_context_read_only
-p509
-I00
-sV_context_user_domain
-p510
-NsV_context_user_name
-p511
-Violie
-p512
-stp513
-a(F0.9002008438110352
-Vcompute.instance.volume.detach
-p514
-(dp515
-V_context_domain
-p516
-NsV_context_request_id
-p517
-Vreq-545bf03c-43f2-43bc-9c5f-d77b31c8a56a
-p518
-sV_context_quota_class
-p519
-NsVevent_type
-p520
-g514
-sV_context_service_catalog
-p521
-(lp522
-(dp523
-Vendpoints
-p524
-(lp525
-(dp526
-VadminURL
-p527
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p528
-sVregion
-p529
-VRegionOne
-p530
-sVinternalURL
-p531
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p532
-sVpublicURL
-p533
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p534
-sasVtype
-p535
-Vvolume
-p536
-sVname
-p537
-Vcinder
-p538
-sa(dp539
-g524
-(lp540
-(dp541
-g527
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p542
-sg529
-VRegionOne
-p543
-sg531
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p544
-sg533
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p545
-sasg535
-Vvolumev2
-p546
-sg537
-Vcinderv2
-p547
-sasV_context_auth_token
-p548
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p549
-sV_context_resource_uuid
-p550
-NsV_context_user_id
-p551
-Vef7a4f67379f41aba489a0b6d6a62094
-p552
-sVpayload
-p553
-(dp554
-Vstate_description
-p555
-V
-p556
-sVavailability_zone
-p557
-Vnova
-p558
-sVterminated_at
-p559
-g556
-sVephemeral_gb
-p560
-I0
-sVinstance_type_id
-p561
-I1
-sVdeleted_at
-p562
-g556
-sVreservation_id
-p563
-Vr-0hp3hep2
-p564
-sVmemory_mb
-p565
-I4096
-sVdisplay_name
-p566
-Vvm_test
-p567
-sVhostname
-p568
-Vvm-test
-p569
-sVstate
-p570
-Vactive
-p571
-sVprogress
-p572
-g556
-sVlaunched_at
-p573
-V2017-12-06T18:50:30.000000
-p574
-sVmetadata
-p575
-(dp576
-sVnode
-p577
-Vmachine-E
-p578
-sVramdisk_id
-p579
-g556
-sVaccess_ip_v6
-p580
-NsVdisk_gb
-p581
-I40
-sVaccess_ip_v4
-p582
-NsVkernel_id
-p583
-g556
-sVhost
-p584
-Vmachine-E
-p585
-sVvolume_id
-p586
-Vd79a82fa-a195-4086-beee-5c449c981708
-p587
-sVuser_id
-p588
-Vef7a4f67379f41aba489a0b6d6a62094
-p589
-sVimage_ref_url
-p590
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p591
-sVcell_name
-p592
-g556
-sVroot_gb
-p593
-I40
-sVtenant_id
-p594
-V187e5e95e7eb499d8a421b3d4ed966d5
-p595
-sVcreated_at
-p596
-V2017-12-06T18:50:19.000000
-p597
-sVinstance_id
-p598
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p599
-sVinstance_type
-p600
-Vm1.medium
-p601
-sVvcpus
-p602
-I2
-sVimage_meta
-p603
-(dp604
-Vmin_disk
-p605
-V40
-p606
-sVcontainer_format
-p607
-Vbare
-p608
-sVmin_ram
-p609
-V0
-p610
-sVdisk_format
-p611
-Vqcow2
-p612
-sVbase_image_ref
-p613
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p614
-ssVarchitecture
-p615
-NsVos_type
-p616
-NsVinstance_flavor_id
-p617
-V3
-p618
-ssV_context_show_deleted
-p619
-I00
-sVpriority
-p620
-VINFO
-p621
-sV_context_is_admin
-p622
-I01
-sV_context_project_domain
-p623
-NsV_context_timestamp
-p624
-V2017-12-06T18:51:17.466300
-p625
-sVpublisher_id
-p626
-Vcompute.machine-E
-p627
-sVmessage_id
-p628
-V08037905-f04b-45ca-baf5-bae70e509609
-p629
-sV_context_remote_address
-p630
-V172.16.0.5
-p631
-sV_context_roles
-p632
-(lp633
-Vadmin
-p634
-asVtimestamp
-p635
-V2017-12-06 18:51:18.267786
-p636
-sV_context_user
-p637
-Vef7a4f67379f41aba489a0b6d6a62094
-p638
-sV_unique_id
-p639
-V15cdd777c55446c48b4435a804bf2a18
-p640
-sV_context_project_name
-p641
-Vapexlake
-p642
-sV_context_read_deleted
-p643
-Vno
-p644
-sV_context_user_identity
-p645
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p646
-sV_context_tenant
-p647
-V187e5e95e7eb499d8a421b3d4ed966d5
-p648
-sV_context_instance_lock_checked
-p649
-I00
-sV_context_project_id
-p650
-V187e5e95e7eb499d8a421b3d4ed966d5
-p651
-sV_context_read_only
-p652
-I00
-sV_context_user_domain
-p653
-NsV_context_user_name
-p654
-Violie
-p655
-stp656
-a(F0.16101312637329102
-Vvolume.detach.start
-p657
-(dp658
-V_context_domain
-p659
-NsV_context_request_id
-p660
-Vreq-1585917d-c9d8-48f7-950f-a0652cbcfa0b
-p661
-sV_context_quota_class
-p662
-NsVevent_type
-p663
-g657
-sV_context_service_catalog
-p664
-(lp665
-(dp666
-Vendpoints
-p667
-(lp668
-(dp669
-VadminURL
-p670
-Vhttp://172.16.0.5:35357/v2.0
-p671
-sVregion
-p672
-VRegionOne
-p673
-sVinternalURL
-p674
-Vhttp://172.16.0.5:5000/v2.0
-p675
-sVpublicURL
-p676
-Vhttp://172.18.0.8:5000/v2.0
-p677
-sasVtype
-p678
-Videntity
-p679
-sVname
-p680
-Vkeystone
-p681
-sa(dp682
-g667
-(lp683
-(dp684
-g670
-Vhttp://172.16.0.5:8774/v2.1
-p685
-sg672
-VRegionOne
-p686
-sg674
-Vhttp://172.16.0.5:8774/v2.1
-p687
-sg676
-Vhttp://172.18.0.8:8774/v2.1
-p688
-sasg678
-Vcompute
-p689
-sg680
-Vnova
-p690
-sa(dp691
-g667
-(lp692
-(dp693
-g670
-Vhttp://172.16.0.5:8080/swift/v1
-p694
-sg672
-VRegionOne
-p695
-sg674
-Vhttp://172.16.0.5:8080/swift/v1
-p696
-sg676
-Vhttp://172.18.0.8:8080/swift/v1
-p697
-sasg678
-Vobject-store
-p698
-sg680
-Vswift
-p699
-sasV_context_auth_token
-p700
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p701
-sV_context_resource_uuid
-p702
-NsV_context_user_id
-p703
-Vef7a4f67379f41aba489a0b6d6a62094
-p704
-sVpayload
-p705
-(dp706
-Vstatus
-p707
-Vdetaching
-p708
-sVuser_id
-p709
-Vef7a4f67379f41aba489a0b6d6a62094
-p710
-sVdisplay_name
-p711
-Vgreen-volume_1-napoefd3kj54
-p712
-sVavailability_zone
-p713
-Vnova
-p714
-sVtenant_id
-p715
-V187e5e95e7eb499d8a421b3d4ed966d5
-p716
-sVcreated_at
-p717
-V2017-12-06T18:50:16
-p718
-sVvolume_attachment
-p719
-(lp720
-(dp721
-Vinstance_uuid
-p722
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p723
-sVattach_time
-p724
-V2017-12-06T18:50:34.000000
-p725
-sVdeleted
-p726
-I00
-sVattached_host
-p727
-Nsg717
-V2017-12-06T18:50:34.000000
-p728
-sVattach_mode
-p729
-Vrw
-p730
-sVupdated_at
-p731
-V2017-12-06T18:50:34.000000
-p732
-sVattach_status
-p733
-Vattached
-p734
-sVdetach_time
-p735
-NsVvolume_id
-p736
-Vd79a82fa-a195-4086-beee-5c449c981708
-p737
-sVmountpoint
-p738
-V/dev/vdb
-p739
-sVdeleted_at
-p740
-NsVid
-p741
-Vf80b4121-e9a1-4d19-970c-20362ab37e3d
-p742
-sasVvolume_type
-p743
-NsVhost
-p744
-Vrbd:volumes@RBD-backend#RBD-backend
-p745
-sVsnapshot_id
-p746
-NsVreplication_status
-p747
-Vdisabled
-p748
-sg736
-Vd79a82fa-a195-4086-beee-5c449c981708
-p749
-sVreplication_extended_status
-p750
-NsVreplication_driver_data
-p751
-NsVsize
-p752
-I1
-sVlaunched_at
-p753
-V2017-12-06T18:50:16
-p754
-sVmetadata
-p755
-(lp756
-ssV_context_show_deleted
-p757
-I00
-sVpriority
-p758
-VINFO
-p759
-sV_context_is_admin
-p760
-I01
-sV_context_project_domain
-p761
-NsV_context_timestamp
-p762
-V2017-12-06T18:51:18.286689+00:00
-p763
-sVpublisher_id
-p764
-Vvolume.rbd:volumes@RBD-backend
-p765
-sVmessage_id
-p766
-Vfe00f4ef-00ca-403d-89d9-5f3d0b002ce4
-p767
-sV_context_remote_address
-p768
-V172.16.0.5
-p769
-sV_context_roles
-p770
-(lp771
-Vadmin
-p772
-asVtimestamp
-p773
-V2017-12-06 18:51:18.433796
-p774
-sV_context_user
-p775
-Vef7a4f67379f41aba489a0b6d6a62094
-p776
-sV_unique_id
-p777
-Vf02277e7f189424192b848c5b5cd692a
-p778
-sV_context_project_name
-p779
-Vapexlake
-p780
-sV_context_read_deleted
-p781
-Vno
-p782
-sV_context_user_identity
-p783
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p784
-sV_context_tenant
-p785
-V187e5e95e7eb499d8a421b3d4ed966d5
-p786
-sV_context_project_id
-p787
-V187e5e95e7eb499d8a421b3d4ed966d5
-p788
-sV_context_read_only
-p789
-I00
-sV_context_user_domain
-p790
-Nstp791
-a(F0.19939899444580078
-Vvolume.detach.end
-p792
-(dp793
-V_context_domain
-p794
-NsV_context_request_id
-p795
-Vreq-1585917d-c9d8-48f7-950f-a0652cbcfa0b
-p796
-sV_context_quota_class
-p797
-NsVevent_type
-p798
-g792
-sV_context_service_catalog
-p799
-(lp800
-(dp801
-Vendpoints
-p802
-(lp803
-(dp804
-VadminURL
-p805
-Vhttp://172.16.0.5:35357/v2.0
-p806
-sVregion
-p807
-VRegionOne
-p808
-sVinternalURL
-p809
-Vhttp://172.16.0.5:5000/v2.0
-p810
-sVpublicURL
-p811
-Vhttp://172.18.0.8:5000/v2.0
-p812
-sasVtype
-p813
-Videntity
-p814
-sVname
-p815
-Vkeystone
-p816
-sa(dp817
-g802
-(lp818
-(dp819
-g805
-Vhttp://172.16.0.5:8774/v2.1
-p820
-sg807
-VRegionOne
-p821
-sg809
-Vhttp://172.16.0.5:8774/v2.1
-p822
-sg811
-Vhttp://172.18.0.8:8774/v2.1
-p823
-sasg813
-Vcompute
-p824
-sg815
-Vnova
-p825
-sa(dp826
-g802
-(lp827
-(dp828
-g805
-Vhttp://172.16.0.5:8080/swift/v1
-p829
-sg807
-VRegionOne
-p830
-sg809
-Vhttp://172.16.0.5:8080/swift/v1
-p831
-sg811
-Vhttp://172.18.0.8:8080/swift/v1
-p832
-sasg813
-Vobject-store
-p833
-sg815
-Vswift
-p834
-sasV_context_auth_token
-p835
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p836
-sV_context_resource_uuid
-p837
-NsV_context_user_id
-p838
-Vef7a4f67379f41aba489a0b6d6a62094
-p839
-sVpayload
-p840
-(dp841
-Vstatus
-p842
-Vavailable
-p843
-sVuser_id
-p844
-Vef7a4f67379f41aba489a0b6d6a62094
-p845
-sVdisplay_name
-p846
-Vgreen-volume_1-napoefd3kj54
-p847
-sVavailability_zone
-p848
-Vnova
-p849
-sVtenant_id
-p850
-V187e5e95e7eb499d8a421b3d4ed966d5
-p851
-sVcreated_at
-p852
-V2017-12-06T18:50:16
-p853
-sVvolume_attachment
-p854
-(lp855
-sVvolume_type
-p856
-NsVhost
-p857
-Vrbd:volumes@RBD-backend#RBD-backend
-p858
-sVsnapshot_id
-p859
-NsVreplication_status
-p860
-Vdisabled
-p861
-sVvolume_id
-p862
-Vd79a82fa-a195-4086-beee-5c449c981708
-p863
-sVreplication_extended_status
-p864
-NsVreplication_driver_data
-p865
-NsVsize
-p866
-I1
-sVlaunched_at
-p867
-V2017-12-06T18:50:16
-p868
-sVmetadata
-p869
-(lp870
-ssV_context_show_deleted
-p871
-I00
-sVpriority
-p872
-VINFO
-p873
-sV_context_is_admin
-p874
-I01
-sV_context_project_domain
-p875
-NsV_context_timestamp
-p876
-V2017-12-06T18:51:18.286689+00:00
-p877
-sVpublisher_id
-p878
-Vvolume.rbd:volumes@RBD-backend
-p879
-sVmessage_id
-p880
-V39b92a9e-8c6c-4ff6-a76b-4d1a1f303822
-p881
-sV_context_remote_address
-p882
-V172.16.0.5
-p883
-sV_context_roles
-p884
-(lp885
-Vadmin
-p886
-asVtimestamp
-p887
-V2017-12-06 18:51:18.631684
-p888
-sV_context_user
-p889
-Vef7a4f67379f41aba489a0b6d6a62094
-p890
-sV_unique_id
-p891
-V471c7861e78b4f54bed6132c49de2e44
-p892
-sV_context_project_name
-p893
-Vapexlake
-p894
-sV_context_read_deleted
-p895
-Vno
-p896
-sV_context_user_identity
-p897
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p898
-sV_context_tenant
-p899
-V187e5e95e7eb499d8a421b3d4ed966d5
-p900
-sV_context_project_id
-p901
-V187e5e95e7eb499d8a421b3d4ed966d5
-p902
-sV_context_read_only
-p903
-I00
-sV_context_user_domain
-p904
-Nstp905
-a(F1.423502016067505
-Vcompute.instance.update
-p906
-(dp907
-V_context_domain
-p908
-NsV_context_request_id
-p909
-Vreq-c15c61d2-8261-42ca-9da0-bbc31fcf3e77
-p910
-sV_context_quota_class
-p911
-NsVevent_type
-p912
-g906
-sV_context_service_catalog
-p913
-(lp914
-(dp915
-Vendpoints
-p916
-(lp917
-(dp918
-VadminURL
-p919
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p920
-sVregion
-p921
-VRegionOne
-p922
-sVinternalURL
-p923
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p924
-sVpublicURL
-p925
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p926
-sasVtype
-p927
-Vvolume
-p928
-sVname
-p929
-Vcinder
-p930
-sa(dp931
-g916
-(lp932
-(dp933
-g919
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p934
-sg921
-VRegionOne
-p935
-sg923
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p936
-sg925
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p937
-sasg927
-Vvolumev2
-p938
-sg929
-Vcinderv2
-p939
-sasV_context_auth_token
-p940
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p941
-sV_context_resource_uuid
-p942
-NsV_context_user_id
-p943
-Vef7a4f67379f41aba489a0b6d6a62094
-p944
-sVpayload
-p945
-(dp946
-Vstate_description
-p947
-Vdeleting
-p948
-sVavailability_zone
-p949
-Vnova
-p950
-sVterminated_at
-p951
-g556
-sVephemeral_gb
-p952
-I0
-sVinstance_type_id
-p953
-I1
-sVbandwidth
-p954
-(dp955
-sVdeleted_at
-p956
-g556
-sVreservation_id
-p957
-Vr-0hp3hep2
-p958
-sVmemory_mb
-p959
-I4096
-sVdisplay_name
-p960
-Vvm_test
-p961
-sVhostname
-p962
-Vvm-test
-p963
-sVstate
-p964
-Vactive
-p965
-sVold_state
-p966
-Vactive
-p967
-sVprogress
-p968
-g556
-sVlaunched_at
-p969
-V2017-12-06T18:50:30.000000
-p970
-sVmetadata
-p971
-(dp972
-sVnode
-p973
-Vmachine-E
-p974
-sVramdisk_id
-p975
-g556
-sVaccess_ip_v6
-p976
-NsVdisk_gb
-p977
-I40
-sVaccess_ip_v4
-p978
-NsVkernel_id
-p979
-g556
-sVhost
-p980
-Vmachine-E
-p981
-sVuser_id
-p982
-Vef7a4f67379f41aba489a0b6d6a62094
-p983
-sVimage_ref_url
-p984
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p985
-sVcell_name
-p986
-g556
-sVaudit_period_beginning
-p987
-V2017-12-01T00:00:00.000000
-p988
-sVroot_gb
-p989
-I40
-sVtenant_id
-p990
-V187e5e95e7eb499d8a421b3d4ed966d5
-p991
-sVcreated_at
-p992
-V2017-12-06T18:50:19.000000
-p993
-sVold_task_state
-p994
-Vdeleting
-p995
-sVinstance_id
-p996
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p997
-sVinstance_type
-p998
-Vm1.medium
-p999
-sVvcpus
-p1000
-I2
-sVimage_meta
-p1001
-(dp1002
-Vmin_disk
-p1003
-V40
-p1004
-sVcontainer_format
-p1005
-Vbare
-p1006
-sVmin_ram
-p1007
-V0
-p1008
-sVdisk_format
-p1009
-Vqcow2
-p1010
-sVbase_image_ref
-p1011
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1012
-ssVarchitecture
-p1013
-NsVnew_task_state
-p1014
-Vdeleting
-p1015
-sVaudit_period_ending
-p1016
-V2017-12-06T18:51:20.250044
-p1017
-sVos_type
-p1018
-NsVinstance_flavor_id
-p1019
-V3
-p1020
-ssV_context_show_deleted
-p1021
-I00
-sVpriority
-p1022
-VINFO
-p1023
-sV_context_is_admin
-p1024
-I01
-sV_context_project_domain
-p1025
-NsV_context_timestamp
-p1026
-V2017-12-06T18:51:20.117777
-p1027
-sVpublisher_id
-p1028
-Vcompute.machine-D
-p1029
-sVmessage_id
-p1030
-Ve49dcf1e-d70c-4577-805e-3c4731e2e265
-p1031
-sV_context_remote_address
-p1032
-V172.16.0.5
-p1033
-sV_context_roles
-p1034
-(lp1035
-Vadmin
-p1036
-asVtimestamp
-p1037
-V2017-12-06 18:51:20.254853
-p1038
-sV_context_user
-p1039
-Vef7a4f67379f41aba489a0b6d6a62094
-p1040
-sV_unique_id
-p1041
-Vc6677b6758c446d297230696a7d8785e
-p1042
-sV_context_project_name
-p1043
-Vapexlake
-p1044
-sV_context_read_deleted
-p1045
-Vno
-p1046
-sV_context_user_identity
-p1047
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1048
-sV_context_tenant
-p1049
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1050
-sV_context_instance_lock_checked
-p1051
-I00
-sV_context_project_id
-p1052
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1053
-sV_context_read_only
-p1054
-I00
-sV_context_user_domain
-p1055
-NsV_context_user_name
-p1056
-Violie
-p1057
-stp1058
-a(F0.03842806816101074
-Vcompute.instance.delete.start
-p1059
-(dp1060
-V_context_domain
-p1061
-NsV_context_request_id
-p1062
-Vreq-c15c61d2-8261-42ca-9da0-bbc31fcf3e77
-p1063
-sV_context_quota_class
-p1064
-NsVevent_type
-p1065
-g1059
-sV_context_service_catalog
-p1066
-(lp1067
-(dp1068
-Vendpoints
-p1069
-(lp1070
-(dp1071
-VadminURL
-p1072
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1073
-sVregion
-p1074
-VRegionOne
-p1075
-sVinternalURL
-p1076
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1077
-sVpublicURL
-p1078
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1079
-sasVtype
-p1080
-Vvolume
-p1081
-sVname
-p1082
-Vcinder
-p1083
-sa(dp1084
-g1069
-(lp1085
-(dp1086
-g1072
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1087
-sg1074
-VRegionOne
-p1088
-sg1076
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1089
-sg1078
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1090
-sasg1080
-Vvolumev2
-p1091
-sg1082
-Vcinderv2
-p1092
-sasV_context_auth_token
-p1093
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p1094
-sV_context_resource_uuid
-p1095
-NsV_context_user_id
-p1096
-Vef7a4f67379f41aba489a0b6d6a62094
-p1097
-sVpayload
-p1098
-(dp1099
-Vstate_description
-p1100
-Vdeleting
-p1101
-sVavailability_zone
-p1102
-Vnova
-p1103
-sVterminated_at
-p1104
-g556
-sVephemeral_gb
-p1105
-I0
-sVinstance_type_id
-p1106
-I1
-sVdeleted_at
-p1107
-g556
-sVreservation_id
-p1108
-Vr-0hp3hep2
-p1109
-sVmemory_mb
-p1110
-I4096
-sVdisplay_name
-p1111
-Vvm_test
-p1112
-sVhostname
-p1113
-Vvm-test
-p1114
-sVstate
-p1115
-Vactive
-p1116
-sVprogress
-p1117
-g556
-sVlaunched_at
-p1118
-V2017-12-06T18:50:30.000000
-p1119
-sVmetadata
-p1120
-(dp1121
-sVnode
-p1122
-Vmachine-E
-p1123
-sVramdisk_id
-p1124
-g556
-sVaccess_ip_v6
-p1125
-NsVdisk_gb
-p1126
-I40
-sVaccess_ip_v4
-p1127
-NsVkernel_id
-p1128
-g556
-sVhost
-p1129
-Vmachine-E
-p1130
-sVuser_id
-p1131
-Vef7a4f67379f41aba489a0b6d6a62094
-p1132
-sVimage_ref_url
-p1133
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1134
-sVcell_name
-p1135
-g556
-sVroot_gb
-p1136
-I40
-sVtenant_id
-p1137
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1138
-sVcreated_at
-p1139
-V2017-12-06T18:50:19.000000
-p1140
-sVinstance_id
-p1141
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1142
-sVinstance_type
-p1143
-Vm1.medium
-p1144
-sVvcpus
-p1145
-I2
-sVimage_meta
-p1146
-(dp1147
-Vmin_disk
-p1148
-V40
-p1149
-sVcontainer_format
-p1150
-Vbare
-p1151
-sVmin_ram
-p1152
-V0
-p1153
-sVdisk_format
-p1154
-Vqcow2
-p1155
-sVbase_image_ref
-p1156
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1157
-ssVarchitecture
-p1158
-NsVos_type
-p1159
-NsVinstance_flavor_id
-p1160
-V3
-p1161
-ssV_context_show_deleted
-p1162
-I00
-sVpriority
-p1163
-VINFO
-p1164
-sV_context_is_admin
-p1165
-I01
-sV_context_project_domain
-p1166
-NsV_context_timestamp
-p1167
-V2017-12-06T18:51:20.117777
-p1168
-sVpublisher_id
-p1169
-Vcompute.machine-E
-p1170
-sVmessage_id
-p1171
-Ve9aa71dc-52a9-42a6-9763-a0df92b531f3
-p1172
-sV_context_remote_address
-p1173
-V172.16.0.5
-p1174
-sV_context_roles
-p1175
-(lp1176
-Vadmin
-p1177
-asVtimestamp
-p1178
-V2017-12-06 18:51:20.292330
-p1179
-sV_context_user
-p1180
-Vef7a4f67379f41aba489a0b6d6a62094
-p1181
-sV_unique_id
-p1182
-V16f26560ea8c4c69b44a56bedaf4aa76
-p1183
-sV_context_project_name
-p1184
-Vapexlake
-p1185
-sV_context_read_deleted
-p1186
-Vno
-p1187
-sV_context_user_identity
-p1188
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1189
-sV_context_tenant
-p1190
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1191
-sV_context_instance_lock_checked
-p1192
-I00
-sV_context_project_id
-p1193
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1194
-sV_context_read_only
-p1195
-I00
-sV_context_user_domain
-p1196
-NsV_context_user_name
-p1197
-Violie
-p1198
-stp1199
-a(F0.005140781402587891
-Vcompute.instance.shutdown.start
-p1200
-(dp1201
-V_context_domain
-p1202
-NsV_context_request_id
-p1203
-Vreq-c15c61d2-8261-42ca-9da0-bbc31fcf3e77
-p1204
-sV_context_quota_class
-p1205
-NsVevent_type
-p1206
-g1200
-sV_context_service_catalog
-p1207
-(lp1208
-(dp1209
-Vendpoints
-p1210
-(lp1211
-(dp1212
-VadminURL
-p1213
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1214
-sVregion
-p1215
-VRegionOne
-p1216
-sVinternalURL
-p1217
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1218
-sVpublicURL
-p1219
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1220
-sasVtype
-p1221
-Vvolume
-p1222
-sVname
-p1223
-Vcinder
-p1224
-sa(dp1225
-g1210
-(lp1226
-(dp1227
-g1213
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1228
-sg1215
-VRegionOne
-p1229
-sg1217
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1230
-sg1219
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1231
-sasg1221
-Vvolumev2
-p1232
-sg1223
-Vcinderv2
-p1233
-sasV_context_auth_token
-p1234
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p1235
-sV_context_resource_uuid
-p1236
-NsV_context_user_id
-p1237
-Vef7a4f67379f41aba489a0b6d6a62094
-p1238
-sVpayload
-p1239
-(dp1240
-Vstate_description
-p1241
-Vdeleting
-p1242
-sVavailability_zone
-p1243
-Vnova
-p1244
-sVterminated_at
-p1245
-g556
-sVephemeral_gb
-p1246
-I0
-sVinstance_type_id
-p1247
-I1
-sVdeleted_at
-p1248
-g556
-sVreservation_id
-p1249
-Vr-0hp3hep2
-p1250
-sVmemory_mb
-p1251
-I4096
-sVdisplay_name
-p1252
-Vvm_test
-p1253
-sVhostname
-p1254
-Vvm-test
-p1255
-sVstate
-p1256
-Vactive
-p1257
-sVprogress
-p1258
-g556
-sVlaunched_at
-p1259
-V2017-12-06T18:50:30.000000
-p1260
-sVmetadata
-p1261
-(dp1262
-sVnode
-p1263
-Vmachine-E
-p1264
-sVramdisk_id
-p1265
-g556
-sVaccess_ip_v6
-p1266
-NsVdisk_gb
-p1267
-I40
-sVaccess_ip_v4
-p1268
-NsVkernel_id
-p1269
-g556
-sVhost
-p1270
-Vmachine-E
-p1271
-sVuser_id
-p1272
-Vef7a4f67379f41aba489a0b6d6a62094
-p1273
-sVimage_ref_url
-p1274
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1275
-sVcell_name
-p1276
-g556
-sVroot_gb
-p1277
-I40
-sVtenant_id
-p1278
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1279
-sVcreated_at
-p1280
-V2017-12-06T18:50:19.000000
-p1281
-sVinstance_id
-p1282
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1283
-sVinstance_type
-p1284
-Vm1.medium
-p1285
-sVvcpus
-p1286
-I2
-sVimage_meta
-p1287
-(dp1288
-Vmin_disk
-p1289
-V40
-p1290
-sVcontainer_format
-p1291
-Vbare
-p1292
-sVmin_ram
-p1293
-V0
-p1294
-sVdisk_format
-p1295
-Vqcow2
-p1296
-sVbase_image_ref
-p1297
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1298
-ssVarchitecture
-p1299
-NsVos_type
-p1300
-NsVinstance_flavor_id
-p1301
-V3
-p1302
-ssV_context_show_deleted
-p1303
-I00
-sVpriority
-p1304
-VINFO
-p1305
-sV_context_is_admin
-p1306
-I01
-sV_context_project_domain
-p1307
-NsV_context_timestamp
-p1308
-V2017-12-06T18:51:20.117777
-p1309
-sVpublisher_id
-p1310
-Vcompute.machine-E
-p1311
-sVmessage_id
-p1312
-Va6cf61be-da44-44bc-bd25-1a6512c586cc
-p1313
-sV_context_remote_address
-p1314
-V172.16.0.5
-p1315
-sV_context_roles
-p1316
-(lp1317
-Vadmin
-p1318
-asVtimestamp
-p1319
-V2017-12-06 18:51:20.297796
-p1320
-sV_context_user
-p1321
-Vef7a4f67379f41aba489a0b6d6a62094
-p1322
-sV_unique_id
-p1323
-V155fd7fbf98442a2b95450c06f3dfcc8
-p1324
-sV_context_project_name
-p1325
-Vapexlake
-p1326
-sV_context_read_deleted
-p1327
-Vno
-p1328
-sV_context_user_identity
-p1329
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1330
-sV_context_tenant
-p1331
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1332
-sV_context_instance_lock_checked
-p1333
-I00
-sV_context_project_id
-p1334
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1335
-sV_context_read_only
-p1336
-I00
-sV_context_user_domain
-p1337
-NsV_context_user_name
-p1338
-Violie
-p1339
-stp1340
-a(F1.3723800659179688
-Vvolume.delete.start
-p1341
-(dp1342
-V_context_domain
-p1343
-NsV_context_request_id
-p1344
-Vreq-ad2fb890-910e-41a8-a76a-945894524d03
-p1345
-sV_context_quota_class
-p1346
-NsVevent_type
-p1347
-g1341
-sV_context_service_catalog
-p1348
-(lp1349
-(dp1350
-Vendpoints
-p1351
-(lp1352
-(dp1353
-VadminURL
-p1354
-Vhttp://172.16.0.5:35357/v2.0
-p1355
-sVregion
-p1356
-VRegionOne
-p1357
-sVinternalURL
-p1358
-Vhttp://172.16.0.5:5000/v2.0
-p1359
-sVpublicURL
-p1360
-Vhttp://172.18.0.8:5000/v2.0
-p1361
-sasVtype
-p1362
-Videntity
-p1363
-sVname
-p1364
-Vkeystone
-p1365
-sa(dp1366
-g1351
-(lp1367
-(dp1368
-g1354
-Vhttp://172.16.0.5:8774/v2.1
-p1369
-sg1356
-VRegionOne
-p1370
-sg1358
-Vhttp://172.16.0.5:8774/v2.1
-p1371
-sg1360
-Vhttp://172.18.0.8:8774/v2.1
-p1372
-sasg1362
-Vcompute
-p1373
-sg1364
-Vnova
-p1374
-sa(dp1375
-g1351
-(lp1376
-(dp1377
-g1354
-Vhttp://172.16.0.5:8080/swift/v1
-p1378
-sg1356
-VRegionOne
-p1379
-sg1358
-Vhttp://172.16.0.5:8080/swift/v1
-p1380
-sg1360
-Vhttp://172.18.0.8:8080/swift/v1
-p1381
-sasg1362
-Vobject-store
-p1382
-sg1364
-Vswift
-p1383
-sasV_context_auth_token
-p1384
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p1385
-sV_context_resource_uuid
-p1386
-NsV_context_user_id
-p1387
-Vef7a4f67379f41aba489a0b6d6a62094
-p1388
-sVpayload
-p1389
-(dp1390
-Vstatus
-p1391
-Vdeleting
-p1392
-sVuser_id
-p1393
-Vef7a4f67379f41aba489a0b6d6a62094
-p1394
-sVdisplay_name
-p1395
-Vgreen-volume_1-napoefd3kj54
-p1396
-sVavailability_zone
-p1397
-Vnova
-p1398
-sVtenant_id
-p1399
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1400
-sVcreated_at
-p1401
-V2017-12-06T18:50:16+00:00
-p1402
-sVvolume_attachment
-p1403
-(lp1404
-sVvolume_type
-p1405
-NsVhost
-p1406
-Vrbd:volumes@RBD-backend#RBD-backend
-p1407
-sVsnapshot_id
-p1408
-NsVreplication_status
-p1409
-Vdisabled
-p1410
-sVvolume_id
-p1411
-Vd79a82fa-a195-4086-beee-5c449c981708
-p1412
-sVreplication_extended_status
-p1413
-NsVreplication_driver_data
-p1414
-NsVsize
-p1415
-I1
-sVlaunched_at
-p1416
-V2017-12-06T18:50:16+00:00
-p1417
-sVmetadata
-p1418
-(lp1419
-ssV_context_show_deleted
-p1420
-I00
-sVpriority
-p1421
-VINFO
-p1422
-sV_context_is_admin
-p1423
-I01
-sV_context_project_domain
-p1424
-NsV_context_timestamp
-p1425
-V2017-12-06T18:51:21.436745+00:00
-p1426
-sVpublisher_id
-p1427
-Vvolume.rbd:volumes@RBD-backend
-p1428
-sVmessage_id
-p1429
-Vcab83937-e622-4e80-8a19-f77113ed73ec
-p1430
-sV_context_remote_address
-p1431
-V172.16.0.5
-p1432
-sV_context_roles
-p1433
-(lp1434
-Vadmin
-p1435
-asVtimestamp
-p1436
-V2017-12-06 18:51:21.872186
-p1437
-sV_context_user
-p1438
-Vef7a4f67379f41aba489a0b6d6a62094
-p1439
-sV_unique_id
-p1440
-Vca589cd531ff4adda992f6dcba637097
-p1441
-sV_context_project_name
-p1442
-Vapexlake
-p1443
-sV_context_read_deleted
-p1444
-Vno
-p1445
-sV_context_user_identity
-p1446
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1447
-sV_context_tenant
-p1448
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1449
-sV_context_project_id
-p1450
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1451
-sV_context_read_only
-p1452
-I00
-sV_context_user_domain
-p1453
-Nstp1454
-a(F0.3871920108795166
-Vvolume.delete.end
-p1455
-(dp1456
-V_context_domain
-p1457
-NsV_context_request_id
-p1458
-Vreq-ad2fb890-910e-41a8-a76a-945894524d03
-p1459
-sV_context_quota_class
-p1460
-NsVevent_type
-p1461
-g1455
-sV_context_service_catalog
-p1462
-(lp1463
-(dp1464
-Vendpoints
-p1465
-(lp1466
-(dp1467
-VadminURL
-p1468
-Vhttp://172.16.0.5:35357/v2.0
-p1469
-sVregion
-p1470
-VRegionOne
-p1471
-sVinternalURL
-p1472
-Vhttp://172.16.0.5:5000/v2.0
-p1473
-sVpublicURL
-p1474
-Vhttp://172.18.0.8:5000/v2.0
-p1475
-sasVtype
-p1476
-Videntity
-p1477
-sVname
-p1478
-Vkeystone
-p1479
-sa(dp1480
-g1465
-(lp1481
-(dp1482
-g1468
-Vhttp://172.16.0.5:8774/v2.1
-p1483
-sg1470
-VRegionOne
-p1484
-sg1472
-Vhttp://172.16.0.5:8774/v2.1
-p1485
-sg1474
-Vhttp://172.18.0.8:8774/v2.1
-p1486
-sasg1476
-Vcompute
-p1487
-sg1478
-Vnova
-p1488
-sa(dp1489
-g1465
-(lp1490
-(dp1491
-g1468
-Vhttp://172.16.0.5:8080/swift/v1
-p1492
-sg1470
-VRegionOne
-p1493
-sg1472
-Vhttp://172.16.0.5:8080/swift/v1
-p1494
-sg1474
-Vhttp://172.18.0.8:8080/swift/v1
-p1495
-sasg1476
-Vobject-store
-p1496
-sg1478
-Vswift
-p1497
-sasV_context_auth_token
-p1498
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p1499
-sV_context_resource_uuid
-p1500
-NsV_context_user_id
-p1501
-Vef7a4f67379f41aba489a0b6d6a62094
-p1502
-sVpayload
-p1503
-(dp1504
-Vstatus
-p1505
-Vdeleting
-p1506
-sVuser_id
-p1507
-Vef7a4f67379f41aba489a0b6d6a62094
-p1508
-sVdisplay_name
-p1509
-Vgreen-volume_1-napoefd3kj54
-p1510
-sVavailability_zone
-p1511
-Vnova
-p1512
-sVtenant_id
-p1513
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1514
-sVcreated_at
-p1515
-V2017-12-06T18:50:16+00:00
-p1516
-sVvolume_attachment
-p1517
-(lp1518
-sVvolume_type
-p1519
-NsVhost
-p1520
-Vrbd:volumes@RBD-backend#RBD-backend
-p1521
-sVsnapshot_id
-p1522
-NsVreplication_status
-p1523
-Vdisabled
-p1524
-sVvolume_id
-p1525
-Vd79a82fa-a195-4086-beee-5c449c981708
-p1526
-sVreplication_extended_status
-p1527
-NsVreplication_driver_data
-p1528
-NsVsize
-p1529
-I1
-sVlaunched_at
-p1530
-V2017-12-06T18:50:16+00:00
-p1531
-sVmetadata
-p1532
-(lp1533
-ssV_context_show_deleted
-p1534
-I00
-sVpriority
-p1535
-VINFO
-p1536
-sV_context_is_admin
-p1537
-I01
-sV_context_project_domain
-p1538
-NsV_context_timestamp
-p1539
-V2017-12-06T18:51:21.436745+00:00
-p1540
-sVpublisher_id
-p1541
-Vvolume.rbd:volumes@RBD-backend
-p1542
-sVmessage_id
-p1543
-V2f9cb7e7-9362-4f42-9d73-4e601edf2bf4
-p1544
-sV_context_remote_address
-p1545
-V172.16.0.5
-p1546
-sV_context_roles
-p1547
-(lp1548
-Vadmin
-p1549
-asVtimestamp
-p1550
-V2017-12-06 18:51:22.260172
-p1551
-sV_context_user
-p1552
-Vef7a4f67379f41aba489a0b6d6a62094
-p1553
-sV_unique_id
-p1554
-Vc4cbc43576a94b08bfdb1c84b2668544
-p1555
-sV_context_project_name
-p1556
-Vapexlake
-p1557
-sV_context_read_deleted
-p1558
-Vno
-p1559
-sV_context_user_identity
-p1560
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1561
-sV_context_tenant
-p1562
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1563
-sV_context_project_id
-p1564
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1565
-sV_context_read_only
-p1566
-I00
-sV_context_user_domain
-p1567
-Nstp1568
-a(F0.7123250961303711
-Vcompute.instance.update
-p1569
-(dp1570
-V_context_domain
-p1571
-NsV_context_request_id
-p1572
-Vreq-c15c61d2-8261-42ca-9da0-bbc31fcf3e77
-p1573
-sV_context_quota_class
-p1574
-NsVevent_type
-p1575
-g1569
-sV_context_service_catalog
-p1576
-(lp1577
-(dp1578
-Vendpoints
-p1579
-(lp1580
-(dp1581
-VadminURL
-p1582
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1583
-sVregion
-p1584
-VRegionOne
-p1585
-sVinternalURL
-p1586
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1587
-sVpublicURL
-p1588
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1589
-sasVtype
-p1590
-Vvolume
-p1591
-sVname
-p1592
-Vcinder
-p1593
-sa(dp1594
-g1579
-(lp1595
-(dp1596
-g1582
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1597
-sg1584
-VRegionOne
-p1598
-sg1586
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1599
-sg1588
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1600
-sasg1590
-Vvolumev2
-p1601
-sg1592
-Vcinderv2
-p1602
-sasV_context_auth_token
-p1603
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p1604
-sV_context_resource_uuid
-p1605
-NsV_context_user_id
-p1606
-Vef7a4f67379f41aba489a0b6d6a62094
-p1607
-sVpayload
-p1608
-(dp1609
-Vstate_description
-p1610
-Vdeleting
-p1611
-sVavailability_zone
-p1612
-Vnova
-p1613
-sVterminated_at
-p1614
-g556
-sVephemeral_gb
-p1615
-I0
-sVinstance_type_id
-p1616
-I1
-sVbandwidth
-p1617
-(dp1618
-sVdeleted_at
-p1619
-g556
-sVreservation_id
-p1620
-Vr-0hp3hep2
-p1621
-sVmemory_mb
-p1622
-I4096
-sVdisplay_name
-p1623
-Vvm_test
-p1624
-sVhostname
-p1625
-Vvm-test
-p1626
-sVstate
-p1627
-Vactive
-p1628
-sVold_state
-p1629
-Vactive
-p1630
-sVprogress
-p1631
-g556
-sVlaunched_at
-p1632
-V2017-12-06T18:50:30.000000
-p1633
-sVmetadata
-p1634
-(dp1635
-sVnode
-p1636
-Vmachine-E
-p1637
-sVramdisk_id
-p1638
-g556
-sVaccess_ip_v6
-p1639
-NsVdisk_gb
-p1640
-I40
-sVaccess_ip_v4
-p1641
-NsVkernel_id
-p1642
-g556
-sVhost
-p1643
-Vmachine-E
-p1644
-sVuser_id
-p1645
-Vef7a4f67379f41aba489a0b6d6a62094
-p1646
-sVimage_ref_url
-p1647
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1648
-sVcell_name
-p1649
-g556
-sVaudit_period_beginning
-p1650
-V2017-12-01T00:00:00.000000
-p1651
-sVroot_gb
-p1652
-I40
-sVtenant_id
-p1653
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1654
-sVcreated_at
-p1655
-V2017-12-06T18:50:19.000000
-p1656
-sVold_task_state
-p1657
-Vdeleting
-p1658
-sVinstance_id
-p1659
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1660
-sVinstance_type
-p1661
-Vm1.medium
-p1662
-sVvcpus
-p1663
-I2
-sVimage_meta
-p1664
-(dp1665
-Vmin_disk
-p1666
-V40
-p1667
-sVcontainer_format
-p1668
-Vbare
-p1669
-sVmin_ram
-p1670
-V0
-p1671
-sVdisk_format
-p1672
-Vqcow2
-p1673
-sVbase_image_ref
-p1674
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1675
-ssVarchitecture
-p1676
-NsVnew_task_state
-p1677
-Vdeleting
-p1678
-sVaudit_period_ending
-p1679
-V2017-12-06T18:51:22.966366
-p1680
-sVos_type
-p1681
-NsVinstance_flavor_id
-p1682
-V3
-p1683
-ssV_context_show_deleted
-p1684
-I00
-sVpriority
-p1685
-VINFO
-p1686
-sV_context_is_admin
-p1687
-I01
-sV_context_project_domain
-p1688
-NsV_context_timestamp
-p1689
-V2017-12-06T18:51:20.117777
-p1690
-sVpublisher_id
-p1691
-Vcompute.machine-D
-p1692
-sVmessage_id
-p1693
-Ve162c033-0f65-4cd2-b64c-e7160244b68d
-p1694
-sV_context_remote_address
-p1695
-V172.16.0.5
-p1696
-sV_context_roles
-p1697
-(lp1698
-Vadmin
-p1699
-asVtimestamp
-p1700
-V2017-12-06 18:51:22.971620
-p1701
-sV_context_user
-p1702
-Vef7a4f67379f41aba489a0b6d6a62094
-p1703
-sV_unique_id
-p1704
-V1eafea3e1ca3497dbab301dd6e9c70b8
-p1705
-sV_context_project_name
-p1706
-Vapexlake
-p1707
-sV_context_read_deleted
-p1708
-Vno
-p1709
-sV_context_user_identity
-p1710
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1711
-sV_context_tenant
-p1712
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1713
-sV_context_instance_lock_checked
-p1714
-I00
-sV_context_project_id
-p1715
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1716
-sV_context_read_only
-p1717
-I00
-sV_context_user_domain
-p1718
-NsV_context_user_name
-p1719
-Violie
-p1720
-stp1721
-a(F0.05340981483459473
-Vport.update.start
-p1722
-(dp1723
-V_context_domain
-p1724
-NsV_context_request_id
-p1725
-Vreq-49dc5d81-a2fc-456a-bc57-60f8c128ecb9
-p1726
-sVevent_type
-p1727
-g1722
-sV_context_auth_token
-p1728
-VgAAAAABaKDC0wXHp29QemdyEz0-90tRDSHLLE1ODoSpZB787uDgJ-D8ZEkJnyxWc_DVJqL_cvAwDNpr9GPW7H1E1bD6JxVVb8ClV8CcbiKfaJo8Ce_yaCO1ZXl6trEwdu8W0qI_5tUlPL0rr-9tIaTy5lx6MOlmJ02IRshdTG2Un-vV-GjWldlg
-p1729
-sV_context_resource_uuid
-p1730
-NsV_context_tenant_name
-p1731
-Vservices
-p1732
-sV_context_user_id
-p1733
-V84faafdbb77b40c9a73047fdebb0ab45
-p1734
-sVpayload
-p1735
-(dp1736
-Vport
-p1737
-(dp1738
-Vbinding:profile
-p1739
-(dp1740
-sVdevice_owner
-p1741
-g556
-sVdns_name
-p1742
-g556
-sVbinding:host_id
-p1743
-NsVdevice_id
-p1744
-g556
-ssVid
-p1745
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p1746
-ssV_context_show_deleted
-p1747
-I00
-sVpriority
-p1748
-VINFO
-p1749
-sV_context_is_admin
-p1750
-I01
-sV_context_project_domain
-p1751
-NsV_context_timestamp
-p1752
-V2017-12-06 18:51:23.023404
-p1753
-sVpublisher_id
-p1754
-Vnetwork.machine-D
-p1755
-sVmessage_id
-p1756
-V701df462-a117-4345-b637-e9e2238e3565
-p1757
-sV_context_roles
-p1758
-(lp1759
-Vadmin
-p1760
-asVtimestamp
-p1761
-V2017-12-06 18:51:23.024493
-p1762
-sV_context_user
-p1763
-V84faafdbb77b40c9a73047fdebb0ab45
-p1764
-sV_unique_id
-p1765
-V6265e8c1998541c3ac9b3b6b1c1365ea
-p1766
-sV_context_tenant_id
-p1767
-V66fbf30f2dce4cef95d5248254dac9a5
-p1768
-sV_context_project_name
-p1769
-Vservices
-p1770
-sV_context_user_identity
-p1771
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p1772
-sV_context_tenant
-p1773
-V66fbf30f2dce4cef95d5248254dac9a5
-p1774
-sV_context_project_id
-p1775
-V66fbf30f2dce4cef95d5248254dac9a5
-p1776
-sV_context_read_only
-p1777
-I00
-sV_context_user_domain
-p1778
-NsV_context_user_name
-p1779
-Vneutron
-p1780
-stp1781
-a(F0.29085803031921387
-Vport.update.end
-p1782
-(dp1783
-V_context_domain
-p1784
-NsV_context_request_id
-p1785
-Vreq-49dc5d81-a2fc-456a-bc57-60f8c128ecb9
-p1786
-sVevent_type
-p1787
-g1782
-sV_context_auth_token
-p1788
-VgAAAAABaKDC0wXHp29QemdyEz0-90tRDSHLLE1ODoSpZB787uDgJ-D8ZEkJnyxWc_DVJqL_cvAwDNpr9GPW7H1E1bD6JxVVb8ClV8CcbiKfaJo8Ce_yaCO1ZXl6trEwdu8W0qI_5tUlPL0rr-9tIaTy5lx6MOlmJ02IRshdTG2Un-vV-GjWldlg
-p1789
-sV_context_resource_uuid
-p1790
-NsV_context_tenant_name
-p1791
-Vservices
-p1792
-sV_context_user_id
-p1793
-V84faafdbb77b40c9a73047fdebb0ab45
-p1794
-sVpayload
-p1795
-(dp1796
-Vport
-p1797
-(dp1798
-Vallowed_address_pairs
-p1799
-(lp1800
-sVextra_dhcp_opts
-p1801
-(lp1802
-sVupdated_at
-p1803
-V2017-12-06T18:51:23
-p1804
-sVdevice_owner
-p1805
-g556
-sVport_security_enabled
-p1806
-I01
-sVbinding:profile
-p1807
-(dp1808
-sVfixed_ips
-p1809
-(lp1810
-(dp1811
-Vsubnet_id
-p1812
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p1813
-sVip_address
-p1814
-V172.16.9.157
-p1815
-sasVid
-p1816
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p1817
-sVsecurity_groups
-p1818
-(lp1819
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p1820
-asVbinding:vif_details
-p1821
-(dp1822
-sVbinding:vif_type
-p1823
-Vunbound
-p1824
-sVmac_address
-p1825
-Vfa:16:3e:a0:d1:cf
-p1826
-sVstatus
-p1827
-VDOWN
-p1828
-sVbinding:host_id
-p1829
-g556
-sVdescription
-p1830
-g556
-sVdns_assignment
-p1831
-(lp1832
-(dp1833
-Vhostname
-p1834
-Vhost-172-16-9-157
-p1835
-sg1814
-V172.16.9.157
-p1836
-sVfqdn
-p1837
-Vhost-172-16-9-157.openstacklocal.
-p1838
-sasVdevice_id
-p1839
-g556
-sVname
-p1840
-Vgreen-server_port-fm3ogwps6zhw
-p1841
-sVadmin_state_up
-p1842
-I01
-sVnetwork_id
-p1843
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p1844
-sVdns_name
-p1845
-g556
-sVcreated_at
-p1846
-V2017-12-06T18:50:17
-p1847
-sVbinding:vnic_type
-p1848
-Vnormal
-p1849
-sVtenant_id
-p1850
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1851
-sssV_context_show_deleted
-p1852
-I00
-sVpriority
-p1853
-VINFO
-p1854
-sV_context_is_admin
-p1855
-I01
-sV_context_project_domain
-p1856
-NsV_context_timestamp
-p1857
-V2017-12-06 18:51:23.023404
-p1858
-sVpublisher_id
-p1859
-Vnetwork.machine-D
-p1860
-sVmessage_id
-p1861
-V1ce74b6a-2f5d-45dc-bc6c-af777eeabe46
-p1862
-sV_context_roles
-p1863
-(lp1864
-Vadmin
-p1865
-asVtimestamp
-p1866
-V2017-12-06 18:51:23.315948
-p1867
-sV_context_user
-p1868
-V84faafdbb77b40c9a73047fdebb0ab45
-p1869
-sV_unique_id
-p1870
-V659c7663a79e4f62afb7af3a00e42203
-p1871
-sV_context_tenant_id
-p1872
-V66fbf30f2dce4cef95d5248254dac9a5
-p1873
-sV_context_project_name
-p1874
-Vservices
-p1875
-sV_context_user_identity
-p1876
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p1877
-sV_context_tenant
-p1878
-V66fbf30f2dce4cef95d5248254dac9a5
-p1879
-sV_context_project_id
-p1880
-V66fbf30f2dce4cef95d5248254dac9a5
-p1881
-sV_context_read_only
-p1882
-I00
-sV_context_user_domain
-p1883
-NsV_context_user_name
-p1884
-Vneutron
-p1885
-stp1886
-a(F0.159804105758667
-Vcompute.instance.shutdown.end
-p1887
-(dp1888
-V_context_domain
-p1889
-NsV_context_request_id
-p1890
-Vreq-c15c61d2-8261-42ca-9da0-bbc31fcf3e77
-p1891
-sV_context_quota_class
-p1892
-NsVevent_type
-p1893
-g1887
-sV_context_service_catalog
-p1894
-(lp1895
-(dp1896
-Vendpoints
-p1897
-(lp1898
-(dp1899
-VadminURL
-p1900
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1901
-sVregion
-p1902
-VRegionOne
-p1903
-sVinternalURL
-p1904
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1905
-sVpublicURL
-p1906
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1907
-sasVtype
-p1908
-Vvolume
-p1909
-sVname
-p1910
-Vcinder
-p1911
-sa(dp1912
-g1897
-(lp1913
-(dp1914
-g1900
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1915
-sg1902
-VRegionOne
-p1916
-sg1904
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1917
-sg1906
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1918
-sasg1908
-Vvolumev2
-p1919
-sg1910
-Vcinderv2
-p1920
-sasV_context_auth_token
-p1921
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p1922
-sV_context_resource_uuid
-p1923
-NsV_context_user_id
-p1924
-Vef7a4f67379f41aba489a0b6d6a62094
-p1925
-sVpayload
-p1926
-(dp1927
-Vstate_description
-p1928
-Vdeleting
-p1929
-sVavailability_zone
-p1930
-Vnova
-p1931
-sVterminated_at
-p1932
-g556
-sVephemeral_gb
-p1933
-I0
-sVinstance_type_id
-p1934
-I1
-sVdeleted_at
-p1935
-g556
-sVreservation_id
-p1936
-Vr-0hp3hep2
-p1937
-sVmemory_mb
-p1938
-I4096
-sVdisplay_name
-p1939
-Vvm_test
-p1940
-sVhostname
-p1941
-Vvm-test
-p1942
-sVstate
-p1943
-Vactive
-p1944
-sVprogress
-p1945
-g556
-sVlaunched_at
-p1946
-V2017-12-06T18:50:30.000000
-p1947
-sVmetadata
-p1948
-(dp1949
-sVnode
-p1950
-Vmachine-E
-p1951
-sVramdisk_id
-p1952
-g556
-sVaccess_ip_v6
-p1953
-NsVdisk_gb
-p1954
-I40
-sVaccess_ip_v4
-p1955
-NsVkernel_id
-p1956
-g556
-sVhost
-p1957
-Vmachine-E
-p1958
-sVuser_id
-p1959
-Vef7a4f67379f41aba489a0b6d6a62094
-p1960
-sVimage_ref_url
-p1961
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1962
-sVcell_name
-p1963
-g556
-sVroot_gb
-p1964
-I40
-sVtenant_id
-p1965
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1966
-sVcreated_at
-p1967
-V2017-12-06T18:50:19.000000
-p1968
-sVinstance_id
-p1969
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p1970
-sVinstance_type
-p1971
-Vm1.medium
-p1972
-sVvcpus
-p1973
-I2
-sVimage_meta
-p1974
-(dp1975
-Vmin_disk
-p1976
-V40
-p1977
-sVcontainer_format
-p1978
-Vbare
-p1979
-sVmin_ram
-p1980
-V0
-p1981
-sVdisk_format
-p1982
-Vqcow2
-p1983
-sVbase_image_ref
-p1984
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1985
-ssVarchitecture
-p1986
-NsVos_type
-p1987
-NsVinstance_flavor_id
-p1988
-V3
-p1989
-ssV_context_show_deleted
-p1990
-I00
-sVpriority
-p1991
-VINFO
-p1992
-sV_context_is_admin
-p1993
-I01
-sV_context_project_domain
-p1994
-NsV_context_timestamp
-p1995
-V2017-12-06T18:51:20.117777
-p1996
-sVpublisher_id
-p1997
-Vcompute.machine-E
-p1998
-sVmessage_id
-p1999
-V2fe11f9c-c35f-4079-9eac-b24093414bae
-p2000
-sV_context_remote_address
-p2001
-V172.16.0.5
-p2002
-sV_context_roles
-p2003
-(lp2004
-Vadmin
-p2005
-asVtimestamp
-p2006
-V2017-12-06 18:51:23.473057
-p2007
-sV_context_user
-p2008
-Vef7a4f67379f41aba489a0b6d6a62094
-p2009
-sV_unique_id
-p2010
-V50e738b49d0749b6bb678f596c26c6b1
-p2011
-sV_context_project_name
-p2012
-Vapexlake
-p2013
-sV_context_read_deleted
-p2014
-Vno
-p2015
-sV_context_user_identity
-p2016
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2017
-sV_context_tenant
-p2018
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2019
-sV_context_instance_lock_checked
-p2020
-I00
-sV_context_project_id
-p2021
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2022
-sV_context_read_only
-p2023
-I00
-sV_context_user_domain
-p2024
-NsV_context_user_name
-p2025
-Violie
-p2026
-stp2027
-a(F0.09328889846801758
-Vcompute.instance.update
-p2028
-(dp2029
-V_context_domain
-p2030
-NsV_context_request_id
-p2031
-Vreq-c15c61d2-8261-42ca-9da0-bbc31fcf3e77
-p2032
-sV_context_quota_class
-p2033
-NsVevent_type
-p2034
-g2028
-sV_context_service_catalog
-p2035
-(lp2036
-(dp2037
-Vendpoints
-p2038
-(lp2039
-(dp2040
-VadminURL
-p2041
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2042
-sVregion
-p2043
-VRegionOne
-p2044
-sVinternalURL
-p2045
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2046
-sVpublicURL
-p2047
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2048
-sasVtype
-p2049
-Vvolume
-p2050
-sVname
-p2051
-Vcinder
-p2052
-sa(dp2053
-g2038
-(lp2054
-(dp2055
-g2041
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2056
-sg2043
-VRegionOne
-p2057
-sg2045
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2058
-sg2047
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2059
-sasg2049
-Vvolumev2
-p2060
-sg2051
-Vcinderv2
-p2061
-sasV_context_auth_token
-p2062
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2063
-sV_context_resource_uuid
-p2064
-NsV_context_user_id
-p2065
-Vef7a4f67379f41aba489a0b6d6a62094
-p2066
-sVpayload
-p2067
-(dp2068
-Vstate_description
-p2069
-g556
-sVavailability_zone
-p2070
-Vnova
-p2071
-sVterminated_at
-p2072
-V2017-12-06T18:51:23.000000
-p2073
-sVephemeral_gb
-p2074
-I0
-sVinstance_type_id
-p2075
-I1
-sVbandwidth
-p2076
-(dp2077
-sVdeleted_at
-p2078
-g556
-sVreservation_id
-p2079
-Vr-0hp3hep2
-p2080
-sVmemory_mb
-p2081
-I4096
-sVdisplay_name
-p2082
-Vvm_test
-p2083
-sVhostname
-p2084
-Vvm-test
-p2085
-sVstate
-p2086
-Vdeleted
-p2087
-sVold_state
-p2088
-Vactive
-p2089
-sVprogress
-p2090
-g556
-sVlaunched_at
-p2091
-V2017-12-06T18:50:30.000000
-p2092
-sVmetadata
-p2093
-(dp2094
-sVnode
-p2095
-Vmachine-E
-p2096
-sVramdisk_id
-p2097
-g556
-sVaccess_ip_v6
-p2098
-NsVdisk_gb
-p2099
-I40
-sVaccess_ip_v4
-p2100
-NsVkernel_id
-p2101
-g556
-sVhost
-p2102
-Vmachine-E
-p2103
-sVuser_id
-p2104
-Vef7a4f67379f41aba489a0b6d6a62094
-p2105
-sVimage_ref_url
-p2106
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2107
-sVcell_name
-p2108
-g556
-sVaudit_period_beginning
-p2109
-V2017-12-01T00:00:00.000000
-p2110
-sVroot_gb
-p2111
-I40
-sVtenant_id
-p2112
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2113
-sVcreated_at
-p2114
-V2017-12-06T18:50:19.000000
-p2115
-sVold_task_state
-p2116
-Vdeleting
-p2117
-sVinstance_id
-p2118
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2119
-sVinstance_type
-p2120
-Vm1.medium
-p2121
-sVvcpus
-p2122
-I2
-sVimage_meta
-p2123
-(dp2124
-Vmin_disk
-p2125
-V40
-p2126
-sVcontainer_format
-p2127
-Vbare
-p2128
-sVmin_ram
-p2129
-V0
-p2130
-sVdisk_format
-p2131
-Vqcow2
-p2132
-sVbase_image_ref
-p2133
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2134
-ssVarchitecture
-p2135
-NsVnew_task_state
-p2136
-NsVaudit_period_ending
-p2137
-V2017-12-06T18:51:23.564168
-p2138
-sVos_type
-p2139
-NsVinstance_flavor_id
-p2140
-V3
-p2141
-ssV_context_show_deleted
-p2142
-I00
-sVpriority
-p2143
-VINFO
-p2144
-sV_context_is_admin
-p2145
-I01
-sV_context_project_domain
-p2146
-NsV_context_timestamp
-p2147
-V2017-12-06T18:51:20.117777
-p2148
-sVpublisher_id
-p2149
-Vcompute.machine-D
-p2150
-sVmessage_id
-p2151
-V9122fcc0-719f-43a0-b1e6-4bfd799ee407
-p2152
-sV_context_remote_address
-p2153
-V172.16.0.5
-p2154
-sV_context_roles
-p2155
-(lp2156
-Vadmin
-p2157
-asVtimestamp
-p2158
-V2017-12-06 18:51:23.569165
-p2159
-sV_context_user
-p2160
-Vef7a4f67379f41aba489a0b6d6a62094
-p2161
-sV_unique_id
-p2162
-Vd7b458788f6649b98c8fc45f70e66817
-p2163
-sV_context_project_name
-p2164
-Vapexlake
-p2165
-sV_context_read_deleted
-p2166
-Vno
-p2167
-sV_context_user_identity
-p2168
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2169
-sV_context_tenant
-p2170
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2171
-sV_context_instance_lock_checked
-p2172
-I00
-sV_context_project_id
-p2173
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2174
-sV_context_read_only
-p2175
-I00
-sV_context_user_domain
-p2176
-NsV_context_user_name
-p2177
-Violie
-p2178
-stp2179
-a(F0.1042320728302002
-Vcompute.instance.delete.end
-p2180
-(dp2181
-V_context_domain
-p2182
-NsV_context_request_id
-p2183
-Vreq-c15c61d2-8261-42ca-9da0-bbc31fcf3e77
-p2184
-sV_context_quota_class
-p2185
-NsVevent_type
-p2186
-g2180
-sV_context_service_catalog
-p2187
-(lp2188
-(dp2189
-Vendpoints
-p2190
-(lp2191
-(dp2192
-VadminURL
-p2193
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2194
-sVregion
-p2195
-VRegionOne
-p2196
-sVinternalURL
-p2197
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2198
-sVpublicURL
-p2199
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2200
-sasVtype
-p2201
-Vvolume
-p2202
-sVname
-p2203
-Vcinder
-p2204
-sa(dp2205
-g2190
-(lp2206
-(dp2207
-g2193
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2208
-sg2195
-VRegionOne
-p2209
-sg2197
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2210
-sg2199
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2211
-sasg2201
-Vvolumev2
-p2212
-sg2203
-Vcinderv2
-p2213
-sasV_context_auth_token
-p2214
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2215
-sV_context_resource_uuid
-p2216
-NsV_context_user_id
-p2217
-Vef7a4f67379f41aba489a0b6d6a62094
-p2218
-sVpayload
-p2219
-(dp2220
-Vstate_description
-p2221
-g556
-sVavailability_zone
-p2222
-Vnova
-p2223
-sVterminated_at
-p2224
-V2017-12-06T18:51:23.488663
-p2225
-sVephemeral_gb
-p2226
-I0
-sVinstance_type_id
-p2227
-I1
-sVdeleted_at
-p2228
-V2017-12-06T18:51:23.000000
-p2229
-sVreservation_id
-p2230
-Vr-0hp3hep2
-p2231
-sVmemory_mb
-p2232
-I4096
-sVdisplay_name
-p2233
-Vvm_test
-p2234
-sVhostname
-p2235
-Vvm-test
-p2236
-sVstate
-p2237
-Vdeleted
-p2238
-sVprogress
-p2239
-g556
-sVlaunched_at
-p2240
-V2017-12-06T18:50:30.000000
-p2241
-sVmetadata
-p2242
-(dp2243
-sVnode
-p2244
-Vmachine-E
-p2245
-sVramdisk_id
-p2246
-g556
-sVaccess_ip_v6
-p2247
-NsVdisk_gb
-p2248
-I40
-sVaccess_ip_v4
-p2249
-NsVkernel_id
-p2250
-g556
-sVhost
-p2251
-Vmachine-E
-p2252
-sVuser_id
-p2253
-Vef7a4f67379f41aba489a0b6d6a62094
-p2254
-sVimage_ref_url
-p2255
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2256
-sVcell_name
-p2257
-g556
-sVroot_gb
-p2258
-I40
-sVtenant_id
-p2259
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2260
-sVcreated_at
-p2261
-V2017-12-06T18:50:19.000000
-p2262
-sVinstance_id
-p2263
-V7593155e-da6b-4b62-9d25-8196b7138f80
-p2264
-sVinstance_type
-p2265
-Vm1.medium
-p2266
-sVvcpus
-p2267
-I2
-sVimage_meta
-p2268
-(dp2269
-Vmin_disk
-p2270
-V40
-p2271
-sVcontainer_format
-p2272
-Vbare
-p2273
-sVmin_ram
-p2274
-V0
-p2275
-sVdisk_format
-p2276
-Vqcow2
-p2277
-sVbase_image_ref
-p2278
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2279
-ssVarchitecture
-p2280
-NsVos_type
-p2281
-NsVinstance_flavor_id
-p2282
-V3
-p2283
-ssV_context_show_deleted
-p2284
-I00
-sVpriority
-p2285
-VINFO
-p2286
-sV_context_is_admin
-p2287
-I01
-sV_context_project_domain
-p2288
-NsV_context_timestamp
-p2289
-V2017-12-06T18:51:20.117777
-p2290
-sVpublisher_id
-p2291
-Vcompute.machine-E
-p2292
-sVmessage_id
-p2293
-V9a214ad5-6765-4203-9f5a-89ebf6d58ce3
-p2294
-sV_context_remote_address
-p2295
-V172.16.0.5
-p2296
-sV_context_roles
-p2297
-(lp2298
-Vadmin
-p2299
-asVtimestamp
-p2300
-V2017-12-06 18:51:23.670999
-p2301
-sV_context_user
-p2302
-Vef7a4f67379f41aba489a0b6d6a62094
-p2303
-sV_unique_id
-p2304
-V24140633e1764d589ae3c064db4d176e
-p2305
-sV_context_project_name
-p2306
-Vapexlake
-p2307
-sV_context_read_deleted
-p2308
-Vno
-p2309
-sV_context_user_identity
-p2310
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2311
-sV_context_tenant
-p2312
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2313
-sV_context_instance_lock_checked
-p2314
-I00
-sV_context_project_id
-p2315
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2316
-sV_context_read_only
-p2317
-I00
-sV_context_user_domain
-p2318
-NsV_context_user_name
-p2319
-Violie
-p2320
-stp2321
-a(F0.4318399429321289
-Vport.delete.start
-p2322
-(dp2323
-V_context_domain
-p2324
-NsV_context_request_id
-p2325
-Vreq-fa3656d6-0921-4fa4-98f7-7379f2183b68
-p2326
-sVevent_type
-p2327
-g2322
-sV_context_auth_token
-p2328
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2329
-sV_context_resource_uuid
-p2330
-NsV_context_tenant_name
-p2331
-Vapexlake
-p2332
-sV_context_user_id
-p2333
-Vef7a4f67379f41aba489a0b6d6a62094
-p2334
-sVpayload
-p2335
-(dp2336
-Vport_id
-p2337
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p2338
-ssV_context_show_deleted
-p2339
-I00
-sVpriority
-p2340
-VINFO
-p2341
-sV_context_is_admin
-p2342
-I01
-sV_context_project_domain
-p2343
-NsV_context_timestamp
-p2344
-V2017-12-06 18:51:24.103727
-p2345
-sVpublisher_id
-p2346
-Vnetwork.machine-D
-p2347
-sVmessage_id
-p2348
-Vaa913fcd-71bd-4fcb-9e99-9bee8d185a66
-p2349
-sV_context_roles
-p2350
-(lp2351
-Vadmin
-p2352
-asVtimestamp
-p2353
-V2017-12-06 18:51:24.104778
-p2354
-sV_context_user
-p2355
-Vef7a4f67379f41aba489a0b6d6a62094
-p2356
-sV_unique_id
-p2357
-V868b2f1e31bb41528a3af9b8d776f251
-p2358
-sV_context_tenant_id
-p2359
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2360
-sV_context_project_name
-p2361
-Vapexlake
-p2362
-sV_context_user_identity
-p2363
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2364
-sV_context_tenant
-p2365
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2366
-sV_context_project_id
-p2367
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2368
-sV_context_read_only
-p2369
-I00
-sV_context_user_domain
-p2370
-NsV_context_user_name
-p2371
-Violie
-p2372
-stp2373
-a(F0.12790703773498535
-Vport.delete.end
-p2374
-(dp2375
-V_context_domain
-p2376
-NsV_context_request_id
-p2377
-Vreq-fa3656d6-0921-4fa4-98f7-7379f2183b68
-p2378
-sVevent_type
-p2379
-g2374
-sV_context_auth_token
-p2380
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2381
-sV_context_resource_uuid
-p2382
-NsV_context_tenant_name
-p2383
-Vapexlake
-p2384
-sV_context_user_id
-p2385
-Vef7a4f67379f41aba489a0b6d6a62094
-p2386
-sVpayload
-p2387
-(dp2388
-Vport_id
-p2389
-V26b65fc8-03be-41a6-9615-f1c123e0f78a
-p2390
-ssV_context_show_deleted
-p2391
-I00
-sVpriority
-p2392
-VINFO
-p2393
-sV_context_is_admin
-p2394
-I01
-sV_context_project_domain
-p2395
-NsV_context_timestamp
-p2396
-V2017-12-06 18:51:24.103727
-p2397
-sVpublisher_id
-p2398
-Vnetwork.machine-D
-p2399
-sVmessage_id
-p2400
-V5cc21188-836a-4b97-9b5d-9bde95ae2922
-p2401
-sV_context_roles
-p2402
-(lp2403
-Vadmin
-p2404
-asVtimestamp
-p2405
-V2017-12-06 18:51:24.234224
-p2406
-sV_context_user
-p2407
-Vef7a4f67379f41aba489a0b6d6a62094
-p2408
-sV_unique_id
-p2409
-V827218dc1cd14856bef2f93fd02ebd49
-p2410
-sV_context_tenant_id
-p2411
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2412
-sV_context_project_name
-p2413
-Vapexlake
-p2414
-sV_context_user_identity
-p2415
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2416
-sV_context_tenant
-p2417
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2418
-sV_context_project_id
-p2419
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2420
-sV_context_read_only
-p2421
-I00
-sV_context_user_domain
-p2422
-NsV_context_user_name
-p2423
-Violie
-p2424
-stp2425
-a(F0.9508579254150391
-Vsecurity_group_rule.delete.start
-p2426
-(dp2427
-V_context_domain
-p2428
-NsV_context_request_id
-p2429
-Vreq-757e36d0-8c8f-4436-a47d-c7b00a92a4d7
-p2430
-sVevent_type
-p2431
-g2426
-sV_context_auth_token
-p2432
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2433
-sV_context_resource_uuid
-p2434
-NsV_context_tenant_name
-p2435
-Vapexlake
-p2436
-sV_context_user_id
-p2437
-Vef7a4f67379f41aba489a0b6d6a62094
-p2438
-sVpayload
-p2439
-(dp2440
-Vsecurity_group_rule_id
-p2441
-V08258b04-0ceb-435a-9e8d-821b98b82466
-p2442
-ssV_context_show_deleted
-p2443
-I00
-sVpriority
-p2444
-VINFO
-p2445
-sV_context_is_admin
-p2446
-I01
-sV_context_project_domain
-p2447
-NsV_context_timestamp
-p2448
-V2017-12-06 18:51:25.381493
-p2449
-sVpublisher_id
-p2450
-Vnetwork.machine-D
-p2451
-sVmessage_id
-p2452
-Vcd49782b-d61c-40fa-adb7-b610379359a6
-p2453
-sV_context_roles
-p2454
-(lp2455
-Vadmin
-p2456
-asVtimestamp
-p2457
-V2017-12-06 18:51:25.383249
-p2458
-sV_context_user
-p2459
-Vef7a4f67379f41aba489a0b6d6a62094
-p2460
-sV_unique_id
-p2461
-V91c96893f9cf49d4977cbb5eb7256bf8
-p2462
-sV_context_tenant_id
-p2463
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2464
-sV_context_project_name
-p2465
-Vapexlake
-p2466
-sV_context_user_identity
-p2467
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2468
-sV_context_tenant
-p2469
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2470
-sV_context_project_id
-p2471
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2472
-sV_context_read_only
-p2473
-I00
-sV_context_user_domain
-p2474
-NsV_context_user_name
-p2475
-Violie
-p2476
-stp2477
-a(F0.03061699867248535
-Vsecurity_group_rule.delete.end
-p2478
-(dp2479
-V_context_domain
-p2480
-NsV_context_request_id
-p2481
-Vreq-757e36d0-8c8f-4436-a47d-c7b00a92a4d7
-p2482
-sVevent_type
-p2483
-g2478
-sV_context_auth_token
-p2484
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2485
-sV_context_resource_uuid
-p2486
-NsV_context_tenant_name
-p2487
-Vapexlake
-p2488
-sV_context_user_id
-p2489
-Vef7a4f67379f41aba489a0b6d6a62094
-p2490
-sVpayload
-p2491
-(dp2492
-Vsecurity_group_rule_id
-p2493
-V08258b04-0ceb-435a-9e8d-821b98b82466
-p2494
-ssV_context_show_deleted
-p2495
-I00
-sVpriority
-p2496
-VINFO
-p2497
-sV_context_is_admin
-p2498
-I01
-sV_context_project_domain
-p2499
-NsV_context_timestamp
-p2500
-V2017-12-06 18:51:25.381493
-p2501
-sVpublisher_id
-p2502
-Vnetwork.machine-D
-p2503
-sVmessage_id
-p2504
-V866c91e1-12b9-42ff-b6d9-0e93d031469f
-p2505
-sV_context_roles
-p2506
-(lp2507
-Vadmin
-p2508
-asVtimestamp
-p2509
-V2017-12-06 18:51:25.414647
-p2510
-sV_context_user
-p2511
-Vef7a4f67379f41aba489a0b6d6a62094
-p2512
-sV_unique_id
-p2513
-V161f3596e8604abc910277b8ad1a2eb4
-p2514
-sV_context_tenant_id
-p2515
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2516
-sV_context_project_name
-p2517
-Vapexlake
-p2518
-sV_context_user_identity
-p2519
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2520
-sV_context_tenant
-p2521
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2522
-sV_context_project_id
-p2523
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2524
-sV_context_read_only
-p2525
-I00
-sV_context_user_domain
-p2526
-NsV_context_user_name
-p2527
-Violie
-p2528
-stp2529
-a(F0.010615110397338867
-Vsecurity_group_rule.delete.start
-p2530
-(dp2531
-V_context_domain
-p2532
-NsV_context_request_id
-p2533
-Vreq-727d05df-0398-4f18-b3c2-1bd2aee3eb88
-p2534
-sVevent_type
-p2535
-g2530
-sV_context_auth_token
-p2536
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2537
-sV_context_resource_uuid
-p2538
-NsV_context_tenant_name
-p2539
-Vapexlake
-p2540
-sV_context_user_id
-p2541
-Vef7a4f67379f41aba489a0b6d6a62094
-p2542
-sVpayload
-p2543
-(dp2544
-Vsecurity_group_rule_id
-p2545
-V291a257a-a101-445e-9511-7d74d36e4f3e
-p2546
-ssV_context_show_deleted
-p2547
-I00
-sVpriority
-p2548
-VINFO
-p2549
-sV_context_is_admin
-p2550
-I01
-sV_context_project_domain
-p2551
-NsV_context_timestamp
-p2552
-V2017-12-06 18:51:25.425127
-p2553
-sVpublisher_id
-p2554
-Vnetwork.machine-D
-p2555
-sVmessage_id
-p2556
-Vdb46735d-3c26-454a-8bcd-5fc12f0fe0ea
-p2557
-sV_context_roles
-p2558
-(lp2559
-Vadmin
-p2560
-asVtimestamp
-p2561
-V2017-12-06 18:51:25.426275
-p2562
-sV_context_user
-p2563
-Vef7a4f67379f41aba489a0b6d6a62094
-p2564
-sV_unique_id
-p2565
-V623fb2deec3e4f349c6ddf24ca145069
-p2566
-sV_context_tenant_id
-p2567
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2568
-sV_context_project_name
-p2569
-Vapexlake
-p2570
-sV_context_user_identity
-p2571
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2572
-sV_context_tenant
-p2573
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2574
-sV_context_project_id
-p2575
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2576
-sV_context_read_only
-p2577
-I00
-sV_context_user_domain
-p2578
-NsV_context_user_name
-p2579
-Violie
-p2580
-stp2581
-a(F0.03257298469543457
-Vsecurity_group_rule.delete.end
-p2582
-(dp2583
-V_context_domain
-p2584
-NsV_context_request_id
-p2585
-Vreq-727d05df-0398-4f18-b3c2-1bd2aee3eb88
-p2586
-sVevent_type
-p2587
-g2582
-sV_context_auth_token
-p2588
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2589
-sV_context_resource_uuid
-p2590
-NsV_context_tenant_name
-p2591
-Vapexlake
-p2592
-sV_context_user_id
-p2593
-Vef7a4f67379f41aba489a0b6d6a62094
-p2594
-sVpayload
-p2595
-(dp2596
-Vsecurity_group_rule_id
-p2597
-V291a257a-a101-445e-9511-7d74d36e4f3e
-p2598
-ssV_context_show_deleted
-p2599
-I00
-sVpriority
-p2600
-VINFO
-p2601
-sV_context_is_admin
-p2602
-I01
-sV_context_project_domain
-p2603
-NsV_context_timestamp
-p2604
-V2017-12-06 18:51:25.425127
-p2605
-sVpublisher_id
-p2606
-Vnetwork.machine-D
-p2607
-sVmessage_id
-p2608
-V664dbb4e-25ac-4f75-92a1-e99cdf613445
-p2609
-sV_context_roles
-p2610
-(lp2611
-Vadmin
-p2612
-asVtimestamp
-p2613
-V2017-12-06 18:51:25.458476
-p2614
-sV_context_user
-p2615
-Vef7a4f67379f41aba489a0b6d6a62094
-p2616
-sV_unique_id
-p2617
-Vb9c03ad4a49144beb807a91f58ca1e73
-p2618
-sV_context_tenant_id
-p2619
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2620
-sV_context_project_name
-p2621
-Vapexlake
-p2622
-sV_context_user_identity
-p2623
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2624
-sV_context_tenant
-p2625
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2626
-sV_context_project_id
-p2627
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2628
-sV_context_read_only
-p2629
-I00
-sV_context_user_domain
-p2630
-NsV_context_user_name
-p2631
-Violie
-p2632
-stp2633
-a(F0.016422033309936523
-Vsecurity_group_rule.delete.start
-p2634
-(dp2635
-V_context_domain
-p2636
-NsV_context_request_id
-p2637
-Vreq-60668569-32fe-4070-83ed-8797eaa6ffc9
-p2638
-sVevent_type
-p2639
-g2634
-sV_context_auth_token
-p2640
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2641
-sV_context_resource_uuid
-p2642
-NsV_context_tenant_name
-p2643
-Vapexlake
-p2644
-sV_context_user_id
-p2645
-Vef7a4f67379f41aba489a0b6d6a62094
-p2646
-sVpayload
-p2647
-(dp2648
-Vsecurity_group_rule_id
-p2649
-V3a78d254-93c0-4336-8703-6fc4b723c6b1
-p2650
-ssV_context_show_deleted
-p2651
-I00
-sVpriority
-p2652
-VINFO
-p2653
-sV_context_is_admin
-p2654
-I01
-sV_context_project_domain
-p2655
-NsV_context_timestamp
-p2656
-V2017-12-06 18:51:25.469249
-p2657
-sVpublisher_id
-p2658
-Vnetwork.machine-D
-p2659
-sVmessage_id
-p2660
-V13f8026c-039e-47f6-b643-3d00f68e5c79
-p2661
-sV_context_roles
-p2662
-(lp2663
-Vadmin
-p2664
-asVtimestamp
-p2665
-V2017-12-06 18:51:25.470938
-p2666
-sV_context_user
-p2667
-Vef7a4f67379f41aba489a0b6d6a62094
-p2668
-sV_unique_id
-p2669
-Vd99c8b3d97414d0cb510d402bdfb6e93
-p2670
-sV_context_tenant_id
-p2671
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2672
-sV_context_project_name
-p2673
-Vapexlake
-p2674
-sV_context_user_identity
-p2675
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2676
-sV_context_tenant
-p2677
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2678
-sV_context_project_id
-p2679
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2680
-sV_context_read_only
-p2681
-I00
-sV_context_user_domain
-p2682
-NsV_context_user_name
-p2683
-Violie
-p2684
-stp2685
-a(F0.025799989700317383
-Vsecurity_group_rule.delete.end
-p2686
-(dp2687
-V_context_domain
-p2688
-NsV_context_request_id
-p2689
-Vreq-60668569-32fe-4070-83ed-8797eaa6ffc9
-p2690
-sVevent_type
-p2691
-g2686
-sV_context_auth_token
-p2692
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2693
-sV_context_resource_uuid
-p2694
-NsV_context_tenant_name
-p2695
-Vapexlake
-p2696
-sV_context_user_id
-p2697
-Vef7a4f67379f41aba489a0b6d6a62094
-p2698
-sVpayload
-p2699
-(dp2700
-Vsecurity_group_rule_id
-p2701
-V3a78d254-93c0-4336-8703-6fc4b723c6b1
-p2702
-ssV_context_show_deleted
-p2703
-I00
-sVpriority
-p2704
-VINFO
-p2705
-sV_context_is_admin
-p2706
-I01
-sV_context_project_domain
-p2707
-NsV_context_timestamp
-p2708
-V2017-12-06 18:51:25.469249
-p2709
-sVpublisher_id
-p2710
-Vnetwork.machine-D
-p2711
-sVmessage_id
-p2712
-V4e8c0018-353a-4745-bab7-4482b00171c3
-p2713
-sV_context_roles
-p2714
-(lp2715
-Vadmin
-p2716
-asVtimestamp
-p2717
-V2017-12-06 18:51:25.501087
-p2718
-sV_context_user
-p2719
-Vef7a4f67379f41aba489a0b6d6a62094
-p2720
-sV_unique_id
-p2721
-Vf36702aea00e42689114870d916e4643
-p2722
-sV_context_tenant_id
-p2723
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2724
-sV_context_project_name
-p2725
-Vapexlake
-p2726
-sV_context_user_identity
-p2727
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2728
-sV_context_tenant
-p2729
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2730
-sV_context_project_id
-p2731
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2732
-sV_context_read_only
-p2733
-I00
-sV_context_user_domain
-p2734
-NsV_context_user_name
-p2735
-Violie
-p2736
-stp2737
-a(F0.009357929229736328
-Vsecurity_group_rule.delete.start
-p2738
-(dp2739
-V_context_domain
-p2740
-NsV_context_request_id
-p2741
-Vreq-f5e88adc-8816-428e-a766-1bc250c4b8b9
-p2742
-sVevent_type
-p2743
-g2738
-sV_context_auth_token
-p2744
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2745
-sV_context_resource_uuid
-p2746
-NsV_context_tenant_name
-p2747
-Vapexlake
-p2748
-sV_context_user_id
-p2749
-Vef7a4f67379f41aba489a0b6d6a62094
-p2750
-sVpayload
-p2751
-(dp2752
-Vsecurity_group_rule_id
-p2753
-V7b4b3414-3153-4766-8b93-cb192f827de4
-p2754
-ssV_context_show_deleted
-p2755
-I00
-sVpriority
-p2756
-VINFO
-p2757
-sV_context_is_admin
-p2758
-I01
-sV_context_project_domain
-p2759
-NsV_context_timestamp
-p2760
-V2017-12-06 18:51:25.509553
-p2761
-sVpublisher_id
-p2762
-Vnetwork.machine-D
-p2763
-sVmessage_id
-p2764
-V2f7c15ac-0283-491d-a2be-144ebbb0e5c3
-p2765
-sV_context_roles
-p2766
-(lp2767
-Vadmin
-p2768
-asVtimestamp
-p2769
-V2017-12-06 18:51:25.510507
-p2770
-sV_context_user
-p2771
-Vef7a4f67379f41aba489a0b6d6a62094
-p2772
-sV_unique_id
-p2773
-Vd9619d498cec4f11900013c6a3ef0b76
-p2774
-sV_context_tenant_id
-p2775
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2776
-sV_context_project_name
-p2777
-Vapexlake
-p2778
-sV_context_user_identity
-p2779
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2780
-sV_context_tenant
-p2781
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2782
-sV_context_project_id
-p2783
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2784
-sV_context_read_only
-p2785
-I00
-sV_context_user_domain
-p2786
-NsV_context_user_name
-p2787
-Violie
-p2788
-stp2789
-a(F0.028445959091186523
-Vsecurity_group_rule.delete.end
-p2790
-(dp2791
-V_context_domain
-p2792
-NsV_context_request_id
-p2793
-Vreq-f5e88adc-8816-428e-a766-1bc250c4b8b9
-p2794
-sVevent_type
-p2795
-g2790
-sV_context_auth_token
-p2796
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2797
-sV_context_resource_uuid
-p2798
-NsV_context_tenant_name
-p2799
-Vapexlake
-p2800
-sV_context_user_id
-p2801
-Vef7a4f67379f41aba489a0b6d6a62094
-p2802
-sVpayload
-p2803
-(dp2804
-Vsecurity_group_rule_id
-p2805
-V7b4b3414-3153-4766-8b93-cb192f827de4
-p2806
-ssV_context_show_deleted
-p2807
-I00
-sVpriority
-p2808
-VINFO
-p2809
-sV_context_is_admin
-p2810
-I01
-sV_context_project_domain
-p2811
-NsV_context_timestamp
-p2812
-V2017-12-06 18:51:25.509553
-p2813
-sVpublisher_id
-p2814
-Vnetwork.machine-D
-p2815
-sVmessage_id
-p2816
-Vcd183721-7338-42b6-b9b0-7e9927826400
-p2817
-sV_context_roles
-p2818
-(lp2819
-Vadmin
-p2820
-asVtimestamp
-p2821
-V2017-12-06 18:51:25.538513
-p2822
-sV_context_user
-p2823
-Vef7a4f67379f41aba489a0b6d6a62094
-p2824
-sV_unique_id
-p2825
-V499f1f65f3394c1f8829f73e8117ae72
-p2826
-sV_context_tenant_id
-p2827
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2828
-sV_context_project_name
-p2829
-Vapexlake
-p2830
-sV_context_user_identity
-p2831
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2832
-sV_context_tenant
-p2833
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2834
-sV_context_project_id
-p2835
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2836
-sV_context_read_only
-p2837
-I00
-sV_context_user_domain
-p2838
-NsV_context_user_name
-p2839
-Violie
-p2840
-stp2841
-a(F0.009576082229614258
-Vsecurity_group_rule.delete.start
-p2842
-(dp2843
-V_context_domain
-p2844
-NsV_context_request_id
-p2845
-Vreq-de2c9e18-b5f1-4458-a2e6-ec7a5f6a00a4
-p2846
-sVevent_type
-p2847
-g2842
-sV_context_auth_token
-p2848
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2849
-sV_context_resource_uuid
-p2850
-NsV_context_tenant_name
-p2851
-Vapexlake
-p2852
-sV_context_user_id
-p2853
-Vef7a4f67379f41aba489a0b6d6a62094
-p2854
-sVpayload
-p2855
-(dp2856
-Vsecurity_group_rule_id
-p2857
-Va2231a85-a009-413d-bfef-28c12748937a
-p2858
-ssV_context_show_deleted
-p2859
-I00
-sVpriority
-p2860
-VINFO
-p2861
-sV_context_is_admin
-p2862
-I01
-sV_context_project_domain
-p2863
-NsV_context_timestamp
-p2864
-V2017-12-06 18:51:25.547615
-p2865
-sVpublisher_id
-p2866
-Vnetwork.machine-D
-p2867
-sVmessage_id
-p2868
-Vf49fe101-f6c4-4e24-a3b0-a8a7f58d2b68
-p2869
-sV_context_roles
-p2870
-(lp2871
-Vadmin
-p2872
-asVtimestamp
-p2873
-V2017-12-06 18:51:25.548559
-p2874
-sV_context_user
-p2875
-Vef7a4f67379f41aba489a0b6d6a62094
-p2876
-sV_unique_id
-p2877
-V209219f51827495ca7c46b18a9f41876
-p2878
-sV_context_tenant_id
-p2879
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2880
-sV_context_project_name
-p2881
-Vapexlake
-p2882
-sV_context_user_identity
-p2883
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2884
-sV_context_tenant
-p2885
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2886
-sV_context_project_id
-p2887
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2888
-sV_context_read_only
-p2889
-I00
-sV_context_user_domain
-p2890
-NsV_context_user_name
-p2891
-Violie
-p2892
-stp2893
-a(F0.025557994842529297
-Vsecurity_group_rule.delete.end
-p2894
-(dp2895
-V_context_domain
-p2896
-NsV_context_request_id
-p2897
-Vreq-de2c9e18-b5f1-4458-a2e6-ec7a5f6a00a4
-p2898
-sVevent_type
-p2899
-g2894
-sV_context_auth_token
-p2900
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2901
-sV_context_resource_uuid
-p2902
-NsV_context_tenant_name
-p2903
-Vapexlake
-p2904
-sV_context_user_id
-p2905
-Vef7a4f67379f41aba489a0b6d6a62094
-p2906
-sVpayload
-p2907
-(dp2908
-Vsecurity_group_rule_id
-p2909
-Va2231a85-a009-413d-bfef-28c12748937a
-p2910
-ssV_context_show_deleted
-p2911
-I00
-sVpriority
-p2912
-VINFO
-p2913
-sV_context_is_admin
-p2914
-I01
-sV_context_project_domain
-p2915
-NsV_context_timestamp
-p2916
-V2017-12-06 18:51:25.547615
-p2917
-sVpublisher_id
-p2918
-Vnetwork.machine-D
-p2919
-sVmessage_id
-p2920
-V1f506f21-0dd1-4970-9aaa-9187a422145c
-p2921
-sV_context_roles
-p2922
-(lp2923
-Vadmin
-p2924
-asVtimestamp
-p2925
-V2017-12-06 18:51:25.573943
-p2926
-sV_context_user
-p2927
-Vef7a4f67379f41aba489a0b6d6a62094
-p2928
-sV_unique_id
-p2929
-Vf9ecba5212894905b47bbf15a3692c48
-p2930
-sV_context_tenant_id
-p2931
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2932
-sV_context_project_name
-p2933
-Vapexlake
-p2934
-sV_context_user_identity
-p2935
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2936
-sV_context_tenant
-p2937
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2938
-sV_context_project_id
-p2939
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2940
-sV_context_read_only
-p2941
-I00
-sV_context_user_domain
-p2942
-NsV_context_user_name
-p2943
-Violie
-p2944
-stp2945
-a(F0.009833097457885742
-Vsecurity_group.delete.start
-p2946
-(dp2947
-V_context_domain
-p2948
-NsV_context_request_id
-p2949
-Vreq-81d9ac79-bd4d-4ebd-8bab-f6e0193a3f6f
-p2950
-sVevent_type
-p2951
-g2946
-sV_context_auth_token
-p2952
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p2953
-sV_context_resource_uuid
-p2954
-NsV_context_tenant_name
-p2955
-Vapexlake
-p2956
-sV_context_user_id
-p2957
-Vef7a4f67379f41aba489a0b6d6a62094
-p2958
-sVpayload
-p2959
-(dp2960
-Vsecurity_group_id
-p2961
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p2962
-ssV_context_show_deleted
-p2963
-I00
-sVpriority
-p2964
-VINFO
-p2965
-sV_context_is_admin
-p2966
-I01
-sV_context_project_domain
-p2967
-NsV_context_timestamp
-p2968
-V2017-12-06 18:51:25.582696
-p2969
-sVpublisher_id
-p2970
-Vnetwork.machine-D
-p2971
-sVmessage_id
-p2972
-V3f8981af-a735-43ed-b6e4-c612fb37fd15
-p2973
-sV_context_roles
-p2974
-(lp2975
-Vadmin
-p2976
-asVtimestamp
-p2977
-V2017-12-06 18:51:25.583921
-p2978
-sV_context_user
-p2979
-Vef7a4f67379f41aba489a0b6d6a62094
-p2980
-sV_unique_id
-p2981
-V8fe18196f347440f977792247e1254cb
-p2982
-sV_context_tenant_id
-p2983
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2984
-sV_context_project_name
-p2985
-Vapexlake
-p2986
-sV_context_user_identity
-p2987
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2988
-sV_context_tenant
-p2989
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2990
-sV_context_project_id
-p2991
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2992
-sV_context_read_only
-p2993
-I00
-sV_context_user_domain
-p2994
-NsV_context_user_name
-p2995
-Violie
-p2996
-stp2997
-a(F0.03979682922363281
-Vsecurity_group.delete.end
-p2998
-(dp2999
-V_context_domain
-p3000
-NsV_context_request_id
-p3001
-Vreq-81d9ac79-bd4d-4ebd-8bab-f6e0193a3f6f
-p3002
-sVevent_type
-p3003
-g2998
-sV_context_auth_token
-p3004
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p3005
-sV_context_resource_uuid
-p3006
-NsV_context_tenant_name
-p3007
-Vapexlake
-p3008
-sV_context_user_id
-p3009
-Vef7a4f67379f41aba489a0b6d6a62094
-p3010
-sVpayload
-p3011
-(dp3012
-Vsecurity_group_id
-p3013
-V6d8942ea-bc65-4367-b172-3f26080443f9
-p3014
-ssV_context_show_deleted
-p3015
-I00
-sVpriority
-p3016
-VINFO
-p3017
-sV_context_is_admin
-p3018
-I01
-sV_context_project_domain
-p3019
-NsV_context_timestamp
-p3020
-V2017-12-06 18:51:25.582696
-p3021
-sVpublisher_id
-p3022
-Vnetwork.machine-D
-p3023
-sVmessage_id
-p3024
-V2c7ff7c8-aaed-477f-8bd4-4002b703fda9
-p3025
-sV_context_roles
-p3026
-(lp3027
-Vadmin
-p3028
-asVtimestamp
-p3029
-V2017-12-06 18:51:25.623542
-p3030
-sV_context_user
-p3031
-Vef7a4f67379f41aba489a0b6d6a62094
-p3032
-sV_unique_id
-p3033
-V040272e07bb84c74b57ad35dfde1560a
-p3034
-sV_context_tenant_id
-p3035
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3036
-sV_context_project_name
-p3037
-Vapexlake
-p3038
-sV_context_user_identity
-p3039
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3040
-sV_context_tenant
-p3041
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3042
-sV_context_project_id
-p3043
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3044
-sV_context_read_only
-p3045
-I00
-sV_context_user_domain
-p3046
-NsV_context_user_name
-p3047
-Violie
-p3048
-stp3049
-a(F1.0799789905548096
-Vorchestration.stack.delete.end
-p3050
-(dp3051
-V_context_request_id
-p3052
-Vreq-827c6fe9-8a9c-4f38-bc6d-a80e705389f8
-p3053
-sVevent_type
-p3054
-g3050
-sV_context_region_name
-p3055
-NsV_context_auth_token
-p3056
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p3057
-sV_context_user_id
-p3058
-Vef7a4f67379f41aba489a0b6d6a62094
-p3059
-sVpayload
-p3060
-(dp3061
-Vusername
-p3062
-NsVstate_reason
-p3063
-VStack DELETE completed successfully
-p3064
-sVuser_id
-p3065
-NsVuser_identity
-p3066
-Vef7a4f67379f41aba489a0b6d6a62094
-p3067
-sVstack_name
-p3068
-Vgreen
-p3069
-sVtenant_id
-p3070
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3071
-sVstack_identity
-p3072
-V7ab82262-5bd0-4047-89b9-9c9ca4ee979b
-p3073
-sVcreate_at
-p3074
-V2017-12-06T18:50:15
-p3075
-sVstate
-p3076
-VDELETE_COMPLETE
-p3077
-ssV_context_username
-p3078
-NsV_context_show_deleted
-p3079
-I00
-sV_context_trust_id
-p3080
-NsVpriority
-p3081
-VINFO
-p3082
-sV_context_is_admin
-p3083
-I01
-sV_context_auth_token_info
-p3084
-(dp3085
-Vtoken
-p3086
-(dp3087
-Vmethods
-p3088
-(lp3089
-Vpassword
-p3090
-asVroles
-p3091
-(lp3092
-(dp3093
-Vid
-p3094
-Vd475171bf8304e06a74b1add560b1f28
-p3095
-sVname
-p3096
-Vadmin
-p3097
-sasVauth_token
-p3098
-VgAAAAABaKDwkIAhtCT12TJGCGh0HVFyuZog70YhBfQtoozibHNZ6umL5y_6xNkqUlOpfsSuF8PeZ20BZlmQhO43_A30jCNyxi-7q0VzdXxj4kPIIwFN7EuzXbLhc_zWTyvWn7Hy8nXn_POANvZ_mYIgSL2Tjy4qr4WoaBOgNGoRbTvJVD00NyR8
-p3099
-sVexpires_at
-p3100
-V2017-12-06T19:51:16.000000Z
-p3101
-sVproject
-p3102
-(dp3103
-Vdomain
-p3104
-(dp3105
-g3094
-Vdefault
-p3106
-sg3096
-VDefault
-p3107
-ssg3094
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3108
-sg3096
-Vapexlake
-p3109
-ssVcatalog
-p3110
-(lp3111
-(dp3112
-Vendpoints
-p3113
-(lp3114
-(dp3115
-Vurl
-p3116
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p3117
-sVinterface
-p3118
-Vpublic
-p3119
-sVregion
-p3120
-VRegionOne
-p3121
-sVregion_id
-p3122
-VRegionOne
-p3123
-sg3094
-V13359d68397c4732b5d455941ac95989
-p3124
-sa(dp3125
-g3116
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p3126
-sg3118
-Vinternal
-p3127
-sg3120
-VRegionOne
-p3128
-sg3122
-VRegionOne
-p3129
-sg3094
-V50aeae6c5d034dcb80871bdac7391209
-p3130
-sa(dp3131
-g3116
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p3132
-sg3118
-Vadmin
-p3133
-sg3120
-VRegionOne
-p3134
-sg3122
-VRegionOne
-p3135
-sg3094
-V93b06f780b224cbd9b514c2041d3db63
-p3136
-sasVtype
-p3137
-Vvolumev3
-p3138
-sg3094
-V00a63293a3154089a4c80b60b4aa9429
-p3139
-sg3096
-Vcinderv3
-p3140
-sa(dp3141
-g3113
-(lp3142
-(dp3143
-g3116
-Vhttp://172.16.0.5:8000/v1
-p3144
-sg3118
-Vadmin
-p3145
-sg3120
-VRegionOne
-p3146
-sg3122
-VRegionOne
-p3147
-sg3094
-V24acffb5d9154df4981db7424b7669bd
-p3148
-sa(dp3149
-g3116
-Vhttp://172.18.0.8:8000/v1
-p3150
-sg3118
-Vpublic
-p3151
-sg3120
-VRegionOne
-p3152
-sg3122
-VRegionOne
-p3153
-sg3094
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p3154
-sa(dp3155
-g3116
-Vhttp://172.16.0.5:8000/v1
-p3156
-sg3118
-Vinternal
-p3157
-sg3120
-VRegionOne
-p3158
-sg3122
-VRegionOne
-p3159
-sg3094
-V679262173a714d76a078051b95f8c969
-p3160
-sasg3137
-Vcloudformation
-p3161
-sg3094
-V245169ccae564a7db06ca002f1553b51
-p3162
-sg3096
-Vheat-cfn
-p3163
-sa(dp3164
-g3113
-(lp3165
-(dp3166
-g3116
-Vhttp://172.18.0.8:8080
-p3167
-sg3118
-Vpublic
-p3168
-sg3120
-VRegionOne
-p3169
-sg3122
-VRegionOne
-p3170
-sg3094
-V04a6ef3db6b046b1893ed45a3f906f6c
-p3171
-sa(dp3172
-g3116
-Vhttp://172.16.0.5:8080
-p3173
-sg3118
-Vinternal
-p3174
-sg3120
-VRegionOne
-p3175
-sg3122
-VRegionOne
-p3176
-sg3094
-V3e30684c9f74492b8ca9a64dd04261e6
-p3177
-sa(dp3178
-g3116
-Vhttp://172.16.0.5:8080
-p3179
-sg3118
-Vadmin
-p3180
-sg3120
-VRegionOne
-p3181
-sg3122
-VRegionOne
-p3182
-sg3094
-Vc5384b55cd7a441582f151c6b2807745
-p3183
-sasg3137
-Vs3
-p3184
-sg3094
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p3185
-sg3096
-Vswift_s3
-p3186
-sa(dp3187
-g3113
-(lp3188
-(dp3189
-g3116
-Vhttp://172.16.0.5:9696
-p3190
-sg3118
-Vadmin
-p3191
-sg3120
-VRegionOne
-p3192
-sg3122
-VRegionOne
-p3193
-sg3094
-V38b78b2c00264f59a4ade9392f88132b
-p3194
-sa(dp3195
-g3116
-Vhttp://172.18.0.8:9696
-p3196
-sg3118
-Vpublic
-p3197
-sg3120
-VRegionOne
-p3198
-sg3122
-VRegionOne
-p3199
-sg3094
-Vb5d0f72fbf674f84adf8929341e45586
-p3200
-sa(dp3201
-g3116
-Vhttp://172.16.0.5:9696
-p3202
-sg3118
-Vinternal
-p3203
-sg3120
-VRegionOne
-p3204
-sg3122
-VRegionOne
-p3205
-sg3094
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p3206
-sasg3137
-Vnetwork
-p3207
-sg3094
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p3208
-sg3096
-Vneutron
-p3209
-sa(dp3210
-g3113
-(lp3211
-(dp3212
-g3116
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3213
-sg3118
-Vinternal
-p3214
-sg3120
-VRegionOne
-p3215
-sg3122
-VRegionOne
-p3216
-sg3094
-V7c60744a22724044a92928bc2fa9e422
-p3217
-sa(dp3218
-g3116
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3219
-sg3118
-Vadmin
-p3220
-sg3120
-VRegionOne
-p3221
-sg3122
-VRegionOne
-p3222
-sg3094
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p3223
-sa(dp3224
-g3116
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3225
-sg3118
-Vpublic
-p3226
-sg3120
-VRegionOne
-p3227
-sg3122
-VRegionOne
-p3228
-sg3094
-Vde47d994bdc147bdb824474ea699a77a
-p3229
-sasg3137
-Vorchestration
-p3230
-sg3094
-V65a72244f7c54382aeebf5dfdeab8140
-p3231
-sg3096
-Vheat
-p3232
-sa(dp3233
-g3113
-(lp3234
-(dp3235
-g3116
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3236
-sg3118
-Vinternal
-p3237
-sg3120
-VRegionOne
-p3238
-sg3122
-VRegionOne
-p3239
-sg3094
-V3a25e85ecaa44b678c3721c2d3d39b38
-p3240
-sa(dp3241
-g3116
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3242
-sg3118
-Vadmin
-p3243
-sg3120
-VRegionOne
-p3244
-sg3122
-VRegionOne
-p3245
-sg3094
-V68c763474c3d4aa28c4ee0e0249998eb
-p3246
-sa(dp3247
-g3116
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3248
-sg3118
-Vpublic
-p3249
-sg3120
-VRegionOne
-p3250
-sg3122
-VRegionOne
-p3251
-sg3094
-Ve0c861373e94468db521d5a8793d33d1
-p3252
-sasg3137
-Vvolume
-p3253
-sg3094
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p3254
-sg3096
-Vcinder
-p3255
-sa(dp3256
-g3113
-(lp3257
-(dp3258
-g3116
-Vhttp://172.18.0.8:5000/v2.0
-p3259
-sg3118
-Vpublic
-p3260
-sg3120
-VRegionOne
-p3261
-sg3122
-VRegionOne
-p3262
-sg3094
-V6aa35bc15a35447db58ec5b67087f96a
-p3263
-sa(dp3264
-g3116
-Vhttp://172.16.0.5:5000/v2.0
-p3265
-sg3118
-Vinternal
-p3266
-sg3120
-VRegionOne
-p3267
-sg3122
-VRegionOne
-p3268
-sg3094
-V6b4742f26b694b93bdbcb37304d22f69
-p3269
-sa(dp3270
-g3116
-Vhttp://172.16.0.5:35357/v2.0
-p3271
-sg3118
-Vadmin
-p3272
-sg3120
-VRegionOne
-p3273
-sg3122
-VRegionOne
-p3274
-sg3094
-Vadc120ea606644a299a3c91a7ceeb8c4
-p3275
-sasg3137
-Videntity
-p3276
-sg3094
-V9f95de9f4efc4730b4dd90354894e1dc
-p3277
-sg3096
-Vkeystone
-p3278
-sa(dp3279
-g3113
-(lp3280
-(dp3281
-g3116
-Vhttp://172.16.0.5:9292
-p3282
-sg3118
-Vadmin
-p3283
-sg3120
-VRegionOne
-p3284
-sg3122
-VRegionOne
-p3285
-sg3094
-V049519f829be4e7fb5f44ae9f470efdf
-p3286
-sa(dp3287
-g3116
-Vhttp://172.18.0.8:9292
-p3288
-sg3118
-Vpublic
-p3289
-sg3120
-VRegionOne
-p3290
-sg3122
-VRegionOne
-p3291
-sg3094
-V1baebbbf35744192b335f4f293d1a9d8
-p3292
-sa(dp3293
-g3116
-Vhttp://172.16.0.5:9292
-p3294
-sg3118
-Vinternal
-p3295
-sg3120
-VRegionOne
-p3296
-sg3122
-VRegionOne
-p3297
-sg3094
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p3298
-sasg3137
-Vimage
-p3299
-sg3094
-Va39ec0213acc45ceb59346299e78d6c0
-p3300
-sg3096
-Vglance
-p3301
-sa(dp3302
-g3113
-(lp3303
-(dp3304
-g3116
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3305
-sg3118
-Vinternal
-p3306
-sg3120
-VRegionOne
-p3307
-sg3122
-VRegionOne
-p3308
-sg3094
-V2cd9d66e95484830a9006177e301aa57
-p3309
-sa(dp3310
-g3116
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3311
-sg3118
-Vpublic
-p3312
-sg3120
-VRegionOne
-p3313
-sg3122
-VRegionOne
-p3314
-sg3094
-Vbe2d979150a2401b9e7d5c365372d093
-p3315
-sa(dp3316
-g3116
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3317
-sg3118
-Vadmin
-p3318
-sg3120
-VRegionOne
-p3319
-sg3122
-VRegionOne
-p3320
-sg3094
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p3321
-sasg3137
-Vcompute_legacy
-p3322
-sg3094
-Va4dd95e3fde340468f8c1d7df9a853d0
-p3323
-sg3096
-Vcompute_legacy
-p3324
-sa(dp3325
-g3113
-(lp3326
-(dp3327
-g3116
-Vhttp://172.16.0.5:8774/v2.1
-p3328
-sg3118
-Vadmin
-p3329
-sg3120
-VRegionOne
-p3330
-sg3122
-VRegionOne
-p3331
-sg3094
-V0307d2c32dd54839aa5bc39746eeb186
-p3332
-sa(dp3333
-g3116
-Vhttp://172.18.0.8:8774/v2.1
-p3334
-sg3118
-Vpublic
-p3335
-sg3120
-VRegionOne
-p3336
-sg3122
-VRegionOne
-p3337
-sg3094
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p3338
-sa(dp3339
-g3116
-Vhttp://172.16.0.5:8774/v2.1
-p3340
-sg3118
-Vinternal
-p3341
-sg3120
-VRegionOne
-p3342
-sg3122
-VRegionOne
-p3343
-sg3094
-Vdb005ab592334fc599c142cf861e754f
-p3344
-sasg3137
-Vcompute
-p3345
-sg3094
-Vc165d40b8c3849bcb6067a3df2540c62
-p3346
-sg3096
-Vnova
-p3347
-sa(dp3348
-g3113
-(lp3349
-(dp3350
-g3116
-Vhttp://172.16.0.5:8080/swift/v1
-p3351
-sg3118
-Vadmin
-p3352
-sg3120
-VRegionOne
-p3353
-sg3122
-VRegionOne
-p3354
-sg3094
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p3355
-sa(dp3356
-g3116
-Vhttp://172.16.0.5:8080/swift/v1
-p3357
-sg3118
-Vinternal
-p3358
-sg3120
-VRegionOne
-p3359
-sg3122
-VRegionOne
-p3360
-sg3094
-V764118d3a33444ac980632d281acf4a7
-p3361
-sa(dp3362
-g3116
-Vhttp://172.18.0.8:8080/swift/v1
-p3363
-sg3118
-Vpublic
-p3364
-sg3120
-VRegionOne
-p3365
-sg3122
-VRegionOne
-p3366
-sg3094
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p3367
-sasg3137
-Vobject-store
-p3368
-sg3094
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p3369
-sg3096
-Vswift
-p3370
-sa(dp3371
-g3113
-(lp3372
-(dp3373
-g3116
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3374
-sg3118
-Vinternal
-p3375
-sg3120
-VRegionOne
-p3376
-sg3122
-VRegionOne
-p3377
-sg3094
-V61ea745c91ab4eb59464679931219024
-p3378
-sa(dp3379
-g3116
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3380
-sg3118
-Vadmin
-p3381
-sg3120
-VRegionOne
-p3382
-sg3122
-VRegionOne
-p3383
-sg3094
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p3384
-sa(dp3385
-g3116
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3386
-sg3118
-Vpublic
-p3387
-sg3120
-VRegionOne
-p3388
-sg3122
-VRegionOne
-p3389
-sg3094
-V7155772851884dc6954c7345d350796f
-p3390
-sasg3137
-Vvolumev2
-p3391
-sg3094
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p3392
-sg3096
-Vcinderv2
-p3393
-sa(dp3394
-g3113
-(lp3395
-(dp3396
-g3116
-Vhttp://172.18.0.8:9494
-p3397
-sg3118
-Vpublic
-p3398
-sg3120
-VRegionOne
-p3399
-sg3122
-VRegionOne
-p3400
-sg3094
-V43a202e889694d51a3b11899c252a8a9
-p3401
-sa(dp3402
-g3116
-Vhttp://172.16.0.5:9494
-p3403
-sg3118
-Vadmin
-p3404
-sg3120
-VRegionOne
-p3405
-sg3122
-VRegionOne
-p3406
-sg3094
-Vfa3c9de06e854542b236aa24b53e19a1
-p3407
-sa(dp3408
-g3116
-Vhttp://172.16.0.5:9494
-p3409
-sg3118
-Vinternal
-p3410
-sg3120
-VRegionOne
-p3411
-sg3122
-VRegionOne
-p3412
-sg3094
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p3413
-sasg3137
-Vartifact
-p3414
-sg3094
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p3415
-sg3096
-Vglare
-p3416
-sasVversion
-p3417
-Vv3
-p3418
-sVuser
-p3419
-(dp3420
-g3104
-(dp3421
-g3094
-Vdefault
-p3422
-sg3096
-VDefault
-p3423
-ssg3094
-Vef7a4f67379f41aba489a0b6d6a62094
-p3424
-sg3096
-Violie
-p3425
-ssVaudit_ids
-p3426
-(lp3427
-Vir5buaPSTDG4VbCO0gmewQ
-p3428
-asVissued_at
-p3429
-V2017-12-06T18:51:16.000000Z
-p3430
-sssV_context_user
-p3431
-NsVpublisher_id
-p3432
-Vorchestration.machine-D
-p3433
-sVmessage_id
-p3434
-V5bdd03c9-6527-4647-9cc1-91c90bcc768d
-p3435
-sV_context_roles
-p3436
-(lp3437
-Vadmin
-p3438
-asV_context_auth_url
-p3439
-Vhttp://172.16.0.5:35357/v3/
-p3440
-sVtimestamp
-p3441
-V2017-12-06 18:51:26.899996
-p3442
-sV_unique_id
-p3443
-V4b6096a8fa6a46a4a4b8be978b07186e
-p3444
-sV_context_tenant_id
-p3445
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3446
-sV_context_user_domain_id
-p3447
-Vdefault
-p3448
-sV_context_password
-p3449
-NsV_context_trustor_user_id
-p3450
-NsV_context_project_domain_id
-p3451
-Vdefault
-p3452
-sV_context_aws_creds
-p3453
-NsV_context_tenant
-p3454
-Vapexlake
-p3455
-sV_context_user_identity
-p3456
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p3457
-stp3458
-a.
\ No newline at end of file
@@ -1,18947 +0,0 @@
-(lp1
-(F0.00012612342834472656
-Vorchestration.stack.delete.start
-p2
-(dp3
-V_context_request_id
-p4
-Vreq-6260a12b-81fb-4067-9476-7c309f0c9ec5
-p5
-sVevent_type
-p6
-g2
-sV_context_region_name
-p7
-NsV_context_auth_token
-p8
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p9
-sV_context_user_id
-p10
-Vef7a4f67379f41aba489a0b6d6a62094
-p11
-sVpayload
-p12
-(dp13
-Vusername
-p14
-NsVstate_reason
-p15
-VStack DELETE started
-p16
-sVuser_id
-p17
-NsVuser_identity
-p18
-Vef7a4f67379f41aba489a0b6d6a62094
-p19
-sVstack_name
-p20
-VA
-sVtenant_id
-p21
-V187e5e95e7eb499d8a421b3d4ed966d5
-p22
-sVstack_identity
-p23
-V84a34c44-0667-45d8-a9a0-15f98f6af026
-p24
-sVcreate_at
-p25
-V2017-11-30T11:03:52
-p26
-sVstate
-p27
-VDELETE_IN_PROGRESS
-p28
-ssV_context_username
-p29
-NsV_context_show_deleted
-p30
-I00
-sV_context_trust_id
-p31
-NsVpriority
-p32
-VINFO
-p33
-sV_context_is_admin
-p34
-I01
-sV_context_auth_token_info
-p35
-(dp36
-Vtoken
-p37
-(dp38
-Vmethods
-p39
-(lp40
-Vpassword
-p41
-asVroles
-p42
-(lp43
-(dp44
-Vid
-p45
-Vd475171bf8304e06a74b1add560b1f28
-p46
-sVname
-p47
-Vadmin
-p48
-sasVauth_token
-p49
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p50
-sVexpires_at
-p51
-V2017-11-30T12:05:04.000000Z
-p52
-sVproject
-p53
-(dp54
-Vdomain
-p55
-(dp56
-g45
-Vdefault
-p57
-sg47
-VDefault
-p58
-ssg45
-V187e5e95e7eb499d8a421b3d4ed966d5
-p59
-sg47
-Vapexlake
-p60
-ssVcatalog
-p61
-(lp62
-(dp63
-Vendpoints
-p64
-(lp65
-(dp66
-Vurl
-p67
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p68
-sVinterface
-p69
-Vpublic
-p70
-sVregion
-p71
-VRegionOne
-p72
-sVregion_id
-p73
-VRegionOne
-p74
-sg45
-V13359d68397c4732b5d455941ac95989
-p75
-sa(dp76
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p77
-sg69
-Vinternal
-p78
-sg71
-VRegionOne
-p79
-sg73
-VRegionOne
-p80
-sg45
-V50aeae6c5d034dcb80871bdac7391209
-p81
-sa(dp82
-g67
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p83
-sg69
-Vadmin
-p84
-sg71
-VRegionOne
-p85
-sg73
-VRegionOne
-p86
-sg45
-V93b06f780b224cbd9b514c2041d3db63
-p87
-sasVtype
-p88
-Vvolumev3
-p89
-sg45
-V00a63293a3154089a4c80b60b4aa9429
-p90
-sg47
-Vcinderv3
-p91
-sa(dp92
-g64
-(lp93
-(dp94
-g67
-Vhttp://172.16.0.5:8000/v1
-p95
-sg69
-Vadmin
-p96
-sg71
-VRegionOne
-p97
-sg73
-VRegionOne
-p98
-sg45
-V24acffb5d9154df4981db7424b7669bd
-p99
-sa(dp100
-g67
-Vhttp://172.18.0.8:8000/v1
-p101
-sg69
-Vpublic
-p102
-sg71
-VRegionOne
-p103
-sg73
-VRegionOne
-p104
-sg45
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p105
-sa(dp106
-g67
-Vhttp://172.16.0.5:8000/v1
-p107
-sg69
-Vinternal
-p108
-sg71
-VRegionOne
-p109
-sg73
-VRegionOne
-p110
-sg45
-V679262173a714d76a078051b95f8c969
-p111
-sasg88
-Vcloudformation
-p112
-sg45
-V245169ccae564a7db06ca002f1553b51
-p113
-sg47
-Vheat-cfn
-p114
-sa(dp115
-g64
-(lp116
-(dp117
-g67
-Vhttp://172.18.0.8:8080
-p118
-sg69
-Vpublic
-p119
-sg71
-VRegionOne
-p120
-sg73
-VRegionOne
-p121
-sg45
-V04a6ef3db6b046b1893ed45a3f906f6c
-p122
-sa(dp123
-g67
-Vhttp://172.16.0.5:8080
-p124
-sg69
-Vinternal
-p125
-sg71
-VRegionOne
-p126
-sg73
-VRegionOne
-p127
-sg45
-V3e30684c9f74492b8ca9a64dd04261e6
-p128
-sa(dp129
-g67
-Vhttp://172.16.0.5:8080
-p130
-sg69
-Vadmin
-p131
-sg71
-VRegionOne
-p132
-sg73
-VRegionOne
-p133
-sg45
-Vc5384b55cd7a441582f151c6b2807745
-p134
-sasg88
-Vs3
-p135
-sg45
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p136
-sg47
-Vswift_s3
-p137
-sa(dp138
-g64
-(lp139
-(dp140
-g67
-Vhttp://172.16.0.5:9696
-p141
-sg69
-Vadmin
-p142
-sg71
-VRegionOne
-p143
-sg73
-VRegionOne
-p144
-sg45
-V38b78b2c00264f59a4ade9392f88132b
-p145
-sa(dp146
-g67
-Vhttp://172.18.0.8:9696
-p147
-sg69
-Vpublic
-p148
-sg71
-VRegionOne
-p149
-sg73
-VRegionOne
-p150
-sg45
-Vb5d0f72fbf674f84adf8929341e45586
-p151
-sa(dp152
-g67
-Vhttp://172.16.0.5:9696
-p153
-sg69
-Vinternal
-p154
-sg71
-VRegionOne
-p155
-sg73
-VRegionOne
-p156
-sg45
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p157
-sasg88
-Vnetwork
-p158
-sg45
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p159
-sg47
-Vneutron
-p160
-sa(dp161
-g64
-(lp162
-(dp163
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p164
-sg69
-Vinternal
-p165
-sg71
-VRegionOne
-p166
-sg73
-VRegionOne
-p167
-sg45
-V7c60744a22724044a92928bc2fa9e422
-p168
-sa(dp169
-g67
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p170
-sg69
-Vadmin
-p171
-sg71
-VRegionOne
-p172
-sg73
-VRegionOne
-p173
-sg45
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p174
-sa(dp175
-g67
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p176
-sg69
-Vpublic
-p177
-sg71
-VRegionOne
-p178
-sg73
-VRegionOne
-p179
-sg45
-Vde47d994bdc147bdb824474ea699a77a
-p180
-sasg88
-Vorchestration
-p181
-sg45
-V65a72244f7c54382aeebf5dfdeab8140
-p182
-sg47
-Vheat
-p183
-sa(dp184
-g64
-(lp185
-(dp186
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p187
-sg69
-Vinternal
-p188
-sg71
-VRegionOne
-p189
-sg73
-VRegionOne
-p190
-sg45
-V3a25e85ecaa44b678c3721c2d3d39b38
-p191
-sa(dp192
-g67
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p193
-sg69
-Vadmin
-p194
-sg71
-VRegionOne
-p195
-sg73
-VRegionOne
-p196
-sg45
-V68c763474c3d4aa28c4ee0e0249998eb
-p197
-sa(dp198
-g67
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p199
-sg69
-Vpublic
-p200
-sg71
-VRegionOne
-p201
-sg73
-VRegionOne
-p202
-sg45
-Ve0c861373e94468db521d5a8793d33d1
-p203
-sasg88
-Vvolume
-p204
-sg45
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p205
-sg47
-Vcinder
-p206
-sa(dp207
-g64
-(lp208
-(dp209
-g67
-Vhttp://172.18.0.8:5000/v2.0
-p210
-sg69
-Vpublic
-p211
-sg71
-VRegionOne
-p212
-sg73
-VRegionOne
-p213
-sg45
-V6aa35bc15a35447db58ec5b67087f96a
-p214
-sa(dp215
-g67
-Vhttp://172.16.0.5:5000/v2.0
-p216
-sg69
-Vinternal
-p217
-sg71
-VRegionOne
-p218
-sg73
-VRegionOne
-p219
-sg45
-V6b4742f26b694b93bdbcb37304d22f69
-p220
-sa(dp221
-g67
-Vhttp://172.16.0.5:35357/v2.0
-p222
-sg69
-Vadmin
-p223
-sg71
-VRegionOne
-p224
-sg73
-VRegionOne
-p225
-sg45
-Vadc120ea606644a299a3c91a7ceeb8c4
-p226
-sasg88
-Videntity
-p227
-sg45
-V9f95de9f4efc4730b4dd90354894e1dc
-p228
-sg47
-Vkeystone
-p229
-sa(dp230
-g64
-(lp231
-(dp232
-g67
-Vhttp://172.16.0.5:9292
-p233
-sg69
-Vadmin
-p234
-sg71
-VRegionOne
-p235
-sg73
-VRegionOne
-p236
-sg45
-V049519f829be4e7fb5f44ae9f470efdf
-p237
-sa(dp238
-g67
-Vhttp://172.18.0.8:9292
-p239
-sg69
-Vpublic
-p240
-sg71
-VRegionOne
-p241
-sg73
-VRegionOne
-p242
-sg45
-V1baebbbf35744192b335f4f293d1a9d8
-p243
-sa(dp244
-g67
-Vhttp://172.16.0.5:9292
-p245
-sg69
-Vinternal
-p246
-sg71
-VRegionOne
-p247
-sg73
-VRegionOne
-p248
-sg45
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p249
-sasg88
-Vimage
-p250
-sg45
-Va39ec0213acc45ceb59346299e78d6c0
-p251
-sg47
-Vglance
-p252
-sa(dp253
-g64
-(lp254
-(dp255
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p256
-sg69
-Vinternal
-p257
-sg71
-VRegionOne
-p258
-sg73
-VRegionOne
-p259
-sg45
-V2cd9d66e95484830a9006177e301aa57
-p260
-sa(dp261
-g67
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p262
-sg69
-Vpublic
-p263
-sg71
-VRegionOne
-p264
-sg73
-VRegionOne
-p265
-sg45
-Vbe2d979150a2401b9e7d5c365372d093
-p266
-sa(dp267
-g67
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p268
-sg69
-Vadmin
-p269
-sg71
-VRegionOne
-p270
-sg73
-VRegionOne
-p271
-sg45
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p272
-sasg88
-Vcompute_legacy
-p273
-sg45
-Va4dd95e3fde340468f8c1d7df9a853d0
-p274
-sg47
-Vcompute_legacy
-p275
-sa(dp276
-g64
-(lp277
-(dp278
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p279
-sg69
-Vadmin
-p280
-sg71
-VRegionOne
-p281
-sg73
-VRegionOne
-p282
-sg45
-V0307d2c32dd54839aa5bc39746eeb186
-p283
-sa(dp284
-g67
-Vhttp://172.18.0.8:8774/v2.1
-p285
-sg69
-Vpublic
-p286
-sg71
-VRegionOne
-p287
-sg73
-VRegionOne
-p288
-sg45
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p289
-sa(dp290
-g67
-Vhttp://172.16.0.5:8774/v2.1
-p291
-sg69
-Vinternal
-p292
-sg71
-VRegionOne
-p293
-sg73
-VRegionOne
-p294
-sg45
-Vdb005ab592334fc599c142cf861e754f
-p295
-sasg88
-Vcompute
-p296
-sg45
-Vc165d40b8c3849bcb6067a3df2540c62
-p297
-sg47
-Vnova
-p298
-sa(dp299
-g64
-(lp300
-(dp301
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p302
-sg69
-Vadmin
-p303
-sg71
-VRegionOne
-p304
-sg73
-VRegionOne
-p305
-sg45
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p306
-sa(dp307
-g67
-Vhttp://172.16.0.5:8080/swift/v1
-p308
-sg69
-Vinternal
-p309
-sg71
-VRegionOne
-p310
-sg73
-VRegionOne
-p311
-sg45
-V764118d3a33444ac980632d281acf4a7
-p312
-sa(dp313
-g67
-Vhttp://172.18.0.8:8080/swift/v1
-p314
-sg69
-Vpublic
-p315
-sg71
-VRegionOne
-p316
-sg73
-VRegionOne
-p317
-sg45
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p318
-sasg88
-Vobject-store
-p319
-sg45
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p320
-sg47
-Vswift
-p321
-sa(dp322
-g64
-(lp323
-(dp324
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p325
-sg69
-Vinternal
-p326
-sg71
-VRegionOne
-p327
-sg73
-VRegionOne
-p328
-sg45
-V61ea745c91ab4eb59464679931219024
-p329
-sa(dp330
-g67
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p331
-sg69
-Vadmin
-p332
-sg71
-VRegionOne
-p333
-sg73
-VRegionOne
-p334
-sg45
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p335
-sa(dp336
-g67
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p337
-sg69
-Vpublic
-p338
-sg71
-VRegionOne
-p339
-sg73
-VRegionOne
-p340
-sg45
-V7155772851884dc6954c7345d350796f
-p341
-sasg88
-Vvolumev2
-p342
-sg45
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p343
-sg47
-Vcinderv2
-p344
-sa(dp345
-g64
-(lp346
-(dp347
-g67
-Vhttp://172.18.0.8:9494
-p348
-sg69
-Vpublic
-p349
-sg71
-VRegionOne
-p350
-sg73
-VRegionOne
-p351
-sg45
-V43a202e889694d51a3b11899c252a8a9
-p352
-sa(dp353
-g67
-Vhttp://172.16.0.5:9494
-p354
-sg69
-Vadmin
-p355
-sg71
-VRegionOne
-p356
-sg73
-VRegionOne
-p357
-sg45
-Vfa3c9de06e854542b236aa24b53e19a1
-p358
-sa(dp359
-g67
-Vhttp://172.16.0.5:9494
-p360
-sg69
-Vinternal
-p361
-sg71
-VRegionOne
-p362
-sg73
-VRegionOne
-p363
-sg45
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p364
-sasg88
-Vartifact
-p365
-sg45
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p366
-sg47
-Vglare
-p367
-sasVversion
-p368
-Vv3
-p369
-sVuser
-p370
-(dp371
-g55
-(dp372
-g45
-Vdefault
-p373
-sg47
-VDefault
-p374
-ssg45
-Vef7a4f67379f41aba489a0b6d6a62094
-p375
-sg47
-Violie
-p376
-ssVaudit_ids
-p377
-(lp378
-V3g8KSAJYRZ6STG5-I1m94w
-p379
-asVissued_at
-p380
-V2017-11-30T11:05:04.000000Z
-p381
-sssV_context_user
-p382
-NsVpublisher_id
-p383
-Vorchestration.machine-A
-p384
-sVmessage_id
-p385
-V2146846d-a170-4c58-8144-d467db68de4b
-p386
-sV_context_roles
-p387
-(lp388
-Vadmin
-p389
-asV_context_auth_url
-p390
-Vhttp://172.16.0.5:35357/v3/
-p391
-sVtimestamp
-p392
-V2017-11-30 11:05:04.401548
-p393
-sV_unique_id
-p394
-V9bb5af57f9534577be00007cf270f2f3
-p395
-sV_context_tenant_id
-p396
-V187e5e95e7eb499d8a421b3d4ed966d5
-p397
-sV_context_user_domain_id
-p398
-Vdefault
-p399
-sV_context_password
-p400
-NsV_context_trustor_user_id
-p401
-NsV_context_project_domain_id
-p402
-Vdefault
-p403
-sV_context_aws_creds
-p404
-NsV_context_tenant
-p405
-Vapexlake
-p406
-sV_context_user_identity
-p407
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p408
-stp409
-a(F0.044852972030639648
-Vfloatingip.delete.start
-p410
-(dp411
-V_context_domain
-p412
-NsV_context_request_id
-p413
-Vreq-33082c2e-f0ae-450f-b3fe-e2548bed509e
-p414
-sVevent_type
-p415
-g410
-sV_context_auth_token
-p416
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p417
-sV_context_resource_uuid
-p418
-NsV_context_tenant_name
-p419
-Vapexlake
-p420
-sV_context_user_id
-p421
-Vef7a4f67379f41aba489a0b6d6a62094
-p422
-sVpayload
-p423
-(dp424
-Vfloatingip_id
-p425
-V507940da-20a4-4115-9ca3-054d62260b8c
-p426
-ssV_context_show_deleted
-p427
-I00
-sVpriority
-p428
-VINFO
-p429
-sV_context_is_admin
-p430
-I01
-sV_context_project_domain
-p431
-NsV_context_user
-p432
-Vef7a4f67379f41aba489a0b6d6a62094
-p433
-sVpublisher_id
-p434
-Vnetwork.machine-A
-p435
-sVmessage_id
-p436
-Vc65fec59-a0bb-4979-a74d-0ee3a2a39a16
-p437
-sV_context_roles
-p438
-(lp439
-Vadmin
-p440
-asVtimestamp
-p441
-V2017-11-30 11:05:04.450273
-p442
-sV_context_timestamp
-p443
-V2017-11-30 11:05:04.448354
-p444
-sV_unique_id
-p445
-Vbc8cc5a5464245ea9a4bff6e986e2d7b
-p446
-sV_context_tenant_id
-p447
-V187e5e95e7eb499d8a421b3d4ed966d5
-p448
-sV_context_project_name
-p449
-Vapexlake
-p450
-sV_context_user_identity
-p451
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p452
-sV_context_tenant
-p453
-V187e5e95e7eb499d8a421b3d4ed966d5
-p454
-sV_context_project_id
-p455
-V187e5e95e7eb499d8a421b3d4ed966d5
-p456
-sV_context_read_only
-p457
-I00
-sV_context_user_domain
-p458
-NsV_context_user_name
-p459
-Violie
-p460
-stp461
-a(F0.36772012710571289
-Vfloatingip.delete.end
-p462
-(dp463
-V_context_domain
-p464
-NsV_context_request_id
-p465
-Vreq-33082c2e-f0ae-450f-b3fe-e2548bed509e
-p466
-sVevent_type
-p467
-g462
-sV_context_auth_token
-p468
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p469
-sV_context_resource_uuid
-p470
-NsV_context_tenant_name
-p471
-Vapexlake
-p472
-sV_context_user_id
-p473
-Vef7a4f67379f41aba489a0b6d6a62094
-p474
-sVpayload
-p475
-(dp476
-Vfloatingip_id
-p477
-V507940da-20a4-4115-9ca3-054d62260b8c
-p478
-ssV_context_show_deleted
-p479
-I00
-sVpriority
-p480
-VINFO
-p481
-sV_context_is_admin
-p482
-I01
-sV_context_project_domain
-p483
-NsV_context_user
-p484
-Vef7a4f67379f41aba489a0b6d6a62094
-p485
-sVpublisher_id
-p486
-Vnetwork.machine-A
-p487
-sVmessage_id
-p488
-V3d175c8e-8691-4381-ac61-f6e725f3f393
-p489
-sV_context_roles
-p490
-(lp491
-Vadmin
-p492
-asVtimestamp
-p493
-V2017-11-30 11:05:04.772271
-p494
-sV_context_timestamp
-p495
-V2017-11-30 11:05:04.448354
-p496
-sV_unique_id
-p497
-Vb8815ee40c3f4d3d8158cbbebad33d69
-p498
-sV_context_tenant_id
-p499
-V187e5e95e7eb499d8a421b3d4ed966d5
-p500
-sV_context_project_name
-p501
-Vapexlake
-p502
-sV_context_user_identity
-p503
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p504
-sV_context_tenant
-p505
-V187e5e95e7eb499d8a421b3d4ed966d5
-p506
-sV_context_project_id
-p507
-V187e5e95e7eb499d8a421b3d4ed966d5
-p508
-sV_context_read_only
-p509
-I00
-sV_context_user_domain
-p510
-NsV_context_user_name
-p511
-Violie
-p512
-stp513
-a(F0.60429906845092773
-Vcompute.instance.update
-p514
-(dp515
-V_context_domain
-p516
-NsV_context_request_id
-p517
-Vreq-77cd0d4a-d7b6-4b82-9768-9b5bc325309a
-p518
-sV_context_quota_class
-p519
-NsVevent_type
-p520
-g514
-sV_context_service_catalog
-p521
-(lp522
-(dp523
-Vendpoints
-p524
-(lp525
-(dp526
-VadminURL
-p527
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p528
-sVregion
-p529
-VRegionOne
-p530
-sVinternalURL
-p531
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p532
-sVpublicURL
-p533
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p534
-sasVtype
-p535
-Vvolume
-p536
-sVname
-p537
-Vcinder
-p538
-sa(dp539
-g524
-(lp540
-(dp541
-g527
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p542
-sg529
-VRegionOne
-p543
-sg531
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p544
-sg533
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p545
-sasg535
-Vvolumev2
-p546
-sg537
-Vcinderv2
-p547
-sasV_context_auth_token
-p548
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p549
-sV_context_resource_uuid
-p550
-NsV_context_user_id
-p551
-Vef7a4f67379f41aba489a0b6d6a62094
-p552
-sVpayload
-p553
-(dp554
-Vstate_description
-p555
-Vdeleting
-p556
-sVavailability_zone
-p557
-Vnova
-p558
-sVterminated_at
-p559
-V
-sVephemeral_gb
-p560
-I0
-sVinstance_type_id
-p561
-I1
-sVbandwidth
-p562
-(dp563
-sVdeleted_at
-p564
-V
-sVreservation_id
-p565
-Vr-61su4ljd
-p566
-sVmemory_mb
-p567
-I4096
-sVdisplay_name
-p568
-Vvm_test
-p569
-sVhostname
-p570
-Vvm-test
-p571
-sVstate
-p572
-Vactive
-p573
-sVold_state
-p574
-Vactive
-p575
-sVprogress
-p576
-V
-sVlaunched_at
-p577
-V2017-11-30T11:04:08.000000
-p578
-sVmetadata
-p579
-(dp580
-sVnode
-p581
-Vmachine-B
-p582
-sVramdisk_id
-p583
-V
-sVaccess_ip_v6
-p584
-NsVdisk_gb
-p585
-I40
-sVaccess_ip_v4
-p586
-NsVkernel_id
-p587
-V
-sVhost
-p588
-Vmachine-B
-p589
-sVuser_id
-p590
-Vef7a4f67379f41aba489a0b6d6a62094
-p591
-sVimage_ref_url
-p592
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p593
-sVcell_name
-p594
-V
-sVaudit_period_beginning
-p595
-V2017-11-01T00:00:00.000000
-p596
-sVroot_gb
-p597
-I40
-sVtenant_id
-p598
-V187e5e95e7eb499d8a421b3d4ed966d5
-p599
-sVcreated_at
-p600
-V2017-11-30T11:03:57.000000
-p601
-sVold_task_state
-p602
-Vdeleting
-p603
-sVinstance_id
-p604
-Va7115aef-929d-454e-9eba-eff685db7a15
-p605
-sVinstance_type
-p606
-Vm1.medium
-p607
-sVvcpus
-p608
-I2
-sVimage_meta
-p609
-(dp610
-Vmin_disk
-p611
-V40
-p612
-sVcontainer_format
-p613
-Vbare
-p614
-sVmin_ram
-p615
-V0
-sVdisk_format
-p616
-Vqcow2
-p617
-sVbase_image_ref
-p618
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p619
-ssVarchitecture
-p620
-NsVnew_task_state
-p621
-Vdeleting
-p622
-sVaudit_period_ending
-p623
-V2017-11-30T11:05:05.003700
-p624
-sVos_type
-p625
-NsVinstance_flavor_id
-p626
-V3
-ssV_context_show_deleted
-p627
-I00
-sVpriority
-p628
-VINFO
-p629
-sV_context_is_admin
-p630
-I01
-sV_context_project_domain
-p631
-NsV_context_user
-p632
-Vef7a4f67379f41aba489a0b6d6a62094
-p633
-sVpublisher_id
-p634
-Vcompute.machine-A
-p635
-sVmessage_id
-p636
-Vd766e8b0-918f-4814-ab49-56678755385f
-p637
-sV_context_remote_address
-p638
-V172.16.0.5
-p639
-sV_context_roles
-p640
-(lp641
-Vadmin
-p642
-asVtimestamp
-p643
-V2017-11-30 11:05:05.008871
-p644
-sV_context_timestamp
-p645
-V2017-11-30T11:05:04.882670
-p646
-sV_unique_id
-p647
-V45308c2d24204b09828ba2f9d6404dcb
-p648
-sV_context_project_name
-p649
-Vapexlake
-p650
-sV_context_read_deleted
-p651
-Vno
-p652
-sV_context_user_identity
-p653
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p654
-sV_context_tenant
-p655
-V187e5e95e7eb499d8a421b3d4ed966d5
-p656
-sV_context_instance_lock_checked
-p657
-I00
-sV_context_project_id
-p658
-V187e5e95e7eb499d8a421b3d4ed966d5
-p659
-sV_context_read_only
-p660
-I00
-sV_context_user_domain
-p661
-NsV_context_user_name
-p662
-Violie
-p663
-stp664
-a(F0.6410830020904541
-Vcompute.instance.delete.start
-p665
-(dp666
-V_context_domain
-p667
-NsV_context_request_id
-p668
-Vreq-77cd0d4a-d7b6-4b82-9768-9b5bc325309a
-p669
-sV_context_quota_class
-p670
-NsVevent_type
-p671
-g665
-sV_context_service_catalog
-p672
-(lp673
-(dp674
-Vendpoints
-p675
-(lp676
-(dp677
-VadminURL
-p678
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p679
-sVregion
-p680
-VRegionOne
-p681
-sVinternalURL
-p682
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p683
-sVpublicURL
-p684
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p685
-sasVtype
-p686
-Vvolume
-p687
-sVname
-p688
-Vcinder
-p689
-sa(dp690
-g675
-(lp691
-(dp692
-g678
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p693
-sg680
-VRegionOne
-p694
-sg682
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p695
-sg684
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p696
-sasg686
-Vvolumev2
-p697
-sg688
-Vcinderv2
-p698
-sasV_context_auth_token
-p699
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p700
-sV_context_resource_uuid
-p701
-NsV_context_user_id
-p702
-Vef7a4f67379f41aba489a0b6d6a62094
-p703
-sVpayload
-p704
-(dp705
-Vstate_description
-p706
-Vdeleting
-p707
-sVavailability_zone
-p708
-Vnova
-p709
-sVterminated_at
-p710
-V
-sVephemeral_gb
-p711
-I0
-sVinstance_type_id
-p712
-I1
-sVdeleted_at
-p713
-V
-sVreservation_id
-p714
-Vr-61su4ljd
-p715
-sVmemory_mb
-p716
-I4096
-sVdisplay_name
-p717
-Vvm_test
-p718
-sVhostname
-p719
-Vvm-test
-p720
-sVstate
-p721
-Vactive
-p722
-sVprogress
-p723
-V
-sVlaunched_at
-p724
-V2017-11-30T11:04:08.000000
-p725
-sVmetadata
-p726
-(dp727
-sVnode
-p728
-Vmachine-B
-p729
-sVramdisk_id
-p730
-V
-sVaccess_ip_v6
-p731
-NsVdisk_gb
-p732
-I40
-sVaccess_ip_v4
-p733
-NsVkernel_id
-p734
-V
-sVhost
-p735
-Vmachine-B
-p736
-sVuser_id
-p737
-Vef7a4f67379f41aba489a0b6d6a62094
-p738
-sVimage_ref_url
-p739
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p740
-sVcell_name
-p741
-V
-sVroot_gb
-p742
-I40
-sVtenant_id
-p743
-V187e5e95e7eb499d8a421b3d4ed966d5
-p744
-sVcreated_at
-p745
-V2017-11-30T11:03:57.000000
-p746
-sVinstance_id
-p747
-Va7115aef-929d-454e-9eba-eff685db7a15
-p748
-sVinstance_type
-p749
-Vm1.medium
-p750
-sVvcpus
-p751
-I2
-sVimage_meta
-p752
-(dp753
-Vmin_disk
-p754
-V40
-p755
-sVcontainer_format
-p756
-Vbare
-p757
-sVmin_ram
-p758
-V0
-sVdisk_format
-p759
-Vqcow2
-p760
-sVbase_image_ref
-p761
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p762
-ssVarchitecture
-p763
-NsVos_type
-p764
-NsVinstance_flavor_id
-p765
-V3
-ssV_context_show_deleted
-p766
-I00
-sVpriority
-p767
-VINFO
-p768
-sV_context_is_admin
-p769
-I01
-sV_context_project_domain
-p770
-NsV_context_user
-p771
-Vef7a4f67379f41aba489a0b6d6a62094
-p772
-sVpublisher_id
-p773
-Vcompute.machine-B
-p774
-sVmessage_id
-p775
-V96a8cb85-b282-472d-ad6b-c93b89981c96
-p776
-sV_context_remote_address
-p777
-V172.16.0.5
-p778
-sV_context_roles
-p779
-(lp780
-Vadmin
-p781
-asVtimestamp
-p782
-V2017-11-30 11:05:05.046519
-p783
-sV_context_timestamp
-p784
-V2017-11-30T11:05:04.882670
-p785
-sV_unique_id
-p786
-Vaf6113aa3e1e442bb440a78348bf685e
-p787
-sV_context_project_name
-p788
-Vapexlake
-p789
-sV_context_read_deleted
-p790
-Vno
-p791
-sV_context_user_identity
-p792
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p793
-sV_context_tenant
-p794
-V187e5e95e7eb499d8a421b3d4ed966d5
-p795
-sV_context_instance_lock_checked
-p796
-I00
-sV_context_project_id
-p797
-V187e5e95e7eb499d8a421b3d4ed966d5
-p798
-sV_context_read_only
-p799
-I00
-sV_context_user_domain
-p800
-NsV_context_user_name
-p801
-Violie
-p802
-stp803
-a(F0.64542913436889648
-Vcompute.instance.shutdown.start
-p804
-(dp805
-V_context_domain
-p806
-NsV_context_request_id
-p807
-Vreq-77cd0d4a-d7b6-4b82-9768-9b5bc325309a
-p808
-sV_context_quota_class
-p809
-NsVevent_type
-p810
-g804
-sV_context_service_catalog
-p811
-(lp812
-(dp813
-Vendpoints
-p814
-(lp815
-(dp816
-VadminURL
-p817
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p818
-sVregion
-p819
-VRegionOne
-p820
-sVinternalURL
-p821
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p822
-sVpublicURL
-p823
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p824
-sasVtype
-p825
-Vvolume
-p826
-sVname
-p827
-Vcinder
-p828
-sa(dp829
-g814
-(lp830
-(dp831
-g817
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p832
-sg819
-VRegionOne
-p833
-sg821
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p834
-sg823
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p835
-sasg825
-Vvolumev2
-p836
-sg827
-Vcinderv2
-p837
-sasV_context_auth_token
-p838
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p839
-sV_context_resource_uuid
-p840
-NsV_context_user_id
-p841
-Vef7a4f67379f41aba489a0b6d6a62094
-p842
-sVpayload
-p843
-(dp844
-Vstate_description
-p845
-Vdeleting
-p846
-sVavailability_zone
-p847
-Vnova
-p848
-sVterminated_at
-p849
-V
-sVephemeral_gb
-p850
-I0
-sVinstance_type_id
-p851
-I1
-sVdeleted_at
-p852
-V
-sVreservation_id
-p853
-Vr-61su4ljd
-p854
-sVmemory_mb
-p855
-I4096
-sVdisplay_name
-p856
-Vvm_test
-p857
-sVhostname
-p858
-Vvm-test
-p859
-sVstate
-p860
-Vactive
-p861
-sVprogress
-p862
-V
-sVlaunched_at
-p863
-V2017-11-30T11:04:08.000000
-p864
-sVmetadata
-p865
-(dp866
-sVnode
-p867
-Vmachine-B
-p868
-sVramdisk_id
-p869
-V
-sVaccess_ip_v6
-p870
-NsVdisk_gb
-p871
-I40
-sVaccess_ip_v4
-p872
-NsVkernel_id
-p873
-V
-sVhost
-p874
-Vmachine-B
-p875
-sVuser_id
-p876
-Vef7a4f67379f41aba489a0b6d6a62094
-p877
-sVimage_ref_url
-p878
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p879
-sVcell_name
-p880
-V
-sVroot_gb
-p881
-I40
-sVtenant_id
-p882
-V187e5e95e7eb499d8a421b3d4ed966d5
-p883
-sVcreated_at
-p884
-V2017-11-30T11:03:57.000000
-p885
-sVinstance_id
-p886
-Va7115aef-929d-454e-9eba-eff685db7a15
-p887
-sVinstance_type
-p888
-Vm1.medium
-p889
-sVvcpus
-p890
-I2
-sVimage_meta
-p891
-(dp892
-Vmin_disk
-p893
-V40
-p894
-sVcontainer_format
-p895
-Vbare
-p896
-sVmin_ram
-p897
-V0
-sVdisk_format
-p898
-Vqcow2
-p899
-sVbase_image_ref
-p900
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p901
-ssVarchitecture
-p902
-NsVos_type
-p903
-NsVinstance_flavor_id
-p904
-V3
-ssV_context_show_deleted
-p905
-I00
-sVpriority
-p906
-VINFO
-p907
-sV_context_is_admin
-p908
-I01
-sV_context_project_domain
-p909
-NsV_context_user
-p910
-Vef7a4f67379f41aba489a0b6d6a62094
-p911
-sVpublisher_id
-p912
-Vcompute.machine-B
-p913
-sVmessage_id
-p914
-V840948a3-c258-4b59-94fd-931b2de15ef5
-p915
-sV_context_remote_address
-p916
-V172.16.0.5
-p917
-sV_context_roles
-p918
-(lp919
-Vadmin
-p920
-asVtimestamp
-p921
-V2017-11-30 11:05:05.051476
-p922
-sV_context_timestamp
-p923
-V2017-11-30T11:05:04.882670
-p924
-sV_unique_id
-p925
-Vcf19d3fd974448939321a887f3dd69b0
-p926
-sV_context_project_name
-p927
-Vapexlake
-p928
-sV_context_read_deleted
-p929
-Vno
-p930
-sV_context_user_identity
-p931
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p932
-sV_context_tenant
-p933
-V187e5e95e7eb499d8a421b3d4ed966d5
-p934
-sV_context_instance_lock_checked
-p935
-I00
-sV_context_project_id
-p936
-V187e5e95e7eb499d8a421b3d4ed966d5
-p937
-sV_context_read_only
-p938
-I00
-sV_context_user_domain
-p939
-NsV_context_user_name
-p940
-Violie
-p941
-stp942
-a(F4.0370001792907715
-Vcompute.instance.update
-p943
-(dp944
-V_context_domain
-p945
-NsV_context_request_id
-p946
-Vreq-77cd0d4a-d7b6-4b82-9768-9b5bc325309a
-p947
-sV_context_quota_class
-p948
-NsVevent_type
-p949
-g943
-sV_context_service_catalog
-p950
-(lp951
-(dp952
-Vendpoints
-p953
-(lp954
-(dp955
-VadminURL
-p956
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p957
-sVregion
-p958
-VRegionOne
-p959
-sVinternalURL
-p960
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p961
-sVpublicURL
-p962
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p963
-sasVtype
-p964
-Vvolume
-p965
-sVname
-p966
-Vcinder
-p967
-sa(dp968
-g953
-(lp969
-(dp970
-g956
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p971
-sg958
-VRegionOne
-p972
-sg960
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p973
-sg962
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p974
-sasg964
-Vvolumev2
-p975
-sg966
-Vcinderv2
-p976
-sasV_context_auth_token
-p977
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p978
-sV_context_resource_uuid
-p979
-NsV_context_user_id
-p980
-Vef7a4f67379f41aba489a0b6d6a62094
-p981
-sVpayload
-p982
-(dp983
-Vstate_description
-p984
-Vdeleting
-p985
-sVavailability_zone
-p986
-Vnova
-p987
-sVterminated_at
-p988
-V
-sVephemeral_gb
-p989
-I0
-sVinstance_type_id
-p990
-I1
-sVbandwidth
-p991
-(dp992
-sVdeleted_at
-p993
-V
-sVreservation_id
-p994
-Vr-61su4ljd
-p995
-sVmemory_mb
-p996
-I4096
-sVdisplay_name
-p997
-Vvm_test
-p998
-sVhostname
-p999
-Vvm-test
-p1000
-sVstate
-p1001
-Vactive
-p1002
-sVold_state
-p1003
-Vactive
-p1004
-sVprogress
-p1005
-V
-sVlaunched_at
-p1006
-V2017-11-30T11:04:08.000000
-p1007
-sVmetadata
-p1008
-(dp1009
-sVnode
-p1010
-Vmachine-B
-p1011
-sVramdisk_id
-p1012
-V
-sVaccess_ip_v6
-p1013
-NsVdisk_gb
-p1014
-I40
-sVaccess_ip_v4
-p1015
-NsVkernel_id
-p1016
-V
-sVhost
-p1017
-Vmachine-B
-p1018
-sVuser_id
-p1019
-Vef7a4f67379f41aba489a0b6d6a62094
-p1020
-sVimage_ref_url
-p1021
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1022
-sVcell_name
-p1023
-V
-sVaudit_period_beginning
-p1024
-V2017-11-01T00:00:00.000000
-p1025
-sVroot_gb
-p1026
-I40
-sVtenant_id
-p1027
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1028
-sVcreated_at
-p1029
-V2017-11-30T11:03:57.000000
-p1030
-sVold_task_state
-p1031
-Vdeleting
-p1032
-sVinstance_id
-p1033
-Va7115aef-929d-454e-9eba-eff685db7a15
-p1034
-sVinstance_type
-p1035
-Vm1.medium
-p1036
-sVvcpus
-p1037
-I2
-sVimage_meta
-p1038
-(dp1039
-Vmin_disk
-p1040
-V40
-p1041
-sVcontainer_format
-p1042
-Vbare
-p1043
-sVmin_ram
-p1044
-V0
-sVdisk_format
-p1045
-Vqcow2
-p1046
-sVbase_image_ref
-p1047
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1048
-ssVarchitecture
-p1049
-NsVnew_task_state
-p1050
-Vdeleting
-p1051
-sVaudit_period_ending
-p1052
-V2017-11-30T11:05:08.436061
-p1053
-sVos_type
-p1054
-NsVinstance_flavor_id
-p1055
-V3
-ssV_context_show_deleted
-p1056
-I00
-sVpriority
-p1057
-VINFO
-p1058
-sV_context_is_admin
-p1059
-I01
-sV_context_project_domain
-p1060
-NsV_context_user
-p1061
-Vef7a4f67379f41aba489a0b6d6a62094
-p1062
-sVpublisher_id
-p1063
-Vcompute.machine-A
-p1064
-sVmessage_id
-p1065
-V0fda7d4b-372c-459c-96ed-282c4a024194
-p1066
-sV_context_remote_address
-p1067
-V172.16.0.5
-p1068
-sV_context_roles
-p1069
-(lp1070
-Vadmin
-p1071
-asVtimestamp
-p1072
-V2017-11-30 11:05:08.441200
-p1073
-sV_context_timestamp
-p1074
-V2017-11-30T11:05:04.882670
-p1075
-sV_unique_id
-p1076
-Vfcd4770dad524ef8b02a3d445332121d
-p1077
-sV_context_project_name
-p1078
-Vapexlake
-p1079
-sV_context_read_deleted
-p1080
-Vno
-p1081
-sV_context_user_identity
-p1082
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1083
-sV_context_tenant
-p1084
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1085
-sV_context_instance_lock_checked
-p1086
-I00
-sV_context_project_id
-p1087
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1088
-sV_context_read_only
-p1089
-I00
-sV_context_user_domain
-p1090
-NsV_context_user_name
-p1091
-Violie
-p1092
-stp1093
-a(F4.106870174407959
-Vport.update.start
-p1094
-(dp1095
-V_context_domain
-p1096
-NsV_context_request_id
-p1097
-Vreq-c6b6fff3-4f68-4f0c-ba8d-804e9e04d7b8
-p1098
-sVevent_type
-p1099
-g1094
-sV_context_auth_token
-p1100
-VgAAAAABaH9-CWgcS39ZdW0cxOVLvB4fAIBmlm17jN9SRgqp0r4jwM-zlbzaX9hGvNRl-wtpjKLecYBw6HnF6c1vMrCbTcZ1-hjhyOqt4VRuIiCrMiyyhfQ6Q-3NaU8XzbobGqQaP6eWVhED5sSv6lWMeJ_IZNtU7mchGDTTAGDFyTo8pQB2VLYU
-p1101
-sV_context_resource_uuid
-p1102
-NsV_context_tenant_name
-p1103
-Vservices
-p1104
-sV_context_user_id
-p1105
-V84faafdbb77b40c9a73047fdebb0ab45
-p1106
-sVpayload
-p1107
-(dp1108
-Vport
-p1109
-(dp1110
-Vbinding:profile
-p1111
-(dp1112
-sVdevice_owner
-p1113
-V
-sVdns_name
-p1114
-V
-sVbinding:host_id
-p1115
-NsVdevice_id
-p1116
-V
-ssVid
-p1117
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p1118
-ssV_context_show_deleted
-p1119
-I00
-sVpriority
-p1120
-VINFO
-p1121
-sV_context_is_admin
-p1122
-I01
-sV_context_project_domain
-p1123
-NsV_context_user
-p1124
-V84faafdbb77b40c9a73047fdebb0ab45
-p1125
-sVpublisher_id
-p1126
-Vnetwork.machine-A
-p1127
-sVmessage_id
-p1128
-V6e3bb946-a1c1-4f60-ae47-b6665078172e
-p1129
-sV_context_roles
-p1130
-(lp1131
-Vadmin
-p1132
-asVtimestamp
-p1133
-V2017-11-30 11:05:08.510408
-p1134
-sV_context_timestamp
-p1135
-V2017-11-30 11:05:08.509318
-p1136
-sV_unique_id
-p1137
-V8d95ac2e859c4d2082696ebcbc295bcd
-p1138
-sV_context_tenant_id
-p1139
-V66fbf30f2dce4cef95d5248254dac9a5
-p1140
-sV_context_project_name
-p1141
-Vservices
-p1142
-sV_context_user_identity
-p1143
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p1144
-sV_context_tenant
-p1145
-V66fbf30f2dce4cef95d5248254dac9a5
-p1146
-sV_context_project_id
-p1147
-V66fbf30f2dce4cef95d5248254dac9a5
-p1148
-sV_context_read_only
-p1149
-I00
-sV_context_user_domain
-p1150
-NsV_context_user_name
-p1151
-Vneutron
-p1152
-stp1153
-a(F4.3519101142883301
-Vport.update.end
-p1154
-(dp1155
-V_context_domain
-p1156
-NsV_context_request_id
-p1157
-Vreq-c6b6fff3-4f68-4f0c-ba8d-804e9e04d7b8
-p1158
-sVevent_type
-p1159
-g1154
-sV_context_auth_token
-p1160
-VgAAAAABaH9-CWgcS39ZdW0cxOVLvB4fAIBmlm17jN9SRgqp0r4jwM-zlbzaX9hGvNRl-wtpjKLecYBw6HnF6c1vMrCbTcZ1-hjhyOqt4VRuIiCrMiyyhfQ6Q-3NaU8XzbobGqQaP6eWVhED5sSv6lWMeJ_IZNtU7mchGDTTAGDFyTo8pQB2VLYU
-p1161
-sV_context_resource_uuid
-p1162
-NsV_context_tenant_name
-p1163
-Vservices
-p1164
-sV_context_user_id
-p1165
-V84faafdbb77b40c9a73047fdebb0ab45
-p1166
-sVpayload
-p1167
-(dp1168
-Vport
-p1169
-(dp1170
-Vallowed_address_pairs
-p1171
-(lp1172
-sVextra_dhcp_opts
-p1173
-(lp1174
-sVupdated_at
-p1175
-V2017-11-30T11:05:08
-p1176
-sVdevice_owner
-p1177
-V
-sVport_security_enabled
-p1178
-I01
-sVbinding:profile
-p1179
-(dp1180
-sVfixed_ips
-p1181
-(lp1182
-(dp1183
-Vsubnet_id
-p1184
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p1185
-sVip_address
-p1186
-V172.16.9.143
-p1187
-sasVid
-p1188
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p1189
-sVsecurity_groups
-p1190
-(lp1191
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p1192
-asVbinding:vif_details
-p1193
-(dp1194
-sVbinding:vif_type
-p1195
-Vunbound
-p1196
-sVmac_address
-p1197
-Vfa:16:3e:e3:1c:a2
-p1198
-sVstatus
-p1199
-VDOWN
-p1200
-sVbinding:host_id
-p1201
-V
-sVdescription
-p1202
-V
-sVdns_assignment
-p1203
-(lp1204
-(dp1205
-Vhostname
-p1206
-Vhost-172-16-9-143
-p1207
-sg1186
-V172.16.9.143
-p1208
-sVfqdn
-p1209
-Vhost-172-16-9-143.openstacklocal.
-p1210
-sasVdevice_id
-p1211
-V
-sVname
-p1212
-VA-server_port-mq5hsmnf3x5v
-p1213
-sVadmin_state_up
-p1214
-I01
-sVnetwork_id
-p1215
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p1216
-sVdns_name
-p1217
-V
-sVcreated_at
-p1218
-V2017-11-30T11:03:53
-p1219
-sVbinding:vnic_type
-p1220
-Vnormal
-p1221
-sVtenant_id
-p1222
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1223
-sssV_context_show_deleted
-p1224
-I00
-sVpriority
-p1225
-VINFO
-p1226
-sV_context_is_admin
-p1227
-I01
-sV_context_project_domain
-p1228
-NsV_context_user
-p1229
-V84faafdbb77b40c9a73047fdebb0ab45
-p1230
-sVpublisher_id
-p1231
-Vnetwork.machine-A
-p1232
-sVmessage_id
-p1233
-V292c04b4-4258-41f0-82eb-a24bc23822ac
-p1234
-sV_context_roles
-p1235
-(lp1236
-Vadmin
-p1237
-asVtimestamp
-p1238
-V2017-11-30 11:05:08.756948
-p1239
-sV_context_timestamp
-p1240
-V2017-11-30 11:05:08.509318
-p1241
-sV_unique_id
-p1242
-V31e3859a382e48d2a78b2dff5c376283
-p1243
-sV_context_tenant_id
-p1244
-V66fbf30f2dce4cef95d5248254dac9a5
-p1245
-sV_context_project_name
-p1246
-Vservices
-p1247
-sV_context_user_identity
-p1248
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p1249
-sV_context_tenant
-p1250
-V66fbf30f2dce4cef95d5248254dac9a5
-p1251
-sV_context_project_id
-p1252
-V66fbf30f2dce4cef95d5248254dac9a5
-p1253
-sV_context_read_only
-p1254
-I00
-sV_context_user_domain
-p1255
-NsV_context_user_name
-p1256
-Vneutron
-p1257
-stp1258
-a(F4.4165949821472168
-Vorchestration.stack.delete.start
-p1259
-(dp1260
-V_context_request_id
-p1261
-Vreq-c1cb724f-f9a9-45c1-852a-52eb4bb5a570
-p1262
-sVevent_type
-p1263
-g1259
-sV_context_region_name
-p1264
-NsV_context_auth_token
-p1265
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p1266
-sV_context_user_id
-p1267
-Vef7a4f67379f41aba489a0b6d6a62094
-p1268
-sVpayload
-p1269
-(dp1270
-Vusername
-p1271
-NsVstate_reason
-p1272
-VStack DELETE started
-p1273
-sVuser_id
-p1274
-NsVuser_identity
-p1275
-Vef7a4f67379f41aba489a0b6d6a62094
-p1276
-sVstack_name
-p1277
-VB
-sVtenant_id
-p1278
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1279
-sVstack_identity
-p1280
-V4166ecad-7e96-49c6-86e3-f0bab0e0bfec
-p1281
-sVcreate_at
-p1282
-V2017-11-30T11:03:56
-p1283
-sVstate
-p1284
-VDELETE_IN_PROGRESS
-p1285
-ssV_context_username
-p1286
-NsV_context_show_deleted
-p1287
-I00
-sV_context_trust_id
-p1288
-NsVpriority
-p1289
-VINFO
-p1290
-sV_context_is_admin
-p1291
-I01
-sV_context_auth_token_info
-p1292
-(dp1293
-Vtoken
-p1294
-(dp1295
-Vmethods
-p1296
-(lp1297
-Vpassword
-p1298
-asVroles
-p1299
-(lp1300
-(dp1301
-Vid
-p1302
-Vd475171bf8304e06a74b1add560b1f28
-p1303
-sVname
-p1304
-Vadmin
-p1305
-sasVauth_token
-p1306
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p1307
-sVexpires_at
-p1308
-V2017-11-30T12:05:08.000000Z
-p1309
-sVproject
-p1310
-(dp1311
-Vdomain
-p1312
-(dp1313
-g1302
-Vdefault
-p1314
-sg1304
-VDefault
-p1315
-ssg1302
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1316
-sg1304
-Vapexlake
-p1317
-ssVcatalog
-p1318
-(lp1319
-(dp1320
-Vendpoints
-p1321
-(lp1322
-(dp1323
-Vurl
-p1324
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p1325
-sVinterface
-p1326
-Vpublic
-p1327
-sVregion
-p1328
-VRegionOne
-p1329
-sVregion_id
-p1330
-VRegionOne
-p1331
-sg1302
-V13359d68397c4732b5d455941ac95989
-p1332
-sa(dp1333
-g1324
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p1334
-sg1326
-Vinternal
-p1335
-sg1328
-VRegionOne
-p1336
-sg1330
-VRegionOne
-p1337
-sg1302
-V50aeae6c5d034dcb80871bdac7391209
-p1338
-sa(dp1339
-g1324
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p1340
-sg1326
-Vadmin
-p1341
-sg1328
-VRegionOne
-p1342
-sg1330
-VRegionOne
-p1343
-sg1302
-V93b06f780b224cbd9b514c2041d3db63
-p1344
-sasVtype
-p1345
-Vvolumev3
-p1346
-sg1302
-V00a63293a3154089a4c80b60b4aa9429
-p1347
-sg1304
-Vcinderv3
-p1348
-sa(dp1349
-g1321
-(lp1350
-(dp1351
-g1324
-Vhttp://172.16.0.5:8000/v1
-p1352
-sg1326
-Vadmin
-p1353
-sg1328
-VRegionOne
-p1354
-sg1330
-VRegionOne
-p1355
-sg1302
-V24acffb5d9154df4981db7424b7669bd
-p1356
-sa(dp1357
-g1324
-Vhttp://172.18.0.8:8000/v1
-p1358
-sg1326
-Vpublic
-p1359
-sg1328
-VRegionOne
-p1360
-sg1330
-VRegionOne
-p1361
-sg1302
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p1362
-sa(dp1363
-g1324
-Vhttp://172.16.0.5:8000/v1
-p1364
-sg1326
-Vinternal
-p1365
-sg1328
-VRegionOne
-p1366
-sg1330
-VRegionOne
-p1367
-sg1302
-V679262173a714d76a078051b95f8c969
-p1368
-sasg1345
-Vcloudformation
-p1369
-sg1302
-V245169ccae564a7db06ca002f1553b51
-p1370
-sg1304
-Vheat-cfn
-p1371
-sa(dp1372
-g1321
-(lp1373
-(dp1374
-g1324
-Vhttp://172.18.0.8:8080
-p1375
-sg1326
-Vpublic
-p1376
-sg1328
-VRegionOne
-p1377
-sg1330
-VRegionOne
-p1378
-sg1302
-V04a6ef3db6b046b1893ed45a3f906f6c
-p1379
-sa(dp1380
-g1324
-Vhttp://172.16.0.5:8080
-p1381
-sg1326
-Vinternal
-p1382
-sg1328
-VRegionOne
-p1383
-sg1330
-VRegionOne
-p1384
-sg1302
-V3e30684c9f74492b8ca9a64dd04261e6
-p1385
-sa(dp1386
-g1324
-Vhttp://172.16.0.5:8080
-p1387
-sg1326
-Vadmin
-p1388
-sg1328
-VRegionOne
-p1389
-sg1330
-VRegionOne
-p1390
-sg1302
-Vc5384b55cd7a441582f151c6b2807745
-p1391
-sasg1345
-Vs3
-p1392
-sg1302
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p1393
-sg1304
-Vswift_s3
-p1394
-sa(dp1395
-g1321
-(lp1396
-(dp1397
-g1324
-Vhttp://172.16.0.5:9696
-p1398
-sg1326
-Vadmin
-p1399
-sg1328
-VRegionOne
-p1400
-sg1330
-VRegionOne
-p1401
-sg1302
-V38b78b2c00264f59a4ade9392f88132b
-p1402
-sa(dp1403
-g1324
-Vhttp://172.18.0.8:9696
-p1404
-sg1326
-Vpublic
-p1405
-sg1328
-VRegionOne
-p1406
-sg1330
-VRegionOne
-p1407
-sg1302
-Vb5d0f72fbf674f84adf8929341e45586
-p1408
-sa(dp1409
-g1324
-Vhttp://172.16.0.5:9696
-p1410
-sg1326
-Vinternal
-p1411
-sg1328
-VRegionOne
-p1412
-sg1330
-VRegionOne
-p1413
-sg1302
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p1414
-sasg1345
-Vnetwork
-p1415
-sg1302
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p1416
-sg1304
-Vneutron
-p1417
-sa(dp1418
-g1321
-(lp1419
-(dp1420
-g1324
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1421
-sg1326
-Vinternal
-p1422
-sg1328
-VRegionOne
-p1423
-sg1330
-VRegionOne
-p1424
-sg1302
-V7c60744a22724044a92928bc2fa9e422
-p1425
-sa(dp1426
-g1324
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1427
-sg1326
-Vadmin
-p1428
-sg1328
-VRegionOne
-p1429
-sg1330
-VRegionOne
-p1430
-sg1302
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p1431
-sa(dp1432
-g1324
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1433
-sg1326
-Vpublic
-p1434
-sg1328
-VRegionOne
-p1435
-sg1330
-VRegionOne
-p1436
-sg1302
-Vde47d994bdc147bdb824474ea699a77a
-p1437
-sasg1345
-Vorchestration
-p1438
-sg1302
-V65a72244f7c54382aeebf5dfdeab8140
-p1439
-sg1304
-Vheat
-p1440
-sa(dp1441
-g1321
-(lp1442
-(dp1443
-g1324
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1444
-sg1326
-Vinternal
-p1445
-sg1328
-VRegionOne
-p1446
-sg1330
-VRegionOne
-p1447
-sg1302
-V3a25e85ecaa44b678c3721c2d3d39b38
-p1448
-sa(dp1449
-g1324
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1450
-sg1326
-Vadmin
-p1451
-sg1328
-VRegionOne
-p1452
-sg1330
-VRegionOne
-p1453
-sg1302
-V68c763474c3d4aa28c4ee0e0249998eb
-p1454
-sa(dp1455
-g1324
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1456
-sg1326
-Vpublic
-p1457
-sg1328
-VRegionOne
-p1458
-sg1330
-VRegionOne
-p1459
-sg1302
-Ve0c861373e94468db521d5a8793d33d1
-p1460
-sasg1345
-Vvolume
-p1461
-sg1302
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p1462
-sg1304
-Vcinder
-p1463
-sa(dp1464
-g1321
-(lp1465
-(dp1466
-g1324
-Vhttp://172.18.0.8:5000/v2.0
-p1467
-sg1326
-Vpublic
-p1468
-sg1328
-VRegionOne
-p1469
-sg1330
-VRegionOne
-p1470
-sg1302
-V6aa35bc15a35447db58ec5b67087f96a
-p1471
-sa(dp1472
-g1324
-Vhttp://172.16.0.5:5000/v2.0
-p1473
-sg1326
-Vinternal
-p1474
-sg1328
-VRegionOne
-p1475
-sg1330
-VRegionOne
-p1476
-sg1302
-V6b4742f26b694b93bdbcb37304d22f69
-p1477
-sa(dp1478
-g1324
-Vhttp://172.16.0.5:35357/v2.0
-p1479
-sg1326
-Vadmin
-p1480
-sg1328
-VRegionOne
-p1481
-sg1330
-VRegionOne
-p1482
-sg1302
-Vadc120ea606644a299a3c91a7ceeb8c4
-p1483
-sasg1345
-Videntity
-p1484
-sg1302
-V9f95de9f4efc4730b4dd90354894e1dc
-p1485
-sg1304
-Vkeystone
-p1486
-sa(dp1487
-g1321
-(lp1488
-(dp1489
-g1324
-Vhttp://172.16.0.5:9292
-p1490
-sg1326
-Vadmin
-p1491
-sg1328
-VRegionOne
-p1492
-sg1330
-VRegionOne
-p1493
-sg1302
-V049519f829be4e7fb5f44ae9f470efdf
-p1494
-sa(dp1495
-g1324
-Vhttp://172.18.0.8:9292
-p1496
-sg1326
-Vpublic
-p1497
-sg1328
-VRegionOne
-p1498
-sg1330
-VRegionOne
-p1499
-sg1302
-V1baebbbf35744192b335f4f293d1a9d8
-p1500
-sa(dp1501
-g1324
-Vhttp://172.16.0.5:9292
-p1502
-sg1326
-Vinternal
-p1503
-sg1328
-VRegionOne
-p1504
-sg1330
-VRegionOne
-p1505
-sg1302
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p1506
-sasg1345
-Vimage
-p1507
-sg1302
-Va39ec0213acc45ceb59346299e78d6c0
-p1508
-sg1304
-Vglance
-p1509
-sa(dp1510
-g1321
-(lp1511
-(dp1512
-g1324
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1513
-sg1326
-Vinternal
-p1514
-sg1328
-VRegionOne
-p1515
-sg1330
-VRegionOne
-p1516
-sg1302
-V2cd9d66e95484830a9006177e301aa57
-p1517
-sa(dp1518
-g1324
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1519
-sg1326
-Vpublic
-p1520
-sg1328
-VRegionOne
-p1521
-sg1330
-VRegionOne
-p1522
-sg1302
-Vbe2d979150a2401b9e7d5c365372d093
-p1523
-sa(dp1524
-g1324
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1525
-sg1326
-Vadmin
-p1526
-sg1328
-VRegionOne
-p1527
-sg1330
-VRegionOne
-p1528
-sg1302
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p1529
-sasg1345
-Vcompute_legacy
-p1530
-sg1302
-Va4dd95e3fde340468f8c1d7df9a853d0
-p1531
-sg1304
-Vcompute_legacy
-p1532
-sa(dp1533
-g1321
-(lp1534
-(dp1535
-g1324
-Vhttp://172.16.0.5:8774/v2.1
-p1536
-sg1326
-Vadmin
-p1537
-sg1328
-VRegionOne
-p1538
-sg1330
-VRegionOne
-p1539
-sg1302
-V0307d2c32dd54839aa5bc39746eeb186
-p1540
-sa(dp1541
-g1324
-Vhttp://172.18.0.8:8774/v2.1
-p1542
-sg1326
-Vpublic
-p1543
-sg1328
-VRegionOne
-p1544
-sg1330
-VRegionOne
-p1545
-sg1302
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p1546
-sa(dp1547
-g1324
-Vhttp://172.16.0.5:8774/v2.1
-p1548
-sg1326
-Vinternal
-p1549
-sg1328
-VRegionOne
-p1550
-sg1330
-VRegionOne
-p1551
-sg1302
-Vdb005ab592334fc599c142cf861e754f
-p1552
-sasg1345
-Vcompute
-p1553
-sg1302
-Vc165d40b8c3849bcb6067a3df2540c62
-p1554
-sg1304
-Vnova
-p1555
-sa(dp1556
-g1321
-(lp1557
-(dp1558
-g1324
-Vhttp://172.16.0.5:8080/swift/v1
-p1559
-sg1326
-Vadmin
-p1560
-sg1328
-VRegionOne
-p1561
-sg1330
-VRegionOne
-p1562
-sg1302
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p1563
-sa(dp1564
-g1324
-Vhttp://172.16.0.5:8080/swift/v1
-p1565
-sg1326
-Vinternal
-p1566
-sg1328
-VRegionOne
-p1567
-sg1330
-VRegionOne
-p1568
-sg1302
-V764118d3a33444ac980632d281acf4a7
-p1569
-sa(dp1570
-g1324
-Vhttp://172.18.0.8:8080/swift/v1
-p1571
-sg1326
-Vpublic
-p1572
-sg1328
-VRegionOne
-p1573
-sg1330
-VRegionOne
-p1574
-sg1302
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p1575
-sasg1345
-Vobject-store
-p1576
-sg1302
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p1577
-sg1304
-Vswift
-p1578
-sa(dp1579
-g1321
-(lp1580
-(dp1581
-g1324
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1582
-sg1326
-Vinternal
-p1583
-sg1328
-VRegionOne
-p1584
-sg1330
-VRegionOne
-p1585
-sg1302
-V61ea745c91ab4eb59464679931219024
-p1586
-sa(dp1587
-g1324
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1588
-sg1326
-Vadmin
-p1589
-sg1328
-VRegionOne
-p1590
-sg1330
-VRegionOne
-p1591
-sg1302
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p1592
-sa(dp1593
-g1324
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1594
-sg1326
-Vpublic
-p1595
-sg1328
-VRegionOne
-p1596
-sg1330
-VRegionOne
-p1597
-sg1302
-V7155772851884dc6954c7345d350796f
-p1598
-sasg1345
-Vvolumev2
-p1599
-sg1302
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p1600
-sg1304
-Vcinderv2
-p1601
-sa(dp1602
-g1321
-(lp1603
-(dp1604
-g1324
-Vhttp://172.18.0.8:9494
-p1605
-sg1326
-Vpublic
-p1606
-sg1328
-VRegionOne
-p1607
-sg1330
-VRegionOne
-p1608
-sg1302
-V43a202e889694d51a3b11899c252a8a9
-p1609
-sa(dp1610
-g1324
-Vhttp://172.16.0.5:9494
-p1611
-sg1326
-Vadmin
-p1612
-sg1328
-VRegionOne
-p1613
-sg1330
-VRegionOne
-p1614
-sg1302
-Vfa3c9de06e854542b236aa24b53e19a1
-p1615
-sa(dp1616
-g1324
-Vhttp://172.16.0.5:9494
-p1617
-sg1326
-Vinternal
-p1618
-sg1328
-VRegionOne
-p1619
-sg1330
-VRegionOne
-p1620
-sg1302
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p1621
-sasg1345
-Vartifact
-p1622
-sg1302
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p1623
-sg1304
-Vglare
-p1624
-sasVversion
-p1625
-Vv3
-p1626
-sVuser
-p1627
-(dp1628
-g1312
-(dp1629
-g1302
-Vdefault
-p1630
-sg1304
-VDefault
-p1631
-ssg1302
-Vef7a4f67379f41aba489a0b6d6a62094
-p1632
-sg1304
-Violie
-p1633
-ssVaudit_ids
-p1634
-(lp1635
-VjaR3K510SNyUdFi1DAdnxw
-p1636
-asVissued_at
-p1637
-V2017-11-30T11:05:08.000000Z
-p1638
-sssV_context_user
-p1639
-NsVpublisher_id
-p1640
-Vorchestration.machine-A
-p1641
-sVmessage_id
-p1642
-V9f1553ca-ac23-4ff1-9dbd-fd69e26809c6
-p1643
-sV_context_roles
-p1644
-(lp1645
-Vadmin
-p1646
-asV_context_auth_url
-p1647
-Vhttp://172.16.0.5:35357/v3/
-p1648
-sVtimestamp
-p1649
-V2017-11-30 11:05:08.818305
-p1650
-sV_unique_id
-p1651
-Vc82d5477743442b689aefd2633fd78a0
-p1652
-sV_context_tenant_id
-p1653
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1654
-sV_context_user_domain_id
-p1655
-Vdefault
-p1656
-sV_context_password
-p1657
-NsV_context_trustor_user_id
-p1658
-NsV_context_project_domain_id
-p1659
-Vdefault
-p1660
-sV_context_aws_creds
-p1661
-NsV_context_tenant
-p1662
-Vapexlake
-p1663
-sV_context_user_identity
-p1664
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p1665
-stp1666
-a(F4.4275989532470703
-Vcompute.instance.shutdown.end
-p1667
-(dp1668
-V_context_domain
-p1669
-NsV_context_request_id
-p1670
-Vreq-77cd0d4a-d7b6-4b82-9768-9b5bc325309a
-p1671
-sV_context_quota_class
-p1672
-NsVevent_type
-p1673
-g1667
-sV_context_service_catalog
-p1674
-(lp1675
-(dp1676
-Vendpoints
-p1677
-(lp1678
-(dp1679
-VadminURL
-p1680
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1681
-sVregion
-p1682
-VRegionOne
-p1683
-sVinternalURL
-p1684
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1685
-sVpublicURL
-p1686
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1687
-sasVtype
-p1688
-Vvolume
-p1689
-sVname
-p1690
-Vcinder
-p1691
-sa(dp1692
-g1677
-(lp1693
-(dp1694
-g1680
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1695
-sg1682
-VRegionOne
-p1696
-sg1684
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1697
-sg1686
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1698
-sasg1688
-Vvolumev2
-p1699
-sg1690
-Vcinderv2
-p1700
-sasV_context_auth_token
-p1701
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p1702
-sV_context_resource_uuid
-p1703
-NsV_context_user_id
-p1704
-Vef7a4f67379f41aba489a0b6d6a62094
-p1705
-sVpayload
-p1706
-(dp1707
-Vstate_description
-p1708
-Vdeleting
-p1709
-sVavailability_zone
-p1710
-Vnova
-p1711
-sVterminated_at
-p1712
-V
-sVephemeral_gb
-p1713
-I0
-sVinstance_type_id
-p1714
-I1
-sVdeleted_at
-p1715
-V
-sVreservation_id
-p1716
-Vr-61su4ljd
-p1717
-sVmemory_mb
-p1718
-I4096
-sVdisplay_name
-p1719
-Vvm_test
-p1720
-sVhostname
-p1721
-Vvm-test
-p1722
-sVstate
-p1723
-Vactive
-p1724
-sVprogress
-p1725
-V
-sVlaunched_at
-p1726
-V2017-11-30T11:04:08.000000
-p1727
-sVmetadata
-p1728
-(dp1729
-sVnode
-p1730
-Vmachine-B
-p1731
-sVramdisk_id
-p1732
-V
-sVaccess_ip_v6
-p1733
-NsVdisk_gb
-p1734
-I40
-sVaccess_ip_v4
-p1735
-NsVkernel_id
-p1736
-V
-sVhost
-p1737
-Vmachine-B
-p1738
-sVuser_id
-p1739
-Vef7a4f67379f41aba489a0b6d6a62094
-p1740
-sVimage_ref_url
-p1741
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1742
-sVcell_name
-p1743
-V
-sVroot_gb
-p1744
-I40
-sVtenant_id
-p1745
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1746
-sVcreated_at
-p1747
-V2017-11-30T11:03:57.000000
-p1748
-sVinstance_id
-p1749
-Va7115aef-929d-454e-9eba-eff685db7a15
-p1750
-sVinstance_type
-p1751
-Vm1.medium
-p1752
-sVvcpus
-p1753
-I2
-sVimage_meta
-p1754
-(dp1755
-Vmin_disk
-p1756
-V40
-p1757
-sVcontainer_format
-p1758
-Vbare
-p1759
-sVmin_ram
-p1760
-V0
-sVdisk_format
-p1761
-Vqcow2
-p1762
-sVbase_image_ref
-p1763
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1764
-ssVarchitecture
-p1765
-NsVos_type
-p1766
-NsVinstance_flavor_id
-p1767
-V3
-ssV_context_show_deleted
-p1768
-I00
-sVpriority
-p1769
-VINFO
-p1770
-sV_context_is_admin
-p1771
-I01
-sV_context_project_domain
-p1772
-NsV_context_user
-p1773
-Vef7a4f67379f41aba489a0b6d6a62094
-p1774
-sVpublisher_id
-p1775
-Vcompute.machine-B
-p1776
-sVmessage_id
-p1777
-V660c1ac8-feb6-4e67-ace6-664086dbbbc4
-p1778
-sV_context_remote_address
-p1779
-V172.16.0.5
-p1780
-sV_context_roles
-p1781
-(lp1782
-Vadmin
-p1783
-asVtimestamp
-p1784
-V2017-11-30 11:05:08.833156
-p1785
-sV_context_timestamp
-p1786
-V2017-11-30T11:05:04.882670
-p1787
-sV_unique_id
-p1788
-Va59d203de02b45639e61d7ff8a392cb7
-p1789
-sV_context_project_name
-p1790
-Vapexlake
-p1791
-sV_context_read_deleted
-p1792
-Vno
-p1793
-sV_context_user_identity
-p1794
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1795
-sV_context_tenant
-p1796
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1797
-sV_context_instance_lock_checked
-p1798
-I00
-sV_context_project_id
-p1799
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1800
-sV_context_read_only
-p1801
-I00
-sV_context_user_domain
-p1802
-NsV_context_user_name
-p1803
-Violie
-p1804
-stp1805
-a(F4.4549601078033447
-Vfloatingip.delete.start
-p1806
-(dp1807
-V_context_domain
-p1808
-NsV_context_request_id
-p1809
-Vreq-959d33ec-ffea-41f4-aef1-a048e5eb4374
-p1810
-sVevent_type
-p1811
-g1806
-sV_context_auth_token
-p1812
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p1813
-sV_context_resource_uuid
-p1814
-NsV_context_tenant_name
-p1815
-Vapexlake
-p1816
-sV_context_user_id
-p1817
-Vef7a4f67379f41aba489a0b6d6a62094
-p1818
-sVpayload
-p1819
-(dp1820
-Vfloatingip_id
-p1821
-V3068dfa3-385a-421b-a3b7-fbfbb47fbc8b
-p1822
-ssV_context_show_deleted
-p1823
-I00
-sVpriority
-p1824
-VINFO
-p1825
-sV_context_is_admin
-p1826
-I01
-sV_context_project_domain
-p1827
-NsV_context_user
-p1828
-Vef7a4f67379f41aba489a0b6d6a62094
-p1829
-sVpublisher_id
-p1830
-Vnetwork.machine-A
-p1831
-sVmessage_id
-p1832
-V9bee27df-e0b7-4145-9f52-db2f446eafb9
-p1833
-sV_context_roles
-p1834
-(lp1835
-Vadmin
-p1836
-asVtimestamp
-p1837
-V2017-11-30 11:05:08.860268
-p1838
-sV_context_timestamp
-p1839
-V2017-11-30 11:05:08.859172
-p1840
-sV_unique_id
-p1841
-V083ca961b7df4ca8964c42f9ba56f3bb
-p1842
-sV_context_tenant_id
-p1843
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1844
-sV_context_project_name
-p1845
-Vapexlake
-p1846
-sV_context_user_identity
-p1847
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1848
-sV_context_tenant
-p1849
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1850
-sV_context_project_id
-p1851
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1852
-sV_context_read_only
-p1853
-I00
-sV_context_user_domain
-p1854
-NsV_context_user_name
-p1855
-Violie
-p1856
-stp1857
-a(F4.5185680389404297
-Vcompute.instance.update
-p1858
-(dp1859
-V_context_domain
-p1860
-NsV_context_request_id
-p1861
-Vreq-77cd0d4a-d7b6-4b82-9768-9b5bc325309a
-p1862
-sV_context_quota_class
-p1863
-NsVevent_type
-p1864
-g1858
-sV_context_service_catalog
-p1865
-(lp1866
-(dp1867
-Vendpoints
-p1868
-(lp1869
-(dp1870
-VadminURL
-p1871
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1872
-sVregion
-p1873
-VRegionOne
-p1874
-sVinternalURL
-p1875
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1876
-sVpublicURL
-p1877
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p1878
-sasVtype
-p1879
-Vvolume
-p1880
-sVname
-p1881
-Vcinder
-p1882
-sa(dp1883
-g1868
-(lp1884
-(dp1885
-g1871
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1886
-sg1873
-VRegionOne
-p1887
-sg1875
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1888
-sg1877
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p1889
-sasg1879
-Vvolumev2
-p1890
-sg1881
-Vcinderv2
-p1891
-sasV_context_auth_token
-p1892
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p1893
-sV_context_resource_uuid
-p1894
-NsV_context_user_id
-p1895
-Vef7a4f67379f41aba489a0b6d6a62094
-p1896
-sVpayload
-p1897
-(dp1898
-Vstate_description
-p1899
-V
-sVavailability_zone
-p1900
-Vnova
-p1901
-sVterminated_at
-p1902
-V2017-11-30T11:05:08.000000
-p1903
-sVephemeral_gb
-p1904
-I0
-sVinstance_type_id
-p1905
-I1
-sVbandwidth
-p1906
-(dp1907
-sVdeleted_at
-p1908
-V
-sVreservation_id
-p1909
-Vr-61su4ljd
-p1910
-sVmemory_mb
-p1911
-I4096
-sVdisplay_name
-p1912
-Vvm_test
-p1913
-sVhostname
-p1914
-Vvm-test
-p1915
-sVstate
-p1916
-Vdeleted
-p1917
-sVold_state
-p1918
-Vactive
-p1919
-sVprogress
-p1920
-V
-sVlaunched_at
-p1921
-V2017-11-30T11:04:08.000000
-p1922
-sVmetadata
-p1923
-(dp1924
-sVnode
-p1925
-Vmachine-B
-p1926
-sVramdisk_id
-p1927
-V
-sVaccess_ip_v6
-p1928
-NsVdisk_gb
-p1929
-I40
-sVaccess_ip_v4
-p1930
-NsVkernel_id
-p1931
-V
-sVhost
-p1932
-Vmachine-B
-p1933
-sVuser_id
-p1934
-Vef7a4f67379f41aba489a0b6d6a62094
-p1935
-sVimage_ref_url
-p1936
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p1937
-sVcell_name
-p1938
-V
-sVaudit_period_beginning
-p1939
-V2017-11-01T00:00:00.000000
-p1940
-sVroot_gb
-p1941
-I40
-sVtenant_id
-p1942
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1943
-sVcreated_at
-p1944
-V2017-11-30T11:03:57.000000
-p1945
-sVold_task_state
-p1946
-Vdeleting
-p1947
-sVinstance_id
-p1948
-Va7115aef-929d-454e-9eba-eff685db7a15
-p1949
-sVinstance_type
-p1950
-Vm1.medium
-p1951
-sVvcpus
-p1952
-I2
-sVimage_meta
-p1953
-(dp1954
-Vmin_disk
-p1955
-V40
-p1956
-sVcontainer_format
-p1957
-Vbare
-p1958
-sVmin_ram
-p1959
-V0
-sVdisk_format
-p1960
-Vqcow2
-p1961
-sVbase_image_ref
-p1962
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p1963
-ssVarchitecture
-p1964
-NsVnew_task_state
-p1965
-NsVaudit_period_ending
-p1966
-V2017-11-30T11:05:08.918587
-p1967
-sVos_type
-p1968
-NsVinstance_flavor_id
-p1969
-V3
-ssV_context_show_deleted
-p1970
-I00
-sVpriority
-p1971
-VINFO
-p1972
-sV_context_is_admin
-p1973
-I01
-sV_context_project_domain
-p1974
-NsV_context_user
-p1975
-Vef7a4f67379f41aba489a0b6d6a62094
-p1976
-sVpublisher_id
-p1977
-Vcompute.machine-A
-p1978
-sVmessage_id
-p1979
-V9f438008-e584-44d3-8edc-3ababaf9e803
-p1980
-sV_context_remote_address
-p1981
-V172.16.0.5
-p1982
-sV_context_roles
-p1983
-(lp1984
-Vadmin
-p1985
-asVtimestamp
-p1986
-V2017-11-30 11:05:08.923519
-p1987
-sV_context_timestamp
-p1988
-V2017-11-30T11:05:04.882670
-p1989
-sV_unique_id
-p1990
-Vc0b5f2ed92b34e73891af89dc2e173bb
-p1991
-sV_context_project_name
-p1992
-Vapexlake
-p1993
-sV_context_read_deleted
-p1994
-Vno
-p1995
-sV_context_user_identity
-p1996
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p1997
-sV_context_tenant
-p1998
-V187e5e95e7eb499d8a421b3d4ed966d5
-p1999
-sV_context_instance_lock_checked
-p2000
-I00
-sV_context_project_id
-p2001
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2002
-sV_context_read_only
-p2003
-I00
-sV_context_user_domain
-p2004
-NsV_context_user_name
-p2005
-Violie
-p2006
-stp2007
-a(F4.6545331478118896
-Vfloatingip.delete.end
-p2008
-(dp2009
-V_context_domain
-p2010
-NsV_context_request_id
-p2011
-Vreq-959d33ec-ffea-41f4-aef1-a048e5eb4374
-p2012
-sVevent_type
-p2013
-g2008
-sV_context_auth_token
-p2014
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p2015
-sV_context_resource_uuid
-p2016
-NsV_context_tenant_name
-p2017
-Vapexlake
-p2018
-sV_context_user_id
-p2019
-Vef7a4f67379f41aba489a0b6d6a62094
-p2020
-sVpayload
-p2021
-(dp2022
-Vfloatingip_id
-p2023
-V3068dfa3-385a-421b-a3b7-fbfbb47fbc8b
-p2024
-ssV_context_show_deleted
-p2025
-I00
-sVpriority
-p2026
-VINFO
-p2027
-sV_context_is_admin
-p2028
-I01
-sV_context_project_domain
-p2029
-NsV_context_user
-p2030
-Vef7a4f67379f41aba489a0b6d6a62094
-p2031
-sVpublisher_id
-p2032
-Vnetwork.machine-A
-p2033
-sVmessage_id
-p2034
-Vcb28701e-8a84-4903-9323-4f3e91eb7cc9
-p2035
-sV_context_roles
-p2036
-(lp2037
-Vadmin
-p2038
-asVtimestamp
-p2039
-V2017-11-30 11:05:09.059740
-p2040
-sV_context_timestamp
-p2041
-V2017-11-30 11:05:08.859172
-p2042
-sV_unique_id
-p2043
-Ve3692d74a6f641c7b0d795c73fc02c6b
-p2044
-sV_context_tenant_id
-p2045
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2046
-sV_context_project_name
-p2047
-Vapexlake
-p2048
-sV_context_user_identity
-p2049
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2050
-sV_context_tenant
-p2051
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2052
-sV_context_project_id
-p2053
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2054
-sV_context_read_only
-p2055
-I00
-sV_context_user_domain
-p2056
-NsV_context_user_name
-p2057
-Violie
-p2058
-stp2059
-a(F4.6633651256561279
-Vcompute.instance.delete.end
-p2060
-(dp2061
-V_context_domain
-p2062
-NsV_context_request_id
-p2063
-Vreq-77cd0d4a-d7b6-4b82-9768-9b5bc325309a
-p2064
-sV_context_quota_class
-p2065
-NsVevent_type
-p2066
-g2060
-sV_context_service_catalog
-p2067
-(lp2068
-(dp2069
-Vendpoints
-p2070
-(lp2071
-(dp2072
-VadminURL
-p2073
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2074
-sVregion
-p2075
-VRegionOne
-p2076
-sVinternalURL
-p2077
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2078
-sVpublicURL
-p2079
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2080
-sasVtype
-p2081
-Vvolume
-p2082
-sVname
-p2083
-Vcinder
-p2084
-sa(dp2085
-g2070
-(lp2086
-(dp2087
-g2073
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2088
-sg2075
-VRegionOne
-p2089
-sg2077
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2090
-sg2079
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2091
-sasg2081
-Vvolumev2
-p2092
-sg2083
-Vcinderv2
-p2093
-sasV_context_auth_token
-p2094
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p2095
-sV_context_resource_uuid
-p2096
-NsV_context_user_id
-p2097
-Vef7a4f67379f41aba489a0b6d6a62094
-p2098
-sVpayload
-p2099
-(dp2100
-Vstate_description
-p2101
-V
-sVavailability_zone
-p2102
-Vnova
-p2103
-sVterminated_at
-p2104
-V2017-11-30T11:05:08.846814
-p2105
-sVephemeral_gb
-p2106
-I0
-sVinstance_type_id
-p2107
-I1
-sVdeleted_at
-p2108
-V2017-11-30T11:05:08.000000
-p2109
-sVreservation_id
-p2110
-Vr-61su4ljd
-p2111
-sVmemory_mb
-p2112
-I4096
-sVdisplay_name
-p2113
-Vvm_test
-p2114
-sVhostname
-p2115
-Vvm-test
-p2116
-sVstate
-p2117
-Vdeleted
-p2118
-sVprogress
-p2119
-V
-sVlaunched_at
-p2120
-V2017-11-30T11:04:08.000000
-p2121
-sVmetadata
-p2122
-(dp2123
-sVnode
-p2124
-Vmachine-B
-p2125
-sVramdisk_id
-p2126
-V
-sVaccess_ip_v6
-p2127
-NsVdisk_gb
-p2128
-I40
-sVaccess_ip_v4
-p2129
-NsVkernel_id
-p2130
-V
-sVhost
-p2131
-Vmachine-B
-p2132
-sVuser_id
-p2133
-Vef7a4f67379f41aba489a0b6d6a62094
-p2134
-sVimage_ref_url
-p2135
-Vhttp://172.16.0.6:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2136
-sVcell_name
-p2137
-V
-sVroot_gb
-p2138
-I40
-sVtenant_id
-p2139
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2140
-sVcreated_at
-p2141
-V2017-11-30T11:03:57.000000
-p2142
-sVinstance_id
-p2143
-Va7115aef-929d-454e-9eba-eff685db7a15
-p2144
-sVinstance_type
-p2145
-Vm1.medium
-p2146
-sVvcpus
-p2147
-I2
-sVimage_meta
-p2148
-(dp2149
-Vmin_disk
-p2150
-V40
-p2151
-sVcontainer_format
-p2152
-Vbare
-p2153
-sVmin_ram
-p2154
-V0
-sVdisk_format
-p2155
-Vqcow2
-p2156
-sVbase_image_ref
-p2157
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2158
-ssVarchitecture
-p2159
-NsVos_type
-p2160
-NsVinstance_flavor_id
-p2161
-V3
-ssV_context_show_deleted
-p2162
-I00
-sVpriority
-p2163
-VINFO
-p2164
-sV_context_is_admin
-p2165
-I01
-sV_context_project_domain
-p2166
-NsV_context_user
-p2167
-Vef7a4f67379f41aba489a0b6d6a62094
-p2168
-sVpublisher_id
-p2169
-Vcompute.machine-B
-p2170
-sVmessage_id
-p2171
-Vdd224cf4-660d-41e8-9a88-d9bef0242459
-p2172
-sV_context_remote_address
-p2173
-V172.16.0.5
-p2174
-sV_context_roles
-p2175
-(lp2176
-Vadmin
-p2177
-asVtimestamp
-p2178
-V2017-11-30 11:05:09.068987
-p2179
-sV_context_timestamp
-p2180
-V2017-11-30T11:05:04.882670
-p2181
-sV_unique_id
-p2182
-V50e6086758ac449c942f9c0e6e4adfad
-p2183
-sV_context_project_name
-p2184
-Vapexlake
-p2185
-sV_context_read_deleted
-p2186
-Vno
-p2187
-sV_context_user_identity
-p2188
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2189
-sV_context_tenant
-p2190
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2191
-sV_context_instance_lock_checked
-p2192
-I00
-sV_context_project_id
-p2193
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2194
-sV_context_read_only
-p2195
-I00
-sV_context_user_domain
-p2196
-NsV_context_user_name
-p2197
-Violie
-p2198
-stp2199
-a(F4.8458340167999268
-Vcompute.instance.update
-p2200
-(dp2201
-V_context_domain
-p2202
-NsV_context_request_id
-p2203
-Vreq-14c241af-f5bf-4396-bbef-c7166326d04d
-p2204
-sV_context_quota_class
-p2205
-NsVevent_type
-p2206
-g2200
-sV_context_service_catalog
-p2207
-(lp2208
-(dp2209
-Vendpoints
-p2210
-(lp2211
-(dp2212
-VadminURL
-p2213
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2214
-sVregion
-p2215
-VRegionOne
-p2216
-sVinternalURL
-p2217
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2218
-sVpublicURL
-p2219
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2220
-sasVtype
-p2221
-Vvolume
-p2222
-sVname
-p2223
-Vcinder
-p2224
-sa(dp2225
-g2210
-(lp2226
-(dp2227
-g2213
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2228
-sg2215
-VRegionOne
-p2229
-sg2217
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2230
-sg2219
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2231
-sasg2221
-Vvolumev2
-p2232
-sg2223
-Vcinderv2
-p2233
-sasV_context_auth_token
-p2234
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p2235
-sV_context_resource_uuid
-p2236
-NsV_context_user_id
-p2237
-Vef7a4f67379f41aba489a0b6d6a62094
-p2238
-sVpayload
-p2239
-(dp2240
-Vstate_description
-p2241
-Vdeleting
-p2242
-sVavailability_zone
-p2243
-Vnova
-p2244
-sVterminated_at
-p2245
-V
-sVephemeral_gb
-p2246
-I0
-sVinstance_type_id
-p2247
-I1
-sVbandwidth
-p2248
-(dp2249
-sVdeleted_at
-p2250
-V
-sVreservation_id
-p2251
-Vr-4jmm1xbm
-p2252
-sVmemory_mb
-p2253
-I4096
-sVdisplay_name
-p2254
-Vvm_test
-p2255
-sVhostname
-p2256
-Vvm-test
-p2257
-sVstate
-p2258
-Vactive
-p2259
-sVold_state
-p2260
-Vactive
-p2261
-sVprogress
-p2262
-V
-sVlaunched_at
-p2263
-V2017-11-30T11:04:13.000000
-p2264
-sVmetadata
-p2265
-(dp2266
-sVnode
-p2267
-Vmachine-C
-p2268
-sVramdisk_id
-p2269
-V
-sVaccess_ip_v6
-p2270
-NsVdisk_gb
-p2271
-I40
-sVaccess_ip_v4
-p2272
-NsVkernel_id
-p2273
-V
-sVhost
-p2274
-Vmachine-C
-p2275
-sVuser_id
-p2276
-Vef7a4f67379f41aba489a0b6d6a62094
-p2277
-sVimage_ref_url
-p2278
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2279
-sVcell_name
-p2280
-V
-sVaudit_period_beginning
-p2281
-V2017-11-01T00:00:00.000000
-p2282
-sVroot_gb
-p2283
-I40
-sVtenant_id
-p2284
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2285
-sVcreated_at
-p2286
-V2017-11-30T11:03:59.000000
-p2287
-sVold_task_state
-p2288
-Vdeleting
-p2289
-sVinstance_id
-p2290
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p2291
-sVinstance_type
-p2292
-Vm1.medium
-p2293
-sVvcpus
-p2294
-I2
-sVimage_meta
-p2295
-(dp2296
-Vmin_disk
-p2297
-V40
-p2298
-sVcontainer_format
-p2299
-Vbare
-p2300
-sVmin_ram
-p2301
-V0
-sVdisk_format
-p2302
-Vqcow2
-p2303
-sVbase_image_ref
-p2304
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2305
-ssVarchitecture
-p2306
-NsVnew_task_state
-p2307
-Vdeleting
-p2308
-sVaudit_period_ending
-p2309
-V2017-11-30T11:05:09.243810
-p2310
-sVos_type
-p2311
-NsVinstance_flavor_id
-p2312
-V3
-ssV_context_show_deleted
-p2313
-I00
-sVpriority
-p2314
-VINFO
-p2315
-sV_context_is_admin
-p2316
-I01
-sV_context_project_domain
-p2317
-NsV_context_user
-p2318
-Vef7a4f67379f41aba489a0b6d6a62094
-p2319
-sVpublisher_id
-p2320
-Vcompute.machine-A
-p2321
-sVmessage_id
-p2322
-V98bd5717-7829-47f3-9740-6442eca7791f
-p2323
-sV_context_remote_address
-p2324
-V172.16.0.5
-p2325
-sV_context_roles
-p2326
-(lp2327
-Vadmin
-p2328
-asVtimestamp
-p2329
-V2017-11-30 11:05:09.247862
-p2330
-sV_context_timestamp
-p2331
-V2017-11-30T11:05:09.150712
-p2332
-sV_unique_id
-p2333
-V267db2bd980844428f41054bf5f033d5
-p2334
-sV_context_project_name
-p2335
-Vapexlake
-p2336
-sV_context_read_deleted
-p2337
-Vno
-p2338
-sV_context_user_identity
-p2339
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2340
-sV_context_tenant
-p2341
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2342
-sV_context_instance_lock_checked
-p2343
-I00
-sV_context_project_id
-p2344
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2345
-sV_context_read_only
-p2346
-I00
-sV_context_user_domain
-p2347
-NsV_context_user_name
-p2348
-Violie
-p2349
-stp2350
-a(F4.877432107925415
-Vcompute.instance.delete.start
-p2351
-(dp2352
-V_context_domain
-p2353
-NsV_context_request_id
-p2354
-Vreq-14c241af-f5bf-4396-bbef-c7166326d04d
-p2355
-sV_context_quota_class
-p2356
-NsVevent_type
-p2357
-g2351
-sV_context_service_catalog
-p2358
-(lp2359
-(dp2360
-Vendpoints
-p2361
-(lp2362
-(dp2363
-VadminURL
-p2364
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2365
-sVregion
-p2366
-VRegionOne
-p2367
-sVinternalURL
-p2368
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2369
-sVpublicURL
-p2370
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2371
-sasVtype
-p2372
-Vvolume
-p2373
-sVname
-p2374
-Vcinder
-p2375
-sa(dp2376
-g2361
-(lp2377
-(dp2378
-g2364
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2379
-sg2366
-VRegionOne
-p2380
-sg2368
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2381
-sg2370
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2382
-sasg2372
-Vvolumev2
-p2383
-sg2374
-Vcinderv2
-p2384
-sasV_context_auth_token
-p2385
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p2386
-sV_context_resource_uuid
-p2387
-NsV_context_user_id
-p2388
-Vef7a4f67379f41aba489a0b6d6a62094
-p2389
-sVpayload
-p2390
-(dp2391
-Vstate_description
-p2392
-Vdeleting
-p2393
-sVavailability_zone
-p2394
-Vnova
-p2395
-sVterminated_at
-p2396
-V
-sVephemeral_gb
-p2397
-I0
-sVinstance_type_id
-p2398
-I1
-sVdeleted_at
-p2399
-V
-sVreservation_id
-p2400
-Vr-4jmm1xbm
-p2401
-sVmemory_mb
-p2402
-I4096
-sVdisplay_name
-p2403
-Vvm_test
-p2404
-sVhostname
-p2405
-Vvm-test
-p2406
-sVstate
-p2407
-Vactive
-p2408
-sVprogress
-p2409
-V
-sVlaunched_at
-p2410
-V2017-11-30T11:04:13.000000
-p2411
-sVmetadata
-p2412
-(dp2413
-sVnode
-p2414
-Vmachine-C
-p2415
-sVramdisk_id
-p2416
-V
-sVaccess_ip_v6
-p2417
-NsVdisk_gb
-p2418
-I40
-sVaccess_ip_v4
-p2419
-NsVkernel_id
-p2420
-V
-sVhost
-p2421
-Vmachine-C
-p2422
-sVuser_id
-p2423
-Vef7a4f67379f41aba489a0b6d6a62094
-p2424
-sVimage_ref_url
-p2425
-Vhttp://172.16.0.7:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2426
-sVcell_name
-p2427
-V
-sVroot_gb
-p2428
-I40
-sVtenant_id
-p2429
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2430
-sVcreated_at
-p2431
-V2017-11-30T11:03:59.000000
-p2432
-sVinstance_id
-p2433
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p2434
-sVinstance_type
-p2435
-Vm1.medium
-p2436
-sVvcpus
-p2437
-I2
-sVimage_meta
-p2438
-(dp2439
-Vmin_disk
-p2440
-V40
-p2441
-sVcontainer_format
-p2442
-Vbare
-p2443
-sVmin_ram
-p2444
-V0
-sVdisk_format
-p2445
-Vqcow2
-p2446
-sVbase_image_ref
-p2447
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2448
-ssVarchitecture
-p2449
-NsVos_type
-p2450
-NsVinstance_flavor_id
-p2451
-V3
-ssV_context_show_deleted
-p2452
-I00
-sVpriority
-p2453
-VINFO
-p2454
-sV_context_is_admin
-p2455
-I01
-sV_context_project_domain
-p2456
-NsV_context_user
-p2457
-Vef7a4f67379f41aba489a0b6d6a62094
-p2458
-sVpublisher_id
-p2459
-Vcompute.machine-C
-p2460
-sVmessage_id
-p2461
-Va1a595f8-7265-44d2-9d4c-19298818229c
-p2462
-sV_context_remote_address
-p2463
-V172.16.0.5
-p2464
-sV_context_roles
-p2465
-(lp2466
-Vadmin
-p2467
-asVtimestamp
-p2468
-V2017-11-30 11:05:09.281561
-p2469
-sV_context_timestamp
-p2470
-V2017-11-30T11:05:09.150712
-p2471
-sV_unique_id
-p2472
-Vd31ca4e7694e400b82308566bc0029bb
-p2473
-sV_context_project_name
-p2474
-Vapexlake
-p2475
-sV_context_read_deleted
-p2476
-Vno
-p2477
-sV_context_user_identity
-p2478
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2479
-sV_context_tenant
-p2480
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2481
-sV_context_instance_lock_checked
-p2482
-I00
-sV_context_project_id
-p2483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2484
-sV_context_read_only
-p2485
-I00
-sV_context_user_domain
-p2486
-NsV_context_user_name
-p2487
-Violie
-p2488
-stp2489
-a(F4.8835561275482178
-Vcompute.instance.shutdown.start
-p2490
-(dp2491
-V_context_domain
-p2492
-NsV_context_request_id
-p2493
-Vreq-14c241af-f5bf-4396-bbef-c7166326d04d
-p2494
-sV_context_quota_class
-p2495
-NsVevent_type
-p2496
-g2490
-sV_context_service_catalog
-p2497
-(lp2498
-(dp2499
-Vendpoints
-p2500
-(lp2501
-(dp2502
-VadminURL
-p2503
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2504
-sVregion
-p2505
-VRegionOne
-p2506
-sVinternalURL
-p2507
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2508
-sVpublicURL
-p2509
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2510
-sasVtype
-p2511
-Vvolume
-p2512
-sVname
-p2513
-Vcinder
-p2514
-sa(dp2515
-g2500
-(lp2516
-(dp2517
-g2503
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2518
-sg2505
-VRegionOne
-p2519
-sg2507
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2520
-sg2509
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2521
-sasg2511
-Vvolumev2
-p2522
-sg2513
-Vcinderv2
-p2523
-sasV_context_auth_token
-p2524
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p2525
-sV_context_resource_uuid
-p2526
-NsV_context_user_id
-p2527
-Vef7a4f67379f41aba489a0b6d6a62094
-p2528
-sVpayload
-p2529
-(dp2530
-Vstate_description
-p2531
-Vdeleting
-p2532
-sVavailability_zone
-p2533
-Vnova
-p2534
-sVterminated_at
-p2535
-V
-sVephemeral_gb
-p2536
-I0
-sVinstance_type_id
-p2537
-I1
-sVdeleted_at
-p2538
-V
-sVreservation_id
-p2539
-Vr-4jmm1xbm
-p2540
-sVmemory_mb
-p2541
-I4096
-sVdisplay_name
-p2542
-Vvm_test
-p2543
-sVhostname
-p2544
-Vvm-test
-p2545
-sVstate
-p2546
-Vactive
-p2547
-sVprogress
-p2548
-V
-sVlaunched_at
-p2549
-V2017-11-30T11:04:13.000000
-p2550
-sVmetadata
-p2551
-(dp2552
-sVnode
-p2553
-Vmachine-C
-p2554
-sVramdisk_id
-p2555
-V
-sVaccess_ip_v6
-p2556
-NsVdisk_gb
-p2557
-I40
-sVaccess_ip_v4
-p2558
-NsVkernel_id
-p2559
-V
-sVhost
-p2560
-Vmachine-C
-p2561
-sVuser_id
-p2562
-Vef7a4f67379f41aba489a0b6d6a62094
-p2563
-sVimage_ref_url
-p2564
-Vhttp://172.16.0.7:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2565
-sVcell_name
-p2566
-V
-sVroot_gb
-p2567
-I40
-sVtenant_id
-p2568
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2569
-sVcreated_at
-p2570
-V2017-11-30T11:03:59.000000
-p2571
-sVinstance_id
-p2572
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p2573
-sVinstance_type
-p2574
-Vm1.medium
-p2575
-sVvcpus
-p2576
-I2
-sVimage_meta
-p2577
-(dp2578
-Vmin_disk
-p2579
-V40
-p2580
-sVcontainer_format
-p2581
-Vbare
-p2582
-sVmin_ram
-p2583
-V0
-sVdisk_format
-p2584
-Vqcow2
-p2585
-sVbase_image_ref
-p2586
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2587
-ssVarchitecture
-p2588
-NsVos_type
-p2589
-NsVinstance_flavor_id
-p2590
-V3
-ssV_context_show_deleted
-p2591
-I00
-sVpriority
-p2592
-VINFO
-p2593
-sV_context_is_admin
-p2594
-I01
-sV_context_project_domain
-p2595
-NsV_context_user
-p2596
-Vef7a4f67379f41aba489a0b6d6a62094
-p2597
-sVpublisher_id
-p2598
-Vcompute.machine-C
-p2599
-sVmessage_id
-p2600
-Vcb3fd2aa-54dd-4521-b25d-e58988992078
-p2601
-sV_context_remote_address
-p2602
-V172.16.0.5
-p2603
-sV_context_roles
-p2604
-(lp2605
-Vadmin
-p2606
-asVtimestamp
-p2607
-V2017-11-30 11:05:09.288268
-p2608
-sV_context_timestamp
-p2609
-V2017-11-30T11:05:09.150712
-p2610
-sV_unique_id
-p2611
-Va28203dbf2fe4f53bbba46fa06087fbc
-p2612
-sV_context_project_name
-p2613
-Vapexlake
-p2614
-sV_context_read_deleted
-p2615
-Vno
-p2616
-sV_context_user_identity
-p2617
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2618
-sV_context_tenant
-p2619
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2620
-sV_context_instance_lock_checked
-p2621
-I00
-sV_context_project_id
-p2622
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2623
-sV_context_read_only
-p2624
-I00
-sV_context_user_domain
-p2625
-NsV_context_user_name
-p2626
-Violie
-p2627
-stp2628
-a(F5.2918159961700439
-Vport.delete.start
-p2629
-(dp2630
-V_context_domain
-p2631
-NsV_context_request_id
-p2632
-Vreq-5a3ed285-0717-4760-8c65-d008d1d2a880
-p2633
-sVevent_type
-p2634
-g2629
-sV_context_auth_token
-p2635
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p2636
-sV_context_resource_uuid
-p2637
-NsV_context_tenant_name
-p2638
-Vapexlake
-p2639
-sV_context_user_id
-p2640
-Vef7a4f67379f41aba489a0b6d6a62094
-p2641
-sVpayload
-p2642
-(dp2643
-Vport_id
-p2644
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p2645
-ssV_context_show_deleted
-p2646
-I00
-sVpriority
-p2647
-VINFO
-p2648
-sV_context_is_admin
-p2649
-I01
-sV_context_project_domain
-p2650
-NsV_context_user
-p2651
-Vef7a4f67379f41aba489a0b6d6a62094
-p2652
-sVpublisher_id
-p2653
-Vnetwork.machine-A
-p2654
-sVmessage_id
-p2655
-V64416ff8-d04e-4aeb-b7d1-feba32996e67
-p2656
-sV_context_roles
-p2657
-(lp2658
-Vadmin
-p2659
-asVtimestamp
-p2660
-V2017-11-30 11:05:09.695822
-p2661
-sV_context_timestamp
-p2662
-V2017-11-30 11:05:09.694742
-p2663
-sV_unique_id
-p2664
-Vb77db20e024d4141a06be2547afeb0c0
-p2665
-sV_context_tenant_id
-p2666
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2667
-sV_context_project_name
-p2668
-Vapexlake
-p2669
-sV_context_user_identity
-p2670
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2671
-sV_context_tenant
-p2672
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2673
-sV_context_project_id
-p2674
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2675
-sV_context_read_only
-p2676
-I00
-sV_context_user_domain
-p2677
-NsV_context_user_name
-p2678
-Violie
-p2679
-stp2680
-a(F5.4250199794769287
-Vport.delete.end
-p2681
-(dp2682
-V_context_domain
-p2683
-NsV_context_request_id
-p2684
-Vreq-5a3ed285-0717-4760-8c65-d008d1d2a880
-p2685
-sVevent_type
-p2686
-g2681
-sV_context_auth_token
-p2687
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p2688
-sV_context_resource_uuid
-p2689
-NsV_context_tenant_name
-p2690
-Vapexlake
-p2691
-sV_context_user_id
-p2692
-Vef7a4f67379f41aba489a0b6d6a62094
-p2693
-sVpayload
-p2694
-(dp2695
-Vport_id
-p2696
-V441a4eab-dc11-495b-9915-dc50d3a99507
-p2697
-ssV_context_show_deleted
-p2698
-I00
-sVpriority
-p2699
-VINFO
-p2700
-sV_context_is_admin
-p2701
-I01
-sV_context_project_domain
-p2702
-NsV_context_user
-p2703
-Vef7a4f67379f41aba489a0b6d6a62094
-p2704
-sVpublisher_id
-p2705
-Vnetwork.machine-A
-p2706
-sVmessage_id
-p2707
-Vd3094e9b-b0c7-43d7-a2e2-71b300f1cc41
-p2708
-sV_context_roles
-p2709
-(lp2710
-Vadmin
-p2711
-asVtimestamp
-p2712
-V2017-11-30 11:05:09.830935
-p2713
-sV_context_timestamp
-p2714
-V2017-11-30 11:05:09.694742
-p2715
-sV_unique_id
-p2716
-V74059b6743b645fe8532b6d75a302d4e
-p2717
-sV_context_tenant_id
-p2718
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2719
-sV_context_project_name
-p2720
-Vapexlake
-p2721
-sV_context_user_identity
-p2722
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2723
-sV_context_tenant
-p2724
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2725
-sV_context_project_id
-p2726
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2727
-sV_context_read_only
-p2728
-I00
-sV_context_user_domain
-p2729
-NsV_context_user_name
-p2730
-Violie
-p2731
-stp2732
-a(F6.5692770481109619
-Vsecurity_group_rule.delete.start
-p2733
-(dp2734
-V_context_domain
-p2735
-NsV_context_request_id
-p2736
-Vreq-efff12d8-9776-4e87-9607-d79a15fb0fa9
-p2737
-sVevent_type
-p2738
-g2733
-sV_context_auth_token
-p2739
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p2740
-sV_context_resource_uuid
-p2741
-NsV_context_tenant_name
-p2742
-Vapexlake
-p2743
-sV_context_user_id
-p2744
-Vef7a4f67379f41aba489a0b6d6a62094
-p2745
-sVpayload
-p2746
-(dp2747
-Vsecurity_group_rule_id
-p2748
-V6c295960-d54d-451d-8f2c-51f1fed503d3
-p2749
-ssV_context_show_deleted
-p2750
-I00
-sVpriority
-p2751
-VINFO
-p2752
-sV_context_is_admin
-p2753
-I01
-sV_context_project_domain
-p2754
-NsV_context_user
-p2755
-Vef7a4f67379f41aba489a0b6d6a62094
-p2756
-sVpublisher_id
-p2757
-Vnetwork.machine-A
-p2758
-sVmessage_id
-p2759
-V38590bcb-988c-4aa7-878a-a26c6ed2abb2
-p2760
-sV_context_roles
-p2761
-(lp2762
-Vadmin
-p2763
-asVtimestamp
-p2764
-V2017-11-30 11:05:10.974844
-p2765
-sV_context_timestamp
-p2766
-V2017-11-30 11:05:10.973709
-p2767
-sV_unique_id
-p2768
-V001e9e4808054933b468c29588573903
-p2769
-sV_context_tenant_id
-p2770
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2771
-sV_context_project_name
-p2772
-Vapexlake
-p2773
-sV_context_user_identity
-p2774
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2775
-sV_context_tenant
-p2776
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2777
-sV_context_project_id
-p2778
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2779
-sV_context_read_only
-p2780
-I00
-sV_context_user_domain
-p2781
-NsV_context_user_name
-p2782
-Violie
-p2783
-stp2784
-a(F6.5994751453399658
-Vsecurity_group_rule.delete.end
-p2785
-(dp2786
-V_context_domain
-p2787
-NsV_context_request_id
-p2788
-Vreq-efff12d8-9776-4e87-9607-d79a15fb0fa9
-p2789
-sVevent_type
-p2790
-g2785
-sV_context_auth_token
-p2791
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p2792
-sV_context_resource_uuid
-p2793
-NsV_context_tenant_name
-p2794
-Vapexlake
-p2795
-sV_context_user_id
-p2796
-Vef7a4f67379f41aba489a0b6d6a62094
-p2797
-sVpayload
-p2798
-(dp2799
-Vsecurity_group_rule_id
-p2800
-V6c295960-d54d-451d-8f2c-51f1fed503d3
-p2801
-ssV_context_show_deleted
-p2802
-I00
-sVpriority
-p2803
-VINFO
-p2804
-sV_context_is_admin
-p2805
-I01
-sV_context_project_domain
-p2806
-NsV_context_user
-p2807
-Vef7a4f67379f41aba489a0b6d6a62094
-p2808
-sVpublisher_id
-p2809
-Vnetwork.machine-A
-p2810
-sVmessage_id
-p2811
-V97c240f7-995e-4eb9-ac9a-f740959efcf9
-p2812
-sV_context_roles
-p2813
-(lp2814
-Vadmin
-p2815
-asVtimestamp
-p2816
-V2017-11-30 11:05:11.004747
-p2817
-sV_context_timestamp
-p2818
-V2017-11-30 11:05:10.973709
-p2819
-sV_unique_id
-p2820
-V0114d41bbf134932996bab038a009829
-p2821
-sV_context_tenant_id
-p2822
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2823
-sV_context_project_name
-p2824
-Vapexlake
-p2825
-sV_context_user_identity
-p2826
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2827
-sV_context_tenant
-p2828
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2829
-sV_context_project_id
-p2830
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2831
-sV_context_read_only
-p2832
-I00
-sV_context_user_domain
-p2833
-NsV_context_user_name
-p2834
-Violie
-p2835
-stp2836
-a(F6.6091179847717285
-Vsecurity_group_rule.delete.start
-p2837
-(dp2838
-V_context_domain
-p2839
-NsV_context_request_id
-p2840
-Vreq-d5c3ed2d-51c0-4f11-ba5b-5febb65fb6ca
-p2841
-sVevent_type
-p2842
-g2837
-sV_context_auth_token
-p2843
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p2844
-sV_context_resource_uuid
-p2845
-NsV_context_tenant_name
-p2846
-Vapexlake
-p2847
-sV_context_user_id
-p2848
-Vef7a4f67379f41aba489a0b6d6a62094
-p2849
-sVpayload
-p2850
-(dp2851
-Vsecurity_group_rule_id
-p2852
-V850528b4-2ce3-45bf-b53b-9806ec4b9d5c
-p2853
-ssV_context_show_deleted
-p2854
-I00
-sVpriority
-p2855
-VINFO
-p2856
-sV_context_is_admin
-p2857
-I01
-sV_context_project_domain
-p2858
-NsV_context_user
-p2859
-Vef7a4f67379f41aba489a0b6d6a62094
-p2860
-sVpublisher_id
-p2861
-Vnetwork.machine-A
-p2862
-sVmessage_id
-p2863
-V75f9177c-8758-4940-b942-0b13744b050d
-p2864
-sV_context_roles
-p2865
-(lp2866
-Vadmin
-p2867
-asVtimestamp
-p2868
-V2017-11-30 11:05:11.014913
-p2869
-sV_context_timestamp
-p2870
-V2017-11-30 11:05:11.013843
-p2871
-sV_unique_id
-p2872
-V2c8f8c62f34043cfb16fff74a4c8c49c
-p2873
-sV_context_tenant_id
-p2874
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2875
-sV_context_project_name
-p2876
-Vapexlake
-p2877
-sV_context_user_identity
-p2878
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p2879
-sV_context_tenant
-p2880
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2881
-sV_context_project_id
-p2882
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2883
-sV_context_read_only
-p2884
-I00
-sV_context_user_domain
-p2885
-NsV_context_user_name
-p2886
-Violie
-p2887
-stp2888
-a(F6.618412971496582
-Vcompute.instance.update
-p2889
-(dp2890
-V_context_domain
-p2891
-NsV_context_request_id
-p2892
-Vreq-14c241af-f5bf-4396-bbef-c7166326d04d
-p2893
-sV_context_quota_class
-p2894
-NsVevent_type
-p2895
-g2889
-sV_context_service_catalog
-p2896
-(lp2897
-(dp2898
-Vendpoints
-p2899
-(lp2900
-(dp2901
-VadminURL
-p2902
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2903
-sVregion
-p2904
-VRegionOne
-p2905
-sVinternalURL
-p2906
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2907
-sVpublicURL
-p2908
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p2909
-sasVtype
-p2910
-Vvolume
-p2911
-sVname
-p2912
-Vcinder
-p2913
-sa(dp2914
-g2899
-(lp2915
-(dp2916
-g2902
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2917
-sg2904
-VRegionOne
-p2918
-sg2906
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2919
-sg2908
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p2920
-sasg2910
-Vvolumev2
-p2921
-sg2912
-Vcinderv2
-p2922
-sasV_context_auth_token
-p2923
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p2924
-sV_context_resource_uuid
-p2925
-NsV_context_user_id
-p2926
-Vef7a4f67379f41aba489a0b6d6a62094
-p2927
-sVpayload
-p2928
-(dp2929
-Vstate_description
-p2930
-Vdeleting
-p2931
-sVavailability_zone
-p2932
-Vnova
-p2933
-sVterminated_at
-p2934
-V
-sVephemeral_gb
-p2935
-I0
-sVinstance_type_id
-p2936
-I1
-sVbandwidth
-p2937
-(dp2938
-sVdeleted_at
-p2939
-V
-sVreservation_id
-p2940
-Vr-4jmm1xbm
-p2941
-sVmemory_mb
-p2942
-I4096
-sVdisplay_name
-p2943
-Vvm_test
-p2944
-sVhostname
-p2945
-Vvm-test
-p2946
-sVstate
-p2947
-Vactive
-p2948
-sVold_state
-p2949
-Vactive
-p2950
-sVprogress
-p2951
-V
-sVlaunched_at
-p2952
-V2017-11-30T11:04:13.000000
-p2953
-sVmetadata
-p2954
-(dp2955
-sVnode
-p2956
-Vmachine-C
-p2957
-sVramdisk_id
-p2958
-V
-sVaccess_ip_v6
-p2959
-NsVdisk_gb
-p2960
-I40
-sVaccess_ip_v4
-p2961
-NsVkernel_id
-p2962
-V
-sVhost
-p2963
-Vmachine-C
-p2964
-sVuser_id
-p2965
-Vef7a4f67379f41aba489a0b6d6a62094
-p2966
-sVimage_ref_url
-p2967
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p2968
-sVcell_name
-p2969
-V
-sVaudit_period_beginning
-p2970
-V2017-11-01T00:00:00.000000
-p2971
-sVroot_gb
-p2972
-I40
-sVtenant_id
-p2973
-V187e5e95e7eb499d8a421b3d4ed966d5
-p2974
-sVcreated_at
-p2975
-V2017-11-30T11:03:59.000000
-p2976
-sVold_task_state
-p2977
-Vdeleting
-p2978
-sVinstance_id
-p2979
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p2980
-sVinstance_type
-p2981
-Vm1.medium
-p2982
-sVvcpus
-p2983
-I2
-sVimage_meta
-p2984
-(dp2985
-Vmin_disk
-p2986
-V40
-p2987
-sVcontainer_format
-p2988
-Vbare
-p2989
-sVmin_ram
-p2990
-V0
-sVdisk_format
-p2991
-Vqcow2
-p2992
-sVbase_image_ref
-p2993
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p2994
-ssVarchitecture
-p2995
-NsVnew_task_state
-p2996
-Vdeleting
-p2997
-sVaudit_period_ending
-p2998
-V2017-11-30T11:05:11.019430
-p2999
-sVos_type
-p3000
-NsVinstance_flavor_id
-p3001
-V3
-ssV_context_show_deleted
-p3002
-I00
-sVpriority
-p3003
-VINFO
-p3004
-sV_context_is_admin
-p3005
-I01
-sV_context_project_domain
-p3006
-NsV_context_user
-p3007
-Vef7a4f67379f41aba489a0b6d6a62094
-p3008
-sVpublisher_id
-p3009
-Vcompute.machine-A
-p3010
-sVmessage_id
-p3011
-V330ef9d1-dc7e-4b7a-90be-f7cb57eddb70
-p3012
-sV_context_remote_address
-p3013
-V172.16.0.5
-p3014
-sV_context_roles
-p3015
-(lp3016
-Vadmin
-p3017
-asVtimestamp
-p3018
-V2017-11-30 11:05:11.023899
-p3019
-sV_context_timestamp
-p3020
-V2017-11-30T11:05:09.150712
-p3021
-sV_unique_id
-p3022
-V2cb8e8d4b116457ebbf563b082020dd4
-p3023
-sV_context_project_name
-p3024
-Vapexlake
-p3025
-sV_context_read_deleted
-p3026
-Vno
-p3027
-sV_context_user_identity
-p3028
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3029
-sV_context_tenant
-p3030
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3031
-sV_context_instance_lock_checked
-p3032
-I00
-sV_context_project_id
-p3033
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3034
-sV_context_read_only
-p3035
-I00
-sV_context_user_domain
-p3036
-NsV_context_user_name
-p3037
-Violie
-p3038
-stp3039
-a(F6.6382730007171631
-Vsecurity_group_rule.delete.end
-p3040
-(dp3041
-V_context_domain
-p3042
-NsV_context_request_id
-p3043
-Vreq-d5c3ed2d-51c0-4f11-ba5b-5febb65fb6ca
-p3044
-sVevent_type
-p3045
-g3040
-sV_context_auth_token
-p3046
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3047
-sV_context_resource_uuid
-p3048
-NsV_context_tenant_name
-p3049
-Vapexlake
-p3050
-sV_context_user_id
-p3051
-Vef7a4f67379f41aba489a0b6d6a62094
-p3052
-sVpayload
-p3053
-(dp3054
-Vsecurity_group_rule_id
-p3055
-V850528b4-2ce3-45bf-b53b-9806ec4b9d5c
-p3056
-ssV_context_show_deleted
-p3057
-I00
-sVpriority
-p3058
-VINFO
-p3059
-sV_context_is_admin
-p3060
-I01
-sV_context_project_domain
-p3061
-NsV_context_user
-p3062
-Vef7a4f67379f41aba489a0b6d6a62094
-p3063
-sVpublisher_id
-p3064
-Vnetwork.machine-A
-p3065
-sVmessage_id
-p3066
-V3b204236-34bb-4e8b-afbb-fb46e99572aa
-p3067
-sV_context_roles
-p3068
-(lp3069
-Vadmin
-p3070
-asVtimestamp
-p3071
-V2017-11-30 11:05:11.044064
-p3072
-sV_context_timestamp
-p3073
-V2017-11-30 11:05:11.013843
-p3074
-sV_unique_id
-p3075
-Vf559264de88f44d1989422e9614fdbc9
-p3076
-sV_context_tenant_id
-p3077
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3078
-sV_context_project_name
-p3079
-Vapexlake
-p3080
-sV_context_user_identity
-p3081
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3082
-sV_context_tenant
-p3083
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3084
-sV_context_project_id
-p3085
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3086
-sV_context_read_only
-p3087
-I00
-sV_context_user_domain
-p3088
-NsV_context_user_name
-p3089
-Violie
-p3090
-stp3091
-a(F6.6487290859222412
-Vsecurity_group_rule.delete.start
-p3092
-(dp3093
-V_context_domain
-p3094
-NsV_context_request_id
-p3095
-Vreq-b7600e24-cfe1-4153-bc70-539ed1290bb7
-p3096
-sVevent_type
-p3097
-g3092
-sV_context_auth_token
-p3098
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3099
-sV_context_resource_uuid
-p3100
-NsV_context_tenant_name
-p3101
-Vapexlake
-p3102
-sV_context_user_id
-p3103
-Vef7a4f67379f41aba489a0b6d6a62094
-p3104
-sVpayload
-p3105
-(dp3106
-Vsecurity_group_rule_id
-p3107
-V8de9bce2-9a99-4f07-acb8-00b7281eafaf
-p3108
-ssV_context_show_deleted
-p3109
-I00
-sVpriority
-p3110
-VINFO
-p3111
-sV_context_is_admin
-p3112
-I01
-sV_context_project_domain
-p3113
-NsV_context_user
-p3114
-Vef7a4f67379f41aba489a0b6d6a62094
-p3115
-sVpublisher_id
-p3116
-Vnetwork.machine-A
-p3117
-sVmessage_id
-p3118
-V4eb78b67-a707-471a-bf02-6c776fed0ae1
-p3119
-sV_context_roles
-p3120
-(lp3121
-Vadmin
-p3122
-asVtimestamp
-p3123
-V2017-11-30 11:05:11.054418
-p3124
-sV_context_timestamp
-p3125
-V2017-11-30 11:05:11.053388
-p3126
-sV_unique_id
-p3127
-V1faa526c06a246be8fdd547b94a8004a
-p3128
-sV_context_tenant_id
-p3129
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3130
-sV_context_project_name
-p3131
-Vapexlake
-p3132
-sV_context_user_identity
-p3133
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3134
-sV_context_tenant
-p3135
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3136
-sV_context_project_id
-p3137
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3138
-sV_context_read_only
-p3139
-I00
-sV_context_user_domain
-p3140
-NsV_context_user_name
-p3141
-Violie
-p3142
-stp3143
-a(F6.6638450622558594
-Vport.update.start
-p3144
-(dp3145
-V_context_domain
-p3146
-NsV_context_request_id
-p3147
-Vreq-376d7b8d-3b78-4794-b9fe-b84e9c286f12
-p3148
-sVevent_type
-p3149
-g3144
-sV_context_auth_token
-p3150
-VgAAAAABaH-Wfd7TZIXXJPMH1HHQqx_qC4NgmENjE_fNChBj5NiFMELs3mInsxfUoG_cVYW4qXmmabXCKFdoJSW0uHGL532NvqPHQiqYBhDuibo1dXODyjZ4xtP39nRzCCS6V0ksS0ABfS2oBUBIqhss0-BVOM-mmH1Q_w4cFCVbQbNUOfBvvB8s
-p3151
-sV_context_resource_uuid
-p3152
-NsV_context_tenant_name
-p3153
-Vservices
-p3154
-sV_context_user_id
-p3155
-V84faafdbb77b40c9a73047fdebb0ab45
-p3156
-sVpayload
-p3157
-(dp3158
-Vport
-p3159
-(dp3160
-Vbinding:profile
-p3161
-(dp3162
-sVdevice_owner
-p3163
-V
-sVdns_name
-p3164
-V
-sVbinding:host_id
-p3165
-NsVdevice_id
-p3166
-V
-ssVid
-p3167
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p3168
-ssV_context_show_deleted
-p3169
-I00
-sVpriority
-p3170
-VINFO
-p3171
-sV_context_is_admin
-p3172
-I01
-sV_context_project_domain
-p3173
-NsV_context_user
-p3174
-V84faafdbb77b40c9a73047fdebb0ab45
-p3175
-sVpublisher_id
-p3176
-Vnetwork.machine-A
-p3177
-sVmessage_id
-p3178
-V730c1d8f-37d6-4c06-a460-b2b1770705db
-p3179
-sV_context_roles
-p3180
-(lp3181
-Vadmin
-p3182
-asVtimestamp
-p3183
-V2017-11-30 11:05:11.069657
-p3184
-sV_context_timestamp
-p3185
-V2017-11-30 11:05:11.068636
-p3186
-sV_unique_id
-p3187
-Ve6e184c95de14168afbc55f28baccea8
-p3188
-sV_context_tenant_id
-p3189
-V66fbf30f2dce4cef95d5248254dac9a5
-p3190
-sV_context_project_name
-p3191
-Vservices
-p3192
-sV_context_user_identity
-p3193
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p3194
-sV_context_tenant
-p3195
-V66fbf30f2dce4cef95d5248254dac9a5
-p3196
-sV_context_project_id
-p3197
-V66fbf30f2dce4cef95d5248254dac9a5
-p3198
-sV_context_read_only
-p3199
-I00
-sV_context_user_domain
-p3200
-NsV_context_user_name
-p3201
-Vneutron
-p3202
-stp3203
-a(F6.6772820949554443
-Vsecurity_group_rule.delete.end
-p3204
-(dp3205
-V_context_domain
-p3206
-NsV_context_request_id
-p3207
-Vreq-b7600e24-cfe1-4153-bc70-539ed1290bb7
-p3208
-sVevent_type
-p3209
-g3204
-sV_context_auth_token
-p3210
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3211
-sV_context_resource_uuid
-p3212
-NsV_context_tenant_name
-p3213
-Vapexlake
-p3214
-sV_context_user_id
-p3215
-Vef7a4f67379f41aba489a0b6d6a62094
-p3216
-sVpayload
-p3217
-(dp3218
-Vsecurity_group_rule_id
-p3219
-V8de9bce2-9a99-4f07-acb8-00b7281eafaf
-p3220
-ssV_context_show_deleted
-p3221
-I00
-sVpriority
-p3222
-VINFO
-p3223
-sV_context_is_admin
-p3224
-I01
-sV_context_project_domain
-p3225
-NsV_context_user
-p3226
-Vef7a4f67379f41aba489a0b6d6a62094
-p3227
-sVpublisher_id
-p3228
-Vnetwork.machine-A
-p3229
-sVmessage_id
-p3230
-V019e4caf-1bc8-46e3-82b4-c2ec900dada9
-p3231
-sV_context_roles
-p3232
-(lp3233
-Vadmin
-p3234
-asVtimestamp
-p3235
-V2017-11-30 11:05:11.082923
-p3236
-sV_context_timestamp
-p3237
-V2017-11-30 11:05:11.053388
-p3238
-sV_unique_id
-p3239
-V39a536b4a5794f1db0fa39c6634086d1
-p3240
-sV_context_tenant_id
-p3241
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3242
-sV_context_project_name
-p3243
-Vapexlake
-p3244
-sV_context_user_identity
-p3245
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3246
-sV_context_tenant
-p3247
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3248
-sV_context_project_id
-p3249
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3250
-sV_context_read_only
-p3251
-I00
-sV_context_user_domain
-p3252
-NsV_context_user_name
-p3253
-Violie
-p3254
-stp3255
-a(F6.688007116317749
-Vsecurity_group_rule.delete.start
-p3256
-(dp3257
-V_context_domain
-p3258
-NsV_context_request_id
-p3259
-Vreq-333fbdd1-47ea-4e5c-b13e-22e31ed4c648
-p3260
-sVevent_type
-p3261
-g3256
-sV_context_auth_token
-p3262
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3263
-sV_context_resource_uuid
-p3264
-NsV_context_tenant_name
-p3265
-Vapexlake
-p3266
-sV_context_user_id
-p3267
-Vef7a4f67379f41aba489a0b6d6a62094
-p3268
-sVpayload
-p3269
-(dp3270
-Vsecurity_group_rule_id
-p3271
-V9c8eaa7a-c266-4b55-9a49-8e179eb43f8a
-p3272
-ssV_context_show_deleted
-p3273
-I00
-sVpriority
-p3274
-VINFO
-p3275
-sV_context_is_admin
-p3276
-I01
-sV_context_project_domain
-p3277
-NsV_context_user
-p3278
-Vef7a4f67379f41aba489a0b6d6a62094
-p3279
-sVpublisher_id
-p3280
-Vnetwork.machine-A
-p3281
-sVmessage_id
-p3282
-V4d7d5890-acb7-4918-879e-d1f88beeac60
-p3283
-sV_context_roles
-p3284
-(lp3285
-Vadmin
-p3286
-asVtimestamp
-p3287
-V2017-11-30 11:05:11.093515
-p3288
-sV_context_timestamp
-p3289
-V2017-11-30 11:05:11.092395
-p3290
-sV_unique_id
-p3291
-V339fdf9adbce4dbc9109556fdea692d6
-p3292
-sV_context_tenant_id
-p3293
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3294
-sV_context_project_name
-p3295
-Vapexlake
-p3296
-sV_context_user_identity
-p3297
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3298
-sV_context_tenant
-p3299
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3300
-sV_context_project_id
-p3301
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3302
-sV_context_read_only
-p3303
-I00
-sV_context_user_domain
-p3304
-NsV_context_user_name
-p3305
-Violie
-p3306
-stp3307
-a(F6.7177281379699707
-Vsecurity_group_rule.delete.end
-p3308
-(dp3309
-V_context_domain
-p3310
-NsV_context_request_id
-p3311
-Vreq-333fbdd1-47ea-4e5c-b13e-22e31ed4c648
-p3312
-sVevent_type
-p3313
-g3308
-sV_context_auth_token
-p3314
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3315
-sV_context_resource_uuid
-p3316
-NsV_context_tenant_name
-p3317
-Vapexlake
-p3318
-sV_context_user_id
-p3319
-Vef7a4f67379f41aba489a0b6d6a62094
-p3320
-sVpayload
-p3321
-(dp3322
-Vsecurity_group_rule_id
-p3323
-V9c8eaa7a-c266-4b55-9a49-8e179eb43f8a
-p3324
-ssV_context_show_deleted
-p3325
-I00
-sVpriority
-p3326
-VINFO
-p3327
-sV_context_is_admin
-p3328
-I01
-sV_context_project_domain
-p3329
-NsV_context_user
-p3330
-Vef7a4f67379f41aba489a0b6d6a62094
-p3331
-sVpublisher_id
-p3332
-Vnetwork.machine-A
-p3333
-sVmessage_id
-p3334
-V9d540775-fb99-4e13-9610-33e66074f7a2
-p3335
-sV_context_roles
-p3336
-(lp3337
-Vadmin
-p3338
-asVtimestamp
-p3339
-V2017-11-30 11:05:11.123426
-p3340
-sV_context_timestamp
-p3341
-V2017-11-30 11:05:11.092395
-p3342
-sV_unique_id
-p3343
-Ve4df63728b03496691bec93869e01343
-p3344
-sV_context_tenant_id
-p3345
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3346
-sV_context_project_name
-p3347
-Vapexlake
-p3348
-sV_context_user_identity
-p3349
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3350
-sV_context_tenant
-p3351
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3352
-sV_context_project_id
-p3353
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3354
-sV_context_read_only
-p3355
-I00
-sV_context_user_domain
-p3356
-NsV_context_user_name
-p3357
-Violie
-p3358
-stp3359
-a(F6.7278280258178711
-Vsecurity_group_rule.delete.start
-p3360
-(dp3361
-V_context_domain
-p3362
-NsV_context_request_id
-p3363
-Vreq-0a31a9a4-cc40-422e-b390-c224dc201da6
-p3364
-sVevent_type
-p3365
-g3360
-sV_context_auth_token
-p3366
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3367
-sV_context_resource_uuid
-p3368
-NsV_context_tenant_name
-p3369
-Vapexlake
-p3370
-sV_context_user_id
-p3371
-Vef7a4f67379f41aba489a0b6d6a62094
-p3372
-sVpayload
-p3373
-(dp3374
-Vsecurity_group_rule_id
-p3375
-V9db9c195-a429-4268-8206-312d77472d5f
-p3376
-ssV_context_show_deleted
-p3377
-I00
-sVpriority
-p3378
-VINFO
-p3379
-sV_context_is_admin
-p3380
-I01
-sV_context_project_domain
-p3381
-NsV_context_user
-p3382
-Vef7a4f67379f41aba489a0b6d6a62094
-p3383
-sVpublisher_id
-p3384
-Vnetwork.machine-A
-p3385
-sVmessage_id
-p3386
-V2a17a0d3-c842-4b98-a26a-cb7976fcd9bd
-p3387
-sV_context_roles
-p3388
-(lp3389
-Vadmin
-p3390
-asVtimestamp
-p3391
-V2017-11-30 11:05:11.133264
-p3392
-sV_context_timestamp
-p3393
-V2017-11-30 11:05:11.132160
-p3394
-sV_unique_id
-p3395
-V41535f8b17864ec2ad20403d61fe5f47
-p3396
-sV_context_tenant_id
-p3397
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3398
-sV_context_project_name
-p3399
-Vapexlake
-p3400
-sV_context_user_identity
-p3401
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3402
-sV_context_tenant
-p3403
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3404
-sV_context_project_id
-p3405
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3406
-sV_context_read_only
-p3407
-I00
-sV_context_user_domain
-p3408
-NsV_context_user_name
-p3409
-Violie
-p3410
-stp3411
-a(F6.7541871070861816
-Vsecurity_group_rule.delete.end
-p3412
-(dp3413
-V_context_domain
-p3414
-NsV_context_request_id
-p3415
-Vreq-0a31a9a4-cc40-422e-b390-c224dc201da6
-p3416
-sVevent_type
-p3417
-g3412
-sV_context_auth_token
-p3418
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3419
-sV_context_resource_uuid
-p3420
-NsV_context_tenant_name
-p3421
-Vapexlake
-p3422
-sV_context_user_id
-p3423
-Vef7a4f67379f41aba489a0b6d6a62094
-p3424
-sVpayload
-p3425
-(dp3426
-Vsecurity_group_rule_id
-p3427
-V9db9c195-a429-4268-8206-312d77472d5f
-p3428
-ssV_context_show_deleted
-p3429
-I00
-sVpriority
-p3430
-VINFO
-p3431
-sV_context_is_admin
-p3432
-I01
-sV_context_project_domain
-p3433
-NsV_context_user
-p3434
-Vef7a4f67379f41aba489a0b6d6a62094
-p3435
-sVpublisher_id
-p3436
-Vnetwork.machine-A
-p3437
-sVmessage_id
-p3438
-Ve7e870bf-c744-40de-bbbf-c54685e64bfa
-p3439
-sV_context_roles
-p3440
-(lp3441
-Vadmin
-p3442
-asVtimestamp
-p3443
-V2017-11-30 11:05:11.159092
-p3444
-sV_context_timestamp
-p3445
-V2017-11-30 11:05:11.132160
-p3446
-sV_unique_id
-p3447
-V8bcff568f82345829c3679796612e765
-p3448
-sV_context_tenant_id
-p3449
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3450
-sV_context_project_name
-p3451
-Vapexlake
-p3452
-sV_context_user_identity
-p3453
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3454
-sV_context_tenant
-p3455
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3456
-sV_context_project_id
-p3457
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3458
-sV_context_read_only
-p3459
-I00
-sV_context_user_domain
-p3460
-NsV_context_user_name
-p3461
-Violie
-p3462
-stp3463
-a(F6.7662911415100098
-Vsecurity_group_rule.delete.start
-p3464
-(dp3465
-V_context_domain
-p3466
-NsV_context_request_id
-p3467
-Vreq-3df9ea8d-f2a6-43d5-a635-018e354e48f0
-p3468
-sVevent_type
-p3469
-g3464
-sV_context_auth_token
-p3470
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3471
-sV_context_resource_uuid
-p3472
-NsV_context_tenant_name
-p3473
-Vapexlake
-p3474
-sV_context_user_id
-p3475
-Vef7a4f67379f41aba489a0b6d6a62094
-p3476
-sVpayload
-p3477
-(dp3478
-Vsecurity_group_rule_id
-p3479
-Ve8850b1e-da1e-4449-8c41-c75ff791f177
-p3480
-ssV_context_show_deleted
-p3481
-I00
-sVpriority
-p3482
-VINFO
-p3483
-sV_context_is_admin
-p3484
-I01
-sV_context_project_domain
-p3485
-NsV_context_user
-p3486
-Vef7a4f67379f41aba489a0b6d6a62094
-p3487
-sVpublisher_id
-p3488
-Vnetwork.machine-A
-p3489
-sVmessage_id
-p3490
-V3e8c450e-723d-4554-85e8-876d8bd9b775
-p3491
-sV_context_roles
-p3492
-(lp3493
-Vadmin
-p3494
-asVtimestamp
-p3495
-V2017-11-30 11:05:11.171418
-p3496
-sV_context_timestamp
-p3497
-V2017-11-30 11:05:11.169758
-p3498
-sV_unique_id
-p3499
-Vd10ec5e5910a4b79861222b2183ce1d2
-p3500
-sV_context_tenant_id
-p3501
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3502
-sV_context_project_name
-p3503
-Vapexlake
-p3504
-sV_context_user_identity
-p3505
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3506
-sV_context_tenant
-p3507
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3508
-sV_context_project_id
-p3509
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3510
-sV_context_read_only
-p3511
-I00
-sV_context_user_domain
-p3512
-NsV_context_user_name
-p3513
-Violie
-p3514
-stp3515
-a(F6.7959640026092529
-Vsecurity_group_rule.delete.end
-p3516
-(dp3517
-V_context_domain
-p3518
-NsV_context_request_id
-p3519
-Vreq-3df9ea8d-f2a6-43d5-a635-018e354e48f0
-p3520
-sVevent_type
-p3521
-g3516
-sV_context_auth_token
-p3522
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3523
-sV_context_resource_uuid
-p3524
-NsV_context_tenant_name
-p3525
-Vapexlake
-p3526
-sV_context_user_id
-p3527
-Vef7a4f67379f41aba489a0b6d6a62094
-p3528
-sVpayload
-p3529
-(dp3530
-Vsecurity_group_rule_id
-p3531
-Ve8850b1e-da1e-4449-8c41-c75ff791f177
-p3532
-ssV_context_show_deleted
-p3533
-I00
-sVpriority
-p3534
-VINFO
-p3535
-sV_context_is_admin
-p3536
-I01
-sV_context_project_domain
-p3537
-NsV_context_user
-p3538
-Vef7a4f67379f41aba489a0b6d6a62094
-p3539
-sVpublisher_id
-p3540
-Vnetwork.machine-A
-p3541
-sVmessage_id
-p3542
-V83986d9e-9fc7-4e8c-941c-25c49a5f1529
-p3543
-sV_context_roles
-p3544
-(lp3545
-Vadmin
-p3546
-asVtimestamp
-p3547
-V2017-11-30 11:05:11.201435
-p3548
-sV_context_timestamp
-p3549
-V2017-11-30 11:05:11.169758
-p3550
-sV_unique_id
-p3551
-V8834fabf3f5649a09964158044b328e7
-p3552
-sV_context_tenant_id
-p3553
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3554
-sV_context_project_name
-p3555
-Vapexlake
-p3556
-sV_context_user_identity
-p3557
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3558
-sV_context_tenant
-p3559
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3560
-sV_context_project_id
-p3561
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3562
-sV_context_read_only
-p3563
-I00
-sV_context_user_domain
-p3564
-NsV_context_user_name
-p3565
-Violie
-p3566
-stp3567
-a(F6.8053810596466064
-Vsecurity_group.delete.start
-p3568
-(dp3569
-V_context_domain
-p3570
-NsV_context_request_id
-p3571
-Vreq-4819484a-ccdf-4b80-91b1-dd09556011ab
-p3572
-sVevent_type
-p3573
-g3568
-sV_context_auth_token
-p3574
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3575
-sV_context_resource_uuid
-p3576
-NsV_context_tenant_name
-p3577
-Vapexlake
-p3578
-sV_context_user_id
-p3579
-Vef7a4f67379f41aba489a0b6d6a62094
-p3580
-sVpayload
-p3581
-(dp3582
-Vsecurity_group_id
-p3583
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p3584
-ssV_context_show_deleted
-p3585
-I00
-sVpriority
-p3586
-VINFO
-p3587
-sV_context_is_admin
-p3588
-I01
-sV_context_project_domain
-p3589
-NsV_context_user
-p3590
-Vef7a4f67379f41aba489a0b6d6a62094
-p3591
-sVpublisher_id
-p3592
-Vnetwork.machine-A
-p3593
-sVmessage_id
-p3594
-V028ca264-71bc-4b04-9525-79e36cdc2fb6
-p3595
-sV_context_roles
-p3596
-(lp3597
-Vadmin
-p3598
-asVtimestamp
-p3599
-V2017-11-30 11:05:11.211608
-p3600
-sV_context_timestamp
-p3601
-V2017-11-30 11:05:11.210666
-p3602
-sV_unique_id
-p3603
-Va0acb149d4584144ab955c23a062afcb
-p3604
-sV_context_tenant_id
-p3605
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3606
-sV_context_project_name
-p3607
-Vapexlake
-p3608
-sV_context_user_identity
-p3609
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3610
-sV_context_tenant
-p3611
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3612
-sV_context_project_id
-p3613
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3614
-sV_context_read_only
-p3615
-I00
-sV_context_user_domain
-p3616
-NsV_context_user_name
-p3617
-Violie
-p3618
-stp3619
-a(F6.9596021175384521
-Vsecurity_group.delete.end
-p3620
-(dp3621
-V_context_domain
-p3622
-NsV_context_request_id
-p3623
-Vreq-4819484a-ccdf-4b80-91b1-dd09556011ab
-p3624
-sVevent_type
-p3625
-g3620
-sV_context_auth_token
-p3626
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p3627
-sV_context_resource_uuid
-p3628
-NsV_context_tenant_name
-p3629
-Vapexlake
-p3630
-sV_context_user_id
-p3631
-Vef7a4f67379f41aba489a0b6d6a62094
-p3632
-sVpayload
-p3633
-(dp3634
-Vsecurity_group_id
-p3635
-V7d362233-25b5-4eb4-931c-0ab3c2147284
-p3636
-ssV_context_show_deleted
-p3637
-I00
-sVpriority
-p3638
-VINFO
-p3639
-sV_context_is_admin
-p3640
-I01
-sV_context_project_domain
-p3641
-NsV_context_user
-p3642
-Vef7a4f67379f41aba489a0b6d6a62094
-p3643
-sVpublisher_id
-p3644
-Vnetwork.machine-A
-p3645
-sVmessage_id
-p3646
-Va9a7d7d3-2987-44bb-843c-bd7355ea15a7
-p3647
-sV_context_roles
-p3648
-(lp3649
-Vadmin
-p3650
-asVtimestamp
-p3651
-V2017-11-30 11:05:11.365350
-p3652
-sV_context_timestamp
-p3653
-V2017-11-30 11:05:11.210666
-p3654
-sV_unique_id
-p3655
-V6feb086464a742dd8f3af1c872deea6d
-p3656
-sV_context_tenant_id
-p3657
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3658
-sV_context_project_name
-p3659
-Vapexlake
-p3660
-sV_context_user_identity
-p3661
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3662
-sV_context_tenant
-p3663
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3664
-sV_context_project_id
-p3665
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3666
-sV_context_read_only
-p3667
-I00
-sV_context_user_domain
-p3668
-NsV_context_user_name
-p3669
-Violie
-p3670
-stp3671
-a(F7.2142071723937988
-Vport.update.end
-p3672
-(dp3673
-V_context_domain
-p3674
-NsV_context_request_id
-p3675
-Vreq-376d7b8d-3b78-4794-b9fe-b84e9c286f12
-p3676
-sVevent_type
-p3677
-g3672
-sV_context_auth_token
-p3678
-VgAAAAABaH-Wfd7TZIXXJPMH1HHQqx_qC4NgmENjE_fNChBj5NiFMELs3mInsxfUoG_cVYW4qXmmabXCKFdoJSW0uHGL532NvqPHQiqYBhDuibo1dXODyjZ4xtP39nRzCCS6V0ksS0ABfS2oBUBIqhss0-BVOM-mmH1Q_w4cFCVbQbNUOfBvvB8s
-p3679
-sV_context_resource_uuid
-p3680
-NsV_context_tenant_name
-p3681
-Vservices
-p3682
-sV_context_user_id
-p3683
-V84faafdbb77b40c9a73047fdebb0ab45
-p3684
-sVpayload
-p3685
-(dp3686
-Vport
-p3687
-(dp3688
-Vallowed_address_pairs
-p3689
-(lp3690
-sVextra_dhcp_opts
-p3691
-(lp3692
-sVupdated_at
-p3693
-V2017-11-30T11:05:11
-p3694
-sVdevice_owner
-p3695
-V
-sVport_security_enabled
-p3696
-I01
-sVbinding:profile
-p3697
-(dp3698
-sVfixed_ips
-p3699
-(lp3700
-(dp3701
-Vsubnet_id
-p3702
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p3703
-sVip_address
-p3704
-V172.16.9.144
-p3705
-sasVid
-p3706
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p3707
-sVsecurity_groups
-p3708
-(lp3709
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p3710
-asVbinding:vif_details
-p3711
-(dp3712
-sVbinding:vif_type
-p3713
-Vunbound
-p3714
-sVmac_address
-p3715
-Vfa:16:3e:e7:da:1b
-p3716
-sVstatus
-p3717
-VDOWN
-p3718
-sVbinding:host_id
-p3719
-V
-sVdescription
-p3720
-V
-sVdns_assignment
-p3721
-(lp3722
-(dp3723
-Vhostname
-p3724
-Vhost-172-16-9-144
-p3725
-sg3704
-V172.16.9.144
-p3726
-sVfqdn
-p3727
-Vhost-172-16-9-144.openstacklocal.
-p3728
-sasVdevice_id
-p3729
-V
-sVname
-p3730
-VB-server_port-hw2ilvbsf7dq
-p3731
-sVadmin_state_up
-p3732
-I01
-sVnetwork_id
-p3733
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p3734
-sVdns_name
-p3735
-V
-sVcreated_at
-p3736
-V2017-11-30T11:03:57
-p3737
-sVbinding:vnic_type
-p3738
-Vnormal
-p3739
-sVtenant_id
-p3740
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3741
-sssV_context_show_deleted
-p3742
-I00
-sVpriority
-p3743
-VINFO
-p3744
-sV_context_is_admin
-p3745
-I01
-sV_context_project_domain
-p3746
-NsV_context_user
-p3747
-V84faafdbb77b40c9a73047fdebb0ab45
-p3748
-sVpublisher_id
-p3749
-Vnetwork.machine-A
-p3750
-sVmessage_id
-p3751
-V94026bcc-27dd-47eb-a4cb-b588c6d9717b
-p3752
-sV_context_roles
-p3753
-(lp3754
-Vadmin
-p3755
-asVtimestamp
-p3756
-V2017-11-30 11:05:11.619635
-p3757
-sV_context_timestamp
-p3758
-V2017-11-30 11:05:11.068636
-p3759
-sV_unique_id
-p3760
-Vc6503fac48c44995a35a6dc7973947cb
-p3761
-sV_context_tenant_id
-p3762
-V66fbf30f2dce4cef95d5248254dac9a5
-p3763
-sV_context_project_name
-p3764
-Vservices
-p3765
-sV_context_user_identity
-p3766
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p3767
-sV_context_tenant
-p3768
-V66fbf30f2dce4cef95d5248254dac9a5
-p3769
-sV_context_project_id
-p3770
-V66fbf30f2dce4cef95d5248254dac9a5
-p3771
-sV_context_read_only
-p3772
-I00
-sV_context_user_domain
-p3773
-NsV_context_user_name
-p3774
-Vneutron
-p3775
-stp3776
-a(F7.2770650386810303
-Vcompute.instance.shutdown.end
-p3777
-(dp3778
-V_context_domain
-p3779
-NsV_context_request_id
-p3780
-Vreq-14c241af-f5bf-4396-bbef-c7166326d04d
-p3781
-sV_context_quota_class
-p3782
-NsVevent_type
-p3783
-g3777
-sV_context_service_catalog
-p3784
-(lp3785
-(dp3786
-Vendpoints
-p3787
-(lp3788
-(dp3789
-VadminURL
-p3790
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3791
-sVregion
-p3792
-VRegionOne
-p3793
-sVinternalURL
-p3794
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3795
-sVpublicURL
-p3796
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3797
-sasVtype
-p3798
-Vvolume
-p3799
-sVname
-p3800
-Vcinder
-p3801
-sa(dp3802
-g3787
-(lp3803
-(dp3804
-g3790
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3805
-sg3792
-VRegionOne
-p3806
-sg3794
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3807
-sg3796
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3808
-sasg3798
-Vvolumev2
-p3809
-sg3800
-Vcinderv2
-p3810
-sasV_context_auth_token
-p3811
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p3812
-sV_context_resource_uuid
-p3813
-NsV_context_user_id
-p3814
-Vef7a4f67379f41aba489a0b6d6a62094
-p3815
-sVpayload
-p3816
-(dp3817
-Vstate_description
-p3818
-Vdeleting
-p3819
-sVavailability_zone
-p3820
-Vnova
-p3821
-sVterminated_at
-p3822
-V
-sVephemeral_gb
-p3823
-I0
-sVinstance_type_id
-p3824
-I1
-sVdeleted_at
-p3825
-V
-sVreservation_id
-p3826
-Vr-4jmm1xbm
-p3827
-sVmemory_mb
-p3828
-I4096
-sVdisplay_name
-p3829
-Vvm_test
-p3830
-sVhostname
-p3831
-Vvm-test
-p3832
-sVstate
-p3833
-Vactive
-p3834
-sVprogress
-p3835
-V
-sVlaunched_at
-p3836
-V2017-11-30T11:04:13.000000
-p3837
-sVmetadata
-p3838
-(dp3839
-sVnode
-p3840
-Vmachine-C
-p3841
-sVramdisk_id
-p3842
-V
-sVaccess_ip_v6
-p3843
-NsVdisk_gb
-p3844
-I40
-sVaccess_ip_v4
-p3845
-NsVkernel_id
-p3846
-V
-sVhost
-p3847
-Vmachine-C
-p3848
-sVuser_id
-p3849
-Vef7a4f67379f41aba489a0b6d6a62094
-p3850
-sVimage_ref_url
-p3851
-Vhttp://172.16.0.7:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3852
-sVcell_name
-p3853
-V
-sVroot_gb
-p3854
-I40
-sVtenant_id
-p3855
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3856
-sVcreated_at
-p3857
-V2017-11-30T11:03:59.000000
-p3858
-sVinstance_id
-p3859
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p3860
-sVinstance_type
-p3861
-Vm1.medium
-p3862
-sVvcpus
-p3863
-I2
-sVimage_meta
-p3864
-(dp3865
-Vmin_disk
-p3866
-V40
-p3867
-sVcontainer_format
-p3868
-Vbare
-p3869
-sVmin_ram
-p3870
-V0
-sVdisk_format
-p3871
-Vqcow2
-p3872
-sVbase_image_ref
-p3873
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p3874
-ssVarchitecture
-p3875
-NsVos_type
-p3876
-NsVinstance_flavor_id
-p3877
-V3
-ssV_context_show_deleted
-p3878
-I00
-sVpriority
-p3879
-VINFO
-p3880
-sV_context_is_admin
-p3881
-I01
-sV_context_project_domain
-p3882
-NsV_context_user
-p3883
-Vef7a4f67379f41aba489a0b6d6a62094
-p3884
-sVpublisher_id
-p3885
-Vcompute.machine-C
-p3886
-sVmessage_id
-p3887
-V5bde2359-e640-4375-b916-47e6fab54b32
-p3888
-sV_context_remote_address
-p3889
-V172.16.0.5
-p3890
-sV_context_roles
-p3891
-(lp3892
-Vadmin
-p3893
-asVtimestamp
-p3894
-V2017-11-30 11:05:11.681356
-p3895
-sV_context_timestamp
-p3896
-V2017-11-30T11:05:09.150712
-p3897
-sV_unique_id
-p3898
-V39710e03ade7498d83657cacc9975535
-p3899
-sV_context_project_name
-p3900
-Vapexlake
-p3901
-sV_context_read_deleted
-p3902
-Vno
-p3903
-sV_context_user_identity
-p3904
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p3905
-sV_context_tenant
-p3906
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3907
-sV_context_instance_lock_checked
-p3908
-I00
-sV_context_project_id
-p3909
-V187e5e95e7eb499d8a421b3d4ed966d5
-p3910
-sV_context_read_only
-p3911
-I00
-sV_context_user_domain
-p3912
-NsV_context_user_name
-p3913
-Violie
-p3914
-stp3915
-a(F7.353255033493042
-Vcompute.instance.update
-p3916
-(dp3917
-V_context_domain
-p3918
-NsV_context_request_id
-p3919
-Vreq-14c241af-f5bf-4396-bbef-c7166326d04d
-p3920
-sV_context_quota_class
-p3921
-NsVevent_type
-p3922
-g3916
-sV_context_service_catalog
-p3923
-(lp3924
-(dp3925
-Vendpoints
-p3926
-(lp3927
-(dp3928
-VadminURL
-p3929
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3930
-sVregion
-p3931
-VRegionOne
-p3932
-sVinternalURL
-p3933
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3934
-sVpublicURL
-p3935
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p3936
-sasVtype
-p3937
-Vvolume
-p3938
-sVname
-p3939
-Vcinder
-p3940
-sa(dp3941
-g3926
-(lp3942
-(dp3943
-g3929
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3944
-sg3931
-VRegionOne
-p3945
-sg3933
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3946
-sg3935
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p3947
-sasg3937
-Vvolumev2
-p3948
-sg3939
-Vcinderv2
-p3949
-sasV_context_auth_token
-p3950
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p3951
-sV_context_resource_uuid
-p3952
-NsV_context_user_id
-p3953
-Vef7a4f67379f41aba489a0b6d6a62094
-p3954
-sVpayload
-p3955
-(dp3956
-Vstate_description
-p3957
-V
-sVavailability_zone
-p3958
-Vnova
-p3959
-sVterminated_at
-p3960
-V2017-11-30T11:05:11.000000
-p3961
-sVephemeral_gb
-p3962
-I0
-sVinstance_type_id
-p3963
-I1
-sVbandwidth
-p3964
-(dp3965
-sVdeleted_at
-p3966
-V
-sVreservation_id
-p3967
-Vr-4jmm1xbm
-p3968
-sVmemory_mb
-p3969
-I4096
-sVdisplay_name
-p3970
-Vvm_test
-p3971
-sVhostname
-p3972
-Vvm-test
-p3973
-sVstate
-p3974
-Vdeleted
-p3975
-sVold_state
-p3976
-Vactive
-p3977
-sVprogress
-p3978
-V
-sVlaunched_at
-p3979
-V2017-11-30T11:04:13.000000
-p3980
-sVmetadata
-p3981
-(dp3982
-sVnode
-p3983
-Vmachine-C
-p3984
-sVramdisk_id
-p3985
-V
-sVaccess_ip_v6
-p3986
-NsVdisk_gb
-p3987
-I40
-sVaccess_ip_v4
-p3988
-NsVkernel_id
-p3989
-V
-sVhost
-p3990
-Vmachine-C
-p3991
-sVuser_id
-p3992
-Vef7a4f67379f41aba489a0b6d6a62094
-p3993
-sVimage_ref_url
-p3994
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p3995
-sVcell_name
-p3996
-V
-sVaudit_period_beginning
-p3997
-V2017-11-01T00:00:00.000000
-p3998
-sVroot_gb
-p3999
-I40
-sVtenant_id
-p4000
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4001
-sVcreated_at
-p4002
-V2017-11-30T11:03:59.000000
-p4003
-sVold_task_state
-p4004
-Vdeleting
-p4005
-sVinstance_id
-p4006
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4007
-sVinstance_type
-p4008
-Vm1.medium
-p4009
-sVvcpus
-p4010
-I2
-sVimage_meta
-p4011
-(dp4012
-Vmin_disk
-p4013
-V40
-p4014
-sVcontainer_format
-p4015
-Vbare
-p4016
-sVmin_ram
-p4017
-V0
-sVdisk_format
-p4018
-Vqcow2
-p4019
-sVbase_image_ref
-p4020
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p4021
-ssVarchitecture
-p4022
-NsVnew_task_state
-p4023
-NsVaudit_period_ending
-p4024
-V2017-11-30T11:05:11.754072
-p4025
-sVos_type
-p4026
-NsVinstance_flavor_id
-p4027
-V3
-ssV_context_show_deleted
-p4028
-I00
-sVpriority
-p4029
-VINFO
-p4030
-sV_context_is_admin
-p4031
-I01
-sV_context_project_domain
-p4032
-NsV_context_user
-p4033
-Vef7a4f67379f41aba489a0b6d6a62094
-p4034
-sVpublisher_id
-p4035
-Vcompute.machine-A
-p4036
-sVmessage_id
-p4037
-V11085417-38ec-477b-b059-7fd9ab7b84d5
-p4038
-sV_context_remote_address
-p4039
-V172.16.0.5
-p4040
-sV_context_roles
-p4041
-(lp4042
-Vadmin
-p4043
-asVtimestamp
-p4044
-V2017-11-30 11:05:11.757679
-p4045
-sV_context_timestamp
-p4046
-V2017-11-30T11:05:09.150712
-p4047
-sV_unique_id
-p4048
-V78dc5d27dd114990819bb4c8d7c8937e
-p4049
-sV_context_project_name
-p4050
-Vapexlake
-p4051
-sV_context_read_deleted
-p4052
-Vno
-p4053
-sV_context_user_identity
-p4054
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4055
-sV_context_tenant
-p4056
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4057
-sV_context_instance_lock_checked
-p4058
-I00
-sV_context_project_id
-p4059
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4060
-sV_context_read_only
-p4061
-I00
-sV_context_user_domain
-p4062
-NsV_context_user_name
-p4063
-Violie
-p4064
-stp4065
-a(F7.4608349800109863
-Vcompute.instance.delete.end
-p4066
-(dp4067
-V_context_domain
-p4068
-NsV_context_request_id
-p4069
-Vreq-14c241af-f5bf-4396-bbef-c7166326d04d
-p4070
-sV_context_quota_class
-p4071
-NsVevent_type
-p4072
-g4066
-sV_context_service_catalog
-p4073
-(lp4074
-(dp4075
-Vendpoints
-p4076
-(lp4077
-(dp4078
-VadminURL
-p4079
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4080
-sVregion
-p4081
-VRegionOne
-p4082
-sVinternalURL
-p4083
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4084
-sVpublicURL
-p4085
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4086
-sasVtype
-p4087
-Vvolume
-p4088
-sVname
-p4089
-Vcinder
-p4090
-sa(dp4091
-g4076
-(lp4092
-(dp4093
-g4079
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4094
-sg4081
-VRegionOne
-p4095
-sg4083
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4096
-sg4085
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4097
-sasg4087
-Vvolumev2
-p4098
-sg4089
-Vcinderv2
-p4099
-sasV_context_auth_token
-p4100
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p4101
-sV_context_resource_uuid
-p4102
-NsV_context_user_id
-p4103
-Vef7a4f67379f41aba489a0b6d6a62094
-p4104
-sVpayload
-p4105
-(dp4106
-Vstate_description
-p4107
-V
-sVavailability_zone
-p4108
-Vnova
-p4109
-sVterminated_at
-p4110
-V2017-11-30T11:05:11.697940
-p4111
-sVephemeral_gb
-p4112
-I0
-sVinstance_type_id
-p4113
-I1
-sVdeleted_at
-p4114
-V2017-11-30T11:05:11.000000
-p4115
-sVreservation_id
-p4116
-Vr-4jmm1xbm
-p4117
-sVmemory_mb
-p4118
-I4096
-sVdisplay_name
-p4119
-Vvm_test
-p4120
-sVhostname
-p4121
-Vvm-test
-p4122
-sVstate
-p4123
-Vdeleted
-p4124
-sVprogress
-p4125
-V
-sVlaunched_at
-p4126
-V2017-11-30T11:04:13.000000
-p4127
-sVmetadata
-p4128
-(dp4129
-sVnode
-p4130
-Vmachine-C
-p4131
-sVramdisk_id
-p4132
-V
-sVaccess_ip_v6
-p4133
-NsVdisk_gb
-p4134
-I40
-sVaccess_ip_v4
-p4135
-NsVkernel_id
-p4136
-V
-sVhost
-p4137
-Vmachine-C
-p4138
-sVuser_id
-p4139
-Vef7a4f67379f41aba489a0b6d6a62094
-p4140
-sVimage_ref_url
-p4141
-Vhttp://172.16.0.7:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p4142
-sVcell_name
-p4143
-V
-sVroot_gb
-p4144
-I40
-sVtenant_id
-p4145
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4146
-sVcreated_at
-p4147
-V2017-11-30T11:03:59.000000
-p4148
-sVinstance_id
-p4149
-Vad35e8ee-a9fc-48b5-a61f-e827cb9ff044
-p4150
-sVinstance_type
-p4151
-Vm1.medium
-p4152
-sVvcpus
-p4153
-I2
-sVimage_meta
-p4154
-(dp4155
-Vmin_disk
-p4156
-V40
-p4157
-sVcontainer_format
-p4158
-Vbare
-p4159
-sVmin_ram
-p4160
-V0
-sVdisk_format
-p4161
-Vqcow2
-p4162
-sVbase_image_ref
-p4163
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p4164
-ssVarchitecture
-p4165
-NsVos_type
-p4166
-NsVinstance_flavor_id
-p4167
-V3
-ssV_context_show_deleted
-p4168
-I00
-sVpriority
-p4169
-VINFO
-p4170
-sV_context_is_admin
-p4171
-I01
-sV_context_project_domain
-p4172
-NsV_context_user
-p4173
-Vef7a4f67379f41aba489a0b6d6a62094
-p4174
-sVpublisher_id
-p4175
-Vcompute.machine-C
-p4176
-sVmessage_id
-p4177
-V14de6ae4-562a-4b98-b31d-6bbc81b6fe01
-p4178
-sV_context_remote_address
-p4179
-V172.16.0.5
-p4180
-sV_context_roles
-p4181
-(lp4182
-Vadmin
-p4183
-asVtimestamp
-p4184
-V2017-11-30 11:05:11.865770
-p4185
-sV_context_timestamp
-p4186
-V2017-11-30T11:05:09.150712
-p4187
-sV_unique_id
-p4188
-V34698564dab64955abcc165fb74cb156
-p4189
-sV_context_project_name
-p4190
-Vapexlake
-p4191
-sV_context_read_deleted
-p4192
-Vno
-p4193
-sV_context_user_identity
-p4194
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4195
-sV_context_tenant
-p4196
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4197
-sV_context_instance_lock_checked
-p4198
-I00
-sV_context_project_id
-p4199
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4200
-sV_context_read_only
-p4201
-I00
-sV_context_user_domain
-p4202
-NsV_context_user_name
-p4203
-Violie
-p4204
-stp4205
-a(F8.1779031753540039
-Vorchestration.stack.delete.end
-p4206
-(dp4207
-V_context_request_id
-p4208
-Vreq-6260a12b-81fb-4067-9476-7c309f0c9ec5
-p4209
-sVevent_type
-p4210
-g4206
-sV_context_region_name
-p4211
-NsV_context_auth_token
-p4212
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p4213
-sV_context_user_id
-p4214
-Vef7a4f67379f41aba489a0b6d6a62094
-p4215
-sVpayload
-p4216
-(dp4217
-Vusername
-p4218
-NsVstate_reason
-p4219
-VStack DELETE completed successfully
-p4220
-sVuser_id
-p4221
-NsVuser_identity
-p4222
-Vef7a4f67379f41aba489a0b6d6a62094
-p4223
-sVstack_name
-p4224
-VA
-sVtenant_id
-p4225
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4226
-sVstack_identity
-p4227
-V84a34c44-0667-45d8-a9a0-15f98f6af026
-p4228
-sVcreate_at
-p4229
-V2017-11-30T11:03:52
-p4230
-sVstate
-p4231
-VDELETE_COMPLETE
-p4232
-ssV_context_username
-p4233
-NsV_context_show_deleted
-p4234
-I00
-sV_context_trust_id
-p4235
-NsVpriority
-p4236
-VINFO
-p4237
-sV_context_is_admin
-p4238
-I01
-sV_context_auth_token_info
-p4239
-(dp4240
-Vtoken
-p4241
-(dp4242
-Vmethods
-p4243
-(lp4244
-Vpassword
-p4245
-asVroles
-p4246
-(lp4247
-(dp4248
-Vid
-p4249
-Vd475171bf8304e06a74b1add560b1f28
-p4250
-sVname
-p4251
-Vadmin
-p4252
-sasVauth_token
-p4253
-VgAAAAABaH-Xg-noobr36HyawQUrS5ZLCLopHnVs4tKP2SNKvc2V4HOlXWYlJ9eSYbIZHtuV7WlA1iVwPQvqbGnONHQauC5BRQ_Xa-P88zjRQ8oK3g3itQVv2QRusAQzj5UCxEXrT5ZnS_rK4dkqPSQbMDOErwtIwZjm2-yMGtqihPPeMWWmxVQ4
-p4254
-sVexpires_at
-p4255
-V2017-11-30T12:05:04.000000Z
-p4256
-sVproject
-p4257
-(dp4258
-Vdomain
-p4259
-(dp4260
-g4249
-Vdefault
-p4261
-sg4251
-VDefault
-p4262
-ssg4249
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4263
-sg4251
-Vapexlake
-p4264
-ssVcatalog
-p4265
-(lp4266
-(dp4267
-Vendpoints
-p4268
-(lp4269
-(dp4270
-Vurl
-p4271
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p4272
-sVinterface
-p4273
-Vpublic
-p4274
-sVregion
-p4275
-VRegionOne
-p4276
-sVregion_id
-p4277
-VRegionOne
-p4278
-sg4249
-V13359d68397c4732b5d455941ac95989
-p4279
-sa(dp4280
-g4271
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p4281
-sg4273
-Vinternal
-p4282
-sg4275
-VRegionOne
-p4283
-sg4277
-VRegionOne
-p4284
-sg4249
-V50aeae6c5d034dcb80871bdac7391209
-p4285
-sa(dp4286
-g4271
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p4287
-sg4273
-Vadmin
-p4288
-sg4275
-VRegionOne
-p4289
-sg4277
-VRegionOne
-p4290
-sg4249
-V93b06f780b224cbd9b514c2041d3db63
-p4291
-sasVtype
-p4292
-Vvolumev3
-p4293
-sg4249
-V00a63293a3154089a4c80b60b4aa9429
-p4294
-sg4251
-Vcinderv3
-p4295
-sa(dp4296
-g4268
-(lp4297
-(dp4298
-g4271
-Vhttp://172.16.0.5:8000/v1
-p4299
-sg4273
-Vadmin
-p4300
-sg4275
-VRegionOne
-p4301
-sg4277
-VRegionOne
-p4302
-sg4249
-V24acffb5d9154df4981db7424b7669bd
-p4303
-sa(dp4304
-g4271
-Vhttp://172.18.0.8:8000/v1
-p4305
-sg4273
-Vpublic
-p4306
-sg4275
-VRegionOne
-p4307
-sg4277
-VRegionOne
-p4308
-sg4249
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p4309
-sa(dp4310
-g4271
-Vhttp://172.16.0.5:8000/v1
-p4311
-sg4273
-Vinternal
-p4312
-sg4275
-VRegionOne
-p4313
-sg4277
-VRegionOne
-p4314
-sg4249
-V679262173a714d76a078051b95f8c969
-p4315
-sasg4292
-Vcloudformation
-p4316
-sg4249
-V245169ccae564a7db06ca002f1553b51
-p4317
-sg4251
-Vheat-cfn
-p4318
-sa(dp4319
-g4268
-(lp4320
-(dp4321
-g4271
-Vhttp://172.18.0.8:8080
-p4322
-sg4273
-Vpublic
-p4323
-sg4275
-VRegionOne
-p4324
-sg4277
-VRegionOne
-p4325
-sg4249
-V04a6ef3db6b046b1893ed45a3f906f6c
-p4326
-sa(dp4327
-g4271
-Vhttp://172.16.0.5:8080
-p4328
-sg4273
-Vinternal
-p4329
-sg4275
-VRegionOne
-p4330
-sg4277
-VRegionOne
-p4331
-sg4249
-V3e30684c9f74492b8ca9a64dd04261e6
-p4332
-sa(dp4333
-g4271
-Vhttp://172.16.0.5:8080
-p4334
-sg4273
-Vadmin
-p4335
-sg4275
-VRegionOne
-p4336
-sg4277
-VRegionOne
-p4337
-sg4249
-Vc5384b55cd7a441582f151c6b2807745
-p4338
-sasg4292
-Vs3
-p4339
-sg4249
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p4340
-sg4251
-Vswift_s3
-p4341
-sa(dp4342
-g4268
-(lp4343
-(dp4344
-g4271
-Vhttp://172.16.0.5:9696
-p4345
-sg4273
-Vadmin
-p4346
-sg4275
-VRegionOne
-p4347
-sg4277
-VRegionOne
-p4348
-sg4249
-V38b78b2c00264f59a4ade9392f88132b
-p4349
-sa(dp4350
-g4271
-Vhttp://172.18.0.8:9696
-p4351
-sg4273
-Vpublic
-p4352
-sg4275
-VRegionOne
-p4353
-sg4277
-VRegionOne
-p4354
-sg4249
-Vb5d0f72fbf674f84adf8929341e45586
-p4355
-sa(dp4356
-g4271
-Vhttp://172.16.0.5:9696
-p4357
-sg4273
-Vinternal
-p4358
-sg4275
-VRegionOne
-p4359
-sg4277
-VRegionOne
-p4360
-sg4249
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p4361
-sasg4292
-Vnetwork
-p4362
-sg4249
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p4363
-sg4251
-Vneutron
-p4364
-sa(dp4365
-g4268
-(lp4366
-(dp4367
-g4271
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4368
-sg4273
-Vinternal
-p4369
-sg4275
-VRegionOne
-p4370
-sg4277
-VRegionOne
-p4371
-sg4249
-V7c60744a22724044a92928bc2fa9e422
-p4372
-sa(dp4373
-g4271
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4374
-sg4273
-Vadmin
-p4375
-sg4275
-VRegionOne
-p4376
-sg4277
-VRegionOne
-p4377
-sg4249
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p4378
-sa(dp4379
-g4271
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4380
-sg4273
-Vpublic
-p4381
-sg4275
-VRegionOne
-p4382
-sg4277
-VRegionOne
-p4383
-sg4249
-Vde47d994bdc147bdb824474ea699a77a
-p4384
-sasg4292
-Vorchestration
-p4385
-sg4249
-V65a72244f7c54382aeebf5dfdeab8140
-p4386
-sg4251
-Vheat
-p4387
-sa(dp4388
-g4268
-(lp4389
-(dp4390
-g4271
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4391
-sg4273
-Vinternal
-p4392
-sg4275
-VRegionOne
-p4393
-sg4277
-VRegionOne
-p4394
-sg4249
-V3a25e85ecaa44b678c3721c2d3d39b38
-p4395
-sa(dp4396
-g4271
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4397
-sg4273
-Vadmin
-p4398
-sg4275
-VRegionOne
-p4399
-sg4277
-VRegionOne
-p4400
-sg4249
-V68c763474c3d4aa28c4ee0e0249998eb
-p4401
-sa(dp4402
-g4271
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4403
-sg4273
-Vpublic
-p4404
-sg4275
-VRegionOne
-p4405
-sg4277
-VRegionOne
-p4406
-sg4249
-Ve0c861373e94468db521d5a8793d33d1
-p4407
-sasg4292
-Vvolume
-p4408
-sg4249
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p4409
-sg4251
-Vcinder
-p4410
-sa(dp4411
-g4268
-(lp4412
-(dp4413
-g4271
-Vhttp://172.18.0.8:5000/v2.0
-p4414
-sg4273
-Vpublic
-p4415
-sg4275
-VRegionOne
-p4416
-sg4277
-VRegionOne
-p4417
-sg4249
-V6aa35bc15a35447db58ec5b67087f96a
-p4418
-sa(dp4419
-g4271
-Vhttp://172.16.0.5:5000/v2.0
-p4420
-sg4273
-Vinternal
-p4421
-sg4275
-VRegionOne
-p4422
-sg4277
-VRegionOne
-p4423
-sg4249
-V6b4742f26b694b93bdbcb37304d22f69
-p4424
-sa(dp4425
-g4271
-Vhttp://172.16.0.5:35357/v2.0
-p4426
-sg4273
-Vadmin
-p4427
-sg4275
-VRegionOne
-p4428
-sg4277
-VRegionOne
-p4429
-sg4249
-Vadc120ea606644a299a3c91a7ceeb8c4
-p4430
-sasg4292
-Videntity
-p4431
-sg4249
-V9f95de9f4efc4730b4dd90354894e1dc
-p4432
-sg4251
-Vkeystone
-p4433
-sa(dp4434
-g4268
-(lp4435
-(dp4436
-g4271
-Vhttp://172.16.0.5:9292
-p4437
-sg4273
-Vadmin
-p4438
-sg4275
-VRegionOne
-p4439
-sg4277
-VRegionOne
-p4440
-sg4249
-V049519f829be4e7fb5f44ae9f470efdf
-p4441
-sa(dp4442
-g4271
-Vhttp://172.18.0.8:9292
-p4443
-sg4273
-Vpublic
-p4444
-sg4275
-VRegionOne
-p4445
-sg4277
-VRegionOne
-p4446
-sg4249
-V1baebbbf35744192b335f4f293d1a9d8
-p4447
-sa(dp4448
-g4271
-Vhttp://172.16.0.5:9292
-p4449
-sg4273
-Vinternal
-p4450
-sg4275
-VRegionOne
-p4451
-sg4277
-VRegionOne
-p4452
-sg4249
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p4453
-sasg4292
-Vimage
-p4454
-sg4249
-Va39ec0213acc45ceb59346299e78d6c0
-p4455
-sg4251
-Vglance
-p4456
-sa(dp4457
-g4268
-(lp4458
-(dp4459
-g4271
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4460
-sg4273
-Vinternal
-p4461
-sg4275
-VRegionOne
-p4462
-sg4277
-VRegionOne
-p4463
-sg4249
-V2cd9d66e95484830a9006177e301aa57
-p4464
-sa(dp4465
-g4271
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4466
-sg4273
-Vpublic
-p4467
-sg4275
-VRegionOne
-p4468
-sg4277
-VRegionOne
-p4469
-sg4249
-Vbe2d979150a2401b9e7d5c365372d093
-p4470
-sa(dp4471
-g4271
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4472
-sg4273
-Vadmin
-p4473
-sg4275
-VRegionOne
-p4474
-sg4277
-VRegionOne
-p4475
-sg4249
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p4476
-sasg4292
-Vcompute_legacy
-p4477
-sg4249
-Va4dd95e3fde340468f8c1d7df9a853d0
-p4478
-sg4251
-Vcompute_legacy
-p4479
-sa(dp4480
-g4268
-(lp4481
-(dp4482
-g4271
-Vhttp://172.16.0.5:8774/v2.1
-p4483
-sg4273
-Vadmin
-p4484
-sg4275
-VRegionOne
-p4485
-sg4277
-VRegionOne
-p4486
-sg4249
-V0307d2c32dd54839aa5bc39746eeb186
-p4487
-sa(dp4488
-g4271
-Vhttp://172.18.0.8:8774/v2.1
-p4489
-sg4273
-Vpublic
-p4490
-sg4275
-VRegionOne
-p4491
-sg4277
-VRegionOne
-p4492
-sg4249
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p4493
-sa(dp4494
-g4271
-Vhttp://172.16.0.5:8774/v2.1
-p4495
-sg4273
-Vinternal
-p4496
-sg4275
-VRegionOne
-p4497
-sg4277
-VRegionOne
-p4498
-sg4249
-Vdb005ab592334fc599c142cf861e754f
-p4499
-sasg4292
-Vcompute
-p4500
-sg4249
-Vc165d40b8c3849bcb6067a3df2540c62
-p4501
-sg4251
-Vnova
-p4502
-sa(dp4503
-g4268
-(lp4504
-(dp4505
-g4271
-Vhttp://172.16.0.5:8080/swift/v1
-p4506
-sg4273
-Vadmin
-p4507
-sg4275
-VRegionOne
-p4508
-sg4277
-VRegionOne
-p4509
-sg4249
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p4510
-sa(dp4511
-g4271
-Vhttp://172.16.0.5:8080/swift/v1
-p4512
-sg4273
-Vinternal
-p4513
-sg4275
-VRegionOne
-p4514
-sg4277
-VRegionOne
-p4515
-sg4249
-V764118d3a33444ac980632d281acf4a7
-p4516
-sa(dp4517
-g4271
-Vhttp://172.18.0.8:8080/swift/v1
-p4518
-sg4273
-Vpublic
-p4519
-sg4275
-VRegionOne
-p4520
-sg4277
-VRegionOne
-p4521
-sg4249
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p4522
-sasg4292
-Vobject-store
-p4523
-sg4249
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p4524
-sg4251
-Vswift
-p4525
-sa(dp4526
-g4268
-(lp4527
-(dp4528
-g4271
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4529
-sg4273
-Vinternal
-p4530
-sg4275
-VRegionOne
-p4531
-sg4277
-VRegionOne
-p4532
-sg4249
-V61ea745c91ab4eb59464679931219024
-p4533
-sa(dp4534
-g4271
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4535
-sg4273
-Vadmin
-p4536
-sg4275
-VRegionOne
-p4537
-sg4277
-VRegionOne
-p4538
-sg4249
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p4539
-sa(dp4540
-g4271
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p4541
-sg4273
-Vpublic
-p4542
-sg4275
-VRegionOne
-p4543
-sg4277
-VRegionOne
-p4544
-sg4249
-V7155772851884dc6954c7345d350796f
-p4545
-sasg4292
-Vvolumev2
-p4546
-sg4249
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p4547
-sg4251
-Vcinderv2
-p4548
-sa(dp4549
-g4268
-(lp4550
-(dp4551
-g4271
-Vhttp://172.18.0.8:9494
-p4552
-sg4273
-Vpublic
-p4553
-sg4275
-VRegionOne
-p4554
-sg4277
-VRegionOne
-p4555
-sg4249
-V43a202e889694d51a3b11899c252a8a9
-p4556
-sa(dp4557
-g4271
-Vhttp://172.16.0.5:9494
-p4558
-sg4273
-Vadmin
-p4559
-sg4275
-VRegionOne
-p4560
-sg4277
-VRegionOne
-p4561
-sg4249
-Vfa3c9de06e854542b236aa24b53e19a1
-p4562
-sa(dp4563
-g4271
-Vhttp://172.16.0.5:9494
-p4564
-sg4273
-Vinternal
-p4565
-sg4275
-VRegionOne
-p4566
-sg4277
-VRegionOne
-p4567
-sg4249
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p4568
-sasg4292
-Vartifact
-p4569
-sg4249
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p4570
-sg4251
-Vglare
-p4571
-sasVversion
-p4572
-Vv3
-p4573
-sVuser
-p4574
-(dp4575
-g4259
-(dp4576
-g4249
-Vdefault
-p4577
-sg4251
-VDefault
-p4578
-ssg4249
-Vef7a4f67379f41aba489a0b6d6a62094
-p4579
-sg4251
-Violie
-p4580
-ssVaudit_ids
-p4581
-(lp4582
-V3g8KSAJYRZ6STG5-I1m94w
-p4583
-asVissued_at
-p4584
-V2017-11-30T11:05:04.000000Z
-p4585
-sssV_context_user
-p4586
-NsVpublisher_id
-p4587
-Vorchestration.machine-A
-p4588
-sVmessage_id
-p4589
-Vcfd82492-a506-4b2e-9422-5bb1ef450c00
-p4590
-sV_context_roles
-p4591
-(lp4592
-Vadmin
-p4593
-asV_context_auth_url
-p4594
-Vhttp://172.16.0.5:35357/v3/
-p4595
-sVtimestamp
-p4596
-V2017-11-30 11:05:12.582851
-p4597
-sV_unique_id
-p4598
-Vdb83b3e4e0734552b85989b1c03fb89a
-p4599
-sV_context_tenant_id
-p4600
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4601
-sV_context_user_domain_id
-p4602
-Vdefault
-p4603
-sV_context_password
-p4604
-NsV_context_trustor_user_id
-p4605
-NsV_context_project_domain_id
-p4606
-Vdefault
-p4607
-sV_context_aws_creds
-p4608
-NsV_context_tenant
-p4609
-Vapexlake
-p4610
-sV_context_user_identity
-p4611
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p4612
-stp4613
-a(F8.3186190128326416
-Vport.delete.start
-p4614
-(dp4615
-V_context_domain
-p4616
-NsV_context_request_id
-p4617
-Vreq-b4f33d1b-bc54-4b8b-93db-fd3ca5162b07
-p4618
-sVevent_type
-p4619
-g4614
-sV_context_auth_token
-p4620
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p4621
-sV_context_resource_uuid
-p4622
-NsV_context_tenant_name
-p4623
-Vapexlake
-p4624
-sV_context_user_id
-p4625
-Vef7a4f67379f41aba489a0b6d6a62094
-p4626
-sVpayload
-p4627
-(dp4628
-Vport_id
-p4629
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p4630
-ssV_context_show_deleted
-p4631
-I00
-sVpriority
-p4632
-VINFO
-p4633
-sV_context_is_admin
-p4634
-I01
-sV_context_project_domain
-p4635
-NsV_context_user
-p4636
-Vef7a4f67379f41aba489a0b6d6a62094
-p4637
-sVpublisher_id
-p4638
-Vnetwork.machine-A
-p4639
-sVmessage_id
-p4640
-V8fc2660b-248f-422b-9d21-2e696ab513a0
-p4641
-sV_context_roles
-p4642
-(lp4643
-Vadmin
-p4644
-asVtimestamp
-p4645
-V2017-11-30 11:05:12.724001
-p4646
-sV_context_timestamp
-p4647
-V2017-11-30 11:05:12.722978
-p4648
-sV_unique_id
-p4649
-V91fe15ffc4654e398a8b58b18f536c39
-p4650
-sV_context_tenant_id
-p4651
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4652
-sV_context_project_name
-p4653
-Vapexlake
-p4654
-sV_context_user_identity
-p4655
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4656
-sV_context_tenant
-p4657
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4658
-sV_context_project_id
-p4659
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4660
-sV_context_read_only
-p4661
-I00
-sV_context_user_domain
-p4662
-NsV_context_user_name
-p4663
-Violie
-p4664
-stp4665
-a(F8.4500479698181152
-Vport.delete.end
-p4666
-(dp4667
-V_context_domain
-p4668
-NsV_context_request_id
-p4669
-Vreq-b4f33d1b-bc54-4b8b-93db-fd3ca5162b07
-p4670
-sVevent_type
-p4671
-g4666
-sV_context_auth_token
-p4672
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p4673
-sV_context_resource_uuid
-p4674
-NsV_context_tenant_name
-p4675
-Vapexlake
-p4676
-sV_context_user_id
-p4677
-Vef7a4f67379f41aba489a0b6d6a62094
-p4678
-sVpayload
-p4679
-(dp4680
-Vport_id
-p4681
-V8352eb08-f1a2-479c-b54f-f3cba355283e
-p4682
-ssV_context_show_deleted
-p4683
-I00
-sVpriority
-p4684
-VINFO
-p4685
-sV_context_is_admin
-p4686
-I01
-sV_context_project_domain
-p4687
-NsV_context_user
-p4688
-Vef7a4f67379f41aba489a0b6d6a62094
-p4689
-sVpublisher_id
-p4690
-Vnetwork.machine-A
-p4691
-sVmessage_id
-p4692
-Vf07c4973-2e0d-405b-ac3e-bac5e7a0275b
-p4693
-sV_context_roles
-p4694
-(lp4695
-Vadmin
-p4696
-asVtimestamp
-p4697
-V2017-11-30 11:05:12.855704
-p4698
-sV_context_timestamp
-p4699
-V2017-11-30 11:05:12.722978
-p4700
-sV_unique_id
-p4701
-V4489118e0ff14c8b84cf98831f3fb211
-p4702
-sV_context_tenant_id
-p4703
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4704
-sV_context_project_name
-p4705
-Vapexlake
-p4706
-sV_context_user_identity
-p4707
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4708
-sV_context_tenant
-p4709
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4710
-sV_context_project_id
-p4711
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4712
-sV_context_read_only
-p4713
-I00
-sV_context_user_domain
-p4714
-NsV_context_user_name
-p4715
-Violie
-p4716
-stp4717
-a(F9.5884301662445068
-Vsecurity_group_rule.delete.start
-p4718
-(dp4719
-V_context_domain
-p4720
-NsV_context_request_id
-p4721
-Vreq-6a9c18a0-4f61-49cd-9790-6275fedd29a0
-p4722
-sVevent_type
-p4723
-g4718
-sV_context_auth_token
-p4724
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p4725
-sV_context_resource_uuid
-p4726
-NsV_context_tenant_name
-p4727
-Vapexlake
-p4728
-sV_context_user_id
-p4729
-Vef7a4f67379f41aba489a0b6d6a62094
-p4730
-sVpayload
-p4731
-(dp4732
-Vsecurity_group_rule_id
-p4733
-V05ca3f24-9c39-4c2a-98a9-a9729a6aeb09
-p4734
-ssV_context_show_deleted
-p4735
-I00
-sVpriority
-p4736
-VINFO
-p4737
-sV_context_is_admin
-p4738
-I01
-sV_context_project_domain
-p4739
-NsV_context_user
-p4740
-Vef7a4f67379f41aba489a0b6d6a62094
-p4741
-sVpublisher_id
-p4742
-Vnetwork.machine-A
-p4743
-sVmessage_id
-p4744
-Vced8c199-458a-493a-9fb3-0e04d8bf2106
-p4745
-sV_context_roles
-p4746
-(lp4747
-Vadmin
-p4748
-asVtimestamp
-p4749
-V2017-11-30 11:05:13.993961
-p4750
-sV_context_timestamp
-p4751
-V2017-11-30 11:05:13.992770
-p4752
-sV_unique_id
-p4753
-V467f978b0d2a48748dc0fcbac1dbaa5e
-p4754
-sV_context_tenant_id
-p4755
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4756
-sV_context_project_name
-p4757
-Vapexlake
-p4758
-sV_context_user_identity
-p4759
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p4760
-sV_context_tenant
-p4761
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4762
-sV_context_project_id
-p4763
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4764
-sV_context_read_only
-p4765
-I00
-sV_context_user_domain
-p4766
-NsV_context_user_name
-p4767
-Violie
-p4768
-stp4769
-a(F9.6073601245880127
-Vorchestration.stack.delete.start
-p4770
-(dp4771
-V_context_request_id
-p4772
-Vreq-de85aaf7-8013-48d9-a030-3c9431857aec
-p4773
-sVevent_type
-p4774
-g4770
-sV_context_region_name
-p4775
-NsV_context_auth_token
-p4776
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p4777
-sV_context_user_id
-p4778
-Vef7a4f67379f41aba489a0b6d6a62094
-p4779
-sVpayload
-p4780
-(dp4781
-Vusername
-p4782
-NsVstate_reason
-p4783
-VStack DELETE started
-p4784
-sVuser_id
-p4785
-NsVuser_identity
-p4786
-Vef7a4f67379f41aba489a0b6d6a62094
-p4787
-sVstack_name
-p4788
-VC
-sVtenant_id
-p4789
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4790
-sVstack_identity
-p4791
-V46e5c635-6b08-47d3-8949-effa358b9485
-p4792
-sVcreate_at
-p4793
-V2017-11-30T11:03:59
-p4794
-sVstate
-p4795
-VDELETE_IN_PROGRESS
-p4796
-ssV_context_username
-p4797
-NsV_context_show_deleted
-p4798
-I00
-sV_context_trust_id
-p4799
-NsVpriority
-p4800
-VINFO
-p4801
-sV_context_is_admin
-p4802
-I01
-sV_context_auth_token_info
-p4803
-(dp4804
-Vtoken
-p4805
-(dp4806
-Vmethods
-p4807
-(lp4808
-Vpassword
-p4809
-asVroles
-p4810
-(lp4811
-(dp4812
-Vid
-p4813
-Vd475171bf8304e06a74b1add560b1f28
-p4814
-sVname
-p4815
-Vadmin
-p4816
-sasVauth_token
-p4817
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p4818
-sVexpires_at
-p4819
-V2017-11-30T12:05:13.000000Z
-p4820
-sVproject
-p4821
-(dp4822
-Vdomain
-p4823
-(dp4824
-g4813
-Vdefault
-p4825
-sg4815
-VDefault
-p4826
-ssg4813
-V187e5e95e7eb499d8a421b3d4ed966d5
-p4827
-sg4815
-Vapexlake
-p4828
-ssVcatalog
-p4829
-(lp4830
-(dp4831
-Vendpoints
-p4832
-(lp4833
-(dp4834
-Vurl
-p4835
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p4836
-sVinterface
-p4837
-Vpublic
-p4838
-sVregion
-p4839
-VRegionOne
-p4840
-sVregion_id
-p4841
-VRegionOne
-p4842
-sg4813
-V13359d68397c4732b5d455941ac95989
-p4843
-sa(dp4844
-g4835
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p4845
-sg4837
-Vinternal
-p4846
-sg4839
-VRegionOne
-p4847
-sg4841
-VRegionOne
-p4848
-sg4813
-V50aeae6c5d034dcb80871bdac7391209
-p4849
-sa(dp4850
-g4835
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p4851
-sg4837
-Vadmin
-p4852
-sg4839
-VRegionOne
-p4853
-sg4841
-VRegionOne
-p4854
-sg4813
-V93b06f780b224cbd9b514c2041d3db63
-p4855
-sasVtype
-p4856
-Vvolumev3
-p4857
-sg4813
-V00a63293a3154089a4c80b60b4aa9429
-p4858
-sg4815
-Vcinderv3
-p4859
-sa(dp4860
-g4832
-(lp4861
-(dp4862
-g4835
-Vhttp://172.16.0.5:8000/v1
-p4863
-sg4837
-Vadmin
-p4864
-sg4839
-VRegionOne
-p4865
-sg4841
-VRegionOne
-p4866
-sg4813
-V24acffb5d9154df4981db7424b7669bd
-p4867
-sa(dp4868
-g4835
-Vhttp://172.18.0.8:8000/v1
-p4869
-sg4837
-Vpublic
-p4870
-sg4839
-VRegionOne
-p4871
-sg4841
-VRegionOne
-p4872
-sg4813
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p4873
-sa(dp4874
-g4835
-Vhttp://172.16.0.5:8000/v1
-p4875
-sg4837
-Vinternal
-p4876
-sg4839
-VRegionOne
-p4877
-sg4841
-VRegionOne
-p4878
-sg4813
-V679262173a714d76a078051b95f8c969
-p4879
-sasg4856
-Vcloudformation
-p4880
-sg4813
-V245169ccae564a7db06ca002f1553b51
-p4881
-sg4815
-Vheat-cfn
-p4882
-sa(dp4883
-g4832
-(lp4884
-(dp4885
-g4835
-Vhttp://172.18.0.8:8080
-p4886
-sg4837
-Vpublic
-p4887
-sg4839
-VRegionOne
-p4888
-sg4841
-VRegionOne
-p4889
-sg4813
-V04a6ef3db6b046b1893ed45a3f906f6c
-p4890
-sa(dp4891
-g4835
-Vhttp://172.16.0.5:8080
-p4892
-sg4837
-Vinternal
-p4893
-sg4839
-VRegionOne
-p4894
-sg4841
-VRegionOne
-p4895
-sg4813
-V3e30684c9f74492b8ca9a64dd04261e6
-p4896
-sa(dp4897
-g4835
-Vhttp://172.16.0.5:8080
-p4898
-sg4837
-Vadmin
-p4899
-sg4839
-VRegionOne
-p4900
-sg4841
-VRegionOne
-p4901
-sg4813
-Vc5384b55cd7a441582f151c6b2807745
-p4902
-sasg4856
-Vs3
-p4903
-sg4813
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p4904
-sg4815
-Vswift_s3
-p4905
-sa(dp4906
-g4832
-(lp4907
-(dp4908
-g4835
-Vhttp://172.16.0.5:9696
-p4909
-sg4837
-Vadmin
-p4910
-sg4839
-VRegionOne
-p4911
-sg4841
-VRegionOne
-p4912
-sg4813
-V38b78b2c00264f59a4ade9392f88132b
-p4913
-sa(dp4914
-g4835
-Vhttp://172.18.0.8:9696
-p4915
-sg4837
-Vpublic
-p4916
-sg4839
-VRegionOne
-p4917
-sg4841
-VRegionOne
-p4918
-sg4813
-Vb5d0f72fbf674f84adf8929341e45586
-p4919
-sa(dp4920
-g4835
-Vhttp://172.16.0.5:9696
-p4921
-sg4837
-Vinternal
-p4922
-sg4839
-VRegionOne
-p4923
-sg4841
-VRegionOne
-p4924
-sg4813
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p4925
-sasg4856
-Vnetwork
-p4926
-sg4813
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p4927
-sg4815
-Vneutron
-p4928
-sa(dp4929
-g4832
-(lp4930
-(dp4931
-g4835
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4932
-sg4837
-Vinternal
-p4933
-sg4839
-VRegionOne
-p4934
-sg4841
-VRegionOne
-p4935
-sg4813
-V7c60744a22724044a92928bc2fa9e422
-p4936
-sa(dp4937
-g4835
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4938
-sg4837
-Vadmin
-p4939
-sg4839
-VRegionOne
-p4940
-sg4841
-VRegionOne
-p4941
-sg4813
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p4942
-sa(dp4943
-g4835
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4944
-sg4837
-Vpublic
-p4945
-sg4839
-VRegionOne
-p4946
-sg4841
-VRegionOne
-p4947
-sg4813
-Vde47d994bdc147bdb824474ea699a77a
-p4948
-sasg4856
-Vorchestration
-p4949
-sg4813
-V65a72244f7c54382aeebf5dfdeab8140
-p4950
-sg4815
-Vheat
-p4951
-sa(dp4952
-g4832
-(lp4953
-(dp4954
-g4835
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4955
-sg4837
-Vinternal
-p4956
-sg4839
-VRegionOne
-p4957
-sg4841
-VRegionOne
-p4958
-sg4813
-V3a25e85ecaa44b678c3721c2d3d39b38
-p4959
-sa(dp4960
-g4835
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4961
-sg4837
-Vadmin
-p4962
-sg4839
-VRegionOne
-p4963
-sg4841
-VRegionOne
-p4964
-sg4813
-V68c763474c3d4aa28c4ee0e0249998eb
-p4965
-sa(dp4966
-g4835
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p4967
-sg4837
-Vpublic
-p4968
-sg4839
-VRegionOne
-p4969
-sg4841
-VRegionOne
-p4970
-sg4813
-Ve0c861373e94468db521d5a8793d33d1
-p4971
-sasg4856
-Vvolume
-p4972
-sg4813
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p4973
-sg4815
-Vcinder
-p4974
-sa(dp4975
-g4832
-(lp4976
-(dp4977
-g4835
-Vhttp://172.18.0.8:5000/v2.0
-p4978
-sg4837
-Vpublic
-p4979
-sg4839
-VRegionOne
-p4980
-sg4841
-VRegionOne
-p4981
-sg4813
-V6aa35bc15a35447db58ec5b67087f96a
-p4982
-sa(dp4983
-g4835
-Vhttp://172.16.0.5:5000/v2.0
-p4984
-sg4837
-Vinternal
-p4985
-sg4839
-VRegionOne
-p4986
-sg4841
-VRegionOne
-p4987
-sg4813
-V6b4742f26b694b93bdbcb37304d22f69
-p4988
-sa(dp4989
-g4835
-Vhttp://172.16.0.5:35357/v2.0
-p4990
-sg4837
-Vadmin
-p4991
-sg4839
-VRegionOne
-p4992
-sg4841
-VRegionOne
-p4993
-sg4813
-Vadc120ea606644a299a3c91a7ceeb8c4
-p4994
-sasg4856
-Videntity
-p4995
-sg4813
-V9f95de9f4efc4730b4dd90354894e1dc
-p4996
-sg4815
-Vkeystone
-p4997
-sa(dp4998
-g4832
-(lp4999
-(dp5000
-g4835
-Vhttp://172.16.0.5:9292
-p5001
-sg4837
-Vadmin
-p5002
-sg4839
-VRegionOne
-p5003
-sg4841
-VRegionOne
-p5004
-sg4813
-V049519f829be4e7fb5f44ae9f470efdf
-p5005
-sa(dp5006
-g4835
-Vhttp://172.18.0.8:9292
-p5007
-sg4837
-Vpublic
-p5008
-sg4839
-VRegionOne
-p5009
-sg4841
-VRegionOne
-p5010
-sg4813
-V1baebbbf35744192b335f4f293d1a9d8
-p5011
-sa(dp5012
-g4835
-Vhttp://172.16.0.5:9292
-p5013
-sg4837
-Vinternal
-p5014
-sg4839
-VRegionOne
-p5015
-sg4841
-VRegionOne
-p5016
-sg4813
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p5017
-sasg4856
-Vimage
-p5018
-sg4813
-Va39ec0213acc45ceb59346299e78d6c0
-p5019
-sg4815
-Vglance
-p5020
-sa(dp5021
-g4832
-(lp5022
-(dp5023
-g4835
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5024
-sg4837
-Vinternal
-p5025
-sg4839
-VRegionOne
-p5026
-sg4841
-VRegionOne
-p5027
-sg4813
-V2cd9d66e95484830a9006177e301aa57
-p5028
-sa(dp5029
-g4835
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5030
-sg4837
-Vpublic
-p5031
-sg4839
-VRegionOne
-p5032
-sg4841
-VRegionOne
-p5033
-sg4813
-Vbe2d979150a2401b9e7d5c365372d093
-p5034
-sa(dp5035
-g4835
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5036
-sg4837
-Vadmin
-p5037
-sg4839
-VRegionOne
-p5038
-sg4841
-VRegionOne
-p5039
-sg4813
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p5040
-sasg4856
-Vcompute_legacy
-p5041
-sg4813
-Va4dd95e3fde340468f8c1d7df9a853d0
-p5042
-sg4815
-Vcompute_legacy
-p5043
-sa(dp5044
-g4832
-(lp5045
-(dp5046
-g4835
-Vhttp://172.16.0.5:8774/v2.1
-p5047
-sg4837
-Vadmin
-p5048
-sg4839
-VRegionOne
-p5049
-sg4841
-VRegionOne
-p5050
-sg4813
-V0307d2c32dd54839aa5bc39746eeb186
-p5051
-sa(dp5052
-g4835
-Vhttp://172.18.0.8:8774/v2.1
-p5053
-sg4837
-Vpublic
-p5054
-sg4839
-VRegionOne
-p5055
-sg4841
-VRegionOne
-p5056
-sg4813
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p5057
-sa(dp5058
-g4835
-Vhttp://172.16.0.5:8774/v2.1
-p5059
-sg4837
-Vinternal
-p5060
-sg4839
-VRegionOne
-p5061
-sg4841
-VRegionOne
-p5062
-sg4813
-Vdb005ab592334fc599c142cf861e754f
-p5063
-sasg4856
-Vcompute
-p5064
-sg4813
-Vc165d40b8c3849bcb6067a3df2540c62
-p5065
-sg4815
-Vnova
-p5066
-sa(dp5067
-g4832
-(lp5068
-(dp5069
-g4835
-Vhttp://172.16.0.5:8080/swift/v1
-p5070
-sg4837
-Vadmin
-p5071
-sg4839
-VRegionOne
-p5072
-sg4841
-VRegionOne
-p5073
-sg4813
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p5074
-sa(dp5075
-g4835
-Vhttp://172.16.0.5:8080/swift/v1
-p5076
-sg4837
-Vinternal
-p5077
-sg4839
-VRegionOne
-p5078
-sg4841
-VRegionOne
-p5079
-sg4813
-V764118d3a33444ac980632d281acf4a7
-p5080
-sa(dp5081
-g4835
-Vhttp://172.18.0.8:8080/swift/v1
-p5082
-sg4837
-Vpublic
-p5083
-sg4839
-VRegionOne
-p5084
-sg4841
-VRegionOne
-p5085
-sg4813
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p5086
-sasg4856
-Vobject-store
-p5087
-sg4813
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p5088
-sg4815
-Vswift
-p5089
-sa(dp5090
-g4832
-(lp5091
-(dp5092
-g4835
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5093
-sg4837
-Vinternal
-p5094
-sg4839
-VRegionOne
-p5095
-sg4841
-VRegionOne
-p5096
-sg4813
-V61ea745c91ab4eb59464679931219024
-p5097
-sa(dp5098
-g4835
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5099
-sg4837
-Vadmin
-p5100
-sg4839
-VRegionOne
-p5101
-sg4841
-VRegionOne
-p5102
-sg4813
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p5103
-sa(dp5104
-g4835
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5105
-sg4837
-Vpublic
-p5106
-sg4839
-VRegionOne
-p5107
-sg4841
-VRegionOne
-p5108
-sg4813
-V7155772851884dc6954c7345d350796f
-p5109
-sasg4856
-Vvolumev2
-p5110
-sg4813
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p5111
-sg4815
-Vcinderv2
-p5112
-sa(dp5113
-g4832
-(lp5114
-(dp5115
-g4835
-Vhttp://172.18.0.8:9494
-p5116
-sg4837
-Vpublic
-p5117
-sg4839
-VRegionOne
-p5118
-sg4841
-VRegionOne
-p5119
-sg4813
-V43a202e889694d51a3b11899c252a8a9
-p5120
-sa(dp5121
-g4835
-Vhttp://172.16.0.5:9494
-p5122
-sg4837
-Vadmin
-p5123
-sg4839
-VRegionOne
-p5124
-sg4841
-VRegionOne
-p5125
-sg4813
-Vfa3c9de06e854542b236aa24b53e19a1
-p5126
-sa(dp5127
-g4835
-Vhttp://172.16.0.5:9494
-p5128
-sg4837
-Vinternal
-p5129
-sg4839
-VRegionOne
-p5130
-sg4841
-VRegionOne
-p5131
-sg4813
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p5132
-sasg4856
-Vartifact
-p5133
-sg4813
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p5134
-sg4815
-Vglare
-p5135
-sasVversion
-p5136
-Vv3
-p5137
-sVuser
-p5138
-(dp5139
-g4823
-(dp5140
-g4813
-Vdefault
-p5141
-sg4815
-VDefault
-p5142
-ssg4813
-Vef7a4f67379f41aba489a0b6d6a62094
-p5143
-sg4815
-Violie
-p5144
-ssVaudit_ids
-p5145
-(lp5146
-VuQuM0ZhiSbC3Wev8-OlRyw
-p5147
-asVissued_at
-p5148
-V2017-11-30T11:05:13.000000Z
-p5149
-sssV_context_user
-p5150
-NsVpublisher_id
-p5151
-Vorchestration.machine-A
-p5152
-sVmessage_id
-p5153
-V9712aabf-64bb-4f1c-a2e5-3836706fdec1
-p5154
-sV_context_roles
-p5155
-(lp5156
-Vadmin
-p5157
-asV_context_auth_url
-p5158
-Vhttp://172.16.0.5:35357/v3/
-p5159
-sVtimestamp
-p5160
-V2017-11-30 11:05:14.009698
-p5161
-sV_unique_id
-p5162
-V73285fef17ae4281b58b973cccf2338f
-p5163
-sV_context_tenant_id
-p5164
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5165
-sV_context_user_domain_id
-p5166
-Vdefault
-p5167
-sV_context_password
-p5168
-NsV_context_trustor_user_id
-p5169
-NsV_context_project_domain_id
-p5170
-Vdefault
-p5171
-sV_context_aws_creds
-p5172
-NsV_context_tenant
-p5173
-Vapexlake
-p5174
-sV_context_user_identity
-p5175
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p5176
-stp5177
-a(F9.6162381172180176
-Vsecurity_group_rule.delete.end
-p5178
-(dp5179
-V_context_domain
-p5180
-NsV_context_request_id
-p5181
-Vreq-6a9c18a0-4f61-49cd-9790-6275fedd29a0
-p5182
-sVevent_type
-p5183
-g5178
-sV_context_auth_token
-p5184
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5185
-sV_context_resource_uuid
-p5186
-NsV_context_tenant_name
-p5187
-Vapexlake
-p5188
-sV_context_user_id
-p5189
-Vef7a4f67379f41aba489a0b6d6a62094
-p5190
-sVpayload
-p5191
-(dp5192
-Vsecurity_group_rule_id
-p5193
-V05ca3f24-9c39-4c2a-98a9-a9729a6aeb09
-p5194
-ssV_context_show_deleted
-p5195
-I00
-sVpriority
-p5196
-VINFO
-p5197
-sV_context_is_admin
-p5198
-I01
-sV_context_project_domain
-p5199
-NsV_context_user
-p5200
-Vef7a4f67379f41aba489a0b6d6a62094
-p5201
-sVpublisher_id
-p5202
-Vnetwork.machine-A
-p5203
-sVmessage_id
-p5204
-V24276177-2af5-4eb5-a6ce-9aeca7730010
-p5205
-sV_context_roles
-p5206
-(lp5207
-Vadmin
-p5208
-asVtimestamp
-p5209
-V2017-11-30 11:05:14.022465
-p5210
-sV_context_timestamp
-p5211
-V2017-11-30 11:05:13.992770
-p5212
-sV_unique_id
-p5213
-V17b37dd14bf84d0294b7bc70c43602df
-p5214
-sV_context_tenant_id
-p5215
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5216
-sV_context_project_name
-p5217
-Vapexlake
-p5218
-sV_context_user_identity
-p5219
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5220
-sV_context_tenant
-p5221
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5222
-sV_context_project_id
-p5223
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5224
-sV_context_read_only
-p5225
-I00
-sV_context_user_domain
-p5226
-NsV_context_user_name
-p5227
-Violie
-p5228
-stp5229
-a(F9.6251139640808105
-Vsecurity_group_rule.delete.start
-p5230
-(dp5231
-V_context_domain
-p5232
-NsV_context_request_id
-p5233
-Vreq-fa2fc107-a5c7-4e25-9d3a-a2a997f0ff3d
-p5234
-sVevent_type
-p5235
-g5230
-sV_context_auth_token
-p5236
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5237
-sV_context_resource_uuid
-p5238
-NsV_context_tenant_name
-p5239
-Vapexlake
-p5240
-sV_context_user_id
-p5241
-Vef7a4f67379f41aba489a0b6d6a62094
-p5242
-sVpayload
-p5243
-(dp5244
-Vsecurity_group_rule_id
-p5245
-V24b9daff-fa99-4319-88f9-0be6b52de0f7
-p5246
-ssV_context_show_deleted
-p5247
-I00
-sVpriority
-p5248
-VINFO
-p5249
-sV_context_is_admin
-p5250
-I01
-sV_context_project_domain
-p5251
-NsV_context_user
-p5252
-Vef7a4f67379f41aba489a0b6d6a62094
-p5253
-sVpublisher_id
-p5254
-Vnetwork.machine-A
-p5255
-sVmessage_id
-p5256
-Vb0c42523-e770-4149-9bc7-4c1e68abac73
-p5257
-sV_context_roles
-p5258
-(lp5259
-Vadmin
-p5260
-asVtimestamp
-p5261
-V2017-11-30 11:05:14.031156
-p5262
-sV_context_timestamp
-p5263
-V2017-11-30 11:05:14.030083
-p5264
-sV_unique_id
-p5265
-Ve1cbc068cbab4cdc8b5dc3ccca007b29
-p5266
-sV_context_tenant_id
-p5267
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5268
-sV_context_project_name
-p5269
-Vapexlake
-p5270
-sV_context_user_identity
-p5271
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5272
-sV_context_tenant
-p5273
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5274
-sV_context_project_id
-p5275
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5276
-sV_context_read_only
-p5277
-I00
-sV_context_user_domain
-p5278
-NsV_context_user_name
-p5279
-Violie
-p5280
-stp5281
-a(F9.6467061042785645
-Vfloatingip.delete.start
-p5282
-(dp5283
-V_context_domain
-p5284
-NsV_context_request_id
-p5285
-Vreq-0d358c54-4833-4386-a2d0-5d548ab34354
-p5286
-sVevent_type
-p5287
-g5282
-sV_context_auth_token
-p5288
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p5289
-sV_context_resource_uuid
-p5290
-NsV_context_tenant_name
-p5291
-Vapexlake
-p5292
-sV_context_user_id
-p5293
-Vef7a4f67379f41aba489a0b6d6a62094
-p5294
-sVpayload
-p5295
-(dp5296
-Vfloatingip_id
-p5297
-V3dce7c86-0999-469a-ad4e-a0dc609695cb
-p5298
-ssV_context_show_deleted
-p5299
-I00
-sVpriority
-p5300
-VINFO
-p5301
-sV_context_is_admin
-p5302
-I01
-sV_context_project_domain
-p5303
-NsV_context_user
-p5304
-Vef7a4f67379f41aba489a0b6d6a62094
-p5305
-sVpublisher_id
-p5306
-Vnetwork.machine-A
-p5307
-sVmessage_id
-p5308
-V0cadf353-4709-496c-8448-53535e53c93a
-p5309
-sV_context_roles
-p5310
-(lp5311
-Vadmin
-p5312
-asVtimestamp
-p5313
-V2017-11-30 11:05:14.051714
-p5314
-sV_context_timestamp
-p5315
-V2017-11-30 11:05:14.050485
-p5316
-sV_unique_id
-p5317
-V3930a7d32341484dae4cc250c5d705fa
-p5318
-sV_context_tenant_id
-p5319
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5320
-sV_context_project_name
-p5321
-Vapexlake
-p5322
-sV_context_user_identity
-p5323
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5324
-sV_context_tenant
-p5325
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5326
-sV_context_project_id
-p5327
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5328
-sV_context_read_only
-p5329
-I00
-sV_context_user_domain
-p5330
-NsV_context_user_name
-p5331
-Violie
-p5332
-stp5333
-a(F9.6502909660339355
-Vsecurity_group_rule.delete.end
-p5334
-(dp5335
-V_context_domain
-p5336
-NsV_context_request_id
-p5337
-Vreq-fa2fc107-a5c7-4e25-9d3a-a2a997f0ff3d
-p5338
-sVevent_type
-p5339
-g5334
-sV_context_auth_token
-p5340
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5341
-sV_context_resource_uuid
-p5342
-NsV_context_tenant_name
-p5343
-Vapexlake
-p5344
-sV_context_user_id
-p5345
-Vef7a4f67379f41aba489a0b6d6a62094
-p5346
-sVpayload
-p5347
-(dp5348
-Vsecurity_group_rule_id
-p5349
-V24b9daff-fa99-4319-88f9-0be6b52de0f7
-p5350
-ssV_context_show_deleted
-p5351
-I00
-sVpriority
-p5352
-VINFO
-p5353
-sV_context_is_admin
-p5354
-I01
-sV_context_project_domain
-p5355
-NsV_context_user
-p5356
-Vef7a4f67379f41aba489a0b6d6a62094
-p5357
-sVpublisher_id
-p5358
-Vnetwork.machine-A
-p5359
-sVmessage_id
-p5360
-V122bb3b1-5abb-4a7d-b2df-4feb09d340e7
-p5361
-sV_context_roles
-p5362
-(lp5363
-Vadmin
-p5364
-asVtimestamp
-p5365
-V2017-11-30 11:05:14.056517
-p5366
-sV_context_timestamp
-p5367
-V2017-11-30 11:05:14.030083
-p5368
-sV_unique_id
-p5369
-Va6c8419b6b6d4beabb630c6650395367
-p5370
-sV_context_tenant_id
-p5371
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5372
-sV_context_project_name
-p5373
-Vapexlake
-p5374
-sV_context_user_identity
-p5375
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5376
-sV_context_tenant
-p5377
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5378
-sV_context_project_id
-p5379
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5380
-sV_context_read_only
-p5381
-I00
-sV_context_user_domain
-p5382
-NsV_context_user_name
-p5383
-Violie
-p5384
-stp5385
-a(F9.6604850292205811
-Vsecurity_group_rule.delete.start
-p5386
-(dp5387
-V_context_domain
-p5388
-NsV_context_request_id
-p5389
-Vreq-efabe294-d675-4778-8067-07aa80e8ed10
-p5390
-sVevent_type
-p5391
-g5386
-sV_context_auth_token
-p5392
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5393
-sV_context_resource_uuid
-p5394
-NsV_context_tenant_name
-p5395
-Vapexlake
-p5396
-sV_context_user_id
-p5397
-Vef7a4f67379f41aba489a0b6d6a62094
-p5398
-sVpayload
-p5399
-(dp5400
-Vsecurity_group_rule_id
-p5401
-V3bcbc8bf-0ff4-4e7e-93e2-d59517d1d377
-p5402
-ssV_context_show_deleted
-p5403
-I00
-sVpriority
-p5404
-VINFO
-p5405
-sV_context_is_admin
-p5406
-I01
-sV_context_project_domain
-p5407
-NsV_context_user
-p5408
-Vef7a4f67379f41aba489a0b6d6a62094
-p5409
-sVpublisher_id
-p5410
-Vnetwork.machine-A
-p5411
-sVmessage_id
-p5412
-V727b7850-799c-443b-a029-e413d61a6ca0
-p5413
-sV_context_roles
-p5414
-(lp5415
-Vadmin
-p5416
-asVtimestamp
-p5417
-V2017-11-30 11:05:14.065745
-p5418
-sV_context_timestamp
-p5419
-V2017-11-30 11:05:14.064509
-p5420
-sV_unique_id
-p5421
-V1926a2f839c947cd9ff30d7ec37a8394
-p5422
-sV_context_tenant_id
-p5423
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5424
-sV_context_project_name
-p5425
-Vapexlake
-p5426
-sV_context_user_identity
-p5427
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5428
-sV_context_tenant
-p5429
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5430
-sV_context_project_id
-p5431
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5432
-sV_context_read_only
-p5433
-I00
-sV_context_user_domain
-p5434
-NsV_context_user_name
-p5435
-Violie
-p5436
-stp5437
-a(F9.6878020763397217
-Vsecurity_group_rule.delete.end
-p5438
-(dp5439
-V_context_domain
-p5440
-NsV_context_request_id
-p5441
-Vreq-efabe294-d675-4778-8067-07aa80e8ed10
-p5442
-sVevent_type
-p5443
-g5438
-sV_context_auth_token
-p5444
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5445
-sV_context_resource_uuid
-p5446
-NsV_context_tenant_name
-p5447
-Vapexlake
-p5448
-sV_context_user_id
-p5449
-Vef7a4f67379f41aba489a0b6d6a62094
-p5450
-sVpayload
-p5451
-(dp5452
-Vsecurity_group_rule_id
-p5453
-V3bcbc8bf-0ff4-4e7e-93e2-d59517d1d377
-p5454
-ssV_context_show_deleted
-p5455
-I00
-sVpriority
-p5456
-VINFO
-p5457
-sV_context_is_admin
-p5458
-I01
-sV_context_project_domain
-p5459
-NsV_context_user
-p5460
-Vef7a4f67379f41aba489a0b6d6a62094
-p5461
-sVpublisher_id
-p5462
-Vnetwork.machine-A
-p5463
-sVmessage_id
-p5464
-V8453baa5-693a-46ef-bd5f-02a13aca2797
-p5465
-sV_context_roles
-p5466
-(lp5467
-Vadmin
-p5468
-asVtimestamp
-p5469
-V2017-11-30 11:05:14.093796
-p5470
-sV_context_timestamp
-p5471
-V2017-11-30 11:05:14.064509
-p5472
-sV_unique_id
-p5473
-V042c4643906e4a36ba00f475f1e1f078
-p5474
-sV_context_tenant_id
-p5475
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5476
-sV_context_project_name
-p5477
-Vapexlake
-p5478
-sV_context_user_identity
-p5479
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5480
-sV_context_tenant
-p5481
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5482
-sV_context_project_id
-p5483
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5484
-sV_context_read_only
-p5485
-I00
-sV_context_user_domain
-p5486
-NsV_context_user_name
-p5487
-Violie
-p5488
-stp5489
-a(F9.6968350410461426
-Vsecurity_group_rule.delete.start
-p5490
-(dp5491
-V_context_domain
-p5492
-NsV_context_request_id
-p5493
-Vreq-d4c62211-8ce1-4878-91fb-3591fe1c11d1
-p5494
-sVevent_type
-p5495
-g5490
-sV_context_auth_token
-p5496
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5497
-sV_context_resource_uuid
-p5498
-NsV_context_tenant_name
-p5499
-Vapexlake
-p5500
-sV_context_user_id
-p5501
-Vef7a4f67379f41aba489a0b6d6a62094
-p5502
-sVpayload
-p5503
-(dp5504
-Vsecurity_group_rule_id
-p5505
-V9e28e6c6-9e72-4af4-adb1-9636ef06cce3
-p5506
-ssV_context_show_deleted
-p5507
-I00
-sVpriority
-p5508
-VINFO
-p5509
-sV_context_is_admin
-p5510
-I01
-sV_context_project_domain
-p5511
-NsV_context_user
-p5512
-Vef7a4f67379f41aba489a0b6d6a62094
-p5513
-sVpublisher_id
-p5514
-Vnetwork.machine-A
-p5515
-sVmessage_id
-p5516
-Vdea899c4-08d4-485d-8e25-fce7f943db4a
-p5517
-sV_context_roles
-p5518
-(lp5519
-Vadmin
-p5520
-asVtimestamp
-p5521
-V2017-11-30 11:05:14.102829
-p5522
-sV_context_timestamp
-p5523
-V2017-11-30 11:05:14.101787
-p5524
-sV_unique_id
-p5525
-V72f92877ba2f464b863b9ce69186e72f
-p5526
-sV_context_tenant_id
-p5527
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5528
-sV_context_project_name
-p5529
-Vapexlake
-p5530
-sV_context_user_identity
-p5531
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5532
-sV_context_tenant
-p5533
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5534
-sV_context_project_id
-p5535
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5536
-sV_context_read_only
-p5537
-I00
-sV_context_user_domain
-p5538
-NsV_context_user_name
-p5539
-Violie
-p5540
-stp5541
-a(F9.7236289978027344
-Vsecurity_group_rule.delete.end
-p5542
-(dp5543
-V_context_domain
-p5544
-NsV_context_request_id
-p5545
-Vreq-d4c62211-8ce1-4878-91fb-3591fe1c11d1
-p5546
-sVevent_type
-p5547
-g5542
-sV_context_auth_token
-p5548
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5549
-sV_context_resource_uuid
-p5550
-NsV_context_tenant_name
-p5551
-Vapexlake
-p5552
-sV_context_user_id
-p5553
-Vef7a4f67379f41aba489a0b6d6a62094
-p5554
-sVpayload
-p5555
-(dp5556
-Vsecurity_group_rule_id
-p5557
-V9e28e6c6-9e72-4af4-adb1-9636ef06cce3
-p5558
-ssV_context_show_deleted
-p5559
-I00
-sVpriority
-p5560
-VINFO
-p5561
-sV_context_is_admin
-p5562
-I01
-sV_context_project_domain
-p5563
-NsV_context_user
-p5564
-Vef7a4f67379f41aba489a0b6d6a62094
-p5565
-sVpublisher_id
-p5566
-Vnetwork.machine-A
-p5567
-sVmessage_id
-p5568
-V6c3c9c50-0b6c-4c1f-9568-7c54c5f2b254
-p5569
-sV_context_roles
-p5570
-(lp5571
-Vadmin
-p5572
-asVtimestamp
-p5573
-V2017-11-30 11:05:14.129464
-p5574
-sV_context_timestamp
-p5575
-V2017-11-30 11:05:14.101787
-p5576
-sV_unique_id
-p5577
-V85a25063965c45849e8373bd0b56ceea
-p5578
-sV_context_tenant_id
-p5579
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5580
-sV_context_project_name
-p5581
-Vapexlake
-p5582
-sV_context_user_identity
-p5583
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5584
-sV_context_tenant
-p5585
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5586
-sV_context_project_id
-p5587
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5588
-sV_context_read_only
-p5589
-I00
-sV_context_user_domain
-p5590
-NsV_context_user_name
-p5591
-Violie
-p5592
-stp5593
-a(F9.7330811023712158
-Vsecurity_group_rule.delete.start
-p5594
-(dp5595
-V_context_domain
-p5596
-NsV_context_request_id
-p5597
-Vreq-02c8b0a3-0f75-48a0-a418-4e40381a389e
-p5598
-sVevent_type
-p5599
-g5594
-sV_context_auth_token
-p5600
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5601
-sV_context_resource_uuid
-p5602
-NsV_context_tenant_name
-p5603
-Vapexlake
-p5604
-sV_context_user_id
-p5605
-Vef7a4f67379f41aba489a0b6d6a62094
-p5606
-sVpayload
-p5607
-(dp5608
-Vsecurity_group_rule_id
-p5609
-Va8594551-41d6-483f-9e84-502d7efdb508
-p5610
-ssV_context_show_deleted
-p5611
-I00
-sVpriority
-p5612
-VINFO
-p5613
-sV_context_is_admin
-p5614
-I01
-sV_context_project_domain
-p5615
-NsV_context_user
-p5616
-Vef7a4f67379f41aba489a0b6d6a62094
-p5617
-sVpublisher_id
-p5618
-Vnetwork.machine-A
-p5619
-sVmessage_id
-p5620
-V7ebb8a28-cde1-49f2-9935-314a527b1e0e
-p5621
-sV_context_roles
-p5622
-(lp5623
-Vadmin
-p5624
-asVtimestamp
-p5625
-V2017-11-30 11:05:14.138946
-p5626
-sV_context_timestamp
-p5627
-V2017-11-30 11:05:14.137872
-p5628
-sV_unique_id
-p5629
-Vad9a48a3600d4d2db25a2e61c3d6fe85
-p5630
-sV_context_tenant_id
-p5631
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5632
-sV_context_project_name
-p5633
-Vapexlake
-p5634
-sV_context_user_identity
-p5635
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5636
-sV_context_tenant
-p5637
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5638
-sV_context_project_id
-p5639
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5640
-sV_context_read_only
-p5641
-I00
-sV_context_user_domain
-p5642
-NsV_context_user_name
-p5643
-Violie
-p5644
-stp5645
-a(F9.7608790397644043
-Vsecurity_group_rule.delete.end
-p5646
-(dp5647
-V_context_domain
-p5648
-NsV_context_request_id
-p5649
-Vreq-02c8b0a3-0f75-48a0-a418-4e40381a389e
-p5650
-sVevent_type
-p5651
-g5646
-sV_context_auth_token
-p5652
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5653
-sV_context_resource_uuid
-p5654
-NsV_context_tenant_name
-p5655
-Vapexlake
-p5656
-sV_context_user_id
-p5657
-Vef7a4f67379f41aba489a0b6d6a62094
-p5658
-sVpayload
-p5659
-(dp5660
-Vsecurity_group_rule_id
-p5661
-Va8594551-41d6-483f-9e84-502d7efdb508
-p5662
-ssV_context_show_deleted
-p5663
-I00
-sVpriority
-p5664
-VINFO
-p5665
-sV_context_is_admin
-p5666
-I01
-sV_context_project_domain
-p5667
-NsV_context_user
-p5668
-Vef7a4f67379f41aba489a0b6d6a62094
-p5669
-sVpublisher_id
-p5670
-Vnetwork.machine-A
-p5671
-sVmessage_id
-p5672
-V5c00c91f-8771-45be-9c6c-851d2ca46160
-p5673
-sV_context_roles
-p5674
-(lp5675
-Vadmin
-p5676
-asVtimestamp
-p5677
-V2017-11-30 11:05:14.166734
-p5678
-sV_context_timestamp
-p5679
-V2017-11-30 11:05:14.137872
-p5680
-sV_unique_id
-p5681
-V3bfd73ca3b7a43eda8b623b0f81bb7fb
-p5682
-sV_context_tenant_id
-p5683
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5684
-sV_context_project_name
-p5685
-Vapexlake
-p5686
-sV_context_user_identity
-p5687
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5688
-sV_context_tenant
-p5689
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5690
-sV_context_project_id
-p5691
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5692
-sV_context_read_only
-p5693
-I00
-sV_context_user_domain
-p5694
-NsV_context_user_name
-p5695
-Violie
-p5696
-stp5697
-a(F9.7720470428466797
-Vsecurity_group_rule.delete.start
-p5698
-(dp5699
-V_context_domain
-p5700
-NsV_context_request_id
-p5701
-Vreq-768ec510-f7bf-47c9-aa5a-0b0c5f2f6639
-p5702
-sVevent_type
-p5703
-g5698
-sV_context_auth_token
-p5704
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5705
-sV_context_resource_uuid
-p5706
-NsV_context_tenant_name
-p5707
-Vapexlake
-p5708
-sV_context_user_id
-p5709
-Vef7a4f67379f41aba489a0b6d6a62094
-p5710
-sVpayload
-p5711
-(dp5712
-Vsecurity_group_rule_id
-p5713
-Vc58077c4-8041-488f-8095-d1876a284805
-p5714
-ssV_context_show_deleted
-p5715
-I00
-sVpriority
-p5716
-VINFO
-p5717
-sV_context_is_admin
-p5718
-I01
-sV_context_project_domain
-p5719
-NsV_context_user
-p5720
-Vef7a4f67379f41aba489a0b6d6a62094
-p5721
-sVpublisher_id
-p5722
-Vnetwork.machine-A
-p5723
-sVmessage_id
-p5724
-V743a753b-0fb4-4940-9ede-0476545bd456
-p5725
-sV_context_roles
-p5726
-(lp5727
-Vadmin
-p5728
-asVtimestamp
-p5729
-V2017-11-30 11:05:14.177415
-p5730
-sV_context_timestamp
-p5731
-V2017-11-30 11:05:14.175113
-p5732
-sV_unique_id
-p5733
-V537d0dc5dc1e4682b7cdfb95d84c3a30
-p5734
-sV_context_tenant_id
-p5735
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5736
-sV_context_project_name
-p5737
-Vapexlake
-p5738
-sV_context_user_identity
-p5739
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5740
-sV_context_tenant
-p5741
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5742
-sV_context_project_id
-p5743
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5744
-sV_context_read_only
-p5745
-I00
-sV_context_user_domain
-p5746
-NsV_context_user_name
-p5747
-Violie
-p5748
-stp5749
-a(F9.8130691051483154
-Vsecurity_group_rule.delete.end
-p5750
-(dp5751
-V_context_domain
-p5752
-NsV_context_request_id
-p5753
-Vreq-768ec510-f7bf-47c9-aa5a-0b0c5f2f6639
-p5754
-sVevent_type
-p5755
-g5750
-sV_context_auth_token
-p5756
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5757
-sV_context_resource_uuid
-p5758
-NsV_context_tenant_name
-p5759
-Vapexlake
-p5760
-sV_context_user_id
-p5761
-Vef7a4f67379f41aba489a0b6d6a62094
-p5762
-sVpayload
-p5763
-(dp5764
-Vsecurity_group_rule_id
-p5765
-Vc58077c4-8041-488f-8095-d1876a284805
-p5766
-ssV_context_show_deleted
-p5767
-I00
-sVpriority
-p5768
-VINFO
-p5769
-sV_context_is_admin
-p5770
-I01
-sV_context_project_domain
-p5771
-NsV_context_user
-p5772
-Vef7a4f67379f41aba489a0b6d6a62094
-p5773
-sVpublisher_id
-p5774
-Vnetwork.machine-A
-p5775
-sVmessage_id
-p5776
-V6d166fd4-c8c1-43c7-b51b-3c3a3a0f863b
-p5777
-sV_context_roles
-p5778
-(lp5779
-Vadmin
-p5780
-asVtimestamp
-p5781
-V2017-11-30 11:05:14.218211
-p5782
-sV_context_timestamp
-p5783
-V2017-11-30 11:05:14.175113
-p5784
-sV_unique_id
-p5785
-V9fa77c5b48904d918601b0958b5d7715
-p5786
-sV_context_tenant_id
-p5787
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5788
-sV_context_project_name
-p5789
-Vapexlake
-p5790
-sV_context_user_identity
-p5791
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5792
-sV_context_tenant
-p5793
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5794
-sV_context_project_id
-p5795
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5796
-sV_context_read_only
-p5797
-I00
-sV_context_user_domain
-p5798
-NsV_context_user_name
-p5799
-Violie
-p5800
-stp5801
-a(F9.8234670162200928
-Vsecurity_group.delete.start
-p5802
-(dp5803
-V_context_domain
-p5804
-NsV_context_request_id
-p5805
-Vreq-70cc671b-9998-40ae-9438-8466f951a701
-p5806
-sVevent_type
-p5807
-g5802
-sV_context_auth_token
-p5808
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5809
-sV_context_resource_uuid
-p5810
-NsV_context_tenant_name
-p5811
-Vapexlake
-p5812
-sV_context_user_id
-p5813
-Vef7a4f67379f41aba489a0b6d6a62094
-p5814
-sVpayload
-p5815
-(dp5816
-Vsecurity_group_id
-p5817
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p5818
-ssV_context_show_deleted
-p5819
-I00
-sVpriority
-p5820
-VINFO
-p5821
-sV_context_is_admin
-p5822
-I01
-sV_context_project_domain
-p5823
-NsV_context_user
-p5824
-Vef7a4f67379f41aba489a0b6d6a62094
-p5825
-sVpublisher_id
-p5826
-Vnetwork.machine-A
-p5827
-sVmessage_id
-p5828
-Vab0e7074-e4ba-4872-ab5e-f485ffc2b212
-p5829
-sV_context_roles
-p5830
-(lp5831
-Vadmin
-p5832
-asVtimestamp
-p5833
-V2017-11-30 11:05:14.229333
-p5834
-sV_context_timestamp
-p5835
-V2017-11-30 11:05:14.228148
-p5836
-sV_unique_id
-p5837
-Vd6910bf7277442f4b5396288ca37597c
-p5838
-sV_context_tenant_id
-p5839
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5840
-sV_context_project_name
-p5841
-Vapexlake
-p5842
-sV_context_user_identity
-p5843
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5844
-sV_context_tenant
-p5845
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5846
-sV_context_project_id
-p5847
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5848
-sV_context_read_only
-p5849
-I00
-sV_context_user_domain
-p5850
-NsV_context_user_name
-p5851
-Violie
-p5852
-stp5853
-a(F9.8696761131286621
-Vsecurity_group.delete.end
-p5854
-(dp5855
-V_context_domain
-p5856
-NsV_context_request_id
-p5857
-Vreq-70cc671b-9998-40ae-9438-8466f951a701
-p5858
-sVevent_type
-p5859
-g5854
-sV_context_auth_token
-p5860
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p5861
-sV_context_resource_uuid
-p5862
-NsV_context_tenant_name
-p5863
-Vapexlake
-p5864
-sV_context_user_id
-p5865
-Vef7a4f67379f41aba489a0b6d6a62094
-p5866
-sVpayload
-p5867
-(dp5868
-Vsecurity_group_id
-p5869
-V7e5f6b7d-017a-4bf1-9002-82e381ef06b5
-p5870
-ssV_context_show_deleted
-p5871
-I00
-sVpriority
-p5872
-VINFO
-p5873
-sV_context_is_admin
-p5874
-I01
-sV_context_project_domain
-p5875
-NsV_context_user
-p5876
-Vef7a4f67379f41aba489a0b6d6a62094
-p5877
-sVpublisher_id
-p5878
-Vnetwork.machine-A
-p5879
-sVmessage_id
-p5880
-Vf6b18361-2d40-4950-819a-40f3da5b29ca
-p5881
-sV_context_roles
-p5882
-(lp5883
-Vadmin
-p5884
-asVtimestamp
-p5885
-V2017-11-30 11:05:14.275121
-p5886
-sV_context_timestamp
-p5887
-V2017-11-30 11:05:14.228148
-p5888
-sV_unique_id
-p5889
-V9493dfcd431c4ec8a25f2bf7cdd3dd62
-p5890
-sV_context_tenant_id
-p5891
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5892
-sV_context_project_name
-p5893
-Vapexlake
-p5894
-sV_context_user_identity
-p5895
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5896
-sV_context_tenant
-p5897
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5898
-sV_context_project_id
-p5899
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5900
-sV_context_read_only
-p5901
-I00
-sV_context_user_domain
-p5902
-NsV_context_user_name
-p5903
-Violie
-p5904
-stp5905
-a(F9.9175021648406982
-Vfloatingip.delete.end
-p5906
-(dp5907
-V_context_domain
-p5908
-NsV_context_request_id
-p5909
-Vreq-0d358c54-4833-4386-a2d0-5d548ab34354
-p5910
-sVevent_type
-p5911
-g5906
-sV_context_auth_token
-p5912
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p5913
-sV_context_resource_uuid
-p5914
-NsV_context_tenant_name
-p5915
-Vapexlake
-p5916
-sV_context_user_id
-p5917
-Vef7a4f67379f41aba489a0b6d6a62094
-p5918
-sVpayload
-p5919
-(dp5920
-Vfloatingip_id
-p5921
-V3dce7c86-0999-469a-ad4e-a0dc609695cb
-p5922
-ssV_context_show_deleted
-p5923
-I00
-sVpriority
-p5924
-VINFO
-p5925
-sV_context_is_admin
-p5926
-I01
-sV_context_project_domain
-p5927
-NsV_context_user
-p5928
-Vef7a4f67379f41aba489a0b6d6a62094
-p5929
-sVpublisher_id
-p5930
-Vnetwork.machine-A
-p5931
-sVmessage_id
-p5932
-V3cb07861-73fb-4372-8166-0859b9e608cc
-p5933
-sV_context_roles
-p5934
-(lp5935
-Vadmin
-p5936
-asVtimestamp
-p5937
-V2017-11-30 11:05:14.323311
-p5938
-sV_context_timestamp
-p5939
-V2017-11-30 11:05:14.050485
-p5940
-sV_unique_id
-p5941
-Vb270350ac3734c12b7c366de600d5a5a
-p5942
-sV_context_tenant_id
-p5943
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5944
-sV_context_project_name
-p5945
-Vapexlake
-p5946
-sV_context_user_identity
-p5947
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p5948
-sV_context_tenant
-p5949
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5950
-sV_context_project_id
-p5951
-V187e5e95e7eb499d8a421b3d4ed966d5
-p5952
-sV_context_read_only
-p5953
-I00
-sV_context_user_domain
-p5954
-NsV_context_user_name
-p5955
-Violie
-p5956
-stp5957
-a(F10.107216119766235
-Vcompute.instance.update
-p5958
-(dp5959
-V_context_domain
-p5960
-NsV_context_request_id
-p5961
-Vreq-6dbda20b-4b44-4689-8d1e-ae656e39ecb8
-p5962
-sV_context_quota_class
-p5963
-NsVevent_type
-p5964
-g5958
-sV_context_service_catalog
-p5965
-(lp5966
-(dp5967
-Vendpoints
-p5968
-(lp5969
-(dp5970
-VadminURL
-p5971
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5972
-sVregion
-p5973
-VRegionOne
-p5974
-sVinternalURL
-p5975
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5976
-sVpublicURL
-p5977
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p5978
-sasVtype
-p5979
-Vvolume
-p5980
-sVname
-p5981
-Vcinder
-p5982
-sa(dp5983
-g5968
-(lp5984
-(dp5985
-g5971
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5986
-sg5973
-VRegionOne
-p5987
-sg5975
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5988
-sg5977
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p5989
-sasg5979
-Vvolumev2
-p5990
-sg5981
-Vcinderv2
-p5991
-sasV_context_auth_token
-p5992
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p5993
-sV_context_resource_uuid
-p5994
-NsV_context_user_id
-p5995
-Vef7a4f67379f41aba489a0b6d6a62094
-p5996
-sVpayload
-p5997
-(dp5998
-Vstate_description
-p5999
-Vdeleting
-p6000
-sVavailability_zone
-p6001
-Vnova
-p6002
-sVterminated_at
-p6003
-V
-sVephemeral_gb
-p6004
-I0
-sVinstance_type_id
-p6005
-I1
-sVbandwidth
-p6006
-(dp6007
-sVdeleted_at
-p6008
-V
-sVreservation_id
-p6009
-Vr-lypgovtc
-p6010
-sVmemory_mb
-p6011
-I4096
-sVdisplay_name
-p6012
-Vvm_test
-p6013
-sVhostname
-p6014
-Vvm-test
-p6015
-sVstate
-p6016
-Vactive
-p6017
-sVold_state
-p6018
-Vactive
-p6019
-sVprogress
-p6020
-V
-sVlaunched_at
-p6021
-V2017-11-30T11:04:15.000000
-p6022
-sVmetadata
-p6023
-(dp6024
-sVnode
-p6025
-Vmachine-E
-p6026
-sVramdisk_id
-p6027
-V
-sVaccess_ip_v6
-p6028
-NsVdisk_gb
-p6029
-I40
-sVaccess_ip_v4
-p6030
-NsVkernel_id
-p6031
-V
-sVhost
-p6032
-Vmachine-E
-p6033
-sVuser_id
-p6034
-Vef7a4f67379f41aba489a0b6d6a62094
-p6035
-sVimage_ref_url
-p6036
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p6037
-sVcell_name
-p6038
-V
-sVaudit_period_beginning
-p6039
-V2017-11-01T00:00:00.000000
-p6040
-sVroot_gb
-p6041
-I40
-sVtenant_id
-p6042
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6043
-sVcreated_at
-p6044
-V2017-11-30T11:04:05.000000
-p6045
-sVold_task_state
-p6046
-Vdeleting
-p6047
-sVinstance_id
-p6048
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p6049
-sVinstance_type
-p6050
-Vm1.medium
-p6051
-sVvcpus
-p6052
-I2
-sVimage_meta
-p6053
-(dp6054
-Vmin_disk
-p6055
-V40
-p6056
-sVcontainer_format
-p6057
-Vbare
-p6058
-sVmin_ram
-p6059
-V0
-sVdisk_format
-p6060
-Vqcow2
-p6061
-sVbase_image_ref
-p6062
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p6063
-ssVarchitecture
-p6064
-NsVnew_task_state
-p6065
-Vdeleting
-p6066
-sVaudit_period_ending
-p6067
-V2017-11-30T11:05:14.507610
-p6068
-sVos_type
-p6069
-NsVinstance_flavor_id
-p6070
-V3
-ssV_context_show_deleted
-p6071
-I00
-sVpriority
-p6072
-VINFO
-p6073
-sV_context_is_admin
-p6074
-I01
-sV_context_project_domain
-p6075
-NsV_context_user
-p6076
-Vef7a4f67379f41aba489a0b6d6a62094
-p6077
-sVpublisher_id
-p6078
-Vcompute.machine-A
-p6079
-sVmessage_id
-p6080
-V42b691a6-ab02-4e80-af71-777148fa5689
-p6081
-sV_context_remote_address
-p6082
-V172.16.0.5
-p6083
-sV_context_roles
-p6084
-(lp6085
-Vadmin
-p6086
-asVtimestamp
-p6087
-V2017-11-30 11:05:14.511592
-p6088
-sV_context_timestamp
-p6089
-V2017-11-30T11:05:14.421285
-p6090
-sV_unique_id
-p6091
-V9f6972c4ff8e491ca3136e8b69fd1d40
-p6092
-sV_context_project_name
-p6093
-Vapexlake
-p6094
-sV_context_read_deleted
-p6095
-Vno
-p6096
-sV_context_user_identity
-p6097
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6098
-sV_context_tenant
-p6099
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6100
-sV_context_instance_lock_checked
-p6101
-I00
-sV_context_project_id
-p6102
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6103
-sV_context_read_only
-p6104
-I00
-sV_context_user_domain
-p6105
-NsV_context_user_name
-p6106
-Violie
-p6107
-stp6108
-a(F10.138731002807617
-Vcompute.instance.delete.start
-p6109
-(dp6110
-V_context_domain
-p6111
-NsV_context_request_id
-p6112
-Vreq-6dbda20b-4b44-4689-8d1e-ae656e39ecb8
-p6113
-sV_context_quota_class
-p6114
-NsVevent_type
-p6115
-g6109
-sV_context_service_catalog
-p6116
-(lp6117
-(dp6118
-Vendpoints
-p6119
-(lp6120
-(dp6121
-VadminURL
-p6122
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6123
-sVregion
-p6124
-VRegionOne
-p6125
-sVinternalURL
-p6126
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6127
-sVpublicURL
-p6128
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6129
-sasVtype
-p6130
-Vvolume
-p6131
-sVname
-p6132
-Vcinder
-p6133
-sa(dp6134
-g6119
-(lp6135
-(dp6136
-g6122
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6137
-sg6124
-VRegionOne
-p6138
-sg6126
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6139
-sg6128
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6140
-sasg6130
-Vvolumev2
-p6141
-sg6132
-Vcinderv2
-p6142
-sasV_context_auth_token
-p6143
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p6144
-sV_context_resource_uuid
-p6145
-NsV_context_user_id
-p6146
-Vef7a4f67379f41aba489a0b6d6a62094
-p6147
-sVpayload
-p6148
-(dp6149
-Vstate_description
-p6150
-Vdeleting
-p6151
-sVavailability_zone
-p6152
-Vnova
-p6153
-sVterminated_at
-p6154
-V
-sVephemeral_gb
-p6155
-I0
-sVinstance_type_id
-p6156
-I1
-sVdeleted_at
-p6157
-V
-sVreservation_id
-p6158
-Vr-lypgovtc
-p6159
-sVmemory_mb
-p6160
-I4096
-sVdisplay_name
-p6161
-Vvm_test
-p6162
-sVhostname
-p6163
-Vvm-test
-p6164
-sVstate
-p6165
-Vactive
-p6166
-sVprogress
-p6167
-V
-sVlaunched_at
-p6168
-V2017-11-30T11:04:15.000000
-p6169
-sVmetadata
-p6170
-(dp6171
-sVnode
-p6172
-Vmachine-E
-p6173
-sVramdisk_id
-p6174
-V
-sVaccess_ip_v6
-p6175
-NsVdisk_gb
-p6176
-I40
-sVaccess_ip_v4
-p6177
-NsVkernel_id
-p6178
-V
-sVhost
-p6179
-Vmachine-E
-p6180
-sVuser_id
-p6181
-Vef7a4f67379f41aba489a0b6d6a62094
-p6182
-sVimage_ref_url
-p6183
-Vhttp://172.16.0.8:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p6184
-sVcell_name
-p6185
-V
-sVroot_gb
-p6186
-I40
-sVtenant_id
-p6187
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6188
-sVcreated_at
-p6189
-V2017-11-30T11:04:05.000000
-p6190
-sVinstance_id
-p6191
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p6192
-sVinstance_type
-p6193
-Vm1.medium
-p6194
-sVvcpus
-p6195
-I2
-sVimage_meta
-p6196
-(dp6197
-Vmin_disk
-p6198
-V40
-p6199
-sVcontainer_format
-p6200
-Vbare
-p6201
-sVmin_ram
-p6202
-V0
-sVdisk_format
-p6203
-Vqcow2
-p6204
-sVbase_image_ref
-p6205
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p6206
-ssVarchitecture
-p6207
-NsVos_type
-p6208
-NsVinstance_flavor_id
-p6209
-V3
-ssV_context_show_deleted
-p6210
-I00
-sVpriority
-p6211
-VINFO
-p6212
-sV_context_is_admin
-p6213
-I01
-sV_context_project_domain
-p6214
-NsV_context_user
-p6215
-Vef7a4f67379f41aba489a0b6d6a62094
-p6216
-sVpublisher_id
-p6217
-Vcompute.machine-E
-p6218
-sVmessage_id
-p6219
-Vd735c3ea-93ca-4d00-a774-5d3e06eca65f
-p6220
-sV_context_remote_address
-p6221
-V172.16.0.5
-p6222
-sV_context_roles
-p6223
-(lp6224
-Vadmin
-p6225
-asVtimestamp
-p6226
-V2017-11-30 11:05:14.543859
-p6227
-sV_context_timestamp
-p6228
-V2017-11-30T11:05:14.421285
-p6229
-sV_unique_id
-p6230
-V86e8379b0b5d4fdda65425ab275ed6fc
-p6231
-sV_context_project_name
-p6232
-Vapexlake
-p6233
-sV_context_read_deleted
-p6234
-Vno
-p6235
-sV_context_user_identity
-p6236
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6237
-sV_context_tenant
-p6238
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6239
-sV_context_instance_lock_checked
-p6240
-I00
-sV_context_project_id
-p6241
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6242
-sV_context_read_only
-p6243
-I00
-sV_context_user_domain
-p6244
-NsV_context_user_name
-p6245
-Violie
-p6246
-stp6247
-a(F10.143251180648804
-Vcompute.instance.shutdown.start
-p6248
-(dp6249
-V_context_domain
-p6250
-NsV_context_request_id
-p6251
-Vreq-6dbda20b-4b44-4689-8d1e-ae656e39ecb8
-p6252
-sV_context_quota_class
-p6253
-NsVevent_type
-p6254
-g6248
-sV_context_service_catalog
-p6255
-(lp6256
-(dp6257
-Vendpoints
-p6258
-(lp6259
-(dp6260
-VadminURL
-p6261
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6262
-sVregion
-p6263
-VRegionOne
-p6264
-sVinternalURL
-p6265
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6266
-sVpublicURL
-p6267
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6268
-sasVtype
-p6269
-Vvolume
-p6270
-sVname
-p6271
-Vcinder
-p6272
-sa(dp6273
-g6258
-(lp6274
-(dp6275
-g6261
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6276
-sg6263
-VRegionOne
-p6277
-sg6265
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6278
-sg6267
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6279
-sasg6269
-Vvolumev2
-p6280
-sg6271
-Vcinderv2
-p6281
-sasV_context_auth_token
-p6282
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p6283
-sV_context_resource_uuid
-p6284
-NsV_context_user_id
-p6285
-Vef7a4f67379f41aba489a0b6d6a62094
-p6286
-sVpayload
-p6287
-(dp6288
-Vstate_description
-p6289
-Vdeleting
-p6290
-sVavailability_zone
-p6291
-Vnova
-p6292
-sVterminated_at
-p6293
-V
-sVephemeral_gb
-p6294
-I0
-sVinstance_type_id
-p6295
-I1
-sVdeleted_at
-p6296
-V
-sVreservation_id
-p6297
-Vr-lypgovtc
-p6298
-sVmemory_mb
-p6299
-I4096
-sVdisplay_name
-p6300
-Vvm_test
-p6301
-sVhostname
-p6302
-Vvm-test
-p6303
-sVstate
-p6304
-Vactive
-p6305
-sVprogress
-p6306
-V
-sVlaunched_at
-p6307
-V2017-11-30T11:04:15.000000
-p6308
-sVmetadata
-p6309
-(dp6310
-sVnode
-p6311
-Vmachine-E
-p6312
-sVramdisk_id
-p6313
-V
-sVaccess_ip_v6
-p6314
-NsVdisk_gb
-p6315
-I40
-sVaccess_ip_v4
-p6316
-NsVkernel_id
-p6317
-V
-sVhost
-p6318
-Vmachine-E
-p6319
-sVuser_id
-p6320
-Vef7a4f67379f41aba489a0b6d6a62094
-p6321
-sVimage_ref_url
-p6322
-Vhttp://172.16.0.8:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p6323
-sVcell_name
-p6324
-V
-sVroot_gb
-p6325
-I40
-sVtenant_id
-p6326
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6327
-sVcreated_at
-p6328
-V2017-11-30T11:04:05.000000
-p6329
-sVinstance_id
-p6330
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p6331
-sVinstance_type
-p6332
-Vm1.medium
-p6333
-sVvcpus
-p6334
-I2
-sVimage_meta
-p6335
-(dp6336
-Vmin_disk
-p6337
-V40
-p6338
-sVcontainer_format
-p6339
-Vbare
-p6340
-sVmin_ram
-p6341
-V0
-sVdisk_format
-p6342
-Vqcow2
-p6343
-sVbase_image_ref
-p6344
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p6345
-ssVarchitecture
-p6346
-NsVos_type
-p6347
-NsVinstance_flavor_id
-p6348
-V3
-ssV_context_show_deleted
-p6349
-I00
-sVpriority
-p6350
-VINFO
-p6351
-sV_context_is_admin
-p6352
-I01
-sV_context_project_domain
-p6353
-NsV_context_user
-p6354
-Vef7a4f67379f41aba489a0b6d6a62094
-p6355
-sVpublisher_id
-p6356
-Vcompute.machine-E
-p6357
-sVmessage_id
-p6358
-Vf25e2981-4207-4a6c-8acd-6bf059590b9c
-p6359
-sV_context_remote_address
-p6360
-V172.16.0.5
-p6361
-sV_context_roles
-p6362
-(lp6363
-Vadmin
-p6364
-asVtimestamp
-p6365
-V2017-11-30 11:05:14.549258
-p6366
-sV_context_timestamp
-p6367
-V2017-11-30T11:05:14.421285
-p6368
-sV_unique_id
-p6369
-Va777954df23e4a189c341d69efa791de
-p6370
-sV_context_project_name
-p6371
-Vapexlake
-p6372
-sV_context_read_deleted
-p6373
-Vno
-p6374
-sV_context_user_identity
-p6375
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6376
-sV_context_tenant
-p6377
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6378
-sV_context_instance_lock_checked
-p6379
-I00
-sV_context_project_id
-p6380
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6381
-sV_context_read_only
-p6382
-I00
-sV_context_user_domain
-p6383
-NsV_context_user_name
-p6384
-Violie
-p6385
-stp6386
-a(F11.166565179824829
-Vorchestration.stack.delete.end
-p6387
-(dp6388
-V_context_request_id
-p6389
-Vreq-c1cb724f-f9a9-45c1-852a-52eb4bb5a570
-p6390
-sVevent_type
-p6391
-g6387
-sV_context_region_name
-p6392
-NsV_context_auth_token
-p6393
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p6394
-sV_context_user_id
-p6395
-Vef7a4f67379f41aba489a0b6d6a62094
-p6396
-sVpayload
-p6397
-(dp6398
-Vusername
-p6399
-NsVstate_reason
-p6400
-VStack DELETE completed successfully
-p6401
-sVuser_id
-p6402
-NsVuser_identity
-p6403
-Vef7a4f67379f41aba489a0b6d6a62094
-p6404
-sVstack_name
-p6405
-VB
-sVtenant_id
-p6406
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6407
-sVstack_identity
-p6408
-V4166ecad-7e96-49c6-86e3-f0bab0e0bfec
-p6409
-sVcreate_at
-p6410
-V2017-11-30T11:03:56
-p6411
-sVstate
-p6412
-VDELETE_COMPLETE
-p6413
-ssV_context_username
-p6414
-NsV_context_show_deleted
-p6415
-I00
-sV_context_trust_id
-p6416
-NsVpriority
-p6417
-VINFO
-p6418
-sV_context_is_admin
-p6419
-I01
-sV_context_auth_token_info
-p6420
-(dp6421
-Vtoken
-p6422
-(dp6423
-Vmethods
-p6424
-(lp6425
-Vpassword
-p6426
-asVroles
-p6427
-(lp6428
-(dp6429
-Vid
-p6430
-Vd475171bf8304e06a74b1add560b1f28
-p6431
-sVname
-p6432
-Vadmin
-p6433
-sasVauth_token
-p6434
-VgAAAAABaH-Xk04bdGgZC5KmoZhSqJDX_q7ZF4Pup46bIdzfHUuf7_e6xtUshNFEGmFuxe1E1Ily292vW-ETzhHn5BtWoN6gtDKclSIbmneHS8cnoxukkvXqMkOez4OFSwUvAF3A4SMOcSPddsR_OYPpJhPI2lEW6-b7gnp4mRihO5YxbMauln6Y
-p6435
-sVexpires_at
-p6436
-V2017-11-30T12:05:08.000000Z
-p6437
-sVproject
-p6438
-(dp6439
-Vdomain
-p6440
-(dp6441
-g6430
-Vdefault
-p6442
-sg6432
-VDefault
-p6443
-ssg6430
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6444
-sg6432
-Vapexlake
-p6445
-ssVcatalog
-p6446
-(lp6447
-(dp6448
-Vendpoints
-p6449
-(lp6450
-(dp6451
-Vurl
-p6452
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p6453
-sVinterface
-p6454
-Vpublic
-p6455
-sVregion
-p6456
-VRegionOne
-p6457
-sVregion_id
-p6458
-VRegionOne
-p6459
-sg6430
-V13359d68397c4732b5d455941ac95989
-p6460
-sa(dp6461
-g6452
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p6462
-sg6454
-Vinternal
-p6463
-sg6456
-VRegionOne
-p6464
-sg6458
-VRegionOne
-p6465
-sg6430
-V50aeae6c5d034dcb80871bdac7391209
-p6466
-sa(dp6467
-g6452
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p6468
-sg6454
-Vadmin
-p6469
-sg6456
-VRegionOne
-p6470
-sg6458
-VRegionOne
-p6471
-sg6430
-V93b06f780b224cbd9b514c2041d3db63
-p6472
-sasVtype
-p6473
-Vvolumev3
-p6474
-sg6430
-V00a63293a3154089a4c80b60b4aa9429
-p6475
-sg6432
-Vcinderv3
-p6476
-sa(dp6477
-g6449
-(lp6478
-(dp6479
-g6452
-Vhttp://172.16.0.5:8000/v1
-p6480
-sg6454
-Vadmin
-p6481
-sg6456
-VRegionOne
-p6482
-sg6458
-VRegionOne
-p6483
-sg6430
-V24acffb5d9154df4981db7424b7669bd
-p6484
-sa(dp6485
-g6452
-Vhttp://172.18.0.8:8000/v1
-p6486
-sg6454
-Vpublic
-p6487
-sg6456
-VRegionOne
-p6488
-sg6458
-VRegionOne
-p6489
-sg6430
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p6490
-sa(dp6491
-g6452
-Vhttp://172.16.0.5:8000/v1
-p6492
-sg6454
-Vinternal
-p6493
-sg6456
-VRegionOne
-p6494
-sg6458
-VRegionOne
-p6495
-sg6430
-V679262173a714d76a078051b95f8c969
-p6496
-sasg6473
-Vcloudformation
-p6497
-sg6430
-V245169ccae564a7db06ca002f1553b51
-p6498
-sg6432
-Vheat-cfn
-p6499
-sa(dp6500
-g6449
-(lp6501
-(dp6502
-g6452
-Vhttp://172.18.0.8:8080
-p6503
-sg6454
-Vpublic
-p6504
-sg6456
-VRegionOne
-p6505
-sg6458
-VRegionOne
-p6506
-sg6430
-V04a6ef3db6b046b1893ed45a3f906f6c
-p6507
-sa(dp6508
-g6452
-Vhttp://172.16.0.5:8080
-p6509
-sg6454
-Vinternal
-p6510
-sg6456
-VRegionOne
-p6511
-sg6458
-VRegionOne
-p6512
-sg6430
-V3e30684c9f74492b8ca9a64dd04261e6
-p6513
-sa(dp6514
-g6452
-Vhttp://172.16.0.5:8080
-p6515
-sg6454
-Vadmin
-p6516
-sg6456
-VRegionOne
-p6517
-sg6458
-VRegionOne
-p6518
-sg6430
-Vc5384b55cd7a441582f151c6b2807745
-p6519
-sasg6473
-Vs3
-p6520
-sg6430
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p6521
-sg6432
-Vswift_s3
-p6522
-sa(dp6523
-g6449
-(lp6524
-(dp6525
-g6452
-Vhttp://172.16.0.5:9696
-p6526
-sg6454
-Vadmin
-p6527
-sg6456
-VRegionOne
-p6528
-sg6458
-VRegionOne
-p6529
-sg6430
-V38b78b2c00264f59a4ade9392f88132b
-p6530
-sa(dp6531
-g6452
-Vhttp://172.18.0.8:9696
-p6532
-sg6454
-Vpublic
-p6533
-sg6456
-VRegionOne
-p6534
-sg6458
-VRegionOne
-p6535
-sg6430
-Vb5d0f72fbf674f84adf8929341e45586
-p6536
-sa(dp6537
-g6452
-Vhttp://172.16.0.5:9696
-p6538
-sg6454
-Vinternal
-p6539
-sg6456
-VRegionOne
-p6540
-sg6458
-VRegionOne
-p6541
-sg6430
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p6542
-sasg6473
-Vnetwork
-p6543
-sg6430
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p6544
-sg6432
-Vneutron
-p6545
-sa(dp6546
-g6449
-(lp6547
-(dp6548
-g6452
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6549
-sg6454
-Vinternal
-p6550
-sg6456
-VRegionOne
-p6551
-sg6458
-VRegionOne
-p6552
-sg6430
-V7c60744a22724044a92928bc2fa9e422
-p6553
-sa(dp6554
-g6452
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6555
-sg6454
-Vadmin
-p6556
-sg6456
-VRegionOne
-p6557
-sg6458
-VRegionOne
-p6558
-sg6430
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p6559
-sa(dp6560
-g6452
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6561
-sg6454
-Vpublic
-p6562
-sg6456
-VRegionOne
-p6563
-sg6458
-VRegionOne
-p6564
-sg6430
-Vde47d994bdc147bdb824474ea699a77a
-p6565
-sasg6473
-Vorchestration
-p6566
-sg6430
-V65a72244f7c54382aeebf5dfdeab8140
-p6567
-sg6432
-Vheat
-p6568
-sa(dp6569
-g6449
-(lp6570
-(dp6571
-g6452
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6572
-sg6454
-Vinternal
-p6573
-sg6456
-VRegionOne
-p6574
-sg6458
-VRegionOne
-p6575
-sg6430
-V3a25e85ecaa44b678c3721c2d3d39b38
-p6576
-sa(dp6577
-g6452
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6578
-sg6454
-Vadmin
-p6579
-sg6456
-VRegionOne
-p6580
-sg6458
-VRegionOne
-p6581
-sg6430
-V68c763474c3d4aa28c4ee0e0249998eb
-p6582
-sa(dp6583
-g6452
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6584
-sg6454
-Vpublic
-p6585
-sg6456
-VRegionOne
-p6586
-sg6458
-VRegionOne
-p6587
-sg6430
-Ve0c861373e94468db521d5a8793d33d1
-p6588
-sasg6473
-Vvolume
-p6589
-sg6430
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p6590
-sg6432
-Vcinder
-p6591
-sa(dp6592
-g6449
-(lp6593
-(dp6594
-g6452
-Vhttp://172.18.0.8:5000/v2.0
-p6595
-sg6454
-Vpublic
-p6596
-sg6456
-VRegionOne
-p6597
-sg6458
-VRegionOne
-p6598
-sg6430
-V6aa35bc15a35447db58ec5b67087f96a
-p6599
-sa(dp6600
-g6452
-Vhttp://172.16.0.5:5000/v2.0
-p6601
-sg6454
-Vinternal
-p6602
-sg6456
-VRegionOne
-p6603
-sg6458
-VRegionOne
-p6604
-sg6430
-V6b4742f26b694b93bdbcb37304d22f69
-p6605
-sa(dp6606
-g6452
-Vhttp://172.16.0.5:35357/v2.0
-p6607
-sg6454
-Vadmin
-p6608
-sg6456
-VRegionOne
-p6609
-sg6458
-VRegionOne
-p6610
-sg6430
-Vadc120ea606644a299a3c91a7ceeb8c4
-p6611
-sasg6473
-Videntity
-p6612
-sg6430
-V9f95de9f4efc4730b4dd90354894e1dc
-p6613
-sg6432
-Vkeystone
-p6614
-sa(dp6615
-g6449
-(lp6616
-(dp6617
-g6452
-Vhttp://172.16.0.5:9292
-p6618
-sg6454
-Vadmin
-p6619
-sg6456
-VRegionOne
-p6620
-sg6458
-VRegionOne
-p6621
-sg6430
-V049519f829be4e7fb5f44ae9f470efdf
-p6622
-sa(dp6623
-g6452
-Vhttp://172.18.0.8:9292
-p6624
-sg6454
-Vpublic
-p6625
-sg6456
-VRegionOne
-p6626
-sg6458
-VRegionOne
-p6627
-sg6430
-V1baebbbf35744192b335f4f293d1a9d8
-p6628
-sa(dp6629
-g6452
-Vhttp://172.16.0.5:9292
-p6630
-sg6454
-Vinternal
-p6631
-sg6456
-VRegionOne
-p6632
-sg6458
-VRegionOne
-p6633
-sg6430
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p6634
-sasg6473
-Vimage
-p6635
-sg6430
-Va39ec0213acc45ceb59346299e78d6c0
-p6636
-sg6432
-Vglance
-p6637
-sa(dp6638
-g6449
-(lp6639
-(dp6640
-g6452
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6641
-sg6454
-Vinternal
-p6642
-sg6456
-VRegionOne
-p6643
-sg6458
-VRegionOne
-p6644
-sg6430
-V2cd9d66e95484830a9006177e301aa57
-p6645
-sa(dp6646
-g6452
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6647
-sg6454
-Vpublic
-p6648
-sg6456
-VRegionOne
-p6649
-sg6458
-VRegionOne
-p6650
-sg6430
-Vbe2d979150a2401b9e7d5c365372d093
-p6651
-sa(dp6652
-g6452
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6653
-sg6454
-Vadmin
-p6654
-sg6456
-VRegionOne
-p6655
-sg6458
-VRegionOne
-p6656
-sg6430
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p6657
-sasg6473
-Vcompute_legacy
-p6658
-sg6430
-Va4dd95e3fde340468f8c1d7df9a853d0
-p6659
-sg6432
-Vcompute_legacy
-p6660
-sa(dp6661
-g6449
-(lp6662
-(dp6663
-g6452
-Vhttp://172.16.0.5:8774/v2.1
-p6664
-sg6454
-Vadmin
-p6665
-sg6456
-VRegionOne
-p6666
-sg6458
-VRegionOne
-p6667
-sg6430
-V0307d2c32dd54839aa5bc39746eeb186
-p6668
-sa(dp6669
-g6452
-Vhttp://172.18.0.8:8774/v2.1
-p6670
-sg6454
-Vpublic
-p6671
-sg6456
-VRegionOne
-p6672
-sg6458
-VRegionOne
-p6673
-sg6430
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p6674
-sa(dp6675
-g6452
-Vhttp://172.16.0.5:8774/v2.1
-p6676
-sg6454
-Vinternal
-p6677
-sg6456
-VRegionOne
-p6678
-sg6458
-VRegionOne
-p6679
-sg6430
-Vdb005ab592334fc599c142cf861e754f
-p6680
-sasg6473
-Vcompute
-p6681
-sg6430
-Vc165d40b8c3849bcb6067a3df2540c62
-p6682
-sg6432
-Vnova
-p6683
-sa(dp6684
-g6449
-(lp6685
-(dp6686
-g6452
-Vhttp://172.16.0.5:8080/swift/v1
-p6687
-sg6454
-Vadmin
-p6688
-sg6456
-VRegionOne
-p6689
-sg6458
-VRegionOne
-p6690
-sg6430
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p6691
-sa(dp6692
-g6452
-Vhttp://172.16.0.5:8080/swift/v1
-p6693
-sg6454
-Vinternal
-p6694
-sg6456
-VRegionOne
-p6695
-sg6458
-VRegionOne
-p6696
-sg6430
-V764118d3a33444ac980632d281acf4a7
-p6697
-sa(dp6698
-g6452
-Vhttp://172.18.0.8:8080/swift/v1
-p6699
-sg6454
-Vpublic
-p6700
-sg6456
-VRegionOne
-p6701
-sg6458
-VRegionOne
-p6702
-sg6430
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p6703
-sasg6473
-Vobject-store
-p6704
-sg6430
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p6705
-sg6432
-Vswift
-p6706
-sa(dp6707
-g6449
-(lp6708
-(dp6709
-g6452
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6710
-sg6454
-Vinternal
-p6711
-sg6456
-VRegionOne
-p6712
-sg6458
-VRegionOne
-p6713
-sg6430
-V61ea745c91ab4eb59464679931219024
-p6714
-sa(dp6715
-g6452
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6716
-sg6454
-Vadmin
-p6717
-sg6456
-VRegionOne
-p6718
-sg6458
-VRegionOne
-p6719
-sg6430
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p6720
-sa(dp6721
-g6452
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6722
-sg6454
-Vpublic
-p6723
-sg6456
-VRegionOne
-p6724
-sg6458
-VRegionOne
-p6725
-sg6430
-V7155772851884dc6954c7345d350796f
-p6726
-sasg6473
-Vvolumev2
-p6727
-sg6430
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p6728
-sg6432
-Vcinderv2
-p6729
-sa(dp6730
-g6449
-(lp6731
-(dp6732
-g6452
-Vhttp://172.18.0.8:9494
-p6733
-sg6454
-Vpublic
-p6734
-sg6456
-VRegionOne
-p6735
-sg6458
-VRegionOne
-p6736
-sg6430
-V43a202e889694d51a3b11899c252a8a9
-p6737
-sa(dp6738
-g6452
-Vhttp://172.16.0.5:9494
-p6739
-sg6454
-Vadmin
-p6740
-sg6456
-VRegionOne
-p6741
-sg6458
-VRegionOne
-p6742
-sg6430
-Vfa3c9de06e854542b236aa24b53e19a1
-p6743
-sa(dp6744
-g6452
-Vhttp://172.16.0.5:9494
-p6745
-sg6454
-Vinternal
-p6746
-sg6456
-VRegionOne
-p6747
-sg6458
-VRegionOne
-p6748
-sg6430
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p6749
-sasg6473
-Vartifact
-p6750
-sg6430
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p6751
-sg6432
-Vglare
-p6752
-sasVversion
-p6753
-Vv3
-p6754
-sVuser
-p6755
-(dp6756
-g6440
-(dp6757
-g6430
-Vdefault
-p6758
-sg6432
-VDefault
-p6759
-ssg6430
-Vef7a4f67379f41aba489a0b6d6a62094
-p6760
-sg6432
-Violie
-p6761
-ssVaudit_ids
-p6762
-(lp6763
-VjaR3K510SNyUdFi1DAdnxw
-p6764
-asVissued_at
-p6765
-V2017-11-30T11:05:08.000000Z
-p6766
-sssV_context_user
-p6767
-NsVpublisher_id
-p6768
-Vorchestration.machine-A
-p6769
-sVmessage_id
-p6770
-Ve4145fa9-13e2-4116-a67e-ad4dd7c176bf
-p6771
-sV_context_roles
-p6772
-(lp6773
-Vadmin
-p6774
-asV_context_auth_url
-p6775
-Vhttp://172.16.0.5:35357/v3/
-p6776
-sVtimestamp
-p6777
-V2017-11-30 11:05:15.569811
-p6778
-sV_unique_id
-p6779
-V24be4cadc5174c858cee93221a7623b0
-p6780
-sV_context_tenant_id
-p6781
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6782
-sV_context_user_domain_id
-p6783
-Vdefault
-p6784
-sV_context_password
-p6785
-NsV_context_trustor_user_id
-p6786
-NsV_context_project_domain_id
-p6787
-Vdefault
-p6788
-sV_context_aws_creds
-p6789
-NsV_context_tenant
-p6790
-Vapexlake
-p6791
-sV_context_user_identity
-p6792
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p6793
-stp6794
-a(F12.916676044464111
-Vcompute.instance.update
-p6795
-(dp6796
-V_context_domain
-p6797
-NsV_context_request_id
-p6798
-Vreq-6dbda20b-4b44-4689-8d1e-ae656e39ecb8
-p6799
-sV_context_quota_class
-p6800
-NsVevent_type
-p6801
-g6795
-sV_context_service_catalog
-p6802
-(lp6803
-(dp6804
-Vendpoints
-p6805
-(lp6806
-(dp6807
-VadminURL
-p6808
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6809
-sVregion
-p6810
-VRegionOne
-p6811
-sVinternalURL
-p6812
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6813
-sVpublicURL
-p6814
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p6815
-sasVtype
-p6816
-Vvolume
-p6817
-sVname
-p6818
-Vcinder
-p6819
-sa(dp6820
-g6805
-(lp6821
-(dp6822
-g6808
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6823
-sg6810
-VRegionOne
-p6824
-sg6812
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6825
-sg6814
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p6826
-sasg6816
-Vvolumev2
-p6827
-sg6818
-Vcinderv2
-p6828
-sasV_context_auth_token
-p6829
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p6830
-sV_context_resource_uuid
-p6831
-NsV_context_user_id
-p6832
-Vef7a4f67379f41aba489a0b6d6a62094
-p6833
-sVpayload
-p6834
-(dp6835
-Vstate_description
-p6836
-Vdeleting
-p6837
-sVavailability_zone
-p6838
-Vnova
-p6839
-sVterminated_at
-p6840
-V
-sVephemeral_gb
-p6841
-I0
-sVinstance_type_id
-p6842
-I1
-sVbandwidth
-p6843
-(dp6844
-sVdeleted_at
-p6845
-V
-sVreservation_id
-p6846
-Vr-lypgovtc
-p6847
-sVmemory_mb
-p6848
-I4096
-sVdisplay_name
-p6849
-Vvm_test
-p6850
-sVhostname
-p6851
-Vvm-test
-p6852
-sVstate
-p6853
-Vactive
-p6854
-sVold_state
-p6855
-Vactive
-p6856
-sVprogress
-p6857
-V
-sVlaunched_at
-p6858
-V2017-11-30T11:04:15.000000
-p6859
-sVmetadata
-p6860
-(dp6861
-sVnode
-p6862
-Vmachine-E
-p6863
-sVramdisk_id
-p6864
-V
-sVaccess_ip_v6
-p6865
-NsVdisk_gb
-p6866
-I40
-sVaccess_ip_v4
-p6867
-NsVkernel_id
-p6868
-V
-sVhost
-p6869
-Vmachine-E
-p6870
-sVuser_id
-p6871
-Vef7a4f67379f41aba489a0b6d6a62094
-p6872
-sVimage_ref_url
-p6873
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p6874
-sVcell_name
-p6875
-V
-sVaudit_period_beginning
-p6876
-V2017-11-01T00:00:00.000000
-p6877
-sVroot_gb
-p6878
-I40
-sVtenant_id
-p6879
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6880
-sVcreated_at
-p6881
-V2017-11-30T11:04:05.000000
-p6882
-sVold_task_state
-p6883
-Vdeleting
-p6884
-sVinstance_id
-p6885
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p6886
-sVinstance_type
-p6887
-Vm1.medium
-p6888
-sVvcpus
-p6889
-I2
-sVimage_meta
-p6890
-(dp6891
-Vmin_disk
-p6892
-V40
-p6893
-sVcontainer_format
-p6894
-Vbare
-p6895
-sVmin_ram
-p6896
-V0
-sVdisk_format
-p6897
-Vqcow2
-p6898
-sVbase_image_ref
-p6899
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p6900
-ssVarchitecture
-p6901
-NsVnew_task_state
-p6902
-Vdeleting
-p6903
-sVaudit_period_ending
-p6904
-V2017-11-30T11:05:17.316331
-p6905
-sVos_type
-p6906
-NsVinstance_flavor_id
-p6907
-V3
-ssV_context_show_deleted
-p6908
-I00
-sVpriority
-p6909
-VINFO
-p6910
-sV_context_is_admin
-p6911
-I01
-sV_context_project_domain
-p6912
-NsV_context_user
-p6913
-Vef7a4f67379f41aba489a0b6d6a62094
-p6914
-sVpublisher_id
-p6915
-Vcompute.machine-A
-p6916
-sVmessage_id
-p6917
-V3ec24e51-9694-4690-a620-2c66efb49098
-p6918
-sV_context_remote_address
-p6919
-V172.16.0.5
-p6920
-sV_context_roles
-p6921
-(lp6922
-Vadmin
-p6923
-asVtimestamp
-p6924
-V2017-11-30 11:05:17.321379
-p6925
-sV_context_timestamp
-p6926
-V2017-11-30T11:05:14.421285
-p6927
-sV_unique_id
-p6928
-Vd35bd09f479340909d1c776be6c1ed25
-p6929
-sV_context_project_name
-p6930
-Vapexlake
-p6931
-sV_context_read_deleted
-p6932
-Vno
-p6933
-sV_context_user_identity
-p6934
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p6935
-sV_context_tenant
-p6936
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6937
-sV_context_instance_lock_checked
-p6938
-I00
-sV_context_project_id
-p6939
-V187e5e95e7eb499d8a421b3d4ed966d5
-p6940
-sV_context_read_only
-p6941
-I00
-sV_context_user_domain
-p6942
-NsV_context_user_name
-p6943
-Violie
-p6944
-stp6945
-a(F12.962507009506226
-Vport.update.start
-p6946
-(dp6947
-V_context_domain
-p6948
-NsV_context_request_id
-p6949
-Vreq-e5fd3bf1-ef04-4b22-a5d8-c9580280f397
-p6950
-sVevent_type
-p6951
-g6946
-sV_context_auth_token
-p6952
-VgAAAAABaH-BHmi0xZ8F_W1g5ZW6qzDLFsbbMBKtL4OMu5BHvR62oZ2EMKhbFia9wxarzCdtKDak95Qe0fOcEwwPVZLIaXCzG0uKzvM9_1AszHCsDf2g6jiGte2hJPIBQ-FNMri44srNkNqaZWQnZMQadXbwFzNfiig_1PEv4b_8Jf0lo3aKKbA4
-p6953
-sV_context_resource_uuid
-p6954
-NsV_context_tenant_name
-p6955
-Vservices
-p6956
-sV_context_user_id
-p6957
-V84faafdbb77b40c9a73047fdebb0ab45
-p6958
-sVpayload
-p6959
-(dp6960
-Vport
-p6961
-(dp6962
-Vbinding:profile
-p6963
-(dp6964
-sVdevice_owner
-p6965
-V
-sVdns_name
-p6966
-V
-sVbinding:host_id
-p6967
-NsVdevice_id
-p6968
-V
-ssVid
-p6969
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p6970
-ssV_context_show_deleted
-p6971
-I00
-sVpriority
-p6972
-VINFO
-p6973
-sV_context_is_admin
-p6974
-I01
-sV_context_project_domain
-p6975
-NsV_context_user
-p6976
-V84faafdbb77b40c9a73047fdebb0ab45
-p6977
-sVpublisher_id
-p6978
-Vnetwork.machine-A
-p6979
-sVmessage_id
-p6980
-Vc628c924-70f9-4a90-9836-843634f35531
-p6981
-sV_context_roles
-p6982
-(lp6983
-Vadmin
-p6984
-asVtimestamp
-p6985
-V2017-11-30 11:05:17.367241
-p6986
-sV_context_timestamp
-p6987
-V2017-11-30 11:05:17.366216
-p6988
-sV_unique_id
-p6989
-V5933e69ff6be45a4a2183560c76ee3ba
-p6990
-sV_context_tenant_id
-p6991
-V66fbf30f2dce4cef95d5248254dac9a5
-p6992
-sV_context_project_name
-p6993
-Vservices
-p6994
-sV_context_user_identity
-p6995
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p6996
-sV_context_tenant
-p6997
-V66fbf30f2dce4cef95d5248254dac9a5
-p6998
-sV_context_project_id
-p6999
-V66fbf30f2dce4cef95d5248254dac9a5
-p7000
-sV_context_read_only
-p7001
-I00
-sV_context_user_domain
-p7002
-NsV_context_user_name
-p7003
-Vneutron
-p7004
-stp7005
-a(F13.310420989990234
-Vport.update.end
-p7006
-(dp7007
-V_context_domain
-p7008
-NsV_context_request_id
-p7009
-Vreq-e5fd3bf1-ef04-4b22-a5d8-c9580280f397
-p7010
-sVevent_type
-p7011
-g7006
-sV_context_auth_token
-p7012
-VgAAAAABaH-BHmi0xZ8F_W1g5ZW6qzDLFsbbMBKtL4OMu5BHvR62oZ2EMKhbFia9wxarzCdtKDak95Qe0fOcEwwPVZLIaXCzG0uKzvM9_1AszHCsDf2g6jiGte2hJPIBQ-FNMri44srNkNqaZWQnZMQadXbwFzNfiig_1PEv4b_8Jf0lo3aKKbA4
-p7013
-sV_context_resource_uuid
-p7014
-NsV_context_tenant_name
-p7015
-Vservices
-p7016
-sV_context_user_id
-p7017
-V84faafdbb77b40c9a73047fdebb0ab45
-p7018
-sVpayload
-p7019
-(dp7020
-Vport
-p7021
-(dp7022
-Vallowed_address_pairs
-p7023
-(lp7024
-sVextra_dhcp_opts
-p7025
-(lp7026
-sVupdated_at
-p7027
-V2017-11-30T11:05:17
-p7028
-sVdevice_owner
-p7029
-V
-sVport_security_enabled
-p7030
-I01
-sVbinding:profile
-p7031
-(dp7032
-sVfixed_ips
-p7033
-(lp7034
-(dp7035
-Vsubnet_id
-p7036
-V4bc95d98-7997-4eff-9590-f2ba9b423768
-p7037
-sVip_address
-p7038
-V172.16.9.145
-p7039
-sasVid
-p7040
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p7041
-sVsecurity_groups
-p7042
-(lp7043
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p7044
-asVbinding:vif_details
-p7045
-(dp7046
-sVbinding:vif_type
-p7047
-Vunbound
-p7048
-sVmac_address
-p7049
-Vfa:16:3e:c1:a1:3f
-p7050
-sVstatus
-p7051
-VDOWN
-p7052
-sVbinding:host_id
-p7053
-V
-sVdescription
-p7054
-V
-sVdns_assignment
-p7055
-(lp7056
-(dp7057
-Vhostname
-p7058
-Vhost-172-16-9-145
-p7059
-sg7038
-V172.16.9.145
-p7060
-sVfqdn
-p7061
-Vhost-172-16-9-145.openstacklocal.
-p7062
-sasVdevice_id
-p7063
-V
-sVname
-p7064
-VC-server_port-wh5difunbszp
-p7065
-sVadmin_state_up
-p7066
-I01
-sVnetwork_id
-p7067
-V598fd41d-5118-48e5-9b75-862ad070a1e3
-p7068
-sVdns_name
-p7069
-V
-sVcreated_at
-p7070
-V2017-11-30T11:04:03
-p7071
-sVbinding:vnic_type
-p7072
-Vnormal
-p7073
-sVtenant_id
-p7074
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7075
-sssV_context_show_deleted
-p7076
-I00
-sVpriority
-p7077
-VINFO
-p7078
-sV_context_is_admin
-p7079
-I01
-sV_context_project_domain
-p7080
-NsV_context_user
-p7081
-V84faafdbb77b40c9a73047fdebb0ab45
-p7082
-sVpublisher_id
-p7083
-Vnetwork.machine-A
-p7084
-sVmessage_id
-p7085
-Vf89b1a9d-c6c7-4b5e-82b7-a9f06a610366
-p7086
-sV_context_roles
-p7087
-(lp7088
-Vadmin
-p7089
-asVtimestamp
-p7090
-V2017-11-30 11:05:17.715319
-p7091
-sV_context_timestamp
-p7092
-V2017-11-30 11:05:17.366216
-p7093
-sV_unique_id
-p7094
-V84d448ffe85c4304b2e7048b40e465cd
-p7095
-sV_context_tenant_id
-p7096
-V66fbf30f2dce4cef95d5248254dac9a5
-p7097
-sV_context_project_name
-p7098
-Vservices
-p7099
-sV_context_user_identity
-p7100
-V84faafdbb77b40c9a73047fdebb0ab45 66fbf30f2dce4cef95d5248254dac9a5 - - -
-p7101
-sV_context_tenant
-p7102
-V66fbf30f2dce4cef95d5248254dac9a5
-p7103
-sV_context_project_id
-p7104
-V66fbf30f2dce4cef95d5248254dac9a5
-p7105
-sV_context_read_only
-p7106
-I00
-sV_context_user_domain
-p7107
-NsV_context_user_name
-p7108
-Vneutron
-p7109
-stp7110
-a(F13.405984163284302
-Vcompute.instance.shutdown.end
-p7111
-(dp7112
-V_context_domain
-p7113
-NsV_context_request_id
-p7114
-Vreq-6dbda20b-4b44-4689-8d1e-ae656e39ecb8
-p7115
-sV_context_quota_class
-p7116
-NsVevent_type
-p7117
-g7111
-sV_context_service_catalog
-p7118
-(lp7119
-(dp7120
-Vendpoints
-p7121
-(lp7122
-(dp7123
-VadminURL
-p7124
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7125
-sVregion
-p7126
-VRegionOne
-p7127
-sVinternalURL
-p7128
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7129
-sVpublicURL
-p7130
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7131
-sasVtype
-p7132
-Vvolume
-p7133
-sVname
-p7134
-Vcinder
-p7135
-sa(dp7136
-g7121
-(lp7137
-(dp7138
-g7124
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7139
-sg7126
-VRegionOne
-p7140
-sg7128
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7141
-sg7130
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7142
-sasg7132
-Vvolumev2
-p7143
-sg7134
-Vcinderv2
-p7144
-sasV_context_auth_token
-p7145
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7146
-sV_context_resource_uuid
-p7147
-NsV_context_user_id
-p7148
-Vef7a4f67379f41aba489a0b6d6a62094
-p7149
-sVpayload
-p7150
-(dp7151
-Vstate_description
-p7152
-Vdeleting
-p7153
-sVavailability_zone
-p7154
-Vnova
-p7155
-sVterminated_at
-p7156
-V
-sVephemeral_gb
-p7157
-I0
-sVinstance_type_id
-p7158
-I1
-sVdeleted_at
-p7159
-V
-sVreservation_id
-p7160
-Vr-lypgovtc
-p7161
-sVmemory_mb
-p7162
-I4096
-sVdisplay_name
-p7163
-Vvm_test
-p7164
-sVhostname
-p7165
-Vvm-test
-p7166
-sVstate
-p7167
-Vactive
-p7168
-sVprogress
-p7169
-V
-sVlaunched_at
-p7170
-V2017-11-30T11:04:15.000000
-p7171
-sVmetadata
-p7172
-(dp7173
-sVnode
-p7174
-Vmachine-E
-p7175
-sVramdisk_id
-p7176
-V
-sVaccess_ip_v6
-p7177
-NsVdisk_gb
-p7178
-I40
-sVaccess_ip_v4
-p7179
-NsVkernel_id
-p7180
-V
-sVhost
-p7181
-Vmachine-E
-p7182
-sVuser_id
-p7183
-Vef7a4f67379f41aba489a0b6d6a62094
-p7184
-sVimage_ref_url
-p7185
-Vhttp://172.16.0.8:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p7186
-sVcell_name
-p7187
-V
-sVroot_gb
-p7188
-I40
-sVtenant_id
-p7189
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7190
-sVcreated_at
-p7191
-V2017-11-30T11:04:05.000000
-p7192
-sVinstance_id
-p7193
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7194
-sVinstance_type
-p7195
-Vm1.medium
-p7196
-sVvcpus
-p7197
-I2
-sVimage_meta
-p7198
-(dp7199
-Vmin_disk
-p7200
-V40
-p7201
-sVcontainer_format
-p7202
-Vbare
-p7203
-sVmin_ram
-p7204
-V0
-sVdisk_format
-p7205
-Vqcow2
-p7206
-sVbase_image_ref
-p7207
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7208
-ssVarchitecture
-p7209
-NsVos_type
-p7210
-NsVinstance_flavor_id
-p7211
-V3
-ssV_context_show_deleted
-p7212
-I00
-sVpriority
-p7213
-VINFO
-p7214
-sV_context_is_admin
-p7215
-I01
-sV_context_project_domain
-p7216
-NsV_context_user
-p7217
-Vef7a4f67379f41aba489a0b6d6a62094
-p7218
-sVpublisher_id
-p7219
-Vcompute.machine-E
-p7220
-sVmessage_id
-p7221
-V698464c9-11a4-4b7f-aea9-989380c97887
-p7222
-sV_context_remote_address
-p7223
-V172.16.0.5
-p7224
-sV_context_roles
-p7225
-(lp7226
-Vadmin
-p7227
-asVtimestamp
-p7228
-V2017-11-30 11:05:17.810751
-p7229
-sV_context_timestamp
-p7230
-V2017-11-30T11:05:14.421285
-p7231
-sV_unique_id
-p7232
-V52583f701524435196b26a9962262534
-p7233
-sV_context_project_name
-p7234
-Vapexlake
-p7235
-sV_context_read_deleted
-p7236
-Vno
-p7237
-sV_context_user_identity
-p7238
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7239
-sV_context_tenant
-p7240
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7241
-sV_context_instance_lock_checked
-p7242
-I00
-sV_context_project_id
-p7243
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7244
-sV_context_read_only
-p7245
-I00
-sV_context_user_domain
-p7246
-NsV_context_user_name
-p7247
-Violie
-p7248
-stp7249
-a(F13.502267122268677
-Vcompute.instance.update
-p7250
-(dp7251
-V_context_domain
-p7252
-NsV_context_request_id
-p7253
-Vreq-6dbda20b-4b44-4689-8d1e-ae656e39ecb8
-p7254
-sV_context_quota_class
-p7255
-NsVevent_type
-p7256
-g7250
-sV_context_service_catalog
-p7257
-(lp7258
-(dp7259
-Vendpoints
-p7260
-(lp7261
-(dp7262
-VadminURL
-p7263
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7264
-sVregion
-p7265
-VRegionOne
-p7266
-sVinternalURL
-p7267
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7268
-sVpublicURL
-p7269
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7270
-sasVtype
-p7271
-Vvolume
-p7272
-sVname
-p7273
-Vcinder
-p7274
-sa(dp7275
-g7260
-(lp7276
-(dp7277
-g7263
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7278
-sg7265
-VRegionOne
-p7279
-sg7267
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7280
-sg7269
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7281
-sasg7271
-Vvolumev2
-p7282
-sg7273
-Vcinderv2
-p7283
-sasV_context_auth_token
-p7284
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7285
-sV_context_resource_uuid
-p7286
-NsV_context_user_id
-p7287
-Vef7a4f67379f41aba489a0b6d6a62094
-p7288
-sVpayload
-p7289
-(dp7290
-Vstate_description
-p7291
-V
-sVavailability_zone
-p7292
-Vnova
-p7293
-sVterminated_at
-p7294
-V2017-11-30T11:05:17.000000
-p7295
-sVephemeral_gb
-p7296
-I0
-sVinstance_type_id
-p7297
-I1
-sVbandwidth
-p7298
-(dp7299
-sVdeleted_at
-p7300
-V
-sVreservation_id
-p7301
-Vr-lypgovtc
-p7302
-sVmemory_mb
-p7303
-I4096
-sVdisplay_name
-p7304
-Vvm_test
-p7305
-sVhostname
-p7306
-Vvm-test
-p7307
-sVstate
-p7308
-Vdeleted
-p7309
-sVold_state
-p7310
-Vactive
-p7311
-sVprogress
-p7312
-V
-sVlaunched_at
-p7313
-V2017-11-30T11:04:15.000000
-p7314
-sVmetadata
-p7315
-(dp7316
-sVnode
-p7317
-Vmachine-E
-p7318
-sVramdisk_id
-p7319
-V
-sVaccess_ip_v6
-p7320
-NsVdisk_gb
-p7321
-I40
-sVaccess_ip_v4
-p7322
-NsVkernel_id
-p7323
-V
-sVhost
-p7324
-Vmachine-E
-p7325
-sVuser_id
-p7326
-Vef7a4f67379f41aba489a0b6d6a62094
-p7327
-sVimage_ref_url
-p7328
-Vhttp://172.18.0.9:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p7329
-sVcell_name
-p7330
-V
-sVaudit_period_beginning
-p7331
-V2017-11-01T00:00:00.000000
-p7332
-sVroot_gb
-p7333
-I40
-sVtenant_id
-p7334
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7335
-sVcreated_at
-p7336
-V2017-11-30T11:04:05.000000
-p7337
-sVold_task_state
-p7338
-Vdeleting
-p7339
-sVinstance_id
-p7340
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7341
-sVinstance_type
-p7342
-Vm1.medium
-p7343
-sVvcpus
-p7344
-I2
-sVimage_meta
-p7345
-(dp7346
-Vmin_disk
-p7347
-V40
-p7348
-sVcontainer_format
-p7349
-Vbare
-p7350
-sVmin_ram
-p7351
-V0
-sVdisk_format
-p7352
-Vqcow2
-p7353
-sVbase_image_ref
-p7354
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7355
-ssVarchitecture
-p7356
-NsVnew_task_state
-p7357
-NsVaudit_period_ending
-p7358
-V2017-11-30T11:05:17.902253
-p7359
-sVos_type
-p7360
-NsVinstance_flavor_id
-p7361
-V3
-ssV_context_show_deleted
-p7362
-I00
-sVpriority
-p7363
-VINFO
-p7364
-sV_context_is_admin
-p7365
-I01
-sV_context_project_domain
-p7366
-NsV_context_user
-p7367
-Vef7a4f67379f41aba489a0b6d6a62094
-p7368
-sVpublisher_id
-p7369
-Vcompute.machine-A
-p7370
-sVmessage_id
-p7371
-Vddba8a20-d492-426c-b578-874cc8acea70
-p7372
-sV_context_remote_address
-p7373
-V172.16.0.5
-p7374
-sV_context_roles
-p7375
-(lp7376
-Vadmin
-p7377
-asVtimestamp
-p7378
-V2017-11-30 11:05:17.906686
-p7379
-sV_context_timestamp
-p7380
-V2017-11-30T11:05:14.421285
-p7381
-sV_unique_id
-p7382
-Ve7ba79b955b24857b7ef9430e27f0e1c
-p7383
-sV_context_project_name
-p7384
-Vapexlake
-p7385
-sV_context_read_deleted
-p7386
-Vno
-p7387
-sV_context_user_identity
-p7388
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7389
-sV_context_tenant
-p7390
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7391
-sV_context_instance_lock_checked
-p7392
-I00
-sV_context_project_id
-p7393
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7394
-sV_context_read_only
-p7395
-I00
-sV_context_user_domain
-p7396
-NsV_context_user_name
-p7397
-Violie
-p7398
-stp7399
-a(F13.649013042449951
-Vport.delete.start
-p7400
-(dp7401
-V_context_domain
-p7402
-NsV_context_request_id
-p7403
-Vreq-0407e9f1-294b-45d8-aaf8-6db74b31d851
-p7404
-sVevent_type
-p7405
-g7400
-sV_context_auth_token
-p7406
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7407
-sV_context_resource_uuid
-p7408
-NsV_context_tenant_name
-p7409
-Vapexlake
-p7410
-sV_context_user_id
-p7411
-Vef7a4f67379f41aba489a0b6d6a62094
-p7412
-sVpayload
-p7413
-(dp7414
-Vport_id
-p7415
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p7416
-ssV_context_show_deleted
-p7417
-I00
-sVpriority
-p7418
-VINFO
-p7419
-sV_context_is_admin
-p7420
-I01
-sV_context_project_domain
-p7421
-NsV_context_user
-p7422
-Vef7a4f67379f41aba489a0b6d6a62094
-p7423
-sVpublisher_id
-p7424
-Vnetwork.machine-A
-p7425
-sVmessage_id
-p7426
-Vad51e27a-5a0c-48e6-9cc9-7da62445f2a0
-p7427
-sV_context_roles
-p7428
-(lp7429
-Vadmin
-p7430
-asVtimestamp
-p7431
-V2017-11-30 11:05:18.054273
-p7432
-sV_context_timestamp
-p7433
-V2017-11-30 11:05:18.053041
-p7434
-sV_unique_id
-p7435
-V1dbb88d2c0e240a598ae50e5e2bbfefa
-p7436
-sV_context_tenant_id
-p7437
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7438
-sV_context_project_name
-p7439
-Vapexlake
-p7440
-sV_context_user_identity
-p7441
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7442
-sV_context_tenant
-p7443
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7444
-sV_context_project_id
-p7445
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7446
-sV_context_read_only
-p7447
-I00
-sV_context_user_domain
-p7448
-NsV_context_user_name
-p7449
-Violie
-p7450
-stp7451
-a(F13.705847978591919
-Vcompute.instance.delete.end
-p7452
-(dp7453
-V_context_domain
-p7454
-NsV_context_request_id
-p7455
-Vreq-6dbda20b-4b44-4689-8d1e-ae656e39ecb8
-p7456
-sV_context_quota_class
-p7457
-NsVevent_type
-p7458
-g7452
-sV_context_service_catalog
-p7459
-(lp7460
-(dp7461
-Vendpoints
-p7462
-(lp7463
-(dp7464
-VadminURL
-p7465
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7466
-sVregion
-p7467
-VRegionOne
-p7468
-sVinternalURL
-p7469
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7470
-sVpublicURL
-p7471
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p7472
-sasVtype
-p7473
-Vvolume
-p7474
-sVname
-p7475
-Vcinder
-p7476
-sa(dp7477
-g7462
-(lp7478
-(dp7479
-g7465
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7480
-sg7467
-VRegionOne
-p7481
-sg7469
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7482
-sg7471
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p7483
-sasg7473
-Vvolumev2
-p7484
-sg7475
-Vcinderv2
-p7485
-sasV_context_auth_token
-p7486
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7487
-sV_context_resource_uuid
-p7488
-NsV_context_user_id
-p7489
-Vef7a4f67379f41aba489a0b6d6a62094
-p7490
-sVpayload
-p7491
-(dp7492
-Vstate_description
-p7493
-V
-sVavailability_zone
-p7494
-Vnova
-p7495
-sVterminated_at
-p7496
-V2017-11-30T11:05:17.827775
-p7497
-sVephemeral_gb
-p7498
-I0
-sVinstance_type_id
-p7499
-I1
-sVdeleted_at
-p7500
-V2017-11-30T11:05:17.000000
-p7501
-sVreservation_id
-p7502
-Vr-lypgovtc
-p7503
-sVmemory_mb
-p7504
-I4096
-sVdisplay_name
-p7505
-Vvm_test
-p7506
-sVhostname
-p7507
-Vvm-test
-p7508
-sVstate
-p7509
-Vdeleted
-p7510
-sVprogress
-p7511
-V
-sVlaunched_at
-p7512
-V2017-11-30T11:04:15.000000
-p7513
-sVmetadata
-p7514
-(dp7515
-sVnode
-p7516
-Vmachine-E
-p7517
-sVramdisk_id
-p7518
-V
-sVaccess_ip_v6
-p7519
-NsVdisk_gb
-p7520
-I40
-sVaccess_ip_v4
-p7521
-NsVkernel_id
-p7522
-V
-sVhost
-p7523
-Vmachine-E
-p7524
-sVuser_id
-p7525
-Vef7a4f67379f41aba489a0b6d6a62094
-p7526
-sVimage_ref_url
-p7527
-Vhttp://172.16.0.8:9292/images/a1f12250-9000-4b16-aa75-50638eb516c3
-p7528
-sVcell_name
-p7529
-V
-sVroot_gb
-p7530
-I40
-sVtenant_id
-p7531
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7532
-sVcreated_at
-p7533
-V2017-11-30T11:04:05.000000
-p7534
-sVinstance_id
-p7535
-V3aa9bdab-8113-44e6-b9e7-434ca023a5de
-p7536
-sVinstance_type
-p7537
-Vm1.medium
-p7538
-sVvcpus
-p7539
-I2
-sVimage_meta
-p7540
-(dp7541
-Vmin_disk
-p7542
-V40
-p7543
-sVcontainer_format
-p7544
-Vbare
-p7545
-sVmin_ram
-p7546
-V0
-sVdisk_format
-p7547
-Vqcow2
-p7548
-sVbase_image_ref
-p7549
-Va1f12250-9000-4b16-aa75-50638eb516c3
-p7550
-ssVarchitecture
-p7551
-NsVos_type
-p7552
-NsVinstance_flavor_id
-p7553
-V3
-ssV_context_show_deleted
-p7554
-I00
-sVpriority
-p7555
-VINFO
-p7556
-sV_context_is_admin
-p7557
-I01
-sV_context_project_domain
-p7558
-NsV_context_user
-p7559
-Vef7a4f67379f41aba489a0b6d6a62094
-p7560
-sVpublisher_id
-p7561
-Vcompute.machine-E
-p7562
-sVmessage_id
-p7563
-Va849b804-7d9e-4ae1-819d-a291991e42ba
-p7564
-sV_context_remote_address
-p7565
-V172.16.0.5
-p7566
-sV_context_roles
-p7567
-(lp7568
-Vadmin
-p7569
-asVtimestamp
-p7570
-V2017-11-30 11:05:18.110849
-p7571
-sV_context_timestamp
-p7572
-V2017-11-30T11:05:14.421285
-p7573
-sV_unique_id
-p7574
-V6211decd2c3040028796f92bc3b0c3fe
-p7575
-sV_context_project_name
-p7576
-Vapexlake
-p7577
-sV_context_read_deleted
-p7578
-Vno
-p7579
-sV_context_user_identity
-p7580
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7581
-sV_context_tenant
-p7582
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7583
-sV_context_instance_lock_checked
-p7584
-I00
-sV_context_project_id
-p7585
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7586
-sV_context_read_only
-p7587
-I00
-sV_context_user_domain
-p7588
-NsV_context_user_name
-p7589
-Violie
-p7590
-stp7591
-a(F13.768990993499756
-Vport.delete.end
-p7592
-(dp7593
-V_context_domain
-p7594
-NsV_context_request_id
-p7595
-Vreq-0407e9f1-294b-45d8-aaf8-6db74b31d851
-p7596
-sVevent_type
-p7597
-g7592
-sV_context_auth_token
-p7598
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7599
-sV_context_resource_uuid
-p7600
-NsV_context_tenant_name
-p7601
-Vapexlake
-p7602
-sV_context_user_id
-p7603
-Vef7a4f67379f41aba489a0b6d6a62094
-p7604
-sVpayload
-p7605
-(dp7606
-Vport_id
-p7607
-Vc91ef2f6-7d68-4cd0-a21a-4d72de592422
-p7608
-ssV_context_show_deleted
-p7609
-I00
-sVpriority
-p7610
-VINFO
-p7611
-sV_context_is_admin
-p7612
-I01
-sV_context_project_domain
-p7613
-NsV_context_user
-p7614
-Vef7a4f67379f41aba489a0b6d6a62094
-p7615
-sVpublisher_id
-p7616
-Vnetwork.machine-A
-p7617
-sVmessage_id
-p7618
-Vc2c474bc-25f4-42f4-b0ae-83f0fb96dbb5
-p7619
-sV_context_roles
-p7620
-(lp7621
-Vadmin
-p7622
-asVtimestamp
-p7623
-V2017-11-30 11:05:18.174349
-p7624
-sV_context_timestamp
-p7625
-V2017-11-30 11:05:18.053041
-p7626
-sV_unique_id
-p7627
-V8588f28f30dd4cd587f40dd34293a0c0
-p7628
-sV_context_tenant_id
-p7629
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7630
-sV_context_project_name
-p7631
-Vapexlake
-p7632
-sV_context_user_identity
-p7633
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7634
-sV_context_tenant
-p7635
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7636
-sV_context_project_id
-p7637
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7638
-sV_context_read_only
-p7639
-I00
-sV_context_user_domain
-p7640
-NsV_context_user_name
-p7641
-Violie
-p7642
-stp7643
-a(F14.918519020080566
-Vsecurity_group_rule.delete.start
-p7644
-(dp7645
-V_context_domain
-p7646
-NsV_context_request_id
-p7647
-Vreq-46bb5390-d1fe-4d8d-a6c2-270336ad7bfe
-p7648
-sVevent_type
-p7649
-g7644
-sV_context_auth_token
-p7650
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7651
-sV_context_resource_uuid
-p7652
-NsV_context_tenant_name
-p7653
-Vapexlake
-p7654
-sV_context_user_id
-p7655
-Vef7a4f67379f41aba489a0b6d6a62094
-p7656
-sVpayload
-p7657
-(dp7658
-Vsecurity_group_rule_id
-p7659
-V269bdd0e-2a04-4385-b4e0-b3f38abfb4cd
-p7660
-ssV_context_show_deleted
-p7661
-I00
-sVpriority
-p7662
-VINFO
-p7663
-sV_context_is_admin
-p7664
-I01
-sV_context_project_domain
-p7665
-NsV_context_user
-p7666
-Vef7a4f67379f41aba489a0b6d6a62094
-p7667
-sVpublisher_id
-p7668
-Vnetwork.machine-A
-p7669
-sVmessage_id
-p7670
-Vd44ae1e5-0ac2-496d-be7d-cc79156be3a1
-p7671
-sV_context_roles
-p7672
-(lp7673
-Vadmin
-p7674
-asVtimestamp
-p7675
-V2017-11-30 11:05:19.323340
-p7676
-sV_context_timestamp
-p7677
-V2017-11-30 11:05:19.322300
-p7678
-sV_unique_id
-p7679
-Vd41f53f30d3e42b5ab720a2ce88c403c
-p7680
-sV_context_tenant_id
-p7681
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7682
-sV_context_project_name
-p7683
-Vapexlake
-p7684
-sV_context_user_identity
-p7685
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7686
-sV_context_tenant
-p7687
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7688
-sV_context_project_id
-p7689
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7690
-sV_context_read_only
-p7691
-I00
-sV_context_user_domain
-p7692
-NsV_context_user_name
-p7693
-Violie
-p7694
-stp7695
-a(F14.950014114379883
-Vsecurity_group_rule.delete.end
-p7696
-(dp7697
-V_context_domain
-p7698
-NsV_context_request_id
-p7699
-Vreq-46bb5390-d1fe-4d8d-a6c2-270336ad7bfe
-p7700
-sVevent_type
-p7701
-g7696
-sV_context_auth_token
-p7702
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7703
-sV_context_resource_uuid
-p7704
-NsV_context_tenant_name
-p7705
-Vapexlake
-p7706
-sV_context_user_id
-p7707
-Vef7a4f67379f41aba489a0b6d6a62094
-p7708
-sVpayload
-p7709
-(dp7710
-Vsecurity_group_rule_id
-p7711
-V269bdd0e-2a04-4385-b4e0-b3f38abfb4cd
-p7712
-ssV_context_show_deleted
-p7713
-I00
-sVpriority
-p7714
-VINFO
-p7715
-sV_context_is_admin
-p7716
-I01
-sV_context_project_domain
-p7717
-NsV_context_user
-p7718
-Vef7a4f67379f41aba489a0b6d6a62094
-p7719
-sVpublisher_id
-p7720
-Vnetwork.machine-A
-p7721
-sVmessage_id
-p7722
-Vb40209b4-1d30-4f70-ada0-20ce4a9cfff1
-p7723
-sV_context_roles
-p7724
-(lp7725
-Vadmin
-p7726
-asVtimestamp
-p7727
-V2017-11-30 11:05:19.355865
-p7728
-sV_context_timestamp
-p7729
-V2017-11-30 11:05:19.322300
-p7730
-sV_unique_id
-p7731
-V871af09de2cc4f618d4f498a4f2bd512
-p7732
-sV_context_tenant_id
-p7733
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7734
-sV_context_project_name
-p7735
-Vapexlake
-p7736
-sV_context_user_identity
-p7737
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7738
-sV_context_tenant
-p7739
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7740
-sV_context_project_id
-p7741
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7742
-sV_context_read_only
-p7743
-I00
-sV_context_user_domain
-p7744
-NsV_context_user_name
-p7745
-Violie
-p7746
-stp7747
-a(F14.95940899848938
-Vsecurity_group_rule.delete.start
-p7748
-(dp7749
-V_context_domain
-p7750
-NsV_context_request_id
-p7751
-Vreq-0342fb1e-50a5-45f2-a551-deb57eed9107
-p7752
-sVevent_type
-p7753
-g7748
-sV_context_auth_token
-p7754
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7755
-sV_context_resource_uuid
-p7756
-NsV_context_tenant_name
-p7757
-Vapexlake
-p7758
-sV_context_user_id
-p7759
-Vef7a4f67379f41aba489a0b6d6a62094
-p7760
-sVpayload
-p7761
-(dp7762
-Vsecurity_group_rule_id
-p7763
-V4e6614c3-e0a5-45e7-bcd6-907e617b570d
-p7764
-ssV_context_show_deleted
-p7765
-I00
-sVpriority
-p7766
-VINFO
-p7767
-sV_context_is_admin
-p7768
-I01
-sV_context_project_domain
-p7769
-NsV_context_user
-p7770
-Vef7a4f67379f41aba489a0b6d6a62094
-p7771
-sVpublisher_id
-p7772
-Vnetwork.machine-A
-p7773
-sVmessage_id
-p7774
-Vd0ab012b-7fc3-4e39-9529-52fdd2f9a0d0
-p7775
-sV_context_roles
-p7776
-(lp7777
-Vadmin
-p7778
-asVtimestamp
-p7779
-V2017-11-30 11:05:19.365507
-p7780
-sV_context_timestamp
-p7781
-V2017-11-30 11:05:19.364384
-p7782
-sV_unique_id
-p7783
-V88ace780285a4d83a5c3d6287ce39adc
-p7784
-sV_context_tenant_id
-p7785
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7786
-sV_context_project_name
-p7787
-Vapexlake
-p7788
-sV_context_user_identity
-p7789
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7790
-sV_context_tenant
-p7791
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7792
-sV_context_project_id
-p7793
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7794
-sV_context_read_only
-p7795
-I00
-sV_context_user_domain
-p7796
-NsV_context_user_name
-p7797
-Violie
-p7798
-stp7799
-a(F14.985767126083374
-Vsecurity_group_rule.delete.end
-p7800
-(dp7801
-V_context_domain
-p7802
-NsV_context_request_id
-p7803
-Vreq-0342fb1e-50a5-45f2-a551-deb57eed9107
-p7804
-sVevent_type
-p7805
-g7800
-sV_context_auth_token
-p7806
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7807
-sV_context_resource_uuid
-p7808
-NsV_context_tenant_name
-p7809
-Vapexlake
-p7810
-sV_context_user_id
-p7811
-Vef7a4f67379f41aba489a0b6d6a62094
-p7812
-sVpayload
-p7813
-(dp7814
-Vsecurity_group_rule_id
-p7815
-V4e6614c3-e0a5-45e7-bcd6-907e617b570d
-p7816
-ssV_context_show_deleted
-p7817
-I00
-sVpriority
-p7818
-VINFO
-p7819
-sV_context_is_admin
-p7820
-I01
-sV_context_project_domain
-p7821
-NsV_context_user
-p7822
-Vef7a4f67379f41aba489a0b6d6a62094
-p7823
-sVpublisher_id
-p7824
-Vnetwork.machine-A
-p7825
-sVmessage_id
-p7826
-Vb3dc97e2-db26-4826-aaca-5cc3e86f335f
-p7827
-sV_context_roles
-p7828
-(lp7829
-Vadmin
-p7830
-asVtimestamp
-p7831
-V2017-11-30 11:05:19.391674
-p7832
-sV_context_timestamp
-p7833
-V2017-11-30 11:05:19.364384
-p7834
-sV_unique_id
-p7835
-V6c84caf3a9cd4e8ca3c4db7177d35af7
-p7836
-sV_context_tenant_id
-p7837
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7838
-sV_context_project_name
-p7839
-Vapexlake
-p7840
-sV_context_user_identity
-p7841
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7842
-sV_context_tenant
-p7843
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7844
-sV_context_project_id
-p7845
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7846
-sV_context_read_only
-p7847
-I00
-sV_context_user_domain
-p7848
-NsV_context_user_name
-p7849
-Violie
-p7850
-stp7851
-a(F14.99465012550354
-Vsecurity_group_rule.delete.start
-p7852
-(dp7853
-V_context_domain
-p7854
-NsV_context_request_id
-p7855
-Vreq-407f4323-c98a-4e9f-9d33-b7e703659ec8
-p7856
-sVevent_type
-p7857
-g7852
-sV_context_auth_token
-p7858
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7859
-sV_context_resource_uuid
-p7860
-NsV_context_tenant_name
-p7861
-Vapexlake
-p7862
-sV_context_user_id
-p7863
-Vef7a4f67379f41aba489a0b6d6a62094
-p7864
-sVpayload
-p7865
-(dp7866
-Vsecurity_group_rule_id
-p7867
-V68a44727-524f-4360-a73a-ee8df2143c81
-p7868
-ssV_context_show_deleted
-p7869
-I00
-sVpriority
-p7870
-VINFO
-p7871
-sV_context_is_admin
-p7872
-I01
-sV_context_project_domain
-p7873
-NsV_context_user
-p7874
-Vef7a4f67379f41aba489a0b6d6a62094
-p7875
-sVpublisher_id
-p7876
-Vnetwork.machine-A
-p7877
-sVmessage_id
-p7878
-V5ad6ee95-4f4c-440a-8954-dec7e82914d3
-p7879
-sV_context_roles
-p7880
-(lp7881
-Vadmin
-p7882
-asVtimestamp
-p7883
-V2017-11-30 11:05:19.400711
-p7884
-sV_context_timestamp
-p7885
-V2017-11-30 11:05:19.399609
-p7886
-sV_unique_id
-p7887
-Vacadbc28fe99433fb5701e3d16988c91
-p7888
-sV_context_tenant_id
-p7889
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7890
-sV_context_project_name
-p7891
-Vapexlake
-p7892
-sV_context_user_identity
-p7893
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7894
-sV_context_tenant
-p7895
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7896
-sV_context_project_id
-p7897
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7898
-sV_context_read_only
-p7899
-I00
-sV_context_user_domain
-p7900
-NsV_context_user_name
-p7901
-Violie
-p7902
-stp7903
-a(F15.024830102920532
-Vsecurity_group_rule.delete.end
-p7904
-(dp7905
-V_context_domain
-p7906
-NsV_context_request_id
-p7907
-Vreq-407f4323-c98a-4e9f-9d33-b7e703659ec8
-p7908
-sVevent_type
-p7909
-g7904
-sV_context_auth_token
-p7910
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7911
-sV_context_resource_uuid
-p7912
-NsV_context_tenant_name
-p7913
-Vapexlake
-p7914
-sV_context_user_id
-p7915
-Vef7a4f67379f41aba489a0b6d6a62094
-p7916
-sVpayload
-p7917
-(dp7918
-Vsecurity_group_rule_id
-p7919
-V68a44727-524f-4360-a73a-ee8df2143c81
-p7920
-ssV_context_show_deleted
-p7921
-I00
-sVpriority
-p7922
-VINFO
-p7923
-sV_context_is_admin
-p7924
-I01
-sV_context_project_domain
-p7925
-NsV_context_user
-p7926
-Vef7a4f67379f41aba489a0b6d6a62094
-p7927
-sVpublisher_id
-p7928
-Vnetwork.machine-A
-p7929
-sVmessage_id
-p7930
-V07f53c8e-0c36-4073-9c5f-fceb9dbda711
-p7931
-sV_context_roles
-p7932
-(lp7933
-Vadmin
-p7934
-asVtimestamp
-p7935
-V2017-11-30 11:05:19.430534
-p7936
-sV_context_timestamp
-p7937
-V2017-11-30 11:05:19.399609
-p7938
-sV_unique_id
-p7939
-Vfd8ae9f53f56452a8cc7e4ca2b56a6ac
-p7940
-sV_context_tenant_id
-p7941
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7942
-sV_context_project_name
-p7943
-Vapexlake
-p7944
-sV_context_user_identity
-p7945
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7946
-sV_context_tenant
-p7947
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7948
-sV_context_project_id
-p7949
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7950
-sV_context_read_only
-p7951
-I00
-sV_context_user_domain
-p7952
-NsV_context_user_name
-p7953
-Violie
-p7954
-stp7955
-a(F15.034124135971069
-Vsecurity_group_rule.delete.start
-p7956
-(dp7957
-V_context_domain
-p7958
-NsV_context_request_id
-p7959
-Vreq-3c8df96d-9120-4913-bcb1-7146fc64ebdf
-p7960
-sVevent_type
-p7961
-g7956
-sV_context_auth_token
-p7962
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p7963
-sV_context_resource_uuid
-p7964
-NsV_context_tenant_name
-p7965
-Vapexlake
-p7966
-sV_context_user_id
-p7967
-Vef7a4f67379f41aba489a0b6d6a62094
-p7968
-sVpayload
-p7969
-(dp7970
-Vsecurity_group_rule_id
-p7971
-V85e1fb2f-f1d5-4a12-b050-07a157ab4fb7
-p7972
-ssV_context_show_deleted
-p7973
-I00
-sVpriority
-p7974
-VINFO
-p7975
-sV_context_is_admin
-p7976
-I01
-sV_context_project_domain
-p7977
-NsV_context_user
-p7978
-Vef7a4f67379f41aba489a0b6d6a62094
-p7979
-sVpublisher_id
-p7980
-Vnetwork.machine-A
-p7981
-sVmessage_id
-p7982
-V570bdd89-b874-4cc8-bbea-bcf6f8f4bacb
-p7983
-sV_context_roles
-p7984
-(lp7985
-Vadmin
-p7986
-asVtimestamp
-p7987
-V2017-11-30 11:05:19.439988
-p7988
-sV_context_timestamp
-p7989
-V2017-11-30 11:05:19.438989
-p7990
-sV_unique_id
-p7991
-V906e3f01cdfd499d8904f72cc091c860
-p7992
-sV_context_tenant_id
-p7993
-V187e5e95e7eb499d8a421b3d4ed966d5
-p7994
-sV_context_project_name
-p7995
-Vapexlake
-p7996
-sV_context_user_identity
-p7997
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p7998
-sV_context_tenant
-p7999
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8000
-sV_context_project_id
-p8001
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8002
-sV_context_read_only
-p8003
-I00
-sV_context_user_domain
-p8004
-NsV_context_user_name
-p8005
-Violie
-p8006
-stp8007
-a(F15.061320066452026
-Vsecurity_group_rule.delete.end
-p8008
-(dp8009
-V_context_domain
-p8010
-NsV_context_request_id
-p8011
-Vreq-3c8df96d-9120-4913-bcb1-7146fc64ebdf
-p8012
-sVevent_type
-p8013
-g8008
-sV_context_auth_token
-p8014
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8015
-sV_context_resource_uuid
-p8016
-NsV_context_tenant_name
-p8017
-Vapexlake
-p8018
-sV_context_user_id
-p8019
-Vef7a4f67379f41aba489a0b6d6a62094
-p8020
-sVpayload
-p8021
-(dp8022
-Vsecurity_group_rule_id
-p8023
-V85e1fb2f-f1d5-4a12-b050-07a157ab4fb7
-p8024
-ssV_context_show_deleted
-p8025
-I00
-sVpriority
-p8026
-VINFO
-p8027
-sV_context_is_admin
-p8028
-I01
-sV_context_project_domain
-p8029
-NsV_context_user
-p8030
-Vef7a4f67379f41aba489a0b6d6a62094
-p8031
-sVpublisher_id
-p8032
-Vnetwork.machine-A
-p8033
-sVmessage_id
-p8034
-V27663e12-1a29-49ae-b42d-a674aecfd011
-p8035
-sV_context_roles
-p8036
-(lp8037
-Vadmin
-p8038
-asVtimestamp
-p8039
-V2017-11-30 11:05:19.466995
-p8040
-sV_context_timestamp
-p8041
-V2017-11-30 11:05:19.438989
-p8042
-sV_unique_id
-p8043
-V174e242630ca49f19505ce8779ba6078
-p8044
-sV_context_tenant_id
-p8045
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8046
-sV_context_project_name
-p8047
-Vapexlake
-p8048
-sV_context_user_identity
-p8049
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8050
-sV_context_tenant
-p8051
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8052
-sV_context_project_id
-p8053
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8054
-sV_context_read_only
-p8055
-I00
-sV_context_user_domain
-p8056
-NsV_context_user_name
-p8057
-Violie
-p8058
-stp8059
-a(F15.069605112075806
-Vsecurity_group_rule.delete.start
-p8060
-(dp8061
-V_context_domain
-p8062
-NsV_context_request_id
-p8063
-Vreq-d912ac46-f99c-464c-ba70-7f761627d8b1
-p8064
-sVevent_type
-p8065
-g8060
-sV_context_auth_token
-p8066
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8067
-sV_context_resource_uuid
-p8068
-NsV_context_tenant_name
-p8069
-Vapexlake
-p8070
-sV_context_user_id
-p8071
-Vef7a4f67379f41aba489a0b6d6a62094
-p8072
-sVpayload
-p8073
-(dp8074
-Vsecurity_group_rule_id
-p8075
-Vc86683d2-513c-4f7f-80ce-c67ce57efb59
-p8076
-ssV_context_show_deleted
-p8077
-I00
-sVpriority
-p8078
-VINFO
-p8079
-sV_context_is_admin
-p8080
-I01
-sV_context_project_domain
-p8081
-NsV_context_user
-p8082
-Vef7a4f67379f41aba489a0b6d6a62094
-p8083
-sVpublisher_id
-p8084
-Vnetwork.machine-A
-p8085
-sVmessage_id
-p8086
-V24dbc5ce-9795-43e4-95e1-5d79f57843fd
-p8087
-sV_context_roles
-p8088
-(lp8089
-Vadmin
-p8090
-asVtimestamp
-p8091
-V2017-11-30 11:05:19.475994
-p8092
-sV_context_timestamp
-p8093
-V2017-11-30 11:05:19.475013
-p8094
-sV_unique_id
-p8095
-Vf019b3c24e3c4425881911416987bc42
-p8096
-sV_context_tenant_id
-p8097
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8098
-sV_context_project_name
-p8099
-Vapexlake
-p8100
-sV_context_user_identity
-p8101
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8102
-sV_context_tenant
-p8103
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8104
-sV_context_project_id
-p8105
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8106
-sV_context_read_only
-p8107
-I00
-sV_context_user_domain
-p8108
-NsV_context_user_name
-p8109
-Violie
-p8110
-stp8111
-a(F15.101022958755493
-Vsecurity_group_rule.delete.end
-p8112
-(dp8113
-V_context_domain
-p8114
-NsV_context_request_id
-p8115
-Vreq-d912ac46-f99c-464c-ba70-7f761627d8b1
-p8116
-sVevent_type
-p8117
-g8112
-sV_context_auth_token
-p8118
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8119
-sV_context_resource_uuid
-p8120
-NsV_context_tenant_name
-p8121
-Vapexlake
-p8122
-sV_context_user_id
-p8123
-Vef7a4f67379f41aba489a0b6d6a62094
-p8124
-sVpayload
-p8125
-(dp8126
-Vsecurity_group_rule_id
-p8127
-Vc86683d2-513c-4f7f-80ce-c67ce57efb59
-p8128
-ssV_context_show_deleted
-p8129
-I00
-sVpriority
-p8130
-VINFO
-p8131
-sV_context_is_admin
-p8132
-I01
-sV_context_project_domain
-p8133
-NsV_context_user
-p8134
-Vef7a4f67379f41aba489a0b6d6a62094
-p8135
-sVpublisher_id
-p8136
-Vnetwork.machine-A
-p8137
-sVmessage_id
-p8138
-V0215a5fd-fa76-45bf-aae7-a4baa2e6a698
-p8139
-sV_context_roles
-p8140
-(lp8141
-Vadmin
-p8142
-asVtimestamp
-p8143
-V2017-11-30 11:05:19.505805
-p8144
-sV_context_timestamp
-p8145
-V2017-11-30 11:05:19.475013
-p8146
-sV_unique_id
-p8147
-V3b4a49d7c76a42c7bca37956d7bf8ed9
-p8148
-sV_context_tenant_id
-p8149
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8150
-sV_context_project_name
-p8151
-Vapexlake
-p8152
-sV_context_user_identity
-p8153
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8154
-sV_context_tenant
-p8155
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8156
-sV_context_project_id
-p8157
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8158
-sV_context_read_only
-p8159
-I00
-sV_context_user_domain
-p8160
-NsV_context_user_name
-p8161
-Violie
-p8162
-stp8163
-a(F15.111886978149414
-Vsecurity_group_rule.delete.start
-p8164
-(dp8165
-V_context_domain
-p8166
-NsV_context_request_id
-p8167
-Vreq-9a7af90a-702e-442a-b7e4-ab28aa9f6880
-p8168
-sVevent_type
-p8169
-g8164
-sV_context_auth_token
-p8170
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8171
-sV_context_resource_uuid
-p8172
-NsV_context_tenant_name
-p8173
-Vapexlake
-p8174
-sV_context_user_id
-p8175
-Vef7a4f67379f41aba489a0b6d6a62094
-p8176
-sVpayload
-p8177
-(dp8178
-Vsecurity_group_rule_id
-p8179
-Ve0d0a918-7972-4cbf-b867-d6f8827a7c00
-p8180
-ssV_context_show_deleted
-p8181
-I00
-sVpriority
-p8182
-VINFO
-p8183
-sV_context_is_admin
-p8184
-I01
-sV_context_project_domain
-p8185
-NsV_context_user
-p8186
-Vef7a4f67379f41aba489a0b6d6a62094
-p8187
-sVpublisher_id
-p8188
-Vnetwork.machine-A
-p8189
-sVmessage_id
-p8190
-V7acfb41f-4488-40ee-96b8-f74c18f3c548
-p8191
-sV_context_roles
-p8192
-(lp8193
-Vadmin
-p8194
-asVtimestamp
-p8195
-V2017-11-30 11:05:19.516860
-p8196
-sV_context_timestamp
-p8197
-V2017-11-30 11:05:19.515538
-p8198
-sV_unique_id
-p8199
-V5e0d1a6d6b5c4ba8bdff87f2c3c1804b
-p8200
-sV_context_tenant_id
-p8201
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8202
-sV_context_project_name
-p8203
-Vapexlake
-p8204
-sV_context_user_identity
-p8205
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8206
-sV_context_tenant
-p8207
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8208
-sV_context_project_id
-p8209
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8210
-sV_context_read_only
-p8211
-I00
-sV_context_user_domain
-p8212
-NsV_context_user_name
-p8213
-Violie
-p8214
-stp8215
-a(F15.144453048706055
-Vsecurity_group_rule.delete.end
-p8216
-(dp8217
-V_context_domain
-p8218
-NsV_context_request_id
-p8219
-Vreq-9a7af90a-702e-442a-b7e4-ab28aa9f6880
-p8220
-sVevent_type
-p8221
-g8216
-sV_context_auth_token
-p8222
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8223
-sV_context_resource_uuid
-p8224
-NsV_context_tenant_name
-p8225
-Vapexlake
-p8226
-sV_context_user_id
-p8227
-Vef7a4f67379f41aba489a0b6d6a62094
-p8228
-sVpayload
-p8229
-(dp8230
-Vsecurity_group_rule_id
-p8231
-Ve0d0a918-7972-4cbf-b867-d6f8827a7c00
-p8232
-ssV_context_show_deleted
-p8233
-I00
-sVpriority
-p8234
-VINFO
-p8235
-sV_context_is_admin
-p8236
-I01
-sV_context_project_domain
-p8237
-NsV_context_user
-p8238
-Vef7a4f67379f41aba489a0b6d6a62094
-p8239
-sVpublisher_id
-p8240
-Vnetwork.machine-A
-p8241
-sVmessage_id
-p8242
-Vfa71f5f8-1157-491d-b98c-230a331b4578
-p8243
-sV_context_roles
-p8244
-(lp8245
-Vadmin
-p8246
-asVtimestamp
-p8247
-V2017-11-30 11:05:19.549851
-p8248
-sV_context_timestamp
-p8249
-V2017-11-30 11:05:19.515538
-p8250
-sV_unique_id
-p8251
-V5917dcf614c04643b2178020c7ea4d4b
-p8252
-sV_context_tenant_id
-p8253
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8254
-sV_context_project_name
-p8255
-Vapexlake
-p8256
-sV_context_user_identity
-p8257
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8258
-sV_context_tenant
-p8259
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8260
-sV_context_project_id
-p8261
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8262
-sV_context_read_only
-p8263
-I00
-sV_context_user_domain
-p8264
-NsV_context_user_name
-p8265
-Violie
-p8266
-stp8267
-a(F15.154494047164917
-Vsecurity_group.delete.start
-p8268
-(dp8269
-V_context_domain
-p8270
-NsV_context_request_id
-p8271
-Vreq-95fb5f76-df92-40d6-a06e-174735ce0859
-p8272
-sVevent_type
-p8273
-g8268
-sV_context_auth_token
-p8274
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8275
-sV_context_resource_uuid
-p8276
-NsV_context_tenant_name
-p8277
-Vapexlake
-p8278
-sV_context_user_id
-p8279
-Vef7a4f67379f41aba489a0b6d6a62094
-p8280
-sVpayload
-p8281
-(dp8282
-Vsecurity_group_id
-p8283
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p8284
-ssV_context_show_deleted
-p8285
-I00
-sVpriority
-p8286
-VINFO
-p8287
-sV_context_is_admin
-p8288
-I01
-sV_context_project_domain
-p8289
-NsV_context_user
-p8290
-Vef7a4f67379f41aba489a0b6d6a62094
-p8291
-sVpublisher_id
-p8292
-Vnetwork.machine-A
-p8293
-sVmessage_id
-p8294
-V6c7786bb-8b0f-4d28-a22c-fe98d6b5caca
-p8295
-sV_context_roles
-p8296
-(lp8297
-Vadmin
-p8298
-asVtimestamp
-p8299
-V2017-11-30 11:05:19.560649
-p8300
-sV_context_timestamp
-p8301
-V2017-11-30 11:05:19.559473
-p8302
-sV_unique_id
-p8303
-V57295928d808413fa9252136c28ad1c1
-p8304
-sV_context_tenant_id
-p8305
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8306
-sV_context_project_name
-p8307
-Vapexlake
-p8308
-sV_context_user_identity
-p8309
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8310
-sV_context_tenant
-p8311
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8312
-sV_context_project_id
-p8313
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8314
-sV_context_read_only
-p8315
-I00
-sV_context_user_domain
-p8316
-NsV_context_user_name
-p8317
-Violie
-p8318
-stp8319
-a(F15.199522018432617
-Vsecurity_group.delete.end
-p8320
-(dp8321
-V_context_domain
-p8322
-NsV_context_request_id
-p8323
-Vreq-95fb5f76-df92-40d6-a06e-174735ce0859
-p8324
-sVevent_type
-p8325
-g8320
-sV_context_auth_token
-p8326
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8327
-sV_context_resource_uuid
-p8328
-NsV_context_tenant_name
-p8329
-Vapexlake
-p8330
-sV_context_user_id
-p8331
-Vef7a4f67379f41aba489a0b6d6a62094
-p8332
-sVpayload
-p8333
-(dp8334
-Vsecurity_group_id
-p8335
-V132d2a51-29b4-4c32-8fe9-72a50c5affd6
-p8336
-ssV_context_show_deleted
-p8337
-I00
-sVpriority
-p8338
-VINFO
-p8339
-sV_context_is_admin
-p8340
-I01
-sV_context_project_domain
-p8341
-NsV_context_user
-p8342
-Vef7a4f67379f41aba489a0b6d6a62094
-p8343
-sVpublisher_id
-p8344
-Vnetwork.machine-A
-p8345
-sVmessage_id
-p8346
-Vd30d5968-fd5c-47f7-813d-f79d2bfd2e91
-p8347
-sV_context_roles
-p8348
-(lp8349
-Vadmin
-p8350
-asVtimestamp
-p8351
-V2017-11-30 11:05:19.603928
-p8352
-sV_context_timestamp
-p8353
-V2017-11-30 11:05:19.559473
-p8354
-sV_unique_id
-p8355
-V7274979b4598404abcdadcf9f8d965dc
-p8356
-sV_context_tenant_id
-p8357
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8358
-sV_context_project_name
-p8359
-Vapexlake
-p8360
-sV_context_user_identity
-p8361
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5 - - -
-p8362
-sV_context_tenant
-p8363
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8364
-sV_context_project_id
-p8365
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8366
-sV_context_read_only
-p8367
-I00
-sV_context_user_domain
-p8368
-NsV_context_user_name
-p8369
-Violie
-p8370
-stp8371
-a(F16.474794149398804
-Vorchestration.stack.delete.end
-p8372
-(dp8373
-V_context_request_id
-p8374
-Vreq-de85aaf7-8013-48d9-a030-3c9431857aec
-p8375
-sVevent_type
-p8376
-g8372
-sV_context_region_name
-p8377
-NsV_context_auth_token
-p8378
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8379
-sV_context_user_id
-p8380
-Vef7a4f67379f41aba489a0b6d6a62094
-p8381
-sVpayload
-p8382
-(dp8383
-Vusername
-p8384
-NsVstate_reason
-p8385
-VStack DELETE completed successfully
-p8386
-sVuser_id
-p8387
-NsVuser_identity
-p8388
-Vef7a4f67379f41aba489a0b6d6a62094
-p8389
-sVstack_name
-p8390
-VC
-sVtenant_id
-p8391
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8392
-sVstack_identity
-p8393
-V46e5c635-6b08-47d3-8949-effa358b9485
-p8394
-sVcreate_at
-p8395
-V2017-11-30T11:03:59
-p8396
-sVstate
-p8397
-VDELETE_COMPLETE
-p8398
-ssV_context_username
-p8399
-NsV_context_show_deleted
-p8400
-I00
-sV_context_trust_id
-p8401
-NsVpriority
-p8402
-VINFO
-p8403
-sV_context_is_admin
-p8404
-I01
-sV_context_auth_token_info
-p8405
-(dp8406
-Vtoken
-p8407
-(dp8408
-Vmethods
-p8409
-(lp8410
-Vpassword
-p8411
-asVroles
-p8412
-(lp8413
-(dp8414
-Vid
-p8415
-Vd475171bf8304e06a74b1add560b1f28
-p8416
-sVname
-p8417
-Vadmin
-p8418
-sasVauth_token
-p8419
-VgAAAAABaH-XpB1UrQ7unc6NKvSuCV-aGM9LptCSigGbKrtbwWGDT49OAECh8NPen0RH9X8p1Udh4TNLfSJYnDadZ3bMrtUk5k0ETwgrgeZD5KttgVkkzYFgV4tbIGRfLMQpb2kU-HNsJ7E8x2pA5JW_Et1WXrWAZNyy6wdXpJTySGXhSwqkN9-g
-p8420
-sVexpires_at
-p8421
-V2017-11-30T12:05:13.000000Z
-p8422
-sVproject
-p8423
-(dp8424
-Vdomain
-p8425
-(dp8426
-g8415
-Vdefault
-p8427
-sg8417
-VDefault
-p8428
-ssg8415
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8429
-sg8417
-Vapexlake
-p8430
-ssVcatalog
-p8431
-(lp8432
-(dp8433
-Vendpoints
-p8434
-(lp8435
-(dp8436
-Vurl
-p8437
-Vhttp://172.18.0.8:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p8438
-sVinterface
-p8439
-Vpublic
-p8440
-sVregion
-p8441
-VRegionOne
-p8442
-sVregion_id
-p8443
-VRegionOne
-p8444
-sg8415
-V13359d68397c4732b5d455941ac95989
-p8445
-sa(dp8446
-g8437
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p8447
-sg8439
-Vinternal
-p8448
-sg8441
-VRegionOne
-p8449
-sg8443
-VRegionOne
-p8450
-sg8415
-V50aeae6c5d034dcb80871bdac7391209
-p8451
-sa(dp8452
-g8437
-Vhttp://172.16.0.5:8776/v3/187e5e95e7eb499d8a421b3d4ed966d5
-p8453
-sg8439
-Vadmin
-p8454
-sg8441
-VRegionOne
-p8455
-sg8443
-VRegionOne
-p8456
-sg8415
-V93b06f780b224cbd9b514c2041d3db63
-p8457
-sasVtype
-p8458
-Vvolumev3
-p8459
-sg8415
-V00a63293a3154089a4c80b60b4aa9429
-p8460
-sg8417
-Vcinderv3
-p8461
-sa(dp8462
-g8434
-(lp8463
-(dp8464
-g8437
-Vhttp://172.16.0.5:8000/v1
-p8465
-sg8439
-Vadmin
-p8466
-sg8441
-VRegionOne
-p8467
-sg8443
-VRegionOne
-p8468
-sg8415
-V24acffb5d9154df4981db7424b7669bd
-p8469
-sa(dp8470
-g8437
-Vhttp://172.18.0.8:8000/v1
-p8471
-sg8439
-Vpublic
-p8472
-sg8441
-VRegionOne
-p8473
-sg8443
-VRegionOne
-p8474
-sg8415
-V2f1fba9bf20544588f9cf1e6ead95bb8
-p8475
-sa(dp8476
-g8437
-Vhttp://172.16.0.5:8000/v1
-p8477
-sg8439
-Vinternal
-p8478
-sg8441
-VRegionOne
-p8479
-sg8443
-VRegionOne
-p8480
-sg8415
-V679262173a714d76a078051b95f8c969
-p8481
-sasg8458
-Vcloudformation
-p8482
-sg8415
-V245169ccae564a7db06ca002f1553b51
-p8483
-sg8417
-Vheat-cfn
-p8484
-sa(dp8485
-g8434
-(lp8486
-(dp8487
-g8437
-Vhttp://172.18.0.8:8080
-p8488
-sg8439
-Vpublic
-p8489
-sg8441
-VRegionOne
-p8490
-sg8443
-VRegionOne
-p8491
-sg8415
-V04a6ef3db6b046b1893ed45a3f906f6c
-p8492
-sa(dp8493
-g8437
-Vhttp://172.16.0.5:8080
-p8494
-sg8439
-Vinternal
-p8495
-sg8441
-VRegionOne
-p8496
-sg8443
-VRegionOne
-p8497
-sg8415
-V3e30684c9f74492b8ca9a64dd04261e6
-p8498
-sa(dp8499
-g8437
-Vhttp://172.16.0.5:8080
-p8500
-sg8439
-Vadmin
-p8501
-sg8441
-VRegionOne
-p8502
-sg8443
-VRegionOne
-p8503
-sg8415
-Vc5384b55cd7a441582f151c6b2807745
-p8504
-sasg8458
-Vs3
-p8505
-sg8415
-V5461021b7f2d42acad3c3c7f7ae4e7d7
-p8506
-sg8417
-Vswift_s3
-p8507
-sa(dp8508
-g8434
-(lp8509
-(dp8510
-g8437
-Vhttp://172.16.0.5:9696
-p8511
-sg8439
-Vadmin
-p8512
-sg8441
-VRegionOne
-p8513
-sg8443
-VRegionOne
-p8514
-sg8415
-V38b78b2c00264f59a4ade9392f88132b
-p8515
-sa(dp8516
-g8437
-Vhttp://172.18.0.8:9696
-p8517
-sg8439
-Vpublic
-p8518
-sg8441
-VRegionOne
-p8519
-sg8443
-VRegionOne
-p8520
-sg8415
-Vb5d0f72fbf674f84adf8929341e45586
-p8521
-sa(dp8522
-g8437
-Vhttp://172.16.0.5:9696
-p8523
-sg8439
-Vinternal
-p8524
-sg8441
-VRegionOne
-p8525
-sg8443
-VRegionOne
-p8526
-sg8415
-Vf3bd13e2ece54a158dddfda0ac43cfbf
-p8527
-sasg8458
-Vnetwork
-p8528
-sg8415
-V616d510ad4ec4e44bdfa51bbcd497f2a
-p8529
-sg8417
-Vneutron
-p8530
-sa(dp8531
-g8434
-(lp8532
-(dp8533
-g8437
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8534
-sg8439
-Vinternal
-p8535
-sg8441
-VRegionOne
-p8536
-sg8443
-VRegionOne
-p8537
-sg8415
-V7c60744a22724044a92928bc2fa9e422
-p8538
-sa(dp8539
-g8437
-Vhttp://172.16.0.5:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8540
-sg8439
-Vadmin
-p8541
-sg8441
-VRegionOne
-p8542
-sg8443
-VRegionOne
-p8543
-sg8415
-V8cef7ffc7dc24dc2b3bc04b695fb141f
-p8544
-sa(dp8545
-g8437
-Vhttp://172.18.0.8:8004/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8546
-sg8439
-Vpublic
-p8547
-sg8441
-VRegionOne
-p8548
-sg8443
-VRegionOne
-p8549
-sg8415
-Vde47d994bdc147bdb824474ea699a77a
-p8550
-sasg8458
-Vorchestration
-p8551
-sg8415
-V65a72244f7c54382aeebf5dfdeab8140
-p8552
-sg8417
-Vheat
-p8553
-sa(dp8554
-g8434
-(lp8555
-(dp8556
-g8437
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8557
-sg8439
-Vinternal
-p8558
-sg8441
-VRegionOne
-p8559
-sg8443
-VRegionOne
-p8560
-sg8415
-V3a25e85ecaa44b678c3721c2d3d39b38
-p8561
-sa(dp8562
-g8437
-Vhttp://172.16.0.5:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8563
-sg8439
-Vadmin
-p8564
-sg8441
-VRegionOne
-p8565
-sg8443
-VRegionOne
-p8566
-sg8415
-V68c763474c3d4aa28c4ee0e0249998eb
-p8567
-sa(dp8568
-g8437
-Vhttp://172.18.0.8:8776/v1/187e5e95e7eb499d8a421b3d4ed966d5
-p8569
-sg8439
-Vpublic
-p8570
-sg8441
-VRegionOne
-p8571
-sg8443
-VRegionOne
-p8572
-sg8415
-Ve0c861373e94468db521d5a8793d33d1
-p8573
-sasg8458
-Vvolume
-p8574
-sg8415
-V6b6f6ab8c7e0411c9f7a350a10e78341
-p8575
-sg8417
-Vcinder
-p8576
-sa(dp8577
-g8434
-(lp8578
-(dp8579
-g8437
-Vhttp://172.18.0.8:5000/v2.0
-p8580
-sg8439
-Vpublic
-p8581
-sg8441
-VRegionOne
-p8582
-sg8443
-VRegionOne
-p8583
-sg8415
-V6aa35bc15a35447db58ec5b67087f96a
-p8584
-sa(dp8585
-g8437
-Vhttp://172.16.0.5:5000/v2.0
-p8586
-sg8439
-Vinternal
-p8587
-sg8441
-VRegionOne
-p8588
-sg8443
-VRegionOne
-p8589
-sg8415
-V6b4742f26b694b93bdbcb37304d22f69
-p8590
-sa(dp8591
-g8437
-Vhttp://172.16.0.5:35357/v2.0
-p8592
-sg8439
-Vadmin
-p8593
-sg8441
-VRegionOne
-p8594
-sg8443
-VRegionOne
-p8595
-sg8415
-Vadc120ea606644a299a3c91a7ceeb8c4
-p8596
-sasg8458
-Videntity
-p8597
-sg8415
-V9f95de9f4efc4730b4dd90354894e1dc
-p8598
-sg8417
-Vkeystone
-p8599
-sa(dp8600
-g8434
-(lp8601
-(dp8602
-g8437
-Vhttp://172.16.0.5:9292
-p8603
-sg8439
-Vadmin
-p8604
-sg8441
-VRegionOne
-p8605
-sg8443
-VRegionOne
-p8606
-sg8415
-V049519f829be4e7fb5f44ae9f470efdf
-p8607
-sa(dp8608
-g8437
-Vhttp://172.18.0.8:9292
-p8609
-sg8439
-Vpublic
-p8610
-sg8441
-VRegionOne
-p8611
-sg8443
-VRegionOne
-p8612
-sg8415
-V1baebbbf35744192b335f4f293d1a9d8
-p8613
-sa(dp8614
-g8437
-Vhttp://172.16.0.5:9292
-p8615
-sg8439
-Vinternal
-p8616
-sg8441
-VRegionOne
-p8617
-sg8443
-VRegionOne
-p8618
-sg8415
-V1dbb6bbe5c9647f780cb0f83f24b1f02
-p8619
-sasg8458
-Vimage
-p8620
-sg8415
-Va39ec0213acc45ceb59346299e78d6c0
-p8621
-sg8417
-Vglance
-p8622
-sa(dp8623
-g8434
-(lp8624
-(dp8625
-g8437
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8626
-sg8439
-Vinternal
-p8627
-sg8441
-VRegionOne
-p8628
-sg8443
-VRegionOne
-p8629
-sg8415
-V2cd9d66e95484830a9006177e301aa57
-p8630
-sa(dp8631
-g8437
-Vhttp://172.18.0.8:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8632
-sg8439
-Vpublic
-p8633
-sg8441
-VRegionOne
-p8634
-sg8443
-VRegionOne
-p8635
-sg8415
-Vbe2d979150a2401b9e7d5c365372d093
-p8636
-sa(dp8637
-g8437
-Vhttp://172.16.0.5:8774/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8638
-sg8439
-Vadmin
-p8639
-sg8441
-VRegionOne
-p8640
-sg8443
-VRegionOne
-p8641
-sg8415
-Vfe9ab7d8b21d4a68a8a0e5abc71f107c
-p8642
-sasg8458
-Vcompute_legacy
-p8643
-sg8415
-Va4dd95e3fde340468f8c1d7df9a853d0
-p8644
-sg8417
-Vcompute_legacy
-p8645
-sa(dp8646
-g8434
-(lp8647
-(dp8648
-g8437
-Vhttp://172.16.0.5:8774/v2.1
-p8649
-sg8439
-Vadmin
-p8650
-sg8441
-VRegionOne
-p8651
-sg8443
-VRegionOne
-p8652
-sg8415
-V0307d2c32dd54839aa5bc39746eeb186
-p8653
-sa(dp8654
-g8437
-Vhttp://172.18.0.8:8774/v2.1
-p8655
-sg8439
-Vpublic
-p8656
-sg8441
-VRegionOne
-p8657
-sg8443
-VRegionOne
-p8658
-sg8415
-Vca7d2e3b6bb540848b9922a2a6eb5816
-p8659
-sa(dp8660
-g8437
-Vhttp://172.16.0.5:8774/v2.1
-p8661
-sg8439
-Vinternal
-p8662
-sg8441
-VRegionOne
-p8663
-sg8443
-VRegionOne
-p8664
-sg8415
-Vdb005ab592334fc599c142cf861e754f
-p8665
-sasg8458
-Vcompute
-p8666
-sg8415
-Vc165d40b8c3849bcb6067a3df2540c62
-p8667
-sg8417
-Vnova
-p8668
-sa(dp8669
-g8434
-(lp8670
-(dp8671
-g8437
-Vhttp://172.16.0.5:8080/swift/v1
-p8672
-sg8439
-Vadmin
-p8673
-sg8441
-VRegionOne
-p8674
-sg8443
-VRegionOne
-p8675
-sg8415
-V18b7e1c32c344ad4855f4956b1d8c5ea
-p8676
-sa(dp8677
-g8437
-Vhttp://172.16.0.5:8080/swift/v1
-p8678
-sg8439
-Vinternal
-p8679
-sg8441
-VRegionOne
-p8680
-sg8443
-VRegionOne
-p8681
-sg8415
-V764118d3a33444ac980632d281acf4a7
-p8682
-sa(dp8683
-g8437
-Vhttp://172.18.0.8:8080/swift/v1
-p8684
-sg8439
-Vpublic
-p8685
-sg8441
-VRegionOne
-p8686
-sg8443
-VRegionOne
-p8687
-sg8415
-Vf8210ccd43f7415ebbcf6e8ea592243e
-p8688
-sasg8458
-Vobject-store
-p8689
-sg8415
-Vc212b6b3e0cd4c7284b731ced2bf3d0b
-p8690
-sg8417
-Vswift
-p8691
-sa(dp8692
-g8434
-(lp8693
-(dp8694
-g8437
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8695
-sg8439
-Vinternal
-p8696
-sg8441
-VRegionOne
-p8697
-sg8443
-VRegionOne
-p8698
-sg8415
-V61ea745c91ab4eb59464679931219024
-p8699
-sa(dp8700
-g8437
-Vhttp://172.16.0.5:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8701
-sg8439
-Vadmin
-p8702
-sg8441
-VRegionOne
-p8703
-sg8443
-VRegionOne
-p8704
-sg8415
-V6413dd7ccf1b4c0c978d3d771fbdb3d0
-p8705
-sa(dp8706
-g8437
-Vhttp://172.18.0.8:8776/v2/187e5e95e7eb499d8a421b3d4ed966d5
-p8707
-sg8439
-Vpublic
-p8708
-sg8441
-VRegionOne
-p8709
-sg8443
-VRegionOne
-p8710
-sg8415
-V7155772851884dc6954c7345d350796f
-p8711
-sasg8458
-Vvolumev2
-p8712
-sg8415
-Vf261a48944ad44d6aeda3d2f1a2961c3
-p8713
-sg8417
-Vcinderv2
-p8714
-sa(dp8715
-g8434
-(lp8716
-(dp8717
-g8437
-Vhttp://172.18.0.8:9494
-p8718
-sg8439
-Vpublic
-p8719
-sg8441
-VRegionOne
-p8720
-sg8443
-VRegionOne
-p8721
-sg8415
-V43a202e889694d51a3b11899c252a8a9
-p8722
-sa(dp8723
-g8437
-Vhttp://172.16.0.5:9494
-p8724
-sg8439
-Vadmin
-p8725
-sg8441
-VRegionOne
-p8726
-sg8443
-VRegionOne
-p8727
-sg8415
-Vfa3c9de06e854542b236aa24b53e19a1
-p8728
-sa(dp8729
-g8437
-Vhttp://172.16.0.5:9494
-p8730
-sg8439
-Vinternal
-p8731
-sg8441
-VRegionOne
-p8732
-sg8443
-VRegionOne
-p8733
-sg8415
-Vfc954edc6dc84190bdded3fbdadd2ea3
-p8734
-sasg8458
-Vartifact
-p8735
-sg8415
-Vf8de823ac3494ff9a3e4314f0ec00caa
-p8736
-sg8417
-Vglare
-p8737
-sasVversion
-p8738
-Vv3
-p8739
-sVuser
-p8740
-(dp8741
-g8425
-(dp8742
-g8415
-Vdefault
-p8743
-sg8417
-VDefault
-p8744
-ssg8415
-Vef7a4f67379f41aba489a0b6d6a62094
-p8745
-sg8417
-Violie
-p8746
-ssVaudit_ids
-p8747
-(lp8748
-VuQuM0ZhiSbC3Wev8-OlRyw
-p8749
-asVissued_at
-p8750
-V2017-11-30T11:05:13.000000Z
-p8751
-sssV_context_user
-p8752
-NsVpublisher_id
-p8753
-Vorchestration.machine-A
-p8754
-sVmessage_id
-p8755
-Ve60be5c6-61cb-4b16-bac3-9be9cb2fb729
-p8756
-sV_context_roles
-p8757
-(lp8758
-Vadmin
-p8759
-asV_context_auth_url
-p8760
-Vhttp://172.16.0.5:35357/v3/
-p8761
-sVtimestamp
-p8762
-V2017-11-30 11:05:20.878132
-p8763
-sV_unique_id
-p8764
-V0d90d034ffdf4bf2a21ca6a660a81d81
-p8765
-sV_context_tenant_id
-p8766
-V187e5e95e7eb499d8a421b3d4ed966d5
-p8767
-sV_context_user_domain_id
-p8768
-Vdefault
-p8769
-sV_context_password
-p8770
-NsV_context_trustor_user_id
-p8771
-NsV_context_project_domain_id
-p8772
-Vdefault
-p8773
-sV_context_aws_creds
-p8774
-NsV_context_tenant
-p8775
-Vapexlake
-p8776
-sV_context_user_identity
-p8777
-Vef7a4f67379f41aba489a0b6d6a62094 187e5e95e7eb499d8a421b3d4ed966d5
-p8778
-stp8779
-a.
@@ -81,6 +81,34 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(expected_value, actual_value,
                          "Returned value does not match set value")
 
+    def test_flush_cached_until_set(self):
+        """
+        Tests that the parsed flush value is reused until it is changed.
+        """
+        self.assertFalse(self.conf_manager.get_flush())
+        self.conf_manager.general['flush'] = "True"
+        self.assertFalse(self.conf_manager.get_flush())
+
+        self.conf_manager.set_variable("general", "flush", "True")
+        self.assertTrue(self.conf_manager.get_flush())
+        self.conf_manager.set_variable("general", "flush", "False")
+
+    def test_set_variable_written_on_flush(self):
+        """
+        Tests that set values only reach the config file on flush.
+        """
+        self.conf_manager.set_variable("general", "pending", "yes")
+        on_disk = configuration.ConfigurationManager(
+            self.conf_manager.config_file)
+        on_disk.add_section("general")
+        self.assertIsNone(on_disk.get_variable("general", "pending"))
+
+        self.conf_manager.flush()
+        on_disk = configuration.ConfigurationManager(
+            self.conf_manager.config_file)
+        on_disk.add_section("general")
+        self.assertEqual(on_disk.get_variable("general", "pending"), "yes")
+
     def get_test_hwloc_folder():
         tests_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
         return tests_dir
@@ -94,3 +122,20 @@ class TestConfiguration(unittest.TestCase):
         machines = self.conf_manager.get_machines()
         self.assertIn('machine-A', machines)
 
+    @mock.patch('landscaper.utilities.configuration.os.listdir')
+    @mock.patch('landscaper.utilities.configuration.ConfigurationManager.get_hwloc_folder', side_effect=get_test_hwloc_folder)
+    def test_get_machines_cached(self, mck_folder, mck_listdir):
+        """
+        Tests that the hwloc folder is only listed again once it changes.
+        """
+        mck_listdir.return_value = ['machine-A_hwloc.xml']
+        self.conf_manager.get_machines()
+        self.conf_manager.get_machines()
+        self.assertEqual(mck_listdir.call_count, 1)
+
+        mtime = os.stat(mck_folder()).st_mtime
+        with mock.patch('landscaper.utilities.configuration.os.stat') as mck_stat:
+            mck_stat.return_value.st_mtime = mtime + 1
+            self.conf_manager.get_machines()
+        self.assertEqual(mck_listdir.call_count, 2)
+
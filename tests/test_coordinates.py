@@ -14,6 +14,7 @@
 """
 Tests for coordinates retrieval
 """
+# pylint: disable=W0212
 import os
 import unittest
 import mock
@@ -94,3 +95,24 @@ class TestCoordinatesRetrieval(unittest.TestCase):
                  [100.0, 1.0], [100.0, 0.0]]
                 ]
         })
+
+    @mock.patch("landscaper.utilities.coordinates.json_decoder")
+    @mock.patch("landscaper.utilities.coordinates.paths")
+    def test_coordinates_parsed_once(self, mck_paths, mck_json):
+        """
+        The coordinates file is only parsed again after it is modified.
+        """
+        mck_paths.COORDINATES = self.coords_path
+        mck_json.loads.return_value = {"features": []}
+        coordinates._COORDINATES_CACHE.clear()
+
+        coordinates.component_coordinates("machine-B")
+        coordinates.component_coordinates("machine-C")
+        self.assertEqual(mck_json.loads.call_count, 1)
+
+        mtime = os.path.getmtime(self.coords_path)
+        with mock.patch("landscaper.utilities.coordinates.os.path.getmtime",
+                        return_value=mtime + 1):
+            coordinates.component_coordinates("machine-B")
+        self.assertEqual(mck_json.loads.call_count, 2)
+        coordinates._COORDINATES_CACHE.clear()
@@ -36,30 +36,32 @@ IDENTITY_ATTR = {'layer': 'virtual', 'type': 'vm', 'category': 'compute'}
 STATE_ATTR = {'vcpu': None, 'mem': None}
 
 
-class TestEphemeralDiskRetrieval(unittest.TestCase):
+def _read_xml_dump():
     """
-    Unittests for the ephemeral disk methods.
+    Reads the libvirt domain dump used by the tests.
+    :return: Contents of the dump.
     """
-    def setUp(self):
-        utils.create_test_config()
-        manager = LandscapeManager(utils.TEST_CONFIG_FILE)
-        self.graph_db = manager.graph_db
-        self.graph_db.delete_all()
-        self.conf_manager = manager.conf_manager
-        self.conf_manager.add_section('physical_layer')
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    xml_file_path = os.path.join(tests_dir, 'data/ephemeral_collector.xml')
+    with open(xml_file_path, 'r') as file_handler:
+        return file_handler.read().strip()
 
-        confmgr_mock = mock.Mock()
-        confmgr_mock.get_types_to_filter.return_value = []
-        confmgr_mock.get_machines.return_value = ['machine-A']
 
-        self.collector = edc.EphemeralDiskCollector(self.graph_db,
+class TestEphemeralDiskUnit(unittest.TestCase):
+    """
+    Unittests for the ephemeral disk methods, against a mocked graph
+    database.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.xml_dump = _read_xml_dump()
+
+    def setUp(self):
+        self.conf_manager = mock.Mock()
+        self.conf_manager.get_machines.return_value = ['machine-A']
+        self.collector = edc.EphemeralDiskCollector(mock.Mock(),
                                                     self.conf_manager,
                                                     mock.Mock())
-        tests_dir = os.path.dirname(os.path.abspath(__file__))
-        self.xml_file_path = os.path.join(tests_dir,
-                                          'data/ephemeral_collector.xml')
-        file_handler = open(self.xml_file_path, 'r')
-        self.xml_dump = file_handler.read().strip()
 
     @mock.patch("landscaper.collector.ephemeral_disk_collector.paramiko")
     @mock.patch("landscaper.collector.ephemeral_disk_collector.LOG")
@@ -102,13 +104,126 @@ class TestEphemeralDiskRetrieval(unittest.TestCase):
         self.assertIsNone(ssh_client)
         self.assertTrue(mck_log.error.called)
 
+    @mock.patch("landscaper.collector.ephemeral_disk_collector.paramiko")
+    def test_ssh_client_reused(self, mck_paramiko):
+        """
+        Check that an active ssh client is reused for the same host.
+        """
+        client = mck_paramiko.SSHClient.return_value
+        client.get_transport.return_value.is_active.return_value = True
+
+        first = self.collector._ssh_client('127.0.0.1')
+        second = self.collector._ssh_client('127.0.0.1')
+        self.assertIs(first, second)
+        self.assertEqual(client.connect.call_count, 1)
+
+        client.get_transport.return_value.is_active.return_value = False
+        self.collector._ssh_client('127.0.0.1')
+        self.assertEqual(client.connect.call_count, 2)
+
+    def test_host_dumps_requested_together(self):
+        """
+        Check that the domain dumps of a host are all requested before any
+        of them is read.
+        """
+        domains = ["instance-{}".format(i) for i in range(10)]
+        calls = []
+
+        def read():
+            """ Records a read of a command output. """
+            calls.append("read")
+            return self.xml_dump
+
+        def exec_command(cmd):
+            """ Records a command run over ssh. """
+            calls.append(cmd)
+            return None, mock.Mock(read=read), None
+
+        ssh_client = mock.Mock()
+        ssh_client.exec_command.side_effect = exec_command
+        self.collector._ssh_client = mock.Mock(return_value=ssh_client)
+        self.collector._libvirt_domains = mock.Mock(return_value=domains)
+
+        self.collector._host_ephemeral_disks("machine-A")
+        first_batch = ["virsh dumpxml {}".format(dom)
+                       for dom in domains[:edc.SSH_CHANNELS]]
+        self.assertEqual(calls[:edc.SSH_CHANNELS], first_batch)
+        self.assertEqual(calls.count("read"), len(domains))
+        self.assertEqual(self.collector.instance_disks.keys(),
+                         ["194e4602-3c79-43ae-a27f-eed56a69aacd"])
+
     def test_machine_hosts(self):
         """
         Test correct host.
         """
-        # test that a list of machines can be obtained - get from config
+        # test that a list of machines can be obtained from the config
         self.assertTrue(self.collector.hosts[0] == 'machine-A')
 
+    def test_delete_instance_bulk_lookup(self):
+        """
+        The disks of a deleted instance are fetched in one call.
+        """
+        graph_db = mock.Mock()
+        graph_db.get_nodes_by_uuids.return_value = {"inst-1_vda": "vda-node"}
+        collector = edc.EphemeralDiskCollector(graph_db, self.conf_manager,
+                                               mock.Mock())
+        collector.instance_disk_lookup = {"inst-1": ["inst-1_vda",
+                                                     "inst-1_vdb"]}
+
+        collector._delete_instance("inst-1", 5)
+        graph_db.get_nodes_by_uuids.assert_called_once_with(["inst-1_vda",
+                                                             "inst-1_vdb"])
+        graph_db.delete_node.assert_called_once_with("vda-node", 5)
+        self.assertFalse(graph_db.get_node_by_uuid.called)
+
+    @mock.patch("landscaper.collector.ephemeral_disk_collector.time")
+    def test_init_graph_db_bulk_lookup(self, mck_time):
+        """
+        The instance nodes are fetched in one call when building the graph.
+        """
+        mck_time.time.return_value = 5
+        graph_db = mock.Mock()
+        inst_node = {"name": "inst-1"}
+        graph_db.get_nodes_by_uuids.return_value = {"inst-1": inst_node}
+        graph_db.add_nodes_bulk.return_value = ["vda-node", "vdb-node"]
+        collector = edc.EphemeralDiskCollector(graph_db, self.conf_manager,
+                                               mock.Mock())
+        collector.instance_disks = {"inst-1": [("vda", {}), ("vdb", {})],
+                                    "inst-2": []}
+
+        with mock.patch.object(collector, "_retrieve_instance_disks"):
+            collector.init_graph_db()
+
+        graph_db.get_nodes_by_uuids.assert_called_once_with(
+            collector.instance_disks)
+        self.assertFalse(graph_db.get_node_by_uuid.called)
+        self.assertEqual(len(graph_db.add_nodes_bulk.call_args[0][0]), 2)
+        graph_db.add_edges_bulk.assert_called_once_with(
+            [(inst_node, "vda-node"), (inst_node, "vdb-node")], 5, "ON")
+        self.assertEqual(collector.instance_disk_lookup["inst-1"],
+                         ["inst-1_vda", "inst-1_vdb"])
+
+
+class TestEphemeralDiskIntegration(unittest.TestCase):
+    """
+    Tests of the ephemeral disks stored in the graph database.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.xml_dump = _read_xml_dump()
+
+        utils.create_test_config()
+        manager = LandscapeManager(utils.TEST_CONFIG_FILE)
+        cls.graph_db = manager.graph_db
+        cls.conf_manager = manager.conf_manager
+        cls.conf_manager.add_section('physical_layer')
+
+    def setUp(self):
+        self.graph_db.delete_all()
+        self.collector = edc.EphemeralDiskCollector(self.graph_db,
+                                                    self.conf_manager,
+                                                    mock.Mock())
+
     def test_instance_disks(self):
         """
         Test for correct instance disks
@@ -133,11 +248,9 @@ class TestEphemeralDiskRetrieval(unittest.TestCase):
 
         # test real graphDB
         vdz_id = "194e4602-3c79-43ae-a27f-eed56a69aacd_vdz"
-        vda_id = "194e4602-3c79-43ae-a27f-eed56a69aacd_vdz"
-        vdz_nodes = self.graph_db.get_nodes_by_properties({"name": vdz_id})
-        vda_nodes = self.graph_db.get_nodes_by_properties({"name": vda_id})
-        self.assertEquals(len(vdz_nodes), 1)
-        self.assertEquals(len(vda_nodes), 1)
+        vda_id = "194e4602-3c79-43ae-a27f-eed56a69aacd_vda"
+        disk_nodes = self.graph_db.get_nodes_by_uuids([vdz_id, vda_id])
+        self.assertItemsEqual(disk_nodes.keys(), [vdz_id, vda_id])
 
     def _add_instance(self, uuid, vcpus, mem, name, hostname, timestamp):
         """
@@ -150,7 +263,8 @@ class TestEphemeralDiskRetrieval(unittest.TestCase):
         :param timestamp: Epoch timestamp.
         """
         identity, state = self._create_instance_nodes(vcpus, mem, name)
-        inst_node = self.graph_db.add_node(uuid, identity, state, timestamp)
+        inst_node = self.graph_db.add_nodes_bulk([(uuid, identity, state)],
+                                                 timestamp)[0]
         machine = self.collector._get_machine_node(hostname)
 
         # Creates the edge between the instance and the machine.
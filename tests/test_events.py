@@ -14,7 +14,7 @@
 """
 Tests event update methods for core openstack collectors.
 """
-import cPickle as pickle
+import json
 import logging
 import unittest
 import mock
@@ -33,137 +33,152 @@ from tests.test_utils import utils
 
 # pylint: disable=W0212
 LOG = logging.getLogger(__name__)
+ADD_1_STACK = 'tests/data/events/add_1_stack.json'
+DELETE_1_STACK = 'tests/data/events/delete_1_stack.json'
+
+# Events sent by the collector helpers.
+HEAT_ADD = heat_collector.ADD_EVENTS[0]
+HEAT_DELETE = heat_collector.DELETE_EVENTS[0]
+NOVA_ADD = nova_collector.ADD_EVENTS[0]
+NOVA_DELETE = nova_collector.DELETE_EVENTS[0]
+PORT_ADD = neutron_collector.PORT_ADD_EVENTS[0]
+PORT_DELETE = neutron_collector.PORT_DELETE_EVENTS[0]
+VOLUME_ADD = cinder_collector.ADD_EVENTS[0]
+VOLUME_DELETE = cinder_collector.DELETE_EVENTS[0]
+
+# Parsed event files, keyed on path.
+_EVENTS_CACHE = {}
+
+
+class _Record(object):
+    """
+    Plain object holding the attributes it is given, standing in for the
+    objects returned by the openstack clients.
+    """
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class _Clock(object):
+    """
+    Stands in for the time module of a collector, reporting a set time.
+    """
+    def __init__(self):
+        self.now = None
+
+    def time(self):
+        """
+        :return: The set time.
+        """
+        return self.now
 
 
 class TestOpenstackCollectorEvents(unittest.TestCase):
     """
     Test the events for the openstack collectors.
     """
-    nova_module = "landscaper.collector.nova_collector"
+    collector_modules = ["heat_collector", "nova_collector",
+                         "neutron_collector", "cinder_collector"]
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         utils.create_test_config()
         test_conf = utils.TEST_CONFIG_FILE
-        self.conf_manager = configuration.ConfigurationManager(test_conf)
-        self.events_manager = events_manager.EventsManager()
-        self.graph_db = neo4j_db.Neo4jGDB(self.conf_manager)
+        cls.conf_manager = configuration.ConfigurationManager(test_conf)
+        cls.events_manager = events_manager.EventsManager()
+        cls.graph_db = neo4j_db.Neo4jGDB(cls.conf_manager)
+
+    @classmethod
+    def tearDownClass(cls):
+        utils.remove_test_config()
+
+    def setUp(self):
+        # Patch the openstack clients and clocks of the collectors.
+        self.mck_os = {}
+        self.clocks = {}
+        for module in self.collector_modules:
+            module_path = "landscaper.collector." + module
+            self.clocks[module] = _Clock()
+            os_patch = patch(module_path + ".openstack")
+            time_patch = patch(module_path + ".time", self.clocks[module])
+            self.mck_os[module] = os_patch.start()
+            time_patch.start()
+            self.addCleanup(os_patch.stop)
+            self.addCleanup(time_patch.stop)
+
+        # Collectors under test, using the patched modules.
+        self.heat_coll = heat_collector.HeatCollectorV1(
+            self.graph_db, self.conf_manager, self.events_manager)
+        self.nova_coll = nova_collector.NovaCollectorV2(
+            self.graph_db, self.conf_manager, self.events_manager)
+        self.neutron_coll = neutron_collector.NeutronCollectorV2(
+            self.graph_db, self.conf_manager, self.events_manager)
+        self.cinder_coll = cinder_collector.CinderCollectorV2(
+            self.graph_db, self.conf_manager, self.events_manager)
 
         # Disable logging.
         logging.disable(logging.CRITICAL)
 
     def tearDown(self):
-        utils.remove_test_config()
         self.graph_db.delete_all()
         logging.disable(logging.NOTSET)
 
-    @patch("landscaper.collector.heat_collector.openstack")
-    @patch("landscaper.collector.heat_collector.time")
-    def _add_stack(self, stack_id, stack_name, resource_ids, mck_time, mck_os):
-        mck_time.time.return_value = "1502828001"
-        stack_obj = self._to_object({"id": stack_id, "stack_name": stack_name})
-        heat = mck_os.OpenStackClientRegistry().get_heat_v1_client()
+    def _add_stack(self, stack_id, stack_name, resource_ids):
+        self.clocks["heat_collector"].now = "1502828001"
+        stack_obj = _Record(id=stack_id, stack_name=stack_name)
+        heat_os = self.mck_os["heat_collector"]
+        heat = heat_os.OpenStackClientRegistry().get_heat_v1_client()
         heat.stacks.get.return_value = stack_obj
         heat.stacks.template.return_value = "<>"
 
-        resources = []
-        for res_id in resource_ids:
-            resources.append(self._to_object({"physical_resource_id": res_id}))
-        heat.resources.list.return_value = resources
-
-        heat_coll = heat_collector.HeatCollectorV1(self.graph_db,
-                                                   self.conf_manager,
-                                                   self.events_manager)
+        heat.resources.list.return_value = [
+            _Record(physical_resource_id=res_id, resource_type=None)
+            for res_id in resource_ids]
 
         event_body = {"payload": {"stack_identity": stack_id}}
-        heat_coll.update_graph_db(heat_collector.ADD_EVENTS[0], event_body)
+        self.heat_coll.update_graph_db(HEAT_ADD, event_body)
 
-    @patch("landscaper.collector.nova_collector.openstack")
-    @patch("landscaper.collector.nova_collector.time")
-    def _delete_nova_instance(self, instance_id, mck_time, _):
-        mck_time.time.return_value = "1502825001"
+    def _delete_nova_instance(self, instance_id):
+        self.clocks["nova_collector"].now = "1502825001"
         event_body = {"payload": {"instance_id": instance_id}}
-        delete_event = nova_collector.DELETE_EVENTS[0]
-        nova_coll = nova_collector.NovaCollectorV2(self.graph_db,
-                                                   self.conf_manager,
-                                                   self.events_manager)
-        nova_coll.update_graph_db(delete_event, event_body)
-
-    @patch("landscaper.collector.neutron_collector.openstack")
-    @patch("landscaper.collector.neutron_collector.time")
-    def _delete_neutron_vnic(self, port_id, mck_time, _):
-        mck_time.time.return_value = "1502825001"
-        delete_port_event = neutron_collector.PORT_DELETE_EVENTS[0]
+        self.nova_coll.update_graph_db(NOVA_DELETE, event_body)
+
+    def _delete_neutron_vnic(self, port_id):
+        self.clocks["neutron_collector"].now = "1502825001"
         event_body = {"payload": {"port_id": port_id}}
-        neutron_col = neutron_collector.NeutronCollectorV2(self.graph_db,
-                                                           self.conf_manager,
-                                                           self.events_manager)
-        neutron_col.update_graph_db(delete_port_event, event_body)
-
-    @patch("landscaper.collector.cinder_collector.openstack")
-    @patch("landscaper.collector.cinder_collector.time")
-    def _delete_cinder_volume(self, volume_id, mck_time, _):
-        mck_time.time.return_value = "1502825001"
-        delete_volume_event = cinder_collector.DELETE_EVENTS[0]
+        self.neutron_coll.update_graph_db(PORT_DELETE, event_body)
+
+    def _delete_cinder_volume(self, volume_id):
+        self.clocks["cinder_collector"].now = "1502825001"
         event_body = {"payload": {"volume_id": volume_id}}
-        cinder_coll = cinder_collector.CinderCollectorV2(self.graph_db,
-                                                         self.conf_manager,
-                                                         self.events_manager)
-        cinder_coll.update_graph_db(delete_volume_event, event_body)
-
-    @patch("landscaper.collector.heat_collector.openstack")
-    @patch("landscaper.collector.heat_collector.time")
-    def _delete_heat_stack(self, stack_id, mck_time, _):
-        mck_time.time.return_value = "1502825001"
-        delete_stack_event = heat_collector.DELETE_EVENTS[0]
+        self.cinder_coll.update_graph_db(VOLUME_DELETE, event_body)
+
+    def _delete_heat_stack(self, stack_id):
+        self.clocks["heat_collector"].now = "1502825001"
         event_body = {"payload": {'stack_identity': stack_id}}
-        heat_coll = heat_collector.HeatCollectorV1(self.graph_db,
-                                                   self.conf_manager,
-                                                   self.events_manager)
-        heat_coll.update_graph_db(delete_stack_event, event_body)
-
-    @patch("landscaper.collector.nova_collector.openstack")
-    @patch("landscaper.collector.nova_collector.time")
-    def _add_nova_instance(self, uuid, host, name, mck_time, _):
-        mck_time.time.return_value = "1502828001"
-        nova_coll = nova_collector.NovaCollectorV2(self.graph_db,
-                                                   self.conf_manager,
-                                                   self.events_manager)
-        add_event = nova_collector.ADD_EVENTS[0]
+        self.heat_coll.update_graph_db(HEAT_DELETE, event_body)
+
+    def _add_nova_instance(self, uuid, host, name):
+        self.clocks["nova_collector"].now = "1502828001"
         event_body = {"payload": {"instance_id": uuid, "display_name": name,
                                   "host": host}}
-        nova_coll.update_graph_db(add_event, event_body)
-
-    @patch("landscaper.collector.neutron_collector.openstack")
-    @patch("landscaper.collector.neutron_collector.time")
-    def _add_neutron_port(self, prt_id, net_id, instance_id, mck_time, _):
-        mck_time.time.return_value = "1502828001"
-        neutron_col = neutron_collector.NeutronCollectorV2(self.graph_db,
-                                                           self.conf_manager,
-                                                           self.events_manager)
-        add_event = neutron_collector.PORT_ADD_EVENTS[0]
+        self.nova_coll.update_graph_db(NOVA_ADD, event_body)
+
+    def _add_neutron_port(self, prt_id, net_id, instance_id):
+        self.clocks["neutron_collector"].now = "1502828001"
         event_body = {"payload": {"port": {"id": prt_id,
                                            "network_id": net_id,
                                            "device_id": instance_id}}}
-        neutron_col.update_graph_db(add_event, event_body)
+        self.neutron_coll.update_graph_db(PORT_ADD, event_body)
 
-    @staticmethod
-    def _to_object(variables):
-        return type("object", (object,), variables)
-
-    @patch("landscaper.collector.cinder_collector.openstack")
-    @patch("landscaper.collector.cinder_collector.time")
-    def _add_volume(self, instance, volume_id, mck_time, _):
-        mck_time.time.return_value = "1502828001"
+    def _add_volume(self, instance, volume_id):
+        self.clocks["cinder_collector"].now = "1502828001"
 
         event_body = {"payload": {"volume_id": volume_id,
                                   "volume_attachment":
                                       [{"instance_uuid": instance,
                                         "attach_status": "attached"}]}}
-        cinder_coll = cinder_collector.CinderCollectorV2(self.graph_db,
-                                                         self.conf_manager,
-                                                         self.events_manager)
-        add_volume_event = cinder_collector.ADD_EVENTS[0]
-        cinder_coll.update_graph_db(add_volume_event, event_body)
+        self.cinder_coll.update_graph_db(VOLUME_ADD, event_body)
 
     def test_create_service(self):
         """
@@ -207,29 +222,37 @@ class TestNeutronEvents(unittest.TestCase):
     """
     landscape_file = "tests/data/test_landscape_with_states.json"
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         conf_manager = configuration.ConfigurationManager()
         event_manager = events_manager.EventsManager()
         # Set up the graph database.
-        self.graph_db = neo4j_db.Neo4jGDB(conf_manager)
-        self.graph_db.delete_all()
-        self.graph_db.load_test_landscape(self.landscape_file)
+        cls.graph_db = neo4j_db.Neo4jGDB(conf_manager)
+        cls.landscape = utils.read_landscape(cls.landscape_file)
 
         # Patch up nova and neutron openstack.
-        nova_patch = patch('landscaper.collector.nova_collector.openstack')
-        net_patch = patch('landscaper.collector.neutron_collector.openstack')
-        self.addCleanup(nova_patch.stop)
-        self.addCleanup(net_patch.stop)
-        nova_patch.start()
-        net_patch.start()
+        cls.patches = [
+            patch('landscaper.collector.nova_collector.openstack'),
+            patch('landscaper.collector.neutron_collector.openstack')]
+        for os_patch in cls.patches:
+            os_patch.start()
 
         # Set up landscaper classes.
-        self.listener = os_rabbitmq_listener.OSRabbitMQListener(event_manager,
-                                                                conf_manager)
-        nova_collector.NovaCollectorV2(self.graph_db, conf_manager,
+        cls.listener = os_rabbitmq_listener.OSRabbitMQListener(event_manager,
+                                                               conf_manager)
+        nova_collector.NovaCollectorV2(cls.graph_db, conf_manager,
                                        event_manager)
-        neutron_collector.NeutronCollectorV2(self.graph_db, conf_manager,
+        neutron_collector.NeutronCollectorV2(cls.graph_db, conf_manager,
                                              event_manager)
+
+    @classmethod
+    def tearDownClass(cls):
+        for os_patch in cls.patches:
+            os_patch.stop()
+
+    def setUp(self):
+        self.graph_db.delete_all()
+        self.graph_db.load_test_landscape(self.landscape)
         logging.disable(logging.ERROR)
 
     def tearDown(self):
@@ -246,7 +269,7 @@ class TestNeutronEvents(unittest.TestCase):
         machine = 'machine-B'
 
         # Launch the events against the database.
-        _simulate_events(self.listener, 'tests/data/events/add_1_stack.p')
+        _simulate_events(self.listener, ADD_1_STACK)
         vm_subgraph = self.graph_db.get_subgraph(instance, json_out=False)
 
         # Check that the vm is connecting properly.
@@ -267,31 +290,37 @@ class TestCinderEvents(unittest.TestCase):
     """
     landscape_file = "tests/data/test_landscape_with_states.json"
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Initialise managers with test config..
         utils.create_test_config()
         conf = configuration.ConfigurationManager(utils.TEST_CONFIG_FILE)
         event_m = events_manager.EventsManager()
 
         # Set up the graph database.
-        self.graph_db = neo4j_db.Neo4jGDB(conf)
-        self.graph_db.delete_all()
-        self.graph_db.load_test_landscape(self.landscape_file)
+        cls.graph_db = neo4j_db.Neo4jGDB(conf)
+        cls.landscape = utils.read_landscape(cls.landscape_file)
 
-        # Patch up nova and neutron openstack.
-        nova_patch = patch('landscaper.collector.nova_collector.openstack')
-        cinder_patch = patch(
-            'landscaper.collector.cinder_collector.openstack')
-        self.addCleanup(nova_patch.stop)
-        self.addCleanup(cinder_patch.stop)
-        nova_patch.start()
-        cinder_patch.start()
+        # Patch up nova and cinder openstack.
+        cls.patches = [
+            patch('landscaper.collector.nova_collector.openstack'),
+            patch('landscaper.collector.cinder_collector.openstack')]
+        for os_patch in cls.patches:
+            os_patch.start()
 
         # Set up landscaper classes.
-        self.listener = os_rabbitmq_listener.OSRabbitMQListener(event_m,
-                                                                conf)
-        nova_collector.NovaCollectorV2(self.graph_db, conf, event_m)
-        cinder_collector.CinderCollectorV2(self.graph_db, conf, event_m)
+        cls.listener = os_rabbitmq_listener.OSRabbitMQListener(event_m, conf)
+        nova_collector.NovaCollectorV2(cls.graph_db, conf, event_m)
+        cinder_collector.CinderCollectorV2(cls.graph_db, conf, event_m)
+
+    @classmethod
+    def tearDownClass(cls):
+        for os_patch in cls.patches:
+            os_patch.stop()
+
+    def setUp(self):
+        self.graph_db.delete_all()
+        self.graph_db.load_test_landscape(self.landscape)
         logging.disable(logging.ERROR)
 
     def tearDown(self):
@@ -305,7 +334,7 @@ class TestCinderEvents(unittest.TestCase):
         volume = 'd79a82fa-a195-4086-beee-5c449c981708'
         instance = '7593155e-da6b-4b62-9d25-8196b7138f80'
 
-        _simulate_events(self.listener, 'tests/data/events/add_1_stack.p')
+        _simulate_events(self.listener, ADD_1_STACK)
         vm_graph = self.graph_db.get_subgraph(instance, json_out=False)
         vm_successors = vm_graph.successors(instance)
 
@@ -322,11 +351,11 @@ class TestCinderEvents(unittest.TestCase):
         instance = '7593155e-da6b-4b62-9d25-8196b7138f80'
 
         # Add the components
-        _simulate_events(self.listener, 'tests/data/events/add_1_stack.p')
+        _simulate_events(self.listener, ADD_1_STACK)
         before_delete = self.graph_db.get_graph(json_out=False)
 
         # Remove the components
-        _simulate_events(self.listener, 'tests/data/events/delete_1_stack.p')
+        _simulate_events(self.listener, DELETE_1_STACK)
         after_delete = self.graph_db.get_graph(json_out=False)
 
         # Compare
@@ -336,12 +365,26 @@ class TestCinderEvents(unittest.TestCase):
 
 def _simulate_events(listener, event_file):
     """
-    Simulates the events in the pickled file. THe timing of events is also
+    Simulates the events in the json file. THe timing of events is also
     preserved. THe events are fired directly at the rabbit handler
     callback.
     :param listener: An event listener.
     :param event_file: The events to simulate.
     """
-    events = pickle.load(open(event_file, 'rb'))
-    for _, _, event_body in events:
-        listener._cb_event(event_body, mock.Mock())
+    callback = listener._cb_event
+    message = mock.Mock()
+    for _, _, event_body in _load_events(event_file):
+        callback(event_body, message)
+
+
+def _load_events(event_file):
+    """
+    Loads the events from a json file. Each file is only parsed once and the
+    events are shared between tests, as the collectors do not modify them.
+    :param event_file: The events to load.
+    :return: Tuple of events.
+    """
+    if event_file not in _EVENTS_CACHE:
+        with open(event_file, 'rb') as events_json:
+            _EVENTS_CACHE[event_file] = tuple(json.load(events_json))
+    return _EVENTS_CACHE[event_file]
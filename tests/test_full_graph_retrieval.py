@@ -14,6 +14,7 @@
 """
 Integration tests for the get graph feature.
 """
+import collections
 import logging
 import unittest
 
@@ -37,31 +38,31 @@ class TestGetGraph(unittest.TestCase):
         """
         utils.create_test_config()
         logging.disable(logging.CRITICAL)
+        # The tests only read the landscape, so it is loaded once per class.
+        manager = landscape_manager.LandscapeManager(utils.TEST_CONFIG_FILE)
+        cls.graph_db = manager.graph_db
+        cls.graph_db.delete_all()
+        cls.graph_db.load_test_landscape(cls.landscape_file)
+        cls.graphs = {}
 
     @classmethod
     def tearDownClass(cls):
+        cls.graph_db.delete_all()
         utils.remove_test_config()
         logging.disable(logging.NOTSET)
 
     def setUp(self):
-        manager = landscape_manager.LandscapeManager(utils.TEST_CONFIG_FILE)
-        self.graph_db = manager.graph_db
-        self.graph_db.delete_all()
-        self.graph_db.load_test_landscape(self.landscape_file)
         self.events = {"start": 1502811001,
                        "first_delete": 1502818001,
                        "second_delete": 1502825001,
                        "first_add": 1502828001}
 
-    def tearDown(self):
-        self.graph_db.delete_all()
-
     def test_initial_stacks(self):
         """
         Test that all stacks are there.
         """
         start_time = self.events["start"] + 60
-        graph = self.graph_db.get_graph(start_time, json_out=False)
+        graph = self._get_graph(start_time)
         stacks = self.graph_nodes(graph, "stack", "stack_name")
 
         self.assertEqual(len(stacks), 4)
@@ -72,7 +73,7 @@ class TestGetGraph(unittest.TestCase):
         Test that only two stacks are there.
         """
         first_delete_time = self.events["first_delete"] + 60
-        graph = self.graph_db.get_graph(first_delete_time, json_out=False)
+        graph = self._get_graph(first_delete_time)
         stacks = self.graph_nodes(graph, "stack", "stack_name")
         self.assertEqual(len(stacks), 2)
         self.assertEqual(set(["alder", "elm"]), set(stacks))
@@ -82,7 +83,7 @@ class TestGetGraph(unittest.TestCase):
         Test that there is only 1 stack left.
         """
         second_delete_time = self.events["second_delete"] + 60
-        graph = self.graph_db.get_graph(second_delete_time, json_out=False)
+        graph = self._get_graph(second_delete_time)
         stacks = self.graph_nodes(graph, "stack", "stack_name")
         self.assertEqual(len(stacks), 1)
         self.assertEqual(["elm"], stacks)
@@ -92,7 +93,7 @@ class TestGetGraph(unittest.TestCase):
         After a stack has been added ensure that there are 2 stacks left.
         """
         first_add_time = self.events["first_add"] + 60
-        graph = self.graph_db.get_graph(first_add_time, json_out=False)
+        graph = self._get_graph(first_add_time)
         stacks = self.graph_nodes(graph, "stack", "stack_name")
         self.assertEqual(len(stacks), 2)
         self.assertItemsEqual(["elm", "yew"], stacks)
@@ -105,7 +106,7 @@ class TestGetGraph(unittest.TestCase):
         """
         timestamp = self.events["start"] + 60
         timeframe = self.events["first_add"] + 10 - timestamp
-        graph = self.graph_db.get_graph(timestamp, timeframe, json_out=False)
+        graph = self._get_graph(timestamp, timeframe)
         stacks = self.graph_nodes(graph, "stack", "stack_name")
         self.assertEqual(len(stacks), 1)
         self.assertEqual(["elm"], stacks)  # Only elm lives forever.
@@ -116,7 +117,7 @@ class TestGetGraph(unittest.TestCase):
         """
         timestamp = self.events["start"] + 60
         timeframe = self.events["first_delete"] + 10 - timestamp
-        graph = self.graph_db.get_graph(timestamp, timeframe, json_out=False)
+        graph = self._get_graph(timestamp, timeframe)
         stacks = self.graph_nodes(graph, "stack", "stack_name")
         self.assertEqual(len(stacks), 2)
         self.assertEqual(["elm", "alder"], stacks)
@@ -127,7 +128,7 @@ class TestGetGraph(unittest.TestCase):
         """
         timestamp = self.events["first_add"] + 60
         timeframe = self.events["first_add"] + 600 - timestamp
-        graph = self.graph_db.get_graph(timestamp, timeframe, json_out=False)
+        graph = self._get_graph(timestamp, timeframe)
         stacks = self.graph_nodes(graph, "stack", "stack_name")
         self.assertEqual(len(stacks), 2)
         self.assertItemsEqual(["elm", "yew"], stacks)
@@ -138,8 +139,8 @@ class TestGetGraph(unittest.TestCase):
         """
         before_time = self.events["second_delete"] + 60
         after_time = self.events["first_add"] + 60
-        before_add = self.graph_db.get_graph(before_time, json_out=False)
-        after_add = self.graph_db.get_graph(after_time, json_out=False)
+        before_add = self._get_graph(before_time)
+        after_add = self._get_graph(after_time)
 
         changes = utils.compare_graph(before_add, after_add)
         self.assertItemsEqual(changes["added"], ["stack-1", "volume-2",
@@ -168,8 +169,8 @@ class TestGetGraph(unittest.TestCase):
         """
         before_time = self.events["first_delete"] + 60
         after_time = self.events["second_delete"] + 60
-        before_delete = self.graph_db.get_graph(before_time, json_out=False)
-        after_delete = self.graph_db.get_graph(after_time, json_out=False)
+        before_delete = self._get_graph(before_time)
+        after_delete = self._get_graph(after_time)
 
         changes = utils.compare_graph(before_delete, after_delete)
 
@@ -202,8 +203,40 @@ class TestGetGraph(unittest.TestCase):
         self.assertEqual(graph.node[node], node_structure)
         self.assertEqual(graph.node[node_2], node_structure_2)
 
+    @classmethod
+    def _get_graph(cls, timestamp, timeframe=0):
+        """
+        Retrieve the graph at a point in time, reusing earlier retrievals of
+        the same timestamp and timeframe.
+        :param timestamp: Time of the graph.
+        :param timeframe: Seconds after the timestamp to include.
+        :return: A copy of the networkx graph.
+        """
+        key = (timestamp, timeframe)
+        if key not in cls.graphs:
+            graph = cls.graph_db.get_graph(timestamp, timeframe,
+                                           json_out=False)
+            cls.index_by_type(graph)
+            cls.graphs[key] = graph
+        return cls.graphs[key].copy()
+
     @staticmethod
-    def graph_nodes(graph, node_type, attribute=None):
+    def index_by_type(graph):
+        """
+        Group the nodes of a graph by their type, once per graph. The index
+        is kept in the graph attributes so that copies carry it with them.
+        :param graph: Graph to index.
+        :return: Dictionary of node type to (node id, node data) tuples.
+        """
+        if "_type_index" not in graph.graph:
+            type_index = collections.defaultdict(list)
+            for node_id, node_data in graph.nodes(data=True):
+                type_index[node_data["type"]].append((node_id, node_data))
+            graph.graph["_type_index"] = type_index
+        return graph.graph["_type_index"]
+
+    @classmethod
+    def graph_nodes(cls, graph, node_type, attribute=None):
         """
         Return the all nodes from the graph of type 'node_type'.
         :param graph: Graph to search.
@@ -212,11 +245,7 @@ class TestGetGraph(unittest.TestCase):
         the attribute type for that node is returned.
         :return: list of nodes.
         """
-        graph_nodes = []
-        for node_id, node_data in graph.nodes(data=True):
-            if node_data["type"] == node_type:
-                if attribute:
-                    graph_nodes.append(node_data[attribute])
-                else:
-                    graph_nodes.append(node_id)
-        return graph_nodes
+        typed_nodes = cls.index_by_type(graph).get(node_type, [])
+        if attribute:
+            return [node_data[attribute] for _, node_data in typed_nodes]
+        return [node_id for node_id, _ in typed_nodes]
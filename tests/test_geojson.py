@@ -19,8 +19,6 @@ import time
 import unittest
 import mock
 
-from networkx.readwrite import json_graph
-
 from landscaper import landscape_manager
 from landscaper.utilities.coordinates import Geo
 from landscaper.web import application
@@ -44,6 +42,12 @@ class TestGeoJSONJson(unittest.TestCase):
         reasons this needs to be explicitly set.
         """
         utils.create_test_config()
+        manager = landscape_manager.LandscapeManager(utils.TEST_CONFIG_FILE)
+
+        # Set the application landscape manager to the test manager.
+        application.LANDSCAPE = manager
+        cls.graph_db = manager.graph_db
+        cls.app = application.APP.test_client()
 
     @classmethod
     def tearDownClass(cls):
@@ -52,15 +56,9 @@ class TestGeoJSONJson(unittest.TestCase):
     def setUp(self):
         self.identity = IDENTITY_ATTR.copy()
         self.state = STATE_ATTR.copy()
-        manager = landscape_manager.LandscapeManager(utils.TEST_CONFIG_FILE)
-
-        # Set the application landscape manager to the test manager.
-        application.LANDSCAPE = manager
 
         # Prepare the database
-        self.graph_db = manager.graph_db
         self.graph_db.delete_all()
-        self.app = application.APP.test_client()
 
     def tearDown(self):
         self.graph_db.delete_all()
@@ -71,8 +69,7 @@ class TestGeoJSONJson(unittest.TestCase):
         FeatureCollection.
         """
         test_graph = _test_graph()
-        geo = Geo.extract_geo(json.dumps(test_graph))
-        geo = json.loads(geo)
+        geo = Geo.extract_geo_object(test_graph)
         self.assertEquals(geo["type"], "FeatureCollection")
         self.assertEquals(type(geo["features"]), list)
         self.assertEquals(len(geo["features"]), 2)
@@ -154,8 +151,9 @@ class TestGeoJSONJson(unittest.TestCase):
         state2 = self.state.copy()
         state2['geo'] = geom2
 
-        self.graph_db.add_node("nodey1", IDENTITY_ATTR, state1, timestamp)
-        self.graph_db.add_node("nodey2", IDENTITY_ATTR, state2, timestamp)
+        self.graph_db.add_nodes_bulk([("nodey1", IDENTITY_ATTR, state1),
+                                      ("nodey2", IDENTITY_ATTR, state2)],
+                                     timestamp)
 
 
 def _test_graph():
@@ -246,11 +244,21 @@ class TestLargeGraphGeo(unittest.TestCase):
     graph_file = "tests/data/test_landscape.json"
     subgraph_file = "tests/data/test_subgraph.json"
 
-    def setUp(self):
-        self.graph = self._hydrate(self.graph_file)
-        self.subgraph = self._hydrate(self.subgraph_file)
+    # Every test mocks the landscape manager and setUpClass only reads the
+    # fixtures, so nose --processes may spread these tests across workers.
+    _multiprocess_can_split_ = True
 
-        self.app = application.APP.test_client()
+    @classmethod
+    def setUpClass(cls):
+        # The files are already node-link json, so the raw text doubles as
+        # the payload for tests which do not add geometries.
+        with open(cls.graph_file) as graph_json:
+            cls.graph_json = graph_json.read()
+        with open(cls.subgraph_file) as subgraph_json:
+            cls.subgraph_json = subgraph_json.read()
+        cls.graph_data = json.loads(cls.graph_json)
+        cls.subgraph_data = json.loads(cls.subgraph_json)
+        cls.app = application.APP.test_client()
 
     @mock.patch("landscaper.web.application.LANDSCAPE")
     def test_get_graph_success(self, mck_lm):
@@ -268,22 +276,20 @@ class TestLargeGraphGeo(unittest.TestCase):
         nodes[other] = {"type": "Point", "coordinates": [21, 4]}
         nodes[server] = {"type": "Polygon", "coordinates": [[[0, 0], [10, 10],
                                                              [10, 0], [0, 0]]]}
-        for node_id, geometry in nodes.iteritems():
-            self.graph.node[node_id]['geo'] = geometry
-
         # mock graph return
-        json_gr = json.dumps(json_graph.node_link_data(self.graph))
+        json_gr = json.dumps(self._with_geo(self.graph_data, nodes))
         mck_lm.graph_db.get_graph.return_value = json_gr
 
         # Make REST call
         response = self.app.get("/graph?geo=True")
         feat_collection = json.loads(response.get_data())
+        geometries = self._index_features(feat_collection)
 
         # Assertions
-        self.assertEqual(self._geo(feat_collection, stack), nodes[stack])
-        self.assertEqual(self._geo(feat_collection, nova_2), nodes[nova_2])
-        self.assertEqual(self._geo(feat_collection, server), nodes[server])
-        self.assertEqual(self._geo(feat_collection, other), nodes[other])
+        self.assertEqual(geometries.get(stack), nodes[stack])
+        self.assertEqual(geometries.get(nova_2), nodes[nova_2])
+        self.assertEqual(geometries.get(server), nodes[server])
+        self.assertEqual(geometries.get(other), nodes[other])
         self.assertEqual(len(feat_collection['features']), 4)
 
     @mock.patch("landscaper.web.application.LANDSCAPE")
@@ -291,8 +297,7 @@ class TestLargeGraphGeo(unittest.TestCase):
         """
         Test for no geo nodes in the graph
         """
-        json_gr = json.dumps(json_graph.node_link_data(self.graph))
-        mck_lm.graph_db.get_graph.return_value = json_gr
+        mck_lm.graph_db.get_graph.return_value = self.graph_json
 
         # Make REST call
         response = self.app.get("/graph?geo=true")
@@ -312,20 +317,18 @@ class TestLargeGraphGeo(unittest.TestCase):
         nodes[server] = {"type": "LineString", "coordinates": [[4, 5], [2, 3]]}
         nodes[instance] = {"type": "Point", "coordinates": [21, 3]}
 
-        for node_id, geometry in nodes.iteritems():
-            self.subgraph.node[node_id]['geo'] = geometry
-
         # mock graph return
-        json_sgr = json.dumps(json_graph.node_link_data(self.subgraph))
+        json_sgr = json.dumps(self._with_geo(self.subgraph_data, nodes))
         mck_lm.graph_db.get_subgraph.return_value = json_sgr
 
         # Make REST call
         response = self.app.get("/subgraph/lola?geo=True")
         feat_collection = json.loads(response.get_data())
+        geometries = self._index_features(feat_collection)
 
         # Assertions
-        self.assertEqual(self._geo(feat_collection, instance), nodes[instance])
-        self.assertEqual(self._geo(feat_collection, server), nodes[server])
+        self.assertEqual(geometries.get(instance), nodes[instance])
+        self.assertEqual(geometries.get(server), nodes[server])
         self.assertEqual(len(feat_collection['features']), 2)
 
     @mock.patch("landscaper.web.application.LANDSCAPE")
@@ -333,8 +336,7 @@ class TestLargeGraphGeo(unittest.TestCase):
         """
         Test for no geo nodes in the graph
         """
-        json_sgr = json.dumps(json_graph.node_link_data(self.subgraph))
-        mck_lm.graph_db.get_graph.return_value = json_sgr
+        mck_lm.graph_db.get_graph.return_value = self.subgraph_json
 
         # Make REST call
         response = self.app.get("/graph?geo=1")
@@ -363,21 +365,26 @@ class TestLargeGraphGeo(unittest.TestCase):
         self.assertEqual(response.get_data(), "subgraph")
 
     @staticmethod
-    def _geo(feature_collection, node_id):
+    def _index_features(feature_collection):
         """
-        Grab the geomtry objects from the feature collection for the matching
-        node id.:
-        :return: geometry object
+        Index the geometry objects of the feature collection by node id.
+        :return: Dictionary of node id to geometry object.
         """
-        for feature in feature_collection['features']:
-            if feature['properties']['name'] == node_id:
-                return feature['geometry']
-        return None
+        return dict((feature['properties']['name'], feature['geometry'])
+                    for feature in feature_collection['features'])
 
     @staticmethod
-    def _hydrate(filename):
-        """
-        Returns a networkx graph object.
-        """
-        graph_data = json.load(open(filename))
-        return json_graph.node_link_graph(graph_data, directed=True)
+    def _with_geo(graph_data, geometries):
+        """
+        Returns a copy of the node-link graph data with geometries added to
+        some of its nodes. The class level graph data is left untouched.
+        :param graph_data: networkx json graph dictionary.
+        :param geometries: Dictionary of node id to geometry.
+        :return: networkx json graph dictionary.
+        """
+        nodes = []
+        for node in graph_data['nodes']:
+            if node['id'] in geometries:
+                node = dict(node, geo=geometries[node['id']])
+            nodes.append(node)
+        return dict(graph_data, nodes=nodes)
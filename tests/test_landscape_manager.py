@@ -17,7 +17,9 @@ Landscape Manager Class tests.
 import unittest
 import mock
 
+from landscaper import common
 from landscaper import landscape_manager
+from landscaper import paths
 
 # W0212 -  Access to a protected member
 # pylint: disable=W0212
@@ -52,3 +54,31 @@ class TestLandscapeManger(unittest.TestCase):
         # Listeners are joined.
         self.listener_1.join.assert_called_once_with()
         self.listener_2.join.assert_called_once_with()
+
+
+class TestPluginDiscovery(unittest.TestCase):
+    """
+    Unit tests for finding plugins without importing them.
+    """
+    def test_plugin_modules(self):
+        """
+        Plugin classes are mapped to the module which defines them.
+        """
+        modules = landscape_manager._plugin_modules(paths.COLLECTOR_DIR)
+        self.assertEqual(modules['NovaCollectorV2'], '.nova_collector')
+        self.assertEqual(modules['HWLocCollector'],
+                         '.physical_host_collector')
+        self.assertNotIn('Node', modules)
+
+    @mock.patch("landscaper.landscape_manager.importlib")
+    def test_only_requested_plugins_imported(self, mck_importlib):
+        """
+        Only the modules of the requested plugins are imported.
+        """
+        plugins = landscape_manager.LandscapeManager._load_plugins(
+            ['FsEventListener'], common.EVENT_LISTENER_PACKAGE,
+            paths.EVENT_LISTENER_DIR, [])
+
+        mck_importlib.import_module.assert_called_once_with(
+            '.fs_event_listener', common.EVENT_LISTENER_PACKAGE)
+        self.assertEqual(len(plugins), 1)
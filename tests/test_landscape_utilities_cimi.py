@@ -18,6 +18,7 @@ Utilities used for testing.
 import unittest
 import mock
 import os
+import urlparse
 from tests.test_utils import utils
 from landscaper.utilities import configuration, cimi
 
@@ -26,35 +27,28 @@ CONFIGURATION_VARIABLE = 'cimi_url'
 CONFIGURATION_VALUE = 'http://localhost'
 
 
-def mocked_requests_post(*args, **kwargs):
-    print args
+class _MockResponse(object):
+    """
+    Stand-in for a requests response.
+    """
+    def __init__(self, json_data, status_code):
+        self.json_data = json_data
+        self.status_code = status_code
 
-    class MockResponse:
-        def __init__(self, json_data, status_code):
-            self.json_data = json_data
-            self.status_code = status_code
+    def json(self):
+        return self.json_data
 
-        def json(self):
-            return self.json_data
 
+def mocked_requests_post(*args, **kwargs):
     if args[0] == 'http://localhost/service-container-metric':
-        return MockResponse({"status": "OK"}, 200)
-    return MockResponse(None, 404)
+        return _MockResponse({"status": "OK"}, 200)
+    return _MockResponse(None, 404)
 
 
 def mocked_requests_put(*args, **kwargs):
-    class MockResponse:
-        def __init__(self, json_data, status_code):
-            self.json_data = json_data
-            self.status_code = status_code
-
-        def json(self):
-            return self.json_data
-    print args
-
     if args[0] == 'http://localhost/service-container-metric/e2344324':
-        return MockResponse({"status": "OK"}, 200)
-    return MockResponse(None, 404)
+        return _MockResponse({"status": "OK"}, 200)
+    return _MockResponse(None, 404)
 
 
 class TestCimi(unittest.TestCase):
@@ -65,32 +59,67 @@ class TestCimi(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         utils.create_test_config()
+        test_config = "tests/data/tmp_config.conf"
+        cls.conf_manager = configuration.ConfigurationManager(test_config)
+        cls.conf_manager.add_section(CONFIGURATION_SECTION)
+        cls.conf_manager.set_variable(
+            CONFIGURATION_SECTION, CONFIGURATION_VARIABLE, CONFIGURATION_VALUE)
+        cls.cimi_client = cimi.CimiClient(cls.conf_manager)
+        collection_item = {
+            "id": "service-container-metric/e2344324",
+            "device_id": {"href": "device/YQCJB3SD2A9A"},
+            "container_id": "e2344324"}
+        collection = {'serviceContainerMetrics': [collection_item]}
+        cls.cimi_client.get_collection = mock.MagicMock(
+            return_value=collection)
 
     @classmethod
     def tearDownClass(cls):
         utils.remove_test_config()
 
     def setUp(self):
-        test_config = "tests/data/tmp_config.conf"
-        self.conf_manager = configuration.ConfigurationManager(test_config)
-        self.conf_manager.add_section(CONFIGURATION_SECTION)
-        self.conf_manager.set_variable(
-            CONFIGURATION_SECTION, CONFIGURATION_VARIABLE, CONFIGURATION_VALUE)
-        self.cimi_client = cimi.CimiClient(self.conf_manager)
-        collection_item = {
-            "id": "e2344324", "device_id": "YQCJB3SD2A9A", "container_id": "e2344324"}
-        collection = {'ServiceContainerMetrics': [collection_item]}
-        self.cimi_client.get_collection = mock.MagicMock(
-            return_value=collection)
+        self.cimi_client.get_collection.reset_mock()
 
-    @mock.patch('requests.post', side_effect=mocked_requests_post)
+    @mock.patch('requests.Session.post', side_effect=mocked_requests_post)
     def test_add_service_container_metric(self, mock_post):
         id = "e2344324"
         device_id = "YQCJB3SD2A9A"
         start_time = "1559765182"
-        response = self.cimi_client.add_service_container_metrics(
+        self.cimi_client.add_service_container_metrics(
             id, device_id, start_time)
-        self.assertEqual(response.status_code, 200, "Status code not 200")
+        self.cimi_client.flush_metrics()
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(mock_post.call_args[0][0],
+                         'http://localhost/service-container-metric')
+        self.assertEqual(mock_post.call_args[1]['json'], {
+            'container_id': id, 'device_id': {'href': 'device/' + device_id},
+            'start_time': start_time})
+
+    @mock.patch('requests.Session.post', side_effect=TypeError)
+    def test_metric_worker_survives_errors(self, mock_post):
+        """
+        Check that an unexpected error while posting does not stop the
+        worker, so flushing still returns.
+        """
+        for start_time in ["1559765182", "1559765183"]:
+            self.cimi_client.add_service_container_metrics(
+                "e2344324", "YQCJB3SD2A9A", start_time)
+        self.cimi_client.flush_metrics()
+        self.assertEqual(mock_post.call_count, 2)
+
+    @mock.patch('requests.Session.post')
+    def test_metric_without_cimi_url(self, mock_post):
+        """
+        Check that metrics are dropped when no CIMI url is configured.
+        """
+        conf_manager = mock.Mock()
+        conf_manager.get_variable.return_value = None
+        client = cimi.CimiClient(conf_manager)
+        client.add_service_container_metrics(
+            "e2344324", "YQCJB3SD2A9A", "1559765182")
+        client.flush_metrics()
+        self.assertIsNone(client._metrics_worker)
+        self.assertFalse(mock_post.called)
 
     @mock.patch('requests.put', side_effect=mocked_requests_put)
     def test_update_service_container_metrics(self, mock_post):
@@ -99,5 +128,25 @@ class TestCimi(unittest.TestCase):
         end_time = "1559765182"
         response = self.cimi_client.update_service_container_metrics(
             id, device_id, end_time)
-        print response.status_code
         self.assertEqual(response.status_code, 200, "Status code not 200")
+        metric_filter = 'device_id/href="device/{}" and container_id="{}"'\
+            .format(device_id, id)
+        self.cimi_client.get_collection.assert_called_once_with(
+            'service-container-metric', limit=1, filter_expr=metric_filter)
+
+    @mock.patch('landscaper.utilities.cimi.requests.get')
+    def test_get_events_url_encoded(self, mock_get):
+        """
+        Check that the event query is url-encoded.
+        """
+        client = cimi.CimiClient(self.conf_manager)
+        client.get_events(from_date="2019-06-05T20:06:22.000Z", limit=5)
+        url = mock_get.call_args[0][0]
+        base, query = url.split('?')
+        self.assertEqual(base, 'http://localhost/event')
+        self.assertEqual(urlparse.parse_qsl(query), [
+            ('$orderby', 'created:desc'),
+            ('$filter', 'content/state="DELETED" and '
+                        'created>"2019-06-05T20:06:22.000Z"'),
+            ('$last', '5')])
+        self.assertNotIn(' ', url)
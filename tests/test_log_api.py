@@ -0,0 +1,92 @@
+# Copyright (c) 2017, Intel Research and Development Ireland Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the landscaper log api.
+"""
+import os
+import tempfile
+import unittest
+import mock
+
+from landscaper.utilities import log_api
+
+# pylint: disable=W0212
+
+
+def _log_line(second, text):
+    return "[2019-06-05 20:06:{:02d} UTC] [INFO] : {}".format(second, text)
+
+
+class TestLogApi(unittest.TestCase):
+    """
+    Unit tests for reading the tail of the landscaper log.
+    """
+    def setUp(self):
+        handle, self.log_file = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.log_file)
+
+    def _write(self, content):
+        with open(self.log_file, 'w') as log_file:
+            log_file.write(content)
+
+    def test_tail(self):
+        """
+        Check the last lines are returned, with or without a final newline.
+        """
+        lines = ["line {}".format(i) for i in range(100)]
+        for ending in ["\n", ""]:
+            self._write("\n".join(lines) + ending)
+            self.assertEqual(log_api.tail(self.log_file, 10), lines[-10:])
+            self.assertEqual(log_api.tail(self.log_file, 1), lines[-1:])
+            self.assertEqual(log_api.tail(self.log_file, 200), lines)
+
+    @mock.patch("landscaper.utilities.log_api.TAIL_BLOCK_SIZE", 7)
+    def test_tail_across_blocks(self):
+        """
+        Check that lines split over several read blocks are joined up.
+        """
+        lines = ["a much longer line {}".format(i) for i in range(20)]
+        self._write("\n".join(lines) + "\n")
+        self.assertEqual(log_api.tail(self.log_file, 5), lines[-5:])
+        self.assertEqual(log_api.tail(self.log_file, 20), lines)
+
+    def test_tail_empty_file(self):
+        """
+        An empty log has no lines.
+        """
+        self.assertEqual(log_api.tail(self.log_file, 5), [])
+
+    def test_parse_ts(self):
+        """
+        Check the timestamp is read from the start of a log line.
+        """
+        self.assertEqual(log_api._parse_ts(_log_line(7, "text")),
+                         "2019-06-05T20:06:07")
+
+    def test_get_log_after_timestamp(self):
+        """
+        Only lines logged after the timestamp are returned, newest first.
+        """
+        self._write("\n".join(_log_line(sec, "event {}".format(sec))
+                              for sec in range(10)) + "\n")
+        with mock.patch("landscaper.utilities.log_api.LOGF", self.log_file):
+            lines = log_api.LogApi().get_log("2019-06-05T20:06:07")
+
+        self.assertEqual([line['log_time'] for line in lines],
+                         ["2019-06-05T20:06:09", "2019-06-05T20:06:08"])
+        self.assertEqual(lines[0]['log_type'], "INFO")
+        self.assertEqual(lines[0]['log_text'], "event 9")
@@ -420,3 +420,61 @@ class TestNodeUpdateUnit(unittest.TestCase):
         # Assertions (Never Gets this far.)
         self.assertTrue(self.neo4j._create_edge.called)
         self.neo4j._expire_edge.assert_called_once_with(old_edge_r, now_ts)
+
+
+class TestBatchUnit(unittest.TestCase):
+    """
+    Unit tests for writes grouped with the batch method.
+    """
+    @mock.patch("landscaper.graph_db.neo4j_db.Neo4jGDB._get_db_connection")
+    def setUp(self, mck_get_connection):
+        mck_get_connection.return_value = None
+        self.neo4j = neo4j_db.Neo4jGDB(mock.Mock())
+        self.neo4j.graph_db_refreshed = time.time()
+        self.neo4j.get_node_by_uuid = mock.Mock(return_value=None)
+        self.neo4j.graph_db = mock.MagicMock()
+        self.neo4j.graph_db.exists.return_value = False
+
+    def test_single_commit(self):
+        """
+        Nodes and edges added within a batch are committed together.
+        """
+        transaction = self.neo4j.graph_db.begin.return_value
+        with self.neo4j.batch():
+            node_a = self.neo4j.add_node('a', {'category': 'compute'}, {}, 1)
+            node_b = self.neo4j.add_node('b', {'category': 'compute'}, {}, 1)
+            self.neo4j.add_edge(node_a, node_b, 1, 'ON')
+            self.assertFalse(transaction.commit.called)
+
+        self.assertEqual(self.neo4j.graph_db.begin.call_count, 1)
+        self.assertEqual(transaction.commit.call_count, 1)
+        self.assertEqual(transaction.create.call_count, 7)
+
+    def test_duplicate_in_batch(self):
+        """
+        A node added twice within a batch is only stored once.
+        """
+        with self.neo4j.batch():
+            first = self.neo4j.add_node('a', {'category': 'compute'}, {}, 1)
+            second = self.neo4j.add_node('a', {'category': 'compute'}, {}, 1)
+        self.assertIs(first, second)
+
+    def test_rollback_on_error(self):
+        """
+        A batch that raises is rolled back rather than committed.
+        """
+        transaction = self.neo4j.graph_db.begin.return_value
+        with self.assertRaises(ValueError):
+            with self.neo4j.batch():
+                self.neo4j.add_node('a', {'category': 'compute'}, {}, 1)
+                raise ValueError()
+        self.assertTrue(transaction.rollback.called)
+        self.assertFalse(transaction.commit.called)
+
+    def test_no_batch(self):
+        """
+        Outside of a batch each write is committed straight away.
+        """
+        transaction = self.neo4j.graph_db.begin.return_value
+        self.neo4j.add_node('a', {'category': 'compute'}, {}, 1)
+        self.assertEqual(transaction.commit.call_count, 1)
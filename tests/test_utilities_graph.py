@@ -14,9 +14,13 @@
 """
 Tests for the utilities.graph module.
 """
+# pylint: disable=W0212
 import json
+import time
 import unittest
 
+import mock
+
 import networkx as nx
 from networkx.readwrite import json_graph
 
@@ -139,6 +143,22 @@ class TestFilterNodes(unittest.TestCase):
         self.assertIsInstance(filter_g, basestring)
         self.assertIsInstance(filter_o, nx.DiGraph)
 
+    def test_node_link_chunks(self):
+        """
+        The streamed chunks join up to the node-link json of the graph.
+        """
+        graph = sample_graphs('sample-a')
+        graph.graph['name'] = 'sample-a'
+        for src, dest in graph.edges():
+            graph.edge[src][dest]['label'] = 'edge'
+
+        chunks = list(graph_utils.node_link_chunks(graph, batch_size=2))
+
+        self.assertEqual(json.loads(''.join(chunks)),
+                         json.loads(json.dumps(
+                             json_graph.node_link_data(graph))))
+        self.assertGreater(len(chunks), 4)
+
     def test_json_graph_passed(self):
         """
         filter_nodes can take a networkx graph as a string.
@@ -150,6 +170,86 @@ class TestFilterNodes(unittest.TestCase):
                                                 json_out=False)
         self.assertIsInstance(filter_graph, nx.DiGraph)
 
+    def test_json_graph_parse_cached(self):
+        """
+        The same json string is only parsed once within the cache ttl.
+        """
+        graph = sample_graphs('sample-b')
+        j_graph = json.dumps(json_graph.node_link_data(graph))
+
+        first = graph_utils._graph_obj(j_graph)
+        self.assertIs(graph_utils._graph_obj(j_graph), first)
+
+        with mock.patch('landscaper.utilities.graph.time.time',
+                        return_value=time.time() + graph_utils.PARSE_CACHE_TTL):
+            self.assertIsNot(graph_utils._graph_obj(j_graph), first)
+
+    def test_geo_only(self):
+        """
+        geo_only returns the feature collection of the kept nodes.
+        """
+        graph = sample_graphs('sample-a')
+        for node in graph:
+            graph.node[node]['name'] = node
+            graph.node[node]['geo'] = {'type': 'Point', 'coordinates': [1, 2]}
+
+        geo = graph_utils.filter_nodes(graph, self.types, filter_these=False,
+                                       geo_only=True)
+        geo = json.loads(geo)
+        names = [feat['properties']['name'] for feat in geo['features']]
+
+        self.assertEqual(geo['type'], 'FeatureCollection')
+        self.assertItemsEqual(names, ['A', 'R', 'F'])
+
+    def test_columnar(self):
+        """
+        columnar returns the kept nodes and edges as parallel lists.
+        """
+        graph = sample_graphs('sample-a')
+        data = graph_utils.filter_nodes(graph, self.types, filter_these=False,
+                                        columnar=True)
+        data = json.loads(data)
+        types = dict(zip(data['ids'], data['types']))
+
+        self.assertEqual(types, {'A': 'stack', 'R': 'stack', 'F': 'vm'})
+        self.assertEqual([attrs['type'] for attrs in data['attrs']],
+                         data['types'])
+        self.assertItemsEqual(zip(*data['edges']), [('A', 'F'), ('R', 'F')])
+
+    def test_deep_graph(self):
+        """
+        Graphs deeper than the recursion limit can be filtered.
+        """
+        graph = nx.DiGraph()
+        graph.add_path(range(5000))
+        for node in graph:
+            graph.node[node]['type'] = 'vm' if node % 2 else 'port'
+
+        filter_graph = graph_utils.filter_nodes(graph, ['vm'],
+                                                filter_these=False,
+                                                json_out=False)
+        self.assertEqual(len(filter_graph), 2500)
+        self.assertEqual(filter_graph.successors(1), [3])
+
+    def test_shared_subgraph(self):
+        """
+        Nodes reachable along several paths are linked to every kept parent.
+        """
+        graph = nx.DiGraph()
+        graph.add_edges_from([('A', 'X'), ('B', 'X'), ('A', 'B'),
+                              ('X', 'Y'), ('Y', 'Z')])
+        types = {'A': 'stack', 'B': 'stack', 'X': 'port', 'Y': 'port',
+                 'Z': 'vm'}
+        for node, ntype in types.items():
+            graph.node[node]['type'] = ntype
+
+        filter_graph = graph_utils.filter_nodes(graph, ['port'],
+                                                filter_these=True,
+                                                json_out=False)
+        self.assertItemsEqual(filter_graph.node, ['A', 'B', 'Z'])
+        self.assertItemsEqual(filter_graph.successors('A'), ['B', 'Z'])
+        self.assertItemsEqual(filter_graph.successors('B'), ['Z'])
+
 
 def sample_graphs(graph_id):
     """
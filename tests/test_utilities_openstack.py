@@ -49,3 +49,25 @@ class TestOpenStack(unittest.TestCase):
         os = openstack.OpenStackClientRegistry()
         session = os._session()
         assert (session is not None), "Session for v2 auth is not created: " + v2uri
+
+    @mock.patch("landscaper.utilities.openstack._get_session_keystone_v3")
+    def test_session_shared(self, mck_session):
+        """
+        Registries with the same connection details share one session.
+        """
+        environ["OS_AUTH_URL"] = v3uri
+        openstack._SESSION_CACHE.clear()
+        first = openstack.OpenStackClientRegistry()._session()
+        second = openstack.OpenStackClientRegistry()._session()
+
+        self.assertIs(first, second)
+        mck_session.assert_called_once_with()
+
+        environ["OS_USERNAME"] = "other"
+        openstack.OpenStackClientRegistry()._session()
+        self.assertEqual(mck_session.call_count, 2)
+
+        environ["OS_PASSWORD"] = "changed"
+        openstack.OpenStackClientRegistry()._session()
+        self.assertEqual(mck_session.call_count, 3)
+        openstack._SESSION_CACHE.clear()
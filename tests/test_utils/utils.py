@@ -16,10 +16,13 @@ Utilities used for testing.
 """
 import collections
 import ConfigParser
+import json
 import random
 import string
 import os
 
+from networkx.readwrite import json_graph
+
 EdgeChange = collections.namedtuple('EdgeChange', 'edge original changed')
 NodeChange = collections.namedtuple('NodeChange', 'node original changed')
 
@@ -40,14 +43,17 @@ def compare_graph(first, second):
                'removed_edge': [],
                'node_changes': [],
                'edge_changes': []}
+    added = set()
     for node in second.nodes():
-        if node not in first.nodes():
+        if node not in first:
             # add missing nodes
-            if node not in changes['added']:
+            if node not in added:
+                added.add(node)
                 changes['added'].append(node)
             for edge in second.out_edges([node]):
                 src = edge[1]
-                if src not in first.nodes() and src not in changes['added']:
+                if src not in first and src not in added:
+                    added.add(src)
                     changes['added'].append(src)
                 changes['added_edge'].append(edge)
         else:
@@ -55,40 +61,39 @@ def compare_graph(first, second):
                 changes['node_changes'].append((node, first.node[node],
                                                 second.node[node]))
     for node in first.nodes():
-        if node not in second.nodes():
+        if node not in second:
             changes['removed'].append(node)
             for edge in first.out_edges([node]):
                 changes['removed_edge'].append(edge)
         else:
             # node exists lets check the edges.
-            for edge_data in second.out_edges([node], data=True):
-                edge = edge_data[0:2]
-                if edge not in first.out_edges([node]):
+            for src, dest, changed_attrs in second.out_edges([node],
+                                                             data=True):
+                edge = (src, dest)
+                if not first.has_edge(src, dest):
                     changes['added_edge'].append(edge)
                 else:
-                    changed_attrs = edge_data[2]
-                    orig_attrs = _find_matching_edge(edge, first)[2]
+                    orig_attrs = first.edge[src][dest]
                     if orig_attrs != changed_attrs:
                         change = EdgeChange(edge, orig_attrs, changed_attrs)
                         changes['edge_changes'].append(change)
 
             for edge in first.out_edges([node]):
-                if edge not in second.out_edges([node]):
+                if not second.has_edge(*edge):
                     changes['removed_edge'].append(edge)
     return changes
 
 
-def _find_matching_edge(edge, graph):
+def read_landscape(graph_file):
     """
-    Retrieve an edge matching the edge inserted from the graph.
-    :param edge: The edge to find.
-    :param graph: The graph to find it in.
-    :return: The edge including attributes.
+    Reads a test landscape, so that it can be loaded into the graph database
+    repeatedly without parsing the file each time.
+    :param graph_file: Path to a networkx json graph.
+    :return: Networkx graph.
     """
-    edges_data = graph.out_edges([edge[0]], data=True)
-    edges = [edge_data[0:2] for edge_data in edges_data]
-    matching_edge_index = edges.index(edge)
-    return edges_data[matching_edge_index]
+    with open(graph_file) as graph_json:
+        return json_graph.node_link_graph(json.load(graph_json),
+                                          directed=True)
 
 
 def write_config(config_params, config_file):
@@ -128,8 +133,12 @@ def create_test_config():
 
     username = os.environ[user_env]
     password = os.environ[pass_env]
-    test_config = {"neo4j": {"url": "http://localhost:7474/db/data",
-                             "user": username, "password": password},
+
+    # Any Neo4j compatible server can be used, such as an in-memory one.
+    url = os.environ.get("NEO4J_URL", "http://localhost:7474/db/data")
+    use_bolt = os.environ.get("NEO4J_USE_BOLT", "false")
+    test_config = {"neo4j": {"url": url, "user": username,
+                             "password": password, "use_bolt": use_bolt},
                    "general": {"graph_db": "Neo4jGDB", "flush": False,
                                "event_listeners": "", "collectors": ""},
                    "physical_layer": {"machines": "machine-A"}}
@@ -17,11 +17,14 @@ Tests for the REST API.
 import unittest
 import logging
 import random
+import threading
 import json
 import time
 import uuid
 import mock
 from mock import MagicMock
+import networkx as nx
+from networkx.readwrite import json_graph
 
 from landscaper.web import application
 from landscaper.landscape_manager import LandscapeManager
@@ -62,6 +65,65 @@ class TestApplication(unittest.TestCase):
         self.assertEqual(response.get_data(), mock_graph)
         mck_lm.graph_db.get_graph.assert_called_once_with()
 
+    @mock.patch("landscaper.web.application.LANDSCAPE")
+    def test_get_graph_cached(self, mck_lm):
+        """
+        Test that polling get_graph within the ttl only fetches once and that
+        a matching ETag gets a 304.
+        """
+        mock_graph = '{"1":2}'
+        mck_lm.graph_db.get_graph = MagicMock(return_value=mock_graph)
+
+        response = self.app.get("/graph")
+        etag = response.headers["ETag"]
+        response = self.app.get("/graph", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.get_data(), "")
+        mck_lm.graph_db.get_graph.assert_called_once_with()
+
+    @mock.patch("landscaper.web.application.LANDSCAPE")
+    def test_get_graph_after_write(self, mck_lm):
+        """
+        Test that storing coordinates invalidates the cached graph.
+        """
+        mck_lm.graph_db.get_graph = MagicMock(return_value='{"1":2}')
+        mck_lm.graph_db.update_node.return_value = (True, "")
+        body = '[{"id": "A", "geo": {"type": "Point", "coordinates": [1, 2]}}]'
+
+        self.app.get("/graph")
+        self.app.put("/coordinates", data=body)
+        self.app.get("/graph")
+
+        self.assertEqual(mck_lm.graph_db.get_graph.call_count, 2)
+
+    @mock.patch("landscaper.web.application.LANDSCAPE")
+    def test_invalidate_during_graph_read(self, mck_lm):
+        """
+        Test that an invalidation while the graph is being fetched neither
+        empties the result of the read nor is lost.
+        """
+        invalidations = []
+
+        def get_graph():
+            invalidation = threading.Thread(
+                target=application._invalidate_graph_cache)
+            invalidation.start()
+            invalidations.append(invalidation)
+            # Give the invalidation the chance to run mid-read.
+            invalidation.join(0.2)
+            return '{"1":2}'
+
+        mck_lm.graph_db.get_graph = MagicMock(side_effect=get_graph)
+
+        graph, etag = application._cached_graph()
+        invalidations[0].join()
+
+        self.assertEqual(graph, '{"1":2}')
+        self.assertEqual(etag, application._etag(graph))
+        application._cached_graph()
+        self.assertEqual(mck_lm.graph_db.get_graph.call_count, 2)
+
     @mock.patch("landscaper.web.application.LANDSCAPE")
     def test_get_subgraph_success(self, mck_lm):
         """
@@ -252,6 +314,17 @@ class TestAddGeo(unittest.TestCase):
 
         self.assertEqual(response.status_code, 400)
 
+    @mock.patch("landscaper.web.application.LANDSCAPE")
+    def test_body_not_json(self, mk_ls):
+        """
+        Test that it aborts when the body is not json.
+        """
+        fake_body = "[{'id': 'A', 'geo': {'type': 'Point'}}]"
+        response = self.app.put("/coordinates", data=fake_body)
+
+        self.assertEqual(response.status_code, 400)
+        mk_ls.graph_db.update_node.assert_not_called()
+
     @mock.patch("landscaper.web.application.LANDSCAPE")
     def test_node_does_not_exist(self, mk_ls):
         """
@@ -261,8 +334,8 @@ class TestAddGeo(unittest.TestCase):
         mk_ls.graph_db.update_node.return_value = (None, "")
 
         # 2. Create Fake Request
-        fake_body = "[{'id': 'A', " \
-                    "'geo': {'type': 'Point', 'coordinates': [1, 2],}}]"
+        fake_body = '[{"id": "A", ' \
+                    '"geo": {"type": "Point", "coordinates": [1, 2]}}]'
 
         url = "/coordinates"
         response = self.app.put(url, data=fake_body)
@@ -278,10 +351,10 @@ class TestAddGeo(unittest.TestCase):
 
         # mk_ls.graph_db.update_node.side_effect = None
         # 2. Create Fake Request
-        fake_body = "[{'id': 'A', " \
-                    "'geo': {'type': 'Point', 'coordinates': [1, 2],}}," \
-                    "{'id': 'B', " \
-                    "'geo': {'type': 'Polygon', 'coordinates': [5, 6],}}]"
+        fake_body = '[{"id": "A", ' \
+                    '"geo": {"type": "Point", "coordinates": [1, 2]}},' \
+                    '{"id": "B", ' \
+                    '"geo": {"type": "Polygon", "coordinates": [5, 6]}}]'
 
         url = "/coordinates"
         response = self.app.put(url, data=fake_body)
@@ -299,12 +372,12 @@ class TestAddGeo(unittest.TestCase):
                                                   ('Success', ""),
                                                   (None, "")]
         # 2. Create Fake Request
-        fake_body = "[{'id': 'A', " \
-                    "'geo': {'type': 'Point', 'coordinates': [1, 2]}}," \
-                    "{'id': 'B', " \
-                    "'geo': {'type': 'Polygon', 'coordinates': [5, 6]}}," \
-                    "{'id': 'C', " \
-                    "'geo': {'type': 'Polygon', 'coordinates': [5, 6]}}]"
+        fake_body = '[{"id": "A", ' \
+                    '"geo": {"type": "Point", "coordinates": [1, 2]}},' \
+                    '{"id": "B", ' \
+                    '"geo": {"type": "Polygon", "coordinates": [5, 6]}},' \
+                    '{"id": "C", ' \
+                    '"geo": {"type": "Polygon", "coordinates": [5, 6]}}]'
 
         url = "/coordinates"
         response = self.app.put(url, data=fake_body)
@@ -324,12 +397,12 @@ class TestAddGeo(unittest.TestCase):
                                                   ('Success', "")]
 
         # 2. Create Fake Request
-        fake_body = "[{'id': 'A', " \
-                    "'geo': {'type': 'Point', 'coordinates': [1, 2],}}," \
-                    "{'id': 'B', " \
-                    "'geo': {'type': 'Polygon', 'coordinates': [5, 6],}} ," \
-                    "{'id': 'C', "\
-                    "'geo': {'type': 'Polygon', 'coordinates': [5, 6],}}]"
+        fake_body = '[{"id": "A", ' \
+                    '"geo": {"type": "Point", "coordinates": [1, 2]}},' \
+                    '{"id": "B", ' \
+                    '"geo": {"type": "Polygon", "coordinates": [5, 6]}},' \
+                    '{"id": "C", '\
+                    '"geo": {"type": "Polygon", "coordinates": [5, 6]}}]'
 
         url = "/coordinates"
         response = self.app.put(url, data=fake_body)
@@ -349,8 +422,8 @@ class TestAddGeo(unittest.TestCase):
         mk_ls.graph_db.update_node.return_value = ('Success', "")
 
         # 2. Create Fake Request
-        fake_body = "[{'id': 'A', " \
-                    "'geo': {'type': 'Point', 'coordinates': [1, 2]}}]"
+        fake_body = '[{"id": "A", ' \
+                    '"geo": {"type": "Point", "coordinates": [1, 2]}}]'
 
         url = "/coordinates"
         geo_string = json.dumps({'type': 'Point', 'coordinates': [1, 2]})
@@ -390,8 +463,8 @@ class TestPutGeolocationIntegration(unittest.TestCase):
         old_node = self._node_state_attributes(node_id)
 
         # Create fake body with geolocation for node
-        fake_body = "[{'id': '%s', 'geo': {'type': 'Point', " \
-                    "'coordinates': [1, 2]}}]" % node_id
+        fake_body = '[{"id": "%s", "geo": {"type": "Point", ' \
+                    '"coordinates": [1, 2]}}]' % node_id
 
         url = "/coordinates"
         response = self.app.put(url, data=fake_body)
@@ -410,8 +483,8 @@ class TestPutGeolocationIntegration(unittest.TestCase):
         node_id = 'fake_node'
         old_node = self._node_state_attributes(node_id)
         # Create fake body for fake node with geolocation
-        fake_body = "[{'id': '%s', 'geo': {'type': 'Point', " \
-                    "'coordinates': [1, 2]}}]" % node_id
+        fake_body = '[{"id": "%s", "geo": {"type": "Point", ' \
+                    '"coordinates": [1, 2]}}]' % node_id
         url = "/coordinates"
         response = self.app.put(url, data=fake_body)
 
@@ -456,7 +529,8 @@ class TestNodeFilteringREST(unittest.TestCase):
 
         self.app.get(url)
 
-        util_mck.filter_nodes.assert_called_once_with("graph", types, True)
+        util_mck.filter_nodes.assert_called_once_with("graph", types, True,
+                                                      json_out=False)
 
         util_mck.reset_mock()
 
@@ -492,6 +566,26 @@ class TestNodeFilteringREST(unittest.TestCase):
         self.app.get("/graph?filter-these=False&filter-nodes=['vnic']")
         self.app.get("/subgraph/node?filter-these=False&filter-nodes=['vm']")
 
-        calls = [mock.call('graph', ['vnic'], False),
+        calls = [mock.call('graph', ['vnic'], False, json_out=False),
                  mock.call('subgraph', ['vm'], False)]
         util_mck.filter_nodes.assert_has_calls(calls)
+
+    @mock.patch("landscaper.web.application.LANDSCAPE")
+    def test_filter_nodes_streamed(self, mck_ls):
+        """
+        Ensure the filtered graph is streamed as valid node-link json.
+        """
+        graph = nx.DiGraph()
+        graph.add_node("A", type="vm")
+        graph.add_node("B", type="port")
+        graph.add_node("C", type="machine")
+        graph.add_edges_from([("A", "B"), ("B", "C")])
+        mck_ls.graph_db.get_graph.return_value = json.dumps(
+            json_graph.node_link_data(graph))
+
+        response = self.app.get("/graph?filter-nodes=['port']")
+        self.assertTrue(response.is_streamed)
+        filtered = json_graph.node_link_graph(json.loads(response.get_data()))
+
+        self.assertItemsEqual(filtered.nodes(), ["A", "C"])
+        self.assertEqual(filtered.successors("A"), ["C"])